@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+Tool Dispatch for the Lore System MCP Server
+
+``handle_tool`` used to be a single ``if/elif name == ...`` chain over every
+tool, so the tools at the end of the chain paid dozens of string compares
+before doing any work, and arguments were only checked when a handler
+happened to index a missing key. ``ToolRegistry`` replaces the chain:
+
+- Handlers register under their tool name with ``@registry.handler(name)``
+  and are found with one dict lookup.
+- The ``inputSchema`` of every listed tool is compiled once into a
+  validator (:func:`compile_schema`) that runs before the handler, so bad
+  arguments are rejected with a message naming the argument.
+- Every call's duration is recorded in a per-tool :class:`LatencyHistogram`
+  (validation included), which makes slow tools easy to find.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence
+
+
+Handler = Callable[[Dict[str, Any]], Any]
+Validator = Callable[[Any, str], None]
+
+# Histogram bucket upper bounds in milliseconds; slower calls land in a final overflow bucket
+LATENCY_BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+
+class ToolArgumentError(ValueError):
+    """Raised when tool arguments do not match the tool's input schema."""
+    pass
+
+
+class UnknownTool(LookupError):
+    """Raised when no handler is registered for a tool name."""
+    pass
+
+
+def _is_integer(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+TYPE_CHECKS: Dict[str, Callable[[Any], bool]] = {
+    "object": lambda value: isinstance(value, dict),
+    "array": lambda value: isinstance(value, list),
+    "string": lambda value: isinstance(value, str),
+    "integer": _is_integer,
+    "number": lambda value: isinstance(value, (int, float)) and not isinstance(value, bool),
+    "boolean": lambda value: isinstance(value, bool),
+}
+
+
+def _is_id(value: Any) -> bool:
+    # IDs are documented as strings, but clients pass back the integer ids
+    # they received and parse_entity_id accepts both
+    return isinstance(value, str) or _is_integer(value)
+
+
+def is_id_property(name: str) -> bool:
+    """Whether a property holds entity ids (``id``, ``*_id`` or ``*_ids``)."""
+    return name == "id" or name.endswith(("_id", "_ids"))
+
+
+def _describe(path: str) -> str:
+    return f"'{path}'" if path else "arguments"
+
+
+def _child(path: str, name: Any) -> str:
+    if isinstance(name, int):
+        return f"{path}[{name}]"
+    return f"{path}.{name}" if path else name
+
+
+def _fold(value: Any) -> Any:
+    return value.lower() if isinstance(value, str) else value
+
+
+def compile_schema(schema: Mapping[str, Any], ids: bool = False) -> Validator:
+    """
+    Compile a JSON Schema into a validator ``validate(value, path)``.
+
+    Supports the keywords the tool schemas use: ``type``, ``properties``,
+    ``required``, ``enum``, ``minimum``, ``maximum`` and ``items``. Optional
+    properties may be null, and enums compare strings case-insensitively
+    (handlers normalize case themselves). Unknown keywords are ignored.
+
+    Args:
+        ids: The value (or, for arrays, each item) is an entity id, so a
+            ``string`` also accepts an integer. Set for the properties
+            :func:`is_id_property` recognises.
+
+    Raises:
+        ToolArgumentError: From the validator, for the first mismatch
+    """
+    checks: List[Validator] = []
+
+    schema_type = schema.get("type")
+    if schema_type is not None:
+        is_type = _is_id if ids and schema_type == "string" else TYPE_CHECKS[schema_type]
+
+        def check_type(value: Any, path: str) -> None:
+            if not is_type(value):
+                raise ToolArgumentError(f"{_describe(path)} must be of type {schema_type}")
+        checks.append(check_type)
+
+    if "enum" in schema:
+        options = schema["enum"]
+        allowed = frozenset(_fold(option) for option in options)
+
+        def check_enum(value: Any, path: str) -> None:
+            if _fold(value) not in allowed:
+                raise ToolArgumentError(f"{_describe(path)} must be one of {', '.join(map(str, options))}")
+        checks.append(check_enum)
+
+    minimum, maximum = schema.get("minimum"), schema.get("maximum")
+    if minimum is not None or maximum is not None:
+        def check_range(value: Any, path: str) -> None:
+            if not isinstance(value, (int, float)) or isinstance(value, bool):
+                return
+            if (minimum is not None and value < minimum) or (maximum is not None and value > maximum):
+                bounds = " and ".join(
+                    f"{word} {bound}" for word, bound in (("at least", minimum), ("at most", maximum))
+                    if bound is not None
+                )
+                raise ToolArgumentError(f"{_describe(path)} must be {bounds}")
+        checks.append(check_range)
+
+    if "items" in schema:
+        validate_item = compile_schema(schema["items"], ids)
+
+        def check_items(value: Any, path: str) -> None:
+            if isinstance(value, list):
+                for i, item in enumerate(value):
+                    validate_item(item, _child(path, i))
+        checks.append(check_items)
+
+    properties = {
+        name: compile_schema(sub, is_id_property(name)) for name, sub in schema.get("properties", {}).items()
+    }
+    required = tuple(schema.get("required", ()))
+    if properties or required:
+        def check_properties(value: Any, path: str) -> None:
+            if not isinstance(value, dict):
+                return
+            for name in required:
+                if value.get(name) is None:
+                    raise ToolArgumentError(f"Missing required argument {_describe(_child(path, name))}")
+            for name, validate in properties.items():
+                item = value.get(name)
+                if item is not None:
+                    validate(item, _child(path, name))
+        checks.append(check_properties)
+
+    if len(checks) == 1:
+        return checks[0]
+
+    def validate(value: Any, path: str) -> None:
+        for check in checks:
+            check(value, path)
+    return validate
+
+
+class LatencyHistogram:
+    """Call durations of one tool in fixed log-scale buckets."""
+
+    def __init__(self, bounds_ms: Sequence[float] = LATENCY_BUCKETS_MS):
+        self.bounds_ms = tuple(bounds_ms)
+        self.buckets = [0] * (len(self.bounds_ms) + 1)
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, elapsed_ms: float, failed: bool = False) -> None:
+        bucket = bisect_left(self.bounds_ms, elapsed_ms)
+        with self._lock:
+            self.buckets[bucket] += 1
+            self.count += 1
+            self.errors += failed
+            self.total_ms += elapsed_ms
+            if elapsed_ms > self.max_ms:
+                self.max_ms = elapsed_ms
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        """Upper bound (ms) of the bucket holding the ``fraction`` quantile."""
+        with self._lock:
+            if not self.count:
+                return None
+            rank = max(1, round(fraction * self.count))
+            seen = 0
+            for bound, count in zip(self.bounds_ms, self.buckets):
+                seen += count
+                if seen >= rank:
+                    return round(min(bound, self.max_ms), 3)
+            return round(self.max_ms, 3)
+
+    def summary(self) -> Dict[str, Any]:
+        """Counts, mean/max and approximate percentiles, JSON-ready."""
+        with self._lock:
+            count, errors, total_ms, max_ms = self.count, self.errors, self.total_ms, self.max_ms
+            buckets = {
+                (f"<={bound}ms" if i < len(self.bounds_ms) else f">{self.bounds_ms[-1]}ms"): n
+                for i, (bound, n) in enumerate(zip(self.bounds_ms + (None,), self.buckets)) if n
+            }
+        return {
+            "calls": count,
+            "errors": errors,
+            "mean_ms": round(total_ms / count, 3) if count else None,
+            "max_ms": round(max_ms, 3),
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "buckets": buckets,
+        }
+
+
+class ToolRegistry:
+    """Tool name -> handler, argument validator and latency histogram."""
+
+    def __init__(self):
+        self._handlers: Dict[str, Handler] = {}
+        self._validators: Dict[str, Validator] = {}
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def handler(self, name: str) -> Callable[[Handler], Handler]:
+        """Decorator registering ``func(arguments)`` as the handler of ``name``."""
+        def register(func: Handler) -> Handler:
+            if name in self._handlers:
+                raise ValueError(f"Tool '{name}' already has a handler")
+            self._handlers[name] = func
+            return func
+        return register
+
+    def add_schemas(self, tools: Iterable[Any]) -> None:
+        """Compile the ``inputSchema`` of each tool (objects with ``name``/``inputSchema``)."""
+        for tool in tools:
+            self._validators[tool.name] = compile_schema(tool.inputSchema)
+
+    def remove(self, name: str) -> None:
+        """Unregister ``name``, e.g. a tool the configured backend cannot serve."""
+        self._handlers.pop(name, None)
+        self._validators.pop(name, None)
+
+    def names(self) -> List[str]:
+        return list(self._handlers)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._handlers
+
+    def _histogram(self, name: str) -> LatencyHistogram:
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(name, LatencyHistogram())
+        return histogram
+
+    def validate(self, name: str, arguments: Any) -> None:
+        """
+        Check ``arguments`` against the schema of ``name`` without running it.
+
+        Raises:
+            UnknownTool: If no handler is registered for ``name``
+            ToolArgumentError: If the arguments do not match the schema
+        """
+        if name not in self._handlers:
+            raise UnknownTool(f"Unknown tool: {name}")
+        validate = self._validators.get(name)
+        if validate is not None:
+            validate(arguments, "")
+
+    def dispatch(self, name: str, arguments: Optional[Dict[str, Any]], validate: bool = True) -> Any:
+        """
+        Validate ``arguments`` and run the handler of ``name``.
+
+        Args:
+            validate: False when the caller already ran :meth:`validate`
+
+        Raises:
+            UnknownTool: If no handler is registered for ``name``
+            ToolArgumentError: If the arguments do not match the schema
+        """
+        handler = self._handlers.get(name)
+        if handler is None:
+            raise UnknownTool(f"Unknown tool: {name}")
+        if arguments is None:
+            arguments = {}
+
+        histogram = self._histogram(name)
+        failed = True
+        start = time.perf_counter()
+        try:
+            validator = self._validators.get(name) if validate else None
+            if validator is not None:
+                validator(arguments, "")
+            result = handler(arguments)
+            failed = False
+            return result
+        finally:
+            histogram.record((time.perf_counter() - start) * 1000, failed)
+
+    def stats(self, names: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """Latency summary per tool that has been called, slowest mean first."""
+        histograms = dict(self._histograms)
+        if names is not None:
+            histograms = {name: histograms[name] for name in names if name in histograms}
+        summaries = {name: histogram.summary() for name, histogram in histograms.items() if histogram.count}
+        return dict(sorted(summaries.items(), key=lambda item: item[1]["mean_ms"] or 0, reverse=True))
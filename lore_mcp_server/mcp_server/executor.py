@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Tool Execution for the Lore System MCP Server
+
+The repositories and the JSON persistence layer are synchronous, so running
+a tool handler directly inside the async ``call_tool`` blocks the event loop:
+one slow ``export_tenant`` stalls every other request on the stdio server.
+``ToolExecutor`` runs handlers on a bounded thread pool instead.
+
+- Read-only tools (``get_*``, ``list_*``, ``search_*``, ``find_*``,
+  ``batch_get`` and ``export_tenant``) share a readers/writer lock and run
+  concurrently; every other tool takes it exclusively, so the in-memory
+  repositories never see a write racing a read.
+- Writes are fully serialized, across tools as well as within one: the
+  repositories and the persistence layer have no finer-grained locking, and
+  most write tools touch several repositories (cascading deletes, batches,
+  snapshot imports). All writes share a single slot, so at most one of them
+  holds a worker thread; queued writes wait on the event loop and cannot
+  starve reads of threads.
+- Read-only tools have a per-tool concurrency limit (an asyncio semaphore).
+  ``concurrency`` is ignored for writes.
+- Every tool has a timeout, counted from when the call gets its slot. A
+  timed-out call returns an error to the client; the worker thread cannot
+  be interrupted, so it keeps its slot until it actually finishes.
+
+Limits are read from the ``execution`` section of ``config.json``.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional
+
+
+READ_ONLY_PREFIXES = ("get_", "list_", "search_", "find_")
+# Tools that do not change repository state but whose names do not start
+# with a read-only prefix (export_tenant only writes its own output file)
+READ_ONLY_TOOLS = frozenset({"batch_get", "export_tenant"})
+
+
+class ToolTimeout(Exception):
+    """Raised when a tool does not finish within its timeout."""
+    pass
+
+
+def is_read_only(name: str) -> bool:
+    """Whether a tool only reads repository state."""
+    return name.startswith(READ_ONLY_PREFIXES) or name in READ_ONLY_TOOLS
+
+
+class ReadWriteLock:
+    """Many readers or one writer; a waiting writer blocks new readers."""
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._readers = 0
+        self._writer = False
+        self._waiting_writers = 0
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        with self._cond:
+            while self._writer or self._waiting_writers:
+                self._cond.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                if not self._readers:
+                    self._cond.notify_all()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        with self._cond:
+            self._waiting_writers += 1
+            try:
+                while self._writer or self._readers:
+                    self._cond.wait()
+            finally:
+                self._waiting_writers -= 1
+            self._writer = True
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writer = False
+                self._cond.notify_all()
+
+
+@dataclass(frozen=True)
+class ToolLimits:
+    """
+    Concurrency limit and timeout (None = no timeout) for one tool.
+
+    ``concurrency`` only applies to read-only tools; writes share one slot.
+    """
+
+    concurrency: int
+    timeout_seconds: Optional[float]
+
+
+class ToolExecutor:
+    """Runs synchronous tool handlers on a bounded thread pool."""
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        default_concurrency: int = 4,
+        default_timeout: Optional[float] = 30.0,
+        tool_limits: Optional[Mapping[str, ToolLimits]] = None,
+    ):
+        """
+        Create the executor.
+
+        Args:
+            max_workers: Threads shared by all tools
+            default_concurrency: Concurrent calls allowed per read-only tool
+            default_timeout: Seconds a call may take (None = unlimited)
+            tool_limits: Per-tool overrides
+        """
+        if max_workers < 1 or default_concurrency < 1:
+            raise ValueError("max_workers and default_concurrency must be at least 1")
+        self.default_limits = ToolLimits(default_concurrency, default_timeout)
+        self.tool_limits: Dict[str, ToolLimits] = dict(tool_limits or {})
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="lore-tool")
+        self._lock = ReadWriteLock()
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._write_slot: Optional[asyncio.Semaphore] = None
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> "ToolExecutor":
+        """Build an executor from the ``execution`` section of config.json."""
+        default_concurrency = config.get("default_concurrency", 4)
+        default_timeout = config.get("default_timeout_seconds", 30.0)
+        tool_limits = {
+            name: ToolLimits(
+                limits.get("concurrency", default_concurrency),
+                limits.get("timeout_seconds", default_timeout),
+            )
+            for name, limits in config.get("tools", {}).items()
+        }
+        return cls(
+            max_workers=config.get("max_workers", 8),
+            default_concurrency=default_concurrency,
+            default_timeout=default_timeout,
+            tool_limits=tool_limits,
+        )
+
+    def limits_for(self, name: str) -> ToolLimits:
+        return self.tool_limits.get(name, self.default_limits)
+
+    def _semaphore(self, name: str) -> asyncio.Semaphore:
+        if not is_read_only(name):
+            if self._write_slot is None:
+                self._write_slot = asyncio.Semaphore(1)
+            return self._write_slot
+        semaphore = self._semaphores.get(name)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.limits_for(name).concurrency)
+            self._semaphores[name] = semaphore
+        return semaphore
+
+    def _call(self, name: str, func: Callable[..., Any], args: tuple) -> Any:
+        lock = self._lock.read() if is_read_only(name) else self._lock.write()
+        with lock:
+            return func(*args)
+
+    async def run(self, name: str, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run ``func(*args)`` for tool ``name`` on the pool.
+
+        Raises:
+            ToolTimeout: If the call exceeds the tool's timeout
+        """
+        limits = self.limits_for(name)
+        semaphore = self._semaphore(name)
+        await semaphore.acquire()
+
+        loop = asyncio.get_running_loop()
+        try:
+            future = self._pool.submit(self._call, name, func, args)
+        except BaseException:
+            semaphore.release()
+            raise
+
+        def release(_):
+            # The slot is freed when the work ends, not when the caller stops waiting
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(semaphore.release)
+
+        future.add_done_callback(release)
+        waiter = asyncio.wrap_future(future)
+        try:
+            return await asyncio.wait_for(asyncio.shield(waiter), limits.timeout_seconds)
+        except asyncio.TimeoutError:
+            # Drops the call if it is still queued; a running call finishes in the background
+            future.cancel()
+            waiter.add_done_callback(lambda f: f.cancelled() or f.exception())
+            raise ToolTimeout(f"Tool '{name}' did not finish within {limits.timeout_seconds} seconds") from None
+
+    def shutdown(self) -> None:
+        """Wait for running calls and stop the worker threads."""
+        self._pool.shutdown(wait=True, cancel_futures=True)
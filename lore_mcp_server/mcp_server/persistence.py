@@ -3,28 +3,112 @@
 JSON Persistence Layer for Lore System MCP Server
 
 Provides save/load functionality for all lore entities to/from JSON files.
+
+Every file is written atomically: the JSON goes to a temporary file in the
+same directory which then replaces the target, so a crash never leaves a
+half-written entity behind. ``WriteBehindPersistence`` additionally moves
+the writes off the tool handlers: saves are queued, repeated saves of the
+same entity are coalesced, and a background thread flushes the queue in
+batches.
+
+:meth:`JSONPersistence.batch` groups the saves of a multi-entity tool call:
+its writes are held back and applied together, with one flush, when the
+block succeeds.
+
+``SegmentPersistence`` keeps the same API but stores every entity as a
+record in an append-only segment store (see ``segment_store``) instead of
+one file per entity. Convert an existing directory with::
+
+    python -m mcp_server.persistence convert-to-segments lore_data
 """
 
+import argparse
+import fnmatch
 import json
+import logging
 import os
+import tempfile
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Union
 from datetime import datetime
 
-# Import domain value objects for proper serialization
-from src.domain.value_objects.common import Timestamp, DateRange
+# Per-entity-class encoders, compiled on first use
+from src.infrastructure.entity_codec import EntityCodec, dumps, loads
+
+from .segment_store import DEFAULT_MAX_SEGMENT_BYTES, SegmentStore
+
+
+logger = logging.getLogger(__name__)
+
+# Date ranges are stored as {start_date, end_date}; other non-primitive
+# value-object contents as strings
+ENTITY_CODEC = EntityCodec(date_ranges_as_dicts=True, stringify_values=True)
+
+# "none": atomic rename only, the OS decides when data reaches the disk.
+# "fsync": fsync each file and its directory, so a flushed write survives power loss.
+DURABILITY_MODES = ("none", "fsync")
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Persist a rename by syncing the directory entry (no-op where unsupported)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def atomic_write_json(filepath: Union[str, Path], data: Any, durability: str = "none") -> None:
+    """
+    Write ``data`` as JSON to ``filepath`` atomically.
+
+    Args:
+        filepath: Target file
+        data: JSON-serializable data
+        durability: One of ``DURABILITY_MODES``
+    """
+    filepath = Path(filepath)
+    fd, tmp_path = tempfile.mkstemp(dir=filepath.parent, prefix=f".{filepath.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(dumps(data, indent=True))
+            if durability == "fsync":
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+    if durability == "fsync":
+        _fsync_directory(filepath.parent)
 
 
 class JSONPersistence:
     """Handles JSON serialization and persistence of lore entities."""
 
-    def __init__(self, data_dir: str = "lore_data"):
+    def __init__(self, data_dir: str = "lore_data", durability: str = "none"):
         """
         Initialize JSON persistence.
 
         Args:
             data_dir: Directory to store JSON files
+            durability: One of ``DURABILITY_MODES``
         """
+        if durability not in DURABILITY_MODES:
+            raise ValueError(f"durability must be one of {DURABILITY_MODES}, got {durability!r}")
+
+        self.durability = durability
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
 
@@ -45,6 +129,84 @@ class JSONPersistence:
                          self.environments_dir, self.textures_dir, self.models_dir]:
             dir_path.mkdir(exist_ok=True)
 
+        # Per thread: stack of writes staged by open batch() blocks
+        self._batches = threading.local()
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Hold back the writes made on this thread until the block exits.
+
+        Writes are coalesced per file and applied together, followed by one
+        :meth:`flush`, when the outermost block succeeds; an exception
+        discards the block's writes. Nested blocks work like savepoints: a
+        failing inner block drops only its own writes. Deletes are applied
+        immediately.
+        """
+        stack = getattr(self._batches, "stack", None)
+        if stack is None:
+            stack = self._batches.stack = []
+        staged: Dict[Path, dict] = {}
+        stack.append(staged)
+        try:
+            yield
+        except BaseException:
+            stack.pop()
+            raise
+        stack.pop()
+        if stack:
+            stack[-1].update(staged)
+            return
+        for filepath, data in staged.items():
+            self._write_json(filepath, data)
+        self.flush()
+
+    def _put(self, filepath: Path, data: dict) -> None:
+        """Write an entity file, or stage it inside :meth:`batch`."""
+        stack = getattr(self._batches, "stack", None)
+        if stack:
+            stack[-1][filepath] = data
+        else:
+            self._write_json(filepath, data)
+
+    def _remove(self, filepath: Path) -> bool:
+        """Delete an entity file, dropping any write of it staged in a batch."""
+        for staged in getattr(self._batches, "stack", None) or ():
+            staged.pop(filepath, None)
+        return self._delete_file(filepath)
+
+    def _write_json(self, filepath: Path, data: dict) -> None:
+        """Write one entity file."""
+        atomic_write_json(filepath, data, self.durability)
+
+    def _delete_file(self, filepath: Path) -> bool:
+        """Delete one entity file; returns whether it existed."""
+        try:
+            filepath.unlink()
+        except FileNotFoundError:
+            return False
+        return True
+
+    def _read_json(self, filepath: Union[str, Path]) -> dict:
+        """Read one entity file."""
+        with open(filepath, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _glob(self, directory: Path, pattern: str) -> List[Path]:
+        """Entity files in ``directory`` matching ``pattern``."""
+        return list(directory.glob(pattern))
+
+    def _file_size(self, filepath: Path) -> int:
+        return filepath.stat().st_size
+
+    def flush(self) -> int:
+        """Write out pending changes; plain persistence writes immediately."""
+        return 0
+
+    def close(self) -> None:
+        """Flush and release resources."""
+        self.flush()
+
     def _serialize_entity(self, entity: Any) -> dict:
         """
         Serialize a domain entity to JSON-compatible dict.
@@ -55,46 +217,7 @@ class JSONPersistence:
         Returns:
             Dictionary representation
         """
-        if entity is None:
-            return None
-
-        result = {}
-        for field_name, field_value in entity.__dict__.items():
-            if field_value is None:
-                result[field_name] = None
-            elif isinstance(field_value, DateRange):
-                # Special handling for DateRange
-                result[field_name] = {
-                    'start_date': field_value.start_date.value.isoformat(),
-                    'end_date': field_value.end_date.value.isoformat() if field_value.end_date else None
-                }
-            elif isinstance(field_value, Timestamp):
-                # Special handling for Timestamp
-                result[field_name] = field_value.value.isoformat()
-            elif hasattr(field_value, 'value'):
-                # Value object - need to serialize the inner value
-                inner_value = field_value.value
-                if isinstance(inner_value, datetime):
-                    result[field_name] = inner_value.isoformat()
-                elif isinstance(inner_value, (str, int, float, bool)):
-                    result[field_name] = inner_value
-                else:
-                    result[field_name] = str(inner_value)
-            elif isinstance(field_value, (str, int, float, bool)):
-                result[field_name] = field_value
-            elif isinstance(field_value, datetime):
-                result[field_name] = field_value.isoformat()
-            elif isinstance(field_value, list):
-                result[field_name] = [
-                    self._serialize_entity(item) if hasattr(item, '__dict__')
-                    else item.value if hasattr(item, 'value')
-                    else str(item)
-                    for item in field_value
-                ]
-            else:
-                result[field_name] = str(field_value)
-
-        return result
+        return ENTITY_CODEC.encode(entity)
 
     def save_world(self, world: Any, tenant_id: str) -> str:
         """Save a world to JSON file."""
@@ -102,8 +225,7 @@ class JSONPersistence:
         filename = f"{tenant_id}_world_{world_data['id']}.json"
         filepath = self.worlds_dir / filename
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(world_data, f, indent=2, ensure_ascii=False)
+        self._put(filepath, world_data)
 
         return str(filepath)
 
@@ -113,8 +235,7 @@ class JSONPersistence:
         filename = f"{tenant_id}_char_{char_data['id']}.json"
         filepath = self.characters_dir / filename
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(char_data, f, indent=2, ensure_ascii=False)
+        self._put(filepath, char_data)
 
         return str(filepath)
 
@@ -124,8 +245,7 @@ class JSONPersistence:
         filename = f"{tenant_id}_story_{story_data['id']}.json"
         filepath = self.stories_dir / filename
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(story_data, f, indent=2, ensure_ascii=False)
+        self._put(filepath, story_data)
 
         return str(filepath)
 
@@ -135,8 +255,7 @@ class JSONPersistence:
         filename = f"{tenant_id}_event_{event_data['id']}.json"
         filepath = self.events_dir / filename
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(event_data, f, indent=2, ensure_ascii=False)
+        self._put(filepath, event_data)
 
         return str(filepath)
 
@@ -146,8 +265,7 @@ class JSONPersistence:
         filename = f"{tenant_id}_page_{page_data['id']}.json"
         filepath = self.pages_dir / filename
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(page_data, f, indent=2, ensure_ascii=False)
+        self._put(filepath, page_data)
 
         return str(filepath)
 
@@ -157,8 +275,7 @@ class JSONPersistence:
         filename = f"{tenant_id}_item_{item_data['id']}.json"
         filepath = self.items_dir / filename
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(item_data, f, indent=2, ensure_ascii=False)
+        self._put(filepath, item_data)
 
         return str(filepath)
 
@@ -167,10 +284,7 @@ class JSONPersistence:
         filename = f"{tenant_id}_item_{item_id}.json"
         filepath = self.items_dir / filename
 
-        if filepath.exists():
-            filepath.unlink()
-            return True
-        return False
+        return self._remove(filepath)
 
     def save_location(self, location: Any, tenant_id: str) -> str:
         """Save a location to JSON file."""
@@ -178,8 +292,7 @@ class JSONPersistence:
         filename = f"{tenant_id}_location_{location_data['id']}.json"
         filepath = self.locations_dir / filename
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(location_data, f, indent=2, ensure_ascii=False)
+        self._put(filepath, location_data)
 
         return str(filepath)
 
@@ -188,10 +301,7 @@ class JSONPersistence:
         filename = f"{tenant_id}_location_{location_id}.json"
         filepath = self.locations_dir / filename
 
-        if filepath.exists():
-            filepath.unlink()
-            return True
-        return False
+        return self._remove(filepath)
 
     def save_environment(self, environment: Any, tenant_id: str) -> str:
         """Save an environment to JSON file."""
@@ -199,8 +309,7 @@ class JSONPersistence:
         filename = f"{tenant_id}_environment_{environment_data['id']}.json"
         filepath = self.environments_dir / filename
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(environment_data, f, indent=2, ensure_ascii=False)
+        self._put(filepath, environment_data)
 
         return str(filepath)
 
@@ -209,10 +318,7 @@ class JSONPersistence:
         filename = f"{tenant_id}_environment_{environment_id}.json"
         filepath = self.environments_dir / filename
 
-        if filepath.exists():
-            filepath.unlink()
-            return True
-        return False
+        return self._remove(filepath)
 
     def save_texture(self, texture: Any, tenant_id: str) -> str:
         """Save a texture to JSON file."""
@@ -220,8 +326,7 @@ class JSONPersistence:
         filename = f"{tenant_id}_texture_{texture_data['id']}.json"
         filepath = self.textures_dir / filename
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(texture_data, f, indent=2, ensure_ascii=False)
+        self._put(filepath, texture_data)
 
         return str(filepath)
 
@@ -230,10 +335,7 @@ class JSONPersistence:
         filename = f"{tenant_id}_texture_{texture_id}.json"
         filepath = self.textures_dir / filename
 
-        if filepath.exists():
-            filepath.unlink()
-            return True
-        return False
+        return self._remove(filepath)
 
     def save_3d_model(self, model: Any, tenant_id: str) -> str:
         """Save a 3D model to JSON file."""
@@ -241,8 +343,7 @@ class JSONPersistence:
         filename = f"{tenant_id}_model_{model_data['id']}.json"
         filepath = self.models_dir / filename
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(model_data, f, indent=2, ensure_ascii=False)
+        self._put(filepath, model_data)
 
         return str(filepath)
 
@@ -251,10 +352,7 @@ class JSONPersistence:
         filename = f"{tenant_id}_model_{model_id}.json"
         filepath = self.models_dir / filename
 
-        if filepath.exists():
-            filepath.unlink()
-            return True
-        return False
+        return self._remove(filepath)
 
     def save_all(self, world_repo, character_repo, story_repo, event_repo, page_repo, item_repo, location_repo,
                  environment_repo, texture_repo, model3d_repo, tenant_id: str) -> Dict[str, int]:
@@ -294,77 +392,68 @@ class JSONPersistence:
         }
 
         # Save worlds
-        worlds = world_repo.list_by_tenant(tid, limit=10000)
+        worlds = list(world_repo.stream_by_tenant(tid))
         for world in worlds:
             filepath = self.save_world(world, tenant_id)
             counts["worlds"] += 1
             counts["files"].append(filepath)
 
         # Save characters
-        characters = character_repo.list_by_tenant(tid, limit=10000)
-        for character in characters:
+        for character in character_repo.stream_by_tenant(tid):
             filepath = self.save_character(character, tenant_id)
             counts["characters"] += 1
             counts["files"].append(filepath)
 
         # Save stories (need to iterate through worlds)
         for world in worlds:
-            stories = story_repo.list_by_world(tid, world.id, limit=10000)
-            for story in stories:
+            for story in story_repo.stream_by_world(tid, world.id):
                 filepath = self.save_story(story, tenant_id)
                 counts["stories"] += 1
                 counts["files"].append(filepath)
 
         # Save events
         for world in worlds:
-            events = event_repo.list_by_world(tid, world.id, limit=10000)
-            for event in events:
+            for event in event_repo.stream_by_world(tid, world.id):
                 filepath = self.save_event(event, tenant_id)
                 counts["events"] += 1
                 counts["files"].append(filepath)
 
         # Save pages
         for world in worlds:
-            pages = page_repo.list_by_world(tid, world.id, limit=10000)
-            for page in pages:
+            for page in page_repo.stream_by_world(tid, world.id):
                 filepath = self.save_page(page, tenant_id)
                 counts["pages"] += 1
                 counts["files"].append(filepath)
 
         # Save items
         for world in worlds:
-            items = item_repo.list_by_world(tid, world.id, limit=10000)
-            for item in items:
+            for item in item_repo.stream_by_world(tid, world.id):
                 filepath = self.save_item(item, tenant_id)
                 counts["items"] += 1
                 counts["files"].append(filepath)
 
         # Save locations
         for world in worlds:
-            locations = location_repo.list_by_world(tid, world.id, limit=10000)
-            for location in locations:
+            for location in location_repo.stream_by_world(tid, world.id):
                 filepath = self.save_location(location, tenant_id)
                 counts["locations"] += 1
                 counts["files"].append(filepath)
 
         # Save environments
         for world in worlds:
-            environments = environment_repo.list_by_world(tid, world.id, limit=10000)
-            for environment in environments:
+            for environment in environment_repo.stream_by_world(tid, world.id):
                 filepath = self.save_environment(environment, tenant_id)
                 counts["environments"] += 1
                 counts["files"].append(filepath)
 
         # Save textures
-        textures = texture_repo.list_by_world(tid, limit=10000)
-        for texture in textures:
+        for texture in texture_repo.stream_by_tenant(tid):
             filepath = self.save_texture(texture, tenant_id)
             counts["textures"] += 1
             counts["files"].append(filepath)
 
         # Save 3D models
-        models = model3d_repo.list_by_world(tid, limit=10000)
-        for model in models:
+        for model in model3d_repo.stream_by_tenant(tid):
             filepath = self.save_3d_model(model, tenant_id)
             counts["models"] += 1
             counts["files"].append(filepath)
@@ -373,33 +462,27 @@ class JSONPersistence:
 
     def load_world(self, filepath: str) -> dict:
         """Load a world from JSON file."""
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return self._read_json(filepath)
 
     def load_character(self, filepath: str) -> dict:
         """Load a character from JSON file."""
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return self._read_json(filepath)
 
     def load_story(self, filepath: str) -> dict:
         """Load a story from JSON file."""
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return self._read_json(filepath)
 
     def load_event(self, filepath: str) -> dict:
         """Load an event from JSON file."""
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return self._read_json(filepath)
 
     def load_page(self, filepath: str) -> dict:
         """Load a page from JSON file."""
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return self._read_json(filepath)
 
     def load_environment(self, filepath: str) -> dict:
         """Load an environment from JSON file."""
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return self._read_json(filepath)
 
     def load_all(self, tenant_id: str) -> Dict[str, List[dict]]:
         """
@@ -421,27 +504,27 @@ class JSONPersistence:
         }
 
         # Load worlds
-        for filepath in self.worlds_dir.glob(f"{tenant_id}_world_*.json"):
+        for filepath in self._glob(self.worlds_dir, f"{tenant_id}_world_*.json"):
             data["worlds"].append(self.load_world(filepath))
 
         # Load characters
-        for filepath in self.characters_dir.glob(f"{tenant_id}_char_*.json"):
+        for filepath in self._glob(self.characters_dir, f"{tenant_id}_char_*.json"):
             data["characters"].append(self.load_character(filepath))
 
         # Load stories
-        for filepath in self.stories_dir.glob(f"{tenant_id}_story_*.json"):
+        for filepath in self._glob(self.stories_dir, f"{tenant_id}_story_*.json"):
             data["stories"].append(self.load_story(filepath))
 
         # Load events
-        for filepath in self.events_dir.glob(f"{tenant_id}_event_*.json"):
+        for filepath in self._glob(self.events_dir, f"{tenant_id}_event_*.json"):
             data["events"].append(self.load_event(filepath))
 
         # Load pages
-        for filepath in self.pages_dir.glob(f"{tenant_id}_page_*.json"):
+        for filepath in self._glob(self.pages_dir, f"{tenant_id}_page_*.json"):
             data["pages"].append(self.load_page(filepath))
 
         # Load environments
-        for filepath in self.environments_dir.glob(f"{tenant_id}_environment_*.json"):
+        for filepath in self._glob(self.environments_dir, f"{tenant_id}_environment_*.json"):
             data["environments"].append(self.load_environment(filepath))
 
         return data
@@ -476,8 +559,7 @@ class JSONPersistence:
         }
 
         filepath = self.data_dir / output_file
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
+        atomic_write_json(filepath, export_data, self.durability)
 
         return str(filepath)
 
@@ -494,11 +576,11 @@ class JSONPersistence:
         pattern = f"{tenant_id}_*" if tenant_id else "*"
 
         return {
-            "worlds": [str(f) for f in self.worlds_dir.glob(f"{pattern}.json")],
-            "characters": [str(f) for f in self.characters_dir.glob(f"{pattern}.json")],
-            "stories": [str(f) for f in self.stories_dir.glob(f"{pattern}.json")],
-            "events": [str(f) for f in self.events_dir.glob(f"{pattern}.json")],
-            "pages": [str(f) for f in self.pages_dir.glob(f"{pattern}.json")]
+            "worlds": [str(f) for f in self._glob(self.worlds_dir, f"{pattern}.json")],
+            "characters": [str(f) for f in self._glob(self.characters_dir, f"{pattern}.json")],
+            "stories": [str(f) for f in self._glob(self.stories_dir, f"{pattern}.json")],
+            "events": [str(f) for f in self._glob(self.events_dir, f"{pattern}.json")],
+            "pages": [str(f) for f in self._glob(self.pages_dir, f"{pattern}.json")]
         }
 
     def get_storage_stats(self) -> Dict[str, Any]:
@@ -519,9 +601,9 @@ class JSONPersistence:
             ("items", self.items_dir),
             ("locations", self.locations_dir)
         ]:
-            files = list(directory.glob("*.json"))
+            files = self._glob(directory, "*.json")
             file_count = len(files)
-            total_size = sum(f.stat().st_size for f in files)
+            total_size = sum(self._file_size(f) for f in files)
 
             stats["by_type"][entity_type] = {
                 "count": file_count,
@@ -531,3 +613,261 @@ class JSONPersistence:
             stats["total_size_bytes"] += total_size
 
         return stats
+
+
+# Marks a queued delete in WriteBehindPersistence._pending
+_DELETE = object()
+
+
+class WriteBehindPersistence(JSONPersistence):
+    """
+    JSON persistence that writes in the background.
+
+    ``save_*`` and ``delete_*`` serialize the entity and queue the change
+    without touching the disk. Changes are keyed by file, so saving the same
+    entity many times between flushes writes it once, with its latest state.
+    A daemon thread flushes every ``flush_interval`` seconds, or sooner once
+    ``max_pending`` changes are queued. Reads (``load_all``, exports, stats)
+    flush first so they always see every change.
+
+    Call :meth:`close` on shutdown to stop the thread and flush what is left.
+    """
+
+    def __init__(
+        self,
+        data_dir: str = "lore_data",
+        durability: str = "none",
+        flush_interval: float = 1.0,
+        max_pending: int = 500,
+    ):
+        """
+        Initialize write-behind persistence.
+
+        Args:
+            data_dir: Directory to store JSON files
+            durability: One of ``DURABILITY_MODES``
+            flush_interval: Seconds between background flushes
+            max_pending: Queued changes that trigger an early flush
+        """
+        super().__init__(data_dir, durability)
+        if flush_interval <= 0:
+            raise ValueError("flush_interval must be positive")
+
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.last_error: Optional[BaseException] = None
+
+        self._pending: Dict[Path, Any] = {}
+        self._lock = threading.Lock()
+        # Serializes flushes so an older batch never lands after a newer one
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="lore-write-behind", daemon=True)
+        self._thread.start()
+
+    @property
+    def pending_count(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def _write_json(self, filepath: Path, data: dict) -> None:
+        self._enqueue(filepath, data)
+
+    def _delete_file(self, filepath: Path) -> bool:
+        with self._lock:
+            queued = self._pending.get(filepath)
+        existed = filepath.exists() if queued is None else queued is not _DELETE
+        self._enqueue(filepath, _DELETE)
+        return existed
+
+    def _enqueue(self, filepath: Path, change: Any) -> None:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("WriteBehindPersistence is closed")
+            self._pending[filepath] = change
+            full = len(self._pending) >= self.max_pending
+        if full:
+            self._wakeup.set()
+
+    def flush(self) -> int:
+        """
+        Write every queued change now.
+
+        Returns:
+            Number of files written or deleted
+
+        Raises:
+            OSError: If a write fails; failed changes stay queued unless a
+                newer change for the same file was queued meanwhile
+        """
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+
+            done = 0
+            try:
+                for filepath, change in batch.items():
+                    if change is _DELETE:
+                        JSONPersistence._delete_file(self, filepath)
+                    else:
+                        JSONPersistence._write_json(self, filepath, change)
+                    done += 1
+            except BaseException:
+                with self._lock:
+                    for filepath, change in list(batch.items())[done:]:
+                        self._pending.setdefault(filepath, change)
+                raise
+            return done
+
+    def _run(self) -> None:
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            with self._lock:
+                closed = self._closed
+            if closed:
+                return
+            try:
+                self.flush()
+                self.last_error = None
+            except Exception as e:
+                # Keep the server running; the changes stay queued for the next flush
+                self.last_error = e
+                logger.exception("Background flush of lore JSON files failed")
+
+    def close(self) -> None:
+        """Stop the background thread and flush the remaining changes."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._wakeup.set()
+        self._thread.join()
+        self.flush()
+
+    def save_all(self, *args, **kwargs) -> Dict[str, int]:
+        counts = super().save_all(*args, **kwargs)
+        self.flush()
+        return counts
+
+    def load_all(self, tenant_id: str) -> Dict[str, List[dict]]:
+        self.flush()
+        return super().load_all(tenant_id)
+
+    def list_saved_files(self, tenant_id: Optional[str] = None) -> Dict[str, List[str]]:
+        self.flush()
+        return super().list_saved_files(tenant_id)
+
+    def get_storage_stats(self) -> Dict[str, Any]:
+        self.flush()
+        return super().get_storage_stats()
+
+
+class SegmentPersistence(JSONPersistence):
+    """
+    JSON persistence backed by an append-only segment store.
+
+    Entities keep their file names as keys, relative to ``data_dir``
+    (``worlds/7_world_1.json``), so listing, loading and the storage stats
+    behave exactly like the one-file-per-entity layout. The segments live
+    in ``data_dir/segments``.
+    """
+
+    def __init__(
+        self,
+        data_dir: str = "lore_data",
+        durability: str = "none",
+        max_segment_bytes: int = DEFAULT_MAX_SEGMENT_BYTES,
+    ):
+        super().__init__(data_dir, durability)
+        self.store = SegmentStore(
+            self.data_dir / "segments",
+            max_segment_bytes=max_segment_bytes,
+            durability=durability,
+        )
+
+    def _key(self, filepath: Union[str, Path]) -> str:
+        return Path(filepath).relative_to(self.data_dir).as_posix()
+
+    def _write_json(self, filepath: Path, data: dict) -> None:
+        value = dumps(data)
+        self.store.put(self._key(filepath), value.encode("utf-8"))
+
+    def _delete_file(self, filepath: Path) -> bool:
+        return self.store.delete(self._key(filepath))
+
+    def _read_json(self, filepath: Union[str, Path]) -> dict:
+        value = self.store.get(self._key(filepath))
+        if value is None:
+            raise FileNotFoundError(str(filepath))
+        return loads(value)
+
+    def _glob(self, directory: Path, pattern: str) -> List[Path]:
+        prefix = self._key(directory) + "/"
+        return [
+            self.data_dir / key
+            for key in self.store.keys(prefix)
+            if fnmatch.fnmatchcase(key[len(prefix):], pattern)
+        ]
+
+    def _file_size(self, filepath: Path) -> int:
+        return self.store.size_of(self._key(filepath)) or 0
+
+    def flush(self) -> int:
+        """Fsync the active segment when running with ``durability="fsync"``."""
+        if self.durability == "fsync":
+            self.store.sync()
+        return 0
+
+    def close(self) -> None:
+        self.store.close()
+
+    def compact(self) -> None:
+        """Rewrite the segments without overwritten and deleted records."""
+        self.store.compact()
+
+    def import_directory(self, source_dir: Union[str, Path]) -> int:
+        """
+        Copy the entity files of a one-file-per-entity directory into the store.
+
+        Args:
+            source_dir: Data directory written by :class:`JSONPersistence`
+
+        Returns:
+            Number of entities imported
+        """
+        source = Path(source_dir)
+        count = 0
+        for directory in [self.worlds_dir, self.characters_dir, self.stories_dir,
+                          self.events_dir, self.pages_dir, self.items_dir, self.locations_dir,
+                          self.environments_dir, self.textures_dir, self.models_dir]:
+            for filepath in sorted((source / directory.name).glob("*.json")):
+                self.store.put(f"{directory.name}/{filepath.name}", filepath.read_bytes())
+                count += 1
+        self.store.sync()
+        return count
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Lore JSON persistence tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+    convert = commands.add_parser(
+        "convert-to-segments",
+        help="Import a one-file-per-entity data directory into a segment store",
+    )
+    convert.add_argument("source", help="Existing data directory (e.g. lore_data)")
+    convert.add_argument("--target", help="Target data directory (defaults to the source)")
+    args = parser.parse_args(argv)
+
+    persistence = SegmentPersistence(args.target or args.source)
+    try:
+        count = persistence.import_directory(args.source)
+    finally:
+        persistence.close()
+    print(f"Imported {count} entities into {persistence.store.directory}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
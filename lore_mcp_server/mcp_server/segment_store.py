@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""
+Append-Only Segment Store
+
+A small log-structured key/value store used as an alternative to writing one
+JSON file per entity. All records live in a handful of segment files, so
+listing and loading a tenant never globs or stats hundreds of thousands of
+small files.
+
+- Records are appended to the active segment (``segment-00000001.log``, ...)
+  as ``header | key | value``. The header holds a CRC32 of the flags, key and
+  value, the key and value lengths, and a flags byte marking deletes
+  (tombstones).
+- An in-memory index maps every live key to the location of its latest
+  record; it is rebuilt by scanning the segments on open. A torn record at
+  the end of the newest segment (a crash mid-append) is truncated away.
+- Values are read through memory maps of the segment files.
+- Overwritten and deleted records are garbage. Once garbage makes up
+  ``compact_ratio`` of the store, :meth:`SegmentStore.compact` rewrites the
+  live records into fresh segments and removes the old ones. New segments
+  are fsynced before old ones are deleted, and replaying old and new
+  segments together yields the same state, so a crash mid-compaction loses
+  nothing.
+"""
+import mmap
+import os
+import re
+import struct
+import threading
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Union
+
+
+# crc32, key length, value length, flags
+HEADER = struct.Struct("<IIIB")
+FLAG_DELETE = 0x01
+
+SEGMENT_NAME = "segment-{:08d}.log"
+SEGMENT_PATTERN = re.compile(r"^segment-(\d{8})\.log$")
+
+DEFAULT_MAX_SEGMENT_BYTES = 64 * 1024 * 1024
+DEFAULT_COMPACT_RATIO = 0.5
+DEFAULT_COMPACT_MIN_BYTES = 4 * 1024 * 1024
+
+
+class SegmentCorruption(Exception):
+    """Raised when a sealed segment contains an unreadable record."""
+    pass
+
+
+@dataclass(frozen=True)
+class RecordLocation:
+    """Where the latest record of a key lives."""
+
+    segment: int
+    offset: int
+    key_length: int
+    value_length: int
+
+    @property
+    def size(self) -> int:
+        return HEADER.size + self.key_length + self.value_length
+
+    @property
+    def value_offset(self) -> int:
+        return self.offset + HEADER.size + self.key_length
+
+
+def encode_record(key: bytes, value: bytes, flags: int = 0) -> bytes:
+    """Encode one record (header, key and value)."""
+    crc = zlib.crc32(value, zlib.crc32(key, zlib.crc32(bytes([flags]))))
+    return HEADER.pack(crc, len(key), len(value), flags) + key + value
+
+
+class SegmentStore:
+    """
+    Append-only key/value store over segment files in ``directory``.
+
+    Keys are strings, values are bytes. Safe to share between threads.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        max_segment_bytes: int = DEFAULT_MAX_SEGMENT_BYTES,
+        durability: str = "none",
+        compact_ratio: float = DEFAULT_COMPACT_RATIO,
+        compact_min_bytes: int = DEFAULT_COMPACT_MIN_BYTES,
+    ):
+        """
+        Open (or create) a segment store.
+
+        Args:
+            directory: Directory holding the segment files
+            max_segment_bytes: Size at which the active segment is sealed
+            durability: "none" or "fsync" (fsync after every write)
+            compact_ratio: Garbage fraction that triggers compaction
+            compact_min_bytes: Stores smaller than this are never compacted
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_segment_bytes = max_segment_bytes
+        self.durability = durability
+        self.compact_ratio = compact_ratio
+        self.compact_min_bytes = compact_min_bytes
+
+        self._lock = threading.RLock()
+        self._index: Dict[str, RecordLocation] = {}
+        self._sizes: Dict[int, int] = {}
+        self._maps: Dict[int, mmap.mmap] = {}
+        self._live_bytes = 0
+        self._closed = False
+
+        self._load()
+        self._active = max(self._sizes, default=0) or self._new_segment_number()
+        self._sizes.setdefault(self._active, 0)
+        self._file = open(self._segment_path(self._active), "ab", buffering=0)
+
+    # -- segment files --------------------------------------------------
+
+    def _segment_path(self, number: int) -> Path:
+        return self.directory / SEGMENT_NAME.format(number)
+
+    def _segment_numbers(self) -> List[int]:
+        numbers = []
+        for path in self.directory.iterdir():
+            match = SEGMENT_PATTERN.match(path.name)
+            if match:
+                numbers.append(int(match.group(1)))
+        return sorted(numbers)
+
+    def _new_segment_number(self) -> int:
+        return max(self._sizes, default=0) + 1
+
+    def _view(self, number: int, end: int) -> mmap.mmap:
+        """A memory map of segment ``number`` covering at least ``end`` bytes."""
+        view = self._maps.get(number)
+        if view is None or len(view) < end:
+            if view is not None:
+                view.close()
+            with open(self._segment_path(number), "rb") as f:
+                view = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._maps[number] = view
+        return view
+
+    def _close_view(self, number: int) -> None:
+        view = self._maps.pop(number, None)
+        if view is not None:
+            view.close()
+
+    # -- recovery -------------------------------------------------------
+
+    def _load(self) -> None:
+        numbers = self._segment_numbers()
+        for position, number in enumerate(numbers):
+            path = self._segment_path(number)
+            size = path.stat().st_size
+            good = self._scan(number, size) if size else 0
+            if good < size:
+                if position != len(numbers) - 1:
+                    raise SegmentCorruption(f"{path} is corrupt at byte {good}")
+                # Torn append at the tail of the newest segment
+                self._close_view(number)
+                with open(path, "r+b") as f:
+                    f.truncate(good)
+                size = good
+            self._sizes[number] = size
+
+    def _scan(self, number: int, size: int) -> int:
+        """Index the records of one segment; returns the end of the last good record."""
+        view = self._view(number, size)
+        offset = 0
+        while offset + HEADER.size <= size:
+            crc, key_length, value_length, flags = HEADER.unpack_from(view, offset)
+            end = offset + HEADER.size + key_length + value_length
+            if end > size:
+                break
+            key = view[offset + HEADER.size:offset + HEADER.size + key_length]
+            value = view[offset + HEADER.size + key_length:end]
+            if zlib.crc32(value, zlib.crc32(key, zlib.crc32(bytes([flags])))) != crc:
+                break
+            self._apply(key.decode("utf-8"), RecordLocation(number, offset, key_length, value_length), flags)
+            offset = end
+        return offset
+
+    def _apply(self, key: str, location: RecordLocation, flags: int) -> None:
+        previous = self._index.pop(key, None)
+        if previous is not None:
+            self._live_bytes -= previous.size
+        if not flags & FLAG_DELETE:
+            self._index[key] = location
+            self._live_bytes += location.size
+
+    # -- writes ---------------------------------------------------------
+
+    def _append(self, key: str, value: bytes, flags: int) -> None:
+        if self._closed:
+            raise ValueError("SegmentStore is closed")
+
+        encoded_key = key.encode("utf-8")
+        record = encode_record(encoded_key, value, flags)
+        if self._sizes[self._active] and self._sizes[self._active] + len(record) > self.max_segment_bytes:
+            self._roll()
+
+        offset = self._sizes[self._active]
+        self._file.write(record)
+        if self.durability == "fsync":
+            os.fsync(self._file.fileno())
+        self._sizes[self._active] = offset + len(record)
+        self._apply(key, RecordLocation(self._active, offset, len(encoded_key), len(value)), flags)
+
+    def _roll(self) -> None:
+        """Seal the active segment and start a new one."""
+        self._file.close()
+        self._active = self._new_segment_number()
+        self._sizes[self._active] = 0
+        self._file = open(self._segment_path(self._active), "ab", buffering=0)
+
+    def put(self, key: str, value: bytes) -> None:
+        """Store ``value`` under ``key``, replacing any previous value."""
+        with self._lock:
+            self._append(key, value, 0)
+            self._maybe_compact()
+
+    def delete(self, key: str) -> bool:
+        """Delete ``key``; returns whether it existed."""
+        with self._lock:
+            if key not in self._index:
+                return False
+            self._append(key, b"", FLAG_DELETE)
+            self._maybe_compact()
+            return True
+
+    # -- reads ----------------------------------------------------------
+
+    def get(self, key: str) -> Optional[bytes]:
+        """The value stored under ``key``, or None."""
+        with self._lock:
+            location = self._index.get(key)
+            if location is None:
+                return None
+            end = location.value_offset + location.value_length
+            return self._view(location.segment, end)[location.value_offset:end]
+
+    def size_of(self, key: str) -> Optional[int]:
+        """Length of the value stored under ``key``, or None."""
+        with self._lock:
+            location = self._index.get(key)
+            return None if location is None else location.value_length
+
+    def keys(self, prefix: str = "") -> List[str]:
+        """Live keys starting with ``prefix``, sorted."""
+        with self._lock:
+            return sorted(key for key in self._index if key.startswith(prefix))
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._index
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._index)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def stats(self) -> Dict[str, int]:
+        """Key count, segment count, live bytes and total bytes on disk."""
+        with self._lock:
+            return {
+                "keys": len(self._index),
+                "segments": len(self._sizes),
+                "live_bytes": self._live_bytes,
+                "total_bytes": sum(self._sizes.values()),
+            }
+
+    # -- compaction -----------------------------------------------------
+
+    def _maybe_compact(self) -> None:
+        total = sum(self._sizes.values())
+        if total >= self.compact_min_bytes and total - self._live_bytes >= total * self.compact_ratio:
+            self.compact()
+
+    def compact(self) -> None:
+        """Rewrite the live records into new segments and delete the old ones."""
+        with self._lock:
+            old_numbers = sorted(self._sizes)
+            old_index = self._index
+
+            self._roll()
+            self._index = {}
+            self._live_bytes = 0
+            new_numbers = {self._active}
+            for key in sorted(old_index):
+                location = old_index[key]
+                end = location.value_offset + location.value_length
+                value = self._view(location.segment, end)[location.value_offset:end]
+                self._append(key, value, 0)
+                new_numbers.add(self._active)
+
+            # The new segments must be durable before the old ones disappear
+            for number in sorted(new_numbers):
+                if number == self._active:
+                    os.fsync(self._file.fileno())
+                else:
+                    with open(self._segment_path(number), "rb") as f:
+                        os.fsync(f.fileno())
+
+            for number in old_numbers:
+                self._close_view(number)
+                self._segment_path(number).unlink()
+                del self._sizes[number]
+
+    # -- lifecycle ------------------------------------------------------
+
+    def sync(self) -> None:
+        """Force appended records to disk."""
+        with self._lock:
+            if not self._closed:
+                os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            if self.durability == "fsync":
+                os.fsync(self._file.fileno())
+            self._file.close()
+            for number in list(self._maps):
+                self._close_view(number)
+            self._closed = True
+
+    def __enter__(self) -> "SegmentStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -38,7 +38,9 @@ if mcp_server_root not in sys.path:
 # Import standard libraries
 import asyncio
 import json
-from typing import Any, Optional
+import os
+from contextlib import nullcontext
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
 
 # Import domain entities and value objects
@@ -52,6 +54,7 @@ from src.domain.entities.location import Location
 from src.domain.entities.environment import Environment
 from src.domain.entities.texture import Texture
 from src.domain.entities.model3d import Model3D
+from src.domain.repositories.search import SearchHit
 from src.domain.value_objects.common import (
     TenantId,
     EntityId,
@@ -75,1402 +78,116 @@ from src.domain.value_objects.common import (
 )
 from src.domain.value_objects.ability import Ability, AbilityName, PowerLevel
 
-# Import in-memory repositories for demo
-from src.infrastructure.in_memory_repositories import (
-    InMemoryWorldRepository,
-    InMemoryCharacterRepository,
-    InMemoryStoryRepository,
-    InMemoryEventRepository,
-    InMemoryPageRepository,
-    InMemoryItemRepository,
-    InMemoryLocationRepository,
-    InMemoryEnvironmentRepository,
-    InMemoryTextureRepository,
-    InMemoryModel3DRepository,
-    InMemorySessionRepository,
-    InMemoryTagRepository,
-    InMemoryNoteRepository,
-    InMemoryTemplateRepository,
-    InMemoryChoiceRepository,
-    InMemoryFlowchartRepository,
-    InMemoryHandoutRepository,
-    InMemoryImageRepository,
-    InMemoryInspirationRepository,
-    InMemoryMapRepository,
-    InMemoryTokenboardRepository,
-)
-
-# Import SQLite repositories for production
-from src.infrastructure.sqlite_repositories import (
-    SQLiteDatabase,
-    SQLiteWorldRepository,
-    SQLiteCharacterRepository,
-    SQLiteItemRepository,
-    SQLiteLocationRepository,
-    SQLiteEnvironmentRepository,
-    SQLiteStoryRepository,
-    SQLiteEventRepository,
-    SQLitePageRepository,
-    SQLiteTextureRepository,
-    SQLiteModel3DRepository,
-    SQLiteSessionRepository,
-    SQLiteTagRepository,
-    SQLiteNoteRepository,
-    SQLiteTemplateRepository,
-    SQLiteChoiceRepository,
-    SQLiteFlowchartRepository,
-    SQLiteHandoutRepository,
-    SQLiteImageRepository,
-    SQLiteInspirationRepository,
-    SQLiteMapRepository,
-    SQLiteTokenboardRepository,
-)
+# Repositories are imported and constructed on first use (see RepositoryRegistry)
+from src.infrastructure.repository_registry import RepositoryRegistry
+from src.infrastructure.entity_codec import EntityCodec, dumps
+from src.infrastructure.snapshot import Snapshot, export_repositories, import_repositories
 
 # Import persistence layer
-from .persistence import JSONPersistence
+from .persistence import JSONPersistence, SegmentPersistence, WriteBehindPersistence
+from .dispatch import ToolArgumentError, ToolRegistry
+from .executor import ToolExecutor, ToolTimeout
 
-# Load configuration
-config_path = Path(__file__).parent / "config.json"
+# Load configuration (LORE_MCP_CONFIG points the server at another file)
+config_path = Path(os.environ.get("LORE_MCP_CONFIG", Path(__file__).parent / "config.json"))
 with open(config_path, 'r') as f:
     config = json.load(f)
 
 # Initialize repositories based on configuration
 connection_type = config.get("repository", {}).get("connection_type", "in_memory")
 
+# Repositories used by the tools, as (registry name, class name stem)
+TOOL_REPOSITORIES = [
+    ("world_repo", "World"),
+    ("character_repo", "Character"),
+    ("story_repo", "Story"),
+    ("event_repo", "Event"),
+    ("page_repo", "Page"),
+    ("item_repo", "Item"),
+    ("location_repo", "Location"),
+    ("environment_repo", "Environment"),
+    ("texture_repo", "Texture"),
+    ("model3d_repo", "Model3D"),
+    ("session_repo", "Session"),
+    ("tag_repo", "Tag"),
+    ("note_repo", "Note"),
+    ("template_repo", "Template"),
+    ("choice_repo", "Choice"),
+    ("flowchart_repo", "Flowchart"),
+    ("handout_repo", "Handout"),
+    ("image_repo", "Image"),
+    ("inspiration_repo", "Inspiration"),
+    ("map_repo", "Map"),
+    ("tokenboard_repo", "Tokenboard"),
+]
+
+# Ranked search tools whose SQLite repositories are not implemented yet
+# (the SQLite character, item, location and environment repositories are
+# abstract); they are only offered with in-memory repositories
+IN_MEMORY_ONLY_TOOLS = frozenset({"search_items", "search_locations", "search_environments"})
+
+# Snapshot section name of each repository ("world_repo" -> "world")
+SNAPSHOT_SECTIONS = {repo_name[:-len("_repo")]: repo_name for repo_name, _ in TOOL_REPOSITORIES}
+
+# Nothing is imported or constructed here: each repository (and the SQLite
+# database with its schema) is built the first time a tool uses it
+repositories = RepositoryRegistry()
+
 if connection_type == "sqlite":
     db_path = config.get("repository", {}).get("database_path", "lore_system.db")
     # Use path relative to mcp_server directory
     full_db_path = Path(__file__).parent / db_path
-    sqlite_db = SQLiteDatabase(str(full_db_path))
-    sqlite_db.initialize_schema()    skill_repo = Skill()
-    perk_repo = Perk()
-    trait_repo = Trait()
-    attribute_repo = Attribute()
-    experience_repo = Experience()
-    levelup_repo = LevelUp()
-    talenttree_repo = TalentTree()
-    mastery_repo = Mastery()
-    factionhierarchy_repo = FactionHierarchy()
-    factionideology_repo = FactionIdeology()
-    factionleader_repo = FactionLeader()
-    factionmembership_repo = FactionMembership()
-    factionresource_repo = FactionResource()
-    factionterritory_repo = FactionTerritory()
-    skill_repo = SQLiteSkill(sqlite_db)
-    perk_repo = SQLitePerk(sqlite_db)
-    trait_repo = SQLiteTrait(sqlite_db)
-    attribute_repo = SQLiteAttribute(sqlite_db)
-    experience_repo = SQLiteExperience(sqlite_db)
-    levelup_repo = SQLiteLevelUp(sqlite_db)
-    talenttree_repo = SQLiteTalentTree(sqlite_db)
-    mastery_repo = SQLiteMastery(sqlite_db)
-    factionhierarchy_repo = SQLiteFactionHierarchy(sqlite_db)
-    factionideology_repo = SQLiteFactionIdeology(sqlite_db)
-    factionleader_repo = SQLiteFactionLeader(sqlite_db)
-    factionmembership_repo = SQLiteFactionMembership(sqlite_db)
-    factionresource_repo = SQLiteFactionResource(sqlite_db)
-    factionterritory_repo = SQLiteFactionTerritory(sqlite_db)# All repositories
-miracle_repo = InMemoryMiracleRepository()
-miracle_repo = SQLiteMiracleRepository(sqlite_db)
-court_repo = InMemoryCourtRepository()
-court_repo = SQLiteCourtRepository(sqlite_db)
-voice_over_repo = InMemoryVoice_overRepository()
-voice_over_repo = SQLiteVoice_overRepository(sqlite_db)
-festival_repo = InMemoryFestivalRepository()
-festival_repo = SQLiteFestivalRepository(sqlite_db)
-cataclysm_repo = InMemoryCataclysmRepository()
-cataclysm_repo = SQLiteCataclysmRepository(sqlite_db)
-progression_state_repo = InMemoryProgression_stateRepository()
-progression_state_repo = SQLiteProgression_stateRepository(sqlite_db)
-chapter_repo = InMemoryChapterRepository()
-chapter_repo = SQLiteChapterRepository(sqlite_db)
-attribute_repo = InMemoryAttributeRepository()
-attribute_repo = SQLiteAttributeRepository(sqlite_db)
-nation_repo = InMemoryNationRepository()
-nation_repo = SQLiteNationRepository(sqlite_db)
-story_repo = InMemoryStoryRepository()
-story_repo = SQLiteStoryRepository(sqlite_db)
-evidence_repo = InMemoryEvidenceRepository()
-evidence_repo = SQLiteEvidenceRepository(sqlite_db)
-improvement_repo = InMemoryImprovementRepository()
-improvement_repo = SQLiteImprovementRepository(sqlite_db)
-lore_fragment_repo = InMemoryLore_fragmentRepository()
-lore_fragment_repo = SQLiteLore_fragmentRepository(sqlite_db)
-faction_repo = InMemoryFactionRepository()
-faction_repo = SQLiteFactionRepository(sqlite_db)
-concert_repo = InMemoryConcertRepository()
-concert_repo = SQLiteConcertRepository(sqlite_db)
-alliance_repo = InMemoryAllianceRepository()
-alliance_repo = SQLiteAllianceRepository(sqlite_db)
-skill_repo = InMemorySkillRepository()
-skill_repo = SQLiteSkillRepository(sqlite_db)
-cinematic_repo = InMemoryCinematicRepository()
-cinematic_repo = SQLiteCinematicRepository(sqlite_db)
-demand_repo = InMemoryDemandRepository()
-demand_repo = SQLiteDemandRepository(sqlite_db)
-note_repo = InMemoryNoteRepository()
-note_repo = SQLiteNoteRepository(sqlite_db)
-deus_ex_machina_repo = InMemoryDeus_ex_machinaRepository()
-deus_ex_machina_repo = SQLiteDeus_ex_machinaRepository(sqlite_db)
-season_repo = InMemorySeasonRepository()
-season_repo = SQLiteSeasonRepository(sqlite_db)
-flash_forward_repo = InMemoryFlash_forwardRepository()
-flash_forward_repo = SQLiteFlash_forwardRepository(sqlite_db)
-world_repo = InMemoryWorldRepository()
-world_repo = SQLiteWorldRepository(sqlite_db)
-talent_tree_repo = InMemoryTalent_treeRepository()
-talent_tree_repo = SQLiteTalent_treeRepository(sqlite_db)
-quest_repo = InMemoryQuestRepository()
-quest_repo = SQLiteQuestRepository(sqlite_db)
-legendary_weapon_repo = InMemoryLegendary_weaponRepository()
-legendary_weapon_repo = SQLiteLegendary_weaponRepository(sqlite_db)
-glyph_repo = InMemoryGlyphRepository()
-glyph_repo = SQLiteGlyphRepository(sqlite_db)
-relic_collection_repo = InMemoryRelic_collectionRepository()
-relic_collection_repo = SQLiteRelic_collectionRepository(sqlite_db)
-artifact_set_repo = InMemoryArtifact_setRepository()
-artifact_set_repo = SQLiteArtifact_setRepository(sqlite_db)
-difficulty_curve_repo = InMemoryDifficulty_curveRepository()
-difficulty_curve_repo = SQLiteDifficulty_curveRepository(sqlite_db)
-requirement_repo = InMemoryRequirementRepository()
-requirement_repo = SQLiteRequirementRepository(sqlite_db)
-plot_device_repo = InMemoryPlot_deviceRepository()
-plot_device_repo = SQLitePlot_deviceRepository(sqlite_db)
-banner_repo = InMemoryBannerRepository()
-banner_repo = SQLiteBannerRepository(sqlite_db)
-quest_reward_repo = InMemoryQuest_rewardRepository()
-quest_reward_repo = SQLiteQuest_rewardRepository(sqlite_db)
-judge_repo = InMemoryJudgeRepository()
-judge_repo = SQLiteJudgeRepository(sqlite_db)
-nightmare_repo = InMemoryNightmareRepository()
-nightmare_repo = SQLiteNightmareRepository(sqlite_db)
-secret_area_repo = InMemorySecret_areaRepository()
-secret_area_repo = SQLiteSecret_areaRepository(sqlite_db)
-pact_repo = InMemoryPactRepository()
-pact_repo = SQLitePactRepository(sqlite_db)
-war_repo = InMemoryWarRepository()
-war_repo = SQLiteWarRepository(sqlite_db)
-user_scenario_repo = InMemoryUser_scenarioRepository()
-user_scenario_repo = SQLiteUser_scenarioRepository(sqlite_db)
-visual_effect_repo = InMemoryVisual_effectRepository()
-visual_effect_repo = SQLiteVisual_effectRepository(sqlite_db)
-material_repo = InMemoryMaterialRepository()
-material_repo = SQLiteMaterialRepository(sqlite_db)
-save_point_repo = InMemorySave_pointRepository()
-save_point_repo = SQLiteSave_pointRepository(sqlite_db)
-propaganda_repo = InMemoryPropagandaRepository()
-propaganda_repo = SQLitePropagandaRepository(sqlite_db)
-leaderboard_repo = InMemoryLeaderboardRepository()
-leaderboard_repo = SQLiteLeaderboardRepository(sqlite_db)
-eclipse_repo = InMemoryEclipseRepository()
-eclipse_repo = SQLiteEclipseRepository(sqlite_db)
-balance_entities_repo = InMemoryBalance_entitiesRepository()
-balance_entities_repo = SQLiteBalance_entitiesRepository(sqlite_db)
-punishment_repo = InMemoryPunishmentRepository()
-punishment_repo = SQLitePunishmentRepository(sqlite_db)
-underground_repo = InMemoryUndergroundRepository()
-underground_repo = SQLiteUndergroundRepository(sqlite_db)
-radio_repo = InMemoryRadioRepository()
-radio_repo = SQLiteRadioRepository(sqlite_db)
-bestiary_entry_repo = InMemoryBestiary_entryRepository()
-bestiary_entry_repo = SQLiteBestiary_entryRepository(sqlite_db)
-open_world_zone_repo = InMemoryOpen_world_zoneRepository()
-open_world_zone_repo = SQLiteOpen_world_zoneRepository(sqlite_db)
-reward_repo = InMemoryRewardRepository()
-reward_repo = SQLiteRewardRepository(sqlite_db)
-drop_rate_repo = InMemoryDrop_rateRepository()
-drop_rate_repo = SQLiteDrop_rateRepository(sqlite_db)
-music_theme_repo = InMemoryMusic_themeRepository()
-music_theme_repo = SQLiteMusic_themeRepository(sqlite_db)
-constitution_repo = InMemoryConstitutionRepository()
-constitution_repo = SQLiteConstitutionRepository(sqlite_db)
-defense_repo = InMemoryDefenseRepository()
-defense_repo = SQLiteDefenseRepository(sqlite_db)
-invasion_repo = InMemoryInvasionRepository()
-invasion_repo = SQLiteInvasionRepository(sqlite_db)
-inspiration_repo = InMemoryInspirationRepository()
-inspiration_repo = SQLiteInspirationRepository(sqlite_db)
-loot_table_weight_repo = InMemoryLoot_table_weightRepository()
-loot_table_weight_repo = SQLiteLoot_table_weightRepository(sqlite_db)
-discovery_repo = InMemoryDiscoveryRepository()
-discovery_repo = SQLiteDiscoveryRepository(sqlite_db)
-mount_repo = InMemoryMountRepository()
-mount_repo = SQLiteMountRepository(sqlite_db)
-wormhole_repo = InMemoryWormholeRepository()
-wormhole_repo = SQLiteWormholeRepository(sqlite_db)
-pocket_dimension_repo = InMemoryPocket_dimensionRepository()
-pocket_dimension_repo = SQLitePocket_dimensionRepository(sqlite_db)
-event_chain_repo = InMemoryEvent_chainRepository()
-event_chain_repo = SQLiteEvent_chainRepository(sqlite_db)
-prologue_repo = InMemoryPrologueRepository()
-prologue_repo = SQLitePrologueRepository(sqlite_db)
-fade_repo = InMemoryFadeRepository()
-fade_repo = SQLiteFadeRepository(sqlite_db)
-autosave_repo = InMemoryAutosaveRepository()
-autosave_repo = SQLiteAutosaveRepository(sqlite_db)
-perk_repo = InMemoryPerkRepository()
-perk_repo = SQLitePerkRepository(sqlite_db)
-social_mobility_repo = InMemorySocial_mobilityRepository()
-social_mobility_repo = SQLiteSocial_mobilityRepository(sqlite_db)
-character_profile_entry_repo = InMemoryCharacter_profile_entryRepository()
-character_profile_entry_repo = SQLiteCharacter_profile_entryRepository(sqlite_db)
-model3d_repo = InMemoryModel3dRepository()
-model3d_repo = SQLiteModel3dRepository(sqlite_db)
-soundtrack_repo = InMemorySoundtrackRepository()
-soundtrack_repo = SQLiteSoundtrackRepository(sqlite_db)
-tag_repo = InMemoryTagRepository()
-tag_repo = SQLiteTagRepository(sqlite_db)
-inflation_repo = InMemoryInflationRepository()
-inflation_repo = SQLiteInflationRepository(sqlite_db)
-star_system_repo = InMemoryStar_systemRepository()
-star_system_repo = SQLiteStar_systemRepository(sqlite_db)
-quarter_repo = InMemoryQuarterRepository()
-quarter_repo = SQLiteQuarterRepository(sqlite_db)
-purchase_repo = InMemoryPurchaseRepository()
-purchase_repo = SQLitePurchaseRepository(sqlite_db)
-character_relationship_repo = InMemoryCharacter_relationshipRepository()
-character_relationship_repo = SQLiteCharacter_relationshipRepository(sqlite_db)
-government_repo = InMemoryGovernmentRepository()
-government_repo = SQLiteGovernmentRepository(sqlite_db)
-campaign_repo = InMemoryCampaignRepository()
-campaign_repo = SQLiteCampaignRepository(sqlite_db)
-event_repo = InMemoryEventRepository()
-event_repo = SQLiteEventRepository(sqlite_db)
-pity_repo = InMemoryPityRepository()
-pity_repo = SQLitePityRepository(sqlite_db)
-image_repo = InMemoryImageRepository()
-image_repo = SQLiteImageRepository(sqlite_db)
-translation_repo = InMemoryTranslationRepository()
-translation_repo = SQLiteTranslationRepository(sqlite_db)
-color_palette_repo = InMemoryColor_paletteRepository()
-color_palette_repo = SQLiteColor_paletteRepository(sqlite_db)
-seasonal_event_repo = InMemorySeasonal_eventRepository()
-seasonal_event_repo = SQLiteSeasonal_eventRepository(sqlite_db)
-army_repo = InMemoryArmyRepository()
-army_repo = SQLiteArmyRepository(sqlite_db)
-mod_repo = InMemoryModRepository()
-mod_repo = SQLiteModRepository(sqlite_db)
-blueprint_repo = InMemoryBlueprintRepository()
-blueprint_repo = SQLiteBlueprintRepository(sqlite_db)
-quest_tracker_repo = InMemoryQuest_trackerRepository()
-quest_tracker_repo = SQLiteQuest_trackerRepository(sqlite_db)
-rank_repo = InMemoryRankRepository()
-rank_repo = SQLiteRankRepository(sqlite_db)
-celebration_repo = InMemoryCelebrationRepository()
-celebration_repo = SQLiteCelebrationRepository(sqlite_db)
-item_repo = InMemoryItemRepository()
-item_repo = SQLiteItemRepository(sqlite_db)
-curse_repo = InMemoryCurseRepository()
-curse_repo = SQLiteCurseRepository(sqlite_db)
-hub_area_repo = InMemoryHub_areaRepository()
-hub_area_repo = SQLiteHub_areaRepository(sqlite_db)
-location_repo = InMemoryLocationRepository()
-location_repo = SQLiteLocationRepository(sqlite_db)
-revolution_repo = InMemoryRevolutionRepository()
-revolution_repo = SQLiteRevolutionRepository(sqlite_db)
-faction_resource_repo = InMemoryFaction_resourceRepository()
-faction_resource_repo = SQLiteFaction_resourceRepository(sqlite_db)
-treaty_repo = InMemoryTreatyRepository()
-treaty_repo = SQLiteTreatyRepository(sqlite_db)
-airship_repo = InMemoryAirshipRepository()
-airship_repo = SQLiteAirshipRepository(sqlite_db)
-cult_repo = InMemoryCultRepository()
-cult_repo = SQLiteCultRepository(sqlite_db)
-enchantment_repo = InMemoryEnchantmentRepository()
-enchantment_repo = SQLiteEnchantmentRepository(sqlite_db)
-instance_repo = InMemoryInstanceRepository()
-instance_repo = SQLiteInstanceRepository(sqlite_db)
-academy_repo = InMemoryAcademyRepository()
-academy_repo = SQLiteAcademyRepository(sqlite_db)
-silence_repo = InMemorySilenceRepository()
-silence_repo = SQLiteSilenceRepository(sqlite_db)
-lore_axioms_repo = InMemoryLore_axiomsRepository()
-lore_axioms_repo = SQLiteLore_axiomsRepository(sqlite_db)
-supply_repo = InMemorySupplyRepository()
-supply_repo = SQLiteSupplyRepository(sqlite_db)
-faction_membership_repo = InMemoryFaction_membershipRepository()
-faction_membership_repo = SQLiteFaction_membershipRepository(sqlite_db)
-music_state_repo = InMemoryMusic_stateRepository()
-music_state_repo = SQLiteMusic_stateRepository(sqlite_db)
-blessing_repo = InMemoryBlessingRepository()
-blessing_repo = SQLiteBlessingRepository(sqlite_db)
-prototype_repo = InMemoryPrototypeRepository()
-prototype_repo = SQLitePrototypeRepository(sqlite_db)
-faction_ideology_repo = InMemoryFaction_ideologyRepository()
-faction_ideology_repo = SQLiteFaction_ideologyRepository(sqlite_db)
-karma_repo = InMemoryKarmaRepository()
-karma_repo = SQLiteKarmaRepository(sqlite_db)
-character_variant_repo = InMemoryCharacter_variantRepository()
-character_variant_repo = SQLiteCharacter_variantRepository(sqlite_db)
-legal_system_repo = InMemoryLegal_systemRepository()
-legal_system_repo = SQLiteLegal_systemRepository(sqlite_db)
-quest_objective_repo = InMemoryQuest_objectiveRepository()
-quest_objective_repo = SQLiteQuest_objectiveRepository(sqlite_db)
-plot_branch_repo = InMemoryPlot_branchRepository()
-plot_branch_repo = SQLitePlot_branchRepository(sqlite_db)
-waypoint_repo = InMemoryWaypointRepository()
-waypoint_repo = SQLiteWaypointRepository(sqlite_db)
-progression_event_repo = InMemoryProgression_eventRepository()
-progression_event_repo = SQLiteProgression_eventRepository(sqlite_db)
-newspaper_repo = InMemoryNewspaperRepository()
-newspaper_repo = SQLiteNewspaperRepository(sqlite_db)
-ward_repo = InMemoryWardRepository()
-ward_repo = SQLiteWardRepository(sqlite_db)
-memory_repo = InMemoryMemoryRepository()
-memory_repo = SQLiteMemoryRepository(sqlite_db)
-pull_repo = InMemoryPullRepository()
-pull_repo = SQLitePullRepository(sqlite_db)
-handout_repo = InMemoryHandoutRepository()
-handout_repo = SQLiteHandoutRepository(sqlite_db)
-branch_point_repo = InMemoryBranch_pointRepository()
-branch_point_repo = SQLiteBranch_pointRepository(sqlite_db)
-world_event_repo = InMemoryWorld_eventRepository()
-world_event_repo = SQLiteWorld_eventRepository(sqlite_db)
-sect_repo = InMemorySectRepository()
-sect_repo = SQLiteSectRepository(sqlite_db)
-empire_repo = InMemoryEmpireRepository()
-empire_repo = SQLiteEmpireRepository(sqlite_db)
-quest_chain_repo = InMemoryQuest_chainRepository()
-quest_chain_repo = SQLiteQuest_chainRepository(sqlite_db)
-choice_repo = InMemoryChoiceRepository()
-choice_repo = SQLiteChoiceRepository(sqlite_db)
-rune_repo = InMemoryRuneRepository()
-rune_repo = SQLiteRuneRepository(sqlite_db)
-holiday_repo = InMemoryHolidayRepository()
-holiday_repo = SQLiteHolidayRepository(sqlite_db)
-shader_repo = InMemoryShaderRepository()
-shader_repo = SQLiteShaderRepository(sqlite_db)
-title_repo = InMemoryTitleRepository()
-title_repo = SQLiteTitleRepository(sqlite_db)
-player_metric_repo = InMemoryPlayer_metricRepository()
-player_metric_repo = SQLitePlayer_metricRepository(sqlite_db)
-epilogue_repo = InMemoryEpilogueRepository()
-epilogue_repo = SQLiteEpilogueRepository(sqlite_db)
-mystery_repo = InMemoryMysteryRepository()
-mystery_repo = SQLiteMysteryRepository(sqlite_db)
-weather_pattern_repo = InMemoryWeather_patternRepository()
-weather_pattern_repo = SQLiteWeather_patternRepository(sqlite_db)
-act_repo = InMemoryActRepository()
-act_repo = SQLiteActRepository(sqlite_db)
-episode_repo = InMemoryEpisodeRepository()
-episode_repo = SQLiteEpisodeRepository(sqlite_db)
-television_repo = InMemoryTelevisionRepository()
-television_repo = SQLiteTelevisionRepository(sqlite_db)
-siege_engine_repo = InMemorySiege_engineRepository()
-siege_engine_repo = SQLiteSiege_engineRepository(sqlite_db)
-custom_map_repo = InMemoryCustom_mapRepository()
-custom_map_repo = SQLiteCustom_mapRepository(sqlite_db)
-theme_repo = InMemoryThemeRepository()
-theme_repo = SQLiteThemeRepository(sqlite_db)
-crafting_recipe_repo = InMemoryCrafting_recipeRepository()
-crafting_recipe_repo = SQLiteCrafting_recipeRepository(sqlite_db)
-social_class_repo = InMemorySocial_classRepository()
-social_class_repo = SQLiteSocial_classRepository(sqlite_db)
-faction_leader_repo = InMemoryFaction_leaderRepository()
-faction_leader_repo = SQLiteFaction_leaderRepository(sqlite_db)
-riddle_repo = InMemoryRiddleRepository()
-riddle_repo = SQLiteRiddleRepository(sqlite_db)
-fast_travel_point_repo = InMemoryFast_travel_pointRepository()
-fast_travel_point_repo = SQLiteFast_travel_pointRepository(sqlite_db)
-museum_repo = InMemoryMuseumRepository()
-museum_repo = SQLiteMuseumRepository(sqlite_db)
-trait_repo = InMemoryTraitRepository()
-trait_repo = SQLiteTraitRepository(sqlite_db)
-familiar_repo = InMemoryFamiliarRepository()
-familiar_repo = SQLiteFamiliarRepository(sqlite_db)
-era_transition_repo = InMemoryEra_transitionRepository()
-era_transition_repo = SQLiteEra_transitionRepository(sqlite_db)
-tariff_repo = InMemoryTariffRepository()
-tariff_repo = SQLiteTariffRepository(sqlite_db)
-quest_node_repo = InMemoryQuest_nodeRepository()
-quest_node_repo = SQLiteQuest_nodeRepository(sqlite_db)
-dream_repo = InMemoryDreamRepository()
-dream_repo = SQLiteDreamRepository(sqlite_db)
-holy_site_repo = InMemoryHoly_siteRepository()
-holy_site_repo = SQLiteHoly_siteRepository(sqlite_db)
-inventory_repo = InMemoryInventoryRepository()
-inventory_repo = SQLiteInventoryRepository(sqlite_db)
-affinity_repo = InMemoryAffinityRepository()
-affinity_repo = SQLiteAffinityRepository(sqlite_db)
-alternate_reality_repo = InMemoryAlternate_realityRepository()
-alternate_reality_repo = SQLiteAlternate_realityRepository(sqlite_db)
-mount_equipment_repo = InMemoryMount_equipmentRepository()
-mount_equipment_repo = SQLiteMount_equipmentRepository(sqlite_db)
-sound_effect_repo = InMemorySound_effectRepository()
-sound_effect_repo = SQLiteSound_effectRepository(sqlite_db)
-internet_repo = InMemoryInternetRepository()
-internet_repo = SQLiteInternetRepository(sqlite_db)
-time_period_repo = InMemoryTime_periodRepository()
-time_period_repo = SQLiteTime_periodRepository(sqlite_db)
-session_repo = InMemorySessionRepository()
-session_repo = SQLiteSessionRepository(sqlite_db)
-experience_repo = InMemoryExperienceRepository()
-experience_repo = SQLiteExperienceRepository(sqlite_db)
-puzzle_repo = InMemoryPuzzleRepository()
-puzzle_repo = SQLitePuzzleRepository(sqlite_db)
-motion_capture_repo = InMemoryMotion_captureRepository()
-motion_capture_repo = SQLiteMotion_captureRepository(sqlite_db)
-fortification_repo = InMemoryFortificationRepository()
-fortification_repo = SQLiteFortificationRepository(sqlite_db)
-voice_actor_repo = InMemoryVoice_actorRepository()
-voice_actor_repo = SQLiteVoice_actorRepository(sqlite_db)
-dimension_repo = InMemoryDimensionRepository()
-dimension_repo = SQLiteDimensionRepository(sqlite_db)
-music_control_repo = InMemoryMusic_controlRepository()
-music_control_repo = SQLiteMusic_controlRepository(sqlite_db)
-dubbing_repo = InMemoryDubbingRepository()
-dubbing_repo = SQLiteDubbingRepository(sqlite_db)
-hidden_path_repo = InMemoryHidden_pathRepository()
-hidden_path_repo = SQLiteHidden_pathRepository(sqlite_db)
-fleet_repo = InMemoryFleetRepository()
-fleet_repo = SQLiteFleetRepository(sqlite_db)
-social_media_repo = InMemorySocial_mediaRepository()
-social_media_repo = SQLiteSocial_mediaRepository(sqlite_db)
-barter_repo = InMemoryBarterRepository()
-barter_repo = SQLiteBarterRepository(sqlite_db)
-calendar_repo = InMemoryCalendarRepository()
-calendar_repo = SQLiteCalendarRepository(sqlite_db)
-solstice_repo = InMemorySolsticeRepository()
-solstice_repo = SQLiteSolsticeRepository(sqlite_db)
-school_repo = InMemorySchoolRepository()
-school_repo = SQLiteSchoolRepository(sqlite_db)
-slums_repo = InMemorySlumsRepository()
-slums_repo = SQLiteSlumsRepository(sqlite_db)
-disaster_repo = InMemoryDisasterRepository()
-disaster_repo = SQLiteDisasterRepository(sqlite_db)
-mastery_repo = InMemoryMasteryRepository()
-mastery_repo = SQLiteMasteryRepository(sqlite_db)
-page_repo = InMemoryPageRepository()
-page_repo = SQLitePageRepository(sqlite_db)
-motif_repo = InMemoryMotifRepository()
-motif_repo = SQLiteMotifRepository(sqlite_db)
-spawn_point_repo = InMemorySpawn_pointRepository()
-spawn_point_repo = SQLiteSpawn_pointRepository(sqlite_db)
-workshop_entry_repo = InMemoryWorkshop_entryRepository()
-workshop_entry_repo = SQLiteWorkshop_entryRepository(sqlite_db)
-environment_repo = InMemoryEnvironmentRepository()
-environment_repo = SQLiteEnvironmentRepository(sqlite_db)
-texture_repo = InMemoryTextureRepository()
-texture_repo = SQLiteTextureRepository(sqlite_db)
-moral_choice_repo = InMemoryMoral_choiceRepository()
-moral_choice_repo = SQLiteMoral_choiceRepository(sqlite_db)
-voice_line_repo = InMemoryVoice_lineRepository()
-voice_line_repo = SQLiteVoice_lineRepository(sqlite_db)
-famine_repo = InMemoryFamineRepository()
-famine_repo = SQLiteFamineRepository(sqlite_db)
-session_data_repo = InMemorySession_dataRepository()
-session_data_repo = SQLiteSession_dataRepository(sqlite_db)
-patent_repo = InMemoryPatentRepository()
-patent_repo = SQLitePatentRepository(sqlite_db)
-archive_repo = InMemoryArchiveRepository()
-archive_repo = SQLiteArchiveRepository(sqlite_db)
-conversion_rate_repo = InMemoryConversion_rateRepository()
-conversion_rate_repo = SQLiteConversion_rateRepository(sqlite_db)
-scripture_repo = InMemoryScriptureRepository()
-scripture_repo = SQLiteScriptureRepository(sqlite_db)
-spaceship_repo = InMemorySpaceshipRepository()
-spaceship_repo = SQLiteSpaceshipRepository(sqlite_db)
-battalion_repo = InMemoryBattalionRepository()
-battalion_repo = SQLiteBattalionRepository(sqlite_db)
-phenomenon_repo = InMemoryPhenomenonRepository()
-phenomenon_repo = SQLitePhenomenonRepository(sqlite_db)
-competition_repo = InMemoryCompetitionRepository()
-competition_repo = SQLiteCompetitionRepository(sqlite_db)
-plague_repo = InMemoryPlagueRepository()
-plague_repo = SQLitePlagueRepository(sqlite_db)
-black_hole_repo = InMemoryBlack_holeRepository()
-black_hole_repo = SQLiteBlack_holeRepository(sqlite_db)
-witness_repo = InMemoryWitnessRepository()
-witness_repo = SQLiteWitnessRepository(sqlite_db)
-cursed_item_repo = InMemoryCursed_itemRepository()
-cursed_item_repo = SQLiteCursed_itemRepository(sqlite_db)
-timeline_repo = InMemoryTimelineRepository()
-timeline_repo = SQLiteTimelineRepository(sqlite_db)
-component_repo = InMemoryComponentRepository()
-component_repo = SQLiteComponentRepository(sqlite_db)
-cutscene_repo = InMemoryCutsceneRepository()
-cutscene_repo = SQLiteCutsceneRepository(sqlite_db)
-faction_hierarchy_repo = InMemoryFaction_hierarchyRepository()
-faction_hierarchy_repo = SQLiteFaction_hierarchyRepository(sqlite_db)
-music_track_repo = InMemoryMusic_trackRepository()
-music_track_repo = SQLiteMusic_trackRepository(sqlite_db)
-trap_repo = InMemoryTrapRepository()
-trap_repo = SQLiteTrapRepository(sqlite_db)
-crime_repo = InMemoryCrimeRepository()
-crime_repo = SQLiteCrimeRepository(sqlite_db)
-food_chain_repo = InMemoryFood_chainRepository()
-food_chain_repo = SQLiteFood_chainRepository(sqlite_db)
-reproduction_repo = InMemoryReproductionRepository()
-reproduction_repo = SQLiteReproductionRepository(sqlite_db)
-raid_repo = InMemoryRaidRepository()
-raid_repo = SQLiteRaidRepository(sqlite_db)
-flowchart_repo = InMemoryFlowchartRepository()
-flowchart_repo = SQLiteFlowchartRepository(sqlite_db)
-score_repo = InMemoryScoreRepository()
-score_repo = SQLiteScoreRepository(sqlite_db)
-honor_repo = InMemoryHonorRepository()
-honor_repo = SQLiteHonorRepository(sqlite_db)
-storyline_repo = InMemoryStorylineRepository()
-storyline_repo = SQLiteStorylineRepository(sqlite_db)
-level_up_repo = InMemoryLevel_upRepository()
-level_up_repo = SQLiteLevel_upRepository(sqlite_db)
-nebula_repo = InMemoryNebulaRepository()
-nebula_repo = SQLiteNebulaRepository(sqlite_db)
-codex_entry_repo = InMemoryCodex_entryRepository()
-codex_entry_repo = SQLiteCodex_entryRepository(sqlite_db)
-subtitle_repo = InMemorySubtitleRepository()
-subtitle_repo = SQLiteSubtitleRepository(sqlite_db)
-district_repo = InMemoryDistrictRepository()
-district_repo = SQLiteDistrictRepository(sqlite_db)
-quest_prerequisite_repo = InMemoryQuest_prerequisiteRepository()
-quest_prerequisite_repo = SQLiteQuest_prerequisiteRepository(sqlite_db)
-mythical_armor_repo = InMemoryMythical_armorRepository()
-mythical_armor_repo = SQLiteMythical_armorRepository(sqlite_db)
-ritual_repo = InMemoryRitualRepository()
-ritual_repo = SQLiteRitualRepository(sqlite_db)
-red_herring_repo = InMemoryRed_herringRepository()
-red_herring_repo = SQLiteRed_herringRepository(sqlite_db)
-pet_repo = InMemoryPetRepository()
-pet_repo = SQLitePetRepository(sqlite_db)
-atmosphere_repo = InMemoryAtmosphereRepository()
-atmosphere_repo = SQLiteAtmosphereRepository(sqlite_db)
-socket_repo = InMemorySocketRepository()
-socket_repo = SQLiteSocketRepository(sqlite_db)
-flashback_repo = InMemoryFlashbackRepository()
-flashback_repo = SQLiteFlashbackRepository(sqlite_db)
-badge_repo = InMemoryBadgeRepository()
-badge_repo = SQLiteBadgeRepository(sqlite_db)
-plaza_repo = InMemoryPlazaRepository()
-plaza_repo = SQLitePlazaRepository(sqlite_db)
-map_repo = InMemoryMapRepository()
-map_repo = SQLiteMapRepository(sqlite_db)
-era_repo = InMemoryEraRepository()
-era_repo = SQLiteEraRepository(sqlite_db)
-tournament_repo = InMemoryTournamentRepository()
-tournament_repo = SQLiteTournamentRepository(sqlite_db)
-share_code_repo = InMemoryShare_codeRepository()
-share_code_repo = SQLiteShare_codeRepository(sqlite_db)
-localization_repo = InMemoryLocalizationRepository()
-localization_repo = SQLiteLocalizationRepository(sqlite_db)
-market_square_repo = InMemoryMarket_squareRepository()
-market_square_repo = SQLiteMarket_squareRepository(sqlite_db)
-research_center_repo = InMemoryResearch_centerRepository()
-research_center_repo = SQLiteResearch_centerRepository(sqlite_db)
-heatmap_repo = InMemoryHeatmapRepository()
-heatmap_repo = SQLiteHeatmapRepository(sqlite_db)
-research_repo = InMemoryResearchRepository()
-research_repo = SQLiteResearchRepository(sqlite_db)
-rumor_repo = InMemoryRumorRepository()
-rumor_repo = SQLiteRumorRepository(sqlite_db)
-invention_repo = InMemoryInventionRepository()
-invention_repo = SQLiteInventionRepository(sqlite_db)
-camera_path_repo = InMemoryCamera_pathRepository()
-camera_path_repo = SQLiteCamera_pathRepository(sqlite_db)
-enigma_repo = InMemoryEnigmaRepository()
-enigma_repo = SQLiteEnigmaRepository(sqlite_db)
-chekhovs_gun_repo = InMemoryChekhovs_gunRepository()
-chekhovs_gun_repo = SQLiteChekhovs_gunRepository(sqlite_db)
-reputation_repo = InMemoryReputationRepository()
-reputation_repo = SQLiteReputationRepository(sqlite_db)
-particle_repo = InMemoryParticleRepository()
-particle_repo = SQLiteParticleRepository(sqlite_db)
-faction_territory_repo = InMemoryFaction_territoryRepository()
-faction_territory_repo = SQLiteFaction_territoryRepository(sqlite_db)
-character_evolution_repo = InMemoryCharacter_evolutionRepository()
-character_evolution_repo = SQLiteCharacter_evolutionRepository(sqlite_db)
-teleporter_repo = InMemoryTeleporterRepository()
-teleporter_repo = SQLiteTeleporterRepository(sqlite_db)
-shop_repo = InMemoryShopRepository()
-shop_repo = SQLiteShopRepository(sqlite_db)
-arena_repo = InMemoryArenaRepository()
-arena_repo = SQLiteArenaRepository(sqlite_db)
-currency_repo = InMemoryCurrencyRepository()
-currency_repo = SQLiteCurrencyRepository(sqlite_db)
-exhibition_repo = InMemoryExhibitionRepository()
-exhibition_repo = SQLiteExhibitionRepository(sqlite_db)
-migration_repo = InMemoryMigrationRepository()
-migration_repo = SQLiteMigrationRepository(sqlite_db)
-foreshadowing_repo = InMemoryForeshadowingRepository()
-foreshadowing_repo = SQLiteForeshadowingRepository(sqlite_db)
-skybox_repo = InMemorySkyboxRepository()
-skybox_repo = SQLiteSkyboxRepository(sqlite_db)
-quest_reward_tier_repo = InMemoryQuest_reward_tierRepository()
-quest_reward_tier_repo = SQLiteQuest_reward_tierRepository(sqlite_db)
-character_repo = InMemoryCharacterRepository()
-character_repo = SQLiteCharacterRepository(sqlite_db)
-evolution_repo = InMemoryEvolutionRepository()
-evolution_repo = SQLiteEvolutionRepository(sqlite_db)
-hibernation_repo = InMemoryHibernationRepository()
-hibernation_repo = SQLiteHibernationRepository(sqlite_db)
-consequence_repo = InMemoryConsequenceRepository()
-consequence_repo = SQLiteConsequenceRepository(sqlite_db)
-divine_item_repo = InMemoryDivine_itemRepository()
-divine_item_repo = SQLiteDivine_itemRepository(sqlite_db)
-easter_egg_repo = InMemoryEaster_eggRepository()
-easter_egg_repo = SQLiteEaster_eggRepository(sqlite_db)
-vehicle_repo = InMemoryVehicleRepository()
-vehicle_repo = SQLiteVehicleRepository(sqlite_db)
-weapon_system_repo = InMemoryWeapon_systemRepository()
-weapon_system_repo = SQLiteWeapon_systemRepository(sqlite_db)
-port_district_repo = InMemoryPort_districtRepository()
-port_district_repo = SQLitePort_districtRepository(sqlite_db)
-library_repo = InMemoryLibraryRepository()
-library_repo = SQLiteLibraryRepository(sqlite_db)
-tokenboard_repo = InMemoryTokenboardRepository()
-tokenboard_repo = SQLiteTokenboardRepository(sqlite_db)
-lighting_repo = InMemoryLightingRepository()
-lighting_repo = SQLiteLightingRepository(sqlite_db)
-checkpoint_repo = InMemoryCheckpointRepository()
-checkpoint_repo = SQLiteCheckpointRepository(sqlite_db)
-university_repo = InMemoryUniversityRepository()
-university_repo = SQLiteUniversityRepository(sqlite_db)
-trophy_repo = InMemoryTrophyRepository()
-trophy_repo = SQLiteTrophyRepository(sqlite_db)
-summon_repo = InMemorySummonRepository()
-summon_repo = SQLiteSummonRepository(sqlite_db)
-kingdom_repo = InMemoryKingdomRepository()
-kingdom_repo = SQLiteKingdomRepository(sqlite_db)
-law_repo = InMemoryLawRepository()
-law_repo = SQLiteLawRepository(sqlite_db)
-template_repo = InMemoryTemplateRepository()
-template_repo = SQLiteTemplateRepository(sqlite_db)
-achievement_repo = InMemoryAchievementRepository()
-achievement_repo = SQLiteAchievementRepository(sqlite_db)
-transition_repo = InMemoryTransitionRepository()
-transition_repo = SQLiteTransitionRepository(sqlite_db)
-tax_repo = InMemoryTaxRepository()
-tax_repo = SQLiteTaxRepository(sqlite_db)
-lawyer_repo = InMemoryLawyerRepository()
-lawyer_repo = SQLiteLawyerRepository(sqlite_db)
-quest_giver_repo = InMemoryQuest_giverRepository()
-quest_giver_repo = SQLiteQuest_giverRepository(sqlite_db)
-price_repo = InMemoryPriceRepository()
-price_repo = SQLitePriceRepository(sqlite_db)
-ending_repo = InMemoryEndingRepository()
-ending_repo = SQLiteEndingRepository(sqlite_db)
-portal_repo = InMemoryPortalRepository()
-portal_repo = SQLitePortalRepository(sqlite_db)
-trade_repo = InMemoryTradeRepository()
-trade_repo = SQLiteTradeRepository(sqlite_db)
-oath_repo = InMemoryOathRepository()
-oath_repo = SQLiteOathRepository(sqlite_db)
-ambient_repo = InMemoryAmbientRepository()
-ambient_repo = SQLiteAmbientRepository(sqlite_db)
-moon_repo = InMemoryMoonRepository()
-moon_repo = SQLiteMoonRepository(sqlite_db)
-extinction_repo = InMemoryExtinctionRepository()
-extinction_repo = SQLiteExtinctionRepository(sqlite_db)
-dungeon_repo = InMemoryDungeonRepository()
-dungeon_repo = SQLiteDungeonRepository(sqlite_db)
-journal_page_repo = InMemoryJournal_pageRepository()
-journal_page_repo = SQLiteJournal_pageRepository(sqlite_db)
-galaxy_repo = InMemoryGalaxyRepository()
-galaxy_repo = SQLiteGalaxyRepository(sqlite_db)
-player_profile_repo = InMemoryPlayer_profileRepository()
-player_profile_repo = SQLitePlayer_profileRepository(sqlite_db)
-noble_district_repo = InMemoryNoble_districtRepository()
-noble_district_repo = SQLiteNoble_districtRepository(sqlite_db)
-disposition_repo = InMemoryDispositionRepository()
-disposition_repo = SQLiteDispositionRepository(sqlite_db)
-jury_repo = InMemoryJuryRepository()
-jury_repo = SQLiteJuryRepository(sqlite_db)
-ceremony_repo = InMemoryCeremonyRepository()
-ceremony_repo = SQLiteCeremonyRepository(sqlite_db)# Placeholder repositories
-
-
-
-
-
-
-
 
+    def open_database():
+        from src.infrastructure.sqlite_repositories import SQLiteDatabase
+        sqlite_db = SQLiteDatabase(str(full_db_path))
+        sqlite_db.initialize_schema()
+        return sqlite_db
 
     # Use SQLite repositories for all entities
-    world_repo = SQLiteWorldRepository(sqlite_db)
-    character_repo = SQLiteCharacterRepository(sqlite_db)
-    story_repo = SQLiteStoryRepository(sqlite_db)
-    event_repo = SQLiteEventRepository(sqlite_db)
-    page_repo = SQLitePageRepository(sqlite_db)
-    item_repo = SQLiteItemRepository(sqlite_db)
-    location_repo = SQLiteLocationRepository(sqlite_db)
-    environment_repo = SQLiteEnvironmentRepository(sqlite_db)
-    texture_repo = SQLiteTextureRepository(sqlite_db)
-    model3d_repo = SQLiteModel3DRepository(sqlite_db)
-    session_repo = SQLiteSessionRepository(sqlite_db)
-    tag_repo = SQLiteTagRepository(sqlite_db)
-    note_repo = SQLiteNoteRepository(sqlite_db)
-    template_repo = SQLiteTemplateRepository(sqlite_db)
-    choice_repo = SQLiteChoiceRepository(sqlite_db)
-    flowchart_repo = SQLiteFlowchartRepository(sqlite_db)
-    handout_repo = SQLiteHandoutRepository(sqlite_db)
-    image_repo = SQLiteImageRepository(sqlite_db)
-    inspiration_repo = SQLiteInspirationRepository(sqlite_db)
-    map_repo = SQLiteMapRepository(sqlite_db)
-    tokenboard_repo = SQLiteTokenboardRepository(sqlite_db)
+    repositories.register("sqlite_db", open_database)
+    for repo_name, stem in TOOL_REPOSITORIES:
+        repositories.register_class(
+            repo_name, f"src.infrastructure.sqlite_repositories:SQLite{stem}Repository", "sqlite_db"
+        )
 else:
     # Default to in-memory repositories
-    world_repo = InMemoryWorldRepository()
-    character_repo = InMemoryCharacterRepository()
-    story_repo = InMemoryStoryRepository()
-    event_repo = InMemoryEventRepository()
-    page_repo = InMemoryPageRepository()
-    item_repo = InMemoryItemRepository()
-    location_repo = InMemoryLocationRepository()
-    environment_repo = InMemoryEnvironmentRepository()
-    texture_repo = InMemoryTextureRepository()
-    model3d_repo = InMemoryModel3DRepository()
-    session_repo = InMemorySessionRepository()
-    tag_repo = InMemoryTagRepository()
-    note_repo = InMemoryNoteRepository()
-    template_repo = InMemoryTemplateRepository()
-    choice_repo = InMemoryChoiceRepository()
-    flowchart_repo = InMemoryFlowchartRepository()
-    handout_repo = InMemoryHandoutRepository()
-    image_repo = InMemoryImageRepository()
-    inspiration_repo = InMemoryInspirationRepository()
-    map_repo = InMemoryMapRepository()
-    tokenboard_repo = InMemoryTokenboardRepository()    skill_repo = Skill()
-    perk_repo = Perk()
-    trait_repo = Trait()
-    attribute_repo = Attribute()
-    experience_repo = Experience()
-    levelup_repo = LevelUp()
-    talenttree_repo = TalentTree()
-    mastery_repo = Mastery()
-    factionhierarchy_repo = FactionHierarchy()
-    factionideology_repo = FactionIdeology()
-    factionleader_repo = FactionLeader()
-    factionmembership_repo = FactionMembership()
-    factionresource_repo = FactionResource()
-    factionterritory_repo = FactionTerritory()
-    skill_repo = SQLiteSkill(sqlite_db)
-    perk_repo = SQLitePerk(sqlite_db)
-    trait_repo = SQLiteTrait(sqlite_db)
-    attribute_repo = SQLiteAttribute(sqlite_db)
-    experience_repo = SQLiteExperience(sqlite_db)
-    levelup_repo = SQLiteLevelUp(sqlite_db)
-    talenttree_repo = SQLiteTalentTree(sqlite_db)
-    mastery_repo = SQLiteMastery(sqlite_db)
-    factionhierarchy_repo = SQLiteFactionHierarchy(sqlite_db)
-    factionideology_repo = SQLiteFactionIdeology(sqlite_db)
-    factionleader_repo = SQLiteFactionLeader(sqlite_db)
-    factionmembership_repo = SQLiteFactionMembership(sqlite_db)
-    factionresource_repo = SQLiteFactionResource(sqlite_db)
-    factionterritory_repo = SQLiteFactionTerritory(sqlite_db)# All repositories
-miracle_repo = InMemoryMiracleRepository()
-miracle_repo = SQLiteMiracleRepository(sqlite_db)
-court_repo = InMemoryCourtRepository()
-court_repo = SQLiteCourtRepository(sqlite_db)
-voice_over_repo = InMemoryVoice_overRepository()
-voice_over_repo = SQLiteVoice_overRepository(sqlite_db)
-festival_repo = InMemoryFestivalRepository()
-festival_repo = SQLiteFestivalRepository(sqlite_db)
-cataclysm_repo = InMemoryCataclysmRepository()
-cataclysm_repo = SQLiteCataclysmRepository(sqlite_db)
-progression_state_repo = InMemoryProgression_stateRepository()
-progression_state_repo = SQLiteProgression_stateRepository(sqlite_db)
-chapter_repo = InMemoryChapterRepository()
-chapter_repo = SQLiteChapterRepository(sqlite_db)
-attribute_repo = InMemoryAttributeRepository()
-attribute_repo = SQLiteAttributeRepository(sqlite_db)
-nation_repo = InMemoryNationRepository()
-nation_repo = SQLiteNationRepository(sqlite_db)
-story_repo = InMemoryStoryRepository()
-story_repo = SQLiteStoryRepository(sqlite_db)
-evidence_repo = InMemoryEvidenceRepository()
-evidence_repo = SQLiteEvidenceRepository(sqlite_db)
-improvement_repo = InMemoryImprovementRepository()
-improvement_repo = SQLiteImprovementRepository(sqlite_db)
-lore_fragment_repo = InMemoryLore_fragmentRepository()
-lore_fragment_repo = SQLiteLore_fragmentRepository(sqlite_db)
-faction_repo = InMemoryFactionRepository()
-faction_repo = SQLiteFactionRepository(sqlite_db)
-concert_repo = InMemoryConcertRepository()
-concert_repo = SQLiteConcertRepository(sqlite_db)
-alliance_repo = InMemoryAllianceRepository()
-alliance_repo = SQLiteAllianceRepository(sqlite_db)
-skill_repo = InMemorySkillRepository()
-skill_repo = SQLiteSkillRepository(sqlite_db)
-cinematic_repo = InMemoryCinematicRepository()
-cinematic_repo = SQLiteCinematicRepository(sqlite_db)
-demand_repo = InMemoryDemandRepository()
-demand_repo = SQLiteDemandRepository(sqlite_db)
-note_repo = InMemoryNoteRepository()
-note_repo = SQLiteNoteRepository(sqlite_db)
-deus_ex_machina_repo = InMemoryDeus_ex_machinaRepository()
-deus_ex_machina_repo = SQLiteDeus_ex_machinaRepository(sqlite_db)
-season_repo = InMemorySeasonRepository()
-season_repo = SQLiteSeasonRepository(sqlite_db)
-flash_forward_repo = InMemoryFlash_forwardRepository()
-flash_forward_repo = SQLiteFlash_forwardRepository(sqlite_db)
-world_repo = InMemoryWorldRepository()
-world_repo = SQLiteWorldRepository(sqlite_db)
-talent_tree_repo = InMemoryTalent_treeRepository()
-talent_tree_repo = SQLiteTalent_treeRepository(sqlite_db)
-quest_repo = InMemoryQuestRepository()
-quest_repo = SQLiteQuestRepository(sqlite_db)
-legendary_weapon_repo = InMemoryLegendary_weaponRepository()
-legendary_weapon_repo = SQLiteLegendary_weaponRepository(sqlite_db)
-glyph_repo = InMemoryGlyphRepository()
-glyph_repo = SQLiteGlyphRepository(sqlite_db)
-relic_collection_repo = InMemoryRelic_collectionRepository()
-relic_collection_repo = SQLiteRelic_collectionRepository(sqlite_db)
-artifact_set_repo = InMemoryArtifact_setRepository()
-artifact_set_repo = SQLiteArtifact_setRepository(sqlite_db)
-difficulty_curve_repo = InMemoryDifficulty_curveRepository()
-difficulty_curve_repo = SQLiteDifficulty_curveRepository(sqlite_db)
-requirement_repo = InMemoryRequirementRepository()
-requirement_repo = SQLiteRequirementRepository(sqlite_db)
-plot_device_repo = InMemoryPlot_deviceRepository()
-plot_device_repo = SQLitePlot_deviceRepository(sqlite_db)
-banner_repo = InMemoryBannerRepository()
-banner_repo = SQLiteBannerRepository(sqlite_db)
-quest_reward_repo = InMemoryQuest_rewardRepository()
-quest_reward_repo = SQLiteQuest_rewardRepository(sqlite_db)
-judge_repo = InMemoryJudgeRepository()
-judge_repo = SQLiteJudgeRepository(sqlite_db)
-nightmare_repo = InMemoryNightmareRepository()
-nightmare_repo = SQLiteNightmareRepository(sqlite_db)
-secret_area_repo = InMemorySecret_areaRepository()
-secret_area_repo = SQLiteSecret_areaRepository(sqlite_db)
-pact_repo = InMemoryPactRepository()
-pact_repo = SQLitePactRepository(sqlite_db)
-war_repo = InMemoryWarRepository()
-war_repo = SQLiteWarRepository(sqlite_db)
-user_scenario_repo = InMemoryUser_scenarioRepository()
-user_scenario_repo = SQLiteUser_scenarioRepository(sqlite_db)
-visual_effect_repo = InMemoryVisual_effectRepository()
-visual_effect_repo = SQLiteVisual_effectRepository(sqlite_db)
-material_repo = InMemoryMaterialRepository()
-material_repo = SQLiteMaterialRepository(sqlite_db)
-save_point_repo = InMemorySave_pointRepository()
-save_point_repo = SQLiteSave_pointRepository(sqlite_db)
-propaganda_repo = InMemoryPropagandaRepository()
-propaganda_repo = SQLitePropagandaRepository(sqlite_db)
-leaderboard_repo = InMemoryLeaderboardRepository()
-leaderboard_repo = SQLiteLeaderboardRepository(sqlite_db)
-eclipse_repo = InMemoryEclipseRepository()
-eclipse_repo = SQLiteEclipseRepository(sqlite_db)
-balance_entities_repo = InMemoryBalance_entitiesRepository()
-balance_entities_repo = SQLiteBalance_entitiesRepository(sqlite_db)
-punishment_repo = InMemoryPunishmentRepository()
-punishment_repo = SQLitePunishmentRepository(sqlite_db)
-underground_repo = InMemoryUndergroundRepository()
-underground_repo = SQLiteUndergroundRepository(sqlite_db)
-radio_repo = InMemoryRadioRepository()
-radio_repo = SQLiteRadioRepository(sqlite_db)
-bestiary_entry_repo = InMemoryBestiary_entryRepository()
-bestiary_entry_repo = SQLiteBestiary_entryRepository(sqlite_db)
-open_world_zone_repo = InMemoryOpen_world_zoneRepository()
-open_world_zone_repo = SQLiteOpen_world_zoneRepository(sqlite_db)
-reward_repo = InMemoryRewardRepository()
-reward_repo = SQLiteRewardRepository(sqlite_db)
-drop_rate_repo = InMemoryDrop_rateRepository()
-drop_rate_repo = SQLiteDrop_rateRepository(sqlite_db)
-music_theme_repo = InMemoryMusic_themeRepository()
-music_theme_repo = SQLiteMusic_themeRepository(sqlite_db)
-constitution_repo = InMemoryConstitutionRepository()
-constitution_repo = SQLiteConstitutionRepository(sqlite_db)
-defense_repo = InMemoryDefenseRepository()
-defense_repo = SQLiteDefenseRepository(sqlite_db)
-invasion_repo = InMemoryInvasionRepository()
-invasion_repo = SQLiteInvasionRepository(sqlite_db)
-inspiration_repo = InMemoryInspirationRepository()
-inspiration_repo = SQLiteInspirationRepository(sqlite_db)
-loot_table_weight_repo = InMemoryLoot_table_weightRepository()
-loot_table_weight_repo = SQLiteLoot_table_weightRepository(sqlite_db)
-discovery_repo = InMemoryDiscoveryRepository()
-discovery_repo = SQLiteDiscoveryRepository(sqlite_db)
-mount_repo = InMemoryMountRepository()
-mount_repo = SQLiteMountRepository(sqlite_db)
-wormhole_repo = InMemoryWormholeRepository()
-wormhole_repo = SQLiteWormholeRepository(sqlite_db)
-pocket_dimension_repo = InMemoryPocket_dimensionRepository()
-pocket_dimension_repo = SQLitePocket_dimensionRepository(sqlite_db)
-event_chain_repo = InMemoryEvent_chainRepository()
-event_chain_repo = SQLiteEvent_chainRepository(sqlite_db)
-prologue_repo = InMemoryPrologueRepository()
-prologue_repo = SQLitePrologueRepository(sqlite_db)
-fade_repo = InMemoryFadeRepository()
-fade_repo = SQLiteFadeRepository(sqlite_db)
-autosave_repo = InMemoryAutosaveRepository()
-autosave_repo = SQLiteAutosaveRepository(sqlite_db)
-perk_repo = InMemoryPerkRepository()
-perk_repo = SQLitePerkRepository(sqlite_db)
-social_mobility_repo = InMemorySocial_mobilityRepository()
-social_mobility_repo = SQLiteSocial_mobilityRepository(sqlite_db)
-character_profile_entry_repo = InMemoryCharacter_profile_entryRepository()
-character_profile_entry_repo = SQLiteCharacter_profile_entryRepository(sqlite_db)
-model3d_repo = InMemoryModel3dRepository()
-model3d_repo = SQLiteModel3dRepository(sqlite_db)
-soundtrack_repo = InMemorySoundtrackRepository()
-soundtrack_repo = SQLiteSoundtrackRepository(sqlite_db)
-tag_repo = InMemoryTagRepository()
-tag_repo = SQLiteTagRepository(sqlite_db)
-inflation_repo = InMemoryInflationRepository()
-inflation_repo = SQLiteInflationRepository(sqlite_db)
-star_system_repo = InMemoryStar_systemRepository()
-star_system_repo = SQLiteStar_systemRepository(sqlite_db)
-quarter_repo = InMemoryQuarterRepository()
-quarter_repo = SQLiteQuarterRepository(sqlite_db)
-purchase_repo = InMemoryPurchaseRepository()
-purchase_repo = SQLitePurchaseRepository(sqlite_db)
-character_relationship_repo = InMemoryCharacter_relationshipRepository()
-character_relationship_repo = SQLiteCharacter_relationshipRepository(sqlite_db)
-government_repo = InMemoryGovernmentRepository()
-government_repo = SQLiteGovernmentRepository(sqlite_db)
-campaign_repo = InMemoryCampaignRepository()
-campaign_repo = SQLiteCampaignRepository(sqlite_db)
-event_repo = InMemoryEventRepository()
-event_repo = SQLiteEventRepository(sqlite_db)
-pity_repo = InMemoryPityRepository()
-pity_repo = SQLitePityRepository(sqlite_db)
-image_repo = InMemoryImageRepository()
-image_repo = SQLiteImageRepository(sqlite_db)
-translation_repo = InMemoryTranslationRepository()
-translation_repo = SQLiteTranslationRepository(sqlite_db)
-color_palette_repo = InMemoryColor_paletteRepository()
-color_palette_repo = SQLiteColor_paletteRepository(sqlite_db)
-seasonal_event_repo = InMemorySeasonal_eventRepository()
-seasonal_event_repo = SQLiteSeasonal_eventRepository(sqlite_db)
-army_repo = InMemoryArmyRepository()
-army_repo = SQLiteArmyRepository(sqlite_db)
-mod_repo = InMemoryModRepository()
-mod_repo = SQLiteModRepository(sqlite_db)
-blueprint_repo = InMemoryBlueprintRepository()
-blueprint_repo = SQLiteBlueprintRepository(sqlite_db)
-quest_tracker_repo = InMemoryQuest_trackerRepository()
-quest_tracker_repo = SQLiteQuest_trackerRepository(sqlite_db)
-rank_repo = InMemoryRankRepository()
-rank_repo = SQLiteRankRepository(sqlite_db)
-celebration_repo = InMemoryCelebrationRepository()
-celebration_repo = SQLiteCelebrationRepository(sqlite_db)
-item_repo = InMemoryItemRepository()
-item_repo = SQLiteItemRepository(sqlite_db)
-curse_repo = InMemoryCurseRepository()
-curse_repo = SQLiteCurseRepository(sqlite_db)
-hub_area_repo = InMemoryHub_areaRepository()
-hub_area_repo = SQLiteHub_areaRepository(sqlite_db)
-location_repo = InMemoryLocationRepository()
-location_repo = SQLiteLocationRepository(sqlite_db)
-revolution_repo = InMemoryRevolutionRepository()
-revolution_repo = SQLiteRevolutionRepository(sqlite_db)
-faction_resource_repo = InMemoryFaction_resourceRepository()
-faction_resource_repo = SQLiteFaction_resourceRepository(sqlite_db)
-treaty_repo = InMemoryTreatyRepository()
-treaty_repo = SQLiteTreatyRepository(sqlite_db)
-airship_repo = InMemoryAirshipRepository()
-airship_repo = SQLiteAirshipRepository(sqlite_db)
-cult_repo = InMemoryCultRepository()
-cult_repo = SQLiteCultRepository(sqlite_db)
-enchantment_repo = InMemoryEnchantmentRepository()
-enchantment_repo = SQLiteEnchantmentRepository(sqlite_db)
-instance_repo = InMemoryInstanceRepository()
-instance_repo = SQLiteInstanceRepository(sqlite_db)
-academy_repo = InMemoryAcademyRepository()
-academy_repo = SQLiteAcademyRepository(sqlite_db)
-silence_repo = InMemorySilenceRepository()
-silence_repo = SQLiteSilenceRepository(sqlite_db)
-lore_axioms_repo = InMemoryLore_axiomsRepository()
-lore_axioms_repo = SQLiteLore_axiomsRepository(sqlite_db)
-supply_repo = InMemorySupplyRepository()
-supply_repo = SQLiteSupplyRepository(sqlite_db)
-faction_membership_repo = InMemoryFaction_membershipRepository()
-faction_membership_repo = SQLiteFaction_membershipRepository(sqlite_db)
-music_state_repo = InMemoryMusic_stateRepository()
-music_state_repo = SQLiteMusic_stateRepository(sqlite_db)
-blessing_repo = InMemoryBlessingRepository()
-blessing_repo = SQLiteBlessingRepository(sqlite_db)
-prototype_repo = InMemoryPrototypeRepository()
-prototype_repo = SQLitePrototypeRepository(sqlite_db)
-faction_ideology_repo = InMemoryFaction_ideologyRepository()
-faction_ideology_repo = SQLiteFaction_ideologyRepository(sqlite_db)
-karma_repo = InMemoryKarmaRepository()
-karma_repo = SQLiteKarmaRepository(sqlite_db)
-character_variant_repo = InMemoryCharacter_variantRepository()
-character_variant_repo = SQLiteCharacter_variantRepository(sqlite_db)
-legal_system_repo = InMemoryLegal_systemRepository()
-legal_system_repo = SQLiteLegal_systemRepository(sqlite_db)
-quest_objective_repo = InMemoryQuest_objectiveRepository()
-quest_objective_repo = SQLiteQuest_objectiveRepository(sqlite_db)
-plot_branch_repo = InMemoryPlot_branchRepository()
-plot_branch_repo = SQLitePlot_branchRepository(sqlite_db)
-waypoint_repo = InMemoryWaypointRepository()
-waypoint_repo = SQLiteWaypointRepository(sqlite_db)
-progression_event_repo = InMemoryProgression_eventRepository()
-progression_event_repo = SQLiteProgression_eventRepository(sqlite_db)
-newspaper_repo = InMemoryNewspaperRepository()
-newspaper_repo = SQLiteNewspaperRepository(sqlite_db)
-ward_repo = InMemoryWardRepository()
-ward_repo = SQLiteWardRepository(sqlite_db)
-memory_repo = InMemoryMemoryRepository()
-memory_repo = SQLiteMemoryRepository(sqlite_db)
-pull_repo = InMemoryPullRepository()
-pull_repo = SQLitePullRepository(sqlite_db)
-handout_repo = InMemoryHandoutRepository()
-handout_repo = SQLiteHandoutRepository(sqlite_db)
-branch_point_repo = InMemoryBranch_pointRepository()
-branch_point_repo = SQLiteBranch_pointRepository(sqlite_db)
-world_event_repo = InMemoryWorld_eventRepository()
-world_event_repo = SQLiteWorld_eventRepository(sqlite_db)
-sect_repo = InMemorySectRepository()
-sect_repo = SQLiteSectRepository(sqlite_db)
-empire_repo = InMemoryEmpireRepository()
-empire_repo = SQLiteEmpireRepository(sqlite_db)
-quest_chain_repo = InMemoryQuest_chainRepository()
-quest_chain_repo = SQLiteQuest_chainRepository(sqlite_db)
-choice_repo = InMemoryChoiceRepository()
-choice_repo = SQLiteChoiceRepository(sqlite_db)
-rune_repo = InMemoryRuneRepository()
-rune_repo = SQLiteRuneRepository(sqlite_db)
-holiday_repo = InMemoryHolidayRepository()
-holiday_repo = SQLiteHolidayRepository(sqlite_db)
-shader_repo = InMemoryShaderRepository()
-shader_repo = SQLiteShaderRepository(sqlite_db)
-title_repo = InMemoryTitleRepository()
-title_repo = SQLiteTitleRepository(sqlite_db)
-player_metric_repo = InMemoryPlayer_metricRepository()
-player_metric_repo = SQLitePlayer_metricRepository(sqlite_db)
-epilogue_repo = InMemoryEpilogueRepository()
-epilogue_repo = SQLiteEpilogueRepository(sqlite_db)
-mystery_repo = InMemoryMysteryRepository()
-mystery_repo = SQLiteMysteryRepository(sqlite_db)
-weather_pattern_repo = InMemoryWeather_patternRepository()
-weather_pattern_repo = SQLiteWeather_patternRepository(sqlite_db)
-act_repo = InMemoryActRepository()
-act_repo = SQLiteActRepository(sqlite_db)
-episode_repo = InMemoryEpisodeRepository()
-episode_repo = SQLiteEpisodeRepository(sqlite_db)
-television_repo = InMemoryTelevisionRepository()
-television_repo = SQLiteTelevisionRepository(sqlite_db)
-siege_engine_repo = InMemorySiege_engineRepository()
-siege_engine_repo = SQLiteSiege_engineRepository(sqlite_db)
-custom_map_repo = InMemoryCustom_mapRepository()
-custom_map_repo = SQLiteCustom_mapRepository(sqlite_db)
-theme_repo = InMemoryThemeRepository()
-theme_repo = SQLiteThemeRepository(sqlite_db)
-crafting_recipe_repo = InMemoryCrafting_recipeRepository()
-crafting_recipe_repo = SQLiteCrafting_recipeRepository(sqlite_db)
-social_class_repo = InMemorySocial_classRepository()
-social_class_repo = SQLiteSocial_classRepository(sqlite_db)
-faction_leader_repo = InMemoryFaction_leaderRepository()
-faction_leader_repo = SQLiteFaction_leaderRepository(sqlite_db)
-riddle_repo = InMemoryRiddleRepository()
-riddle_repo = SQLiteRiddleRepository(sqlite_db)
-fast_travel_point_repo = InMemoryFast_travel_pointRepository()
-fast_travel_point_repo = SQLiteFast_travel_pointRepository(sqlite_db)
-museum_repo = InMemoryMuseumRepository()
-museum_repo = SQLiteMuseumRepository(sqlite_db)
-trait_repo = InMemoryTraitRepository()
-trait_repo = SQLiteTraitRepository(sqlite_db)
-familiar_repo = InMemoryFamiliarRepository()
-familiar_repo = SQLiteFamiliarRepository(sqlite_db)
-era_transition_repo = InMemoryEra_transitionRepository()
-era_transition_repo = SQLiteEra_transitionRepository(sqlite_db)
-tariff_repo = InMemoryTariffRepository()
-tariff_repo = SQLiteTariffRepository(sqlite_db)
-quest_node_repo = InMemoryQuest_nodeRepository()
-quest_node_repo = SQLiteQuest_nodeRepository(sqlite_db)
-dream_repo = InMemoryDreamRepository()
-dream_repo = SQLiteDreamRepository(sqlite_db)
-holy_site_repo = InMemoryHoly_siteRepository()
-holy_site_repo = SQLiteHoly_siteRepository(sqlite_db)
-inventory_repo = InMemoryInventoryRepository()
-inventory_repo = SQLiteInventoryRepository(sqlite_db)
-affinity_repo = InMemoryAffinityRepository()
-affinity_repo = SQLiteAffinityRepository(sqlite_db)
-alternate_reality_repo = InMemoryAlternate_realityRepository()
-alternate_reality_repo = SQLiteAlternate_realityRepository(sqlite_db)
-mount_equipment_repo = InMemoryMount_equipmentRepository()
-mount_equipment_repo = SQLiteMount_equipmentRepository(sqlite_db)
-sound_effect_repo = InMemorySound_effectRepository()
-sound_effect_repo = SQLiteSound_effectRepository(sqlite_db)
-internet_repo = InMemoryInternetRepository()
-internet_repo = SQLiteInternetRepository(sqlite_db)
-time_period_repo = InMemoryTime_periodRepository()
-time_period_repo = SQLiteTime_periodRepository(sqlite_db)
-session_repo = InMemorySessionRepository()
-session_repo = SQLiteSessionRepository(sqlite_db)
-experience_repo = InMemoryExperienceRepository()
-experience_repo = SQLiteExperienceRepository(sqlite_db)
-puzzle_repo = InMemoryPuzzleRepository()
-puzzle_repo = SQLitePuzzleRepository(sqlite_db)
-motion_capture_repo = InMemoryMotion_captureRepository()
-motion_capture_repo = SQLiteMotion_captureRepository(sqlite_db)
-fortification_repo = InMemoryFortificationRepository()
-fortification_repo = SQLiteFortificationRepository(sqlite_db)
-voice_actor_repo = InMemoryVoice_actorRepository()
-voice_actor_repo = SQLiteVoice_actorRepository(sqlite_db)
-dimension_repo = InMemoryDimensionRepository()
-dimension_repo = SQLiteDimensionRepository(sqlite_db)
-music_control_repo = InMemoryMusic_controlRepository()
-music_control_repo = SQLiteMusic_controlRepository(sqlite_db)
-dubbing_repo = InMemoryDubbingRepository()
-dubbing_repo = SQLiteDubbingRepository(sqlite_db)
-hidden_path_repo = InMemoryHidden_pathRepository()
-hidden_path_repo = SQLiteHidden_pathRepository(sqlite_db)
-fleet_repo = InMemoryFleetRepository()
-fleet_repo = SQLiteFleetRepository(sqlite_db)
-social_media_repo = InMemorySocial_mediaRepository()
-social_media_repo = SQLiteSocial_mediaRepository(sqlite_db)
-barter_repo = InMemoryBarterRepository()
-barter_repo = SQLiteBarterRepository(sqlite_db)
-calendar_repo = InMemoryCalendarRepository()
-calendar_repo = SQLiteCalendarRepository(sqlite_db)
-solstice_repo = InMemorySolsticeRepository()
-solstice_repo = SQLiteSolsticeRepository(sqlite_db)
-school_repo = InMemorySchoolRepository()
-school_repo = SQLiteSchoolRepository(sqlite_db)
-slums_repo = InMemorySlumsRepository()
-slums_repo = SQLiteSlumsRepository(sqlite_db)
-disaster_repo = InMemoryDisasterRepository()
-disaster_repo = SQLiteDisasterRepository(sqlite_db)
-mastery_repo = InMemoryMasteryRepository()
-mastery_repo = SQLiteMasteryRepository(sqlite_db)
-page_repo = InMemoryPageRepository()
-page_repo = SQLitePageRepository(sqlite_db)
-motif_repo = InMemoryMotifRepository()
-motif_repo = SQLiteMotifRepository(sqlite_db)
-spawn_point_repo = InMemorySpawn_pointRepository()
-spawn_point_repo = SQLiteSpawn_pointRepository(sqlite_db)
-workshop_entry_repo = InMemoryWorkshop_entryRepository()
-workshop_entry_repo = SQLiteWorkshop_entryRepository(sqlite_db)
-environment_repo = InMemoryEnvironmentRepository()
-environment_repo = SQLiteEnvironmentRepository(sqlite_db)
-texture_repo = InMemoryTextureRepository()
-texture_repo = SQLiteTextureRepository(sqlite_db)
-moral_choice_repo = InMemoryMoral_choiceRepository()
-moral_choice_repo = SQLiteMoral_choiceRepository(sqlite_db)
-voice_line_repo = InMemoryVoice_lineRepository()
-voice_line_repo = SQLiteVoice_lineRepository(sqlite_db)
-famine_repo = InMemoryFamineRepository()
-famine_repo = SQLiteFamineRepository(sqlite_db)
-session_data_repo = InMemorySession_dataRepository()
-session_data_repo = SQLiteSession_dataRepository(sqlite_db)
-patent_repo = InMemoryPatentRepository()
-patent_repo = SQLitePatentRepository(sqlite_db)
-archive_repo = InMemoryArchiveRepository()
-archive_repo = SQLiteArchiveRepository(sqlite_db)
-conversion_rate_repo = InMemoryConversion_rateRepository()
-conversion_rate_repo = SQLiteConversion_rateRepository(sqlite_db)
-scripture_repo = InMemoryScriptureRepository()
-scripture_repo = SQLiteScriptureRepository(sqlite_db)
-spaceship_repo = InMemorySpaceshipRepository()
-spaceship_repo = SQLiteSpaceshipRepository(sqlite_db)
-battalion_repo = InMemoryBattalionRepository()
-battalion_repo = SQLiteBattalionRepository(sqlite_db)
-phenomenon_repo = InMemoryPhenomenonRepository()
-phenomenon_repo = SQLitePhenomenonRepository(sqlite_db)
-competition_repo = InMemoryCompetitionRepository()
-competition_repo = SQLiteCompetitionRepository(sqlite_db)
-plague_repo = InMemoryPlagueRepository()
-plague_repo = SQLitePlagueRepository(sqlite_db)
-black_hole_repo = InMemoryBlack_holeRepository()
-black_hole_repo = SQLiteBlack_holeRepository(sqlite_db)
-witness_repo = InMemoryWitnessRepository()
-witness_repo = SQLiteWitnessRepository(sqlite_db)
-cursed_item_repo = InMemoryCursed_itemRepository()
-cursed_item_repo = SQLiteCursed_itemRepository(sqlite_db)
-timeline_repo = InMemoryTimelineRepository()
-timeline_repo = SQLiteTimelineRepository(sqlite_db)
-component_repo = InMemoryComponentRepository()
-component_repo = SQLiteComponentRepository(sqlite_db)
-cutscene_repo = InMemoryCutsceneRepository()
-cutscene_repo = SQLiteCutsceneRepository(sqlite_db)
-faction_hierarchy_repo = InMemoryFaction_hierarchyRepository()
-faction_hierarchy_repo = SQLiteFaction_hierarchyRepository(sqlite_db)
-music_track_repo = InMemoryMusic_trackRepository()
-music_track_repo = SQLiteMusic_trackRepository(sqlite_db)
-trap_repo = InMemoryTrapRepository()
-trap_repo = SQLiteTrapRepository(sqlite_db)
-crime_repo = InMemoryCrimeRepository()
-crime_repo = SQLiteCrimeRepository(sqlite_db)
-food_chain_repo = InMemoryFood_chainRepository()
-food_chain_repo = SQLiteFood_chainRepository(sqlite_db)
-reproduction_repo = InMemoryReproductionRepository()
-reproduction_repo = SQLiteReproductionRepository(sqlite_db)
-raid_repo = InMemoryRaidRepository()
-raid_repo = SQLiteRaidRepository(sqlite_db)
-flowchart_repo = InMemoryFlowchartRepository()
-flowchart_repo = SQLiteFlowchartRepository(sqlite_db)
-score_repo = InMemoryScoreRepository()
-score_repo = SQLiteScoreRepository(sqlite_db)
-honor_repo = InMemoryHonorRepository()
-honor_repo = SQLiteHonorRepository(sqlite_db)
-storyline_repo = InMemoryStorylineRepository()
-storyline_repo = SQLiteStorylineRepository(sqlite_db)
-level_up_repo = InMemoryLevel_upRepository()
-level_up_repo = SQLiteLevel_upRepository(sqlite_db)
-nebula_repo = InMemoryNebulaRepository()
-nebula_repo = SQLiteNebulaRepository(sqlite_db)
-codex_entry_repo = InMemoryCodex_entryRepository()
-codex_entry_repo = SQLiteCodex_entryRepository(sqlite_db)
-subtitle_repo = InMemorySubtitleRepository()
-subtitle_repo = SQLiteSubtitleRepository(sqlite_db)
-district_repo = InMemoryDistrictRepository()
-district_repo = SQLiteDistrictRepository(sqlite_db)
-quest_prerequisite_repo = InMemoryQuest_prerequisiteRepository()
-quest_prerequisite_repo = SQLiteQuest_prerequisiteRepository(sqlite_db)
-mythical_armor_repo = InMemoryMythical_armorRepository()
-mythical_armor_repo = SQLiteMythical_armorRepository(sqlite_db)
-ritual_repo = InMemoryRitualRepository()
-ritual_repo = SQLiteRitualRepository(sqlite_db)
-red_herring_repo = InMemoryRed_herringRepository()
-red_herring_repo = SQLiteRed_herringRepository(sqlite_db)
-pet_repo = InMemoryPetRepository()
-pet_repo = SQLitePetRepository(sqlite_db)
-atmosphere_repo = InMemoryAtmosphereRepository()
-atmosphere_repo = SQLiteAtmosphereRepository(sqlite_db)
-socket_repo = InMemorySocketRepository()
-socket_repo = SQLiteSocketRepository(sqlite_db)
-flashback_repo = InMemoryFlashbackRepository()
-flashback_repo = SQLiteFlashbackRepository(sqlite_db)
-badge_repo = InMemoryBadgeRepository()
-badge_repo = SQLiteBadgeRepository(sqlite_db)
-plaza_repo = InMemoryPlazaRepository()
-plaza_repo = SQLitePlazaRepository(sqlite_db)
-map_repo = InMemoryMapRepository()
-map_repo = SQLiteMapRepository(sqlite_db)
-era_repo = InMemoryEraRepository()
-era_repo = SQLiteEraRepository(sqlite_db)
-tournament_repo = InMemoryTournamentRepository()
-tournament_repo = SQLiteTournamentRepository(sqlite_db)
-share_code_repo = InMemoryShare_codeRepository()
-share_code_repo = SQLiteShare_codeRepository(sqlite_db)
-localization_repo = InMemoryLocalizationRepository()
-localization_repo = SQLiteLocalizationRepository(sqlite_db)
-market_square_repo = InMemoryMarket_squareRepository()
-market_square_repo = SQLiteMarket_squareRepository(sqlite_db)
-research_center_repo = InMemoryResearch_centerRepository()
-research_center_repo = SQLiteResearch_centerRepository(sqlite_db)
-heatmap_repo = InMemoryHeatmapRepository()
-heatmap_repo = SQLiteHeatmapRepository(sqlite_db)
-research_repo = InMemoryResearchRepository()
-research_repo = SQLiteResearchRepository(sqlite_db)
-rumor_repo = InMemoryRumorRepository()
-rumor_repo = SQLiteRumorRepository(sqlite_db)
-invention_repo = InMemoryInventionRepository()
-invention_repo = SQLiteInventionRepository(sqlite_db)
-camera_path_repo = InMemoryCamera_pathRepository()
-camera_path_repo = SQLiteCamera_pathRepository(sqlite_db)
-enigma_repo = InMemoryEnigmaRepository()
-enigma_repo = SQLiteEnigmaRepository(sqlite_db)
-chekhovs_gun_repo = InMemoryChekhovs_gunRepository()
-chekhovs_gun_repo = SQLiteChekhovs_gunRepository(sqlite_db)
-reputation_repo = InMemoryReputationRepository()
-reputation_repo = SQLiteReputationRepository(sqlite_db)
-particle_repo = InMemoryParticleRepository()
-particle_repo = SQLiteParticleRepository(sqlite_db)
-faction_territory_repo = InMemoryFaction_territoryRepository()
-faction_territory_repo = SQLiteFaction_territoryRepository(sqlite_db)
-character_evolution_repo = InMemoryCharacter_evolutionRepository()
-character_evolution_repo = SQLiteCharacter_evolutionRepository(sqlite_db)
-teleporter_repo = InMemoryTeleporterRepository()
-teleporter_repo = SQLiteTeleporterRepository(sqlite_db)
-shop_repo = InMemoryShopRepository()
-shop_repo = SQLiteShopRepository(sqlite_db)
-arena_repo = InMemoryArenaRepository()
-arena_repo = SQLiteArenaRepository(sqlite_db)
-currency_repo = InMemoryCurrencyRepository()
-currency_repo = SQLiteCurrencyRepository(sqlite_db)
-exhibition_repo = InMemoryExhibitionRepository()
-exhibition_repo = SQLiteExhibitionRepository(sqlite_db)
-migration_repo = InMemoryMigrationRepository()
-migration_repo = SQLiteMigrationRepository(sqlite_db)
-foreshadowing_repo = InMemoryForeshadowingRepository()
-foreshadowing_repo = SQLiteForeshadowingRepository(sqlite_db)
-skybox_repo = InMemorySkyboxRepository()
-skybox_repo = SQLiteSkyboxRepository(sqlite_db)
-quest_reward_tier_repo = InMemoryQuest_reward_tierRepository()
-quest_reward_tier_repo = SQLiteQuest_reward_tierRepository(sqlite_db)
-character_repo = InMemoryCharacterRepository()
-character_repo = SQLiteCharacterRepository(sqlite_db)
-evolution_repo = InMemoryEvolutionRepository()
-evolution_repo = SQLiteEvolutionRepository(sqlite_db)
-hibernation_repo = InMemoryHibernationRepository()
-hibernation_repo = SQLiteHibernationRepository(sqlite_db)
-consequence_repo = InMemoryConsequenceRepository()
-consequence_repo = SQLiteConsequenceRepository(sqlite_db)
-divine_item_repo = InMemoryDivine_itemRepository()
-divine_item_repo = SQLiteDivine_itemRepository(sqlite_db)
-easter_egg_repo = InMemoryEaster_eggRepository()
-easter_egg_repo = SQLiteEaster_eggRepository(sqlite_db)
-vehicle_repo = InMemoryVehicleRepository()
-vehicle_repo = SQLiteVehicleRepository(sqlite_db)
-weapon_system_repo = InMemoryWeapon_systemRepository()
-weapon_system_repo = SQLiteWeapon_systemRepository(sqlite_db)
-port_district_repo = InMemoryPort_districtRepository()
-port_district_repo = SQLitePort_districtRepository(sqlite_db)
-library_repo = InMemoryLibraryRepository()
-library_repo = SQLiteLibraryRepository(sqlite_db)
-tokenboard_repo = InMemoryTokenboardRepository()
-tokenboard_repo = SQLiteTokenboardRepository(sqlite_db)
-lighting_repo = InMemoryLightingRepository()
-lighting_repo = SQLiteLightingRepository(sqlite_db)
-checkpoint_repo = InMemoryCheckpointRepository()
-checkpoint_repo = SQLiteCheckpointRepository(sqlite_db)
-university_repo = InMemoryUniversityRepository()
-university_repo = SQLiteUniversityRepository(sqlite_db)
-trophy_repo = InMemoryTrophyRepository()
-trophy_repo = SQLiteTrophyRepository(sqlite_db)
-summon_repo = InMemorySummonRepository()
-summon_repo = SQLiteSummonRepository(sqlite_db)
-kingdom_repo = InMemoryKingdomRepository()
-kingdom_repo = SQLiteKingdomRepository(sqlite_db)
-law_repo = InMemoryLawRepository()
-law_repo = SQLiteLawRepository(sqlite_db)
-template_repo = InMemoryTemplateRepository()
-template_repo = SQLiteTemplateRepository(sqlite_db)
-achievement_repo = InMemoryAchievementRepository()
-achievement_repo = SQLiteAchievementRepository(sqlite_db)
-transition_repo = InMemoryTransitionRepository()
-transition_repo = SQLiteTransitionRepository(sqlite_db)
-tax_repo = InMemoryTaxRepository()
-tax_repo = SQLiteTaxRepository(sqlite_db)
-lawyer_repo = InMemoryLawyerRepository()
-lawyer_repo = SQLiteLawyerRepository(sqlite_db)
-quest_giver_repo = InMemoryQuest_giverRepository()
-quest_giver_repo = SQLiteQuest_giverRepository(sqlite_db)
-price_repo = InMemoryPriceRepository()
-price_repo = SQLitePriceRepository(sqlite_db)
-ending_repo = InMemoryEndingRepository()
-ending_repo = SQLiteEndingRepository(sqlite_db)
-portal_repo = InMemoryPortalRepository()
-portal_repo = SQLitePortalRepository(sqlite_db)
-trade_repo = InMemoryTradeRepository()
-trade_repo = SQLiteTradeRepository(sqlite_db)
-oath_repo = InMemoryOathRepository()
-oath_repo = SQLiteOathRepository(sqlite_db)
-ambient_repo = InMemoryAmbientRepository()
-ambient_repo = SQLiteAmbientRepository(sqlite_db)
-moon_repo = InMemoryMoonRepository()
-moon_repo = SQLiteMoonRepository(sqlite_db)
-extinction_repo = InMemoryExtinctionRepository()
-extinction_repo = SQLiteExtinctionRepository(sqlite_db)
-dungeon_repo = InMemoryDungeonRepository()
-dungeon_repo = SQLiteDungeonRepository(sqlite_db)
-journal_page_repo = InMemoryJournal_pageRepository()
-journal_page_repo = SQLiteJournal_pageRepository(sqlite_db)
-galaxy_repo = InMemoryGalaxyRepository()
-galaxy_repo = SQLiteGalaxyRepository(sqlite_db)
-player_profile_repo = InMemoryPlayer_profileRepository()
-player_profile_repo = SQLitePlayer_profileRepository(sqlite_db)
-noble_district_repo = InMemoryNoble_districtRepository()
-noble_district_repo = SQLiteNoble_districtRepository(sqlite_db)
-disposition_repo = InMemoryDispositionRepository()
-disposition_repo = SQLiteDispositionRepository(sqlite_db)
-jury_repo = InMemoryJuryRepository()
-jury_repo = SQLiteJuryRepository(sqlite_db)
-ceremony_repo = InMemoryCeremonyRepository()
-ceremony_repo = SQLiteCeremonyRepository(sqlite_db)
+    for repo_name, stem in TOOL_REPOSITORIES:
+        repositories.register_class(
+            repo_name, f"src.infrastructure.in_memory_repositories:InMemory{stem}Repository"
+        )
 
+# Initialize JSON persistence
+persistence_config = config.get("persistence", {})
+persistence_dir = str(Path(__file__).parent / persistence_config.get("data_dir", "lore_data"))
+if persistence_config.get("format", "files") == "segments":
+    # Appends are cheap, so the segment store is written synchronously
+    persistence = SegmentPersistence(
+        data_dir=persistence_dir,
+        durability=persistence_config.get("durability", "none"),
+        max_segment_bytes=int(persistence_config.get("segment_max_mb", 64) * 1024 * 1024),
+    )
+elif persistence_config.get("write_behind", True):
+    persistence = WriteBehindPersistence(
+        data_dir=persistence_dir,
+        durability=persistence_config.get("durability", "none"),
+        flush_interval=persistence_config.get("flush_interval_seconds", 1.0),
+        max_pending=persistence_config.get("max_pending_writes", 500),
+    )
+else:
+    persistence = JSONPersistence(data_dir=persistence_dir, durability=persistence_config.get("durability", "none"))
 
+# Run blocking tool handlers off the event loop
+tool_executor = ToolExecutor.from_config(config.get("execution", {}))
 
+# Tool name -> handler; arguments are validated against the listed schemas
+tool_registry = ToolRegistry()
 
+# Responses are compact JSON unless config.json asks for indented output
+PRETTY_RESPONSES = config.get("execution", {}).get("pretty_json", False)
 
-
-# Initialize JSON persistence
-persistence = JSONPersistence(data_dir=str(Path(__file__).parent / "lore_data"))
+# Per-entity-class encoders for tool responses, compiled on first use
+ENTITY_CODEC = EntityCodec()
 
 # Create MCP server
 app = Server("lore-system-server")
@@ -1480,38 +197,31 @@ app = Server("lore-system-server")
 # HELPER FUNCTIONS
 # ============================================================================
 
+def tool_response(payload: Any) -> list[TextContent]:
+    """Wrap a JSON payload as a tool result."""
+    return [TextContent(type="text", text=dumps(payload, indent=PRETTY_RESPONSES))]
+
+
+def error_response(error: Exception) -> list[TextContent]:
+    """Tool result reporting a failed call."""
+    return tool_response({
+        "success": False,
+        "error": str(error),
+        "type": type(error).__name__
+    })
+
+
 def serialize_entity(entity: Any) -> dict:
     """Serialize domain entity to JSON-compatible dict."""
-    if entity is None:
-        return None
-
-    result = {}
-    for field_name, field_value in entity.__dict__.items():
-        if field_value is None:
-            result[field_name] = None
-        elif hasattr(field_value, 'value'):
-            # Value object
-            val = field_value.value
-            if isinstance(val, datetime):
-                result[field_name] = val.isoformat()
-            else:
-                result[field_name] = val
-        elif isinstance(field_value, (str, int, float, bool)):
-            result[field_name] = field_value
-        elif isinstance(field_value, datetime):
-            result[field_name] = field_value.isoformat()
-        elif isinstance(field_value, list):
-            result[field_name] = [
-                serialize_entity(item) if hasattr(item, '__dict__')
-                else item.value.isoformat() if hasattr(item, 'value') and isinstance(item.value, datetime)
-                else item.value if hasattr(item, 'value')
-                else str(item)
-                for item in field_value
-            ]
-        else:
-            result[field_name] = str(field_value)
+    return ENTITY_CODEC.encode(entity)
 
-    return result
+
+def serialize_search_hits(hits: List[SearchHit]) -> List[dict]:
+    """Serialize ranked search hits: the entity plus its score and snippet."""
+    return [
+        {**serialize_entity(hit.entity), "score": hit.score, "snippet": hit.snippet}
+        for hit in hits
+    ]
 
 
 def parse_tenant_id(tenant_id_str: str) -> TenantId:
@@ -1534,1900 +244,2240 @@ def parse_entity_id(entity_id_str: str) -> EntityId:
 
 
 # ============================================================================
-# WORLD CRUD OPERATIONS
+# TOOL DEFINITIONS
 # ============================================================================
 
-@app.list_tools()
-async def list_tools() -> list[Tool]:
-    """List available MCP tools."""
-    return [
-        # World operations
-        Tool(
-            name="create_world",
-            description="Create a new world in the lore system",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tenant_id": {"type": "string", "description": "Tenant identifier"},
-                    "name": {"type": "string", "description": "World name (max 100 chars)"},
-                    "description": {"type": "string", "description": "World description (max 1000 chars)"},
-                    "parent_id": {"type": "string", "description": "Optional parent world ID for hierarchies"},
+# Entity types accepted by batch_create / batch_update / batch_get; each item
+# runs the matching create_<type> / update_<type> / get_<type> tool
+BATCH_ENTITY_TYPES = {
+    "create": ["world", "character", "story", "event", "page", "item", "texture", "3d_model", "location", "environment"],
+    "update": ["world", "character", "item", "location", "environment"],
+    "get": ["world", "character", "story", "item", "texture", "3d_model", "location", "environment"],
+}
+MAX_BATCH_ITEMS = config.get("limits", {}).get("max_batch_items", 1000)
+
+
+def batch_tool_schema(operation: str) -> dict:
+    """Input schema of the batch tool for ``operation``."""
+    return {
+        "type": "object",
+        "properties": {
+            "tenant_id": {"type": "string", "description": "Tenant ID for items whose arguments do not set one"},
+            "items": {
+                "type": "array",
+                "description": f"Up to {MAX_BATCH_ITEMS} items, each with the arguments of the matching {operation}_<entity_type> tool",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "entity_type": {"type": "string", "enum": BATCH_ENTITY_TYPES[operation]},
+                        "arguments": {"type": "object"},
+                    },
+                    "required": ["entity_type", "arguments"],
                 },
-                "required": ["tenant_id", "name", "description"],
             },
-        ),
-        Tool(
-            name="get_world",
-            description="Get a world by ID",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tenant_id": {"type": "string"},
-                    "world_id": {"type": "string"},
-                },
-                "required": ["tenant_id", "world_id"],
+        },
+        "required": ["items"],
+    }
+
+
+TOOLS = [
+    # World operations
+    Tool(
+        name="create_world",
+        description="Create a new world in the lore system",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tenant_id": {"type": "string", "description": "Tenant identifier"},
+                "name": {"type": "string", "description": "World name (max 100 chars)"},
+                "description": {"type": "string", "description": "World description (max 1000 chars)"},
+                "parent_id": {"type": "string", "description": "Optional parent world ID for hierarchies"},
             },
-        ),
-        Tool(
-            name="list_worlds",
-            description="List all worlds for a tenant",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tenant_id": {"type": "string"},
-                    "limit": {"type": "integer", "default": 100},
-                    "offset": {"type": "integer", "default": 0},
-                },
-                "required": ["tenant_id"],
+            "required": ["tenant_id", "name", "description"],
+        },
+    ),
+    Tool(
+        name="get_world",
+        description="Get a world by ID",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tenant_id": {"type": "string"},
+                "world_id": {"type": "string"},
             },
-        ),
-        Tool(
-            name="update_world",
-            description="Update world description or name",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tenant_id": {"type": "string"},
-                    "world_id": {"type": "string"},
-                    "name": {"type": "string", "description": "New name (optional)"},
-                    "description": {"type": "string", "description": "New description (optional)"},
-                },
-                "required": ["tenant_id", "world_id"],
+            "required": ["tenant_id", "world_id"],
+        },
+    ),
+    Tool(
+        name="list_worlds",
+        description="List all worlds for a tenant",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tenant_id": {"type": "string"},
+                "limit": {"type": "integer", "default": 100, "minimum": 1},
+                "offset": {"type": "integer", "description": "Skip this many results (prefer cursor for deep pages)"},
+                "cursor": {"type": "string", "description": "next_cursor from the previous page"},
             },
-        ),
-        Tool(
-            name="delete_world",
-            description="Delete a world",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tenant_id": {"type": "string"},
-                    "world_id": {"type": "string"},
-                },
-                "required": ["tenant_id", "world_id"],
+            "required": ["tenant_id"],
+        },
+    ),
+    Tool(
+        name="update_world",
+        description="Update world description or name",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tenant_id": {"type": "string"},
+                "world_id": {"type": "string"},
+                "name": {"type": "string", "description": "New name (optional)"},
+                "description": {"type": "string", "description": "New description (optional)"},
             },
-        ),
-
-        # Character operations
-        Tool(
-            name="create_character",
-            description="Create a new character in a world",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tenant_id": {"type": "string"},
-                    "world_id": {"type": "string"},
-                    "name": {"type": "string", "description": "Character name (max 100 chars)"},
-                    "backstory": {"type": "string", "description": "Character backstory (min 100 chars)"},
-                    "rarity": {"type": "string", "enum": ["COMMON", "UNCOMMON", "RARE", "EPIC", "LEGENDARY"]},
-                    "element": {"type": "string", "enum": ["physical", "fire", "water", "earth", "wind", "light", "dark"]},
-                    "role": {"type": "string", "enum": ["dps", "tank", "support", "specialist"]},
-                    "base_hp": {"type": "integer", "description": "Base health points"},
-                    "base_atk": {"type": "integer", "description": "Base attack"},
-                    "base_def": {"type": "integer", "description": "Base defense"},
-                    "base_speed": {"type": "integer", "description": "Base speed"},
-                    "energy_cost": {"type": "integer", "description": "Ultimate energy cost"},
-                },
-                "required": ["tenant_id", "world_id", "name", "backstory"],
+            "required": ["tenant_id", "world_id"],
+        },
+    ),
+    Tool(
+        name="delete_world",
+        description="Delete a world",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tenant_id": {"type": "string"},
+                "world_id": {"type": "string"},
             },
-        ),
-        Tool(
-            name="get_character",
-            description="Get a character by ID",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tenant_id": {"type": "string"},
-                    "character_id": {"type": "string"},
-                },
-                "required": ["tenant_id", "character_id"],
+            "required": ["tenant_id", "world_id"],
+        },
+    ),
+
+    # Character operations
+    Tool(
+        name="create_character",
+        description="Create a new character in a world",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tenant_id": {"type": "string"},
+                "world_id": {"type": "string"},
+                "name": {"type": "string", "description": "Character name (max 100 chars)"},
+                "backstory": {"type": "string", "description": "Character backstory (min 100 chars)"},
+                "rarity": {"type": "string", "enum": ["COMMON", "UNCOMMON", "RARE", "EPIC", "LEGENDARY"]},
+                "element": {"type": "string", "enum": ["physical", "fire", "water", "earth", "wind", "light", "dark"]},
+                "role": {"type": "string", "enum": ["dps", "tank", "support", "specialist"]},
+                "base_hp": {"type": "integer", "description": "Base health points"},
+                "base_atk": {"type": "integer", "description": "Base attack"},
+                "base_def": {"type": "integer", "description": "Base defense"},
+                "base_speed": {"type": "integer", "description": "Base speed"},
+                "energy_cost": {"type": "integer", "description": "Ultimate energy cost"},
             },
-        ),
-        Tool(
-            name="list_characters",
-            description="List characters in a world",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tenant_id": {"type": "string"},
-                    "world_id": {"type": "string"},
-                    "limit": {"type": "integer", "default": 100},
-                    "offset": {"type": "integer", "default": 0},
-                },
-                "required": ["tenant_id", "world_id"],
+            "required": ["tenant_id", "world_id", "name", "backstory"],
+        },
+    ),
+    Tool(
+        name="get_character",
+        description="Get a character by ID",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tenant_id": {"type": "string"},
+                "character_id": {"type": "string"},
             },
-        ),
-        Tool(
-            name="update_character",
-            description="Update character details",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tenant_id": {"type": "string"},
-                    "character_id": {"type": "string"},
-                    "backstory": {"type": "string", "description": "New backstory (min 100 chars)"},
-                    "status": {"type": "string", "enum": ["active", "inactive"]},
-                },
-                "required": ["tenant_id", "character_id"],
+            "required": ["tenant_id", "character_id"],
+        },
+    ),
+    Tool(
+        name="list_characters",
+        description="List characters in a world",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tenant_id": {"type": "string"},
+                "world_id": {"type": "string"},
+                "limit": {"type": "integer", "default": 100, "minimum": 1},
+                "offset": {"type": "integer", "description": "Skip this many results (prefer cursor for deep pages)"},
+                "cursor": {"type": "string", "description": "next_cursor from the previous page"},
             },
-        ),
-        Tool(
-            name="delete_character",
-            description="Delete a character",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tenant_id": {"type": "string"},
-                    "character_id": {"type": "string"},
-                },
-                "required": ["tenant_id", "character_id"],
+            "required": ["tenant_id", "world_id"],
+        },
+    ),
+    Tool(
+        name="update_character",
+        description="Update character details",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tenant_id": {"type": "string"},
+                "character_id": {"type": "string"},
+                "backstory": {"type": "string", "description": "New backstory (min 100 chars)"},
+                "status": {"type": "string", "enum": ["active", "inactive"]},
             },
-        ),
-        Tool(
-            name="add_ability",
-            description="Add an ability to a character",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tenant_id": {"type": "string"},
-                    "character_id": {"type": "string"},
-                    "ability_name": {"type": "string"},
-                    "description": {"type": "string"},
-                    "power_level": {"type": "integer", "minimum": 1, "maximum": 10, "description": "Power level 1-10 (1=weak, 10=strongest)"},
-                },
-                "required": ["tenant_id", "character_id", "ability_name", "description", "power_level"],
+            "required": ["tenant_id", "character_id"],
+        },
+    ),
+    Tool(
+        name="delete_character",
+        description="Delete a character",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tenant_id": {"type": "string"},
+                "character_id": {"type": "string"},
             },
-        ),
-
-        # Story operations
-        Tool(
-            name="create_story",
-            description="Create a new story in a world",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tenant_id": {"type": "string"},
-                    "world_id": {"type": "string"},
-                    "name": {"type": "string"},
-                    "description": {"type": "string"},
-                    "story_type": {"type": "string", "enum": ["LINEAR", "NON_LINEAR", "INTERACTIVE"], "default": "LINEAR"},
-                    "content": {"type": "string"},
-                },
-                "required": ["tenant_id", "world_id", "name", "description"],
+            "required": ["tenant_id", "character_id"],
+        },
+    ),
+    Tool(
+        name="add_ability",
+        description="Add an ability to a character",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tenant_id": {"type": "string"},
+                "character_id": {"type": "string"},
+                "ability_name": {"type": "string"},
+                "description": {"type": "string"},
+                "power_level": {"type": "integer", "minimum": 1, "maximum": 10, "description": "Power level 1-10 (1=weak, 10=strongest)"},
             },
-        ),
-        Tool(
-            name="get_story",
-            description="Get a story by ID",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tenant_id": {"type": "string"},
-                    "story_id": {"type": "string"},
-                },
-                "required": ["tenant_id", "story_id"],
+            "required": ["tenant_id", "character_id", "ability_name", "description", "power_level"],
+        },
+    ),
+
+    # Story operations
+    Tool(
+        name="create_story",
+        description="Create a new story in a world",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tenant_id": {"type": "string"},
+                "world_id": {"type": "string"},
+                "name": {"type": "string"},
+                "description": {"type": "string"},
+                "story_type": {"type": "string", "enum": ["LINEAR", "NON_LINEAR", "INTERACTIVE"], "default": "LINEAR"},
+                "content": {"type": "string"},
             },
-        ),
-        Tool(
-            name="list_stories",
-            description="List stories in a world",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tenant_id": {"type": "string"},
-                    "world_id": {"type": "string"},
-                    "limit": {"type": "integer", "default": 100},
-                    "offset": {"type": "integer", "default": 0},
-                },
-                "required": ["tenant_id", "world_id"],
+            "required": ["tenant_id", "world_id", "name", "description"],
+        },
+    ),
+    Tool(
+        name="get_story",
+        description="Get a story by ID",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tenant_id": {"type": "string"},
+                "story_id": {"type": "string"},
             },
-        ),
-
-        # Event operations
-        Tool(
-            name="create_event",
-            description="Create a new event in a world. Note: Events require at least one participant (character_id).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tenant_id": {"type": "string"},
-                    "world_id": {"type": "string"},
-                    "name": {"type": "string"},
-                    "description": {"type": "string"},
-                    "start_date": {"type": "string", "description": "ISO date string"},
-                    "end_date": {"type": "string", "description": "ISO date string (optional)"},
-                    "participant_ids": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Array of character IDs participating in the event (at least 1 required)"
-                    },
-                    "outcome": {"type": "string", "enum": ["success", "failure", "ongoing"], "default": "ongoing"},
-                },
-                "required": ["tenant_id", "world_id", "name", "description", "start_date", "participant_ids"],
+            "required": ["tenant_id", "story_id"],
+        },
+    ),
+    Tool(
+        name="list_stories",
+        description="List stories in a world",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tenant_id": {"type": "string"},
+                "world_id": {"type": "string"},
+                "limit": {"type": "integer", "default": 100, "minimum": 1},
+                "offset": {"type": "integer", "description": "Skip this many results (prefer cursor for deep pages)"},
+                "cursor": {"type": "string", "description": "next_cursor from the previous page"},
             },
-        ),
-        Tool(
-            name="list_events",
-            description="List events in a world",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tenant_id": {"type": "string"},
-                    "world_id": {"type": "string"},
-                    "limit": {"type": "integer", "default": 100},
-                    "offset": {"type": "integer", "default": 0},
+            "required": ["tenant_id", "world_id"],
+        },
+    ),
+
+    # Event operations
+    Tool(
+        name="create_event",
+        description="Create a new event in a world. Note: Events require at least one participant (character_id).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tenant_id": {"type": "string"},
+                "world_id": {"type": "string"},
+                "name": {"type": "string"},
+                "description": {"type": "string"},
+                "start_date": {"type": "string", "description": "ISO date string"},
+                "end_date": {"type": "string", "description": "ISO date string (optional)"},
+                "participant_ids": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Array of character IDs participating in the event (at least 1 required)"
                 },
-                "required": ["tenant_id", "world_id"],
+                "outcome": {"type": "string", "enum": ["success", "failure", "ongoing"], "default": "ongoing"},
             },
-        ),
-
-        # Page operations
-        Tool(
-            name="create_page",
-            description="Create a custom lore page",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tenant_id": {"type": "string"},
-                    "world_id": {"type": "string"},
-                    "name": {"type": "string"},
-                    "content": {"type": "string", "description": "Page content/body"},
-                },
-                "required": ["tenant_id", "world_id", "name", "content"],
+            "required": ["tenant_id", "world_id", "name", "description", "start_date", "participant_ids"],
+        },
+    ),
+    Tool(
+        name="list_events",
+        description="List events in a world",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tenant_id": {"type": "string"},
+                "world_id": {"type": "string"},
+                "limit": {"type": "integer", "default": 100, "minimum": 1},
+                "offset": {"type": "integer", "description": "Skip this many results (prefer cursor for deep pages)"},
+                "cursor": {"type": "string", "description": "next_cursor from the previous page"},
             },
-        ),
-        Tool(
-            name="list_pages",
-            description="List pages in a world",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tenant_id": {"type": "string"},
-                    "world_id": {"type": "string"},
-                    "limit": {"type": "integer", "default": 100},
-                    "offset": {"type": "integer", "default": 0},
-                },
-                "required": ["tenant_id", "world_id"],
+            "required": ["tenant_id", "world_id"],
+        },
+    ),
+
+    # Page operations
+    Tool(
+        name="create_page",
+        description="Create a custom lore page",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tenant_id": {"type": "string"},
+                "world_id": {"type": "string"},
+                "name": {"type": "string"},
+                "content": {"type": "string", "description": "Page content/body"},
             },
-        ),
-
-        # Item operations
-        Tool(
-            name="create_item",
-            description="Create a new item in a world",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tenant_id": {"type": "string"},
-                    "world_id": {"type": "string"},
-                    "name": {"type": "string", "description": "Item name"},
-                    "description": {"type": "string", "description": "Item description"},
-                    "item_type": {"type": "string", "enum": ["weapon", "armor", "artifact", "consumable", "tool", "other"]},
-                    "rarity": {"type": "string", "enum": ["common", "uncommon", "rare", "epic", "legendary", "mythic"]},
-                    "location_id": {"type": "string", "description": "Location ID where item is found (optional)"},
-                    "level": {"type": "integer", "description": "Item level (1-100)", "minimum": 1, "maximum": 100},
-                    "enhancement": {"type": "integer", "description": "Enhancement level (0+)", "minimum": 0},
-                    "max_enhancement": {"type": "integer", "description": "Maximum enhancement level", "minimum": 0},
-                    "base_atk": {"type": "integer", "description": "Base attack bonus", "minimum": 0},
-                    "base_hp": {"type": "integer", "description": "Base HP bonus", "minimum": 0},
-                    "base_def": {"type": "integer", "description": "Base defense bonus", "minimum": 0},
-                    "special_stat": {"type": "string", "description": "Special stat name (e.g., 'crit_rate')"},
-                    "special_stat_value": {"type": "number", "description": "Special stat value"},
-                },
-                "required": ["tenant_id", "world_id", "name", "description", "item_type"],
+            "required": ["tenant_id", "world_id", "name", "content"],
+        },
+    ),
+    Tool(
+        name="list_pages",
+        description="List pages in a world",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tenant_id": {"type": "string"},
+                "world_id": {"type": "string"},
+                "limit": {"type": "integer", "default": 100, "minimum": 1},
+                "offset": {"type": "integer", "description": "Skip this many results (prefer cursor for deep pages)"},
+                "cursor": {"type": "string", "description": "next_cursor from the previous page"},
             },
-        ),
-        Tool(
-            name="get_item",
-            description="Get an item by ID",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tenant_id": {"type": "string"},
-                    "item_id": {"type": "string"},
-                },
-                "required": ["tenant_id", "item_id"],
+            "required": ["tenant_id", "world_id"],
+        },
+    ),
+
+    # Item operations
+    Tool(
+        name="create_item",
+        description="Create a new item in a world",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tenant_id": {"type": "string"},
+                "world_id": {"type": "string"},
+                "name": {"type": "string", "description": "Item name"},
+                "description": {"type": "string", "description": "Item description"},
+                "item_type": {"type": "string", "enum": ["weapon", "armor", "artifact", "consumable", "tool", "other"]},
+                "rarity": {"type": "string", "enum": ["common", "uncommon", "rare", "epic", "legendary", "mythic"]},
+                "location_id": {"type": "string", "description": "Location ID where item is found (optional)"},
+                "level": {"type": "integer", "description": "Item level (1-100)", "minimum": 1, "maximum": 100},
+                "enhancement": {"type": "integer", "description": "Enhancement level (0+)", "minimum": 0},
+                "max_enhancement": {"type": "integer", "description": "Maximum enhancement level", "minimum": 0},
+                "base_atk": {"type": "integer", "description": "Base attack bonus", "minimum": 0},
+                "base_hp": {"type": "integer", "description": "Base HP bonus", "minimum": 0},
+                "base_def": {"type": "integer", "description": "Base defense bonus", "minimum": 0},
+                "special_stat": {"type": "string", "description": "Special stat name (e.g., 'crit_rate')"},
+                "special_stat_value": {"type": "number", "description": "Special stat value"},
             },
-        ),
-        Tool(
-            name="list_items",
-            description="List items in a world",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tenant_id": {"type": "string"},
-                    "world_id": {"type": "string"},
-                    "limit": {"type": "integer", "default": 50},
-                    "offset": {"type": "integer", "default": 0},
-                },
-                "required": ["tenant_id", "world_id"],
+            "required": ["tenant_id", "world_id", "name", "description", "item_type"],
+        },
+    ),
+    Tool(
+        name="get_item",
+        description="Get an item by ID",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tenant_id": {"type": "string"},
+                "item_id": {"type": "string"},
             },
-        ),
-
-        # Texture operations
-        Tool(
-            name="create_texture",
-            description="Create a new texture for 3D models",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tenant_id": {"type": "string"},
-                    "world_id": {"type": "string"},
-                    "name": {"type": "string", "description": "Texture name"},
-                    "path": {"type": "string", "description": "Path to texture file"},
-                    "texture_type": {"type": "string", "enum": ["diffuse", "normal", "specular", "emissive", "roughness", "metallic"]},
-                    "file_size": {"type": "integer", "description": "File size in bytes"},
-                    "dimensions": {"type": "string", "description": "Dimensions (e.g., '1024x1024')"},
-                    "color_space": {"type": "string", "description": "Color space (e.g., 'sRGB')"},
-                    "description": {"type": "string"},
-                },
-                "required": ["tenant_id", "world_id", "name", "path", "texture_type", "file_size"],
+            "required": ["tenant_id", "item_id"],
+        },
+    ),
+    Tool(
+        name="list_items",
+        description="List items in a world",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tenant_id": {"type": "string"},
+                "world_id": {"type": "string"},
+                "limit": {"type": "integer", "default": 50, "minimum": 1},
+                "offset": {"type": "integer", "description": "Skip this many results (prefer cursor for deep pages)"},
+                "cursor": {"type": "string", "description": "next_cursor from the previous page"},
             },
-        ),
-        Tool(
-            name="get_texture",
-            description="Get a texture by ID",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tenant_id": {"type": "string"},
-                    "texture_id": {"type": "string"},
-                },
-                "required": ["tenant_id", "texture_id"],
+            "required": ["tenant_id", "world_id"],
+        },
+    ),
+
+    # Texture operations
+    Tool(
+        name="create_texture",
+        description="Create a new texture for 3D models",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tenant_id": {"type": "string"},
+                "world_id": {"type": "string"},
+                "name": {"type": "string", "description": "Texture name"},
+                "path": {"type": "string", "description": "Path to texture file"},
+                "texture_type": {"type": "string", "enum": ["diffuse", "normal", "specular", "emissive", "roughness", "metallic"]},
+                "file_size": {"type": "integer", "description": "File size in bytes"},
+                "dimensions": {"type": "string", "description": "Dimensions (e.g., '1024x1024')"},
+                "color_space": {"type": "string", "description": "Color space (e.g., 'sRGB')"},
+                "description": {"type": "string"},
             },
-        ),
-        Tool(
-            name="list_textures",
-            description="List textures in a world",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tenant_id": {"type": "string"},
-                    "world_id": {"type": "string"},
-                    "limit": {"type": "integer", "default": 100},
-                    "offset": {"type": "integer", "default": 0},
-                },
-                "required": ["tenant_id", "world_id"],
+            "required": ["tenant_id", "world_id", "name", "path", "texture_type", "file_size"],
+        },
+    ),
+    Tool(
+        name="get_texture",
+        description="Get a texture by ID",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tenant_id": {"type": "string"},
+                "texture_id": {"type": "string"},
             },
-        ),
-
-        # 3D Model operations
-        Tool(
-            name="create_3d_model",
-            description="Create a new 3D model",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tenant_id": {"type": "string"},
-                    "world_id": {"type": "string"},
-                    "name": {"type": "string", "description": "3D model name"},
-                    "path": {"type": "string", "description": "Path to 3D model file"},
-                    "model_type": {"type": "string", "enum": ["item", "location", "character", "environment"]},
-                    "file_size": {"type": "integer", "description": "File size in bytes"},
-                    "poly_count": {"type": "integer", "description": "Number of polygons"},
-                    "dimensions": {"type": "string", "description": "Dimensions (e.g., '1x1x1')"},
-                    "textures": {"type": "array", "items": {"type": "string"}, "description": "List of texture IDs"},
-                    "animations": {"type": "array", "items": {"type": "string"}, "description": "List of animation names"},
-                    "description": {"type": "string"},
-                },
-                "required": ["tenant_id", "world_id", "name", "path", "model_type", "file_size"],
+            "required": ["tenant_id", "texture_id"],
+        },
+    ),
+    Tool(
+        name="list_textures",
+        description="List textures in a world",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tenant_id": {"type": "string"},
+                "world_id": {"type": "string"},
+                "limit": {"type": "integer", "default": 100, "minimum": 1},
+                "offset": {"type": "integer", "description": "Skip this many results (prefer cursor for deep pages)"},
+                "cursor": {"type": "string", "description": "next_cursor from the previous page"},
             },
-        ),
-        Tool(
-            name="get_3d_model",
-            description="Get a 3D model by ID",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tenant_id": {"type": "string"},
-                    "model_id": {"type": "string"},
-                },
-                "required": ["tenant_id", "model_id"],
+            "required": ["tenant_id", "world_id"],
+        },
+    ),
+
+    # 3D Model operations
+    Tool(
+        name="create_3d_model",
+        description="Create a new 3D model",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tenant_id": {"type": "string"},
+                "world_id": {"type": "string"},
+                "name": {"type": "string", "description": "3D model name"},
+                "path": {"type": "string", "description": "Path to 3D model file"},
+                "model_type": {"type": "string", "enum": ["item", "location", "character", "environment"]},
+                "file_size": {"type": "integer", "description": "File size in bytes"},
+                "poly_count": {"type": "integer", "description": "Number of polygons"},
+                "dimensions": {"type": "string", "description": "Dimensions (e.g., '1x1x1')"},
+                "textures": {"type": "array", "items": {"type": "string"}, "description": "List of texture IDs"},
+                "animations": {"type": "array", "items": {"type": "string"}, "description": "List of animation names"},
+                "description": {"type": "string"},
             },
-        ),
-        Tool(
-            name="list_3d_models",
-            description="List 3D models in a world",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tenant_id": {"type": "string"},
-                    "world_id": {"type": "string"},
-                    "limit": {"type": "integer", "default": 100},
-                    "offset": {"type": "integer", "default": 0},
-                },
-                "required": ["tenant_id", "world_id"],
+            "required": ["tenant_id", "world_id", "name", "path", "model_type", "file_size"],
+        },
+    ),
+    Tool(
+        name="get_3d_model",
+        description="Get a 3D model by ID",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tenant_id": {"type": "string"},
+                "model_id": {"type": "string"},
             },
-        ),
-        Tool(
-            name="search_items",
-            description="Search items by name",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tenant_id": {"type": "string"},
-                    "search_term": {"type": "string", "description": "Term to search for in item names"},
-                    "limit": {"type": "integer", "default": 20},
-                },
-                "required": ["tenant_id", "search_term"],
+            "required": ["tenant_id", "model_id"],
+        },
+    ),
+    Tool(
+        name="list_3d_models",
+        description="List 3D models in a world",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tenant_id": {"type": "string"},
+                "world_id": {"type": "string"},
+                "limit": {"type": "integer", "default": 100, "minimum": 1},
+                "offset": {"type": "integer", "description": "Skip this many results (prefer cursor for deep pages)"},
+                "cursor": {"type": "string", "description": "next_cursor from the previous page"},
             },
-        ),
-        Tool(
-            name="update_item",
-            description="Update item details",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tenant_id": {"type": "string"},
-                    "item_id": {"type": "string"},
-                    "name": {"type": "string", "description": "New item name"},
-                    "description": {"type": "string", "description": "New item description"},
-                    "rarity": {"type": "string", "enum": ["common", "uncommon", "rare", "epic", "legendary", "mythic"]},
-                    "location_id": {"type": "string", "description": "New location ID"},
-                    "level": {"type": "integer", "description": "New item level (1-100)", "minimum": 1, "maximum": 100},
-                },
-                "required": ["tenant_id", "item_id"],
+            "required": ["tenant_id", "world_id"],
+        },
+    ),
+    Tool(
+        name="search_items",
+        description="Search items by name (ranked full-text search; words match as prefixes)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tenant_id": {"type": "string"},
+                "search_term": {"type": "string", "description": "Term to search for in item names"},
+                "limit": {"type": "integer", "default": 20},
+                "full_text": {"type": "boolean", "default": False, "description": "Also search descriptions"},
             },
-        ),
-        Tool(
-            name="enhance_item",
-            description="Enhance an item (increase enhancement level)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tenant_id": {"type": "string"},
-                    "item_id": {"type": "string"},
-                },
-                "required": ["tenant_id", "item_id"],
+            "required": ["tenant_id", "search_term"],
+        },
+    ),
+    Tool(
+        name="update_item",
+        description="Update item details",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tenant_id": {"type": "string"},
+                "item_id": {"type": "string"},
+                "name": {"type": "string", "description": "New item name"},
+                "description": {"type": "string", "description": "New item description"},
+                "rarity": {"type": "string", "enum": ["common", "uncommon", "rare", "epic", "legendary", "mythic"]},
+                "location_id": {"type": "string", "description": "New location ID"},
+                "level": {"type": "integer", "description": "New item level (1-100)", "minimum": 1, "maximum": 100},
             },
-        ),
-        Tool(
-            name="delete_item",
-            description="Delete an item",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tenant_id": {"type": "string"},
-                    "item_id": {"type": "string"},
-                },
-                "required": ["tenant_id", "item_id"],
+            "required": ["tenant_id", "item_id"],
+        },
+    ),
+    Tool(
+        name="enhance_item",
+        description="Enhance an item (increase enhancement level)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tenant_id": {"type": "string"},
+                "item_id": {"type": "string"},
             },
-        ),
-
-        # Location operations
-        Tool(
-            name="create_location",
-            description="Create a new location in a world",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tenant_id": {"type": "string"},
-                    "world_id": {"type": "string"},
-                    "name": {"type": "string", "description": "Location name"},
-                    "description": {"type": "string", "description": "Location description"},
-                    "location_type": {"type": "string", "enum": ["building", "house", "barn", "temple", "castle", "dungeon", "cave", "forest", "mountain", "city", "village", "shop", "tavern", "ruins", "landmark", "other"]},
-                    "parent_location_id": {"type": "string", "description": "Parent location ID for hierarchical locations (optional)"},
-                },
-                "required": ["tenant_id", "world_id", "name", "description", "location_type"],
+            "required": ["tenant_id", "item_id"],
+        },
+    ),
+    Tool(
+        name="delete_item",
+        description="Delete an item",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tenant_id": {"type": "string"},
+                "item_id": {"type": "string"},
             },
-        ),
-        Tool(
-            name="get_location",
-            description="Get a location by ID",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tenant_id": {"type": "string"},
-                    "location_id": {"type": "string"},
-                },
-                "required": ["tenant_id", "location_id"],
+            "required": ["tenant_id", "item_id"],
+        },
+    ),
+
+    # Location operations
+    Tool(
+        name="create_location",
+        description="Create a new location in a world",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tenant_id": {"type": "string"},
+                "world_id": {"type": "string"},
+                "name": {"type": "string", "description": "Location name"},
+                "description": {"type": "string", "description": "Location description"},
+                "location_type": {"type": "string", "enum": ["building", "house", "barn", "temple", "castle", "dungeon", "cave", "forest", "mountain", "city", "village", "shop", "tavern", "ruins", "landmark", "other"]},
+                "parent_location_id": {"type": "string", "description": "Parent location ID for hierarchical locations (optional)"},
             },
-        ),
-        Tool(
-            name="list_locations",
-            description="List locations in a world",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tenant_id": {"type": "string"},
-                    "world_id": {"type": "string"},
-                    "limit": {"type": "integer", "default": 50},
-                    "offset": {"type": "integer", "default": 0},
-                },
-                "required": ["tenant_id", "world_id"],
+            "required": ["tenant_id", "world_id", "name", "description", "location_type"],
+        },
+    ),
+    Tool(
+        name="get_location",
+        description="Get a location by ID",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tenant_id": {"type": "string"},
+                "location_id": {"type": "string"},
             },
-        ),
-        Tool(
-            name="search_locations",
-            description="Search locations by name",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tenant_id": {"type": "string"},
-                    "search_term": {"type": "string", "description": "Term to search for in location names"},
-                    "limit": {"type": "integer", "default": 20},
-                },
-                "required": ["tenant_id", "search_term"],
+            "required": ["tenant_id", "location_id"],
+        },
+    ),
+    Tool(
+        name="list_locations",
+        description="List locations in a world",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tenant_id": {"type": "string"},
+                "world_id": {"type": "string"},
+                "limit": {"type": "integer", "default": 50, "minimum": 1},
+                "offset": {"type": "integer", "description": "Skip this many results (prefer cursor for deep pages)"},
+                "cursor": {"type": "string", "description": "next_cursor from the previous page"},
             },
-        ),
-        Tool(
-            name="find_locations_by_type",
-            description="Find locations by type in a world",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tenant_id": {"type": "string"},
-                    "world_id": {"type": "string"},
-                    "location_type": {"type": "string", "description": "Type of location to find"},
-                    "limit": {"type": "integer", "default": 50},
-                },
-                "required": ["tenant_id", "world_id", "location_type"],
+            "required": ["tenant_id", "world_id"],
+        },
+    ),
+    Tool(
+        name="search_locations",
+        description="Search locations by name (ranked full-text search; words match as prefixes)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tenant_id": {"type": "string"},
+                "search_term": {"type": "string", "description": "Term to search for in location names"},
+                "limit": {"type": "integer", "default": 20},
+                "full_text": {"type": "boolean", "default": False, "description": "Also search descriptions"},
             },
-        ),
-        Tool(
-            name="update_location",
-            description="Update location details",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tenant_id": {"type": "string"},
-                    "location_id": {"type": "string"},
-                    "name": {"type": "string", "description": "New location name"},
-                    "description": {"type": "string", "description": "New location description"},
-                    "location_type": {"type": "string", "enum": ["building", "house", "barn", "temple", "castle", "dungeon", "cave", "forest", "mountain", "city", "village", "shop", "tavern", "ruins", "landmark", "other"]},
-                },
-                "required": ["tenant_id", "location_id"],
+            "required": ["tenant_id", "search_term"],
+        },
+    ),
+    Tool(
+        name="find_locations_by_type",
+        description="Find locations by type in a world",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tenant_id": {"type": "string"},
+                "world_id": {"type": "string"},
+                "location_type": {"type": "string", "description": "Type of location to find"},
+                "limit": {"type": "integer", "default": 50},
             },
-        ),
-        Tool(
-            name="delete_location",
-            description="Delete a location",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tenant_id": {"type": "string"},
-                    "location_id": {"type": "string"},
-                },
-                "required": ["tenant_id", "location_id"],
+            "required": ["tenant_id", "world_id", "location_type"],
+        },
+    ),
+    Tool(
+        name="update_location",
+        description="Update location details",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tenant_id": {"type": "string"},
+                "location_id": {"type": "string"},
+                "name": {"type": "string", "description": "New location name"},
+                "description": {"type": "string", "description": "New location description"},
+                "location_type": {"type": "string", "enum": ["building", "house", "barn", "temple", "castle", "dungeon", "cave", "forest", "mountain", "city", "village", "shop", "tavern", "ruins", "landmark", "other"]},
             },
-        ),
-
-        # Environment operations
-        Tool(
-            name="create_environment",
-            description="Create a new environment for a location",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tenant_id": {"type": "string"},
-                    "world_id": {"type": "string"},
-                    "location_id": {"type": "string"},
-                    "name": {"type": "string", "description": "Environment preset name (e.g., 'Stormy Night')"},
-                    "description": {"type": "string", "description": "Detailed environment description"},
-                    "time_of_day": {"type": "string", "enum": ["day", "night", "dawn", "dusk"], "description": "Time of day"},
-                    "weather": {"type": "string", "enum": ["clear", "rainy", "stormy", "foggy"], "description": "Weather conditions"},
-                    "lighting": {"type": "string", "enum": ["bright", "dim", "dark", "magical"], "description": "Lighting conditions"},
-                    "temperature": {"type": "string", "description": "Temperature description (optional)"},
-                    "sounds": {"type": "string", "description": "Ambient sounds (optional)"},
-                    "smells": {"type": "string", "description": "Ambient smells (optional)"},
-                    "is_active": {"type": "boolean", "description": "Whether this environment is currently active", "default": True},
-                },
-                "required": ["tenant_id", "world_id", "location_id", "name", "time_of_day", "weather", "lighting"],
+            "required": ["tenant_id", "location_id"],
+        },
+    ),
+    Tool(
+        name="delete_location",
+        description="Delete a location",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tenant_id": {"type": "string"},
+                "location_id": {"type": "string"},
             },
-        ),
-        Tool(
-            name="get_environment",
-            description="Get an environment by ID",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tenant_id": {"type": "string"},
-                    "environment_id": {"type": "string"},
-                },
-                "required": ["tenant_id", "environment_id"],
+            "required": ["tenant_id", "location_id"],
+        },
+    ),
+
+    # Environment operations
+    Tool(
+        name="create_environment",
+        description="Create a new environment for a location",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tenant_id": {"type": "string"},
+                "world_id": {"type": "string"},
+                "location_id": {"type": "string"},
+                "name": {"type": "string", "description": "Environment preset name (e.g., 'Stormy Night')"},
+                "description": {"type": "string", "description": "Detailed environment description"},
+                "time_of_day": {"type": "string", "enum": ["day", "night", "dawn", "dusk"], "description": "Time of day"},
+                "weather": {"type": "string", "enum": ["clear", "rainy", "stormy", "foggy"], "description": "Weather conditions"},
+                "lighting": {"type": "string", "enum": ["bright", "dim", "dark", "magical"], "description": "Lighting conditions"},
+                "temperature": {"type": "string", "description": "Temperature description (optional)"},
+                "sounds": {"type": "string", "description": "Ambient sounds (optional)"},
+                "smells": {"type": "string", "description": "Ambient smells (optional)"},
+                "is_active": {"type": "boolean", "description": "Whether this environment is currently active", "default": True},
             },
-        ),
-        Tool(
-            name="list_environments",
-            description="List environments in a world",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tenant_id": {"type": "string"},
-                    "world_id": {"type": "string"},
-                    "limit": {"type": "integer", "default": 50},
-                    "offset": {"type": "integer", "default": 0},
-                },
-                "required": ["tenant_id", "world_id"],
+            "required": ["tenant_id", "world_id", "location_id", "name", "time_of_day", "weather", "lighting"],
+        },
+    ),
+    Tool(
+        name="get_environment",
+        description="Get an environment by ID",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tenant_id": {"type": "string"},
+                "environment_id": {"type": "string"},
             },
-        ),
-        Tool(
-            name="list_environments_by_location",
-            description="List all environments for a specific location",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tenant_id": {"type": "string"},
-                    "location_id": {"type": "string"},
-                    "limit": {"type": "integer", "default": 20},
-                    "offset": {"type": "integer", "default": 0},
-                },
-                "required": ["tenant_id", "location_id"],
+            "required": ["tenant_id", "environment_id"],
+        },
+    ),
+    Tool(
+        name="list_environments",
+        description="List environments in a world",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tenant_id": {"type": "string"},
+                "world_id": {"type": "string"},
+                "limit": {"type": "integer", "default": 50, "minimum": 1},
+                "offset": {"type": "integer", "description": "Skip this many results (prefer cursor for deep pages)"},
+                "cursor": {"type": "string", "description": "next_cursor from the previous page"},
             },
-        ),
-        Tool(
-            name="search_environments",
-            description="Search environments by name",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tenant_id": {"type": "string"},
-                    "search_term": {"type": "string", "description": "Term to search for in environment names"},
-                    "limit": {"type": "integer", "default": 20},
-                },
-                "required": ["tenant_id", "search_term"],
+            "required": ["tenant_id", "world_id"],
+        },
+    ),
+    Tool(
+        name="list_environments_by_location",
+        description="List all environments for a specific location",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tenant_id": {"type": "string"},
+                "location_id": {"type": "string"},
+                "limit": {"type": "integer", "default": 20},
+                "offset": {"type": "integer", "default": 0},
             },
-        ),
-        Tool(
-            name="find_environments_by_conditions",
-            description="Find environments by atmospheric conditions",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tenant_id": {"type": "string"},
-                    "world_id": {"type": "string"},
-                    "time_of_day": {"type": "string", "enum": ["day", "night", "dawn", "dusk"], "description": "Filter by time of day"},
-                    "weather": {"type": "string", "enum": ["clear", "rainy", "stormy", "foggy"], "description": "Filter by weather"},
-                    "lighting": {"type": "string", "enum": ["bright", "dim", "dark", "magical"], "description": "Filter by lighting"},
-                    "limit": {"type": "integer", "default": 50},
-                },
-                "required": ["tenant_id", "world_id"],
+            "required": ["tenant_id", "location_id"],
+        },
+    ),
+    Tool(
+        name="search_environments",
+        description="Search environments by name (ranked full-text search; words match as prefixes)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tenant_id": {"type": "string"},
+                "search_term": {"type": "string", "description": "Term to search for in environment names"},
+                "limit": {"type": "integer", "default": 20},
+                "full_text": {"type": "boolean", "default": False, "description": "Also search descriptions"},
             },
-        ),
-        Tool(
-            name="get_active_environment",
-            description="Get the currently active environment for a location",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tenant_id": {"type": "string"},
-                    "location_id": {"type": "string"},
-                },
-                "required": ["tenant_id", "location_id"],
+            "required": ["tenant_id", "search_term"],
+        },
+    ),
+    Tool(
+        name="find_environments_by_conditions",
+        description="Find environments by atmospheric conditions",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tenant_id": {"type": "string"},
+                "world_id": {"type": "string"},
+                "time_of_day": {"type": "string", "enum": ["day", "night", "dawn", "dusk"], "description": "Filter by time of day"},
+                "weather": {"type": "string", "enum": ["clear", "rainy", "stormy", "foggy"], "description": "Filter by weather"},
+                "lighting": {"type": "string", "enum": ["bright", "dim", "dark", "magical"], "description": "Filter by lighting"},
+                "limit": {"type": "integer", "default": 50},
             },
-        ),
-        Tool(
-            name="update_environment",
-            description="Update environment details",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tenant_id": {"type": "string"},
-                    "environment_id": {"type": "string"},
-                    "name": {"type": "string", "description": "New environment name"},
-                    "description": {"type": "string", "description": "New environment description"},
-                    "time_of_day": {"type": "string", "enum": ["day", "night", "dawn", "dusk"]},
-                    "weather": {"type": "string", "enum": ["clear", "rainy", "stormy", "foggy"]},
-                    "lighting": {"type": "string", "enum": ["bright", "dim", "dark", "magical"]},
-                    "temperature": {"type": "string", "description": "New temperature description"},
-                    "sounds": {"type": "string", "description": "New ambient sounds"},
-                    "smells": {"type": "string", "description": "New ambient smells"},
-                    "is_active": {"type": "boolean", "description": "Whether this environment should be active"},
-                },
-                "required": ["tenant_id", "environment_id"],
+            "required": ["tenant_id", "world_id"],
+        },
+    ),
+    Tool(
+        name="get_active_environment",
+        description="Get the currently active environment for a location",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tenant_id": {"type": "string"},
+                "location_id": {"type": "string"},
             },
-        ),
-        Tool(
-            name="delete_environment",
-            description="Delete an environment",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tenant_id": {"type": "string"},
-                    "environment_id": {"type": "string"},
-                },
-                "required": ["tenant_id", "environment_id"],
+            "required": ["tenant_id", "location_id"],
+        },
+    ),
+    Tool(
+        name="update_environment",
+        description="Update environment details",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tenant_id": {"type": "string"},
+                "environment_id": {"type": "string"},
+                "name": {"type": "string", "description": "New environment name"},
+                "description": {"type": "string", "description": "New environment description"},
+                "time_of_day": {"type": "string", "enum": ["day", "night", "dawn", "dusk"]},
+                "weather": {"type": "string", "enum": ["clear", "rainy", "stormy", "foggy"]},
+                "lighting": {"type": "string", "enum": ["bright", "dim", "dark", "magical"]},
+                "temperature": {"type": "string", "description": "New temperature description"},
+                "sounds": {"type": "string", "description": "New ambient sounds"},
+                "smells": {"type": "string", "description": "New ambient smells"},
+                "is_active": {"type": "boolean", "description": "Whether this environment should be active"},
             },
-        ),
-
-        # Persistence operations
-        Tool(
-            name="save_to_json",
-            description="Save all lore data to JSON files for a tenant. Creates individual JSON files for each entity.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tenant_id": {"type": "string", "description": "Tenant ID to save data for"},
-                },
-                "required": ["tenant_id"],
+            "required": ["tenant_id", "environment_id"],
+        },
+    ),
+    Tool(
+        name="delete_environment",
+        description="Delete an environment",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tenant_id": {"type": "string"},
+                "environment_id": {"type": "string"},
             },
-        ),
-        Tool(
-            name="export_tenant",
-            description="Export all tenant data to a single JSON file",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tenant_id": {"type": "string", "description": "Tenant ID to export"},
-                    "filename": {"type": "string", "description": "Output filename (e.g., 'my_world.json')"},
-                },
-                "required": ["tenant_id", "filename"],
+            "required": ["tenant_id", "environment_id"],
+        },
+    ),
+
+    # Batch operations
+    Tool(
+        name="batch_create",
+        description="Create many entities of mixed types in one call. Every item is validated before any is created; items are saved in one transaction and written to disk in one flush. Returns a result per item.",
+        inputSchema=batch_tool_schema("create"),
+    ),
+    Tool(
+        name="batch_update",
+        description="Update many entities of mixed types in one call. Every item is validated before any is updated; items are saved in one transaction and written to disk in one flush. Returns a result per item.",
+        inputSchema=batch_tool_schema("update"),
+    ),
+    Tool(
+        name="batch_get",
+        description="Get many entities of mixed types by ID in one call. Returns a result per item.",
+        inputSchema=batch_tool_schema("get"),
+    ),
+
+    # Persistence operations
+    Tool(
+        name="save_to_json",
+        description="Save all lore data to JSON files for a tenant. Creates individual JSON files for each entity.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tenant_id": {"type": "string", "description": "Tenant ID to save data for"},
             },
-        ),
-        Tool(
-            name="list_saved_files",
-            description="List all saved JSON files, optionally filtered by tenant",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tenant_id": {"type": "string", "description": "Optional tenant ID to filter by"},
-                },
+            "required": ["tenant_id"],
+        },
+    ),
+    Tool(
+        name="export_tenant",
+        description="Export all tenant data to a single JSON file, or to a binary snapshot that can be read without loading it",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tenant_id": {"type": "string", "description": "Tenant ID to export"},
+                "filename": {"type": "string", "description": "Output filename (e.g., 'my_world.json')"},
+                "format": {"type": "string", "enum": ["json", "snapshot"], "description": "Export format (default: json)"},
             },
-        ),
-        Tool(
-            name="get_storage_stats",
-            description="Get statistics about stored JSON data",
-            inputSchema={
-                "type": "object",
-                "properties": {},
+            "required": ["tenant_id", "filename"],
+        },
+    ),
+    Tool(
+        name="import_snapshot",
+        description="Import every entity of a binary snapshot into the repositories",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "filename": {"type": "string", "description": "Snapshot filename (e.g., 'my_world.snapshot')"},
+                "tenant_id": {"type": "string", "description": "Optional tenant ID to import into (default: the exported tenant)"},
+                "renumber": {"type": "boolean", "description": "Assign new IDs (default: true for SQLite repositories)"},
             },
-        ),
-    ]
+            "required": ["filename"],
+        },
+    ),
+    Tool(
+        name="get_snapshot_entity",
+        description="Read one entity from a binary snapshot by ID without loading the rest",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "filename": {"type": "string", "description": "Snapshot filename"},
+                "entity_type": {"type": "string", "description": "Entity type (e.g., 'character', 'world')"},
+                "entity_id": {"type": "string", "description": "Entity ID"},
+            },
+            "required": ["filename", "entity_type", "entity_id"],
+        },
+    ),
+    Tool(
+        name="list_saved_files",
+        description="List all saved JSON files, optionally filtered by tenant",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tenant_id": {"type": "string", "description": "Optional tenant ID to filter by"},
+            },
+        },
+    ),
+    Tool(
+        name="get_storage_stats",
+        description="Get statistics about stored JSON data",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+        },
+    ),
+    Tool(
+        name="get_tool_stats",
+        description="Get call counts and latency percentiles per tool, slowest first",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tools": {"type": "array", "items": {"type": "string"}, "description": "Optional tool names to report (default: every tool called so far)"},
+            },
+        },
+    ),
+]
+
+
+@app.list_tools()
+async def list_tools() -> list[Tool]:
+    """List available MCP tools."""
+    return TOOLS
 
 
 @app.call_tool()
 async def call_tool(name: str, arguments: Any) -> list[TextContent]:
-    """Handle tool calls."""
+    """Handle tool calls on the tool executor's thread pool."""
+    try:
+        return await tool_executor.run(name, handle_tool, name, arguments)
+    except ToolTimeout as e:
+        return error_response(e)
+
+
+# ============================================================================
+# WORLD OPERATIONS
+# ============================================================================
+
+@tool_registry.handler("create_world")
+def handle_create_world(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    tenant_id = parse_tenant_id(arguments["tenant_id"])
+    world_name = WorldName(arguments["name"])
+    description = Description(arguments["description"])
+    parent_id = parse_entity_id(arguments["parent_id"]) if arguments.get("parent_id") else None
+
+    world = World.create(tenant_id, world_name, description, parent_id)
+    repositories.world_repo.save(world)
+    persistence.save_world(world, str(arguments["tenant_id"]))
+
+    return {
+        "success": True,
+        "world": serialize_entity(world),
+        "message": f"World '{world_name}' created successfully"
+    }
+
+
+@tool_registry.handler("get_world")
+def handle_get_world(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    tenant_id = parse_tenant_id(arguments["tenant_id"])
+    world_id = parse_entity_id(arguments["world_id"])
+
+    world = repositories.world_repo.find_by_id(tenant_id, world_id)
+    if not world:
+        return {"success": False, "error": "World not found"}
+
+    return {"success": True, "world": serialize_entity(world)}
+
+
+@tool_registry.handler("list_worlds")
+def handle_list_worlds(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    tenant_id = parse_tenant_id(arguments["tenant_id"])
+    limit = arguments.get("limit", 100)
+    offset = arguments.get("offset")
+    cursor = arguments.get("cursor")
+
+    if offset is not None:
+        worlds = repositories.world_repo.list_by_tenant(tenant_id, limit, offset)
+        next_cursor = None
+    else:
+        result_page = repositories.world_repo.page_by_tenant(tenant_id, limit, cursor)
+        worlds, next_cursor = result_page.items, result_page.next_cursor
+
+    return {
+        "success": True,
+        "count": len(worlds),
+        "next_cursor": next_cursor,
+        "worlds": [serialize_entity(w) for w in worlds]
+    }
+
+
+@tool_registry.handler("update_world")
+def handle_update_world(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    tenant_id = parse_tenant_id(arguments["tenant_id"])
+    world_id = parse_entity_id(arguments["world_id"])
+
+    world = repositories.world_repo.find_by_id(tenant_id, world_id)
+    if not world:
+        return {"success": False, "error": "World not found"}
+
+    if "name" in arguments:
+        world.rename(WorldName(arguments["name"]))
+
+    if "description" in arguments:
+        world.update_description(Description(arguments["description"]))
+
+    repositories.world_repo.save(world)
+    persistence.save_world(world, str(arguments["tenant_id"]))
+
+    return {"success": True, "world": serialize_entity(world)}
+
+
+@tool_registry.handler("delete_world")
+def handle_delete_world(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    tenant_id = parse_tenant_id(arguments["tenant_id"])
+    world_id = parse_entity_id(arguments["world_id"])
+
+    repositories.world_repo.delete(tenant_id, world_id)
+
+    return {"success": True, "message": "World deleted"}
+
+
+# ============================================================================
+# CHARACTER OPERATIONS
+# ============================================================================
+
+@tool_registry.handler("create_character")
+def handle_create_character(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    tenant_id = parse_tenant_id(arguments["tenant_id"])
+    world_id = parse_entity_id(arguments["world_id"])
+    name = CharacterName(arguments["name"])
+    backstory = Backstory(arguments["backstory"])
+
+    # Optional fields
+    rarity = Rarity[arguments["rarity"]] if arguments.get("rarity") else None
+    element = CharacterElement[arguments["element"].upper()] if arguments.get("element") else None
+    role = CharacterRole[arguments["role"].upper()] if arguments.get("role") else None
+
+    character = Character.create(
+        tenant_id=tenant_id,
+        world_id=world_id,
+        name=name,
+        backstory=backstory,
+        rarity=rarity,
+        element=element,
+        role=role,
+        base_hp=arguments.get("base_hp"),
+        base_atk=arguments.get("base_atk"),
+        base_def=arguments.get("base_def"),
+        base_speed=arguments.get("base_speed"),
+        energy_cost=arguments.get("energy_cost"),
+    )
+
+    repositories.character_repo.save(character)
+    persistence.save_character(character, str(arguments["tenant_id"]))
+
+    return {
+        "success": True,
+        "character": serialize_entity(character),
+        "message": f"Character '{name}' created successfully"
+    }
+
+
+@tool_registry.handler("get_character")
+def handle_get_character(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    tenant_id = parse_tenant_id(arguments["tenant_id"])
+    character_id = parse_entity_id(arguments["character_id"])
+
+    character = repositories.character_repo.find_by_id(tenant_id, character_id)
+    if not character:
+        return {"success": False, "error": "Character not found"}
+
+    return {"success": True, "character": serialize_entity(character)}
+
+
+@tool_registry.handler("list_characters")
+def handle_list_characters(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    tenant_id = parse_tenant_id(arguments["tenant_id"])
+    world_id = parse_entity_id(arguments["world_id"])
+    limit = arguments.get("limit", 100)
+    offset = arguments.get("offset")
+    cursor = arguments.get("cursor")
+
+    if offset is not None:
+        characters = repositories.character_repo.list_by_world(tenant_id, world_id, limit, offset)
+        next_cursor = None
+    else:
+        result_page = repositories.character_repo.page_by_world(tenant_id, world_id, limit, cursor)
+        characters, next_cursor = result_page.items, result_page.next_cursor
+
+    return {
+        "success": True,
+        "count": len(characters),
+        "next_cursor": next_cursor,
+        "characters": [serialize_entity(c) for c in characters]
+    }
+
+
+@tool_registry.handler("update_character")
+def handle_update_character(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    tenant_id = parse_tenant_id(arguments["tenant_id"])
+    character_id = parse_entity_id(arguments["character_id"])
+
+    character = repositories.character_repo.find_by_id(tenant_id, character_id)
+    if not character:
+        return {"success": False, "error": "Character not found"}
+
+    if "backstory" in arguments:
+        character.update_backstory(Backstory(arguments["backstory"]))
+
+    if "status" in arguments:
+        if arguments["status"] == "active":
+            character.activate()
+        else:
+            character.deactivate()
+
+    repositories.character_repo.save(character)
+
+    return {"success": True, "character": serialize_entity(character)}
+
+
+@tool_registry.handler("delete_character")
+def handle_delete_character(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    tenant_id = parse_tenant_id(arguments["tenant_id"])
+    character_id = parse_entity_id(arguments["character_id"])
+
+    repositories.character_repo.delete(tenant_id, character_id)
+
+    return {"success": True, "message": "Character deleted"}
+
+
+@tool_registry.handler("add_ability")
+def handle_add_ability(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    tenant_id = parse_tenant_id(arguments["tenant_id"])
+    character_id = parse_entity_id(arguments["character_id"])
+
+    character = repositories.character_repo.find_by_id(tenant_id, character_id)
+    if not character:
+        return {"success": False, "error": "Character not found"}
+
+    ability = Ability(
+        name=AbilityName(arguments["ability_name"]),
+        description=Description(arguments["description"]),
+        power_level=PowerLevel(arguments["power_level"]),
+    )
+
+    character.add_ability(ability)
+    repositories.character_repo.save(character)
+
+    return {
+        "success": True,
+        "character": serialize_entity(character),
+        "message": f"Ability '{arguments['ability_name']}' added"
+    }
+
+
+# ============================================================================
+# STORY OPERATIONS
+# ============================================================================
+
+@tool_registry.handler("create_story")
+def handle_create_story(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    tenant_id = parse_tenant_id(arguments["tenant_id"])
+    world_id = parse_entity_id(arguments["world_id"])
+
+    story = Story.create(
+        tenant_id=tenant_id,
+        world_id=world_id,
+        name=StoryName(arguments["name"]),
+        description=arguments["description"],
+        story_type=StoryType[arguments.get("story_type", "LINEAR")],
+        content=Content(arguments.get("content", "") or "Story content to be added."),
+    )
+
+    repositories.story_repo.save(story)
+    persistence.save_story(story, str(arguments["tenant_id"]))
+
+    return {
+        "success": True,
+        "story": serialize_entity(story),
+        "message": "Story created successfully"
+    }
+
+
+@tool_registry.handler("get_story")
+def handle_get_story(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    tenant_id = parse_tenant_id(arguments["tenant_id"])
+    story_id = parse_entity_id(arguments["story_id"])
+
+    story = repositories.story_repo.find_by_id(tenant_id, story_id)
+    if not story:
+        return {"success": False, "error": "Story not found"}
+
+    return {"success": True, "story": serialize_entity(story)}
+
+
+@tool_registry.handler("list_stories")
+def handle_list_stories(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    tenant_id = parse_tenant_id(arguments["tenant_id"])
+    world_id = parse_entity_id(arguments["world_id"])
+    limit = arguments.get("limit", 100)
+    offset = arguments.get("offset")
+    cursor = arguments.get("cursor")
+
+    if offset is not None:
+        stories = repositories.story_repo.list_by_world(tenant_id, world_id, limit, offset)
+        next_cursor = None
+    else:
+        result_page = repositories.story_repo.page_by_world(tenant_id, world_id, limit, cursor)
+        stories, next_cursor = result_page.items, result_page.next_cursor
+
+    return {
+        "success": True,
+        "count": len(stories),
+        "next_cursor": next_cursor,
+        "stories": [serialize_entity(s) for s in stories]
+    }
+
+
+# ============================================================================
+# EVENT OPERATIONS
+# ============================================================================
+
+@tool_registry.handler("create_event")
+def handle_create_event(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    from datetime import datetime
+    from dataclasses import dataclass
+
+    tenant_id = parse_tenant_id(arguments["tenant_id"])
+    world_id = parse_entity_id(arguments["world_id"])
+
+    start_datetime = datetime.fromisoformat(arguments["start_date"])
+    start_timestamp = Timestamp(start_datetime)
+
+    end_timestamp = None
+    if arguments.get("end_date"):
+        end_datetime = datetime.fromisoformat(arguments["end_date"])
+        end_timestamp = Timestamp(end_datetime)
+
+    # Parse participant IDs
+    participant_ids = [parse_entity_id(pid) for pid in arguments.get("participant_ids", [])]
+
+    event = Event.create(
+        tenant_id=tenant_id,
+        world_id=world_id,
+        name=arguments["name"],
+        description=Description(arguments["description"]),
+        start_date=start_timestamp,
+        end_date=end_timestamp,
+        participant_ids=participant_ids,
+        outcome=EventOutcome[arguments.get("outcome", "ongoing").upper()],
+    )
+
+    repositories.event_repo.save(event)
+    persistence.save_event(event, str(arguments["tenant_id"]))
+
+    return {
+        "success": True,
+        "event": serialize_entity(event),
+        "message": "Event created successfully"
+    }
+
+
+@tool_registry.handler("list_events")
+def handle_list_events(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    tenant_id = parse_tenant_id(arguments["tenant_id"])
+    world_id = parse_entity_id(arguments["world_id"])
+    limit = arguments.get("limit", 100)
+    offset = arguments.get("offset")
+    cursor = arguments.get("cursor")
+
+    if offset is not None:
+        events = repositories.event_repo.list_by_world(tenant_id, world_id, limit, offset)
+        next_cursor = None
+    else:
+        result_page = repositories.event_repo.page_by_world(tenant_id, world_id, limit, cursor)
+        events, next_cursor = result_page.items, result_page.next_cursor
+
+    return {
+        "success": True,
+        "count": len(events),
+        "next_cursor": next_cursor,
+        "events": [serialize_entity(e) for e in events]
+    }
+
+
+# ============================================================================
+# PAGE OPERATIONS
+# ============================================================================
+
+@tool_registry.handler("create_page")
+def handle_create_page(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    tenant_id = parse_tenant_id(arguments["tenant_id"])
+    world_id = parse_entity_id(arguments["world_id"])
+
+    page = Page.create(
+        tenant_id=tenant_id,
+        world_id=world_id,
+        name=PageName(arguments["name"]),
+        content=Content(arguments["content"]),
+    )
+
+    repositories.page_repo.save(page)
+    persistence.save_page(page, str(arguments["tenant_id"]))
+
+    return {
+        "success": True,
+        "page": serialize_entity(page),
+        "message": "Page created successfully"
+    }
+
+
+@tool_registry.handler("list_pages")
+def handle_list_pages(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    tenant_id = parse_tenant_id(arguments["tenant_id"])
+    world_id = parse_entity_id(arguments["world_id"])
+    limit = arguments.get("limit", 100)
+    offset = arguments.get("offset")
+    cursor = arguments.get("cursor")
+
+    if offset is not None:
+        pages = repositories.page_repo.list_by_world(tenant_id, world_id, limit, offset)
+        next_cursor = None
+    else:
+        result_page = repositories.page_repo.page_by_world(tenant_id, world_id, limit, cursor)
+        pages, next_cursor = result_page.items, result_page.next_cursor
+
+    return {
+        "success": True,
+        "count": len(pages),
+        "next_cursor": next_cursor,
+        "pages": [serialize_entity(p) for p in pages]
+    }
+
+
+# ============================================================================
+# ITEM OPERATIONS
+# ============================================================================
+
+@tool_registry.handler("create_item")
+def handle_create_item(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    tenant_id = parse_tenant_id(arguments["tenant_id"])
+    world_id = parse_entity_id(arguments["world_id"])
+
+    item = Item.create(
+        tenant_id=tenant_id,
+        world_id=world_id,
+        name=arguments["name"],
+        description=Description(arguments["description"]),
+        item_type=ItemType[arguments["item_type"].upper()],
+        rarity=Rarity[arguments["rarity"].upper()] if arguments.get("rarity") else None,
+        location_id=parse_entity_id(arguments["location_id"]) if arguments.get("location_id") else None,
+        level=arguments.get("level"),
+        enhancement=arguments.get("enhancement"),
+        max_enhancement=arguments.get("max_enhancement"),
+        base_atk=arguments.get("base_atk"),
+        base_hp=arguments.get("base_hp"),
+        base_def=arguments.get("base_def"),
+        special_stat=arguments.get("special_stat"),
+        special_stat_value=arguments.get("special_stat_value"),
+    )
+
+    repositories.item_repo.save(item)
+    persistence.save_item(item, str(arguments["tenant_id"]))
+
+    return {
+        "success": True,
+        "item": serialize_entity(item),
+        "message": "Item created successfully"
+    }
+
+
+@tool_registry.handler("get_item")
+def handle_get_item(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    tenant_id = parse_tenant_id(arguments["tenant_id"])
+    item_id = parse_entity_id(arguments["item_id"])
+
+    item = repositories.item_repo.find_by_id(tenant_id, item_id)
+    if not item:
+        return {"success": False, "error": "Item not found"}
+
+    return {"success": True, "item": serialize_entity(item)}
+
+
+@tool_registry.handler("list_items")
+def handle_list_items(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    tenant_id = parse_tenant_id(arguments["tenant_id"])
+    world_id = parse_entity_id(arguments["world_id"])
+    limit = arguments.get("limit", 50)
+    offset = arguments.get("offset")
+    cursor = arguments.get("cursor")
+
+    if offset is not None:
+        items = repositories.item_repo.list_by_world(tenant_id, world_id, limit, offset)
+        next_cursor = None
+    else:
+        result_page = repositories.item_repo.page_by_world(tenant_id, world_id, limit, cursor)
+        items, next_cursor = result_page.items, result_page.next_cursor
+
+    return {
+        "success": True,
+        "count": len(items),
+        "next_cursor": next_cursor,
+        "items": [serialize_entity(i) for i in items]
+    }
+
+
+@tool_registry.handler("search_items")
+def handle_search_items(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    tenant_id = parse_tenant_id(arguments["tenant_id"])
+    search_term = arguments["search_term"]
+    limit = arguments.get("limit", 20)
+
+    columns = None if arguments.get("full_text") else ("name",)
+    hits = repositories.item_repo.search_ranked(tenant_id, search_term, limit, columns)
+
+    return {
+        "success": True,
+        "count": len(hits),
+        "search_term": search_term,
+        "items": serialize_search_hits(hits)
+    }
+
+
+@tool_registry.handler("update_item")
+def handle_update_item(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    tenant_id = parse_tenant_id(arguments["tenant_id"])
+    item_id = parse_entity_id(arguments["item_id"])
+
+    item = repositories.item_repo.find_by_id(tenant_id, item_id)
+    if not item:
+        return {"success": False, "error": "Item not found"}
+
+    # Update fields
+    if "name" in arguments:
+        item.rename(arguments["name"])
+    if "description" in arguments:
+        item.update_description(Description(arguments["description"]))
+    if "rarity" in arguments:
+        item.set_rarity(Rarity[arguments["rarity"].upper()] if arguments["rarity"] else None)
+    if "location_id" in arguments:
+        item.move_to_location(parse_entity_id(arguments["location_id"]) if arguments["location_id"] else None)
+    if "level" in arguments:
+        item.set_level(arguments["level"])
+
+    repositories.item_repo.save(item)
+    persistence.save_item(item, str(arguments["tenant_id"]))
+
+    return {
+        "success": True,
+        "item": serialize_entity(item),
+        "message": "Item updated successfully"
+    }
+
+
+@tool_registry.handler("enhance_item")
+def handle_enhance_item(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    tenant_id = parse_tenant_id(arguments["tenant_id"])
+    item_id = parse_entity_id(arguments["item_id"])
+
+    item = repositories.item_repo.find_by_id(tenant_id, item_id)
+    if not item:
+        return {"success": False, "error": "Item not found"}
 
     try:
-        # World operations
-        if name == "create_world":
-            tenant_id = parse_tenant_id(arguments["tenant_id"])
-            world_name = WorldName(arguments["name"])
-            description = Description(arguments["description"])
-            parent_id = parse_entity_id(arguments["parent_id"]) if arguments.get("parent_id") else None
-
-            world = World.create(tenant_id, world_name, description, parent_id)
-            world_repo.save(world)
-            persistence.save_world(world, str(arguments["tenant_id"]))
-
-            return [TextContent(
-                type="text",
-                text=json.dumps({
-                    "success": True,
-                    "world": serialize_entity(world),
-                    "message": f"World '{world_name}' created successfully"
-                }, indent=2)
-            )]
-
-        elif name == "get_world":
-            tenant_id = parse_tenant_id(arguments["tenant_id"])
-            world_id = parse_entity_id(arguments["world_id"])
-
-            world = world_repo.find_by_id(tenant_id, world_id)
-            if not world:
-                return [TextContent(type="text", text=json.dumps({"success": False, "error": "World not found"}))]
-
-            return [TextContent(
-                type="text",
-                text=json.dumps({"success": True, "world": serialize_entity(world)}, indent=2)
-            )]
-
-        elif name == "list_worlds":
-            tenant_id = parse_tenant_id(arguments["tenant_id"])
-            limit = arguments.get("limit", 100)
-            offset = arguments.get("offset", 0)
-
-            worlds = world_repo.list_by_tenant(tenant_id, limit, offset)
-
-            return [TextContent(
-                type="text",
-                text=json.dumps({
-                    "success": True,
-                    "count": len(worlds),
-                    "worlds": [serialize_entity(w) for w in worlds]
-                }, indent=2)
-            )]
-
-        elif name == "update_world":
-            tenant_id = parse_tenant_id(arguments["tenant_id"])
-            world_id = parse_entity_id(arguments["world_id"])
-
-            world = world_repo.find_by_id(tenant_id, world_id)
-            if not world:
-                return [TextContent(type="text", text=json.dumps({"success": False, "error": "World not found"}))]
-
-            if "name" in arguments:
-                world.rename(WorldName(arguments["name"]))
-
-            if "description" in arguments:
-                world.update_description(Description(arguments["description"]))
-
-            world_repo.save(world)
-            persistence.save_world(world, str(arguments["tenant_id"]))
-
-            return [TextContent(
-                type="text",
-                text=json.dumps({"success": True, "world": serialize_entity(world)}, indent=2)
-            )]
-
-        elif name == "delete_world":
-            tenant_id = parse_tenant_id(arguments["tenant_id"])
-            world_id = parse_entity_id(arguments["world_id"])
-
-            world_repo.delete(tenant_id, world_id)
-
-            return [TextContent(
-                type="text",
-                text=json.dumps({"success": True, "message": "World deleted"})
-            )]
-
-        # Character operations
-        elif name == "create_character":
-            tenant_id = parse_tenant_id(arguments["tenant_id"])
-            world_id = parse_entity_id(arguments["world_id"])
-            name = CharacterName(arguments["name"])
-            backstory = Backstory(arguments["backstory"])
-
-            # Optional fields
-            rarity = Rarity[arguments["rarity"]] if arguments.get("rarity") else None
-            element = CharacterElement[arguments["element"].upper()] if arguments.get("element") else None
-            role = CharacterRole[arguments["role"].upper()] if arguments.get("role") else None
-
-            character = Character.create(
-                tenant_id=tenant_id,
-                world_id=world_id,
-                name=name,
-                backstory=backstory,
-                rarity=rarity,
-                element=element,
-                role=role,
-                base_hp=arguments.get("base_hp"),
-                base_atk=arguments.get("base_atk"),
-                base_def=arguments.get("base_def"),
-                base_speed=arguments.get("base_speed"),
-                energy_cost=arguments.get("energy_cost"),
-            )
+        item.enhance()
+        repositories.item_repo.save(item)
+        persistence.save_item(item, str(arguments["tenant_id"]))
+
+        return {
+            "success": True,
+            "item": serialize_entity(item),
+            "message": "Item enhanced successfully"
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
 
-            character_repo.save(character)
-            persistence.save_character(character, str(arguments["tenant_id"]))
-
-            return [TextContent(
-                type="text",
-                text=json.dumps({
-                    "success": True,
-                    "character": serialize_entity(character),
-                    "message": f"Character '{name}' created successfully"
-                }, indent=2)
-            )]
-
-        elif name == "get_character":
-            tenant_id = parse_tenant_id(arguments["tenant_id"])
-            character_id = parse_entity_id(arguments["character_id"])
-
-            character = character_repo.find_by_id(tenant_id, character_id)
-            if not character:
-                return [TextContent(type="text", text=json.dumps({"success": False, "error": "Character not found"}))]
-
-            return [TextContent(
-                type="text",
-                text=json.dumps({"success": True, "character": serialize_entity(character)}, indent=2)
-            )]
-
-        elif name == "list_characters":
-            tenant_id = parse_tenant_id(arguments["tenant_id"])
-            world_id = parse_entity_id(arguments["world_id"])
-            limit = arguments.get("limit", 100)
-            offset = arguments.get("offset", 0)
-
-            characters = character_repo.list_by_world(tenant_id, world_id, limit, offset)
-
-            return [TextContent(
-                type="text",
-                text=json.dumps({
-                    "success": True,
-                    "count": len(characters),
-                    "characters": [serialize_entity(c) for c in characters]
-                }, indent=2)
-            )]
-
-        elif name == "update_character":
-            tenant_id = parse_tenant_id(arguments["tenant_id"])
-            character_id = parse_entity_id(arguments["character_id"])
-
-            character = character_repo.find_by_id(tenant_id, character_id)
-            if not character:
-                return [TextContent(type="text", text=json.dumps({"success": False, "error": "Character not found"}))]
-
-            if "backstory" in arguments:
-                character.update_backstory(Backstory(arguments["backstory"]))
-
-            if "status" in arguments:
-                if arguments["status"] == "active":
-                    character.activate()
-                else:
-                    character.deactivate()
-
-            character_repo.save(character)
-
-            return [TextContent(
-                type="text",
-                text=json.dumps({"success": True, "character": serialize_entity(character)}, indent=2)
-            )]
-
-        elif name == "delete_character":
-            tenant_id = parse_tenant_id(arguments["tenant_id"])
-            character_id = parse_entity_id(arguments["character_id"])
-
-            character_repo.delete(tenant_id, character_id)
-
-            return [TextContent(
-                type="text",
-                text=json.dumps({"success": True, "message": "Character deleted"})
-            )]
-
-        elif name == "add_ability":
-            tenant_id = parse_tenant_id(arguments["tenant_id"])
-            character_id = parse_entity_id(arguments["character_id"])
-
-            character = character_repo.find_by_id(tenant_id, character_id)
-            if not character:
-                return [TextContent(type="text", text=json.dumps({"success": False, "error": "Character not found"}))]
-
-            ability = Ability(
-                name=AbilityName(arguments["ability_name"]),
-                description=Description(arguments["description"]),
-                power_level=PowerLevel(arguments["power_level"]),
-            )
 
-            character.add_ability(ability)
-            character_repo.save(character)
-
-            return [TextContent(
-                type="text",
-                text=json.dumps({
-                    "success": True,
-                    "character": serialize_entity(character),
-                    "message": f"Ability '{arguments['ability_name']}' added"
-                }, indent=2)
-            )]
-
-        # Story operations
-        elif name == "create_story":
-            tenant_id = parse_tenant_id(arguments["tenant_id"])
-            world_id = parse_entity_id(arguments["world_id"])
-
-            story = Story.create(
-                tenant_id=tenant_id,
-                world_id=world_id,
-                name=StoryName(arguments["name"]),
-                description=arguments["description"],
-                story_type=StoryType[arguments.get("story_type", "LINEAR")],
-                content=Content(arguments.get("content", "") or "Story content to be added."),
-            )
+@tool_registry.handler("delete_item")
+def handle_delete_item(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    tenant_id = parse_tenant_id(arguments["tenant_id"])
+    item_id = parse_entity_id(arguments["item_id"])
 
-            story_repo.save(story)
-            persistence.save_story(story, str(arguments["tenant_id"]))
-
-            return [TextContent(
-                type="text",
-                text=json.dumps({
-                    "success": True,
-                    "story": serialize_entity(story),
-                    "message": "Story created successfully"
-                }, indent=2)
-            )]
-
-        elif name == "get_story":
-            tenant_id = parse_tenant_id(arguments["tenant_id"])
-            story_id = parse_entity_id(arguments["story_id"])
-
-            story = story_repo.find_by_id(tenant_id, story_id)
-            if not story:
-                return [TextContent(type="text", text=json.dumps({"success": False, "error": "Story not found"}))]
-
-            return [TextContent(
-                type="text",
-                text=json.dumps({"success": True, "story": serialize_entity(story)}, indent=2)
-            )]
-
-        elif name == "list_stories":
-            tenant_id = parse_tenant_id(arguments["tenant_id"])
-            world_id = parse_entity_id(arguments["world_id"])
-            limit = arguments.get("limit", 100)
-            offset = arguments.get("offset", 0)
-
-            stories = story_repo.list_by_world(tenant_id, world_id, limit, offset)
-
-            return [TextContent(
-                type="text",
-                text=json.dumps({
-                    "success": True,
-                    "count": len(stories),
-                    "stories": [serialize_entity(s) for s in stories]
-                }, indent=2)
-            )]
-
-        # Event operations
-        elif name == "create_event":
-            from datetime import datetime
-            from dataclasses import dataclass
-
-            tenant_id = parse_tenant_id(arguments["tenant_id"])
-            world_id = parse_entity_id(arguments["world_id"])
-
-            start_datetime = datetime.fromisoformat(arguments["start_date"])
-            start_timestamp = Timestamp(start_datetime)
-
-            end_timestamp = None
-            if arguments.get("end_date"):
-                end_datetime = datetime.fromisoformat(arguments["end_date"])
-                end_timestamp = Timestamp(end_datetime)
-
-            # Parse participant IDs
-            participant_ids = [parse_entity_id(pid) for pid in arguments.get("participant_ids", [])]
-
-            event = Event.create(
-                tenant_id=tenant_id,
-                world_id=world_id,
-                name=arguments["name"],
-                description=Description(arguments["description"]),
-                start_date=start_timestamp,
-                end_date=end_timestamp,
-                participant_ids=participant_ids,
-                outcome=EventOutcome[arguments.get("outcome", "ongoing").upper()],
-            )
+    item = repositories.item_repo.find_by_id(tenant_id, item_id)
+    if not item:
+        return {"success": False, "error": "Item not found"}
 
-            event_repo.save(event)
-            persistence.save_event(event, str(arguments["tenant_id"]))
-
-            return [TextContent(
-                type="text",
-                text=json.dumps({
-                    "success": True,
-                    "event": serialize_entity(event),
-                    "message": "Event created successfully"
-                }, indent=2)
-            )]
-
-        elif name == "list_events":
-            tenant_id = parse_tenant_id(arguments["tenant_id"])
-            world_id = parse_entity_id(arguments["world_id"])
-            limit = arguments.get("limit", 100)
-            offset = arguments.get("offset", 0)
-
-            events = event_repo.list_by_world(tenant_id, world_id, limit, offset)
-
-            return [TextContent(
-                type="text",
-                text=json.dumps({
-                    "success": True,
-                    "count": len(events),
-                    "events": [serialize_entity(e) for e in events]
-                }, indent=2)
-            )]
-
-        # Page operations
-        elif name == "create_page":
-            tenant_id = parse_tenant_id(arguments["tenant_id"])
-            world_id = parse_entity_id(arguments["world_id"])
-
-            page = Page.create(
-                tenant_id=tenant_id,
-                world_id=world_id,
-                name=PageName(arguments["name"]),
-                content=Content(arguments["content"]),
-            )
+    deleted = repositories.item_repo.delete(tenant_id, item_id)
+    if deleted:
+        persistence.delete_item(str(arguments["tenant_id"]), str(item_id))
 
-            page_repo.save(page)
-            persistence.save_page(page, str(arguments["tenant_id"]))
-
-            return [TextContent(
-                type="text",
-                text=json.dumps({
-                    "success": True,
-                    "page": serialize_entity(page),
-                    "message": "Page created successfully"
-                }, indent=2)
-            )]
-
-        elif name == "list_pages":
-            tenant_id = parse_tenant_id(arguments["tenant_id"])
-            world_id = parse_entity_id(arguments["world_id"])
-            limit = arguments.get("limit", 100)
-            offset = arguments.get("offset", 0)
-
-            pages = page_repo.list_by_world(tenant_id, world_id, limit, offset)
-
-            return [TextContent(
-                type="text",
-                text=json.dumps({
-                    "success": True,
-                    "count": len(pages),
-                    "pages": [serialize_entity(p) for p in pages]
-                }, indent=2)
-            )]
-
-        # Item operations
-        elif name == "create_item":
-            tenant_id = parse_tenant_id(arguments["tenant_id"])
-            world_id = parse_entity_id(arguments["world_id"])
-
-            item = Item.create(
-                tenant_id=tenant_id,
-                world_id=world_id,
-                name=arguments["name"],
-                description=Description(arguments["description"]),
-                item_type=ItemType[arguments["item_type"].upper()],
-                rarity=Rarity[arguments["rarity"].upper()] if arguments.get("rarity") else None,
-                location_id=parse_entity_id(arguments["location_id"]) if arguments.get("location_id") else None,
-                level=arguments.get("level"),
-                enhancement=arguments.get("enhancement"),
-                max_enhancement=arguments.get("max_enhancement"),
-                base_atk=arguments.get("base_atk"),
-                base_hp=arguments.get("base_hp"),
-                base_def=arguments.get("base_def"),
-                special_stat=arguments.get("special_stat"),
-                special_stat_value=arguments.get("special_stat_value"),
-            )
+    return {
+        "success": deleted,
+        "message": "Item deleted successfully" if deleted else "Item not found"
+    }
 
-            item_repo.save(item)
-            persistence.save_item(item, str(arguments["tenant_id"]))
-
-            return [TextContent(
-                type="text",
-                text=json.dumps({
-                    "success": True,
-                    "item": serialize_entity(item),
-                    "message": "Item created successfully"
-                }, indent=2)
-            )]
-
-        elif name == "get_item":
-            tenant_id = parse_tenant_id(arguments["tenant_id"])
-            item_id = parse_entity_id(arguments["item_id"])
-
-            item = item_repo.find_by_id(tenant_id, item_id)
-            if not item:
-                return [TextContent(type="text", text=json.dumps({"success": False, "error": "Item not found"}))]
-
-            return [TextContent(
-                type="text",
-                text=json.dumps({"success": True, "item": serialize_entity(item)}, indent=2)
-            )]
-
-        elif name == "list_items":
-            tenant_id = parse_tenant_id(arguments["tenant_id"])
-            world_id = parse_entity_id(arguments["world_id"])
-            limit = arguments.get("limit", 50)
-            offset = arguments.get("offset", 0)
-
-            items = item_repo.list_by_world(tenant_id, world_id, limit, offset)
-
-            return [TextContent(
-                type="text",
-                text=json.dumps({
-                    "success": True,
-                    "count": len(items),
-                    "items": [serialize_entity(i) for i in items]
-                }, indent=2)
-            )]
-
-        elif name == "search_items":
-            tenant_id = parse_tenant_id(arguments["tenant_id"])
-            search_term = arguments["search_term"]
-            limit = arguments.get("limit", 20)
-
-            items = item_repo.search_by_name(tenant_id, search_term, limit)
-
-            return [TextContent(
-                type="text",
-                text=json.dumps({
-                    "success": True,
-                    "count": len(items),
-                    "search_term": search_term,
-                    "items": [serialize_entity(i) for i in items]
-                }, indent=2)
-            )]
-
-        elif name == "update_item":
-            tenant_id = parse_tenant_id(arguments["tenant_id"])
-            item_id = parse_entity_id(arguments["item_id"])
-
-            item = item_repo.find_by_id(tenant_id, item_id)
-            if not item:
-                return [TextContent(type="text", text=json.dumps({"success": False, "error": "Item not found"}))]
-
-            # Update fields
-            if "name" in arguments:
-                item.rename(arguments["name"])
-            if "description" in arguments:
-                item.update_description(Description(arguments["description"]))
-            if "rarity" in arguments:
-                item.set_rarity(Rarity[arguments["rarity"].upper()] if arguments["rarity"] else None)
-            if "location_id" in arguments:
-                item.move_to_location(parse_entity_id(arguments["location_id"]) if arguments["location_id"] else None)
-            if "level" in arguments:
-                item.set_level(arguments["level"])
-
-            item_repo.save(item)
-            persistence.save_item(item, str(arguments["tenant_id"]))
-
-            return [TextContent(
-                type="text",
-                text=json.dumps({
-                    "success": True,
-                    "item": serialize_entity(item),
-                    "message": "Item updated successfully"
-                }, indent=2)
-            )]
-
-        elif name == "enhance_item":
-            tenant_id = parse_tenant_id(arguments["tenant_id"])
-            item_id = parse_entity_id(arguments["item_id"])
-
-            item = item_repo.find_by_id(tenant_id, item_id)
-            if not item:
-                return [TextContent(type="text", text=json.dumps({"success": False, "error": "Item not found"}))]
-
-            try:
-                item.enhance()
-                item_repo.save(item)
-                persistence.save_item(item, str(arguments["tenant_id"]))
-
-                return [TextContent(
-                    type="text",
-                    text=json.dumps({
-                        "success": True,
-                        "item": serialize_entity(item),
-                        "message": "Item enhanced successfully"
-                    }, indent=2)
-                )]
-            except Exception as e:
-                return [TextContent(
-                    type="text",
-                    text=json.dumps({
-                        "success": False,
-                        "error": str(e)
-                    }, indent=2)
-                )]
-
-        elif name == "delete_item":
-            tenant_id = parse_tenant_id(arguments["tenant_id"])
-            item_id = parse_entity_id(arguments["item_id"])
-
-            item = item_repo.find_by_id(tenant_id, item_id)
-            if not item:
-                return [TextContent(type="text", text=json.dumps({"success": False, "error": "Item not found"}))]
-
-            deleted = item_repo.delete(tenant_id, item_id)
-            if deleted:
-                persistence.delete_item(str(arguments["tenant_id"]), str(item_id))
-
-            return [TextContent(
-                type="text",
-                text=json.dumps({
-                    "success": deleted,
-                    "message": "Item deleted successfully" if deleted else "Item not found"
-                }, indent=2)
-            )]
-
-        # Texture operations
-        elif name == "create_texture":
-            tenant_id = parse_tenant_id(arguments["tenant_id"])
-            world_id = parse_entity_id(arguments["world_id"])
-
-            texture = Texture.create(
-                tenant_id=tenant_id,
-                world_id=world_id,
-                name=arguments["name"],
-                path=arguments["path"],
-                texture_type=arguments["texture_type"],
-                file_size=arguments["file_size"],
-                dimensions=arguments.get("dimensions"),
-                color_space=arguments.get("color_space", "sRGB"),
-                description=arguments.get("description"),
-            )
 
-            texture_repo.save(texture)
-            persistence.save_texture(texture, str(arguments["tenant_id"]))
-
-            return [TextContent(
-                type="text",
-                text=json.dumps({
-                    "success": True,
-                    "texture": serialize_entity(texture),
-                    "message": "Texture created successfully"
-                }, indent=2)
-            )]
-
-        elif name == "get_texture":
-            tenant_id = parse_tenant_id(arguments["tenant_id"])
-            texture_id = parse_entity_id(arguments["texture_id"])
-
-            texture = texture_repo.get_by_id(tenant_id, texture_id)
-            if not texture:
-                return [TextContent(type="text", text=json.dumps({"success": False, "error": "Texture not found"}))]
-
-            return [TextContent(
-                type="text",
-                text=json.dumps({"success": True, "texture": serialize_entity(texture)}, indent=2)
-            )]
-
-        elif name == "list_textures":
-            tenant_id = parse_tenant_id(arguments["tenant_id"])
-            limit = arguments.get("limit", 100)
-            offset = arguments.get("offset", 0)
-
-            textures = texture_repo.list_by_world(tenant_id, limit, offset)
-
-            return [TextContent(
-                type="text",
-                text=json.dumps({
-                    "success": True,
-                    "count": len(textures),
-                    "textures": [serialize_entity(t) for t in textures]
-                }, indent=2)
-            )]
-
-        # 3D Model operations
-        elif name == "create_3d_model":
-            tenant_id = parse_tenant_id(arguments["tenant_id"])
-            world_id = parse_entity_id(arguments["world_id"])
-
-            model = Model3D.create(
-                tenant_id=tenant_id,
-                world_id=world_id,
-                name=arguments["name"],
-                path=arguments["path"],
-                model_type=arguments["model_type"],
-                file_size=arguments["file_size"],
-                poly_count=arguments.get("poly_count"),
-                dimensions=arguments.get("dimensions"),
-                textures=[parse_entity_id(tid) for tid in arguments.get("textures", [])],
-                animations=arguments.get("animations", []),
-                description=arguments.get("description"),
-            )
+# ============================================================================
+# TEXTURE OPERATIONS
+# ============================================================================
 
-            model3d_repo.save(model)
-            persistence.save_3d_model(model, str(arguments["tenant_id"]))
-
-            return [TextContent(
-                type="text",
-                text=json.dumps({
-                    "success": True,
-                    "model": serialize_entity(model),
-                    "message": "3D Model created successfully"
-                }, indent=2)
-            )]
-
-        elif name == "get_3d_model":
-            tenant_id = parse_tenant_id(arguments["tenant_id"])
-            model_id = parse_entity_id(arguments["model_id"])
-
-            model = model3d_repo.get_by_id(tenant_id, model_id)
-            if not model:
-                return [TextContent(type="text", text=json.dumps({"success": False, "error": "3D Model not found"}))]
-
-            return [TextContent(
-                type="text",
-                text=json.dumps({"success": True, "model": serialize_entity(model)}, indent=2)
-            )]
-
-        elif name == "list_3d_models":
-            tenant_id = parse_tenant_id(arguments["tenant_id"])
-            limit = arguments.get("limit", 100)
-            offset = arguments.get("offset", 0)
-
-            models = model3d_repo.list_by_world(tenant_id, limit, offset)
-
-            return [TextContent(
-                type="text",
-                text=json.dumps({
-                    "success": True,
-                    "count": len(models),
-                    "models": [serialize_entity(m) for m in models]
-                }, indent=2)
-            )]
-
-        # Location operations
-        elif name == "create_location":
-            tenant_id = parse_tenant_id(arguments["tenant_id"])
-            world_id = parse_entity_id(arguments["world_id"])
-
-            location = Location.create(
-                tenant_id=tenant_id,
-                world_id=world_id,
-                name=arguments["name"],
-                description=Description(arguments["description"]),
-                location_type=LocationType[arguments["location_type"].upper()],
-                parent_location_id=parse_entity_id(arguments["parent_location_id"]) if arguments.get("parent_location_id") else None,
-            )
+@tool_registry.handler("create_texture")
+def handle_create_texture(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    tenant_id = parse_tenant_id(arguments["tenant_id"])
+    world_id = parse_entity_id(arguments["world_id"])
+
+    texture = Texture.create(
+        tenant_id=tenant_id,
+        world_id=world_id,
+        name=arguments["name"],
+        path=arguments["path"],
+        texture_type=arguments["texture_type"],
+        file_size=arguments["file_size"],
+        dimensions=arguments.get("dimensions"),
+        color_space=arguments.get("color_space", "sRGB"),
+        description=arguments.get("description"),
+    )
+
+    repositories.texture_repo.save(texture)
+    persistence.save_texture(texture, str(arguments["tenant_id"]))
+
+    return {
+        "success": True,
+        "texture": serialize_entity(texture),
+        "message": "Texture created successfully"
+    }
+
+
+@tool_registry.handler("get_texture")
+def handle_get_texture(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    tenant_id = parse_tenant_id(arguments["tenant_id"])
+    texture_id = parse_entity_id(arguments["texture_id"])
+
+    texture = repositories.texture_repo.get_by_id(tenant_id, texture_id)
+    if not texture:
+        return {"success": False, "error": "Texture not found"}
+
+    return {"success": True, "texture": serialize_entity(texture)}
+
+
+@tool_registry.handler("list_textures")
+def handle_list_textures(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    tenant_id = parse_tenant_id(arguments["tenant_id"])
+    limit = arguments.get("limit", 100)
+    offset = arguments.get("offset")
+    cursor = arguments.get("cursor")
+
+    if offset is not None:
+        textures = repositories.texture_repo.list_by_world(tenant_id, limit, offset)
+        next_cursor = None
+    else:
+        result_page = repositories.texture_repo.page_by_tenant(tenant_id, limit, cursor)
+        textures, next_cursor = result_page.items, result_page.next_cursor
+
+    return {
+        "success": True,
+        "count": len(textures),
+        "next_cursor": next_cursor,
+        "textures": [serialize_entity(t) for t in textures]
+    }
 
-            location_repo.save(location)
-            persistence.save_location(location, str(arguments["tenant_id"]))
-
-            return [TextContent(
-                type="text",
-                text=json.dumps({
-                    "success": True,
-                    "location": serialize_entity(location),
-                    "message": "Location created successfully"
-                }, indent=2)
-            )]
-
-        elif name == "get_location":
-            tenant_id = parse_tenant_id(arguments["tenant_id"])
-            location_id = parse_entity_id(arguments["location_id"])
-
-            location = location_repo.find_by_id(tenant_id, location_id)
-            if not location:
-                return [TextContent(type="text", text=json.dumps({"success": False, "error": "Location not found"}))]
-
-            return [TextContent(
-                type="text",
-                text=json.dumps({"success": True, "location": serialize_entity(location)}, indent=2)
-            )]
-
-        elif name == "list_locations":
-            tenant_id = parse_tenant_id(arguments["tenant_id"])
-            world_id = parse_entity_id(arguments["world_id"])
-            limit = arguments.get("limit", 50)
-            offset = arguments.get("offset", 0)
-
-            locations = location_repo.list_by_world(tenant_id, world_id, limit, offset)
-
-            return [TextContent(
-                type="text",
-                text=json.dumps({
-                    "success": True,
-                    "count": len(locations),
-                    "locations": [serialize_entity(l) for l in locations]
-                }, indent=2)
-            )]
-
-        elif name == "search_locations":
-            tenant_id = parse_tenant_id(arguments["tenant_id"])
-            search_term = arguments["search_term"]
-            limit = arguments.get("limit", 20)
-
-            locations = location_repo.search_by_name(tenant_id, search_term, limit)
-
-            return [TextContent(
-                type="text",
-                text=json.dumps({
-                    "success": True,
-                    "count": len(locations),
-                    "search_term": search_term,
-                    "locations": [serialize_entity(l) for l in locations]
-                }, indent=2)
-            )]
-
-        elif name == "find_locations_by_type":
-            tenant_id = parse_tenant_id(arguments["tenant_id"])
-            world_id = parse_entity_id(arguments["world_id"])
-            location_type = arguments["location_type"]
-            limit = arguments.get("limit", 50)
-
-            locations = location_repo.find_by_type(tenant_id, world_id, location_type, limit)
-
-            return [TextContent(
-                type="text",
-                text=json.dumps({
-                    "success": True,
-                    "count": len(locations),
-                    "location_type": location_type,
-                    "locations": [serialize_entity(l) for l in locations]
-                }, indent=2)
-            )]
-
-        elif name == "update_location":
-            tenant_id = parse_tenant_id(arguments["tenant_id"])
-            location_id = parse_entity_id(arguments["location_id"])
-
-            location = location_repo.find_by_id(tenant_id, location_id)
-            if not location:
-                return [TextContent(type="text", text=json.dumps({"success": False, "error": "Location not found"}))]
-
-            # Update fields
-            if "name" in arguments:
-                location.rename(arguments["name"])
-            if "description" in arguments:
-                location.update_description(Description(arguments["description"]))
-            if "location_type" in arguments:
-                # Note: changing type would require updating indexes, for now just update the field
-                object.__setattr__(location, 'location_type', LocationType[arguments["location_type"].upper()])
-                object.__setattr__(location, 'updated_at', Timestamp.now())
-                object.__setattr__(location, 'version', location.version.increment())
-
-            location_repo.save(location)
-            persistence.save_location(location, str(arguments["tenant_id"]))
-
-            return [TextContent(
-                type="text",
-                text=json.dumps({
-                    "success": True,
-                    "location": serialize_entity(location),
-                    "message": "Location updated successfully"
-                }, indent=2)
-            )]
-
-        elif name == "delete_location":
-            tenant_id = parse_tenant_id(arguments["tenant_id"])
-            location_id = parse_entity_id(arguments["location_id"])
-
-            location = location_repo.find_by_id(tenant_id, location_id)
-            if not location:
-                return [TextContent(type="text", text=json.dumps({"success": False, "error": "Location not found"}))]
-
-            deleted = location_repo.delete(tenant_id, location_id)
-            if deleted:
-                persistence.delete_location(str(arguments["tenant_id"]), str(location_id))
-
-            return [TextContent(
-                type="text",
-                text=json.dumps({
-                    "success": deleted,
-                    "message": "Location deleted successfully" if deleted else "Location not found"
-                }, indent=2)
-            )]
-
-        # Environment operations
-        elif name == "create_environment":
-            tenant_id = parse_tenant_id(arguments["tenant_id"])
-            world_id = parse_entity_id(arguments["world_id"])
-            location_id = parse_entity_id(arguments["location_id"])
-            name = arguments["name"]
-            time_of_day = TimeOfDay(arguments["time_of_day"])
-            weather = Weather(arguments["weather"])
-            lighting = Lighting(arguments["lighting"])
-            description = arguments.get("description")
-            temperature = arguments.get("temperature")
-            sounds = arguments.get("sounds")
-            smells = arguments.get("smells")
-            is_active = arguments.get("is_active", True)
-
-            # Check if world exists
-            world = world_repo.find_by_id(tenant_id, world_id)
-            if not world:
-                return [TextContent(type="text", text=json.dumps({"success": False, "error": "World not found"}))]
-
-            # Check if location exists
-            location = location_repo.find_by_id(tenant_id, location_id)
-            if not location:
-                return [TextContent(type="text", text=json.dumps({"success": False, "error": "Location not found"}))]
-
-            # Check for duplicate name for this location
-            if environment_repo.exists(tenant_id, location_id, name):
-                return [TextContent(type="text", text=json.dumps({"success": False, "error": f"Environment with name '{name}' already exists for this location"}))]
-
-            environment = Environment.create(
-                tenant_id=tenant_id,
-                world_id=world_id,
-                location_id=location_id,
-                name=name,
-                time_of_day=time_of_day,
-                weather=weather,
-                lighting=lighting,
-                description=Description(description) if description else None,
-                temperature=temperature,
-                sounds=sounds,
-                smells=smells,
-                is_active=is_active,
-            )
 
-            saved_environment = environment_repo.save(environment)
-
-            return [TextContent(
-                type="text",
-                text=json.dumps({
-                    "success": True,
-                    "environment": serialize_entity(saved_environment),
-                    "message": "Environment created successfully"
-                }, indent=2)
-            )]
-
-        elif name == "get_environment":
-            tenant_id = parse_tenant_id(arguments["tenant_id"])
-            environment_id = parse_entity_id(arguments["environment_id"])
-
-            environment = environment_repo.find_by_id(tenant_id, environment_id)
-            if not environment:
-                return [TextContent(type="text", text=json.dumps({"success": False, "error": "Environment not found"}))]
-
-            return [TextContent(
-                type="text",
-                text=json.dumps({
-                    "success": True,
-                    "environment": serialize_entity(environment)
-                }, indent=2)
-            )]
-
-        elif name == "list_environments":
-            tenant_id = parse_tenant_id(arguments["tenant_id"])
-            world_id = parse_entity_id(arguments["world_id"])
-            limit = arguments.get("limit", 50)
-            offset = arguments.get("offset", 0)
-
-            environments = environment_repo.list_by_world(tenant_id, world_id, limit, offset)
-
-            return [TextContent(
-                type="text",
-                text=json.dumps({
-                    "success": True,
-                    "count": len(environments),
-                    "environments": [serialize_entity(e) for e in environments]
-                }, indent=2)
-            )]
-
-        elif name == "list_environments_by_location":
-            tenant_id = parse_tenant_id(arguments["tenant_id"])
-            location_id = parse_entity_id(arguments["location_id"])
-            limit = arguments.get("limit", 20)
-            offset = arguments.get("offset", 0)
-
-            environments = environment_repo.list_by_location(tenant_id, location_id, limit, offset)
-
-            return [TextContent(
-                type="text",
-                text=json.dumps({
-                    "success": True,
-                    "count": len(environments),
-                    "environments": [serialize_entity(e) for e in environments]
-                }, indent=2)
-            )]
-
-        elif name == "search_environments":
-            tenant_id = parse_tenant_id(arguments["tenant_id"])
-            search_term = arguments["search_term"]
-            limit = arguments.get("limit", 20)
-
-            environments = environment_repo.search_by_name(tenant_id, search_term, limit)
-
-            return [TextContent(
-                type="text",
-                text=json.dumps({
-                    "success": True,
-                    "count": len(environments),
-                    "environments": [serialize_entity(e) for e in environments]
-                }, indent=2)
-            )]
-
-        elif name == "find_environments_by_conditions":
-            tenant_id = parse_tenant_id(arguments["tenant_id"])
-            world_id = parse_entity_id(arguments["world_id"])
-            time_of_day = TimeOfDay(arguments["time_of_day"]) if arguments.get("time_of_day") else None
-            weather = Weather(arguments["weather"]) if arguments.get("weather") else None
-            lighting = Lighting(arguments["lighting"]) if arguments.get("lighting") else None
-            limit = arguments.get("limit", 50)
-
-            environments = environment_repo.find_by_conditions(
-                tenant_id, world_id, time_of_day, weather, lighting, limit
-            )
+# ============================================================================
+# 3D MODEL OPERATIONS
+# ============================================================================
 
-            return [TextContent(
-                type="text",
-                text=json.dumps({
-                    "success": True,
-                    "count": len(environments),
-                    "environments": [serialize_entity(e) for e in environments]
-                }, indent=2)
-            )]
-
-        elif name == "get_active_environment":
-            tenant_id = parse_tenant_id(arguments["tenant_id"])
-            location_id = parse_entity_id(arguments["location_id"])
-
-            environment = environment_repo.find_active_by_location(tenant_id, location_id)
-
-            return [TextContent(
-                type="text",
-                text=json.dumps({
-                    "success": True,
-                    "environment": serialize_entity(environment) if environment else None
-                }, indent=2)
-            )]
-
-        elif name == "update_environment":
-            tenant_id = parse_tenant_id(arguments["tenant_id"])
-            environment_id = parse_entity_id(arguments["environment_id"])
-
-            environment = environment_repo.find_by_id(tenant_id, environment_id)
-            if not environment:
-                return [TextContent(type="text", text=json.dumps({"success": False, "error": "Environment not found"}))]
-
-            # Update fields if provided
-            if "name" in arguments:
-                environment.rename(arguments["name"])
-            if "description" in arguments:
-                environment.update_description(
-                    Description(arguments["description"]) if arguments["description"] else None
-                )
-            if any(k in arguments for k in ["time_of_day", "weather", "lighting", "temperature", "sounds", "smells"]):
-                environment.change_conditions(
-                    time_of_day=TimeOfDay(arguments["time_of_day"]) if arguments.get("time_of_day") else None,
-                    weather=Weather(arguments["weather"]) if arguments.get("weather") else None,
-                    lighting=Lighting(arguments["lighting"]) if arguments.get("lighting") else None,
-                    temperature=arguments.get("temperature"),
-                    sounds=arguments.get("sounds"),
-                    smells=arguments.get("smells"),
-                )
-            if "is_active" in arguments:
-                if arguments["is_active"]:
-                    environment.activate()
-                else:
-                    environment.deactivate()
-
-            saved_environment = environment_repo.save(environment)
-
-            return [TextContent(
-                type="text",
-                text=json.dumps({
-                    "success": True,
-                    "environment": serialize_entity(saved_environment),
-                    "message": "Environment updated successfully"
-                }, indent=2)
-            )]
-
-        elif name == "delete_environment":
-            tenant_id = parse_tenant_id(arguments["tenant_id"])
-            environment_id = parse_entity_id(arguments["environment_id"])
-
-            environment = environment_repo.find_by_id(tenant_id, environment_id)
-            if not environment:
-                return [TextContent(type="text", text=json.dumps({"success": False, "error": "Environment not found"}))]
-
-            deleted = environment_repo.delete(tenant_id, environment_id)
-            if deleted:
-                persistence.delete_environment(str(arguments["tenant_id"]), str(environment_id))
-
-            return [TextContent(
-                type="text",
-                text=json.dumps({
-                    "success": deleted,
-                    "message": "Environment deleted successfully" if deleted else "Environment not found"
-                }, indent=2)
-            )]
-
-        # Persistence operations
-        elif name == "save_to_json":
-            tenant_id = arguments["tenant_id"]
-
-            counts = persistence.save_all(
-                world_repo,
-                character_repo,
-                story_repo,
-                event_repo,
-                page_repo,
-                item_repo,
-                location_repo,
-                environment_repo,
-                texture_repo,
-                model3d_repo,
-                tenant_id
-            )
+@tool_registry.handler("create_3d_model")
+def handle_create_3d_model(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    tenant_id = parse_tenant_id(arguments["tenant_id"])
+    world_id = parse_entity_id(arguments["world_id"])
+
+    model = Model3D.create(
+        tenant_id=tenant_id,
+        world_id=world_id,
+        name=arguments["name"],
+        path=arguments["path"],
+        model_type=arguments["model_type"],
+        file_size=arguments["file_size"],
+        poly_count=arguments.get("poly_count"),
+        dimensions=arguments.get("dimensions"),
+        textures=[parse_entity_id(tid) for tid in arguments.get("textures", [])],
+        animations=arguments.get("animations", []),
+        description=arguments.get("description"),
+    )
+
+    repositories.model3d_repo.save(model)
+    persistence.save_3d_model(model, str(arguments["tenant_id"]))
+
+    return {
+        "success": True,
+        "model": serialize_entity(model),
+        "message": "3D Model created successfully"
+    }
+
+
+@tool_registry.handler("get_3d_model")
+def handle_get_3d_model(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    tenant_id = parse_tenant_id(arguments["tenant_id"])
+    model_id = parse_entity_id(arguments["model_id"])
+
+    model = repositories.model3d_repo.get_by_id(tenant_id, model_id)
+    if not model:
+        return {"success": False, "error": "3D Model not found"}
+
+    return {"success": True, "model": serialize_entity(model)}
+
+
+@tool_registry.handler("list_3d_models")
+def handle_list_3d_models(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    tenant_id = parse_tenant_id(arguments["tenant_id"])
+    limit = arguments.get("limit", 100)
+    offset = arguments.get("offset")
+    cursor = arguments.get("cursor")
+
+    if offset is not None:
+        models = repositories.model3d_repo.list_by_world(tenant_id, limit, offset)
+        next_cursor = None
+    else:
+        result_page = repositories.model3d_repo.page_by_tenant(tenant_id, limit, cursor)
+        models, next_cursor = result_page.items, result_page.next_cursor
+
+    return {
+        "success": True,
+        "count": len(models),
+        "next_cursor": next_cursor,
+        "models": [serialize_entity(m) for m in models]
+    }
 
-            return [TextContent(
-                type="text",
-                text=json.dumps({
-                    "success": True,
-                    "message": "Data saved to JSON files",
-                    "tenant_id": tenant_id,
-                    "counts": {
-                        "worlds": counts["worlds"],
-                        "characters": counts["characters"],
-                        "stories": counts["stories"],
-                        "events": counts["events"],
-                        "pages": counts["pages"],
-                        "items": counts["items"],
-                        "locations": counts["locations"],
-                        "environments": counts["environments"],
-                        "total_files": len(counts["files"])
-                    },
-                    "data_directory": str(persistence.data_dir.absolute()),
-                    "sample_files": counts["files"][:5] if counts["files"] else []
-                }, indent=2)
-            )]
-
-        elif name == "export_tenant":
-            tenant_id = arguments["tenant_id"]
-            filename = arguments["filename"]
-
-            # Ensure filename ends with .json
-            if not filename.endswith('.json'):
-                filename += '.json'
-
-            filepath = persistence.export_tenant(tenant_id, filename)
-
-            # Get file size
-            file_size = Path(filepath).stat().st_size
-
-            return [TextContent(
-                type="text",
-                text=json.dumps({
-                    "success": True,
-                    "message": f"Tenant data exported successfully",
-                    "tenant_id": tenant_id,
-                    "filepath": filepath,
-                    "size_bytes": file_size,
-                    "size_kb": round(file_size / 1024, 2)
-                }, indent=2)
-            )]
-
-        elif name == "list_saved_files":
-            tenant_id = arguments.get("tenant_id")
-
-            files = persistence.list_saved_files(tenant_id)
-
-            total_count = sum(len(file_list) for file_list in files.values())
-
-            return [TextContent(
-                type="text",
-                text=json.dumps({
-                    "success": True,
-                    "tenant_id": tenant_id if tenant_id else "all",
-                    "total_files": total_count,
-                    "files": files,
-                    "data_directory": str(persistence.data_dir.absolute())
-                }, indent=2)
-            )]
-
-        elif name == "get_storage_stats":
-            stats = persistence.get_storage_stats()
-
-            return [TextContent(
-                type="text",
-                text=json.dumps({
-                    "success": True,
-                    "statistics": stats
-                }, indent=2)
-            )]
 
+# ============================================================================
+# LOCATION OPERATIONS
+# ============================================================================
+
+@tool_registry.handler("create_location")
+def handle_create_location(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    tenant_id = parse_tenant_id(arguments["tenant_id"])
+    world_id = parse_entity_id(arguments["world_id"])
+
+    location = Location.create(
+        tenant_id=tenant_id,
+        world_id=world_id,
+        name=arguments["name"],
+        description=Description(arguments["description"]),
+        location_type=LocationType[arguments["location_type"].upper()],
+        parent_location_id=parse_entity_id(arguments["parent_location_id"]) if arguments.get("parent_location_id") else None,
+    )
+
+    repositories.location_repo.save(location)
+    persistence.save_location(location, str(arguments["tenant_id"]))
+
+    return {
+        "success": True,
+        "location": serialize_entity(location),
+        "message": "Location created successfully"
+    }
+
+
+@tool_registry.handler("get_location")
+def handle_get_location(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    tenant_id = parse_tenant_id(arguments["tenant_id"])
+    location_id = parse_entity_id(arguments["location_id"])
+
+    location = repositories.location_repo.find_by_id(tenant_id, location_id)
+    if not location:
+        return {"success": False, "error": "Location not found"}
+
+    return {"success": True, "location": serialize_entity(location)}
+
+
+@tool_registry.handler("list_locations")
+def handle_list_locations(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    tenant_id = parse_tenant_id(arguments["tenant_id"])
+    world_id = parse_entity_id(arguments["world_id"])
+    limit = arguments.get("limit", 50)
+    offset = arguments.get("offset")
+    cursor = arguments.get("cursor")
+
+    if offset is not None:
+        locations = repositories.location_repo.list_by_world(tenant_id, world_id, limit, offset)
+        next_cursor = None
+    else:
+        result_page = repositories.location_repo.page_by_world(tenant_id, world_id, limit, cursor)
+        locations, next_cursor = result_page.items, result_page.next_cursor
+
+    return {
+        "success": True,
+        "count": len(locations),
+        "next_cursor": next_cursor,
+        "locations": [serialize_entity(l) for l in locations]
+    }
+
+
+@tool_registry.handler("search_locations")
+def handle_search_locations(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    tenant_id = parse_tenant_id(arguments["tenant_id"])
+    search_term = arguments["search_term"]
+    limit = arguments.get("limit", 20)
+
+    columns = None if arguments.get("full_text") else ("name",)
+    hits = repositories.location_repo.search_ranked(tenant_id, search_term, limit, columns)
+
+    return {
+        "success": True,
+        "count": len(hits),
+        "search_term": search_term,
+        "locations": serialize_search_hits(hits)
+    }
+
+
+@tool_registry.handler("find_locations_by_type")
+def handle_find_locations_by_type(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    tenant_id = parse_tenant_id(arguments["tenant_id"])
+    world_id = parse_entity_id(arguments["world_id"])
+    location_type = arguments["location_type"]
+    limit = arguments.get("limit", 50)
+
+    locations = repositories.location_repo.find_by_type(tenant_id, world_id, location_type, limit)
+
+    return {
+        "success": True,
+        "count": len(locations),
+        "location_type": location_type,
+        "locations": [serialize_entity(l) for l in locations]
+    }
+
+
+@tool_registry.handler("update_location")
+def handle_update_location(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    tenant_id = parse_tenant_id(arguments["tenant_id"])
+    location_id = parse_entity_id(arguments["location_id"])
+
+    location = repositories.location_repo.find_by_id(tenant_id, location_id)
+    if not location:
+        return {"success": False, "error": "Location not found"}
+
+    # Update fields
+    if "name" in arguments:
+        location.rename(arguments["name"])
+    if "description" in arguments:
+        location.update_description(Description(arguments["description"]))
+    if "location_type" in arguments:
+        # Note: changing type would require updating indexes, for now just update the field
+        object.__setattr__(location, 'location_type', LocationType[arguments["location_type"].upper()])
+        object.__setattr__(location, 'updated_at', Timestamp.now())
+        object.__setattr__(location, 'version', location.version.increment())
+
+    repositories.location_repo.save(location)
+    persistence.save_location(location, str(arguments["tenant_id"]))
+
+    return {
+        "success": True,
+        "location": serialize_entity(location),
+        "message": "Location updated successfully"
+    }
+
+
+@tool_registry.handler("delete_location")
+def handle_delete_location(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    tenant_id = parse_tenant_id(arguments["tenant_id"])
+    location_id = parse_entity_id(arguments["location_id"])
+
+    location = repositories.location_repo.find_by_id(tenant_id, location_id)
+    if not location:
+        return {"success": False, "error": "Location not found"}
+
+    deleted = repositories.location_repo.delete(tenant_id, location_id)
+    if deleted:
+        persistence.delete_location(str(arguments["tenant_id"]), str(location_id))
+
+    return {
+        "success": deleted,
+        "message": "Location deleted successfully" if deleted else "Location not found"
+    }
+
+
+# ============================================================================
+# ENVIRONMENT OPERATIONS
+# ============================================================================
+
+@tool_registry.handler("create_environment")
+def handle_create_environment(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    tenant_id = parse_tenant_id(arguments["tenant_id"])
+    world_id = parse_entity_id(arguments["world_id"])
+    location_id = parse_entity_id(arguments["location_id"])
+    name = arguments["name"]
+    time_of_day = TimeOfDay(arguments["time_of_day"])
+    weather = Weather(arguments["weather"])
+    lighting = Lighting(arguments["lighting"])
+    description = arguments.get("description")
+    temperature = arguments.get("temperature")
+    sounds = arguments.get("sounds")
+    smells = arguments.get("smells")
+    is_active = arguments.get("is_active", True)
+
+    # Check if world exists
+    world = repositories.world_repo.find_by_id(tenant_id, world_id)
+    if not world:
+        return {"success": False, "error": "World not found"}
+
+    # Check if location exists
+    location = repositories.location_repo.find_by_id(tenant_id, location_id)
+    if not location:
+        return {"success": False, "error": "Location not found"}
+
+    # Check for duplicate name for this location
+    if repositories.environment_repo.exists(tenant_id, location_id, name):
+        return {"success": False, "error": f"Environment with name '{name}' already exists for this location"}
+
+    environment = Environment.create(
+        tenant_id=tenant_id,
+        world_id=world_id,
+        location_id=location_id,
+        name=name,
+        time_of_day=time_of_day,
+        weather=weather,
+        lighting=lighting,
+        description=Description(description) if description else None,
+        temperature=temperature,
+        sounds=sounds,
+        smells=smells,
+        is_active=is_active,
+    )
+
+    saved_environment = repositories.environment_repo.save(environment)
+
+    return {
+        "success": True,
+        "environment": serialize_entity(saved_environment),
+        "message": "Environment created successfully"
+    }
+
+
+@tool_registry.handler("get_environment")
+def handle_get_environment(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    tenant_id = parse_tenant_id(arguments["tenant_id"])
+    environment_id = parse_entity_id(arguments["environment_id"])
+
+    environment = repositories.environment_repo.find_by_id(tenant_id, environment_id)
+    if not environment:
+        return {"success": False, "error": "Environment not found"}
+
+    return {
+        "success": True,
+        "environment": serialize_entity(environment)
+    }
+
+
+@tool_registry.handler("list_environments")
+def handle_list_environments(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    tenant_id = parse_tenant_id(arguments["tenant_id"])
+    world_id = parse_entity_id(arguments["world_id"])
+    limit = arguments.get("limit", 50)
+    offset = arguments.get("offset")
+    cursor = arguments.get("cursor")
+
+    if offset is not None:
+        environments = repositories.environment_repo.list_by_world(tenant_id, world_id, limit, offset)
+        next_cursor = None
+    else:
+        result_page = repositories.environment_repo.page_by_world(tenant_id, world_id, limit, cursor)
+        environments, next_cursor = result_page.items, result_page.next_cursor
+
+    return {
+        "success": True,
+        "count": len(environments),
+        "next_cursor": next_cursor,
+        "environments": [serialize_entity(e) for e in environments]
+    }
+
+
+@tool_registry.handler("list_environments_by_location")
+def handle_list_environments_by_location(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    tenant_id = parse_tenant_id(arguments["tenant_id"])
+    location_id = parse_entity_id(arguments["location_id"])
+    limit = arguments.get("limit", 20)
+    offset = arguments.get("offset", 0)
+
+    environments = repositories.environment_repo.list_by_location(tenant_id, location_id, limit, offset)
+
+    return {
+        "success": True,
+        "count": len(environments),
+        "environments": [serialize_entity(e) for e in environments]
+    }
+
+
+@tool_registry.handler("search_environments")
+def handle_search_environments(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    tenant_id = parse_tenant_id(arguments["tenant_id"])
+    search_term = arguments["search_term"]
+    limit = arguments.get("limit", 20)
+
+    columns = None if arguments.get("full_text") else ("name",)
+    hits = repositories.environment_repo.search_ranked(tenant_id, search_term, limit, columns)
+
+    return {
+        "success": True,
+        "count": len(hits),
+        "search_term": search_term,
+        "environments": serialize_search_hits(hits)
+    }
+
+
+@tool_registry.handler("find_environments_by_conditions")
+def handle_find_environments_by_conditions(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    tenant_id = parse_tenant_id(arguments["tenant_id"])
+    world_id = parse_entity_id(arguments["world_id"])
+    time_of_day = TimeOfDay(arguments["time_of_day"]) if arguments.get("time_of_day") else None
+    weather = Weather(arguments["weather"]) if arguments.get("weather") else None
+    lighting = Lighting(arguments["lighting"]) if arguments.get("lighting") else None
+    limit = arguments.get("limit", 50)
+
+    environments = repositories.environment_repo.find_by_conditions(
+        tenant_id, world_id, time_of_day, weather, lighting, limit
+    )
+
+    return {
+        "success": True,
+        "count": len(environments),
+        "environments": [serialize_entity(e) for e in environments]
+    }
+
+
+@tool_registry.handler("get_active_environment")
+def handle_get_active_environment(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    tenant_id = parse_tenant_id(arguments["tenant_id"])
+    location_id = parse_entity_id(arguments["location_id"])
+
+    environment = repositories.environment_repo.find_active_by_location(tenant_id, location_id)
+
+    return {
+        "success": True,
+        "environment": serialize_entity(environment) if environment else None
+    }
+
+
+@tool_registry.handler("update_environment")
+def handle_update_environment(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    tenant_id = parse_tenant_id(arguments["tenant_id"])
+    environment_id = parse_entity_id(arguments["environment_id"])
+
+    environment = repositories.environment_repo.find_by_id(tenant_id, environment_id)
+    if not environment:
+        return {"success": False, "error": "Environment not found"}
+
+    # Update fields if provided
+    if "name" in arguments:
+        environment.rename(arguments["name"])
+    if "description" in arguments:
+        environment.update_description(
+            Description(arguments["description"]) if arguments["description"] else None
+        )
+    if any(k in arguments for k in ["time_of_day", "weather", "lighting", "temperature", "sounds", "smells"]):
+        environment.change_conditions(
+            time_of_day=TimeOfDay(arguments["time_of_day"]) if arguments.get("time_of_day") else None,
+            weather=Weather(arguments["weather"]) if arguments.get("weather") else None,
+            lighting=Lighting(arguments["lighting"]) if arguments.get("lighting") else None,
+            temperature=arguments.get("temperature"),
+            sounds=arguments.get("sounds"),
+            smells=arguments.get("smells"),
+        )
+    if "is_active" in arguments:
+        if arguments["is_active"]:
+            environment.activate()
         else:
-            return [TextContent(
-                type="text",
-                text=json.dumps({"success": False, "error": f"Unknown tool: {name}"})
-            )]
+            environment.deactivate()
+
+    saved_environment = repositories.environment_repo.save(environment)
 
+    return {
+        "success": True,
+        "environment": serialize_entity(saved_environment),
+        "message": "Environment updated successfully"
+    }
+
+
+@tool_registry.handler("delete_environment")
+def handle_delete_environment(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    tenant_id = parse_tenant_id(arguments["tenant_id"])
+    environment_id = parse_entity_id(arguments["environment_id"])
+
+    environment = repositories.environment_repo.find_by_id(tenant_id, environment_id)
+    if not environment:
+        return {"success": False, "error": "Environment not found"}
+
+    deleted = repositories.environment_repo.delete(tenant_id, environment_id)
+    if deleted:
+        persistence.delete_environment(str(arguments["tenant_id"]), str(environment_id))
+
+    return {
+        "success": deleted,
+        "message": "Environment deleted successfully" if deleted else "Environment not found"
+    }
+
+
+# ============================================================================
+# PERSISTENCE OPERATIONS
+# ============================================================================
+
+@tool_registry.handler("save_to_json")
+def handle_save_to_json(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    tenant_id = arguments["tenant_id"]
+
+    counts = persistence.save_all(
+        repositories.world_repo,
+        repositories.character_repo,
+        repositories.story_repo,
+        repositories.event_repo,
+        repositories.page_repo,
+        repositories.item_repo,
+        repositories.location_repo,
+        repositories.environment_repo,
+        repositories.texture_repo,
+        repositories.model3d_repo,
+        tenant_id
+    )
+
+    return {
+        "success": True,
+        "message": "Data saved to JSON files",
+        "tenant_id": tenant_id,
+        "counts": {
+            "worlds": counts["worlds"],
+            "characters": counts["characters"],
+            "stories": counts["stories"],
+            "events": counts["events"],
+            "pages": counts["pages"],
+            "items": counts["items"],
+            "locations": counts["locations"],
+            "environments": counts["environments"],
+            "total_files": len(counts["files"])
+        },
+        "data_directory": str(persistence.data_dir.absolute()),
+        "sample_files": counts["files"][:5] if counts["files"] else []
+    }
+
+
+@tool_registry.handler("export_tenant")
+def handle_export_tenant(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    tenant_id = arguments["tenant_id"]
+    filename = arguments["filename"]
+    export_format = arguments.get("format", "json")
+
+    if export_format == "snapshot":
+        if not filename.endswith('.snapshot'):
+            filename += '.snapshot'
+        filepath = str(persistence.data_dir / filename)
+        export_repositories(
+            filepath,
+            {section: repositories.get(repo_name) for section, repo_name in SNAPSHOT_SECTIONS.items()},
+            parse_tenant_id(tenant_id),
+            metadata={"exported_at": datetime.now().isoformat()},
+        )
+    else:
+        # Ensure filename ends with .json
+        if not filename.endswith('.json'):
+            filename += '.json'
+
+        filepath = persistence.export_tenant(tenant_id, filename)
+
+    # Get file size
+    file_size = Path(filepath).stat().st_size
+
+    return {
+        "success": True,
+        "message": f"Tenant data exported successfully",
+        "tenant_id": tenant_id,
+        "filepath": filepath,
+        "size_bytes": file_size,
+        "size_kb": round(file_size / 1024, 2)
+    }
+
+
+@tool_registry.handler("import_snapshot")
+def handle_import_snapshot(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    filepath = persistence.data_dir / arguments["filename"]
+    tenant_id = parse_tenant_id(arguments["tenant_id"]) if arguments.get("tenant_id") else None
+    # SQLite repositories only insert entities that have no ID yet
+    renumber = arguments.get("renumber", connection_type == "sqlite")
+
+    with Snapshot(filepath) as snapshot:
+        id_maps = import_repositories(
+            snapshot,
+            {section: repositories.get(SNAPSHOT_SECTIONS[section])
+             for section in snapshot.sections if section in SNAPSHOT_SECTIONS},
+            tenant_id=tenant_id,
+            renumber=renumber,
+        )
+
+    return {
+        "success": True,
+        "filepath": str(filepath),
+        "renumbered": renumber,
+        "counts": {section: len(id_map) for section, id_map in id_maps.items()}
+    }
+
+
+@tool_registry.handler("get_snapshot_entity")
+def handle_get_snapshot_entity(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    filepath = persistence.data_dir / arguments["filename"]
+    entity_type = arguments["entity_type"]
+    entity_id = parse_entity_id(arguments["entity_id"])
+
+    with Snapshot(filepath) as snapshot:
+        if entity_type not in snapshot.sections:
+            return {"success": False, "error": f"No {entity_type} entities in snapshot"}
+        entity = snapshot.get(entity_type, entity_id)
+
+    if entity is None:
+        return {"success": False, "error": f"{entity_type} not found"}
+
+    return {"success": True, entity_type: entity}
+
+
+@tool_registry.handler("list_saved_files")
+def handle_list_saved_files(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    tenant_id = arguments.get("tenant_id")
+
+    files = persistence.list_saved_files(tenant_id)
+
+    total_count = sum(len(file_list) for file_list in files.values())
+
+    return {
+        "success": True,
+        "tenant_id": tenant_id if tenant_id else "all",
+        "total_files": total_count,
+        "files": files,
+        "data_directory": str(persistence.data_dir.absolute())
+    }
+
+
+@tool_registry.handler("get_storage_stats")
+def handle_get_storage_stats(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    stats = persistence.get_storage_stats()
+
+    return {
+        "success": True,
+        "statistics": stats
+    }
+
+
+@tool_registry.handler("get_tool_stats")
+def handle_get_tool_stats(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "success": True,
+        "tools": tool_registry.stats(arguments.get("tools"))
+    }
+
+
+# ============================================================================
+# BATCH OPERATIONS
+# ============================================================================
+
+class BatchItemFailed(Exception):
+    """Rolls back a batch item whose handler reported a failure."""
+    pass
+
+
+def repository_transaction():
+    """
+    One transaction shared by every repository on this thread; nested calls
+    open a savepoint. In-memory repositories have no transactions, so their
+    changes are journaled and undone instead.
+    """
+    if connection_type == "sqlite":
+        return repositories.sqlite_db.transaction()
+    return repositories.undo_on_error()
+
+
+def prepare_batch(operation: str, arguments: Dict[str, Any]) -> Tuple[List[Tuple[str, str, Dict[str, Any]]], List[dict]]:
+    """
+    Resolve and validate every item of a batch call.
+
+    Returns:
+        (entity type, tool, arguments) per item, and the validation errors
+    """
+    items = arguments["items"]
+    if len(items) > MAX_BATCH_ITEMS:
+        raise ToolArgumentError(f"A batch holds at most {MAX_BATCH_ITEMS} items, got {len(items)}")
+
+    tenant_id = arguments.get("tenant_id")
+    calls, errors = [], []
+    for index, item in enumerate(items):
+        entity_type = item["entity_type"]
+        tool = f"{operation}_{entity_type}"
+        item_arguments = dict(item["arguments"])
+        if tenant_id is not None and item_arguments.get("tenant_id") is None:
+            item_arguments["tenant_id"] = tenant_id
+        try:
+            tool_registry.validate(tool, item_arguments)
+        except ToolArgumentError as e:
+            errors.append({"index": index, "entity_type": entity_type, "error": str(e)})
+        calls.append((entity_type, tool, item_arguments))
+    return calls, errors
+
+
+def run_batch_item(tool: str, item_arguments: Dict[str, Any], write: bool) -> Dict[str, Any]:
+    """Run one item; a failed write item is rolled back on its own (SQLite savepoint or in-memory undo)."""
+    try:
+        if not write:
+            return tool_registry.dispatch(tool, item_arguments, validate=False)
+        # The repository block closes first, so the files are staged only
+        # once the savepoint is released
+        with persistence.batch(), repository_transaction():
+            payload = tool_registry.dispatch(tool, item_arguments, validate=False)
+            if not payload.get("success"):
+                raise BatchItemFailed(payload)
+        return payload
+    except BatchItemFailed as e:
+        return e.args[0]
+    except Exception as e:
+        return {"success": False, "error": str(e), "type": type(e).__name__}
+
+
+def run_batch(operation: str, arguments: Dict[str, Any], write: bool = True) -> Dict[str, Any]:
+    """
+    Run a batch call: validate every item first, then run them in order.
+
+    Writes share one repository transaction and one persistence flush. The
+    flush happens after the commit; a failed commit discards the files.
+    """
+    calls, errors = prepare_batch(operation, arguments)
+    if errors:
+        return {
+            "success": False,
+            "error": f"{len(errors)} of {len(calls)} items are invalid; nothing was applied",
+            "errors": errors
+        }
+
+    results = []
+    with (persistence.batch() if write else nullcontext()), (repository_transaction() if write else nullcontext()):
+        for index, (entity_type, tool, item_arguments) in enumerate(calls):
+            payload = run_batch_item(tool, item_arguments, write)
+            results.append({"index": index, "entity_type": entity_type, **payload})
+
+    failed = sum(1 for result in results if not result.get("success"))
+    return {
+        "success": True,
+        "count": len(results),
+        "succeeded": len(results) - failed,
+        "failed": failed,
+        "results": results
+    }
+
+
+@tool_registry.handler("batch_create")
+def handle_batch_create(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    return run_batch("create", arguments)
+
+
+@tool_registry.handler("batch_update")
+def handle_batch_update(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    return run_batch("update", arguments)
+
+
+@tool_registry.handler("batch_get")
+def handle_batch_get(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    return run_batch("get", arguments, write=False)
+
+
+# ============================================================================
+# DISPATCH
+# ============================================================================
+
+def handle_tool(name: str, arguments: Any) -> list[TextContent]:
+    """Execute one tool call synchronously."""
+    try:
+        return tool_response(tool_registry.dispatch(name, arguments))
     except Exception as e:
-        return [TextContent(
-            type="text",
-            text=json.dumps({
-                "success": False,
-                "error": str(e),
-                "type": type(e).__name__
-            }, indent=2)
-        )]
+        return error_response(e)
+
+
+if connection_type == "sqlite":
+    TOOLS = [tool for tool in TOOLS if tool.name not in IN_MEMORY_ONLY_TOOLS]
+    for tool_name in IN_MEMORY_ONLY_TOOLS:
+        tool_registry.remove(tool_name)
+
+tool_registry.add_schemas(TOOLS)
 
 
 async def main():
     """Run the MCP server."""
-    async with stdio_server() as (read_stream, write_stream):
-        await app.run(
-            read_stream,
-            write_stream,
-            app.create_initialization_options()
-        )
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await app.run(
+                read_stream,
+                write_stream,
+                app.create_initialization_options()
+            )
+    finally:
+        # Let running tools finish, then write out everything still queued
+        tool_executor.shutdown()
+        persistence.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Benchmark pooled SQLite connections against connect-per-call.
+
+Replays the statement mix issued by the SQLite repositories (single-row
+INSERT, UPDATE, find_by_id, list_by_world, delete), each wrapped in its own
+``get_connection()`` block exactly like a repository method, and reports
+operations per second for both connection modes.
+
+Usage:
+    python scripts/benchmark_sqlite_connections.py [--ops 2000] [--threads 4]
+"""
+
+import argparse
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.infrastructure.sqlite_connection import SQLiteConnectionManager, SQLiteSettings
+
+
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS characters (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        tenant_id INTEGER NOT NULL,
+        world_id INTEGER NOT NULL,
+        name TEXT NOT NULL,
+        backstory TEXT,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL
+    )
+"""
+
+
+def run_workload(db: SQLiteConnectionManager, ops: int, tenant_id: int) -> None:
+    """Issue ``ops`` repository-style calls, one connection block per call."""
+    ids = []
+    for i in range(ops):
+        step = i % 5
+        if step == 0 or not ids:
+            with db.get_connection() as conn:
+                cursor = conn.execute(
+                    "INSERT INTO characters (tenant_id, world_id, name, backstory, created_at, updated_at) "
+                    "VALUES (?, ?, ?, ?, datetime('now'), datetime('now'))",
+                    (tenant_id, 1, f"Hero {i}", "A wandering hero. " * 10),
+                )
+                ids.append(cursor.lastrowid)
+        elif step == 1:
+            with db.get_connection() as conn:
+                conn.execute(
+                    "UPDATE characters SET backstory = ?, updated_at = datetime('now') WHERE id = ? AND tenant_id = ?",
+                    ("Updated backstory. " * 10, ids[-1], tenant_id),
+                )
+        elif step == 2:
+            with db.get_connection() as conn:
+                conn.execute(
+                    "SELECT * FROM characters WHERE id = ? AND tenant_id = ?",
+                    (ids[i % len(ids)], tenant_id),
+                ).fetchone()
+        elif step == 3:
+            with db.get_connection() as conn:
+                conn.execute(
+                    "SELECT * FROM characters WHERE world_id = ? AND tenant_id = ? ORDER BY id LIMIT ? OFFSET ?",
+                    (1, tenant_id, 50, 0),
+                ).fetchall()
+        else:
+            with db.get_connection() as conn:
+                conn.execute(
+                    "DELETE FROM characters WHERE id = ? AND tenant_id = ?",
+                    (ids.pop(0), tenant_id),
+                )
+
+
+def benchmark(settings: SQLiteSettings, ops: int, threads: int) -> float:
+    """Run the workload on a fresh database and return operations per second."""
+    with tempfile.TemporaryDirectory() as tmp:
+        db = SQLiteConnectionManager(str(Path(tmp) / "bench.db"), settings)
+        with db.get_connection() as conn:
+            conn.execute(SCHEMA)
+
+        workers = [
+            threading.Thread(target=run_workload, args=(db, ops, tenant_id))
+            for tenant_id in range(1, threads + 1)
+        ]
+        start = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        elapsed = time.perf_counter() - start
+
+        db.close()
+        return (ops * threads) / elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--ops", type=int, default=2000, help="Operations per thread")
+    parser.add_argument("--threads", type=int, default=4, help="Concurrent worker threads")
+    args = parser.parse_args()
+
+    pooled_settings = SQLiteSettings.load()
+    per_call_settings = pooled_settings.per_call()
+
+    print("=" * 60)
+    print("SQLITE CONNECTION BENCHMARK")
+    print("=" * 60)
+    print(f"Operations per thread: {args.ops}, threads: {args.threads}")
+    print(
+        f"Pooled settings: journal={pooled_settings.journal_mode}, "
+        f"synchronous={pooled_settings.synchronous}, "
+        f"cache={pooled_settings.cache_size_kb}KiB, mmap={pooled_settings.mmap_size_mb}MiB"
+    )
+    print()
+
+    per_call = benchmark(per_call_settings, args.ops, args.threads)
+    print(f"connect-per-call : {per_call:10.0f} ops/s")
+
+    pooled = benchmark(pooled_settings, args.ops, args.threads)
+    print(f"pooled           : {pooled:10.0f} ops/s")
+
+    print()
+    print(f"Speedup: {pooled / per_call:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
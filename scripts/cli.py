@@ -13,13 +13,17 @@ Usage:
     lore-cli export --output lore_data.json
     lore-cli import --input lore_data.json
     lore-cli stats
+    lore-cli check-indexes --db lore_system.db
 """
+from __future__ import annotations
+
 import argparse
 import json
 import sys
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import TYPE_CHECKING, Dict, List, Optional, Any
 import traceback
 
 # Color output
@@ -73,13 +77,15 @@ from src.domain.exceptions import (
     InvalidState,
 )
 
-# Repository imports
-from src.infrastructure.in_memory_repositories import (
-    InMemoryWorldRepository,
-    InMemoryCharacterRepository,
-    InMemoryEventRepository,
-    InMemoryStoryRepository,
-)
+# Repository imports are deferred to main() so commands that do not use the
+# in-memory repositories (check-indexes) do not load them
+if TYPE_CHECKING:
+    from src.infrastructure.in_memory_repositories import (
+        InMemoryWorldRepository,
+        InMemoryCharacterRepository,
+        InMemoryEventRepository,
+        InMemoryStoryRepository,
+    )
 
 
 # ============================================================================
@@ -1340,6 +1346,59 @@ class StatsCommands:
             return 1
 
 
+class IndexCommands:
+    """Commands for SQLite index diagnostics."""
+
+    def check(self, args: argparse.Namespace) -> int:
+        """Run EXPLAIN QUERY PLAN on every repository query and flag table scans."""
+        try:
+            import sqlite3
+            from src.infrastructure.sqlite_indexes import explain_queries
+
+            if not Path(args.db).exists():
+                CLIOutput.error(f"Database not found: {args.db}")
+                return 1
+
+            conn = sqlite3.connect(args.db)
+            try:
+                plans = explain_queries(conn)
+            finally:
+                conn.close()
+
+            checked = [plan for plan in plans if plan.error is None]
+            scanning = [plan for plan in checked if plan.scans]
+            skipped = [plan for plan in plans if plan.error is not None]
+
+            CLIOutput.header(f"🔍 Query Plans ({len(checked)} of {len(plans)} queries analysed)")
+            for plan in scanning:
+                CLIOutput.warning(plan.sql)
+                for detail in plan.details:
+                    print(f"    {detail}")
+
+            if skipped:
+                errors = Counter(plan.error for plan in skipped)
+                CLIOutput.error(f"{len(skipped)} queries could not be analysed against this database:")
+                for error, count in errors.most_common():
+                    print(f"    {count:4d} × {error}")
+                if args.verbose:
+                    for plan in skipped:
+                        CLIOutput.info(f"Not analysed ({plan.error}): {plan.sql}")
+
+            if scanning:
+                CLIOutput.error(f"{len(scanning)} queries still scan a table")
+            if scanning or skipped:
+                return 1
+
+            CLIOutput.success("Every repository query uses an index")
+            return 0
+
+        except Exception as e:
+            CLIOutput.error(f"Failed to check indexes: {e}")
+            if args.verbose:
+                traceback.print_exc()
+            return 1
+
+
 # ============================================================================
 # Argument Parser Setup
 # ============================================================================
@@ -1357,6 +1416,7 @@ Examples:
   %(prog)s export --output lore_data.json
   %(prog)s import --input lore_data.json
   %(prog)s stats
+  %(prog)s check-indexes --db lore_system.db
         """,
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
@@ -1498,6 +1558,11 @@ Examples:
     stats_parser = subparsers.add_parser('stats', help='Show system statistics')
     stats_parser.set_defaults(func=StatsCommands.show)
 
+    # Index check command
+    check_indexes_parser = subparsers.add_parser('check-indexes', help='Flag repository queries that scan a table')
+    check_indexes_parser.add_argument('--db', default='lore_system.db', help='SQLite database path (default: lore_system.db)')
+    check_indexes_parser.set_defaults(func=IndexCommands.check)
+
     return parser
 
 
@@ -1507,6 +1572,26 @@ Examples:
 
 def main(args: Optional[List[str]] = None) -> int:
     """Main CLI entry point."""
+    # Parse arguments
+    parser = create_parser()
+    parsed_args = parser.parse_args(args)
+
+    # If no command, show help
+    if not parsed_args.command:
+        parser.print_help()
+        return 0
+
+    # Works on a database file and needs none of the repositories below
+    if parsed_args.command == 'check-indexes':
+        return IndexCommands().check(parsed_args)
+
+    from src.infrastructure.in_memory_repositories import (
+        InMemoryWorldRepository,
+        InMemoryCharacterRepository,
+        InMemoryEventRepository,
+        InMemoryStoryRepository,
+    )
+
     # Initialize repositories
     world_repo = InMemoryWorldRepository()
     character_repo = InMemoryCharacterRepository()
@@ -1521,15 +1606,6 @@ def main(args: Optional[List[str]] = None) -> int:
     import_export_commands = ImportExportCommands(world_repo, character_repo, event_repo, story_repo)
     stats_commands = StatsCommands(world_repo, character_repo, event_repo, story_repo)
 
-    # Parse arguments
-    parser = create_parser()
-    parsed_args = parser.parse_args(args)
-
-    # If no command, show help
-    if not parsed_args.command:
-        parser.print_help()
-        return 0
-
     # Route to appropriate handler
     try:
         if parsed_args.command == 'world':
@@ -1,133 +1,105 @@
 #!/usr/bin/env python3
 """
 Parse chapter text and extract entities, relationships, and context.
-Input: chapter text (file or stdin)
+Input: one or more chapter text files (or stdin)
 Output: parsed_data.json with chapter_id and entities array
+
+Every chapter is tokenized once and matched against all known names with a
+single Aho-Corasick automaton (see src/infrastructure/chapter_extraction.py).
+Known names are read from the characters and locations tables when --db is
+given. Several chapters are parsed on a process pool (--workers); each gets
+its own output directory named after the chapter file.
+
+Usage:
+    python scripts/parse_chapter.py chapter.txt
+    python scripts/parse_chapter.py ch1.txt ch2.txt --db lore_system.db --world 1 --workers 4
 """
 
+import argparse
 import json
-import re
+import sqlite3
 import sys
 from pathlib import Path
 from datetime import datetime
 
-def extract_entities(text):
-    """
-    Extract entity mentions from chapter text.
-    This is a simplified extractor - in production, use NLP/LLM.
-    """
-    entities = []
-
-    # Extract character names (capitalized words followed by verbs or dialogue)
-    character_pattern = r'\b([A-Z][a-z]+)\b(?=\s+(?:said|asked|replied|thought|walked|ran|looked))'
-    characters = set(re.findall(character_pattern, text))
-    for char in characters:
-        entities.append({
-            'type': 'character',
-            'name': char,
-            'mentions': text.count(char)
-        })
-
-    # Extract location names (simplified)
-    location_pattern = r'(?:in|at|near|from|to)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)'
-    locations = set(re.findall(location_pattern, text))
-    for loc in locations:
-        if len(loc.split()) > 1:  # Multi-word location
-            entities.append({
-                'type': 'location',
-                'name': loc,
-                'mentions': text.count(loc)
-            })
-
-    # Extract potential quest keywords
-    quest_keywords = ['find', 'rescue', 'retrieve', 'defeat', 'explore', 'investigate']
-    for keyword in quest_keywords:
-        if keyword.lower() in text.lower():
-            entities.append({
-                'type': 'quest_keyword',
-                'keyword': keyword,
-                'context': 'potential_quest'
-            })
-
-    return entities
-
-def extract_relationships(text, entities):
-    """Extract relationships between entities based on text analysis."""
-    relationships = []
-
-    # Simplified: characters mentioned together might have relationships
-    character_entities = [e for e in entities if e['type'] == 'character']
-    for i, char1 in enumerate(character_entities):
-        for char2 in character_entities[i+1:]:
-            # If characters appear near each other in text
-            if char1['name'] in text and char2['name'] in text:
-                relationships.append({
-                    'entity_a': char1['name'],
-                    'entity_b': char2['name'],
-                    'type': 'mentioned_together',
-                    'confidence': 'low'
-                })
-
-    return relationships
-
-def generate_chapter_id():
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.infrastructure.chapter_extraction import extract_chapters, known_entities_from_sqlite
+
+def load_known_names(db_path, tenant_id, world_id):
+    """Names of every character and location of a world in the SQLite database."""
+    # Read-only, so a mistyped path fails instead of creating an empty database
+    conn = sqlite3.connect(Path(db_path).resolve().as_uri() + "?mode=ro", uri=True)
+    try:
+        return known_entities_from_sqlite(conn, tenant_id, world_id)
+    finally:
+        conn.close()
+
+def generate_chapter_id(index=0):
     """Generate a unique chapter ID."""
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    return f"chapter_{timestamp}"
-
-def main():
-    # Read chapter text from file or stdin
-    if len(sys.argv) > 1:
-        chapter_file = sys.argv[1]
-        try:
-            with open(chapter_file, 'r') as f:
-                text = f.read()
-        except FileNotFoundError:
-            print(f"ERROR: Chapter file not found: {chapter_file}")
-            sys.exit(1)
-    else:
-        text = sys.stdin.read()
+    return f"chapter_{timestamp}" if not index else f"chapter_{timestamp}_{index}"
 
-    if not text or len(text.strip()) < 50:
-        print("ERROR: Chapter text is too short or empty")
-        sys.exit(1)
+def write_outputs(output_dir, parsed_data):
+    output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Extract entities and relationships
-    entities = extract_entities(text)
-    relationships = extract_relationships(text, entities)
-
-    # Generate chapter ID
-    chapter_id = generate_chapter_id()
-
-    # Create parsed data output
-    parsed_data = {
-        'chapter_id': chapter_id,
-        'text_length': len(text),
-        'word_count': len(text.split()),
-        'entities': entities,
-        'relationships': relationships,
-        'metadata': {
-            'parser_version': '1.0',
-            'extraction_method': 'regex_patterns',
-            'timestamp': datetime.now().isoformat()
-        }
-    }
-
-    # Write output files
-    with open('parsed_data.json', 'w') as f:
+    with open(output_dir / 'parsed_data.json', 'w') as f:
         json.dump(parsed_data, f, indent=2)
 
-    with open('extracted_entities.json', 'w') as f:
-        json.dump(entities, f, indent=2)
+    with open(output_dir / 'extracted_entities.json', 'w') as f:
+        json.dump(parsed_data['entities'], f, indent=2)
+
+    with open(output_dir / 'relationships.json', 'w') as f:
+        json.dump(parsed_data['relationships'], f, indent=2)
+
+def main():
+    parser = argparse.ArgumentParser(description="Extract entities and relationships from chapters")
+    parser.add_argument('chapters', nargs='*', help="Chapter text files (default: stdin)")
+    parser.add_argument('--db', help="SQLite database to load known character/location names from")
+    parser.add_argument('--tenant', type=int, default=1)
+    parser.add_argument('--world', type=int, default=1)
+    parser.add_argument('--window', type=int, default=50, help="Co-occurrence window in tokens")
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--output-dir', default='.', help="Where to write the JSON files")
+    args = parser.parse_args()
+
+    # Read chapter text from files or stdin
+    texts = []
+    if args.chapters:
+        for chapter_file in args.chapters:
+            try:
+                with open(chapter_file, 'r') as f:
+                    texts.append(f.read())
+            except FileNotFoundError:
+                print(f"ERROR: Chapter file not found: {chapter_file}")
+                sys.exit(1)
+    else:
+        texts.append(sys.stdin.read())
+
+    for text in texts:
+        if not text or len(text.strip()) < 50:
+            print("ERROR: Chapter text is too short or empty")
+            sys.exit(1)
 
-    with open('relationships.json', 'w') as f:
-        json.dump(relationships, f, indent=2)
+    known = load_known_names(args.db, args.tenant, args.world) if args.db else {}
 
-    print(f"✓ Chapter parsed successfully")
-    print(f"  Chapter ID: {chapter_id}")
-    print(f"  Word count: {parsed_data['word_count']}")
-    print(f"  Entities extracted: {len(entities)}")
-    print(f"  Relationships found: {len(relationships)}")
+    # Extract entities and relationships
+    extractions = extract_chapters(texts, known, window=args.window, workers=args.workers)
+
+    output_root = Path(args.output_dir)
+    for index, extraction in enumerate(extractions):
+        chapter_id = generate_chapter_id(index)
+        parsed_data = extraction.to_parsed_data(chapter_id)
+
+        # A single chapter keeps the historical layout in the output dir
+        output_dir = output_root if len(extractions) == 1 else output_root / Path(args.chapters[index]).stem
+        write_outputs(output_dir, parsed_data)
+
+        print(f"✓ Chapter parsed successfully")
+        print(f"  Chapter ID: {chapter_id}")
+        print(f"  Word count: {parsed_data['word_count']}")
+        print(f"  Entities extracted: {len(parsed_data['entities'])}")
+        print(f"  Relationships found: {len(parsed_data['relationships'])}")
 
     sys.exit(0)
 
@@ -1,317 +1,346 @@
-"""Domain Entities - Objects with identity and lifecycle."""
-
-# Campaign & Story
-from .act import Act
-from .alternate_reality import AlternateReality
-from .branch_point import BranchPoint
-from .campaign import Campaign
-from .chapter import Chapter
-from .consequence import Consequence
-from .ending import Ending
-from .epilogue import Epilogue
-from .episode import Episode
-from .moral_choice import MoralChoice
-from .plot_branch import PlotBranch
-from .prologue import Prologue
-
-# Character Depth
-from .character import Character, CharacterElement, CharacterRole
-from .character_evolution import CharacterEvolution
-from .character_profile_entry import CharacterProfileEntry
-from .character_relationship import CharacterRelationship
-from .character_variant import CharacterVariant
-from .motion_capture import MotionCapture
-from .voice_actor import VoiceActor
-
-# Lore System
-from .bestiary_entry import BestiaryEntry
-from .codex_entry import CodexEntry
-from .dream import Dream
-from .journal_page import JournalPage
-from .lore_fragment import LoreFragment
-from .memory import Memory
-from .nightmare import Nightmare
-
-# Locations
-from .dungeon import Dungeon
-from .hub_area import HubArea
-from .instance import Instance
-from .location import Location
-from .open_world_zone import OpenWorldZone
-from .pocket_dimension import PocketDimension
-from .raid import Raid
-from .skybox import Skybox
-from .underground import Underground
-
-# Companions & Transport
-from .airship import Airship
-from .familiar import Familiar
-from .mount import Mount
-from .mount_equipment import MountEquipment
-from .pet import Pet
-from .portal import Portal
-from .spaceship import Spaceship
-from .teleporter import Teleporter
-from .vehicle import Vehicle
-
-# Quest Mechanics
-from .quest_chain import QuestChain
-from .quest_giver import QuestGiver
-from .quest_node import QuestNode
-from .quest_objective import QuestObjective
-from .quest_prerequisite import QuestPrerequisite
-from .quest_reward_tier import QuestRewardTier
-from .quest_tracker import QuestTracker
-
-# Skills & Development
-from .attribute import Attribute
-from .experience import Experience
-from .level_up import LevelUp
-from .mastery import Mastery
-from .perk import Perk
-from .skill import Skill
-from .talent_tree import TalentTree
-from .trait import Trait
-
-# Inventory & Crafting
-from .blueprint import Blueprint
-from .component import Component
-from .crafting_recipe import CraftingRecipe
-from .enchantment import Enchantment
-from .glyph import Glyph
-from .inventory import Inventory
-from .material import Material
-from .rune import Rune
-from .socket import Socket
-
-# History & Time
-from .alliance import Alliance
-from .calendar import Calendar
-from .constitution import Constitution
-from .empire import Empire
-from .era import Era
-from .era_transition import EraTransition
-from .government import Government
-from .holiday import Holiday
-from .kingdom import Kingdom
-from .law import Law
-from .legal_system import LegalSystem
-from .nation import Nation
-from .season import Season
-from .time_period import TimePeriod
-from .timeline import Timeline
-from .treaty import Treaty
-from .world import World
-
-# Social Systems
-from .affinity import Affinity
-from .disposition import Disposition
-from .honor import Honor
-from .karma import Karma
-from .reputation import Reputation
-from .social_class import SocialClass
-from .social_mobility import SocialMobility
-
-# Faction Depth
-from .faction_hierarchy import FactionHierarchy
-from .faction_ideology import FactionIdeology
-from .faction_leader import FactionLeader
-from .faction_resource import FactionResource
-from .faction_territory import FactionTerritory
-
-# Religion & Mysticism
-from .blessing import Blessing
-from .cult import Cult
-from .curse import Curse
-from .holy_site import HolySite
-from .oath import Oath
-from .pact import Pact
-from .ritual import Ritual
-from .scripture import Scripture
-from .sect import Sect
-from .summon import Summon
-
-# Economy
-from .barter import Barter
-from .demand import Demand
-from .inflation import Inflation
-from .price import Price
-from .supply import Supply
-from .tariff import Tariff
-from .tax import Tax
-from .trade import Trade
-
-# Military Systems
-from .army import Army
-from .battalion import Battalion
-from .defense import Defense
-from .fleet import Fleet
-from .fortification import Fortification
-from .siege_engine import SiegeEngine
-from .weapon_system import WeaponSystem
-
-# Architecture Detail
-from .district import District
-from .market_square import MarketSquare
-from .noble_district import NobleDistrict
-from .plaza import Plaza
-from .port_district import PortDistrict
-from .quarter import Quarter
-from .slums import Slums
-from .ward import Ward
-
-# Biology & Ecology
-from .evolution import Evolution
-from .extinction import Extinction
-from .food_chain import FoodChain
-from .hibernation import Hibernation
-from .migration import Migration
-from .reproduction import Reproduction
-
-# Astronomy
-from .black_hole import BlackHole
-from .eclipse import Eclipse
-from .galaxy import Galaxy
-from .moon import Moon
-from .nebula import Nebula
-from .solstice import Solstice
-from .star_system import StarSystem
-from .wormhole import Wormhole
-
-# Art & Culture
-from .celebration import Celebration
-from .ceremony import Ceremony
-from .concert import Concert
-from .competition import Competition
-from .exhibition import Exhibition
-from .festival import Festival
-from .tournament import Tournament
-from .weather_pattern import WeatherPattern
-
-# Legal System
-from .court import Court
-from .crime import Crime
-from .evidence import Evidence
-from .judge import Judge
-from .jury import Jury
-from .lawyer import Lawyer
-from .punishment import Punishment
-from .witness import Witness
-
-# Education
-from .academy import Academy
-from .archive import Archive
-from .library import Library
-from .museum import Museum
-from .research_center import ResearchCenter
-from .school import School
-from .university import University
-
-# Media
-from .internet import Internet
-from .newspaper import Newspaper
-from .propaganda import Propaganda
-from .radio import Radio
-from .social_media import SocialMedia
-from .rumor import Rumor
-from .television import Television
-
-# Secrets
-from .easter_egg import EasterEgg
-from .enigma import Enigma
-from .hidden_path import HiddenPath
-from .mystery import Mystery
-from .puzzle import Puzzle
-from .riddle import Riddle
-from .secret_area import SecretArea
-from .trap import Trap
-
-# Legendary Items
-from .artifact_set import ArtifactSet
-from .cursed_item import CursedItem
-from .divine_item import DivineItem
-from .legendary_weapon import LegendaryWeapon
-from .mythical_armor import MythicalArmor
-from .relic_collection import RelicCollection
-
-# Music & Audio
-from .ambient import Ambient
-from .motif import Motif
-from .score import Score
-from .silence import Silence
-from .sound_effect import SoundEffect
-from .soundtrack import Soundtrack
-from .theme import Theme
-from .voice_line import VoiceLine
-
-# Visual Effects
-from .color_palette import ColorPalette
-from .lighting import Lighting
-from .particle import Particle
-from .shader import Shader
-from .visual_effect import VisualEffect
-
-# Cinematography
-from .camera_path import CameraPath
-from .cinematic import Cinematic
-from .cutscene import Cutscene
-from .fade import Fade
-from .flashback import Flashback
-from .transition import Transition
-
-# Narrative Devices
-from .chekhovs_gun import ChekhovsGun
-from .deus_ex_machina import DeusExMachina
-from .flashforward import FlashForward
-from .foreshadowing import Foreshadowing
-from .plot_device import PlotDevice
-from .redherring import RedHerring
-
-# Global Events
-from .famine import Famine
-from .invasion import Invasion
-from .plague import Plague
-from .revolution import Revolution
-from .seasonal_event import SeasonalEvent
-from .war import War
-from .world_event import WorldEvent
-
-# Gameplay Mechanics
-from .autosave import Autosave
-from .checkpoint import Checkpoint
-from .fast_travel_point import FastTravelPoint
-from .save_point import SavePoint
-from .spawn_point import SpawnPoint
-from .waypoint import Waypoint
-
-# Achievements
-from .achievement import Achievement
-from .badge import Badge
-from .leaderboard import Leaderboard
-from .rank import Rank
-from .trophy import Trophy
-
-# UGC & Localization
-from .custom_map import CustomMap
-from .dubbing import Dubbing
-from .localization import Localization
-from .mod import Mod
-from .share_code import ShareCode
-from .subtitle import Subtitle
-from .translation import Translation
-from .user_scenario import UserScenario
-from .voice_over import VoiceOver
-from .workshop_entry import WorkshopEntry
-
-# Analytics & Balance
-from .balance_entities import EconomyBalance, PvPBalance, PvEBalance
-from .conversion_rate import ConversionRate
-from .difficulty_curve import DifficultyCurve
-from .drop_rate import DropRate
-from .heatmap import Heatmap
-from .loot_table_weight import LootTableWeight
-from .player_metric import PlayerMetric
-from .session_data import SessionData
+"""Domain Entities - Objects with identity and lifecycle.
+
+Entity classes are imported on first access (PEP 562 module ``__getattr__``),
+so ``from src.domain.entities import Character`` loads only ``character.py``
+instead of every entity module.
+"""
+from importlib import import_module
+from typing import Any, Dict
+
+# Entity name -> module (relative to this package) that defines it
+_ENTITY_MODULES: Dict[str, str] = {
+    # Campaign & Story
+    "Act": "act",
+    "AlternateReality": "alternate_reality",
+    "BranchPoint": "branch_point",
+    "Campaign": "campaign",
+    "Chapter": "chapter",
+    "Consequence": "consequence",
+    "Ending": "ending",
+    "Epilogue": "epilogue",
+    "Episode": "episode",
+    "MoralChoice": "moral_choice",
+    "PlotBranch": "plot_branch",
+    "Prologue": "prologue",
+
+    # Character Depth
+    "Character": "character",
+    "CharacterElement": "character",
+    "CharacterRole": "character",
+    "CharacterEvolution": "character_evolution",
+    "CharacterProfileEntry": "character_profile_entry",
+    "CharacterRelationship": "character_relationship",
+    "CharacterVariant": "character_variant",
+    "MotionCapture": "motion_capture",
+    "VoiceActor": "voice_actor",
+
+    # Lore System
+    "BestiaryEntry": "bestiary_entry",
+    "CodexEntry": "codex_entry",
+    "Dream": "dream",
+    "JournalPage": "journal_page",
+    "LoreFragment": "lore_fragment",
+    "Memory": "memory",
+    "Nightmare": "nightmare",
+
+    # Locations
+    "Dungeon": "dungeon",
+    "HubArea": "hub_area",
+    "Instance": "instance",
+    "Location": "location",
+    "OpenWorldZone": "open_world_zone",
+    "PocketDimension": "pocket_dimension",
+    "Raid": "raid",
+    "Skybox": "skybox",
+    "Underground": "underground",
+
+    # Companions & Transport
+    "Airship": "airship",
+    "Familiar": "familiar",
+    "Mount": "mount",
+    "MountEquipment": "mount_equipment",
+    "Pet": "pet",
+    "Portal": "portal",
+    "Spaceship": "spaceship",
+    "Teleporter": "teleporter",
+    "Vehicle": "vehicle",
+
+    # Quest Mechanics
+    "QuestChain": "quest_chain",
+    "QuestGiver": "quest_giver",
+    "QuestNode": "quest_node",
+    "QuestObjective": "quest_objective",
+    "QuestPrerequisite": "quest_prerequisite",
+    "QuestRewardTier": "quest_reward_tier",
+    "QuestTracker": "quest_tracker",
+
+    # Skills & Development
+    "Attribute": "attribute",
+    "Experience": "experience",
+    "LevelUp": "level_up",
+    "Mastery": "mastery",
+    "Perk": "perk",
+    "Skill": "skill",
+    "TalentTree": "talent_tree",
+    "Trait": "trait",
+
+    # Inventory & Crafting
+    "Blueprint": "blueprint",
+    "Component": "component",
+    "CraftingRecipe": "crafting_recipe",
+    "Enchantment": "enchantment",
+    "Glyph": "glyph",
+    "Inventory": "inventory",
+    "Material": "material",
+    "Rune": "rune",
+    "Socket": "socket",
+
+    # History & Time
+    "Alliance": "alliance",
+    "Calendar": "calendar",
+    "Constitution": "constitution",
+    "Empire": "empire",
+    "Era": "era",
+    "EraTransition": "era_transition",
+    "Government": "government",
+    "Holiday": "holiday",
+    "Kingdom": "kingdom",
+    "Law": "law",
+    "LegalSystem": "legal_system",
+    "Nation": "nation",
+    "Season": "season",
+    "TimePeriod": "time_period",
+    "Timeline": "timeline",
+    "Treaty": "treaty",
+    "World": "world",
+
+    # Social Systems
+    "Affinity": "affinity",
+    "Disposition": "disposition",
+    "Honor": "honor",
+    "Karma": "karma",
+    "Reputation": "reputation",
+    "SocialClass": "social_class",
+    "SocialMobility": "social_mobility",
+
+    # Faction Depth
+    "FactionHierarchy": "faction_hierarchy",
+    "FactionIdeology": "faction_ideology",
+    "FactionLeader": "faction_leader",
+    "FactionResource": "faction_resource",
+    "FactionTerritory": "faction_territory",
+
+    # Religion & Mysticism
+    "Blessing": "blessing",
+    "Cult": "cult",
+    "Curse": "curse",
+    "HolySite": "holy_site",
+    "Oath": "oath",
+    "Pact": "pact",
+    "Ritual": "ritual",
+    "Scripture": "scripture",
+    "Sect": "sect",
+    "Summon": "summon",
+
+    # Economy
+    "Barter": "barter",
+    "Demand": "demand",
+    "Inflation": "inflation",
+    "Price": "price",
+    "Supply": "supply",
+    "Tariff": "tariff",
+    "Tax": "tax",
+    "Trade": "trade",
+
+    # Military Systems
+    "Army": "army",
+    "Battalion": "battalion",
+    "Defense": "defense",
+    "Fleet": "fleet",
+    "Fortification": "fortification",
+    "SiegeEngine": "siege_engine",
+    "WeaponSystem": "weapon_system",
+
+    # Architecture Detail
+    "District": "district",
+    "MarketSquare": "market_square",
+    "NobleDistrict": "noble_district",
+    "Plaza": "plaza",
+    "PortDistrict": "port_district",
+    "Quarter": "quarter",
+    "Slums": "slums",
+    "Ward": "ward",
+
+    # Biology & Ecology
+    "Evolution": "evolution",
+    "Extinction": "extinction",
+    "FoodChain": "food_chain",
+    "Hibernation": "hibernation",
+    "Migration": "migration",
+    "Reproduction": "reproduction",
+
+    # Astronomy
+    "BlackHole": "black_hole",
+    "Eclipse": "eclipse",
+    "Galaxy": "galaxy",
+    "Moon": "moon",
+    "Nebula": "nebula",
+    "Solstice": "solstice",
+    "StarSystem": "star_system",
+    "Wormhole": "wormhole",
+
+    # Art & Culture
+    "Celebration": "celebration",
+    "Ceremony": "ceremony",
+    "Concert": "concert",
+    "Competition": "competition",
+    "Exhibition": "exhibition",
+    "Festival": "festival",
+    "Tournament": "tournament",
+    "WeatherPattern": "weather_pattern",
+
+    # Legal System
+    "Court": "court",
+    "Crime": "crime",
+    "Evidence": "evidence",
+    "Judge": "judge",
+    "Jury": "jury",
+    "Lawyer": "lawyer",
+    "Punishment": "punishment",
+    "Witness": "witness",
+
+    # Education
+    "Academy": "academy",
+    "Archive": "archive",
+    "Library": "library",
+    "Museum": "museum",
+    "ResearchCenter": "research_center",
+    "School": "school",
+    "University": "university",
+
+    # Media
+    "Internet": "internet",
+    "Newspaper": "newspaper",
+    "Propaganda": "propaganda",
+    "Radio": "radio",
+    "SocialMedia": "social_media",
+    "Rumor": "rumor",
+    "Television": "television",
+
+    # Secrets
+    "EasterEgg": "easter_egg",
+    "Enigma": "enigma",
+    "HiddenPath": "hidden_path",
+    "Mystery": "mystery",
+    "Puzzle": "puzzle",
+    "Riddle": "riddle",
+    "SecretArea": "secret_area",
+    "Trap": "trap",
+
+    # Legendary Items
+    "ArtifactSet": "artifact_set",
+    "CursedItem": "cursed_item",
+    "DivineItem": "divine_item",
+    "LegendaryWeapon": "legendary_weapon",
+    "MythicalArmor": "mythical_armor",
+    "RelicCollection": "relic_collection",
+
+    # Music & Audio
+    "Ambient": "ambient",
+    "Motif": "motif",
+    "Score": "score",
+    "Silence": "silence",
+    "SoundEffect": "sound_effect",
+    "Soundtrack": "soundtrack",
+    "Theme": "theme",
+    "VoiceLine": "voice_line",
+
+    # Visual Effects
+    "ColorPalette": "color_palette",
+    "Lighting": "lighting",
+    "Particle": "particle",
+    "Shader": "shader",
+    "VisualEffect": "visual_effect",
+
+    # Cinematography
+    "CameraPath": "camera_path",
+    "Cinematic": "cinematic",
+    "Cutscene": "cutscene",
+    "Fade": "fade",
+    "Flashback": "flashback",
+    "Transition": "transition",
+
+    # Narrative Devices
+    "ChekhovsGun": "chekhovs_gun",
+    "DeusExMachina": "deus_ex_machina",
+    "FlashForward": "flashforward",
+    "Foreshadowing": "foreshadowing",
+    "PlotDevice": "plot_device",
+    "RedHerring": "redherring",
+
+    # Global Events
+    "Famine": "famine",
+    "Invasion": "invasion",
+    "Plague": "plague",
+    "Revolution": "revolution",
+    "SeasonalEvent": "seasonal_event",
+    "War": "war",
+    "WorldEvent": "world_event",
+
+    # Gameplay Mechanics
+    "Autosave": "autosave",
+    "Checkpoint": "checkpoint",
+    "FastTravelPoint": "fast_travel_point",
+    "SavePoint": "save_point",
+    "SpawnPoint": "spawn_point",
+    "Waypoint": "waypoint",
+
+    # Achievements
+    "Achievement": "achievement",
+    "Badge": "badge",
+    "Leaderboard": "leaderboard",
+    "Rank": "rank",
+    "Trophy": "trophy",
+
+    # UGC & Localization
+    "CustomMap": "custom_map",
+    "Dubbing": "dubbing",
+    "Localization": "localization",
+    "Mod": "mod",
+    "ShareCode": "share_code",
+    "Subtitle": "subtitle",
+    "Translation": "translation",
+    "UserScenario": "user_scenario",
+    "VoiceOver": "voice_over",
+    "WorkshopEntry": "workshop_entry",
+
+    # Analytics & Balance
+    "EconomyBalance": "balance_entities",
+    "PvPBalance": "balance_entities",
+    "PvEBalance": "balance_entities",
+    "ConversionRate": "conversion_rate",
+    "DifficultyCurve": "difficulty_curve",
+    "DropRate": "drop_rate",
+    "Heatmap": "heatmap",
+    "LootTableWeight": "loot_table_weight",
+    "PlayerMetric": "player_metric",
+    "SessionData": "session_data",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _ENTITY_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_ENTITY_MODULES))
+
 
 __all__ = [
     # Campaign & Story
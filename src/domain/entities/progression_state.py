@@ -5,7 +5,7 @@ Represents the complete state of a character at a specific time point.
 All facts are time-indexed for formal verification.
 """
 from dataclasses import dataclass, field
-from typing import Dict, Optional, List
+from typing import Dict, Mapping, Optional, List
 
 from ..value_objects.common import (
     TenantId,
@@ -22,6 +22,7 @@ from ..value_objects.progression import (
     TimePoint,
 )
 from ..exceptions import InvariantViolation
+from ..persistent_map import PersistentMap
 
 
 @dataclass
@@ -90,11 +91,16 @@ class CharacterState:
             return False
         return self.experience.value >= required_xp
     
-    def with_level_up(self, new_level: CharacterLevel, new_experience: ExperiencePoints) -> 'CharacterState':
-        """Create new state after level up."""
+    def with_level_up(
+        self,
+        new_level: CharacterLevel,
+        new_experience: ExperiencePoints,
+        at: Optional[TimePoint] = None,
+    ) -> 'CharacterState':
+        """Create new state after level up (at ``at``, default the next time point)."""
         return CharacterState(
             character_id=self.character_id,
-            time_point=self.time_point.next(),
+            time_point=at or self.time_point.next(),
             level=new_level,
             character_class=self.character_class,
             experience=new_experience,
@@ -102,14 +108,19 @@ class CharacterState:
             created_at=Timestamp.now(),
         )
     
-    def with_stat_increase(self, stat_type: StatType, new_value: StatValue) -> 'CharacterState':
-        """Create new state with increased stat."""
+    def with_stat_increase(
+        self,
+        stat_type: StatType,
+        new_value: StatValue,
+        at: Optional[TimePoint] = None,
+    ) -> 'CharacterState':
+        """Create new state with increased stat (at ``at``, default the next time point)."""
         new_stats = self.stats.copy()
         new_stats[stat_type] = new_value
         
         return CharacterState(
             character_id=self.character_id,
-            time_point=self.time_point.next(),
+            time_point=at or self.time_point.next(),
             level=self.level,
             character_class=self.character_class,
             experience=self.experience,
@@ -117,8 +128,8 @@ class CharacterState:
             created_at=Timestamp.now(),
         )
     
-    def with_experience_gain(self, additional_xp: int) -> 'CharacterState':
-        """Create new state with gained experience."""
+    def with_experience_gain(self, additional_xp: int, at: Optional[TimePoint] = None) -> 'CharacterState':
+        """Create new state with gained experience (at ``at``, default the next time point)."""
         if not self.experience:
             new_experience = ExperiencePoints(additional_xp)
         else:
@@ -126,7 +137,7 @@ class CharacterState:
         
         return CharacterState(
             character_id=self.character_id,
-            time_point=self.time_point.next(),
+            time_point=at or self.time_point.next(),
             level=self.level,
             character_class=self.character_class,
             experience=new_experience,
@@ -140,24 +151,62 @@ class WorldState:
     """
     Complete world state at a time point.
     
-    Contains states for all characters in the world.
+    Contains states for all characters in the world. A character's state
+    holds from its own time point until it changes, so a state may be older
+    than the world time point but never newer.
+    
+    Character states are kept in a :class:`PersistentMap`: a state derived
+    with :meth:`with_character_state` shares everything but the changed
+    character with its predecessor, and only that character is validated.
     """
     
     world_id: EntityId
     time_point: TimePoint
-    character_states: Dict[EntityId, CharacterState]
+    character_states: Mapping[EntityId, CharacterState]
     
     created_at: Timestamp
     
     def __post_init__(self):
         """Validate world state."""
-        # All character states must be at the same time point
-        for char_id, state in self.character_states.items():
-            if state.time_point != self.time_point:
-                raise InvariantViolation(
-                    f"Character {char_id} state time {state.time_point} "
-                    f"does not match world time {self.time_point}"
-                )
+        if not isinstance(self.character_states, PersistentMap):
+            self.character_states = PersistentMap(self.character_states)
+        self.validate()
+    
+    def validate(self) -> None:
+        """Check every character state (O(characters); derived states skip this)."""
+        for state in self.character_states.values():
+            self._validate_character(state)
+    
+    def _validate_character(self, state: CharacterState) -> None:
+        # No character state may come from the future
+        if state.time_point > self.time_point:
+            raise InvariantViolation(
+                f"Character {state.character_id} state time {state.time_point} "
+                f"is after world time {self.time_point}"
+            )
+    
+    def with_character_state(
+        self,
+        state: CharacterState,
+        time_point: TimePoint,
+        created_at: Timestamp,
+    ) -> 'WorldState':
+        """
+        Derive the world state at ``time_point`` with one character's state replaced.
+        
+        O(log characters): the other character states are shared, not copied
+        or re-validated.
+        """
+        if time_point < self.time_point:
+            raise InvariantViolation(f"World time cannot go back from {self.time_point} to {time_point}")
+        
+        world_state = object.__new__(WorldState)
+        world_state.world_id = self.world_id
+        world_state.time_point = time_point
+        world_state.character_states = self.character_states.set(state.character_id, state)
+        world_state.created_at = created_at
+        world_state._validate_character(state)
+        return world_state
     
     def to_fol_facts(self) -> List[str]:
         """Convert entire world state to FOL facts."""
@@ -0,0 +1,258 @@
+"""
+Session Entity
+
+A Session is one scheduled game session in a World: a GM, the players
+taking part, and the session's lifecycle from scheduled to completed or
+cancelled.
+"""
+from dataclasses import dataclass
+from typing import Optional, List
+
+from ..value_objects.common import (
+    TenantId,
+    EntityId,
+    SessionName,
+    SessionStatus,
+    Version,
+    Timestamp,
+)
+from ..exceptions import InvariantViolation
+
+
+@dataclass
+class Session:
+    """
+    Session entity within a World.
+
+    Invariants:
+    - Must belong to exactly one World
+    - Must have at least one player
+    - Estimated duration must be positive
+    - Actual end must be after actual start
+    - Scheduled start must be in the future while the session is scheduled
+    - Version increases monotonically
+    """
+
+    id: Optional[EntityId]
+    tenant_id: TenantId
+    world_id: EntityId
+    name: SessionName
+    description: str
+    gm_id: EntityId
+    status: SessionStatus
+    scheduled_start: Timestamp
+    estimated_duration_hours: float
+    player_ids: List[EntityId]
+    created_at: Timestamp
+    updated_at: Timestamp
+    version: Version
+    actual_start: Optional[Timestamp] = None
+    actual_end: Optional[Timestamp] = None
+    actual_duration_hours: Optional[float] = None
+    notes: str = ""
+    story_id: Optional[EntityId] = None  # Story this session plays through
+
+    def __post_init__(self):
+        """Validate invariants after construction."""
+        # A stored session that is still scheduled after its start time is
+        # overdue, not invalid, so loading it must not fail
+        self._validate_invariants(check_schedule=False)
+
+    def _validate_invariants(self, check_schedule: bool = True):
+        """Check all invariants are satisfied."""
+        if self.updated_at.value < self.created_at.value:
+            raise InvariantViolation(
+                "Updated timestamp must be >= created timestamp"
+            )
+
+        if not self.player_ids:
+            raise InvariantViolation("Session must have at least one player")
+
+        if self.estimated_duration_hours <= 0:
+            raise InvariantViolation("Estimated duration must be positive")
+
+        if self.actual_start and self.actual_end and self.actual_end.value < self.actual_start.value:
+            raise InvariantViolation("Actual end must be after actual start")
+
+        if self.actual_duration_hours is not None and self.actual_duration_hours <= 0:
+            raise InvariantViolation("Actual duration must be positive")
+
+        if (
+            check_schedule
+            and self.status == SessionStatus.SCHEDULED
+            and self.scheduled_start.value <= Timestamp.now().value
+        ):
+            raise InvariantViolation(
+                "Scheduled start must be in the future for scheduled sessions"
+            )
+
+    @classmethod
+    def create(
+        cls,
+        tenant_id: TenantId,
+        world_id: EntityId,
+        name: SessionName,
+        description: str,
+        player_ids: List[EntityId],
+        gm_id: EntityId,
+        scheduled_start: Timestamp,
+        estimated_duration_hours: float,
+        story_id: Optional[EntityId] = None,
+    ) -> 'Session':
+        """
+        Factory method for creating a new scheduled Session.
+
+        Args:
+            tenant_id: Tenant this session belongs to
+            world_id: World this session is played in
+            name: Session name
+            description: What the session is about
+            player_ids: IDs of the players taking part (>= 1)
+            gm_id: ID of the game master
+            scheduled_start: When the session is planned to start (future)
+            estimated_duration_hours: Planned length (> 0)
+            story_id: Story this session plays through (optional)
+
+        Raises:
+            InvariantViolation: If there are no players, the duration is not
+                positive or the start is not in the future
+        """
+        now = Timestamp.now()
+        if scheduled_start.value <= now.value:
+            raise InvariantViolation("Scheduled start must be in the future")
+
+        return cls(
+            id=None,
+            tenant_id=tenant_id,
+            world_id=world_id,
+            name=name,
+            description=description,
+            gm_id=gm_id,
+            status=SessionStatus.SCHEDULED,
+            scheduled_start=scheduled_start,
+            estimated_duration_hours=estimated_duration_hours,
+            player_ids=player_ids.copy(),
+            created_at=now,
+            updated_at=now,
+            version=Version(1),
+            story_id=story_id,
+        )
+
+    def start_session(self) -> None:
+        """
+        Start a scheduled session now.
+
+        Raises:
+            InvariantViolation: If the session is not scheduled
+        """
+        if self.status != SessionStatus.SCHEDULED:
+            raise InvariantViolation("Can only start scheduled sessions")
+
+        object.__setattr__(self, 'status', SessionStatus.ACTIVE)
+        object.__setattr__(self, 'actual_start', Timestamp.now())
+        self._touch()
+
+    def end_session(self, notes: str = "") -> None:
+        """
+        End an active session now, recording its actual duration.
+
+        Raises:
+            InvariantViolation: If the session is not active
+        """
+        if self.status != SessionStatus.ACTIVE:
+            raise InvariantViolation("Can only end active sessions")
+
+        end = Timestamp.now()
+        duration = (end.value - self.actual_start.value).total_seconds() / 3600
+
+        object.__setattr__(self, 'status', SessionStatus.COMPLETED)
+        object.__setattr__(self, 'actual_end', end)
+        object.__setattr__(self, 'actual_duration_hours', duration)
+        object.__setattr__(self, 'notes', notes)
+        self._touch()
+
+    def cancel_session(self, reason: Optional[str] = None) -> None:
+        """
+        Cancel a scheduled session.
+
+        Raises:
+            InvariantViolation: If the session is not scheduled
+        """
+        if self.status != SessionStatus.SCHEDULED:
+            raise InvariantViolation("Can only cancel scheduled sessions")
+
+        object.__setattr__(self, 'status', SessionStatus.CANCELLED)
+        object.__setattr__(self, 'notes', f"Cancelled: {reason}" if reason else "Cancelled")
+        self._touch()
+
+    def add_player(self, player_id: EntityId) -> None:
+        """
+        Add a player to the session.
+
+        Raises:
+            InvariantViolation: If the player is already in the session
+        """
+        if player_id in self.player_ids:
+            raise InvariantViolation(f"Player already in session: {player_id}")
+
+        self.player_ids.append(player_id)
+        self._touch()
+
+    def remove_player(self, player_id: EntityId) -> None:
+        """
+        Remove a player from the session.
+
+        Raises:
+            InvariantViolation: If the player is not in the session or is
+                the last player
+        """
+        if player_id not in self.player_ids:
+            raise InvariantViolation(f"Player not in session: {player_id}")
+
+        if len(self.player_ids) == 1:
+            raise InvariantViolation("Session must have at least one player")
+
+        self.player_ids.remove(player_id)
+        self._touch()
+
+    def update_description(self, new_description: str) -> None:
+        """Update session description."""
+        if self.description == new_description:
+            return
+
+        object.__setattr__(self, 'description', new_description)
+        self._touch()
+
+    def _touch(self) -> None:
+        object.__setattr__(self, 'updated_at', Timestamp.now())
+        object.__setattr__(self, 'version', self.version.increment())
+
+    def is_scheduled(self) -> bool:
+        return self.status == SessionStatus.SCHEDULED
+
+    def is_active(self) -> bool:
+        return self.status == SessionStatus.ACTIVE
+
+    def is_completed(self) -> bool:
+        return self.status == SessionStatus.COMPLETED
+
+    def is_cancelled(self) -> bool:
+        return self.status == SessionStatus.CANCELLED
+
+    def player_count(self) -> int:
+        return len(self.player_ids)
+
+    def has_started(self) -> bool:
+        return self.actual_start is not None
+
+    def has_ended(self) -> bool:
+        return self.actual_end is not None
+
+    def __str__(self) -> str:
+        return f"Session({self.name}, {self.status.value})"
+
+    def __repr__(self) -> str:
+        return (
+            f"Session(id={self.id}, name={self.name}, "
+            f"status={self.status!s}, version={self.version})"
+        )
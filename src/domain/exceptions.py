@@ -39,3 +39,23 @@ class InvalidState(DomainException):
 class InvalidImprovement(DomainException):
     """Raised when an improvement proposal is invalid."""
     pass
+
+
+class InvalidCursor(DomainException):
+    """Raised when a pagination cursor is malformed or was not issued by us."""
+    pass
+
+
+class CircularDependency(DomainException):
+    """Raised when a dependency would make an entity (indirectly) depend on itself."""
+    pass
+
+
+class InvalidEntityOperation(DomainException):
+    """Raised when an operation refers to entities that do not exist or do not fit together."""
+    pass
+
+
+class BusinessRuleViolation(DomainException):
+    """Raised when an operation would break a business rule, e.g. deleting a referenced entity."""
+    pass
@@ -0,0 +1,235 @@
+"""
+Persistent Map
+
+An immutable mapping with structural sharing (a hash array mapped trie,
+HAMT). ``set`` and ``delete`` return a new map that shares every untouched
+branch with the original, so deriving a new version costs O(log32 n) time
+and memory instead of copying the whole dict. Old versions stay valid and
+unchanged, which makes keeping a full history of snapshots cheap.
+
+Used by :class:`~src.domain.entities.progression_state.WorldState` to hold
+character states across simulation steps.
+"""
+from typing import Any, Iterable, Iterator, Mapping, Optional, Tuple, TypeVar, Union
+
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+_BITS = 5
+_MASK = (1 << _BITS) - 1
+_HASH_BITS = 64
+_HASH_MASK = (1 << _HASH_BITS) - 1
+_MISSING = object()
+
+
+def _hash(key: Any) -> int:
+    return hash(key) & _HASH_MASK
+
+
+class _Leaf:
+    __slots__ = ("hash", "key", "value")
+
+    def __init__(self, hash_: int, key: Any, value: Any):
+        self.hash = hash_
+        self.key = key
+        self.value = value
+
+
+class _Collision:
+    """Leaves whose full hashes are equal."""
+
+    __slots__ = ("hash", "leaves")
+
+    def __init__(self, hash_: int, leaves: Tuple[_Leaf, ...]):
+        self.hash = hash_
+        self.leaves = leaves
+
+    def get(self, hash_: int, key: Any, shift: int) -> Any:
+        for leaf in self.leaves:
+            if leaf.key == key:
+                return leaf.value
+        return _MISSING
+
+    def set(self, leaf: _Leaf, shift: int) -> Tuple["_Collision", bool]:
+        for i, existing in enumerate(self.leaves):
+            if existing.key == leaf.key:
+                if existing.value is leaf.value:
+                    return self, False
+                return _Collision(self.hash, self.leaves[:i] + (leaf,) + self.leaves[i + 1:]), False
+        return _Collision(self.hash, self.leaves + (leaf,)), True
+
+    def delete(self, hash_: int, key: Any, shift: int) -> Union["_Collision", _Leaf]:
+        for i, existing in enumerate(self.leaves):
+            if existing.key == key:
+                rest = self.leaves[:i] + self.leaves[i + 1:]
+                return rest[0] if len(rest) == 1 else _Collision(self.hash, rest)
+        raise KeyError(key)
+
+    def leaves_iter(self) -> Iterator[_Leaf]:
+        return iter(self.leaves)
+
+
+class _Node:
+    """Up to 32 slots (leaves or child nodes), present slots marked in a bitmap."""
+
+    __slots__ = ("bitmap", "slots")
+
+    def __init__(self, bitmap: int, slots: Tuple[Any, ...]):
+        self.bitmap = bitmap
+        self.slots = slots
+
+    def _position(self, hash_: int, shift: int) -> Tuple[int, int]:
+        bit = 1 << ((hash_ >> shift) & _MASK)
+        return bit, (self.bitmap & (bit - 1)).bit_count()
+
+    def get(self, hash_: int, key: Any, shift: int) -> Any:
+        bit, index = self._position(hash_, shift)
+        if not self.bitmap & bit:
+            return _MISSING
+        slot = self.slots[index]
+        if isinstance(slot, _Leaf):
+            return slot.value if slot.hash == hash_ and slot.key == key else _MISSING
+        return slot.get(hash_, key, shift + _BITS)
+
+    def set(self, leaf: _Leaf, shift: int) -> Tuple["_Node", bool]:
+        """The node with ``leaf`` stored, and whether a key was added."""
+        bit, index = self._position(leaf.hash, shift)
+        slots = self.slots
+        if not self.bitmap & bit:
+            return _Node(self.bitmap | bit, slots[:index] + (leaf,) + slots[index:]), True
+
+        slot = slots[index]
+        if isinstance(slot, _Leaf):
+            if slot.hash == leaf.hash and slot.key == leaf.key:
+                if slot.value is leaf.value:
+                    return self, False
+                child, added = leaf, False
+            else:
+                child, added = _merge(slot, leaf, shift + _BITS), True
+        else:
+            child, added = slot.set(leaf, shift + _BITS)
+            if child is slot:
+                return self, False
+        return _Node(self.bitmap, slots[:index] + (child,) + slots[index + 1:]), added
+
+    def delete(self, hash_: int, key: Any, shift: int) -> Optional[Any]:
+        """The replacement for this node (a node, a single leaf, or None)."""
+        bit, index = self._position(hash_, shift)
+        if not self.bitmap & bit:
+            raise KeyError(key)
+
+        slot = self.slots[index]
+        if isinstance(slot, _Leaf):
+            if not (slot.hash == hash_ and slot.key == key):
+                raise KeyError(key)
+            child = None
+        else:
+            child = slot.delete(hash_, key, shift + _BITS)
+
+        if child is None:
+            bitmap = self.bitmap & ~bit
+            slots = self.slots[:index] + self.slots[index + 1:]
+        else:
+            bitmap = self.bitmap
+            slots = self.slots[:index] + (child,) + self.slots[index + 1:]
+
+        if not slots:
+            return None
+        if len(slots) == 1 and isinstance(slots[0], _Leaf):
+            # Let the parent inline a lone leaf
+            return slots[0]
+        return _Node(bitmap, slots)
+
+    def leaves_iter(self) -> Iterator[_Leaf]:
+        for slot in self.slots:
+            if isinstance(slot, _Leaf):
+                yield slot
+            else:
+                yield from slot.leaves_iter()
+
+
+def _merge(a: _Leaf, b: _Leaf, shift: int) -> Union[_Node, _Collision]:
+    """A subtree holding two leaves whose hashes agree below ``shift``."""
+    if shift >= _HASH_BITS:
+        return _Collision(a.hash, (a, b))
+    index_a = (a.hash >> shift) & _MASK
+    index_b = (b.hash >> shift) & _MASK
+    if index_a == index_b:
+        return _Node(1 << index_a, (_merge(a, b, shift + _BITS),))
+    slots = (a, b) if index_a < index_b else (b, a)
+    return _Node((1 << index_a) | (1 << index_b), slots)
+
+
+_EMPTY_NODE = _Node(0, ())
+
+
+class PersistentMap(Mapping[K, V]):
+    """Immutable mapping; ``set``/``delete`` return new maps sharing structure."""
+
+    __slots__ = ("_root", "_size")
+
+    def __init__(self, items: Union[Mapping[K, V], Iterable[Tuple[K, V]], None] = None):
+        self._root = _EMPTY_NODE
+        self._size = 0
+        if items:
+            pairs = items.items() if isinstance(items, Mapping) else items
+            for key, value in pairs:
+                self._root, added = self._root.set(_Leaf(_hash(key), key, value), 0)
+                self._size += added
+
+    @classmethod
+    def _make(cls, root: _Node, size: int) -> "PersistentMap[K, V]":
+        new = cls.__new__(cls)
+        new._root = root
+        new._size = size
+        return new
+
+    def __getitem__(self, key: K) -> V:
+        value = self._root.get(_hash(key), key, 0)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: K, default: Any = None) -> Any:
+        value = self._root.get(_hash(key), key, 0)
+        return default if value is _MISSING else value
+
+    def __contains__(self, key: object) -> bool:
+        return self._root.get(_hash(key), key, 0) is not _MISSING
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[K]:
+        return (leaf.key for leaf in self._root.leaves_iter())
+
+    def items(self):
+        return [(leaf.key, leaf.value) for leaf in self._root.leaves_iter()]
+
+    def values(self):
+        return [leaf.value for leaf in self._root.leaves_iter()]
+
+    def set(self, key: K, value: V) -> "PersistentMap[K, V]":
+        """A map with ``key`` bound to ``value``."""
+        root, added = self._root.set(_Leaf(_hash(key), key, value), 0)
+        if root is self._root:
+            return self
+        return self._make(root, self._size + added)
+
+    def delete(self, key: K) -> "PersistentMap[K, V]":
+        """
+        A map without ``key``.
+
+        Raises:
+            KeyError: If the key is not present
+        """
+        root = self._root.delete(_hash(key), key, 0)
+        if root is None:
+            root = _EMPTY_NODE
+        elif isinstance(root, _Leaf):
+            root = _EMPTY_NODE.set(root, 0)[0]
+        return self._make(root, self._size - 1)
+
+    def __repr__(self) -> str:
+        return f"PersistentMap({dict(self.items())!r})"
@@ -46,15 +46,51 @@ class ProgressionSimulator:
     current_state: WorldState
     event_history: List[ProgressionEvent] = field(default_factory=list)
     
+    # Every world state reached, oldest first; snapshots share unchanged characters
+    state_history: List[WorldState] = field(default_factory=list)
+    
     def __post_init__(self):
         """Initialize simulator."""
         self._validate_setup()
+        if not self.state_history:
+            self.state_history.append(self.current_state)
     
     def _validate_setup(self):
         """Validate simulator configuration."""
         if self.current_state.world_id != self.world_id:
             raise ValueError("World state does not match simulator world")
     
+    def _next_time_point(self) -> TimePoint:
+        return self.current_state.time_point.next()
+    
+    def _advance(self, event: ProgressionEvent, new_char_state: CharacterState) -> SimulationResult:
+        """Move the world one time point forward with one character changed."""
+        new_world_state = self.current_state.with_character_state(
+            new_char_state,
+            time_point=self._next_time_point(),
+            created_at=Timestamp.now(),
+        )
+        
+        # Record event
+        self.event_history.append(event)
+        self.state_history.append(new_world_state)
+        self.current_state = new_world_state
+        
+        observations = [event.get_observation_log()]
+        
+        return SimulationResult(
+            events=[event],
+            new_state=new_world_state,
+            observations=observations,
+        )
+    
+    def state_at(self, time_point: TimePoint) -> Optional[WorldState]:
+        """The world state at a past (or the current) time point."""
+        index = time_point.value - self.state_history[0].time_point.value
+        if 0 <= index < len(self.state_history):
+            return self.state_history[index]
+        return None
+    
     def simulate_level_up(self, character_id: EntityId) -> Optional[SimulationResult]:
         """
         Attempt to level up a character.
@@ -88,30 +124,9 @@ class ProgressionSimulator:
         # Reset XP after level up (common RPG mechanic)
         new_experience = ExperiencePoints(0)
         
-        new_char_state = char_state.with_level_up(new_level, new_experience)
-        
-        # Update world state
-        new_character_states = self.current_state.character_states.copy()
-        new_character_states[character_id] = new_char_state
-        
-        new_world_state = WorldState(
-            world_id=self.world_id,
-            time_point=self.current_state.time_point.next(),
-            character_states=new_character_states,
-            created_at=Timestamp.now(),
-        )
-        
-        # Record event
-        self.event_history.append(event)
-        self.current_state = new_world_state
-        
-        observations = [event.get_observation_log()]
+        new_char_state = char_state.with_level_up(new_level, new_experience, at=self._next_time_point())
         
-        return SimulationResult(
-            events=[event],
-            new_state=new_world_state,
-            observations=observations,
-        )
+        return self._advance(event, new_char_state)
     
     def simulate_experience_gain(
         self,
@@ -135,30 +150,9 @@ class ProgressionSimulator:
         )
         
         # Create new state
-        new_char_state = char_state.with_experience_gain(xp_amount)
-        
-        # Update world state
-        new_character_states = self.current_state.character_states.copy()
-        new_character_states[character_id] = new_char_state
+        new_char_state = char_state.with_experience_gain(xp_amount, at=self._next_time_point())
         
-        new_world_state = WorldState(
-            world_id=self.world_id,
-            time_point=self.current_state.time_point.next(),
-            character_states=new_character_states,
-            created_at=Timestamp.now(),
-        )
-        
-        # Record event
-        self.event_history.append(event)
-        self.current_state = new_world_state
-        
-        observations = [event.get_observation_log()]
-        
-        return SimulationResult(
-            events=[event],
-            new_state=new_world_state,
-            observations=observations,
-        )
+        return self._advance(event, new_char_state)
     
     def simulate_stat_increase(
         self,
@@ -197,30 +191,9 @@ class ProgressionSimulator:
         )
         
         # Create new state
-        new_char_state = char_state.with_stat_increase(stat_type, new_value)
+        new_char_state = char_state.with_stat_increase(stat_type, new_value, at=self._next_time_point())
         
-        # Update world state
-        new_character_states = self.current_state.character_states.copy()
-        new_character_states[character_id] = new_char_state
-        
-        new_world_state = WorldState(
-            world_id=self.world_id,
-            time_point=self.current_state.time_point.next(),
-            character_states=new_character_states,
-            created_at=Timestamp.now(),
-        )
-        
-        # Record event
-        self.event_history.append(event)
-        self.current_state = new_world_state
-        
-        observations = [event.get_observation_log()]
-        
-        return SimulationResult(
-            events=[event],
-            new_state=new_world_state,
-            observations=observations,
-        )
+        return self._advance(event, new_char_state)
     
     def export_to_fol(self, output_dir: Path) -> Dict[str, Path]:
         """
@@ -8,23 +8,50 @@ Key principles:
 - Repositories work with aggregates, not individual entities
 - Methods express domain operations, not database operations
 - No infrastructure concerns (SQL, ES) leak into interfaces
+
+Interfaces are imported on first access (PEP 562 module ``__getattr__``),
+so importing one port module (e.g. ``src.domain.repositories.bulk``) does
+not load every repository interface and the entities they reference.
 """
+from importlib import import_module
+from typing import Any, Dict
+
+# Interface name -> module (relative to this package) that defines it
+_INTERFACE_MODULES: Dict[str, str] = {
+    "ICharacterRepository": "character_repository",
+    "IChoiceRepository": "choice_repository",
+    "IFlowchartRepository": "flowchart_repository",
+    "IHandoutRepository": "handout_repository",
+    "IImageRepository": "image_repository",
+    "IInspirationRepository": "inspiration_repository",
+    "IMapRepository": "map_repository",
+    "INoteRepository": "note_repository",
+    "IPageRepository": "page_repository",
+    "CursorPage": "pagination",
+    "SearchHit": "search",
+    "ISessionRepository": "session_repository",
+    "IStoryRepository": "story_repository",
+    "ITagRepository": "tag_repository",
+    "ITemplateRepository": "template_repository",
+    "ITokenboardRepository": "tokenboard_repository",
+    "IUnitOfWork": "unit_of_work",
+    "IWorldRepository": "world_repository",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _INTERFACE_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_INTERFACE_MODULES))
 
-from .character_repository import ICharacterRepository
-from .choice_repository import IChoiceRepository
-from .flowchart_repository import IFlowchartRepository
-from .handout_repository import IHandoutRepository
-from .image_repository import IImageRepository
-from .inspiration_repository import IInspirationRepository
-from .map_repository import IMapRepository
-from .note_repository import INoteRepository
-from .page_repository import IPageRepository
-from .session_repository import ISessionRepository
-from .story_repository import IStoryRepository
-from .tag_repository import ITagRepository
-from .template_repository import ITemplateRepository
-from .tokenboard_repository import ITokenboardRepository
-from .world_repository import IWorldRepository
 
 __all__ = [
     "ICharacterRepository",
@@ -36,10 +63,13 @@ __all__ = [
     "IMapRepository",
     "INoteRepository",
     "IPageRepository",
+    "CursorPage",
+    "SearchHit",
     "ISessionRepository",
     "IStoryRepository",
     "ITagRepository",
     "ITemplateRepository",
     "ITokenboardRepository",
+    "IUnitOfWork",
     "IWorldRepository",
 ]
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.academy import Academy
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IAcademyRepository(ABC):
+class IAcademyRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Academy entity.
     
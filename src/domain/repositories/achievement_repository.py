@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.achievement import Achievement
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IAchievementRepository(ABC):
+class IAchievementRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Achievement entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.act import Act
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IActRepository(ABC):
+class IActRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Act entity.
     
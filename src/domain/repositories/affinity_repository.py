@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.affinity import Affinity
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IAffinityRepository(ABC):
+class IAffinityRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Affinity entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.airship import Airship
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IAirshipRepository(ABC):
+class IAirshipRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Airship entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.alliance import Alliance
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IAllianceRepository(ABC):
+class IAllianceRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Alliance entity.
     
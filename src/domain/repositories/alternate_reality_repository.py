@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.alternate_reality import AlternateReality
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IAlternateRealityRepository(ABC):
+class IAlternateRealityRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for AlternateReality entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.ambient import Ambient
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IAmbientRepository(ABC):
+class IAmbientRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Ambient entity.
     
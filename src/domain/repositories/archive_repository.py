@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.archive import Archive
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IArchiveRepository(ABC):
+class IArchiveRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Archive entity.
     
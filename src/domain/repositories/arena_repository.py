@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.arena import Arena
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IArenaRepository(ABC):
+class IArenaRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Arena entity.
     
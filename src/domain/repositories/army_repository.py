@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.army import Army
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IArmyRepository(ABC):
+class IArmyRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Army entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.artifact_set import ArtifactSet
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IArtifactSetRepository(ABC):
+class IArtifactSetRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for ArtifactSet entity.
     
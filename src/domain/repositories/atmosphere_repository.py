@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.atmosphere import Atmosphere
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IAtmosphereRepository(ABC):
+class IAtmosphereRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Atmosphere entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.attribute import Attribute
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IAttributeRepository(ABC):
+class IAttributeRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Attribute entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.autosave import Autosave
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IAutosaveRepository(ABC):
+class IAutosaveRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Autosave entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.badge import Badge
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IBadgeRepository(ABC):
+class IBadgeRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Badge entity.
     
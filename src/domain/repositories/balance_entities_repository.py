@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.balance_entities import BalanceEntities
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IBalanceEntitiesRepository(ABC):
+class IBalanceEntitiesRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for BalanceEntities entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.banner import Banner
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IBannerRepository(ABC):
+class IBannerRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Banner entity.
     
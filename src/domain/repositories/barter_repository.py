@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.barter import Barter
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IBarterRepository(ABC):
+class IBarterRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Barter entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.battalion import Battalion
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IBattalionRepository(ABC):
+class IBattalionRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Battalion entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.bestiary_entry import BestiaryEntry
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IBestiaryEntryRepository(ABC):
+class IBestiaryEntryRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for BestiaryEntry entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.black_hole import BlackHole
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IBlackHoleRepository(ABC):
+class IBlackHoleRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for BlackHole entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.blessing import Blessing
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IBlessingRepository(ABC):
+class IBlessingRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Blessing entity.
     
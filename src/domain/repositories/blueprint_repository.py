@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.blueprint import Blueprint
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IBlueprintRepository(ABC):
+class IBlueprintRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Blueprint entity.
     
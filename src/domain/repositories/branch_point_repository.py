@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.branch_point import Branch_point
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IBranch_pointRepository(ABC):
+class IBranch_pointRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Branch_point entity.
     
@@ -0,0 +1,71 @@
+"""
+Bulk Repository Operations
+
+Batched counterparts of ``save``/``find_by_id``/``delete`` shared by every
+repository interface. The defaults here are correct for any repository
+because they are expressed in terms of the single-entity methods; concrete
+implementations override them with real batched storage access.
+
+Keyset pagination (``page_by_world`` / ``page_by_tenant``) comes along via
+:class:`CursorPaginationMixin`, so every interface has it as well.
+"""
+from typing import Iterable, List, Sequence, TypeVar
+
+from ..value_objects.common import TenantId, EntityId
+from .pagination import CursorPaginationMixin
+
+
+T = TypeVar("T")
+
+
+class BulkOperationsMixin(CursorPaginationMixin):
+    """
+    Default batched operations for repository interfaces.
+
+    Relies only on the abstract ``save``, ``find_by_id`` and ``delete``
+    methods every repository already provides.
+    """
+
+    def save_many(self, entities: Iterable[T]) -> List[T]:
+        """
+        Save several entities (insert or update).
+
+        Args:
+            entities: Entities to save, in order
+
+        Returns:
+            Saved entities with IDs populated, in the same order
+        """
+        return [self.save(entity) for entity in entities]
+
+    def find_many(
+        self,
+        tenant_id: TenantId,
+        entity_ids: Sequence[EntityId],
+    ) -> List[T]:
+        """
+        Find several entities by ID.
+
+        Returns:
+            Found entities in the order of ``entity_ids``; missing IDs are skipped
+        """
+        results = []
+        for entity_id in entity_ids:
+            entity = self.find_by_id(tenant_id, entity_id)
+            if entity is not None:
+                results.append(entity)
+        return results
+
+    def delete_many(
+        self,
+        tenant_id: TenantId,
+        entity_ids: Sequence[EntityId],
+    ) -> int:
+        """
+        Delete several entities.
+
+        Returns:
+            Number of entities actually deleted
+        """
+        return sum(1 for entity_id in entity_ids if self.delete(tenant_id, entity_id))
+
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.calendar import Calendar
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ICalendarRepository(ABC):
+class ICalendarRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Calendar entity.
     
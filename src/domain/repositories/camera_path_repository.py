@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.camera_path import CameraPath
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ICameraPathRepository(ABC):
+class ICameraPathRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for CameraPath entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.campaign import Campaign
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ICampaignRepository(ABC):
+class ICampaignRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Campaign entity.
     
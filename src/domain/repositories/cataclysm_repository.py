@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.cataclysm import Cataclysm
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ICataclysmRepository(ABC):
+class ICataclysmRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Cataclysm entity.
     
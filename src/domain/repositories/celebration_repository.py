@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.celebration import Celebration
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ICelebrationRepository(ABC):
+class ICelebrationRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Celebration entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.ceremony import Ceremony
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ICeremonyRepository(ABC):
+class ICeremonyRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Ceremony entity.
     
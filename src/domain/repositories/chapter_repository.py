@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.chapter import Chapter
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IChapterRepository(ABC):
+class IChapterRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Chapter entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.character_evolution import CharacterEvolution
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ICharacterEvolutionRepository(ABC):
+class ICharacterEvolutionRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for CharacterEvolution entity.
     
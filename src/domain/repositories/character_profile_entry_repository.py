@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.character_profile_entry import CharacterProfileEntry
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ICharacterProfileEntryRepository(ABC):
+class ICharacterProfileEntryRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for CharacterProfileEntry entity.
     
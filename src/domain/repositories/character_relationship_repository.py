@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.character_relationship import Character_relationship
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ICharacter_relationshipRepository(ABC):
+class ICharacter_relationshipRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Character_relationship entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.character import Character
 from ..value_objects.common import TenantId, EntityId, CharacterName
+from .bulk import BulkOperationsMixin
 
 
-class ICharacterRepository(ABC):
+class ICharacterRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Character entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.character_variant import CharacterVariant
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ICharacterVariantRepository(ABC):
+class ICharacterVariantRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for CharacterVariant entity.
     
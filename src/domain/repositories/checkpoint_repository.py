@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.checkpoint import Checkpoint
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ICheckpointRepository(ABC):
+class ICheckpointRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Checkpoint entity.
     
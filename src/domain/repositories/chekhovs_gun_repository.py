@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.chekhovs_gun import ChekhovsGun
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IChekhovsGunRepository(ABC):
+class IChekhovsGunRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for ChekhovsGun entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.choice import Choice
 from ..value_objects.common import TenantId, EntityId, ChoiceType
+from .bulk import BulkOperationsMixin
 
 
-class IChoiceRepository(ABC):
+class IChoiceRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Choice entity.
     
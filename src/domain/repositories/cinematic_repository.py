@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.cinematic import Cinematic
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ICinematicRepository(ABC):
+class ICinematicRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Cinematic entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.codex_entry import CodexEntry
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ICodexEntryRepository(ABC):
+class ICodexEntryRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for CodexEntry entity.
     
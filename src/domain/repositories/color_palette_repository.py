@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.color_palette import ColorPalette
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IColorPaletteRepository(ABC):
+class IColorPaletteRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for ColorPalette entity.
     
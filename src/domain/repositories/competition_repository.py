@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.competition import Competition
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ICompetitionRepository(ABC):
+class ICompetitionRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Competition entity.
     
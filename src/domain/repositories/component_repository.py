@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.component import Component
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IComponentRepository(ABC):
+class IComponentRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Component entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.concert import Concert
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IConcertRepository(ABC):
+class IConcertRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Concert entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.consequence import Consequence
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IConsequenceRepository(ABC):
+class IConsequenceRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Consequence entity.
     
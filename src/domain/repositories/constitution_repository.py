@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.constitution import Constitution
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IConstitutionRepository(ABC):
+class IConstitutionRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Constitution entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.conversion_rate import ConversionRate
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IConversionRateRepository(ABC):
+class IConversionRateRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for ConversionRate entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.court import Court
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ICourtRepository(ABC):
+class ICourtRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Court entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.crafting_recipe import CraftingRecipe
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ICraftingRecipeRepository(ABC):
+class ICraftingRecipeRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for CraftingRecipe entity.
     
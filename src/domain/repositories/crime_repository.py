@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.crime import Crime
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ICrimeRepository(ABC):
+class ICrimeRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Crime entity.
     
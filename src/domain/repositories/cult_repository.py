@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.cult import Cult
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ICultRepository(ABC):
+class ICultRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Cult entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.currency import Currency
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ICurrencyRepository(ABC):
+class ICurrencyRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Currency entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.curse import Curse
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ICurseRepository(ABC):
+class ICurseRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Curse entity.
     
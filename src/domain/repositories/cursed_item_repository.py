@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.cursed_item import CursedItem
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ICursedItemRepository(ABC):
+class ICursedItemRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for CursedItem entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.custom_map import CustomMap
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ICustomMapRepository(ABC):
+class ICustomMapRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for CustomMap entity.
     
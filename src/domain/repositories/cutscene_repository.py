@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.cutscene import Cutscene
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ICutsceneRepository(ABC):
+class ICutsceneRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Cutscene entity.
     
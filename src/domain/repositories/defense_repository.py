@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.defense import Defense
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IDefenseRepository(ABC):
+class IDefenseRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Defense entity.
     
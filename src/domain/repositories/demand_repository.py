@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.demand import Demand
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IDemandRepository(ABC):
+class IDemandRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Demand entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.deus_ex_machina import DeusExMachina
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IDeusExMachinaRepository(ABC):
+class IDeusExMachinaRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for DeusExMachina entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.difficulty_curve import DifficultyCurve
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IDifficultyCurveRepository(ABC):
+class IDifficultyCurveRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for DifficultyCurve entity.
     
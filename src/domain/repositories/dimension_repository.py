@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.dimension import Dimension
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IDimensionRepository(ABC):
+class IDimensionRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Dimension entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.disaster import Disaster
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IDisasterRepository(ABC):
+class IDisasterRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Disaster entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.discovery import Discovery
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IDiscoveryRepository(ABC):
+class IDiscoveryRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Discovery entity.
     
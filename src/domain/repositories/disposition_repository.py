@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.disposition import Disposition
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IDispositionRepository(ABC):
+class IDispositionRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Disposition entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.district import District
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IDistrictRepository(ABC):
+class IDistrictRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for District entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.divine_item import DivineItem
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IDivineItemRepository(ABC):
+class IDivineItemRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for DivineItem entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.dream import Dream
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IDreamRepository(ABC):
+class IDreamRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Dream entity.
     
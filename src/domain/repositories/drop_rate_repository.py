@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.drop_rate import DropRate
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IDropRateRepository(ABC):
+class IDropRateRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for DropRate entity.
     
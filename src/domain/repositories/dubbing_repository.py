@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.dubbing import Dubbing
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IDubbingRepository(ABC):
+class IDubbingRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Dubbing entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.dungeon import Dungeon
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IDungeonRepository(ABC):
+class IDungeonRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Dungeon entity.
     
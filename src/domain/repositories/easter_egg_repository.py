@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.easter_egg import EasterEgg
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IEasterEggRepository(ABC):
+class IEasterEggRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for EasterEgg entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.eclipse import Eclipse
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IEclipseRepository(ABC):
+class IEclipseRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Eclipse entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.empire import Empire
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IEmpireRepository(ABC):
+class IEmpireRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Empire entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.enchantment import Enchantment
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IEnchantmentRepository(ABC):
+class IEnchantmentRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Enchantment entity.
     
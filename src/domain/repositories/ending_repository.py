@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.ending import Ending
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IEndingRepository(ABC):
+class IEndingRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Ending entity.
     
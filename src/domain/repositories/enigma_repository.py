@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.enigma import Enigma
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IEnigmaRepository(ABC):
+class IEnigmaRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Enigma entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.environment import Environment
 from ..value_objects.common import TenantId, EntityId, TimeOfDay, Weather, Lighting
+from .bulk import BulkOperationsMixin
 
 
-class IEnvironmentRepository(ABC):
+class IEnvironmentRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Environment entity.
 
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.epilogue import Epilogue
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IEpilogueRepository(ABC):
+class IEpilogueRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Epilogue entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.episode import Episode
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IEpisodeRepository(ABC):
+class IEpisodeRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Episode entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.era import Era
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IEraRepository(ABC):
+class IEraRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Era entity.
     
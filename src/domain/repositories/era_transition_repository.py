@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.era_transition import EraTransition
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IEraTransitionRepository(ABC):
+class IEraTransitionRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for EraTransition entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.event_chain import Event_chain
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IEvent_chainRepository(ABC):
+class IEvent_chainRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Event_chain entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.event import Event
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IEventRepository(ABC):
+class IEventRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Event entity.
     
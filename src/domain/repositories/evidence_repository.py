@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.evidence import Evidence
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IEvidenceRepository(ABC):
+class IEvidenceRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Evidence entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.evolution import Evolution
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IEvolutionRepository(ABC):
+class IEvolutionRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Evolution entity.
     
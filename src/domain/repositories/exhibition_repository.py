@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.exhibition import Exhibition
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IExhibitionRepository(ABC):
+class IExhibitionRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Exhibition entity.
     
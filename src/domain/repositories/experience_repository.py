@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.experience import Experience
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IExperienceRepository(ABC):
+class IExperienceRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Experience entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.extinction import Extinction
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IExtinctionRepository(ABC):
+class IExtinctionRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Extinction entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.faction_hierarchy import FactionHierarchy
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IFactionHierarchyRepository(ABC):
+class IFactionHierarchyRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for FactionHierarchy entity.
     
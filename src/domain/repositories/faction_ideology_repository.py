@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.faction_ideology import FactionIdeology
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IFactionIdeologyRepository(ABC):
+class IFactionIdeologyRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for FactionIdeology entity.
     
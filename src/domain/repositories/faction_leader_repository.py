@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.faction_leader import FactionLeader
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IFactionLeaderRepository(ABC):
+class IFactionLeaderRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for FactionLeader entity.
     
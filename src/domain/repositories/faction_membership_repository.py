@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.faction_membership import FactionMembership
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IFactionMembershipRepository(ABC):
+class IFactionMembershipRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for FactionMembership entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.faction import Faction
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IFactionRepository(ABC):
+class IFactionRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Faction entity.
     
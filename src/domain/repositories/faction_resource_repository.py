@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.faction_resource import FactionResource
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IFactionResourceRepository(ABC):
+class IFactionResourceRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for FactionResource entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.faction_territory import FactionTerritory
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IFactionTerritoryRepository(ABC):
+class IFactionTerritoryRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for FactionTerritory entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.fade import Fade
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IFadeRepository(ABC):
+class IFadeRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Fade entity.
     
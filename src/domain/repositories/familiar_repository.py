@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.familiar import Familiar
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IFamiliarRepository(ABC):
+class IFamiliarRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Familiar entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.famine import Famine
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IFamineRepository(ABC):
+class IFamineRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Famine entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.fast_travel_point import FastTravelPoint
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IFastTravelPointRepository(ABC):
+class IFastTravelPointRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for FastTravelPoint entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.festival import Festival
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IFestivalRepository(ABC):
+class IFestivalRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Festival entity.
     
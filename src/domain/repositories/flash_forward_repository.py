@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.flash_forward import FlashForward
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IFlashForwardRepository(ABC):
+class IFlashForwardRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for FlashForward entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.flashback import Flashback
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IFlashbackRepository(ABC):
+class IFlashbackRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Flashback entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.fleet import Fleet
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IFleetRepository(ABC):
+class IFleetRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Fleet entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.flowchart import Flowchart
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IFlowchartRepository(ABC):
+class IFlowchartRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Flowchart entity.
     
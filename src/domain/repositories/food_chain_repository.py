@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.food_chain import FoodChain
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IFoodChainRepository(ABC):
+class IFoodChainRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for FoodChain entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.foreshadowing import Foreshadowing
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IForeshadowingRepository(ABC):
+class IForeshadowingRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Foreshadowing entity.
     
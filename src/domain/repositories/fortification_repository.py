@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.fortification import Fortification
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IFortificationRepository(ABC):
+class IFortificationRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Fortification entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.galaxy import Galaxy
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IGalaxyRepository(ABC):
+class IGalaxyRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Galaxy entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.glyph import Glyph
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IGlyphRepository(ABC):
+class IGlyphRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Glyph entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.government import Government
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IGovernmentRepository(ABC):
+class IGovernmentRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Government entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.handout import Handout
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IHandoutRepository(ABC):
+class IHandoutRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Handout entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.heatmap import Heatmap
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IHeatmapRepository(ABC):
+class IHeatmapRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Heatmap entity.
     
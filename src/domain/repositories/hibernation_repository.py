@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.hibernation import Hibernation
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IHibernationRepository(ABC):
+class IHibernationRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Hibernation entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.hidden_path import HiddenPath
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IHiddenPathRepository(ABC):
+class IHiddenPathRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for HiddenPath entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.holiday import Holiday
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IHolidayRepository(ABC):
+class IHolidayRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Holiday entity.
     
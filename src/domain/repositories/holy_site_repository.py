@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.holy_site import HolySite
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IHolySiteRepository(ABC):
+class IHolySiteRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for HolySite entity.
     
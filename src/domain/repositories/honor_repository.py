@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.honor import Honor
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IHonorRepository(ABC):
+class IHonorRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Honor entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.hub_area import HubArea
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IHubAreaRepository(ABC):
+class IHubAreaRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for HubArea entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.image import Image
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IImageRepository(ABC):
+class IImageRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Image entity.
     
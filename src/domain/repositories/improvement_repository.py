@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.improvement import Improvement
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IImprovementRepository(ABC):
+class IImprovementRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Improvement entity.
     
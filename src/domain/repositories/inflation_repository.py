@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.inflation import Inflation
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IInflationRepository(ABC):
+class IInflationRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Inflation entity.
     
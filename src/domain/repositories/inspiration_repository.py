@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.inspiration import Inspiration
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IInspirationRepository(ABC):
+class IInspirationRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Inspiration entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.instance import Instance
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IInstanceRepository(ABC):
+class IInstanceRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Instance entity.
     
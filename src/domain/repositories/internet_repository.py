@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.internet import Internet
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IInternetRepository(ABC):
+class IInternetRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Internet entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.invasion import Invasion
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IInvasionRepository(ABC):
+class IInvasionRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Invasion entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.invention import Invention
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IInventionRepository(ABC):
+class IInventionRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Invention entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.inventory import Inventory
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IInventoryRepository(ABC):
+class IInventoryRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Inventory entity.
     
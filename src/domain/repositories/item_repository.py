@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.item import Item
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IItemRepository(ABC):
+class IItemRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Item entity.
 
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.journal_page import JournalPage
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IJournalPageRepository(ABC):
+class IJournalPageRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for JournalPage entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.judge import Judge
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IJudgeRepository(ABC):
+class IJudgeRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Judge entity.
     
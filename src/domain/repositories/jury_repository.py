@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.jury import Jury
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IJuryRepository(ABC):
+class IJuryRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Jury entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.karma import Karma
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IKarmaRepository(ABC):
+class IKarmaRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Karma entity.
     
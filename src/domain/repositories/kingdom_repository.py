@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.kingdom import Kingdom
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IKingdomRepository(ABC):
+class IKingdomRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Kingdom entity.
     
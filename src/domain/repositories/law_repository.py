@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.law import Law
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ILawRepository(ABC):
+class ILawRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Law entity.
     
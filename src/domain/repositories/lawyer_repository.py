@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.lawyer import Lawyer
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ILawyerRepository(ABC):
+class ILawyerRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Lawyer entity.
     
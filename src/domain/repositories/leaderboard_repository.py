@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.leaderboard import Leaderboard
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ILeaderboardRepository(ABC):
+class ILeaderboardRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Leaderboard entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.legal_system import LegalSystem
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ILegalSystemRepository(ABC):
+class ILegalSystemRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for LegalSystem entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.legendary_weapon import LegendaryWeapon
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ILegendaryWeaponRepository(ABC):
+class ILegendaryWeaponRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for LegendaryWeapon entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.level_up import LevelUp
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ILevelUpRepository(ABC):
+class ILevelUpRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for LevelUp entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.library import Library
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ILibraryRepository(ABC):
+class ILibraryRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Library entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.lighting import Lighting
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ILightingRepository(ABC):
+class ILightingRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Lighting entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.localization import Localization
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ILocalizationRepository(ABC):
+class ILocalizationRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Localization entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.location import Location
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ILocationRepository(ABC):
+class ILocationRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Location entity.
 
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.loot_table_weight import LootTableWeight
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ILootTableWeightRepository(ABC):
+class ILootTableWeightRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for LootTableWeight entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.lore_axioms import Lore_axioms
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ILore_axiomsRepository(ABC):
+class ILore_axiomsRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Lore_axioms entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.lore_fragment import LoreFragment
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ILoreFragmentRepository(ABC):
+class ILoreFragmentRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for LoreFragment entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.map import Map
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IMapRepository(ABC):
+class IMapRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Map entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.market_square import MarketSquare
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IMarketSquareRepository(ABC):
+class IMarketSquareRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for MarketSquare entity.
     
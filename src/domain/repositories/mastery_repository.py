@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.mastery import Mastery
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IMasteryRepository(ABC):
+class IMasteryRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Mastery entity.
     
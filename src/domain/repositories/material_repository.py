@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.material import Material
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IMaterialRepository(ABC):
+class IMaterialRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Material entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.memory import Memory
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IMemoryRepository(ABC):
+class IMemoryRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Memory entity.
     
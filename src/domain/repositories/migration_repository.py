@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.migration import Migration
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IMigrationRepository(ABC):
+class IMigrationRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Migration entity.
     
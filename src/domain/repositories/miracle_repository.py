@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.miracle import Miracle
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IMiracleRepository(ABC):
+class IMiracleRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Miracle entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.mod import Mod
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IModRepository(ABC):
+class IModRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Mod entity.
     
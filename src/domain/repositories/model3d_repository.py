@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.model3d import Model3d
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IModel3dRepository(ABC):
+class IModel3dRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Model3d entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.moon import Moon
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IMoonRepository(ABC):
+class IMoonRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Moon entity.
     
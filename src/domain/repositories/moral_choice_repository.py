@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.moral_choice import Moral_choice
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IMoral_choiceRepository(ABC):
+class IMoral_choiceRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Moral_choice entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.motif import Motif
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IMotifRepository(ABC):
+class IMotifRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Motif entity.
     
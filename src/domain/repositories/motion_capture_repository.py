@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.motion_capture import MotionCapture
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IMotionCaptureRepository(ABC):
+class IMotionCaptureRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for MotionCapture entity.
     
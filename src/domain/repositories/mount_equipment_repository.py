@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.mount_equipment import MountEquipment
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IMountEquipmentRepository(ABC):
+class IMountEquipmentRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for MountEquipment entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.mount import Mount
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IMountRepository(ABC):
+class IMountRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Mount entity.
     
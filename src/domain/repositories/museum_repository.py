@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.museum import Museum
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IMuseumRepository(ABC):
+class IMuseumRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Museum entity.
     
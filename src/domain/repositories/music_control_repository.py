@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.music_control import Music_control
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IMusic_controlRepository(ABC):
+class IMusic_controlRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Music_control entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.music_state import Music_state
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IMusic_stateRepository(ABC):
+class IMusic_stateRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Music_state entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.music_theme import Music_theme
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IMusic_themeRepository(ABC):
+class IMusic_themeRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Music_theme entity.
     
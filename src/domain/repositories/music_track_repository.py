@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.music_track import Music_track
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IMusic_trackRepository(ABC):
+class IMusic_trackRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Music_track entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.mystery import Mystery
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IMysteryRepository(ABC):
+class IMysteryRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Mystery entity.
     
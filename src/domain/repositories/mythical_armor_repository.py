@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.mythical_armor import MythicalArmor
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IMythicalArmorRepository(ABC):
+class IMythicalArmorRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for MythicalArmor entity.
     
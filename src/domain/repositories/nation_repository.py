@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.nation import Nation
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class INationRepository(ABC):
+class INationRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Nation entity.
     
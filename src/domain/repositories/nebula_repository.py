@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.nebula import Nebula
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class INebulaRepository(ABC):
+class INebulaRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Nebula entity.
     
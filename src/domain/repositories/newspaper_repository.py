@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.newspaper import Newspaper
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class INewspaperRepository(ABC):
+class INewspaperRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Newspaper entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.nightmare import Nightmare
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class INightmareRepository(ABC):
+class INightmareRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Nightmare entity.
     
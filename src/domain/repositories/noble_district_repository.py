@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.noble_district import NobleDistrict
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class INobleDistrictRepository(ABC):
+class INobleDistrictRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for NobleDistrict entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.note import Note
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class INoteRepository(ABC):
+class INoteRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Note entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.oath import Oath
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IOathRepository(ABC):
+class IOathRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Oath entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.open_world_zone import OpenWorldZone
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IOpenWorldZoneRepository(ABC):
+class IOpenWorldZoneRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for OpenWorldZone entity.
     
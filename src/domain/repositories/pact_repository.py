@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.pact import Pact
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IPactRepository(ABC):
+class IPactRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Pact entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.page import Page
 from ..value_objects.common import TenantId, EntityId, PageName
+from .bulk import BulkOperationsMixin
 
 
-class IPageRepository(ABC):
+class IPageRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Page entity.
     
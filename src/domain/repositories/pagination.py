@@ -0,0 +1,254 @@
+"""
+Keyset (Cursor) Pagination
+
+``list_by_world`` / ``list_by_tenant`` page with ``LIMIT ? OFFSET ?``, which
+costs O(offset): every skipped row is still read. The ``page_by_*`` methods
+here page by key instead: a page holds the entities whose id is greater than
+the last id of the previous page, so fetching page 500 costs the same as
+page 1 when the backend can seek by id.
+
+Cursors are opaque strings. Callers pass back the ``next_cursor`` of the
+previous page and must not build or inspect cursors themselves.
+
+``stream_by_world`` / ``stream_by_tenant`` build on the same idea for
+exports and migrations: a generator yielding every entity while holding at
+most one batch in memory.
+"""
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from typing import Any, Callable, Generic, Iterator, List, Optional, TypeVar
+
+from ..exceptions import InvalidCursor
+from ..value_objects.common import TenantId, EntityId
+
+
+T = TypeVar("T")
+
+CURSOR_VERSION = 1
+
+# Page size used by the default implementations when scanning ``list_by_*``.
+SCAN_BATCH_SIZE = 500
+
+# Entities held in memory at a time by the ``stream_by_*`` generators.
+STREAM_BATCH_SIZE = 500
+
+
+@dataclass(frozen=True)
+class CursorPage(Generic[T]):
+    """
+    One page of a keyset-paginated listing.
+
+    Attributes:
+        items: Entities on this page, ordered by id
+        next_cursor: Cursor for the following page, or None on the last page
+    """
+
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+
+def encode_cursor(after_id: EntityId) -> str:
+    """Encode the last id of a page as an opaque cursor."""
+    payload = json.dumps({"v": CURSOR_VERSION, "after": after_id.value}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[EntityId]:
+    """
+    Decode a cursor into the id to continue after.
+
+    Returns:
+        None for an empty cursor (the first page)
+
+    Raises:
+        InvalidCursor: If the cursor cannot be decoded
+    """
+    if not cursor:
+        return None
+
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if payload["v"] != CURSOR_VERSION:
+            raise InvalidCursor(f"Unsupported cursor version: {payload['v']!r}")
+        return EntityId(int(payload["after"]))
+    except InvalidCursor:
+        raise
+    except (binascii.Error, UnicodeDecodeError, ValueError, KeyError, TypeError) as e:
+        raise InvalidCursor(f"Malformed cursor: {cursor!r}") from e
+
+
+def check_limit(limit: int) -> int:
+    """
+    Validate a page size.
+
+    Raises:
+        ValueError: If ``limit`` is below 1; a page of nothing has no last id
+            to continue after, and ``limit + 1`` would reach SQLite's
+            ``LIMIT -1`` (no limit) for ``limit == -2``
+    """
+    if limit < 1:
+        raise ValueError(f"limit must be at least 1, got {limit}")
+    return limit
+
+
+def make_page(rows: List[T], limit: int) -> CursorPage[T]:
+    """
+    Build a page from up to ``limit + 1`` entities ordered by id.
+
+    The extra entity only signals that another page exists; it is dropped.
+
+    Raises:
+        ValueError: If ``limit`` is below 1
+    """
+    check_limit(limit)
+    if len(rows) > limit:
+        rows = rows[:limit]
+        return CursorPage(rows, encode_cursor(rows[-1].id) if rows else None)
+    return CursorPage(rows, None)
+
+
+class CursorPaginationMixin:
+    """
+    Default keyset pagination for repository interfaces.
+
+    The defaults scan ``list_by_world`` / ``list_by_tenant`` in id order and
+    are correct for any repository that lists in id order, but still read the
+    skipped entities. Concrete repositories override ``_page_after_world`` /
+    ``_page_after_tenant`` with a real seek.
+    """
+
+    def page_by_world(
+        self,
+        tenant_id: TenantId,
+        world_id: EntityId,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> CursorPage[Any]:
+        """
+        List a page of a world's entities, ordered by id.
+
+        Args:
+            limit: Maximum number of entities on the page
+            cursor: ``next_cursor`` of the previous page; None for the first page
+
+        Raises:
+            InvalidCursor: If ``cursor`` is malformed
+            ValueError: If ``limit`` is below 1
+        """
+        check_limit(limit)
+        after_id = decode_cursor(cursor)
+        return make_page(self._page_after_world(tenant_id, world_id, after_id, limit + 1), limit)
+
+    def page_by_tenant(
+        self,
+        tenant_id: TenantId,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> CursorPage[Any]:
+        """
+        List a page of a tenant's entities, ordered by id.
+
+        Args:
+            limit: Maximum number of entities on the page
+            cursor: ``next_cursor`` of the previous page; None for the first page
+
+        Raises:
+            InvalidCursor: If ``cursor`` is malformed
+            ValueError: If ``limit`` is below 1
+        """
+        check_limit(limit)
+        after_id = decode_cursor(cursor)
+        return make_page(self._page_after_tenant(tenant_id, after_id, limit + 1), limit)
+
+    def stream_by_world(
+        self,
+        tenant_id: TenantId,
+        world_id: EntityId,
+        batch_size: int = STREAM_BATCH_SIZE,
+    ) -> Iterator[Any]:
+        """
+        Yield every entity of a world, fetching ``batch_size`` at a time.
+
+        Entities saved or deleted while the stream is open may or may not be
+        seen, but no entity is yielded twice.
+        """
+        return _stream_pages(
+            lambda after_id: self._page_after_world(tenant_id, world_id, after_id, batch_size),
+            batch_size,
+        )
+
+    def stream_by_tenant(
+        self,
+        tenant_id: TenantId,
+        batch_size: int = STREAM_BATCH_SIZE,
+    ) -> Iterator[Any]:
+        """
+        Yield every entity of a tenant, fetching ``batch_size`` at a time.
+
+        Entities saved or deleted while the stream is open may or may not be
+        seen, but no entity is yielded twice.
+        """
+        return _stream_pages(
+            lambda after_id: self._page_after_tenant(tenant_id, after_id, batch_size),
+            batch_size,
+        )
+
+    def _page_after_world(
+        self,
+        tenant_id: TenantId,
+        world_id: EntityId,
+        after_id: Optional[EntityId],
+        limit: int,
+    ) -> List[Any]:
+        return _scan_after(
+            lambda batch, offset: self.list_by_world(tenant_id, world_id, batch, offset),
+            after_id,
+            limit,
+        )
+
+    def _page_after_tenant(
+        self,
+        tenant_id: TenantId,
+        after_id: Optional[EntityId],
+        limit: int,
+    ) -> List[Any]:
+        return _scan_after(
+            lambda batch, offset: self.list_by_tenant(tenant_id, batch, offset),
+            after_id,
+            limit,
+        )
+
+
+def _stream_pages(
+    page_after: Callable[[Optional[EntityId]], List[Any]],
+    batch_size: int,
+) -> Iterator[Any]:
+    """Yield the entities of consecutive keyset pages until a short page."""
+    after_id = None
+    while True:
+        batch = page_after(after_id)
+        yield from batch
+        if len(batch) < batch_size:
+            return
+        after_id = batch[-1].id
+
+
+def _scan_after(
+    list_page: Callable[[int, int], List[Any]],
+    after_id: Optional[EntityId],
+    limit: int,
+) -> List[Any]:
+    """Collect up to ``limit`` entities with an id above ``after_id`` from an offset listing."""
+    after = after_id.value if after_id is not None else 0
+    found: List[Any] = []
+    offset = 0
+    while len(found) < limit:
+        batch = list_page(SCAN_BATCH_SIZE, offset)
+        found.extend(entity for entity in batch if entity.id.value > after)
+        if len(batch) < SCAN_BATCH_SIZE:
+            break
+        offset += SCAN_BATCH_SIZE
+    return found[:limit]
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.particle import Particle
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IParticleRepository(ABC):
+class IParticleRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Particle entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.patent import Patent
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IPatentRepository(ABC):
+class IPatentRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Patent entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.perk import Perk
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IPerkRepository(ABC):
+class IPerkRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Perk entity.
     
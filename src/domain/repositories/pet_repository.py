@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.pet import Pet
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IPetRepository(ABC):
+class IPetRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Pet entity.
     
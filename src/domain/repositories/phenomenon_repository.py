@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.phenomenon import Phenomenon
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IPhenomenonRepository(ABC):
+class IPhenomenonRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Phenomenon entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.pity import Pity
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IPityRepository(ABC):
+class IPityRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Pity entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.plague import Plague
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IPlagueRepository(ABC):
+class IPlagueRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Plague entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.player_metric import PlayerMetric
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IPlayerMetricRepository(ABC):
+class IPlayerMetricRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for PlayerMetric entity.
     
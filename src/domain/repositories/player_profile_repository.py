@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.player_profile import Player_profile
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IPlayer_profileRepository(ABC):
+class IPlayer_profileRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Player_profile entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.plaza import Plaza
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IPlazaRepository(ABC):
+class IPlazaRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Plaza entity.
     
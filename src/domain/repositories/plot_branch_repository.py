@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.plot_branch import PlotBranch
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IPlotBranchRepository(ABC):
+class IPlotBranchRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for PlotBranch entity.
     
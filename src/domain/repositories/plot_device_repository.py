@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.plot_device import PlotDevice
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IPlotDeviceRepository(ABC):
+class IPlotDeviceRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for PlotDevice entity.
     
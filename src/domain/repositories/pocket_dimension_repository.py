@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.pocket_dimension import PocketDimension
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IPocketDimensionRepository(ABC):
+class IPocketDimensionRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for PocketDimension entity.
     
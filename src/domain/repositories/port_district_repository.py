@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.port_district import PortDistrict
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IPortDistrictRepository(ABC):
+class IPortDistrictRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for PortDistrict entity.
     
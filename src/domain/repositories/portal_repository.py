@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.portal import Portal
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IPortalRepository(ABC):
+class IPortalRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Portal entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.price import Price
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IPriceRepository(ABC):
+class IPriceRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Price entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.progression_event import Progression_event
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IProgression_eventRepository(ABC):
+class IProgression_eventRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Progression_event entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.progression_state import Progression_state
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IProgression_stateRepository(ABC):
+class IProgression_stateRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Progression_state entity.
     
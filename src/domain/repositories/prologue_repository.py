@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.prologue import Prologue
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IPrologueRepository(ABC):
+class IPrologueRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Prologue entity.
     
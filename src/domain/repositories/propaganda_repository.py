@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.propaganda import Propaganda
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IPropagandaRepository(ABC):
+class IPropagandaRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Propaganda entity.
     
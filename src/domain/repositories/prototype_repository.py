@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.prototype import Prototype
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IPrototypeRepository(ABC):
+class IPrototypeRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Prototype entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.pull import Pull
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IPullRepository(ABC):
+class IPullRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Pull entity.
     
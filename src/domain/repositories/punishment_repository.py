@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.punishment import Punishment
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IPunishmentRepository(ABC):
+class IPunishmentRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Punishment entity.
     
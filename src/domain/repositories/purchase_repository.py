@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.purchase import Purchase
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IPurchaseRepository(ABC):
+class IPurchaseRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Purchase entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.puzzle import Puzzle
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IPuzzleRepository(ABC):
+class IPuzzleRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Puzzle entity.
     
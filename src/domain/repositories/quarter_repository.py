@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.quarter import Quarter
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IQuarterRepository(ABC):
+class IQuarterRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Quarter entity.
     
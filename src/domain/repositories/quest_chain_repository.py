@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.quest_chain import QuestChain
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IQuestChainRepository(ABC):
+class IQuestChainRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for QuestChain entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.quest_giver import QuestGiver
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IQuestGiverRepository(ABC):
+class IQuestGiverRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for QuestGiver entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.quest_node import QuestNode
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IQuestNodeRepository(ABC):
+class IQuestNodeRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for QuestNode entity.
     
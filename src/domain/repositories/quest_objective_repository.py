@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.quest_objective import QuestObjective
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IQuestObjectiveRepository(ABC):
+class IQuestObjectiveRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for QuestObjective entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.quest_prerequisite import QuestPrerequisite
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IQuestPrerequisiteRepository(ABC):
+class IQuestPrerequisiteRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for QuestPrerequisite entity.
     
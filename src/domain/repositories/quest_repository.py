@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.quest import Quest
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IQuestRepository(ABC):
+class IQuestRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Quest entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.quest_reward import QuestReward
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IQuestRewardRepository(ABC):
+class IQuestRewardRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for QuestReward entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.quest_reward_tier import QuestRewardTier
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IQuestRewardTierRepository(ABC):
+class IQuestRewardTierRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for QuestRewardTier entity.
     
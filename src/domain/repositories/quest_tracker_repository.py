@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.quest_tracker import QuestTracker
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IQuestTrackerRepository(ABC):
+class IQuestTrackerRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for QuestTracker entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.radio import Radio
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IRadioRepository(ABC):
+class IRadioRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Radio entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.raid import Raid
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IRaidRepository(ABC):
+class IRaidRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Raid entity.
     
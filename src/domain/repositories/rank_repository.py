@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.rank import Rank
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IRankRepository(ABC):
+class IRankRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Rank entity.
     
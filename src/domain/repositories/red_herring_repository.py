@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.red_herring import RedHerring
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IRedHerringRepository(ABC):
+class IRedHerringRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for RedHerring entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.relic_collection import RelicCollection
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IRelicCollectionRepository(ABC):
+class IRelicCollectionRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for RelicCollection entity.
     
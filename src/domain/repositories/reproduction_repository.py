@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.reproduction import Reproduction
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IReproductionRepository(ABC):
+class IReproductionRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Reproduction entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.reputation import Reputation
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IReputationRepository(ABC):
+class IReputationRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Reputation entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.requirement import Requirement
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IRequirementRepository(ABC):
+class IRequirementRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Requirement entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.research_center import ResearchCenter
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IResearchCenterRepository(ABC):
+class IResearchCenterRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for ResearchCenter entity.
     
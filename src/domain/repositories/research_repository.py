@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.research import Research
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IResearchRepository(ABC):
+class IResearchRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Research entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.revolution import Revolution
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IRevolutionRepository(ABC):
+class IRevolutionRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Revolution entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.reward import Reward
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IRewardRepository(ABC):
+class IRewardRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Reward entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.riddle import Riddle
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IRiddleRepository(ABC):
+class IRiddleRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Riddle entity.
     
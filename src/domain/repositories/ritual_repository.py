@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.ritual import Ritual
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IRitualRepository(ABC):
+class IRitualRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Ritual entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.rumor import Rumor
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IRumorRepository(ABC):
+class IRumorRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Rumor entity.
     
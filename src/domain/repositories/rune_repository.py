@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.rune import Rune
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IRuneRepository(ABC):
+class IRuneRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Rune entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.save_point import SavePoint
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ISavePointRepository(ABC):
+class ISavePointRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for SavePoint entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.school import School
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ISchoolRepository(ABC):
+class ISchoolRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for School entity.
     
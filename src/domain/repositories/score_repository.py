@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.score import Score
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IScoreRepository(ABC):
+class IScoreRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Score entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.scripture import Scripture
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IScriptureRepository(ABC):
+class IScriptureRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Scripture entity.
     
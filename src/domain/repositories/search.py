@@ -0,0 +1,27 @@
+"""
+Full-Text Search Results
+
+Result type shared by the ranked full-text search implementations.
+"""
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class SearchHit(Generic[T]):
+    """
+    A ranked full-text match.
+
+    Attributes:
+        entity: The matching entity
+        score: Relevance; higher is better
+        snippet: Excerpt of the best matching field with matched terms
+            wrapped in ``[`` and ``]``
+    """
+
+    entity: T
+    score: float
+    snippet: str
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.season import Season
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ISeasonRepository(ABC):
+class ISeasonRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Season entity.
     
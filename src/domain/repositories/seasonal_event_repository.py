@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.seasonal_event import SeasonalEvent
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ISeasonalEventRepository(ABC):
+class ISeasonalEventRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for SeasonalEvent entity.
     
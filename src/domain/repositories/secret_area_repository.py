@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.secret_area import SecretArea
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ISecretAreaRepository(ABC):
+class ISecretAreaRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for SecretArea entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.sect import Sect
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ISectRepository(ABC):
+class ISectRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Sect entity.
     
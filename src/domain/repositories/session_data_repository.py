@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.session_data import SessionData
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ISessionDataRepository(ABC):
+class ISessionDataRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for SessionData entity.
     
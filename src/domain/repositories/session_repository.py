@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.session import Session
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ISessionRepository(ABC):
+class ISessionRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Session entity.
     
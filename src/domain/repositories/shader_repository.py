@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.shader import Shader
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IShaderRepository(ABC):
+class IShaderRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Shader entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.share_code import ShareCode
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IShareCodeRepository(ABC):
+class IShareCodeRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for ShareCode entity.
     
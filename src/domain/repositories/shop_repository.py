@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.shop import Shop
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IShopRepository(ABC):
+class IShopRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Shop entity.
     
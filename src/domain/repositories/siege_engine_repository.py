@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.siege_engine import SiegeEngine
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ISiegeEngineRepository(ABC):
+class ISiegeEngineRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for SiegeEngine entity.
     
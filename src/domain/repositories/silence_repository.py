@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.silence import Silence
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ISilenceRepository(ABC):
+class ISilenceRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Silence entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.skill import Skill
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ISkillRepository(ABC):
+class ISkillRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Skill entity.
     
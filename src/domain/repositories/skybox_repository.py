@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.skybox import Skybox
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ISkyboxRepository(ABC):
+class ISkyboxRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Skybox entity.
     
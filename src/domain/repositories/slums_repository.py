@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.slums import Slums
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ISlumsRepository(ABC):
+class ISlumsRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Slums entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.social_class import SocialClass
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ISocialClassRepository(ABC):
+class ISocialClassRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for SocialClass entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.social_media import SocialMedia
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ISocialMediaRepository(ABC):
+class ISocialMediaRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for SocialMedia entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.social_mobility import SocialMobility
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ISocialMobilityRepository(ABC):
+class ISocialMobilityRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for SocialMobility entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.socket import Socket
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ISocketRepository(ABC):
+class ISocketRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Socket entity.
     
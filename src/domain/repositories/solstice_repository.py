@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.solstice import Solstice
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ISolsticeRepository(ABC):
+class ISolsticeRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Solstice entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.sound_effect import SoundEffect
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ISoundEffectRepository(ABC):
+class ISoundEffectRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for SoundEffect entity.
     
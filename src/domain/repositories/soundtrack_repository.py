@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.soundtrack import Soundtrack
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ISoundtrackRepository(ABC):
+class ISoundtrackRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Soundtrack entity.
     
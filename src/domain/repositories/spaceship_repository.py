@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.spaceship import Spaceship
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ISpaceshipRepository(ABC):
+class ISpaceshipRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Spaceship entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.spawn_point import SpawnPoint
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ISpawnPointRepository(ABC):
+class ISpawnPointRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for SpawnPoint entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.star_system import StarSystem
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IStarSystemRepository(ABC):
+class IStarSystemRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for StarSystem entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.story import Story
 from ..value_objects.common import TenantId, EntityId, StoryName, StoryType
+from .bulk import BulkOperationsMixin
 
 
-class IStoryRepository(ABC):
+class IStoryRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Story entity.
     
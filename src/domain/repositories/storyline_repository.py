@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.storyline import Storyline
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IStorylineRepository(ABC):
+class IStorylineRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Storyline entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.subtitle import Subtitle
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ISubtitleRepository(ABC):
+class ISubtitleRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Subtitle entity.
     
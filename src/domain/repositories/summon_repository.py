@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.summon import Summon
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ISummonRepository(ABC):
+class ISummonRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Summon entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.supply import Supply
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ISupplyRepository(ABC):
+class ISupplyRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Supply entity.
     
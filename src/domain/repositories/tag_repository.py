@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.tag import Tag
 from ..value_objects.common import TenantId, EntityId, TagName, TagType
+from .bulk import BulkOperationsMixin
 
 
-class ITagRepository(ABC):
+class ITagRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Tag entity.
     
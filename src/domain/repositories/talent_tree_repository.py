@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.talent_tree import TalentTree
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ITalentTreeRepository(ABC):
+class ITalentTreeRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for TalentTree entity.
     
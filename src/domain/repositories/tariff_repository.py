@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.tariff import Tariff
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ITariffRepository(ABC):
+class ITariffRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Tariff entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.tax import Tax
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ITaxRepository(ABC):
+class ITaxRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Tax entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.teleporter import Teleporter
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ITeleporterRepository(ABC):
+class ITeleporterRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Teleporter entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.television import Television
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ITelevisionRepository(ABC):
+class ITelevisionRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Television entity.
     
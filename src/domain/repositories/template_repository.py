@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.template import Template
 from ..value_objects.common import TenantId, EntityId, TemplateName, TemplateType
+from .bulk import BulkOperationsMixin
 
 
-class ITemplateRepository(ABC):
+class ITemplateRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Template entity.
     
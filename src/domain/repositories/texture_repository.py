@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.texture import Texture
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ITextureRepository(ABC):
+class ITextureRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Texture entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.theme import Theme
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IThemeRepository(ABC):
+class IThemeRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Theme entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.time_period import TimePeriod
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ITimePeriodRepository(ABC):
+class ITimePeriodRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for TimePeriod entity.
     
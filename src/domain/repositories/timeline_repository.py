@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.timeline import Timeline
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ITimelineRepository(ABC):
+class ITimelineRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Timeline entity.
     
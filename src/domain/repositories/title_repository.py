@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.title import Title
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ITitleRepository(ABC):
+class ITitleRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Title entity.
     
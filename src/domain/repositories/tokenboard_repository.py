@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.tokenboard import Tokenboard
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ITokenboardRepository(ABC):
+class ITokenboardRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Tokenboard entity.
     
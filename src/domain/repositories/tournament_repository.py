@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.tournament import Tournament
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ITournamentRepository(ABC):
+class ITournamentRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Tournament entity.
     
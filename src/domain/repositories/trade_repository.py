@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.trade import Trade
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ITradeRepository(ABC):
+class ITradeRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Trade entity.
     
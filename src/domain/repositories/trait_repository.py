@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.trait import Trait
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ITraitRepository(ABC):
+class ITraitRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Trait entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.transition import Transition
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ITransitionRepository(ABC):
+class ITransitionRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Transition entity.
     
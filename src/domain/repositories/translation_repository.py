@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.translation import Translation
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ITranslationRepository(ABC):
+class ITranslationRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Translation entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.trap import Trap
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ITrapRepository(ABC):
+class ITrapRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Trap entity.
     
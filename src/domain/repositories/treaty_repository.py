@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.treaty import Treaty
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ITreatyRepository(ABC):
+class ITreatyRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Treaty entity.
     
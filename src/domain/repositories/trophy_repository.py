@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.trophy import Trophy
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class ITrophyRepository(ABC):
+class ITrophyRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Trophy entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.underground import Underground
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IUndergroundRepository(ABC):
+class IUndergroundRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Underground entity.
     
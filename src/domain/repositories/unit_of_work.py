@@ -0,0 +1,74 @@
+"""
+Unit of Work Interface
+
+Port for grouping several repository operations into one atomic change.
+"""
+from abc import ABC, abstractmethod
+from typing import Callable
+
+
+class IUnitOfWork(ABC):
+    """
+    Unit of work spanning multiple repositories.
+
+    Used as a context manager: everything saved or deleted inside the block
+    is committed together when the block exits normally and rolled back
+    together when it raises.
+
+    Example:
+        with uow:
+            world_repo.save(world)
+            for character in characters:
+                character_repo.save(character)
+    """
+
+    def __enter__(self) -> "IUnitOfWork":
+        self.begin()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        if exc_type is None:
+            self.complete()
+        else:
+            self.abort()
+        return False
+
+    @abstractmethod
+    def begin(self) -> None:
+        """Start the unit of work. Nested units join the outer one."""
+        pass
+
+    @abstractmethod
+    def commit(self) -> None:
+        """
+        Commit the work done so far and keep the unit of work open.
+
+        Raises:
+            InvalidState: If the unit of work is not active
+        """
+        pass
+
+    @abstractmethod
+    def rollback(self) -> None:
+        """
+        Discard the work done since the last commit and keep the unit open.
+
+        Raises:
+            InvalidState: If the unit of work is not active
+        """
+        pass
+
+    @abstractmethod
+    def complete(self) -> None:
+        """Commit and close the unit of work (normal exit of the block)."""
+        pass
+
+    @abstractmethod
+    def abort(self) -> None:
+        """Roll back and close the unit of work (exceptional exit of the block)."""
+        pass
+
+    @abstractmethod
+    def on_commit(self, callback: Callable[[], None]) -> None:
+        """Register a callback to run after the outermost commit succeeds."""
+        pass
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.university import University
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IUniversityRepository(ABC):
+class IUniversityRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for University entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.user_scenario import UserScenario
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IUserScenarioRepository(ABC):
+class IUserScenarioRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for UserScenario entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.vehicle import Vehicle
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IVehicleRepository(ABC):
+class IVehicleRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Vehicle entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.visual_effect import VisualEffect
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IVisualEffectRepository(ABC):
+class IVisualEffectRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for VisualEffect entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.voice_actor import VoiceActor
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IVoiceActorRepository(ABC):
+class IVoiceActorRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for VoiceActor entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.voice_line import VoiceLine
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IVoiceLineRepository(ABC):
+class IVoiceLineRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for VoiceLine entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.voice_over import VoiceOver
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IVoiceOverRepository(ABC):
+class IVoiceOverRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for VoiceOver entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.war import War
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IWarRepository(ABC):
+class IWarRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for War entity.
     
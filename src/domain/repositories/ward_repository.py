@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.ward import Ward
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IWardRepository(ABC):
+class IWardRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Ward entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.waypoint import Waypoint
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IWaypointRepository(ABC):
+class IWaypointRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Waypoint entity.
     
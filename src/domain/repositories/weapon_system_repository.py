@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.weapon_system import WeaponSystem
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IWeaponSystemRepository(ABC):
+class IWeaponSystemRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for WeaponSystem entity.
     
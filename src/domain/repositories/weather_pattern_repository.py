@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.weather_pattern import WeatherPattern
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IWeatherPatternRepository(ABC):
+class IWeatherPatternRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for WeatherPattern entity.
     
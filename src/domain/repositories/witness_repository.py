@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.witness import Witness
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IWitnessRepository(ABC):
+class IWitnessRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Witness entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.workshop_entry import WorkshopEntry
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IWorkshopEntryRepository(ABC):
+class IWorkshopEntryRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for WorkshopEntry entity.
     
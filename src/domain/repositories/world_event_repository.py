@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.world_event import WorldEvent
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IWorldEventRepository(ABC):
+class IWorldEventRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for WorldEvent entity.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.world import World
 from ..value_objects.common import TenantId, EntityId, WorldName
+from .bulk import BulkOperationsMixin
 
 
-class IWorldRepository(ABC):
+class IWorldRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for World aggregate.
     
@@ -8,9 +8,10 @@ from typing import Optional, List
 
 from ..entities.wormhole import Wormhole
 from ..value_objects.common import TenantId, EntityId
+from .bulk import BulkOperationsMixin
 
 
-class IWormholeRepository(ABC):
+class IWormholeRepository(BulkOperationsMixin, ABC):
     """
     Repository interface for Wormhole entity.
     
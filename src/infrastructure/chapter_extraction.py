@@ -0,0 +1,328 @@
+"""
+Chapter Entity Extraction
+
+``scripts/parse_chapter.py`` used to call ``text.count(name)`` for every
+extracted name, lowercase the whole chapter for every quest keyword and test
+every character pair with ``in text``: O(entities x text) plus O(C^2) over
+the full chapter. :class:`ChapterExtractor` reads each chapter once:
+
+- the text is tokenized a single time into word tokens;
+- all known entity names (from the repositories) are matched with a
+  token-level Aho-Corasick automaton (:class:`NameAutomaton`) built once per
+  world, so multi-word names and word boundaries come for free; names the
+  dialogue / preposition heuristics discover in the chapter get a small
+  per-chapter automaton over the same tokens;
+- mention counts, quest keywords and co-occurrences of characters within a
+  sliding window of tokens are all collected while walking the matches.
+
+:func:`extract_chapters` runs many chapters on a process pool. The output
+keeps the ``parsed_data.json`` layout that ``validate_parse_output.py``
+checks.
+"""
+import re
+import sqlite3
+from collections import ChainMap, Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+# Words, plus punctuation as tokens of its own so that names never match across it
+TOKEN_PATTERN = re.compile(r"[^\W_]+(?:['’][^\W_]+)*|[^\w\s]")
+
+SPEECH_VERBS = frozenset({"said", "asked", "replied", "thought", "walked", "ran", "looked"})
+LOCATION_PREPOSITIONS = frozenset({"in", "at", "near", "from", "to"})
+QUEST_KEYWORDS = ("find", "rescue", "retrieve", "defeat", "explore", "investigate")
+
+PARSER_VERSION = "2.0"
+
+# (table, entity type) whose names known_entities_from_sqlite reads
+NAME_TABLES: Tuple[Tuple[str, str], ...] = (('characters', 'character'), ('locations', 'location'))
+
+
+def tokenize(text: str) -> List[str]:
+    """Word and punctuation tokens of ``text``, in order."""
+    return TOKEN_PATTERN.findall(text)
+
+
+def _is_name_token(token: str) -> bool:
+    # Same shape as the old ``[A-Z][a-z]+`` patterns
+    return len(token) > 1 and token[0].isupper() and token[1:].islower()
+
+
+class NameAutomaton:
+    """
+    Aho-Corasick automaton over token sequences.
+
+    Each pattern is a name split into tokens; :meth:`scan` reports every
+    occurrence of every pattern in one pass over a token list.
+    """
+
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # Patterns ending at each state, including those reached via failure links
+        self._output: List[List[Tuple[str, int]]] = [[]]
+        self._names: Dict[str, str] = {}
+        self._built = True
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._names
+
+    def add(self, name: str, entity_type: str) -> None:
+        """Add ``name`` as a pattern; the first type registered for a name wins."""
+        tokens = tokenize(name)
+        if not tokens or name in self._names:
+            return
+        self._names[name] = entity_type
+
+        state = 0
+        for token in tokens:
+            nxt = self._goto[state].get(token)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][token] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = nxt
+        self._output[state].append((name, len(tokens)))
+        self._built = False
+
+    def build(self) -> None:
+        """Compute failure links (breadth-first)."""
+        queue: Deque[int] = deque()
+        for state in self._goto[0].values():
+            self._fail[state] = 0
+            queue.append(state)
+
+        while queue:
+            state = queue.popleft()
+            for token, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(token, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._output[nxt] = self._output[nxt] + self._output[self._fail[nxt]]
+        self._built = True
+
+    def scan(self, tokens: Sequence[str]) -> Iterator[Tuple[int, str]]:
+        """Yield ``(start_token_index, name)`` for every match, in order of their end."""
+        if not self._built:
+            self.build()
+        goto, fail, output = self._goto, self._fail, self._output
+
+        state = 0
+        for i, token in enumerate(tokens):
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            for name, length in output[state]:
+                yield i - length + 1, name
+
+
+@dataclass
+class ChapterExtraction:
+    """Entities and relationships found in one chapter."""
+    entities: List[Dict[str, Any]]
+    relationships: List[Dict[str, Any]]
+    word_count: int
+    text_length: int
+
+    def to_parsed_data(self, chapter_id: str) -> Dict[str, Any]:
+        """The ``parsed_data.json`` document for this chapter."""
+        return {
+            'chapter_id': chapter_id,
+            'text_length': self.text_length,
+            'word_count': self.word_count,
+            'entities': self.entities,
+            'relationships': self.relationships,
+            'metadata': {
+                'parser_version': PARSER_VERSION,
+                'extraction_method': 'aho_corasick',
+                'timestamp': datetime.now().isoformat(),
+            },
+        }
+
+
+@dataclass
+class ChapterExtractor:
+    """
+    Single-pass extractor for chapters of one world.
+
+    ``known`` maps entity names (typically every character and location in
+    the repositories) to their entity type. Characters mentioned within
+    ``window`` tokens of each other are reported as ``mentioned_together``.
+    """
+    known: Mapping[str, str] = field(default_factory=dict)
+    window: int = 50
+    discover: bool = True
+
+    def __post_init__(self):
+        self._automaton = NameAutomaton()
+        for name, entity_type in self.known.items():
+            self._automaton.add(name, entity_type)
+        self._automaton.build()
+
+    def _discover(self, tokens: Sequence[str]) -> Dict[str, str]:
+        """New character and location names suggested by the chapter itself."""
+        found: Dict[str, str] = {}
+        automaton = self._automaton
+        i, n = 0, len(tokens)
+        while i < n:
+            token = tokens[i]
+            if token in SPEECH_VERBS and i and _is_name_token(tokens[i - 1]):
+                name = tokens[i - 1]
+                if name not in automaton and name not in found:
+                    found[name] = 'character'
+            elif token in LOCATION_PREPOSITIONS:
+                end = i + 1
+                while end < n and _is_name_token(tokens[end]):
+                    end += 1
+                # Single capitalized words are too ambiguous to call a location
+                if end - i > 2:
+                    name = " ".join(tokens[i + 1:end])
+                    if name not in automaton and name not in found:
+                        found[name] = 'location'
+                i = end - 1
+            i += 1
+        return found
+
+    def extract(self, text: str) -> ChapterExtraction:
+        tokens = tokenize(text)
+
+        matches = list(self._automaton.scan(tokens))
+        discovered = self._discover(tokens) if self.discover else {}
+        if discovered:
+            # Names new to this chapter get a small automaton of their own, so
+            # the one built from the repositories is never rebuilt
+            chapter_automaton = NameAutomaton()
+            for name, entity_type in discovered.items():
+                chapter_automaton.add(name, entity_type)
+            matches.extend(chapter_automaton.scan(tokens))
+            matches.sort()
+
+        types = ChainMap(discovered, self.known)
+        mentions: Counter = Counter()
+        pairs: Counter = Counter()
+        recent: Deque[Tuple[int, str]] = deque()
+        for start, name in matches:
+            mentions[name] += 1
+            if types[name] != 'character':
+                continue
+            while recent and start - recent[0][0] > self.window:
+                recent.popleft()
+            for _, other in recent:
+                if other != name:
+                    pairs[(other, name) if other < name else (name, other)] += 1
+            recent.append((start, name))
+
+        entities: List[Dict[str, Any]] = [
+            {'type': types[name], 'name': name, 'mentions': count}
+            for name, count in mentions.items()
+        ]
+
+        lowered = {token.lower() for token in tokens}
+        for keyword in QUEST_KEYWORDS:
+            if any(token.startswith(keyword) for token in lowered):
+                entities.append({
+                    'type': 'quest_keyword',
+                    'keyword': keyword,
+                    'context': 'potential_quest',
+                })
+
+        relationships = [
+            {
+                'entity_a': a,
+                'entity_b': b,
+                'type': 'mentioned_together',
+                'confidence': 'high' if count >= 10 else 'medium' if count >= 3 else 'low',
+                'co_occurrences': count,
+            }
+            for (a, b), count in sorted(pairs.items(), key=lambda item: (-item[1], item[0]))
+        ]
+
+        return ChapterExtraction(
+            entities=entities,
+            relationships=relationships,
+            word_count=len(text.split()),
+            text_length=len(text),
+        )
+
+
+def known_entities(repositories: Mapping[str, Any], tenant_id, world_id) -> Dict[str, str]:
+    """
+    ``{name: entity_type}`` for every entity of a world.
+
+    ``repositories`` maps an entity type (e.g. ``"character"``) to a
+    repository with ``stream_by_world``.
+    """
+    known: Dict[str, str] = {}
+    for entity_type, repository in repositories.items():
+        for entity in repository.stream_by_world(tenant_id, world_id):
+            known.setdefault(str(entity.name), entity_type)
+    return known
+
+
+def known_entities_from_sqlite(
+    conn: sqlite3.Connection,
+    tenant_id: int,
+    world_id: int,
+    tables: Sequence[Tuple[str, str]] = NAME_TABLES,
+) -> Dict[str, str]:
+    """
+    :func:`known_entities` read from a lore database: only the ``name``
+    column of each table, so no entity has to be rebuilt from its row.
+    """
+    known: Dict[str, str] = {}
+    for table, entity_type in tables:
+        rows = conn.execute(
+            f"SELECT name FROM {table} WHERE tenant_id = ? AND world_id = ? ORDER BY id",
+            (tenant_id, world_id),
+        )
+        for (name,) in rows:
+            known.setdefault(name, entity_type)
+    return known
+
+
+_worker_extractor: Optional[ChapterExtractor] = None
+
+
+def _init_worker(known: Mapping[str, str], window: int, discover: bool) -> None:
+    global _worker_extractor
+    _worker_extractor = ChapterExtractor(known, window, discover)
+
+
+def _extract_in_worker(text: str) -> ChapterExtraction:
+    return _worker_extractor.extract(text)
+
+
+def extract_chapters(
+    texts: Iterable[str],
+    known: Optional[Mapping[str, str]] = None,
+    window: int = 50,
+    discover: bool = True,
+    workers: int = 1,
+) -> List[ChapterExtraction]:
+    """
+    Extract many chapters, in input order.
+
+    With ``workers`` > 1 each pool process builds the automaton once and
+    then extracts the chapters it is given.
+    """
+    known = dict(known or {})
+    if workers <= 1:
+        extractor = ChapterExtractor(known, window, discover)
+        return [extractor.extract(text) for text in texts]
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(known, window, discover),
+    ) as pool:
+        return list(pool.map(_extract_in_worker, texts))
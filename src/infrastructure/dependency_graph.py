@@ -0,0 +1,227 @@
+"""
+Incremental Dependency Graph
+
+A directed acyclic graph that stays acyclic as edges are added, for
+repositories that maintain dependency hierarchies (quest prerequisites;
+faction parents and skill prerequisites have the same shape).
+
+Instead of enumerating every cycle of the whole graph on each save, the
+graph keeps an online topological order (Pearce & Kelly, "A Dynamic
+Topological Sort Algorithm for Directed Acyclic Graphs"). Adding an edge
+``u -> v`` that already agrees with the order costs O(1); otherwise only the
+nodes whose position lies between ``v`` and ``u`` are searched and
+reordered, and a path from ``v`` back to ``u`` means the edge would close a
+cycle and is rejected with :class:`CircularDependency`.
+"""
+from collections import deque
+from typing import Dict, Hashable, Iterable, Iterator, List, Optional, Set, Tuple
+
+from src.domain.exceptions import CircularDependency
+
+
+class IncrementalDAG:
+    """
+    Directed acyclic graph with an incrementally maintained topological order.
+
+    Edges point from a dependency to its dependent (``prerequisite -> skill``,
+    ``parent -> child``), so :meth:`topological_order` lists dependencies
+    first. Adjacency is kept in both directions, in insertion order (dicts
+    used as ordered sets), so traversals are deterministic.
+    """
+
+    def __init__(self):
+        self._successors: Dict[Hashable, Dict[Hashable, None]] = {}
+        self._predecessors: Dict[Hashable, Dict[Hashable, None]] = {}
+        self._order: Dict[Hashable, int] = {}
+        self._next_order = 0
+
+    def __contains__(self, node: Hashable) -> bool:
+        return node in self._order
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def add_node(self, node: Hashable) -> None:
+        if node not in self._order:
+            self._order[node] = self._next_order
+            self._next_order += 1
+            self._successors[node] = {}
+            self._predecessors[node] = {}
+
+    def remove_node(self, node: Hashable) -> None:
+        """Remove a node and its edges; removing never breaks the order."""
+        if node not in self._order:
+            return
+        for successor in self._successors.pop(node):
+            del self._predecessors[successor][node]
+        for predecessor in self._predecessors.pop(node):
+            del self._successors[predecessor][node]
+        del self._order[node]
+
+    def successors(self, node: Hashable) -> Set[Hashable]:
+        return set(self._successors.get(node, ()))
+
+    def predecessors(self, node: Hashable) -> Set[Hashable]:
+        return set(self._predecessors.get(node, ()))
+
+    def has_edge(self, source: Hashable, target: Hashable) -> bool:
+        return target in self._successors.get(source, ())
+
+    def add_edge(self, source: Hashable, target: Hashable) -> None:
+        """
+        Add ``source -> target``.
+
+        Raises:
+            CircularDependency: If the edge would close a cycle; the graph is unchanged
+        """
+        if source == target:
+            raise CircularDependency(f"Circular dependency detected: {source} -> {source}")
+        self.add_node(source)
+        self.add_node(target)
+        if target in self._successors[source]:
+            return
+
+        lower, upper = self._order[target], self._order[source]
+        if lower < upper:
+            # The edge disagrees with the current order: repair the affected region
+            forward = self._search_forward(target, upper, source)
+            backward = self._search_backward(source, lower)
+            self._reorder(backward, forward)
+
+        self._successors[source][target] = None
+        self._predecessors[target][source] = None
+
+    def remove_edge(self, source: Hashable, target: Hashable) -> None:
+        if target in self._successors.get(source, ()):
+            del self._successors[source][target]
+            del self._predecessors[target][source]
+
+    def set_predecessors(self, node: Hashable, predecessors: Iterable[Hashable]) -> None:
+        """
+        Replace the incoming edges of ``node``, all or nothing.
+
+        Raises:
+            CircularDependency: If a new edge would close a cycle; the old edges are kept
+        """
+        self.add_node(node)
+        wanted = set(predecessors)
+        current = set(self._predecessors[node])
+        removed = current - wanted
+        for predecessor in removed:
+            self.remove_edge(predecessor, node)
+
+        added = []
+        try:
+            for predecessor in wanted - current:
+                self.add_edge(predecessor, node)
+                added.append(predecessor)
+        except CircularDependency:
+            for predecessor in added:
+                self.remove_edge(predecessor, node)
+            for predecessor in removed:
+                self.add_edge(predecessor, node)
+            raise
+
+    def would_create_cycle(self, source: Hashable, target: Hashable) -> bool:
+        """Whether adding ``source -> target`` would close a cycle."""
+        if source == target:
+            return True
+        if source not in self._order or target not in self._order:
+            return False
+        return self._find_path(target, source) is not None
+
+    def topological_order(self) -> List[Hashable]:
+        """All nodes, every dependency before its dependents."""
+        return sorted(self._order, key=self._order.__getitem__)
+
+    def ancestors(self, node: Hashable) -> Set[Hashable]:
+        """Every node ``node`` depends on, directly or transitively."""
+        return self._reachable(node, self._predecessors)
+
+    def descendants(self, node: Hashable) -> Set[Hashable]:
+        """Every node that depends on ``node``, directly or transitively."""
+        return self._reachable(node, self._successors)
+
+    def breadth_first(self, root: Hashable) -> Iterator[Tuple[Hashable, int]]:
+        """``(node, depth)`` for ``root`` and its descendants, nearest first, each once."""
+        if root not in self._order:
+            return
+        seen = {root}
+        queue = deque([(root, 0)])
+        while queue:
+            node, depth = queue.popleft()
+            yield node, depth
+            for successor in self._successors[node]:
+                if successor not in seen:
+                    seen.add(successor)
+                    queue.append((successor, depth + 1))
+
+    def _reachable(self, node: Hashable, edges: Dict[Hashable, Dict[Hashable, None]]) -> Set[Hashable]:
+        seen: Set[Hashable] = set()
+        queue = deque(edges.get(node, ()))
+        while queue:
+            current = queue.popleft()
+            if current not in seen:
+                seen.add(current)
+                queue.extend(n for n in edges[current] if n not in seen)
+        return seen
+
+    def _find_path(self, start: Hashable, goal: Hashable) -> Optional[List[Hashable]]:
+        """A path ``start -> ... -> goal``, searching only nodes ordered before ``goal``."""
+        upper = self._order[goal]
+        if self._order[start] > upper:
+            return None
+        parents: Dict[Hashable, Optional[Hashable]] = {start: None}
+        stack = [start]
+        while stack:
+            current = stack.pop()
+            for successor in self._successors[current]:
+                if successor in parents or self._order[successor] > upper:
+                    continue
+                parents[successor] = current
+                if successor == goal:
+                    path = [goal]
+                    while parents[path[-1]] is not None:
+                        path.append(parents[path[-1]])
+                    return path[::-1]
+                stack.append(successor)
+        return None
+
+    def _search_forward(self, start: Hashable, upper: int, source: Hashable) -> List[Hashable]:
+        """Nodes reachable from ``start`` ordered at or before ``upper``; fails on reaching ``source``."""
+        parents: Dict[Hashable, Optional[Hashable]] = {start: None}
+        stack = [start]
+        while stack:
+            current = stack.pop()
+            for successor in self._successors[current]:
+                if successor in parents or self._order[successor] > upper:
+                    continue
+                parents[successor] = current
+                if successor == source:
+                    path = [source]
+                    while parents[path[-1]] is not None:
+                        path.append(parents[path[-1]])
+                    cycle = " -> ".join(str(node) for node in [source, *reversed(path)])
+                    raise CircularDependency(f"Circular dependency detected: {cycle}")
+                stack.append(successor)
+        return list(parents)
+
+    def _search_backward(self, start: Hashable, lower: int) -> List[Hashable]:
+        """Nodes that reach ``start`` and are ordered after ``lower``."""
+        seen = {start}
+        stack = [start]
+        while stack:
+            for predecessor in self._predecessors[stack.pop()]:
+                if predecessor not in seen and self._order[predecessor] > lower:
+                    seen.add(predecessor)
+                    stack.append(predecessor)
+        return list(seen)
+
+    def _reorder(self, backward: List[Hashable], forward: List[Hashable]) -> None:
+        """Give the affected nodes their old positions, ``backward`` first."""
+        key = self._order.__getitem__
+        backward.sort(key=key)
+        forward.sort(key=key)
+        positions = sorted(self._order[node] for node in backward + forward)
+        for node, position in zip(backward + forward, positions):
+            self._order[node] = position
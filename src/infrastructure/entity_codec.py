@@ -0,0 +1,367 @@
+"""
+Compiled entity codecs.
+
+Entities used to be serialized by walking ``entity.__dict__`` and testing
+every value with a chain of ``hasattr(value, 'value')``/``isinstance``
+checks. :class:`EntityCodec` instead generates one encoder (and one
+decoder) per dataclass, the first time the class is seen, from its field
+types:
+
+- value objects (``EntityId``, ``Timestamp``, ...) are unwrapped inline;
+- enums become their value and datetimes ISO strings;
+- ``Optional[...]`` and ``List[...]`` fields get a precompiled expression,
+  and nested dataclasses in lists their own compiled encoder.
+
+Every compiled expression is guarded by an exact type check and falls back
+to the generic rules (:meth:`EntityCodec.encode_value`), so the output is
+the same as the reflective walk for any value, including ones that do not
+match their annotation.
+
+:func:`dumps` and :func:`loads` use ``orjson`` when it is installed.
+"""
+import dataclasses
+import enum
+import json
+import threading
+import typing
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Type
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+from src.domain.value_objects.common import DateRange
+
+Encoder = Callable[[Any], Optional[Dict[str, Any]]]
+Decoder = Callable[[Dict[str, Any]], Any]
+
+PRIMITIVES = (str, int, float, bool)
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """
+    JSON-encode ``obj``, compact or with a two-space indent, using orjson
+    when available. Non-ASCII text is written as is.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+        except TypeError:
+            # e.g. non-string dict keys; the json module coerces them
+            pass
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def loads(data: Any) -> Any:
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _build_function(lines: List[str], namespace: Dict[str, Any]) -> Callable:
+    """
+    Compile the function in ``lines`` with ``namespace`` bound as closure
+    variables (faster to read than globals).
+    """
+    names = sorted(namespace)
+    source = "\n".join([
+        f"def _factory({', '.join(names)}):",
+        *("    " + line for line in lines),
+        f"    return {lines[0][4:lines[0].index('(')]}",
+    ])
+    scope: Dict[str, Any] = {}
+    exec(source, scope)
+    return scope['_factory'](**namespace)
+
+
+def _strip_optional(annotation: Any) -> Any:
+    """``Optional[X]`` -> ``X``; anything else unchanged (or ``None`` for other unions)."""
+    if typing.get_origin(annotation) is typing.Union:
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        return args[0] if len(args) == 1 else None
+    return annotation
+
+
+def _value_type(cls: Any) -> Any:
+    """The declared type of a value object's ``value`` field, or ``None``."""
+    if not (isinstance(cls, type) and dataclasses.is_dataclass(cls)):
+        return None
+    fields = dataclasses.fields(cls)
+    if len(fields) != 1 or fields[0].name != 'value':
+        return None
+    return typing.get_type_hints(cls).get('value')
+
+
+def _is_primitive_enum(cls: Any) -> bool:
+    return (
+        isinstance(cls, type) and issubclass(cls, enum.Enum)
+        and all(isinstance(member.value, PRIMITIVES) for member in cls)
+    )
+
+
+class EntityCodec:
+    """
+    Registry of compiled per-class encoders and decoders.
+
+    Args:
+        date_ranges_as_dicts: Encode ``DateRange`` fields as
+            ``{'start_date', 'end_date'}`` instead of ``str(date_range)``.
+        stringify_values: Encode a value object whose inner value is not a
+            str/int/float/bool/datetime as ``str(inner)`` instead of as is.
+    """
+
+    def __init__(self, date_ranges_as_dicts: bool = False, stringify_values: bool = False):
+        self.date_ranges_as_dicts = date_ranges_as_dicts
+        self.stringify_values = stringify_values
+        self._encoders: Dict[type, Encoder] = {}
+        self._decoders: Dict[type, Decoder] = {}
+        self._compiling: set = set()
+        self._lock = threading.RLock()
+
+    # -- Public API -------------------------------------------------------
+
+    def encode(self, entity: Any) -> Optional[Dict[str, Any]]:
+        """Encode ``entity`` into a JSON-compatible dict (``None`` stays ``None``)."""
+        if entity is None:
+            return None
+        encoder = self._encoders.get(entity.__class__)
+        if encoder is None:
+            encoder = self.encoder(entity.__class__)
+        return encoder(entity)
+
+    def encode_many(self, entities: typing.Iterable[Any]) -> List[Optional[Dict[str, Any]]]:
+        return [self.encode(entity) for entity in entities]
+
+    def decode(self, cls: Type[Any], data: Optional[Dict[str, Any]]) -> Any:
+        """Build a ``cls`` from a dict produced by :meth:`encode`."""
+        if data is None:
+            return None
+        decoder = self._decoders.get(cls)
+        if decoder is None:
+            decoder = self.decoder(cls)
+        return decoder(data)
+
+    def encoder(self, cls: type) -> Encoder:
+        """The compiled encoder of ``cls``, compiling it on first use."""
+        encoder = self._encoders.get(cls)
+        if encoder is None:
+            with self._lock:
+                encoder = self._encoders.get(cls)
+                if encoder is None:
+                    encoder = self._compile_encoder(cls)
+                    self._encoders[cls] = encoder
+        return encoder
+
+    def decoder(self, cls: type) -> Decoder:
+        """The compiled decoder of ``cls``, compiling it on first use."""
+        decoder = self._decoders.get(cls)
+        if decoder is None:
+            with self._lock:
+                decoder = self._decoders.get(cls)
+                if decoder is None:
+                    decoder = self._compile_decoder(cls)
+                    self._decoders[cls] = decoder
+        return decoder
+
+    # -- Generic rules ----------------------------------------------------
+
+    def encode_value(self, value: Any) -> Any:
+        """Encode one field value without type information."""
+        if value is None:
+            return None
+        if self.date_ranges_as_dicts and isinstance(value, DateRange):
+            return {
+                'start_date': value.start_date.value.isoformat(),
+                'end_date': value.end_date.value.isoformat() if value.end_date else None,
+            }
+        if hasattr(value, 'value'):
+            # Value object or enum
+            inner = value.value
+            if isinstance(inner, datetime):
+                return inner.isoformat()
+            if self.stringify_values and not isinstance(inner, PRIMITIVES):
+                return str(inner)
+            return inner
+        if isinstance(value, PRIMITIVES):
+            return value
+        if isinstance(value, datetime):
+            return value.isoformat()
+        if isinstance(value, list):
+            return [self.encode_item(item) for item in value]
+        return str(value)
+
+    def encode_item(self, item: Any) -> Any:
+        """Encode one list element without type information."""
+        if hasattr(item, '__dict__'):
+            return self.encode(item)
+        if hasattr(item, 'value'):
+            inner = item.value
+            return inner.isoformat() if isinstance(inner, datetime) else inner
+        return str(item)
+
+    def _encode_attributes(self, obj: Any) -> Dict[str, Any]:
+        return {name: self.encode_value(value) for name, value in obj.__dict__.items()}
+
+    # -- Encoder compilation ----------------------------------------------
+
+    def _compile_encoder(self, cls: type) -> Encoder:
+        if not dataclasses.is_dataclass(cls):
+            return self._encode_attributes
+        try:
+            hints = typing.get_type_hints(cls)
+        except Exception:
+            return self._encode_attributes
+
+        self._compiling.add(cls)
+        try:
+            namespace: Dict[str, Any] = {
+                '_datetime': datetime,
+                '_slow_record': self._encode_attributes,
+                '_value': self.encode_value,
+                '_item': self.encode_item,
+            }
+            fields = dataclasses.fields(cls)
+            lines = [
+                "def encode(obj):",
+                "    d = obj.__dict__",
+                # Attributes set outside __init__ would be missed below
+                f"    if len(d) != {len(fields)}:",
+                "        return _slow_record(obj)",
+            ]
+            entries = []
+            for position, field in enumerate(fields):
+                variable = f"v{position}"
+                expression = self._encode_expression(hints.get(field.name, Any), variable, namespace)
+                lines.append(f"    {variable} = d[{field.name!r}]")
+                entries.append(f"        {field.name!r}: {expression},")
+            lines += ["    return {", *entries, "    }"]
+            encode = _build_function(lines, namespace)
+        finally:
+            self._compiling.discard(cls)
+        encode.__qualname__ = f"encode_{cls.__name__}"
+        return encode
+
+    def _bind(self, namespace: Dict[str, Any], prefix: str, value: Any) -> str:
+        name = f"_{prefix}{len(namespace)}"
+        namespace[name] = value
+        return name
+
+    def _nested_encoder(self, cls: type) -> Encoder:
+        if cls in self._compiling:
+            # Self-referential type: look the encoder up when called
+            return lambda obj: self.encoder(cls)(obj)
+        return self.encoder(cls)
+
+    def _encode_expression(self, annotation: Any, var: str, namespace: Dict[str, Any]) -> str:
+        """A Python expression encoding ``var`` declared as ``annotation``."""
+        target = _strip_optional(annotation)
+        fast = self._fast_expression(target, var, namespace)
+        if fast is None:
+            return f"_value({var})"
+        guard, expression = fast
+        expression = f"{expression} if {guard} else _value({var})"
+        if target is not annotation:
+            # Optional: None fails the guard anyway, but is the common case
+            expression = f"None if {var} is None else ({expression})"
+        return expression
+
+    def _fast_expression(self, target: Any, var: str, namespace: Dict[str, Any]):
+        """``(guard, expression)`` for a declared type, or ``None`` for the generic rules."""
+        if target in PRIMITIVES:
+            return f"{var}.__class__ is {target.__name__}", var
+        if target is datetime:
+            return f"{var}.__class__ is _datetime", f"{var}.isoformat()"
+        if _is_primitive_enum(target):
+            cls = self._bind(namespace, "cls", target)
+            return f"{var}.__class__ is {cls}", f"{var}._value_"
+
+        inner = _value_type(target)
+        if inner is not None:
+            cls = self._bind(namespace, "cls", target)
+            if inner in PRIMITIVES:
+                return f"{var}.__class__ is {cls}", f"{var}.value"
+            if inner is datetime:
+                return f"{var}.__class__ is {cls}", f"{var}.value.isoformat()"
+            return None
+
+        if typing.get_origin(target) in (list, List):
+            args = typing.get_args(target)
+            item = self._item_expression(args[0] if args else Any, "i", namespace)
+            if item is None:
+                return None
+            return f"{var}.__class__ is list", f"[{item} for i in {var}]"
+        return None
+
+    def _item_expression(self, annotation: Any, var: str, namespace: Dict[str, Any]) -> Optional[str]:
+        if annotation is str:
+            return f"({var} if {var}.__class__ is str else _item({var}))"
+        if annotation in (int, float, bool):
+            return f"(str({var}) if {var}.__class__ is {annotation.__name__} else _item({var}))"
+        if isinstance(annotation, type) and dataclasses.is_dataclass(annotation):
+            cls = self._bind(namespace, "cls", annotation)
+            encode = self._bind(namespace, "encode", self._nested_encoder(annotation))
+            return f"({encode}({var}) if {var}.__class__ is {cls} else _item({var}))"
+        return None
+
+    # -- Decoder compilation ----------------------------------------------
+
+    def _compile_decoder(self, cls: type) -> Decoder:
+        if not dataclasses.is_dataclass(cls):
+            raise TypeError(f"{cls.__name__} is not a dataclass")
+        hints = typing.get_type_hints(cls)
+        namespace: Dict[str, Any] = {'_cls': cls, '_datetime': datetime}
+        self._compiling.add(cls)
+        try:
+            lines = ["def decode(data):", "    kwargs = {}"]
+            for field in dataclasses.fields(cls):
+                if not field.init:
+                    continue
+                expression = self._decode_expression(hints.get(field.name, Any), "x", namespace)
+                lines += [
+                    f"    if {field.name!r} in data:",
+                    f"        x = data[{field.name!r}]",
+                    f"        kwargs[{field.name!r}] = None if x is None else {expression}",
+                ]
+            lines.append("    return _cls(**kwargs)")
+            decode = _build_function(lines, namespace)
+        finally:
+            self._compiling.discard(cls)
+        decode.__qualname__ = f"decode_{cls.__name__}"
+        return decode
+
+    def _nested_decoder(self, cls: type) -> Decoder:
+        if cls in self._compiling:
+            return lambda data: self.decoder(cls)(data)
+        return self.decoder(cls)
+
+    def _decode_expression(self, annotation: Any, var: str, namespace: Dict[str, Any]) -> str:
+        target = _strip_optional(annotation)
+        if target is datetime:
+            return f"_datetime.fromisoformat({var})"
+        if isinstance(target, type) and issubclass(target, enum.Enum):
+            return f"{self._bind(namespace, 'cls', target)}({var})"
+
+        inner = _value_type(target)
+        if inner is not None:
+            cls = self._bind(namespace, "cls", target)
+            if inner is datetime:
+                return f"{cls}(_datetime.fromisoformat({var}))"
+            return f"{cls}({var})"
+        if isinstance(target, type) and dataclasses.is_dataclass(target):
+            # Nested records were encoded as dicts (or strings, which stay as is)
+            decode = self._bind(namespace, "decode", self._nested_decoder(target))
+            return f"({decode}({var}) if {var}.__class__ is dict else {var})"
+
+        if typing.get_origin(target) in (list, List):
+            args = typing.get_args(target)
+            item_type = _strip_optional(args[0]) if args else Any
+            if item_type in (int, float, bool):
+                # Encoded list elements of these types are strings
+                return f"[{item_type.__name__}(i) for i in {var}]"
+            if isinstance(item_type, type) and dataclasses.is_dataclass(item_type):
+                decode = self._bind(namespace, "decode", self._nested_decoder(item_type))
+                return f"[{decode}(i) if i.__class__ is dict else i for i in {var}]"
+            return f"list({var})"
+        return var
@@ -0,0 +1,287 @@
+"""
+Monte Carlo Gacha Simulation
+
+The gacha entities (``Banner``, ``Pity.record_pull``, ``Pull.create``) model
+one player's pulls one object mutation at a time, and
+``Banner.calculate_total_cost_for_pity`` only covers the worst case. To
+validate a banner design we need the whole distribution, so
+:class:`GachaSimulator` simulates millions of players at once:
+
+- a banner compiles into :class:`GachaRates`: the per-pull SSR probability
+  (base rate, a linear soft-pity ramp, certainty at hard pity) and its
+  cumulative distribution over "pulls until the next SSR";
+- instead of drawing every pull, each round draws the gap to every active
+  player's next SSR by inverse-CDF lookup (conditioned on the pity they
+  already carry), then resolves the 50/50 with the guarantee flag and the
+  featured-guarantee counter, exactly as ``Pity.record_pull`` tracks them;
+- players are split into fixed-size chunks, each with its own child of one
+  ``SeedSequence``, so a seed gives the same result for any worker count.
+  Chunks run in-process or on a process pool.
+
+:class:`GachaSimulationResult` reports pull and gem cost distributions,
+percentiles of each player's featured share of SSRs, and the expected gems
+per featured SSR.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from src.domain.entities.banner import Banner
+
+# Stands in for "no limit" in the integer state arrays
+UNLIMITED = np.iinfo(np.int64).max // 4
+
+PityStart = Union[int, np.ndarray]
+
+
+@dataclass(frozen=True)
+class GachaRates:
+    """The pull rules of one banner. Rates are percentages, as on ``Banner``."""
+    ssr_rate: float
+    soft_pity_threshold: int
+    hard_pity_threshold: int
+    featured_guarantee_pity: int
+    featured_rate: float
+    single_pull_cost: int
+    ten_pull_cost: int
+    # Added to the SSR rate for every pull past soft pity
+    soft_pity_step: float = 6.0
+
+    @classmethod
+    def from_banner(cls, banner: Banner, soft_pity_step: float = 6.0) -> 'GachaRates':
+        return cls(
+            ssr_rate=banner.ssr_rate,
+            soft_pity_threshold=banner.soft_pity_threshold,
+            hard_pity_threshold=banner.hard_pity_threshold,
+            featured_guarantee_pity=banner.featured_guarantee_pity,
+            featured_rate=banner.featured_rate,
+            single_pull_cost=banner.single_pull_cost,
+            ten_pull_cost=banner.ten_pull_cost,
+            soft_pity_step=soft_pity_step,
+        )
+
+    def ssr_probabilities(self) -> np.ndarray:
+        """
+        ``p[k]``: chance that the k-th pull since the last SSR is an SSR.
+
+        Index 0 is unused. Past ``soft_pity_threshold`` pulls without an SSR
+        (``Pity.is_at_soft_pity``) the rate ramps up by ``soft_pity_step``
+        per pull; pull ``hard_pity_threshold`` is always an SSR.
+        """
+        hard = self.hard_pity_threshold
+        k = np.arange(hard + 1)
+        ramp = np.maximum(k - self.soft_pity_threshold, 0) * self.soft_pity_step
+        p = np.minimum((self.ssr_rate + ramp) / 100.0, 1.0)
+        p[0] = 0.0
+        p[hard] = 1.0
+        return p
+
+    def gap_cdf(self) -> np.ndarray:
+        """``cdf[k]``: chance that the next SSR comes within ``k`` pulls."""
+        survival = np.cumprod(1.0 - self.ssr_probabilities())
+        cdf = 1.0 - survival
+        cdf[-1] = 1.0
+        return cdf
+
+    def expected_pulls_per_ssr(self) -> float:
+        """Mean gap between SSRs, from the exact gap distribution."""
+        cdf = self.gap_cdf()
+        return float(np.sum(1.0 - cdf[:-1]))
+
+    def cost_of(self, pulls: Union[int, np.ndarray]) -> np.ndarray:
+        """
+        Gems for ``pulls`` pulls, buying ten-pulls where possible.
+
+        Same rule as ``Banner.calculate_total_cost_for_pity``.
+        """
+        pulls = np.asarray(pulls, dtype=np.int64)
+        return (pulls // 10) * self.ten_pull_cost + (pulls % 10) * self.single_pull_cost
+
+
+@dataclass
+class GachaSimulationResult:
+    """Per-player outcome arrays of one simulation run."""
+    rates: GachaRates
+    pulls: np.ndarray
+    ssr: np.ndarray
+    featured: np.ndarray
+    # Pity carried out of the run, as Pity.pulls_since_last_ssr / guaranteed_featured_next
+    pity: np.ndarray
+    guaranteed: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.pulls)
+
+    @property
+    def gems(self) -> np.ndarray:
+        return self.rates.cost_of(self.pulls)
+
+    def percentiles(self, q: Sequence[float] = (50, 90, 99), of: str = "gems") -> Dict[float, float]:
+        """Percentiles of ``gems``, ``pulls``, ``ssr`` or ``featured`` per player."""
+        values = getattr(self, of)
+        return dict(zip(q, np.percentile(values, q).tolist()))
+
+    def featured_share(self) -> np.ndarray:
+        """Each player's fraction of SSRs that were featured (players with an SSR only)."""
+        has_ssr = self.ssr > 0
+        return self.featured[has_ssr] / self.ssr[has_ssr]
+
+    def featured_rate_percentiles(self, q: Sequence[float] = (10, 50, 90)) -> Dict[float, float]:
+        """Percentiles of :meth:`featured_share` across players."""
+        share = self.featured_share()
+        if not len(share):
+            return {p: float("nan") for p in q}
+        return dict(zip(q, np.percentile(share, q).tolist()))
+
+    def expected_gems_to_featured(self) -> float:
+        """Gems spent per featured SSR obtained, over all players."""
+        featured = int(self.featured.sum())
+        if not featured:
+            return float("inf")
+        return float(self.gems.sum()) / featured
+
+    def cost_distribution(self, bins: Union[int, Sequence[int]] = 20) -> Tuple[np.ndarray, np.ndarray]:
+        """Histogram of gems spent: ``(counts, bin_edges)``."""
+        return np.histogram(self.gems, bins=bins)
+
+
+def _simulate_chunk(
+    rates: GachaRates,
+    seed: np.random.SeedSequence,
+    players: int,
+    budget: int,
+    copies: int,
+    start_pity: np.ndarray,
+    start_guaranteed: np.ndarray,
+) -> Tuple[np.ndarray, ...]:
+    """
+    Simulate one chunk of players until each spends ``budget`` pulls or
+    obtains ``copies`` featured SSRs, whichever comes first.
+
+    Module-level so that process pools can pickle it.
+    """
+    rng = np.random.default_rng(seed)
+    cdf = rates.gap_cdf()
+    featured_chance = rates.featured_rate / 100.0
+
+    pulls = np.zeros(players, dtype=np.int64)
+    ssr = np.zeros(players, dtype=np.int64)
+    featured = np.zeros(players, dtype=np.int64)
+    pity = np.array(start_pity, dtype=np.int64)
+    # Carried-over pity counts towards the featured guarantee too
+    since_featured = pity.copy()
+    guaranteed = np.array(start_guaranteed, dtype=bool)
+
+    active = np.arange(players)
+    while len(active):
+        s = pity[active]
+        remaining = budget - pulls[active]
+
+        # Pulls until the next SSR, given s pulls without one already
+        floor = cdf[s]
+        u = floor + rng.random(len(active)) * (1.0 - floor)
+        gap = np.searchsorted(cdf, u, side="right") - s
+
+        # The featured guarantee forces a featured SSR once reached
+        until_forced = rates.featured_guarantee_pity - since_featured[active]
+        forced = gap >= until_forced
+        gap = np.where(forced, until_forced, gap)
+
+        hit = gap <= remaining
+        missed = active[~hit]
+        pulls[missed] += remaining[~hit]
+        pity[missed] += remaining[~hit]
+        since_featured[missed] += remaining[~hit]
+
+        active, gap, forced = active[hit], gap[hit], forced[hit]
+        won = forced | guaranteed[active] | (rng.random(len(active)) < featured_chance)
+        pulls[active] += gap
+        ssr[active] += 1
+        featured[active] += won
+        pity[active] = 0
+        since_featured[active] = np.where(won, 0, since_featured[active] + gap)
+        guaranteed[active] = ~won
+
+        active = active[(featured[active] < copies) & (pulls[active] < budget)]
+
+    return pulls, ssr, featured, pity, guaranteed
+
+
+class GachaSimulator:
+    """
+    Vectorized Monte Carlo simulation of many players pulling on one banner.
+
+    ``chunk_size`` fixes how players are split (and seeded); ``workers`` > 1
+    runs chunks on a process pool without changing the result.
+    """
+
+    def __init__(
+        self,
+        rates: GachaRates,
+        seed: Optional[int] = None,
+        chunk_size: int = 250_000,
+        workers: int = 1,
+    ):
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be positive")
+        self.rates = rates
+        self.seed = seed
+        self.chunk_size = chunk_size
+        self.workers = workers
+
+    @classmethod
+    def for_banner(cls, banner: Banner, soft_pity_step: float = 6.0, **kwargs) -> 'GachaSimulator':
+        return cls(GachaRates.from_banner(banner, soft_pity_step), **kwargs)
+
+    def until_featured(
+        self,
+        players: int,
+        copies: int = 1,
+        start_pity: PityStart = 0,
+        start_guaranteed: Union[bool, np.ndarray] = False,
+    ) -> GachaSimulationResult:
+        """Pull until each player has ``copies`` featured SSRs."""
+        return self._run(players, UNLIMITED, copies, start_pity, start_guaranteed)
+
+    def with_budget(
+        self,
+        players: int,
+        pulls: int,
+        start_pity: PityStart = 0,
+        start_guaranteed: Union[bool, np.ndarray] = False,
+    ) -> GachaSimulationResult:
+        """Every player spends exactly ``pulls`` pulls."""
+        return self._run(players, pulls, UNLIMITED, start_pity, start_guaranteed)
+
+    def _run(
+        self,
+        players: int,
+        budget: int,
+        copies: int,
+        start_pity: PityStart,
+        start_guaranteed: Union[bool, np.ndarray],
+    ) -> GachaSimulationResult:
+        pity = np.broadcast_to(np.asarray(start_pity, dtype=np.int64), (players,))
+        guaranteed = np.broadcast_to(np.asarray(start_guaranteed, dtype=bool), (players,))
+        if ((pity < 0) | (pity >= self.rates.hard_pity_threshold)).any():
+            raise ValueError("Starting pity must be between 0 and hard pity - 1")
+
+        bounds = list(range(0, players, self.chunk_size)) + [players]
+        seeds = np.random.SeedSequence(self.seed).spawn(len(bounds) - 1)
+        jobs = [
+            (self.rates, seed, end - start, budget, copies, pity[start:end], guaranteed[start:end])
+            for seed, start, end in zip(seeds, bounds, bounds[1:])
+        ]
+
+        if self.workers > 1 and len(jobs) > 1:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                chunks: List[Tuple[np.ndarray, ...]] = list(pool.map(_simulate_chunk, *zip(*jobs)))
+        else:
+            chunks = [_simulate_chunk(*job) for job in jobs]
+
+        if not chunks:
+            empty = np.zeros(0, dtype=np.int64)
+            return GachaSimulationResult(self.rates, empty, empty, empty, empty, empty.astype(bool))
+        return GachaSimulationResult(self.rates, *(np.concatenate(column) for column in zip(*chunks)))
@@ -0,0 +1,237 @@
+"""
+In-Memory Bulk Support
+
+Helpers shared by the in-memory repositories:
+
+- ``IdIndex``: insertion-ordered id set used for the ``_by_world`` /
+  ``_by_tenant`` style secondary indexes. It keeps the list operations the
+  repositories already use (``append``, ``remove``, ``in``, slicing) but makes
+  membership checks O(1), so saving N entities is no longer O(N^2). It also
+  keeps its ids sorted, so ``after`` seeks to a keyset page in O(log N).
+- ``InMemoryKeysetPaginationMixin``: ``page_by_world`` / ``page_by_tenant``
+  and the lazy ``stream_by_world`` / ``stream_by_tenant`` generators for
+  repositories with ``_by_world`` / ``_by_tenant`` id indexes.
+- ``InMemoryBulkMixin``: batched ``save_many`` / ``find_many`` /
+  ``delete_many`` for the generic repositories that keep every entity in a
+  single ``(tenant_id, entity_id) -> entity`` dict.
+"""
+import heapq
+from bisect import bisect_left, bisect_right, insort
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from src.domain.repositories.bulk import BulkOperationsMixin
+from src.domain.repositories.pagination import STREAM_BATCH_SIZE, CursorPaginationMixin
+from src.domain.value_objects.common import TenantId, EntityId
+
+
+def _id_key(entity_id: Any) -> Any:
+    """Sort key of an ``EntityId`` (or a plain id)."""
+    return getattr(entity_id, "value", entity_id)
+
+
+class IdIndex:
+    """Insertion-ordered set of entity ids with a list-like interface."""
+
+    __slots__ = ("_ids", "_sorted")
+
+    def __init__(self, ids: Iterable[Any] = ()):
+        self._ids: Dict[Any, None] = dict.fromkeys(ids)
+        self._sorted: List[Any] = sorted(self._ids, key=_id_key)
+
+    def append(self, entity_id: Any) -> None:
+        if entity_id in self._ids:
+            return
+        self._ids[entity_id] = None
+        # New ids are allocated in increasing order, so this is nearly always an append
+        if not self._sorted or _id_key(self._sorted[-1]) < _id_key(entity_id):
+            self._sorted.append(entity_id)
+        else:
+            insort(self._sorted, entity_id, key=_id_key)
+
+    def extend(self, entity_ids: Iterable[Any]) -> None:
+        for entity_id in entity_ids:
+            self.append(entity_id)
+
+    def remove(self, entity_id: Any) -> None:
+        try:
+            del self._ids[entity_id]
+        except KeyError:
+            raise ValueError(f"{entity_id!r} not in index") from None
+        del self._sorted[bisect_left(self._sorted, _id_key(entity_id), key=_id_key)]
+
+    def discard(self, entity_id: Any) -> None:
+        if entity_id in self._ids:
+            self.remove(entity_id)
+
+    def after(self, entity_id: Optional[Any], limit: int) -> List[Any]:
+        """Up to ``limit`` ids greater than ``entity_id`` (None: from the start), in id order."""
+        start = 0 if entity_id is None else bisect_right(self._sorted, _id_key(entity_id), key=_id_key)
+        return self._sorted[start:start + limit]
+
+    def __contains__(self, entity_id: Any) -> bool:
+        return entity_id in self._ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._ids)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self._ids))
+            return list(islice(self._ids, start, stop, step))
+        if index < 0:
+            index += len(self._ids)
+        if not 0 <= index < len(self._ids):
+            raise IndexError("IdIndex index out of range")
+        return next(islice(self._ids, index, None))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, IdIndex):
+            return list(self._ids) == list(other._ids)
+        if isinstance(other, list):
+            return list(self._ids) == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"IdIndex({list(self._ids)!r})"
+
+
+class InMemoryKeysetPaginationMixin(CursorPaginationMixin):
+    """
+    Keyset pagination for in-memory repositories.
+
+    Pages are read from the ``IdIndex`` dicts named by ``_world_index_attr``
+    (keyed by ``(tenant_id, world_id)``) and ``_tenant_index_attr`` (keyed by
+    ``tenant_id``); entities come from the dict named by ``_store_attr``.
+    Repositories without such an index fall back to filtering the store,
+    which reads every entity but never materialises skipped pages; their
+    streams walk the store once instead of once per batch.
+    """
+
+    _store_attr = "_entities"
+    _world_index_attr: Optional[str] = "_by_world"
+    _tenant_index_attr: Optional[str] = "_by_tenant"
+
+    def _indexes(self, index_attr: Optional[str]) -> Optional[Dict[Any, IdIndex]]:
+        return getattr(self, index_attr, None) if index_attr else None
+
+    def _page_from_index(
+        self,
+        index_attr: str,
+        key: Any,
+        tenant_id: TenantId,
+        after_id: Optional[EntityId],
+        limit: int,
+    ) -> Optional[List[Any]]:
+        indexes = self._indexes(index_attr)
+        if indexes is None:
+            return None
+        index = indexes.get(key)
+        if index is None:
+            return []
+        store = getattr(self, self._store_attr)
+        found = (store.get((tenant_id, entity_id)) for entity_id in index.after(after_id, limit))
+        return [entity for entity in found if entity is not None]
+
+    def _page_from_store(self, matches, after_id: Optional[EntityId], limit: int) -> List[Any]:
+        after = after_id.value if after_id is not None else 0
+        candidates = (
+            entity for entity in getattr(self, self._store_attr).values()
+            if entity.id.value > after and matches(entity)
+        )
+        return heapq.nsmallest(limit, candidates, key=lambda entity: entity.id.value)
+
+    def _stream_store(self, matches: Callable[[Any], bool]) -> Iterator[Any]:
+        # Iterate a snapshot of the keys so saves during the stream are safe
+        store = getattr(self, self._store_attr)
+        for key in tuple(store):
+            entity = store.get(key)
+            if entity is not None and matches(entity):
+                yield entity
+
+    def stream_by_world(
+        self,
+        tenant_id: TenantId,
+        world_id: EntityId,
+        batch_size: int = STREAM_BATCH_SIZE,
+    ) -> Iterator[Any]:
+        if self._indexes(self._world_index_attr) is not None:
+            return super().stream_by_world(tenant_id, world_id, batch_size)
+        return self._stream_store(
+            lambda entity: entity.tenant_id == tenant_id and getattr(entity, "world_id", None) == world_id
+        )
+
+    def stream_by_tenant(
+        self,
+        tenant_id: TenantId,
+        batch_size: int = STREAM_BATCH_SIZE,
+    ) -> Iterator[Any]:
+        if self._indexes(self._tenant_index_attr) is not None:
+            return super().stream_by_tenant(tenant_id, batch_size)
+        return self._stream_store(lambda entity: entity.tenant_id == tenant_id)
+
+    def _page_after_world(
+        self,
+        tenant_id: TenantId,
+        world_id: EntityId,
+        after_id: Optional[EntityId],
+        limit: int,
+    ) -> List[Any]:
+        page = self._page_from_index(self._world_index_attr, (tenant_id, world_id), tenant_id, after_id, limit)
+        if page is not None:
+            return page
+        return self._page_from_store(
+            lambda entity: entity.tenant_id == tenant_id and getattr(entity, "world_id", None) == world_id,
+            after_id,
+            limit,
+        )
+
+    def _page_after_tenant(
+        self,
+        tenant_id: TenantId,
+        after_id: Optional[EntityId],
+        limit: int,
+    ) -> List[Any]:
+        page = self._page_from_index(self._tenant_index_attr, tenant_id, tenant_id, after_id, limit)
+        if page is not None:
+            return page
+        return self._page_from_store(lambda entity: entity.tenant_id == tenant_id, after_id, limit)
+
+
+class InMemoryBulkMixin(InMemoryKeysetPaginationMixin, BulkOperationsMixin):
+    """
+    Dict-backed bulk operations for generic in-memory repositories.
+
+    The repository must keep its entities in the dict named by ``_store_attr``
+    (keyed by ``(tenant_id, entity_id)``) and allocate ids from ``_next_id``.
+    """
+
+    _store_attr = "_entities"
+
+    def _bulk_store(self) -> Dict[Any, Any]:
+        return getattr(self, self._store_attr)
+
+    def save_many(self, entities: Iterable[Any]) -> List[Any]:
+        entities = list(entities)
+        for entity in entities:
+            if entity.id is None:
+                object.__setattr__(entity, 'id', EntityId(self._next_id))
+                self._next_id += 1
+        self._bulk_store().update({(entity.tenant_id, entity.id): entity for entity in entities})
+        return entities
+
+    def find_many(self, tenant_id: TenantId, entity_ids: Sequence[EntityId]) -> List[Any]:
+        store = self._bulk_store()
+        found = (store.get((tenant_id, entity_id)) for entity_id in entity_ids)
+        return [entity for entity in found if entity is not None]
+
+    def delete_many(self, tenant_id: TenantId, entity_ids: Sequence[EntityId]) -> int:
+        store = self._bulk_store()
+        deleted = 0
+        for entity_id in entity_ids:
+            if store.pop((tenant_id, entity_id), None) is not None:
+                deleted += 1
+        return deleted
@@ -33,22 +33,27 @@ from src.domain.value_objects.common import (
     TenantId, EntityId, WorldName, CharacterName, TimeOfDay, Weather, Lighting
 )
 from src.domain.exceptions import DuplicateEntity, EntityNotFound
+from src.domain.repositories.bulk import BulkOperationsMixin
+from src.infrastructure.in_memory_bulk import IdIndex, InMemoryBulkMixin, InMemoryKeysetPaginationMixin
+from src.infrastructure.in_memory_search import InMemoryFullTextSearchMixin
 
 
-class InMemoryWorldRepository(IWorldRepository):
+class InMemoryWorldRepository(InMemoryKeysetPaginationMixin, IWorldRepository):
     """
     In-memory implementation of World repository for testing.
 
     Stores worlds in memory using dictionaries for fast access.
     """
 
+    _store_attr = "_worlds"
+
     def __init__(self):
         # Storage: (tenant_id, world_id) -> World
         self._worlds: Dict[Tuple[TenantId, EntityId], World] = {}
         # Index: (tenant_id, world_name) -> world_id
         self._names: Dict[Tuple[TenantId, WorldName], EntityId] = {}
         # Index: tenant_id -> list of world_ids
-        self._by_tenant: Dict[TenantId, List[EntityId]] = defaultdict(list)
+        self._by_tenant: Dict[TenantId, IdIndex] = defaultdict(IdIndex)
         # ID counter for generating new IDs
         self._next_id = 1
 
@@ -116,24 +121,29 @@ class InMemoryWorldRepository(IWorldRepository):
         return (tenant_id, name) in self._names
 
 
-class InMemoryCharacterRepository(ICharacterRepository):
+class InMemoryCharacterRepository(InMemoryKeysetPaginationMixin, InMemoryFullTextSearchMixin, ICharacterRepository):
     """
     In-memory implementation of Character repository for testing.
 
     Stores characters in memory with proper indexing for fast access.
     """
 
+    _store_attr = "_characters"
+    _search_fields = {"name": "name", "backstory": "backstory"}
+
     def __init__(self):
         # Storage: (tenant_id, character_id) -> Character
         self._characters: Dict[Tuple[TenantId, EntityId], Character] = {}
         # Index: (tenant_id, world_id, character_name) -> character_id
         self._names: Dict[Tuple[TenantId, EntityId, CharacterName], EntityId] = {}
         # Index: (tenant_id, world_id) -> list of character_ids
-        self._by_world: Dict[Tuple[TenantId, EntityId], List[EntityId]] = defaultdict(list)
+        self._by_world: Dict[Tuple[TenantId, EntityId], IdIndex] = defaultdict(IdIndex)
         # Index: tenant_id -> list of character_ids
-        self._by_tenant: Dict[TenantId, List[EntityId]] = defaultdict(list)
+        self._by_tenant: Dict[TenantId, IdIndex] = defaultdict(IdIndex)
         # ID counter for generating new IDs
         self._next_id = 1
+        # Full-text index over the searchable fields
+        self._text_index = self._create_text_index()
 
     def save(self, character: Character) -> Character:
         # Assign ID if this is a new character
@@ -162,6 +172,8 @@ class InMemoryCharacterRepository(ICharacterRepository):
         if character.id not in self._by_tenant[character.tenant_id]:
             self._by_tenant[character.tenant_id].append(character.id)
 
+        self._index_text(key, character)
+
         return character
 
     def find_by_id(self, tenant_id: TenantId, character_id: EntityId) -> Optional[Character]:
@@ -193,14 +205,8 @@ class InMemoryCharacterRepository(ICharacterRepository):
         return characters
 
     def search_by_backstory(self, tenant_id: TenantId, search_term: str, limit: int = 20) -> List[Character]:
-        """Simple substring search in backstories."""
-        results = []
-        for character in self._characters.values():
-            if character.tenant_id == tenant_id and search_term.lower() in character.backstory.value.lower():
-                results.append(character)
-                if len(results) >= limit:
-                    break
-        return results
+        """Full-text search in backstories."""
+        return self._search_entities(tenant_id, search_term, limit, columns=("backstory",))
 
     def delete(self, tenant_id: TenantId, character_id: EntityId) -> bool:
         key = (tenant_id, character_id)
@@ -221,6 +227,7 @@ class InMemoryCharacterRepository(ICharacterRepository):
         if character_id in self._by_tenant[tenant_id]:
             self._by_tenant[tenant_id].remove(character_id)
 
+        self._unindex_text(key)
         del self._characters[key]
         return True
 
@@ -228,12 +235,14 @@ class InMemoryCharacterRepository(ICharacterRepository):
         return (tenant_id, world_id, name) in self._names
 
 
-class InMemoryStoryRepository:
+class InMemoryStoryRepository(InMemoryKeysetPaginationMixin, BulkOperationsMixin):
     """In-memory implementation of Story repository for testing."""
 
+    _store_attr = "_stories"
+
     def __init__(self):
         self._stories: Dict[Tuple[TenantId, EntityId], "Story"] = {}
-        self._by_world: Dict[Tuple[TenantId, EntityId], List[EntityId]] = defaultdict(list)
+        self._by_world: Dict[Tuple[TenantId, EntityId], IdIndex] = defaultdict(IdIndex)
         self._next_id = 1
 
     def save(self, story: "Story") -> "Story":
@@ -280,12 +289,14 @@ class InMemoryStoryRepository:
         return True
 
 
-class InMemoryEventRepository:
+class InMemoryEventRepository(InMemoryKeysetPaginationMixin, BulkOperationsMixin):
     """In-memory implementation of Event repository for testing."""
 
+    _store_attr = "_events"
+
     def __init__(self):
         self._events: Dict[Tuple[TenantId, EntityId], "Event"] = {}
-        self._by_world: Dict[Tuple[TenantId, EntityId], List[EntityId]] = defaultdict(list)
+        self._by_world: Dict[Tuple[TenantId, EntityId], IdIndex] = defaultdict(IdIndex)
         self._next_id = 1
 
     def save(self, event: "Event") -> "Event":
@@ -332,12 +343,14 @@ class InMemoryEventRepository:
         return True
 
 
-class InMemoryPageRepository:
+class InMemoryPageRepository(InMemoryKeysetPaginationMixin, BulkOperationsMixin):
     """In-memory implementation of Page repository for testing."""
 
+    _store_attr = "_pages"
+
     def __init__(self):
         self._pages: Dict[Tuple[TenantId, EntityId], "Page"] = {}
-        self._by_world: Dict[Tuple[TenantId, EntityId], List[EntityId]] = defaultdict(list)
+        self._by_world: Dict[Tuple[TenantId, EntityId], IdIndex] = defaultdict(IdIndex)
         self._next_id = 1
 
     def save(self, page: "Page") -> "Page":
@@ -384,24 +397,29 @@ class InMemoryPageRepository:
         return True
 
 
-class InMemoryItemRepository(IItemRepository):
+class InMemoryItemRepository(InMemoryKeysetPaginationMixin, InMemoryFullTextSearchMixin, IItemRepository):
     """
     In-memory implementation of Item repository for testing.
 
     Stores items in memory with proper indexing for fast access.
     """
 
+    _store_attr = "_items"
+    _search_fields = {"name": "name", "description": "description"}
+
     def __init__(self):
         # Storage: (tenant_id, item_id) -> Item
         self._items: Dict[Tuple[TenantId, EntityId], Item] = {}
         # Index: (tenant_id, world_id, item_name) -> item_id
         self._names: Dict[Tuple[TenantId, EntityId, str], EntityId] = {}
         # Index: (tenant_id, world_id) -> list of item_ids
-        self._by_world: Dict[Tuple[TenantId, EntityId], List[EntityId]] = defaultdict(list)
+        self._by_world: Dict[Tuple[TenantId, EntityId], IdIndex] = defaultdict(IdIndex)
         # Index: tenant_id -> list of item_ids
-        self._by_tenant: Dict[TenantId, List[EntityId]] = defaultdict(list)
+        self._by_tenant: Dict[TenantId, IdIndex] = defaultdict(IdIndex)
         # ID counter for generating new IDs
         self._next_id = 1
+        # Full-text index over the searchable fields
+        self._text_index = self._create_text_index()
 
     def save(self, item: Item) -> Item:
         # Assign ID if this is a new item
@@ -430,6 +448,8 @@ class InMemoryItemRepository(IItemRepository):
         if item.id not in self._by_tenant[item.tenant_id]:
             self._by_tenant[item.tenant_id].append(item.id)
 
+        self._index_text(key, item)
+
         return item
 
     def find_by_id(self, tenant_id: TenantId, item_id: EntityId) -> Optional[Item]:
@@ -455,14 +475,8 @@ class InMemoryItemRepository(IItemRepository):
         return items
 
     def search_by_name(self, tenant_id: TenantId, search_term: str, limit: int = 20) -> List[Item]:
-        """Simple substring search in item names."""
-        results = []
-        for item in self._items.values():
-            if item.tenant_id == tenant_id and search_term.lower() in item.name.lower():
-                results.append(item)
-                if len(results) >= limit:
-                    break
-        return results
+        """Full-text search in item names."""
+        return self._search_entities(tenant_id, search_term, limit, columns=("name",))
 
     def delete(self, tenant_id: TenantId, item_id: EntityId) -> bool:
         key = (tenant_id, item_id)
@@ -483,6 +497,7 @@ class InMemoryItemRepository(IItemRepository):
         if item_id in self._by_tenant[tenant_id]:
             self._by_tenant[tenant_id].remove(item_id)
 
+        self._unindex_text(key)
         del self._items[key]
         return True
 
@@ -490,26 +505,31 @@ class InMemoryItemRepository(IItemRepository):
         return (tenant_id, world_id, name) in self._names
 
 
-class InMemoryLocationRepository(ILocationRepository):
+class InMemoryLocationRepository(InMemoryKeysetPaginationMixin, InMemoryFullTextSearchMixin, ILocationRepository):
     """
     In-memory implementation of Location repository for testing.
 
     Stores locations in memory with proper indexing for fast access.
     """
 
+    _store_attr = "_locations"
+    _search_fields = {"name": "name", "description": "description"}
+
     def __init__(self):
         # Storage: (tenant_id, location_id) -> Location
         self._locations: Dict[Tuple[TenantId, EntityId], Location] = {}
         # Index: (tenant_id, world_id, location_name) -> location_id
         self._names: Dict[Tuple[TenantId, EntityId, str], EntityId] = {}
         # Index: (tenant_id, world_id) -> list of location_ids
-        self._by_world: Dict[Tuple[TenantId, EntityId], List[EntityId]] = defaultdict(list)
+        self._by_world: Dict[Tuple[TenantId, EntityId], IdIndex] = defaultdict(IdIndex)
         # Index: (tenant_id, world_id, location_type) -> list of location_ids
-        self._by_type: Dict[Tuple[TenantId, EntityId, str], List[EntityId]] = defaultdict(list)
+        self._by_type: Dict[Tuple[TenantId, EntityId, str], IdIndex] = defaultdict(IdIndex)
         # Index: tenant_id -> list of location_ids
-        self._by_tenant: Dict[TenantId, List[EntityId]] = defaultdict(list)
+        self._by_tenant: Dict[TenantId, IdIndex] = defaultdict(IdIndex)
         # ID counter for generating new IDs
         self._next_id = 1
+        # Full-text index over the searchable fields
+        self._text_index = self._create_text_index()
 
     def save(self, location: Location) -> Location:
         # Assign ID if this is a new location
@@ -543,6 +563,8 @@ class InMemoryLocationRepository(ILocationRepository):
         if location.id not in self._by_tenant[location.tenant_id]:
             self._by_tenant[location.tenant_id].append(location.id)
 
+        self._index_text(key, location)
+
         return location
 
     def find_by_id(self, tenant_id: TenantId, location_id: EntityId) -> Optional[Location]:
@@ -568,14 +590,8 @@ class InMemoryLocationRepository(ILocationRepository):
         return locations
 
     def search_by_name(self, tenant_id: TenantId, search_term: str, limit: int = 20) -> List[Location]:
-        """Simple substring search in location names."""
-        results = []
-        for location in self._locations.values():
-            if location.tenant_id == tenant_id and search_term.lower() in location.name.lower():
-                results.append(location)
-                if len(results) >= limit:
-                    break
-        return results
+        """Full-text search in location names."""
+        return self._search_entities(tenant_id, search_term, limit, columns=("name",))
 
     def find_by_type(self, tenant_id: TenantId, world_id: EntityId, location_type: str, limit: int = 50) -> List[Location]:
         type_key = (tenant_id, world_id, location_type)
@@ -610,6 +626,7 @@ class InMemoryLocationRepository(ILocationRepository):
         if location_id in self._by_tenant[tenant_id]:
             self._by_tenant[tenant_id].remove(location_id)
 
+        self._unindex_text(key)
         del self._locations[key]
         return True
 
@@ -617,30 +634,35 @@ class InMemoryLocationRepository(ILocationRepository):
         return (tenant_id, world_id, name) in self._names
 
 
-class InMemoryEnvironmentRepository(IEnvironmentRepository):
+class InMemoryEnvironmentRepository(InMemoryKeysetPaginationMixin, InMemoryFullTextSearchMixin, IEnvironmentRepository):
     """
     In-memory implementation of Environment repository for testing.
 
     Stores environments in memory with proper indexing for fast access.
     """
 
+    _store_attr = "_environments"
+    _search_fields = {"name": "name", "description": "description"}
+
     def __init__(self):
         # Storage: (tenant_id, environment_id) -> Environment
         self._environments: Dict[Tuple[TenantId, EntityId], Environment] = {}
         # Index: (tenant_id, location_id, environment_name) -> environment_id
         self._names: Dict[Tuple[TenantId, EntityId, str], EntityId] = {}
         # Index: (tenant_id, world_id) -> list of environment_ids
-        self._by_world: Dict[Tuple[TenantId, EntityId], List[EntityId]] = defaultdict(list)
+        self._by_world: Dict[Tuple[TenantId, EntityId], IdIndex] = defaultdict(IdIndex)
         # Index: (tenant_id, location_id) -> list of environment_ids
-        self._by_location: Dict[Tuple[TenantId, EntityId], List[EntityId]] = defaultdict(list)
+        self._by_location: Dict[Tuple[TenantId, EntityId], IdIndex] = defaultdict(IdIndex)
         # Index: (tenant_id, world_id, time_of_day, weather, lighting) -> list of environment_ids
-        self._by_conditions: Dict[Tuple[TenantId, EntityId, str, str, str], List[EntityId]] = defaultdict(list)
+        self._by_conditions: Dict[Tuple[TenantId, EntityId, str, str, str], IdIndex] = defaultdict(IdIndex)
         # Index: (tenant_id, location_id) -> active environment_id
         self._active_by_location: Dict[Tuple[TenantId, EntityId], EntityId] = {}
         # Index: tenant_id -> list of environment_ids
-        self._by_tenant: Dict[TenantId, List[EntityId]] = defaultdict(list)
+        self._by_tenant: Dict[TenantId, IdIndex] = defaultdict(IdIndex)
         # ID counter for generating new IDs
         self._next_id = 1
+        # Full-text index over the searchable fields
+        self._text_index = self._create_text_index()
 
     def save(self, environment: Environment) -> Environment:
         # Assign ID if this is a new environment
@@ -692,6 +714,8 @@ class InMemoryEnvironmentRepository(IEnvironmentRepository):
         if environment.id not in self._by_tenant[environment.tenant_id]:
             self._by_tenant[environment.tenant_id].append(environment.id)
 
+        self._index_text(key, environment)
+
         return environment
 
     def find_by_id(self, tenant_id: TenantId, environment_id: EntityId) -> Optional[Environment]:
@@ -727,14 +751,8 @@ class InMemoryEnvironmentRepository(IEnvironmentRepository):
         return environments
 
     def search_by_name(self, tenant_id: TenantId, search_term: str, limit: int = 20) -> List[Environment]:
-        """Simple substring search in environment names."""
-        results = []
-        for environment in self._environments.values():
-            if environment.tenant_id == tenant_id and search_term.lower() in environment.name.lower():
-                results.append(environment)
-                if len(results) >= limit:
-                    break
-        return results
+        """Full-text search in environment names."""
+        return self._search_entities(tenant_id, search_term, limit, columns=("name",))
 
     def find_by_conditions(
         self,
@@ -822,6 +840,7 @@ class InMemoryEnvironmentRepository(IEnvironmentRepository):
         if environment_id in self._by_tenant[tenant_id]:
             self._by_tenant[tenant_id].remove(environment_id)
 
+        self._unindex_text(key)
         del self._environments[key]
         return True
 
@@ -829,15 +848,20 @@ class InMemoryEnvironmentRepository(IEnvironmentRepository):
         return (tenant_id, location_id, name) in self._names
 
 
-class InMemoryTextureRepository:
+class InMemoryTextureRepository(InMemoryKeysetPaginationMixin, BulkOperationsMixin):
     """
     In-memory implementation of Texture repository.
     """
 
+    _store_attr = "_textures"
+    # _by_world is keyed by tenant only
+    _world_index_attr = None
+    _tenant_index_attr = "_by_world"
+
     def __init__(self):
         self._textures: Dict[Tuple[TenantId, EntityId], Texture] = {}
         self._names: Dict[Tuple[TenantId, str], EntityId] = {}
-        self._by_world: Dict[TenantId, List[EntityId]] = defaultdict(list)
+        self._by_world: Dict[TenantId, IdIndex] = defaultdict(IdIndex)
         self._next_id = 1
 
     def save(self, texture: Texture) -> Texture:
@@ -873,9 +897,12 @@ class InMemoryTextureRepository:
         
         return texture
 
-    def get_by_id(self, tenant_id: TenantId, texture_id: EntityId) -> Optional[Texture]:
+    def find_by_id(self, tenant_id: TenantId, texture_id: EntityId) -> Optional[Texture]:
         return self._textures.get((tenant_id, texture_id))
 
+    # Older name kept for existing callers
+    get_by_id = find_by_id
+
     def list_by_world(self, tenant_id: TenantId, limit: int = 100, offset: int = 0) -> List[Texture]:
         texture_ids = self._by_world.get(tenant_id, [])[offset:offset + limit]
         return [self._textures[(tenant_id, tid)] for tid in texture_ids if (tenant_id, tid) in self._textures]
@@ -897,15 +924,20 @@ class InMemoryTextureRepository:
         return True
 
 
-class InMemoryModel3DRepository:
+class InMemoryModel3DRepository(InMemoryKeysetPaginationMixin, BulkOperationsMixin):
     """
     In-memory implementation of 3D Model repository.
     """
 
+    _store_attr = "_models"
+    # _by_world is keyed by tenant only
+    _world_index_attr = None
+    _tenant_index_attr = "_by_world"
+
     def __init__(self):
         self._models: Dict[Tuple[TenantId, EntityId], Model3D] = {}
         self._names: Dict[Tuple[TenantId, str], EntityId] = {}
-        self._by_world: Dict[TenantId, List[EntityId]] = defaultdict(list)
+        self._by_world: Dict[TenantId, IdIndex] = defaultdict(IdIndex)
         self._next_id = 1
 
     def save(self, model: Model3D) -> Model3D:
@@ -943,9 +975,12 @@ class InMemoryModel3DRepository:
         
         return model
 
-    def get_by_id(self, tenant_id: TenantId, model_id: EntityId) -> Optional[Model3D]:
+    def find_by_id(self, tenant_id: TenantId, model_id: EntityId) -> Optional[Model3D]:
         return self._models.get((tenant_id, model_id))
 
+    # Older name kept for existing callers
+    get_by_id = find_by_id
+
     def list_by_world(self, tenant_id: TenantId, limit: int = 100, offset: int = 0) -> List[Model3D]:
         model_ids = self._by_world.get(tenant_id, [])[offset:offset + limit]
         return [self._models[(tenant_id, mid)] for mid in model_ids if (tenant_id, mid) in self._models]
@@ -966,13 +1001,15 @@ class InMemoryModel3DRepository:
         
         return True
 
-class InMemorySessionRepository:
+class InMemorySessionRepository(InMemoryKeysetPaginationMixin, BulkOperationsMixin):
     """In-memory implementation of Session repository for testing."""
 
+    _store_attr = "_sessions"
+
     def __init__(self):
         self._sessions: Dict[Tuple[TenantId, EntityId], object] = {}
-        self._by_world: Dict[Tuple[TenantId, EntityId], List[EntityId]] = defaultdict(list)
-        self._by_story: Dict[Tuple[TenantId, EntityId], List[EntityId]] = defaultdict(list)
+        self._by_world: Dict[Tuple[TenantId, EntityId], IdIndex] = defaultdict(IdIndex)
+        self._by_story: Dict[Tuple[TenantId, EntityId], IdIndex] = defaultdict(IdIndex)
         self._next_id = 1
 
     def save(self, session: object) -> object:
@@ -1050,13 +1087,15 @@ from src.domain.entities.template import Template
 from src.domain.repositories.template_repository import ITemplateRepository
 
 
-class InMemoryTagRepository(ITagRepository):
+class InMemoryTagRepository(InMemoryKeysetPaginationMixin, ITagRepository):
     """In-memory implementation of Tag repository for testing."""
 
+    _store_attr = "_tags"
+
     def __init__(self):
         self._tags: Dict[Tuple[TenantId, EntityId], Tag] = {}
         self._names: Dict[Tuple[TenantId, EntityId, str, str], EntityId] = {}
-        self._by_world: Dict[Tuple[TenantId, EntityId], List[EntityId]] = defaultdict(list)
+        self._by_world: Dict[Tuple[TenantId, EntityId], IdIndex] = defaultdict(IdIndex)
         self._next_id = 1
 
     def save(self, tag: Tag) -> Tag:
@@ -1126,13 +1165,18 @@ class InMemoryTagRepository(ITagRepository):
         return name_key in self._names
 
 
-class InMemoryNoteRepository(INoteRepository):
+class InMemoryNoteRepository(InMemoryKeysetPaginationMixin, InMemoryFullTextSearchMixin, INoteRepository):
     """In-memory implementation of Note repository for testing."""
 
+    _store_attr = "_notes"
+    _search_fields = {"title": "title", "content": "content"}
+
     def __init__(self):
         self._notes: Dict[Tuple[TenantId, EntityId], Note] = {}
-        self._by_world: Dict[Tuple[TenantId, EntityId], List[EntityId]] = defaultdict(list)
+        self._by_world: Dict[Tuple[TenantId, EntityId], IdIndex] = defaultdict(IdIndex)
         self._next_id = 1
+        # Full-text index over the searchable fields
+        self._text_index = self._create_text_index()
 
     def save(self, note: Note) -> Note:
         if note.id is None:
@@ -1147,6 +1191,8 @@ class InMemoryNoteRepository(INoteRepository):
         if note.id not in self._by_world[world_key]:
             self._by_world[world_key].append(note.id)
 
+        self._index_text(key, note)
+
         return note
 
     def find_by_id(self, tenant_id: TenantId, note_id: EntityId) -> Optional[Note]:
@@ -1167,14 +1213,7 @@ class InMemoryNoteRepository(INoteRepository):
         return [n for n in all_notes if n.is_pinned][offset:offset + limit]
 
     def search_by_content(self, tenant_id: TenantId, search_term: str, limit: int = 20) -> List[Note]:
-        results = []
-        for note in self._notes.values():
-            if note.tenant_id == tenant_id:
-                if search_term.lower() in note.content.lower() or search_term.lower() in note.title.lower():
-                    results.append(note)
-                    if len(results) >= limit:
-                        break
-        return results
+        return self._search_entities(tenant_id, search_term, limit)
 
     def delete(self, tenant_id: TenantId, note_id: EntityId) -> bool:
         key = (tenant_id, note_id)
@@ -1186,17 +1225,20 @@ class InMemoryNoteRepository(INoteRepository):
         if note_id in self._by_world[world_key]:
             self._by_world[world_key].remove(note_id)
 
+        self._unindex_text(key)
         del self._notes[key]
         return True
 
 
-class InMemoryTemplateRepository(ITemplateRepository):
+class InMemoryTemplateRepository(InMemoryKeysetPaginationMixin, ITemplateRepository):
     """In-memory implementation of Template repository for testing."""
 
+    _store_attr = "_templates"
+
     def __init__(self):
         self._templates: Dict[Tuple[TenantId, EntityId], Template] = {}
         self._names: Dict[Tuple[TenantId, EntityId, str], EntityId] = {}
-        self._by_world: Dict[Tuple[TenantId, EntityId], List[EntityId]] = defaultdict(list)
+        self._by_world: Dict[Tuple[TenantId, EntityId], IdIndex] = defaultdict(IdIndex)
         self._next_id = 1
 
     def save(self, template: Template) -> Template:
@@ -1276,8 +1318,8 @@ class InMemoryChoiceRepository(IChoiceRepository):
     def __init__(self):
         from src.domain.repositories.choice_repository import IChoiceRepository
         self._choices: Dict[Tuple[TenantId, EntityId], object] = {}
-        self._by_story: Dict[Tuple[TenantId, EntityId], List[EntityId]] = defaultdict(list)
-        self._by_world: Dict[Tuple[TenantId, EntityId], List[EntityId]] = defaultdict(list)
+        self._by_story: Dict[Tuple[TenantId, EntityId], IdIndex] = defaultdict(IdIndex)
+        self._by_world: Dict[Tuple[TenantId, EntityId], IdIndex] = defaultdict(IdIndex)
         self._next_id = 1
 
     def save(self, choice: object) -> object:
@@ -1346,13 +1388,15 @@ class InMemoryChoiceRepository(IChoiceRepository):
         return True
 
 
-class InMemoryFlowchartRepository:
+class InMemoryFlowchartRepository(InMemoryKeysetPaginationMixin, BulkOperationsMixin):
     """In-memory implementation of Flowchart repository for testing."""
 
+    _store_attr = "_flowcharts"
+
     def __init__(self):
         self._flowcharts: Dict[Tuple[TenantId, EntityId], object] = {}
-        self._by_world: Dict[Tuple[TenantId, EntityId], List[EntityId]] = defaultdict(list)
-        self._by_story: Dict[Tuple[TenantId, EntityId], List[EntityId]] = defaultdict(list)
+        self._by_world: Dict[Tuple[TenantId, EntityId], IdIndex] = defaultdict(IdIndex)
+        self._by_story: Dict[Tuple[TenantId, EntityId], IdIndex] = defaultdict(IdIndex)
         self._next_id = 1
 
     def save(self, flowchart: object) -> object:
@@ -1424,13 +1468,15 @@ class InMemoryFlowchartRepository:
         return True
 
 
-class InMemoryHandoutRepository(IHandoutRepository):
+class InMemoryHandoutRepository(InMemoryKeysetPaginationMixin, IHandoutRepository):
     """In-memory implementation of Handout repository for testing."""
 
+    _store_attr = "_handouts"
+
     def __init__(self):
         self._handouts: Dict[Tuple[TenantId, EntityId], object] = {}
-        self._by_world: Dict[Tuple[TenantId, EntityId], List[EntityId]] = defaultdict(list)
-        self._by_session: Dict[Tuple[TenantId, EntityId], List[EntityId]] = defaultdict(list)
+        self._by_world: Dict[Tuple[TenantId, EntityId], IdIndex] = defaultdict(IdIndex)
+        self._by_session: Dict[Tuple[TenantId, EntityId], IdIndex] = defaultdict(IdIndex)
         self._next_id = 1
 
     def save(self, handout: object) -> object:
@@ -1499,12 +1545,14 @@ class InMemoryHandoutRepository(IHandoutRepository):
         return True
 
 
-class InMemoryImageRepository(IImageRepository):
+class InMemoryImageRepository(InMemoryKeysetPaginationMixin, IImageRepository):
     """In-memory implementation of Image repository for testing."""
 
+    _store_attr = "_images"
+
     def __init__(self):
         self._images: Dict[Tuple[TenantId, EntityId], object] = {}
-        self._by_world: Dict[Tuple[TenantId, EntityId], List[EntityId]] = defaultdict(list)
+        self._by_world: Dict[Tuple[TenantId, EntityId], IdIndex] = defaultdict(IdIndex)
         self._paths: Dict[Tuple[TenantId, EntityId, str], EntityId] = {}
         self._next_id = 1
 
@@ -1568,13 +1616,18 @@ class InMemoryImageRepository(IImageRepository):
         return path_key in self._paths
 
 
-class InMemoryInspirationRepository:
+class InMemoryInspirationRepository(InMemoryKeysetPaginationMixin, InMemoryFullTextSearchMixin, BulkOperationsMixin):
     """In-memory implementation of Inspiration repository for testing."""
 
+    _store_attr = "_inspirations"
+    _search_fields = {"content": "content"}
+
     def __init__(self):
         self._inspirations: Dict[Tuple[TenantId, EntityId], object] = {}
-        self._by_world: Dict[Tuple[TenantId, EntityId], List[EntityId]] = defaultdict(list)
+        self._by_world: Dict[Tuple[TenantId, EntityId], IdIndex] = defaultdict(IdIndex)
         self._next_id = 1
+        # Full-text index over the searchable fields
+        self._text_index = self._create_text_index()
 
     def save(self, inspiration: object) -> object:
         if inspiration.id is None:
@@ -1589,6 +1642,8 @@ class InMemoryInspirationRepository:
         if inspiration.id not in self._by_world[world_key]:
             self._by_world[world_key].append(inspiration.id)
 
+        self._index_text(key, inspiration)
+
         return inspiration
 
     def find_by_id(self, tenant_id: TenantId, inspiration_id: EntityId) -> Optional[object]:
@@ -1613,15 +1668,7 @@ class InMemoryInspirationRepository:
         return [i for i in all_inspirations if not getattr(i, 'is_used', False)][offset:offset + limit]
 
     def search_by_content(self, tenant_id: TenantId, search_term: str, limit: int = 20) -> List[object]:
-        results = []
-        for inspiration in self._inspirations.values():
-            if inspiration.tenant_id == tenant_id:
-                content = getattr(inspiration, 'content', '')
-                if search_term.lower() in content.lower():
-                    results.append(inspiration)
-                    if len(results) >= limit:
-                        break
-        return results
+        return self._search_entities(tenant_id, search_term, limit)
 
     def delete(self, tenant_id: TenantId, inspiration_id: EntityId) -> bool:
         key = (tenant_id, inspiration_id)
@@ -1633,16 +1680,19 @@ class InMemoryInspirationRepository:
         if inspiration_id in self._by_world[world_key]:
             self._by_world[world_key].remove(inspiration_id)
 
+        self._unindex_text(key)
         del self._inspirations[key]
         return True
 
 
-class InMemoryMapRepository:
+class InMemoryMapRepository(InMemoryKeysetPaginationMixin, BulkOperationsMixin):
     """In-memory implementation of Map repository for testing."""
 
+    _store_attr = "_maps"
+
     def __init__(self):
         self._maps: Dict[Tuple[TenantId, EntityId], object] = {}
-        self._by_world: Dict[Tuple[TenantId, EntityId], List[EntityId]] = defaultdict(list)
+        self._by_world: Dict[Tuple[TenantId, EntityId], IdIndex] = defaultdict(IdIndex)
         self._next_id = 1
 
     def save(self, map_obj: object) -> object:
@@ -1691,12 +1741,14 @@ class InMemoryMapRepository:
         return True
 
 
-class InMemoryTokenboardRepository(ITokenboardRepository):
+class InMemoryTokenboardRepository(InMemoryKeysetPaginationMixin, ITokenboardRepository):
     """In-memory implementation of Tokenboard repository for testing."""
 
+    _store_attr = "_tokenboards"
+
     def __init__(self):
         self._tokenboards: Dict[Tuple[TenantId, EntityId], object] = {}
-        self._by_world: Dict[Tuple[TenantId, EntityId], List[EntityId]] = defaultdict(list)
+        self._by_world: Dict[Tuple[TenantId, EntityId], IdIndex] = defaultdict(IdIndex)
         self._next_id = 1
 
     def save(self, tokenboard: object) -> object:
@@ -1756,7 +1808,7 @@ from src.domain.repositories.inspiration_repository import IInspirationRepositor
 from src.domain.repositories.map_repository import IMapRepository
 from src.domain.repositories.tokenboard_repository import ITokenboardRepository
 
-class InMemoryQuestChainRepository:
+class InMemoryQuestChainRepository(BulkOperationsMixin):
     """In-memory implementation of QuestChain repository."""
     def __init__(self):
         from typing import Dict, Optional, Tuple
@@ -1764,7 +1816,7 @@ class InMemoryQuestChainRepository:
         from src.domain.value_objects.common import TenantId, EntityId
         
         self._quest_chains: Dict[Tuple[TenantId, EntityId], object] = {}
-        self._by_world: Dict[Tuple[TenantId, EntityId], list] = defaultdict(list)
+        self._by_world: Dict[Tuple[TenantId, EntityId], IdIndex] = defaultdict(IdIndex)
         self._next_id = 1
 
     def save(self, quest_chain):
@@ -1798,8 +1850,10 @@ class InMemoryQuestChainRepository:
         return False
 
 
-class InMemoryQuestNodeRepository:
+class InMemoryQuestNodeRepository(InMemoryBulkMixin):
     """In-memory implementation of QuestNode repository."""
+    _store_attr = "_quest_nodes"
+
     def __init__(self):
         self._quest_nodes = {}
         self._next_id = 1
@@ -1817,7 +1871,7 @@ class InMemoryQuestNodeRepository:
         return self._quest_nodes.get((tenant_id, entity_id))
 
     def list_by_world(self, tenant_id, world_id, limit=50, offset=0):
-        return [qn for qn in self._quest_nodes.values() if qn.tenant_id == tenant_id and qn.world_id == world_id][offset:offset+limit]]
+        return [qn for qn in self._quest_nodes.values() if qn.tenant_id == tenant_id and qn.world_id == world_id][offset:offset+limit]
 
     def delete(self, tenant_id, entity_id):
         key = (tenant_id, entity_id)
@@ -1827,8 +1881,10 @@ class InMemoryQuestNodeRepository:
         return False
 
 
-class InMemoryQuestPrerequisiteRepository:
+class InMemoryQuestPrerequisiteRepository(InMemoryBulkMixin):
     """In-memory implementation of QuestPrerequisite repository."""
+    _store_attr = "_prerequisites"
+
     def __init__(self):
         self._prerequisites = {}
         self._next_id = 1
@@ -1846,7 +1902,7 @@ class InMemoryQuestPrerequisiteRepository:
         return self._prerequisites.get((tenant_id, entity_id))
 
     def list_by_world(self, tenant_id, world_id, limit=50, offset=0):
-        return [p for p in self._prerequisites.values() if p.tenant_id == tenant_id and p.world_id == world_id][offset:offset+limit]]
+        return [p for p in self._prerequisites.values() if p.tenant_id == tenant_id and p.world_id == world_id][offset:offset+limit]
 
     def delete(self, tenant_id, entity_id):
         key = (tenant_id, entity_id)
@@ -1856,8 +1912,10 @@ class InMemoryQuestPrerequisiteRepository:
         return False
 
 
-class InMemoryQuestObjectiveRepository:
+class InMemoryQuestObjectiveRepository(InMemoryBulkMixin):
     """In-memory implementation of QuestObjective repository."""
+    _store_attr = "_objectives"
+
     def __init__(self):
         self._objectives = {}
         self._next_id = 1
@@ -1875,7 +1933,7 @@ class InMemoryQuestObjectiveRepository:
         return self._objectives.get((tenant_id, entity_id))
 
     def list_by_world(self, tenant_id, world_id, limit=50, offset=0):
-        return [o for o in self._objectives.values() if o.tenant_id == tenant_id and o.world_id == world_id][offset:offset+limit]]
+        return [o for o in self._objectives.values() if o.tenant_id == tenant_id and o.world_id == world_id][offset:offset+limit]
 
     def delete(self, tenant_id, entity_id):
         key = (tenant_id, entity_id)
@@ -1885,8 +1943,10 @@ class InMemoryQuestObjectiveRepository:
         return False
 
 
-class InMemoryQuestTrackerRepository:
+class InMemoryQuestTrackerRepository(InMemoryBulkMixin):
     """In-memory implementation of QuestTracker repository."""
+    _store_attr = "_trackers"
+
     def __init__(self):
         self._trackers = {}
         self._next_id = 1
@@ -1904,7 +1964,7 @@ class InMemoryQuestTrackerRepository:
         return self._trackers.get((tenant_id, entity_id))
 
     def list_by_world(self, tenant_id, world_id, limit=50, offset=0):
-        return [t for t in self._trackers.values() if t.tenant_id == tenant_id and t.world_id == world_id][offset:offset+limit]]
+        return [t for t in self._trackers.values() if t.tenant_id == tenant_id and t.world_id == world_id][offset:offset+limit]
 
     def delete(self, tenant_id, entity_id):
         key = (tenant_id, entity_id)
@@ -1914,8 +1974,10 @@ class InMemoryQuestTrackerRepository:
         return False
 
 
-class InMemoryQuestGiverRepository:
+class InMemoryQuestGiverRepository(InMemoryBulkMixin):
     """In-memory implementation of QuestGiver repository."""
+    _store_attr = "_givers"
+
     def __init__(self):
         self._givers = {}
         self._next_id = 1
@@ -1933,7 +1995,7 @@ class InMemoryQuestGiverRepository:
         return self._givers.get((tenant_id, entity_id))
 
     def list_by_world(self, tenant_id, world_id, limit=50, offset=0):
-        return [g for g in self._givers.values() if g.tenant_id == tenant_id and g.world_id == world_id][offset:offset+limit]]
+        return [g for g in self._givers.values() if g.tenant_id == tenant_id and g.world_id == world_id][offset:offset+limit]
 
     def delete(self, tenant_id, entity_id):
         key = (tenant_id, entity_id)
@@ -1943,8 +2005,10 @@ class InMemoryQuestGiverRepository:
         return False
 
 
-class InMemoryQuestRewardRepository:
+class InMemoryQuestRewardRepository(InMemoryBulkMixin):
     """In-memory implementation of QuestReward repository."""
+    _store_attr = "_rewards"
+
     def __init__(self):
         self._rewards = {}
         self._next_id = 1
@@ -1962,7 +2026,7 @@ class InMemoryQuestRewardRepository:
         return self._rewards.get((tenant_id, entity_id))
 
     def list_by_world(self, tenant_id, world_id, limit=50, offset=0):
-        return [r for r in self._rewards.values() if r.tenant_id == tenant_id and r.world_id == world_id][offset:offset+limit]]
+        return [r for r in self._rewards.values() if r.tenant_id == tenant_id and r.world_id == world_id][offset:offset+limit]
 
     def delete(self, tenant_id, entity_id):
         key = (tenant_id, entity_id)
@@ -1972,8 +2036,10 @@ class InMemoryQuestRewardRepository:
         return False
 
 
-class InMemoryQuestRewardTierRepository:
+class InMemoryQuestRewardTierRepository(InMemoryBulkMixin):
     """In-memory implementation of QuestRewardTier repository."""
+    _store_attr = "_tiers"
+
     def __init__(self):
         self._tiers = {}
         self._next_id = 1
@@ -1991,7 +2057,7 @@ class InMemoryQuestRewardTierRepository:
         return self._tiers.get((tenant_id, entity_id))
 
     def list_by_world(self, tenant_id, world_id, limit=50, offset=0):
-        return [t for t in self._tiers.values() if t.tenant_id == tenant_id and t.world_id == world_id][offset:offset+limit]]
+        return [t for t in self._tiers.values() if t.tenant_id == tenant_id and t.world_id == world_id][offset:offset+limit]
 
     def delete(self, tenant_id, entity_id):
         key = (tenant_id, entity_id)
@@ -2001,7 +2067,9 @@ class InMemoryQuestRewardTierRepository:
         return False
 
 # Progression repositories
-class InMemorySkillRepository:
+class InMemorySkillRepository(InMemoryBulkMixin):
+    _store_attr = "_skills"
+
     def __init__(self):
         self._skills = {}
         self._next_id = 1
@@ -2022,7 +2090,9 @@ class InMemorySkillRepository:
             return True
         return False
 
-class InMemoryPerkRepository:
+class InMemoryPerkRepository(InMemoryBulkMixin):
+    _store_attr = "_perks"
+
     def __init__(self):
         self._perks = {}
         self._next_id = 1
@@ -2043,7 +2113,9 @@ class InMemoryPerkRepository:
             return True
         return False
 
-class InMemoryTraitRepository:
+class InMemoryTraitRepository(InMemoryBulkMixin):
+    _store_attr = "_traits"
+
     def __init__(self):
         self._traits = {}
         self._next_id = 1
@@ -2064,7 +2136,9 @@ class InMemoryTraitRepository:
             return True
         return False
 
-class InMemoryAttributeRepository:
+class InMemoryAttributeRepository(InMemoryBulkMixin):
+    _store_attr = "_attributes"
+
     def __init__(self):
         self._attributes = {}
         self._next_id = 1
@@ -2085,7 +2159,9 @@ class InMemoryAttributeRepository:
             return True
         return False
 
-class InMemoryExperienceRepository:
+class InMemoryExperienceRepository(InMemoryBulkMixin):
+    _store_attr = "_experiences"
+
     def __init__(self):
         self._experiences = {}
         self._next_id = 1
@@ -2106,7 +2182,9 @@ class InMemoryExperienceRepository:
             return True
         return False
 
-class InMemoryLevelUpRepository:
+class InMemoryLevelUpRepository(InMemoryBulkMixin):
+    _store_attr = "_level_ups"
+
     def __init__(self):
         self._level_ups = {}
         self._next_id = 1
@@ -2127,7 +2205,9 @@ class InMemoryLevelUpRepository:
             return True
         return False
 
-class InMemoryTalentTreeRepository:
+class InMemoryTalentTreeRepository(InMemoryBulkMixin):
+    _store_attr = "_talent_trees"
+
     def __init__(self):
         self._talent_trees = {}
         self._next_id = 1
@@ -2148,7 +2228,9 @@ class InMemoryTalentTreeRepository:
             return True
         return False
 
-class InMemoryMasteryRepository:
+class InMemoryMasteryRepository(InMemoryBulkMixin):
+    _store_attr = "_masteries"
+
     def __init__(self):
         self._masteries = {}
         self._next_id = 1
@@ -2170,7 +2252,9 @@ class InMemoryMasteryRepository:
         return False
 
 # Faction repositories
-class InMemoryFactionHierarchyRepository:
+class InMemoryFactionHierarchyRepository(InMemoryBulkMixin):
+    _store_attr = "_hierarchies"
+
     def __init__(self):
         self._hierarchies = {}
         self._next_id = 1
@@ -2191,7 +2275,9 @@ class InMemoryFactionHierarchyRepository:
             return True
         return False
 
-class InMemoryFactionIdeologyRepository:
+class InMemoryFactionIdeologyRepository(InMemoryBulkMixin):
+    _store_attr = "_ideologies"
+
     def __init__(self):
         self._ideologies = {}
         self._next_id = 1
@@ -2212,7 +2298,9 @@ class InMemoryFactionIdeologyRepository:
             return True
         return False
 
-class InMemoryFactionLeaderRepository:
+class InMemoryFactionLeaderRepository(InMemoryBulkMixin):
+    _store_attr = "_leaders"
+
     def __init__(self):
         self._leaders = {}
         self._next_id = 1
@@ -2233,7 +2321,9 @@ class InMemoryFactionLeaderRepository:
             return True
         return False
 
-class InMemoryFactionMembershipRepository:
+class InMemoryFactionMembershipRepository(InMemoryBulkMixin):
+    _store_attr = "_memberships"
+
     def __init__(self):
         self._memberships = {}
         self._next_id = 1
@@ -2254,7 +2344,9 @@ class InMemoryFactionMembershipRepository:
             return True
         return False
 
-class InMemoryFactionResourceRepository:
+class InMemoryFactionResourceRepository(InMemoryBulkMixin):
+    _store_attr = "_resources"
+
     def __init__(self):
         self._resources = {}
         self._next_id = 1
@@ -2275,7 +2367,9 @@ class InMemoryFactionResourceRepository:
             return True
         return False
 
-class InMemoryFactionTerritoryRepository:
+class InMemoryFactionTerritoryRepository(InMemoryBulkMixin):
+    _store_attr = "_territories"
+
     def __init__(self):
         self._territories = {}
         self._next_id = 1
@@ -2299,7 +2393,7 @@ class InMemoryFactionTerritoryRepository:
 # In-Memory implementations for remaining repositories
 
 
-class InMemoryMiracleRepository:
+class InMemoryMiracleRepository(InMemoryBulkMixin):
     """In-memory implementation of Miracle repository."""
     def __init__(self):
         self._entities = {}
@@ -2329,7 +2423,7 @@ class InMemoryMiracleRepository:
             return True
         return False
 
-class InMemoryCourtRepository:
+class InMemoryCourtRepository(InMemoryBulkMixin):
     """In-memory implementation of Court repository."""
     def __init__(self):
         self._entities = {}
@@ -2359,7 +2453,7 @@ class InMemoryCourtRepository:
             return True
         return False
 
-class InMemoryVoice_overRepository:
+class InMemoryVoice_overRepository(InMemoryBulkMixin):
     """In-memory implementation of Voice_over repository."""
     def __init__(self):
         self._entities = {}
@@ -2389,7 +2483,7 @@ class InMemoryVoice_overRepository:
             return True
         return False
 
-class InMemoryFestivalRepository:
+class InMemoryFestivalRepository(InMemoryBulkMixin):
     """In-memory implementation of Festival repository."""
     def __init__(self):
         self._entities = {}
@@ -2419,7 +2513,7 @@ class InMemoryFestivalRepository:
             return True
         return False
 
-class InMemoryCataclysmRepository:
+class InMemoryCataclysmRepository(InMemoryBulkMixin):
     """In-memory implementation of Cataclysm repository."""
     def __init__(self):
         self._entities = {}
@@ -2449,7 +2543,7 @@ class InMemoryCataclysmRepository:
             return True
         return False
 
-class InMemoryProgression_stateRepository:
+class InMemoryProgression_stateRepository(InMemoryBulkMixin):
     """In-memory implementation of Progression_state repository."""
     def __init__(self):
         self._entities = {}
@@ -2479,7 +2573,7 @@ class InMemoryProgression_stateRepository:
             return True
         return False
 
-class InMemoryChapterRepository:
+class InMemoryChapterRepository(InMemoryBulkMixin):
     """In-memory implementation of Chapter repository."""
     def __init__(self):
         self._entities = {}
@@ -2509,7 +2603,7 @@ class InMemoryChapterRepository:
             return True
         return False
 
-class InMemoryNationRepository:
+class InMemoryNationRepository(InMemoryBulkMixin):
     """In-memory implementation of Nation repository."""
     def __init__(self):
         self._entities = {}
@@ -2539,7 +2633,7 @@ class InMemoryNationRepository:
             return True
         return False
 
-class InMemoryEvidenceRepository:
+class InMemoryEvidenceRepository(InMemoryBulkMixin):
     """In-memory implementation of Evidence repository."""
     def __init__(self):
         self._entities = {}
@@ -2569,7 +2663,7 @@ class InMemoryEvidenceRepository:
             return True
         return False
 
-class InMemoryImprovementRepository:
+class InMemoryImprovementRepository(InMemoryBulkMixin):
     """In-memory implementation of Improvement repository."""
     def __init__(self):
         self._entities = {}
@@ -2599,7 +2693,7 @@ class InMemoryImprovementRepository:
             return True
         return False
 
-class InMemoryLore_fragmentRepository:
+class InMemoryLore_fragmentRepository(InMemoryBulkMixin):
     """In-memory implementation of Lore_fragment repository."""
     def __init__(self):
         self._entities = {}
@@ -2629,7 +2723,7 @@ class InMemoryLore_fragmentRepository:
             return True
         return False
 
-class InMemoryFactionRepository:
+class InMemoryFactionRepository(InMemoryBulkMixin):
     """In-memory implementation of Faction repository."""
     def __init__(self):
         self._entities = {}
@@ -2659,7 +2753,7 @@ class InMemoryFactionRepository:
             return True
         return False
 
-class InMemoryConcertRepository:
+class InMemoryConcertRepository(InMemoryBulkMixin):
     """In-memory implementation of Concert repository."""
     def __init__(self):
         self._entities = {}
@@ -2689,7 +2783,7 @@ class InMemoryConcertRepository:
             return True
         return False
 
-class InMemoryAllianceRepository:
+class InMemoryAllianceRepository(InMemoryBulkMixin):
     """In-memory implementation of Alliance repository."""
     def __init__(self):
         self._entities = {}
@@ -2719,7 +2813,7 @@ class InMemoryAllianceRepository:
             return True
         return False
 
-class InMemoryCinematicRepository:
+class InMemoryCinematicRepository(InMemoryBulkMixin):
     """In-memory implementation of Cinematic repository."""
     def __init__(self):
         self._entities = {}
@@ -2749,7 +2843,7 @@ class InMemoryCinematicRepository:
             return True
         return False
 
-class InMemoryDemandRepository:
+class InMemoryDemandRepository(InMemoryBulkMixin):
     """In-memory implementation of Demand repository."""
     def __init__(self):
         self._entities = {}
@@ -2779,7 +2873,7 @@ class InMemoryDemandRepository:
             return True
         return False
 
-class InMemoryDeus_ex_machinaRepository:
+class InMemoryDeus_ex_machinaRepository(InMemoryBulkMixin):
     """In-memory implementation of Deus_ex_machina repository."""
     def __init__(self):
         self._entities = {}
@@ -2809,7 +2903,7 @@ class InMemoryDeus_ex_machinaRepository:
             return True
         return False
 
-class InMemorySeasonRepository:
+class InMemorySeasonRepository(InMemoryBulkMixin):
     """In-memory implementation of Season repository."""
     def __init__(self):
         self._entities = {}
@@ -2839,7 +2933,7 @@ class InMemorySeasonRepository:
             return True
         return False
 
-class InMemoryFlash_forwardRepository:
+class InMemoryFlash_forwardRepository(InMemoryBulkMixin):
     """In-memory implementation of Flash_forward repository."""
     def __init__(self):
         self._entities = {}
@@ -2869,7 +2963,7 @@ class InMemoryFlash_forwardRepository:
             return True
         return False
 
-class InMemoryTalent_treeRepository:
+class InMemoryTalent_treeRepository(InMemoryBulkMixin):
     """In-memory implementation of Talent_tree repository."""
     def __init__(self):
         self._entities = {}
@@ -2899,7 +2993,7 @@ class InMemoryTalent_treeRepository:
             return True
         return False
 
-class InMemoryQuestRepository:
+class InMemoryQuestRepository(InMemoryBulkMixin):
     """In-memory implementation of Quest repository."""
     def __init__(self):
         self._entities = {}
@@ -2929,7 +3023,7 @@ class InMemoryQuestRepository:
             return True
         return False
 
-class InMemoryLegendary_weaponRepository:
+class InMemoryLegendary_weaponRepository(InMemoryBulkMixin):
     """In-memory implementation of Legendary_weapon repository."""
     def __init__(self):
         self._entities = {}
@@ -2959,7 +3053,7 @@ class InMemoryLegendary_weaponRepository:
             return True
         return False
 
-class InMemoryGlyphRepository:
+class InMemoryGlyphRepository(InMemoryBulkMixin):
     """In-memory implementation of Glyph repository."""
     def __init__(self):
         self._entities = {}
@@ -2989,7 +3083,7 @@ class InMemoryGlyphRepository:
             return True
         return False
 
-class InMemoryRelic_collectionRepository:
+class InMemoryRelic_collectionRepository(InMemoryBulkMixin):
     """In-memory implementation of Relic_collection repository."""
     def __init__(self):
         self._entities = {}
@@ -3019,7 +3113,7 @@ class InMemoryRelic_collectionRepository:
             return True
         return False
 
-class InMemoryArtifact_setRepository:
+class InMemoryArtifact_setRepository(InMemoryBulkMixin):
     """In-memory implementation of Artifact_set repository."""
     def __init__(self):
         self._entities = {}
@@ -3049,7 +3143,7 @@ class InMemoryArtifact_setRepository:
             return True
         return False
 
-class InMemoryDifficulty_curveRepository:
+class InMemoryDifficulty_curveRepository(InMemoryBulkMixin):
     """In-memory implementation of Difficulty_curve repository."""
     def __init__(self):
         self._entities = {}
@@ -3079,7 +3173,7 @@ class InMemoryDifficulty_curveRepository:
             return True
         return False
 
-class InMemoryRequirementRepository:
+class InMemoryRequirementRepository(InMemoryBulkMixin):
     """In-memory implementation of Requirement repository."""
     def __init__(self):
         self._entities = {}
@@ -3109,7 +3203,7 @@ class InMemoryRequirementRepository:
             return True
         return False
 
-class InMemoryPlot_deviceRepository:
+class InMemoryPlot_deviceRepository(InMemoryBulkMixin):
     """In-memory implementation of Plot_device repository."""
     def __init__(self):
         self._entities = {}
@@ -3139,7 +3233,7 @@ class InMemoryPlot_deviceRepository:
             return True
         return False
 
-class InMemoryBannerRepository:
+class InMemoryBannerRepository(InMemoryBulkMixin):
     """In-memory implementation of Banner repository."""
     def __init__(self):
         self._entities = {}
@@ -3169,7 +3263,7 @@ class InMemoryBannerRepository:
             return True
         return False
 
-class InMemoryQuest_rewardRepository:
+class InMemoryQuest_rewardRepository(InMemoryBulkMixin):
     """In-memory implementation of Quest_reward repository."""
     def __init__(self):
         self._entities = {}
@@ -3199,7 +3293,7 @@ class InMemoryQuest_rewardRepository:
             return True
         return False
 
-class InMemoryJudgeRepository:
+class InMemoryJudgeRepository(InMemoryBulkMixin):
     """In-memory implementation of Judge repository."""
     def __init__(self):
         self._entities = {}
@@ -3229,7 +3323,7 @@ class InMemoryJudgeRepository:
             return True
         return False
 
-class InMemoryNightmareRepository:
+class InMemoryNightmareRepository(InMemoryBulkMixin):
     """In-memory implementation of Nightmare repository."""
     def __init__(self):
         self._entities = {}
@@ -3259,7 +3353,7 @@ class InMemoryNightmareRepository:
             return True
         return False
 
-class InMemorySecret_areaRepository:
+class InMemorySecret_areaRepository(InMemoryBulkMixin):
     """In-memory implementation of Secret_area repository."""
     def __init__(self):
         self._entities = {}
@@ -3289,7 +3383,7 @@ class InMemorySecret_areaRepository:
             return True
         return False
 
-class InMemoryPactRepository:
+class InMemoryPactRepository(InMemoryBulkMixin):
     """In-memory implementation of Pact repository."""
     def __init__(self):
         self._entities = {}
@@ -3319,7 +3413,7 @@ class InMemoryPactRepository:
             return True
         return False
 
-class InMemoryWarRepository:
+class InMemoryWarRepository(InMemoryBulkMixin):
     """In-memory implementation of War repository."""
     def __init__(self):
         self._entities = {}
@@ -3349,7 +3443,7 @@ class InMemoryWarRepository:
             return True
         return False
 
-class InMemoryUser_scenarioRepository:
+class InMemoryUser_scenarioRepository(InMemoryBulkMixin):
     """In-memory implementation of User_scenario repository."""
     def __init__(self):
         self._entities = {}
@@ -3379,7 +3473,7 @@ class InMemoryUser_scenarioRepository:
             return True
         return False
 
-class InMemoryVisual_effectRepository:
+class InMemoryVisual_effectRepository(InMemoryBulkMixin):
     """In-memory implementation of Visual_effect repository."""
     def __init__(self):
         self._entities = {}
@@ -3409,7 +3503,7 @@ class InMemoryVisual_effectRepository:
             return True
         return False
 
-class InMemoryMaterialRepository:
+class InMemoryMaterialRepository(InMemoryBulkMixin):
     """In-memory implementation of Material repository."""
     def __init__(self):
         self._entities = {}
@@ -3439,7 +3533,7 @@ class InMemoryMaterialRepository:
             return True
         return False
 
-class InMemorySave_pointRepository:
+class InMemorySave_pointRepository(InMemoryBulkMixin):
     """In-memory implementation of Save_point repository."""
     def __init__(self):
         self._entities = {}
@@ -3469,7 +3563,7 @@ class InMemorySave_pointRepository:
             return True
         return False
 
-class InMemoryPropagandaRepository:
+class InMemoryPropagandaRepository(InMemoryBulkMixin):
     """In-memory implementation of Propaganda repository."""
     def __init__(self):
         self._entities = {}
@@ -3499,7 +3593,7 @@ class InMemoryPropagandaRepository:
             return True
         return False
 
-class InMemoryLeaderboardRepository:
+class InMemoryLeaderboardRepository(InMemoryBulkMixin):
     """In-memory implementation of Leaderboard repository."""
     def __init__(self):
         self._entities = {}
@@ -3529,7 +3623,7 @@ class InMemoryLeaderboardRepository:
             return True
         return False
 
-class InMemoryEclipseRepository:
+class InMemoryEclipseRepository(InMemoryBulkMixin):
     """In-memory implementation of Eclipse repository."""
     def __init__(self):
         self._entities = {}
@@ -3559,7 +3653,7 @@ class InMemoryEclipseRepository:
             return True
         return False
 
-class InMemoryBalance_entitiesRepository:
+class InMemoryBalance_entitiesRepository(InMemoryBulkMixin):
     """In-memory implementation of Balance_entities repository."""
     def __init__(self):
         self._entities = {}
@@ -3589,7 +3683,7 @@ class InMemoryBalance_entitiesRepository:
             return True
         return False
 
-class InMemoryPunishmentRepository:
+class InMemoryPunishmentRepository(InMemoryBulkMixin):
     """In-memory implementation of Punishment repository."""
     def __init__(self):
         self._entities = {}
@@ -3619,7 +3713,7 @@ class InMemoryPunishmentRepository:
             return True
         return False
 
-class InMemoryUndergroundRepository:
+class InMemoryUndergroundRepository(InMemoryBulkMixin):
     """In-memory implementation of Underground repository."""
     def __init__(self):
         self._entities = {}
@@ -3649,7 +3743,7 @@ class InMemoryUndergroundRepository:
             return True
         return False
 
-class InMemoryRadioRepository:
+class InMemoryRadioRepository(InMemoryBulkMixin):
     """In-memory implementation of Radio repository."""
     def __init__(self):
         self._entities = {}
@@ -3679,7 +3773,7 @@ class InMemoryRadioRepository:
             return True
         return False
 
-class InMemoryBestiary_entryRepository:
+class InMemoryBestiary_entryRepository(InMemoryBulkMixin):
     """In-memory implementation of Bestiary_entry repository."""
     def __init__(self):
         self._entities = {}
@@ -3709,7 +3803,7 @@ class InMemoryBestiary_entryRepository:
             return True
         return False
 
-class InMemoryOpen_world_zoneRepository:
+class InMemoryOpen_world_zoneRepository(InMemoryBulkMixin):
     """In-memory implementation of Open_world_zone repository."""
     def __init__(self):
         self._entities = {}
@@ -3739,7 +3833,7 @@ class InMemoryOpen_world_zoneRepository:
             return True
         return False
 
-class InMemoryRewardRepository:
+class InMemoryRewardRepository(InMemoryBulkMixin):
     """In-memory implementation of Reward repository."""
     def __init__(self):
         self._entities = {}
@@ -3769,7 +3863,7 @@ class InMemoryRewardRepository:
             return True
         return False
 
-class InMemoryDrop_rateRepository:
+class InMemoryDrop_rateRepository(InMemoryBulkMixin):
     """In-memory implementation of Drop_rate repository."""
     def __init__(self):
         self._entities = {}
@@ -3799,7 +3893,7 @@ class InMemoryDrop_rateRepository:
             return True
         return False
 
-class InMemoryMusic_themeRepository:
+class InMemoryMusic_themeRepository(InMemoryBulkMixin):
     """In-memory implementation of Music_theme repository."""
     def __init__(self):
         self._entities = {}
@@ -3829,7 +3923,7 @@ class InMemoryMusic_themeRepository:
             return True
         return False
 
-class InMemoryConstitutionRepository:
+class InMemoryConstitutionRepository(InMemoryBulkMixin):
     """In-memory implementation of Constitution repository."""
     def __init__(self):
         self._entities = {}
@@ -3859,7 +3953,7 @@ class InMemoryConstitutionRepository:
             return True
         return False
 
-class InMemoryDefenseRepository:
+class InMemoryDefenseRepository(InMemoryBulkMixin):
     """In-memory implementation of Defense repository."""
     def __init__(self):
         self._entities = {}
@@ -3889,7 +3983,7 @@ class InMemoryDefenseRepository:
             return True
         return False
 
-class InMemoryInvasionRepository:
+class InMemoryInvasionRepository(InMemoryBulkMixin):
     """In-memory implementation of Invasion repository."""
     def __init__(self):
         self._entities = {}
@@ -3919,7 +4013,7 @@ class InMemoryInvasionRepository:
             return True
         return False
 
-class InMemoryLoot_table_weightRepository:
+class InMemoryLoot_table_weightRepository(InMemoryBulkMixin):
     """In-memory implementation of Loot_table_weight repository."""
     def __init__(self):
         self._entities = {}
@@ -3949,7 +4043,7 @@ class InMemoryLoot_table_weightRepository:
             return True
         return False
 
-class InMemoryDiscoveryRepository:
+class InMemoryDiscoveryRepository(InMemoryBulkMixin):
     """In-memory implementation of Discovery repository."""
     def __init__(self):
         self._entities = {}
@@ -3979,7 +4073,7 @@ class InMemoryDiscoveryRepository:
             return True
         return False
 
-class InMemoryMountRepository:
+class InMemoryMountRepository(InMemoryBulkMixin):
     """In-memory implementation of Mount repository."""
     def __init__(self):
         self._entities = {}
@@ -4009,7 +4103,7 @@ class InMemoryMountRepository:
             return True
         return False
 
-class InMemoryWormholeRepository:
+class InMemoryWormholeRepository(InMemoryBulkMixin):
     """In-memory implementation of Wormhole repository."""
     def __init__(self):
         self._entities = {}
@@ -4039,7 +4133,7 @@ class InMemoryWormholeRepository:
             return True
         return False
 
-class InMemoryPocket_dimensionRepository:
+class InMemoryPocket_dimensionRepository(InMemoryBulkMixin):
     """In-memory implementation of Pocket_dimension repository."""
     def __init__(self):
         self._entities = {}
@@ -4069,7 +4163,7 @@ class InMemoryPocket_dimensionRepository:
             return True
         return False
 
-class InMemoryEvent_chainRepository:
+class InMemoryEvent_chainRepository(InMemoryBulkMixin):
     """In-memory implementation of Event_chain repository."""
     def __init__(self):
         self._entities = {}
@@ -4099,7 +4193,7 @@ class InMemoryEvent_chainRepository:
             return True
         return False
 
-class InMemoryPrologueRepository:
+class InMemoryPrologueRepository(InMemoryBulkMixin):
     """In-memory implementation of Prologue repository."""
     def __init__(self):
         self._entities = {}
@@ -4129,7 +4223,7 @@ class InMemoryPrologueRepository:
             return True
         return False
 
-class InMemoryFadeRepository:
+class InMemoryFadeRepository(InMemoryBulkMixin):
     """In-memory implementation of Fade repository."""
     def __init__(self):
         self._entities = {}
@@ -4159,7 +4253,7 @@ class InMemoryFadeRepository:
             return True
         return False
 
-class InMemoryAutosaveRepository:
+class InMemoryAutosaveRepository(InMemoryBulkMixin):
     """In-memory implementation of Autosave repository."""
     def __init__(self):
         self._entities = {}
@@ -4189,7 +4283,7 @@ class InMemoryAutosaveRepository:
             return True
         return False
 
-class InMemorySocial_mobilityRepository:
+class InMemorySocial_mobilityRepository(InMemoryBulkMixin):
     """In-memory implementation of Social_mobility repository."""
     def __init__(self):
         self._entities = {}
@@ -4219,7 +4313,7 @@ class InMemorySocial_mobilityRepository:
             return True
         return False
 
-class InMemoryCharacter_profile_entryRepository:
+class InMemoryCharacter_profile_entryRepository(InMemoryBulkMixin):
     """In-memory implementation of Character_profile_entry repository."""
     def __init__(self):
         self._entities = {}
@@ -4249,7 +4343,7 @@ class InMemoryCharacter_profile_entryRepository:
             return True
         return False
 
-class InMemoryModel3dRepository:
+class InMemoryModel3dRepository(InMemoryBulkMixin):
     """In-memory implementation of Model3d repository."""
     def __init__(self):
         self._entities = {}
@@ -4279,7 +4373,7 @@ class InMemoryModel3dRepository:
             return True
         return False
 
-class InMemorySoundtrackRepository:
+class InMemorySoundtrackRepository(InMemoryBulkMixin):
     """In-memory implementation of Soundtrack repository."""
     def __init__(self):
         self._entities = {}
@@ -4309,7 +4403,7 @@ class InMemorySoundtrackRepository:
             return True
         return False
 
-class InMemoryInflationRepository:
+class InMemoryInflationRepository(InMemoryBulkMixin):
     """In-memory implementation of Inflation repository."""
     def __init__(self):
         self._entities = {}
@@ -4339,7 +4433,7 @@ class InMemoryInflationRepository:
             return True
         return False
 
-class InMemoryStar_systemRepository:
+class InMemoryStar_systemRepository(InMemoryBulkMixin):
     """In-memory implementation of Star_system repository."""
     def __init__(self):
         self._entities = {}
@@ -4369,7 +4463,7 @@ class InMemoryStar_systemRepository:
             return True
         return False
 
-class InMemoryQuarterRepository:
+class InMemoryQuarterRepository(InMemoryBulkMixin):
     """In-memory implementation of Quarter repository."""
     def __init__(self):
         self._entities = {}
@@ -4399,7 +4493,7 @@ class InMemoryQuarterRepository:
             return True
         return False
 
-class InMemoryPurchaseRepository:
+class InMemoryPurchaseRepository(InMemoryBulkMixin):
     """In-memory implementation of Purchase repository."""
     def __init__(self):
         self._entities = {}
@@ -4429,7 +4523,7 @@ class InMemoryPurchaseRepository:
             return True
         return False
 
-class InMemoryCharacter_relationshipRepository:
+class InMemoryCharacter_relationshipRepository(InMemoryBulkMixin):
     """In-memory implementation of Character_relationship repository."""
     def __init__(self):
         self._entities = {}
@@ -4459,7 +4553,7 @@ class InMemoryCharacter_relationshipRepository:
             return True
         return False
 
-class InMemoryGovernmentRepository:
+class InMemoryGovernmentRepository(InMemoryBulkMixin):
     """In-memory implementation of Government repository."""
     def __init__(self):
         self._entities = {}
@@ -4489,7 +4583,7 @@ class InMemoryGovernmentRepository:
             return True
         return False
 
-class InMemoryCampaignRepository:
+class InMemoryCampaignRepository(InMemoryBulkMixin):
     """In-memory implementation of Campaign repository."""
     def __init__(self):
         self._entities = {}
@@ -4519,7 +4613,7 @@ class InMemoryCampaignRepository:
             return True
         return False
 
-class InMemoryPityRepository:
+class InMemoryPityRepository(InMemoryBulkMixin):
     """In-memory implementation of Pity repository."""
     def __init__(self):
         self._entities = {}
@@ -4549,7 +4643,7 @@ class InMemoryPityRepository:
             return True
         return False
 
-class InMemoryTranslationRepository:
+class InMemoryTranslationRepository(InMemoryBulkMixin):
     """In-memory implementation of Translation repository."""
     def __init__(self):
         self._entities = {}
@@ -4579,7 +4673,7 @@ class InMemoryTranslationRepository:
             return True
         return False
 
-class InMemoryColor_paletteRepository:
+class InMemoryColor_paletteRepository(InMemoryBulkMixin):
     """In-memory implementation of Color_palette repository."""
     def __init__(self):
         self._entities = {}
@@ -4609,7 +4703,7 @@ class InMemoryColor_paletteRepository:
             return True
         return False
 
-class InMemorySeasonal_eventRepository:
+class InMemorySeasonal_eventRepository(InMemoryBulkMixin):
     """In-memory implementation of Seasonal_event repository."""
     def __init__(self):
         self._entities = {}
@@ -4639,7 +4733,7 @@ class InMemorySeasonal_eventRepository:
             return True
         return False
 
-class InMemoryArmyRepository:
+class InMemoryArmyRepository(InMemoryBulkMixin):
     """In-memory implementation of Army repository."""
     def __init__(self):
         self._entities = {}
@@ -4669,7 +4763,7 @@ class InMemoryArmyRepository:
             return True
         return False
 
-class InMemoryModRepository:
+class InMemoryModRepository(InMemoryBulkMixin):
     """In-memory implementation of Mod repository."""
     def __init__(self):
         self._entities = {}
@@ -4699,7 +4793,7 @@ class InMemoryModRepository:
             return True
         return False
 
-class InMemoryBlueprintRepository:
+class InMemoryBlueprintRepository(InMemoryBulkMixin):
     """In-memory implementation of Blueprint repository."""
     def __init__(self):
         self._entities = {}
@@ -4729,7 +4823,7 @@ class InMemoryBlueprintRepository:
             return True
         return False
 
-class InMemoryQuest_trackerRepository:
+class InMemoryQuest_trackerRepository(InMemoryBulkMixin):
     """In-memory implementation of Quest_tracker repository."""
     def __init__(self):
         self._entities = {}
@@ -4759,7 +4853,7 @@ class InMemoryQuest_trackerRepository:
             return True
         return False
 
-class InMemoryRankRepository:
+class InMemoryRankRepository(InMemoryBulkMixin):
     """In-memory implementation of Rank repository."""
     def __init__(self):
         self._entities = {}
@@ -4789,7 +4883,7 @@ class InMemoryRankRepository:
             return True
         return False
 
-class InMemoryCelebrationRepository:
+class InMemoryCelebrationRepository(InMemoryBulkMixin):
     """In-memory implementation of Celebration repository."""
     def __init__(self):
         self._entities = {}
@@ -4819,7 +4913,7 @@ class InMemoryCelebrationRepository:
             return True
         return False
 
-class InMemoryCurseRepository:
+class InMemoryCurseRepository(InMemoryBulkMixin):
     """In-memory implementation of Curse repository."""
     def __init__(self):
         self._entities = {}
@@ -4849,7 +4943,7 @@ class InMemoryCurseRepository:
             return True
         return False
 
-class InMemoryHub_areaRepository:
+class InMemoryHub_areaRepository(InMemoryBulkMixin):
     """In-memory implementation of Hub_area repository."""
     def __init__(self):
         self._entities = {}
@@ -4879,7 +4973,7 @@ class InMemoryHub_areaRepository:
             return True
         return False
 
-class InMemoryRevolutionRepository:
+class InMemoryRevolutionRepository(InMemoryBulkMixin):
     """In-memory implementation of Revolution repository."""
     def __init__(self):
         self._entities = {}
@@ -4909,7 +5003,7 @@ class InMemoryRevolutionRepository:
             return True
         return False
 
-class InMemoryFaction_resourceRepository:
+class InMemoryFaction_resourceRepository(InMemoryBulkMixin):
     """In-memory implementation of Faction_resource repository."""
     def __init__(self):
         self._entities = {}
@@ -4939,7 +5033,7 @@ class InMemoryFaction_resourceRepository:
             return True
         return False
 
-class InMemoryTreatyRepository:
+class InMemoryTreatyRepository(InMemoryBulkMixin):
     """In-memory implementation of Treaty repository."""
     def __init__(self):
         self._entities = {}
@@ -4969,7 +5063,7 @@ class InMemoryTreatyRepository:
             return True
         return False
 
-class InMemoryAirshipRepository:
+class InMemoryAirshipRepository(InMemoryBulkMixin):
     """In-memory implementation of Airship repository."""
     def __init__(self):
         self._entities = {}
@@ -4999,7 +5093,7 @@ class InMemoryAirshipRepository:
             return True
         return False
 
-class InMemoryCultRepository:
+class InMemoryCultRepository(InMemoryBulkMixin):
     """In-memory implementation of Cult repository."""
     def __init__(self):
         self._entities = {}
@@ -5029,7 +5123,7 @@ class InMemoryCultRepository:
             return True
         return False
 
-class InMemoryEnchantmentRepository:
+class InMemoryEnchantmentRepository(InMemoryBulkMixin):
     """In-memory implementation of Enchantment repository."""
     def __init__(self):
         self._entities = {}
@@ -5059,7 +5153,7 @@ class InMemoryEnchantmentRepository:
             return True
         return False
 
-class InMemoryInstanceRepository:
+class InMemoryInstanceRepository(InMemoryBulkMixin):
     """In-memory implementation of Instance repository."""
     def __init__(self):
         self._entities = {}
@@ -5089,7 +5183,7 @@ class InMemoryInstanceRepository:
             return True
         return False
 
-class InMemoryAcademyRepository:
+class InMemoryAcademyRepository(InMemoryBulkMixin):
     """In-memory implementation of Academy repository."""
     def __init__(self):
         self._entities = {}
@@ -5119,7 +5213,7 @@ class InMemoryAcademyRepository:
             return True
         return False
 
-class InMemorySilenceRepository:
+class InMemorySilenceRepository(InMemoryBulkMixin):
     """In-memory implementation of Silence repository."""
     def __init__(self):
         self._entities = {}
@@ -5149,7 +5243,7 @@ class InMemorySilenceRepository:
             return True
         return False
 
-class InMemoryLore_axiomsRepository:
+class InMemoryLore_axiomsRepository(InMemoryBulkMixin):
     """In-memory implementation of Lore_axioms repository."""
     def __init__(self):
         self._entities = {}
@@ -5179,7 +5273,7 @@ class InMemoryLore_axiomsRepository:
             return True
         return False
 
-class InMemorySupplyRepository:
+class InMemorySupplyRepository(InMemoryBulkMixin):
     """In-memory implementation of Supply repository."""
     def __init__(self):
         self._entities = {}
@@ -5209,7 +5303,7 @@ class InMemorySupplyRepository:
             return True
         return False
 
-class InMemoryFaction_membershipRepository:
+class InMemoryFaction_membershipRepository(InMemoryBulkMixin):
     """In-memory implementation of Faction_membership repository."""
     def __init__(self):
         self._entities = {}
@@ -5239,7 +5333,7 @@ class InMemoryFaction_membershipRepository:
             return True
         return False
 
-class InMemoryMusic_stateRepository:
+class InMemoryMusic_stateRepository(InMemoryBulkMixin):
     """In-memory implementation of Music_state repository."""
     def __init__(self):
         self._entities = {}
@@ -5269,7 +5363,7 @@ class InMemoryMusic_stateRepository:
             return True
         return False
 
-class InMemoryBlessingRepository:
+class InMemoryBlessingRepository(InMemoryBulkMixin):
     """In-memory implementation of Blessing repository."""
     def __init__(self):
         self._entities = {}
@@ -5299,7 +5393,7 @@ class InMemoryBlessingRepository:
             return True
         return False
 
-class InMemoryPrototypeRepository:
+class InMemoryPrototypeRepository(InMemoryBulkMixin):
     """In-memory implementation of Prototype repository."""
     def __init__(self):
         self._entities = {}
@@ -5329,7 +5423,7 @@ class InMemoryPrototypeRepository:
             return True
         return False
 
-class InMemoryFaction_ideologyRepository:
+class InMemoryFaction_ideologyRepository(InMemoryBulkMixin):
     """In-memory implementation of Faction_ideology repository."""
     def __init__(self):
         self._entities = {}
@@ -5359,7 +5453,7 @@ class InMemoryFaction_ideologyRepository:
             return True
         return False
 
-class InMemoryKarmaRepository:
+class InMemoryKarmaRepository(InMemoryBulkMixin):
     """In-memory implementation of Karma repository."""
     def __init__(self):
         self._entities = {}
@@ -5389,7 +5483,7 @@ class InMemoryKarmaRepository:
             return True
         return False
 
-class InMemoryCharacter_variantRepository:
+class InMemoryCharacter_variantRepository(InMemoryBulkMixin):
     """In-memory implementation of Character_variant repository."""
     def __init__(self):
         self._entities = {}
@@ -5419,7 +5513,7 @@ class InMemoryCharacter_variantRepository:
             return True
         return False
 
-class InMemoryLegal_systemRepository:
+class InMemoryLegal_systemRepository(InMemoryBulkMixin):
     """In-memory implementation of Legal_system repository."""
     def __init__(self):
         self._entities = {}
@@ -5449,7 +5543,7 @@ class InMemoryLegal_systemRepository:
             return True
         return False
 
-class InMemoryQuest_objectiveRepository:
+class InMemoryQuest_objectiveRepository(InMemoryBulkMixin):
     """In-memory implementation of Quest_objective repository."""
     def __init__(self):
         self._entities = {}
@@ -5479,7 +5573,7 @@ class InMemoryQuest_objectiveRepository:
             return True
         return False
 
-class InMemoryPlot_branchRepository:
+class InMemoryPlot_branchRepository(InMemoryBulkMixin):
     """In-memory implementation of Plot_branch repository."""
     def __init__(self):
         self._entities = {}
@@ -5509,7 +5603,7 @@ class InMemoryPlot_branchRepository:
             return True
         return False
 
-class InMemoryWaypointRepository:
+class InMemoryWaypointRepository(InMemoryBulkMixin):
     """In-memory implementation of Waypoint repository."""
     def __init__(self):
         self._entities = {}
@@ -5539,7 +5633,7 @@ class InMemoryWaypointRepository:
             return True
         return False
 
-class InMemoryProgression_eventRepository:
+class InMemoryProgression_eventRepository(InMemoryBulkMixin):
     """In-memory implementation of Progression_event repository."""
     def __init__(self):
         self._entities = {}
@@ -5569,7 +5663,7 @@ class InMemoryProgression_eventRepository:
             return True
         return False
 
-class InMemoryNewspaperRepository:
+class InMemoryNewspaperRepository(InMemoryBulkMixin):
     """In-memory implementation of Newspaper repository."""
     def __init__(self):
         self._entities = {}
@@ -5599,7 +5693,7 @@ class InMemoryNewspaperRepository:
             return True
         return False
 
-class InMemoryWardRepository:
+class InMemoryWardRepository(InMemoryBulkMixin):
     """In-memory implementation of Ward repository."""
     def __init__(self):
         self._entities = {}
@@ -5629,7 +5723,7 @@ class InMemoryWardRepository:
             return True
         return False
 
-class InMemoryMemoryRepository:
+class InMemoryMemoryRepository(InMemoryBulkMixin):
     """In-memory implementation of Memory repository."""
     def __init__(self):
         self._entities = {}
@@ -5659,7 +5753,7 @@ class InMemoryMemoryRepository:
             return True
         return False
 
-class InMemoryPullRepository:
+class InMemoryPullRepository(InMemoryBulkMixin):
     """In-memory implementation of Pull repository."""
     def __init__(self):
         self._entities = {}
@@ -5689,7 +5783,7 @@ class InMemoryPullRepository:
             return True
         return False
 
-class InMemoryBranch_pointRepository:
+class InMemoryBranch_pointRepository(InMemoryBulkMixin):
     """In-memory implementation of Branch_point repository."""
     def __init__(self):
         self._entities = {}
@@ -5719,7 +5813,7 @@ class InMemoryBranch_pointRepository:
             return True
         return False
 
-class InMemoryWorld_eventRepository:
+class InMemoryWorld_eventRepository(InMemoryBulkMixin):
     """In-memory implementation of World_event repository."""
     def __init__(self):
         self._entities = {}
@@ -5749,7 +5843,7 @@ class InMemoryWorld_eventRepository:
             return True
         return False
 
-class InMemorySectRepository:
+class InMemorySectRepository(InMemoryBulkMixin):
     """In-memory implementation of Sect repository."""
     def __init__(self):
         self._entities = {}
@@ -5779,7 +5873,7 @@ class InMemorySectRepository:
             return True
         return False
 
-class InMemoryEmpireRepository:
+class InMemoryEmpireRepository(InMemoryBulkMixin):
     """In-memory implementation of Empire repository."""
     def __init__(self):
         self._entities = {}
@@ -5809,7 +5903,7 @@ class InMemoryEmpireRepository:
             return True
         return False
 
-class InMemoryQuest_chainRepository:
+class InMemoryQuest_chainRepository(InMemoryBulkMixin):
     """In-memory implementation of Quest_chain repository."""
     def __init__(self):
         self._entities = {}
@@ -5839,7 +5933,7 @@ class InMemoryQuest_chainRepository:
             return True
         return False
 
-class InMemoryRuneRepository:
+class InMemoryRuneRepository(InMemoryBulkMixin):
     """In-memory implementation of Rune repository."""
     def __init__(self):
         self._entities = {}
@@ -5869,7 +5963,7 @@ class InMemoryRuneRepository:
             return True
         return False
 
-class InMemoryHolidayRepository:
+class InMemoryHolidayRepository(InMemoryBulkMixin):
     """In-memory implementation of Holiday repository."""
     def __init__(self):
         self._entities = {}
@@ -5899,7 +5993,7 @@ class InMemoryHolidayRepository:
             return True
         return False
 
-class InMemoryShaderRepository:
+class InMemoryShaderRepository(InMemoryBulkMixin):
     """In-memory implementation of Shader repository."""
     def __init__(self):
         self._entities = {}
@@ -5929,7 +6023,7 @@ class InMemoryShaderRepository:
             return True
         return False
 
-class InMemoryTitleRepository:
+class InMemoryTitleRepository(InMemoryBulkMixin):
     """In-memory implementation of Title repository."""
     def __init__(self):
         self._entities = {}
@@ -5959,7 +6053,7 @@ class InMemoryTitleRepository:
             return True
         return False
 
-class InMemoryPlayer_metricRepository:
+class InMemoryPlayer_metricRepository(InMemoryBulkMixin):
     """In-memory implementation of Player_metric repository."""
     def __init__(self):
         self._entities = {}
@@ -5989,7 +6083,7 @@ class InMemoryPlayer_metricRepository:
             return True
         return False
 
-class InMemoryEpilogueRepository:
+class InMemoryEpilogueRepository(InMemoryBulkMixin):
     """In-memory implementation of Epilogue repository."""
     def __init__(self):
         self._entities = {}
@@ -6019,7 +6113,7 @@ class InMemoryEpilogueRepository:
             return True
         return False
 
-class InMemoryMysteryRepository:
+class InMemoryMysteryRepository(InMemoryBulkMixin):
     """In-memory implementation of Mystery repository."""
     def __init__(self):
         self._entities = {}
@@ -6049,7 +6143,7 @@ class InMemoryMysteryRepository:
             return True
         return False
 
-class InMemoryWeather_patternRepository:
+class InMemoryWeather_patternRepository(InMemoryBulkMixin):
     """In-memory implementation of Weather_pattern repository."""
     def __init__(self):
         self._entities = {}
@@ -6079,7 +6173,7 @@ class InMemoryWeather_patternRepository:
             return True
         return False
 
-class InMemoryActRepository:
+class InMemoryActRepository(InMemoryBulkMixin):
     """In-memory implementation of Act repository."""
     def __init__(self):
         self._entities = {}
@@ -6109,7 +6203,7 @@ class InMemoryActRepository:
             return True
         return False
 
-class InMemoryEpisodeRepository:
+class InMemoryEpisodeRepository(InMemoryBulkMixin):
     """In-memory implementation of Episode repository."""
     def __init__(self):
         self._entities = {}
@@ -6139,7 +6233,7 @@ class InMemoryEpisodeRepository:
             return True
         return False
 
-class InMemoryTelevisionRepository:
+class InMemoryTelevisionRepository(InMemoryBulkMixin):
     """In-memory implementation of Television repository."""
     def __init__(self):
         self._entities = {}
@@ -6169,7 +6263,7 @@ class InMemoryTelevisionRepository:
             return True
         return False
 
-class InMemorySiege_engineRepository:
+class InMemorySiege_engineRepository(InMemoryBulkMixin):
     """In-memory implementation of Siege_engine repository."""
     def __init__(self):
         self._entities = {}
@@ -6199,7 +6293,7 @@ class InMemorySiege_engineRepository:
             return True
         return False
 
-class InMemoryCustom_mapRepository:
+class InMemoryCustom_mapRepository(InMemoryBulkMixin):
     """In-memory implementation of Custom_map repository."""
     def __init__(self):
         self._entities = {}
@@ -6229,7 +6323,7 @@ class InMemoryCustom_mapRepository:
             return True
         return False
 
-class InMemoryThemeRepository:
+class InMemoryThemeRepository(InMemoryBulkMixin):
     """In-memory implementation of Theme repository."""
     def __init__(self):
         self._entities = {}
@@ -6259,7 +6353,7 @@ class InMemoryThemeRepository:
             return True
         return False
 
-class InMemoryCrafting_recipeRepository:
+class InMemoryCrafting_recipeRepository(InMemoryBulkMixin):
     """In-memory implementation of Crafting_recipe repository."""
     def __init__(self):
         self._entities = {}
@@ -6289,7 +6383,7 @@ class InMemoryCrafting_recipeRepository:
             return True
         return False
 
-class InMemorySocial_classRepository:
+class InMemorySocial_classRepository(InMemoryBulkMixin):
     """In-memory implementation of Social_class repository."""
     def __init__(self):
         self._entities = {}
@@ -6319,7 +6413,7 @@ class InMemorySocial_classRepository:
             return True
         return False
 
-class InMemoryFaction_leaderRepository:
+class InMemoryFaction_leaderRepository(InMemoryBulkMixin):
     """In-memory implementation of Faction_leader repository."""
     def __init__(self):
         self._entities = {}
@@ -6349,7 +6443,7 @@ class InMemoryFaction_leaderRepository:
             return True
         return False
 
-class InMemoryRiddleRepository:
+class InMemoryRiddleRepository(InMemoryBulkMixin):
     """In-memory implementation of Riddle repository."""
     def __init__(self):
         self._entities = {}
@@ -6379,7 +6473,7 @@ class InMemoryRiddleRepository:
             return True
         return False
 
-class InMemoryFast_travel_pointRepository:
+class InMemoryFast_travel_pointRepository(InMemoryBulkMixin):
     """In-memory implementation of Fast_travel_point repository."""
     def __init__(self):
         self._entities = {}
@@ -6409,7 +6503,7 @@ class InMemoryFast_travel_pointRepository:
             return True
         return False
 
-class InMemoryMuseumRepository:
+class InMemoryMuseumRepository(InMemoryBulkMixin):
     """In-memory implementation of Museum repository."""
     def __init__(self):
         self._entities = {}
@@ -6439,7 +6533,7 @@ class InMemoryMuseumRepository:
             return True
         return False
 
-class InMemoryFamiliarRepository:
+class InMemoryFamiliarRepository(InMemoryBulkMixin):
     """In-memory implementation of Familiar repository."""
     def __init__(self):
         self._entities = {}
@@ -6469,7 +6563,7 @@ class InMemoryFamiliarRepository:
             return True
         return False
 
-class InMemoryEra_transitionRepository:
+class InMemoryEra_transitionRepository(InMemoryBulkMixin):
     """In-memory implementation of Era_transition repository."""
     def __init__(self):
         self._entities = {}
@@ -6499,7 +6593,7 @@ class InMemoryEra_transitionRepository:
             return True
         return False
 
-class InMemoryTariffRepository:
+class InMemoryTariffRepository(InMemoryBulkMixin):
     """In-memory implementation of Tariff repository."""
     def __init__(self):
         self._entities = {}
@@ -6529,7 +6623,7 @@ class InMemoryTariffRepository:
             return True
         return False
 
-class InMemoryQuest_nodeRepository:
+class InMemoryQuest_nodeRepository(InMemoryBulkMixin):
     """In-memory implementation of Quest_node repository."""
     def __init__(self):
         self._entities = {}
@@ -6559,7 +6653,7 @@ class InMemoryQuest_nodeRepository:
             return True
         return False
 
-class InMemoryDreamRepository:
+class InMemoryDreamRepository(InMemoryBulkMixin):
     """In-memory implementation of Dream repository."""
     def __init__(self):
         self._entities = {}
@@ -6589,7 +6683,7 @@ class InMemoryDreamRepository:
             return True
         return False
 
-class InMemoryHoly_siteRepository:
+class InMemoryHoly_siteRepository(InMemoryBulkMixin):
     """In-memory implementation of Holy_site repository."""
     def __init__(self):
         self._entities = {}
@@ -6619,7 +6713,7 @@ class InMemoryHoly_siteRepository:
             return True
         return False
 
-class InMemoryInventoryRepository:
+class InMemoryInventoryRepository(InMemoryBulkMixin):
     """In-memory implementation of Inventory repository."""
     def __init__(self):
         self._entities = {}
@@ -6649,7 +6743,7 @@ class InMemoryInventoryRepository:
             return True
         return False
 
-class InMemoryAffinityRepository:
+class InMemoryAffinityRepository(InMemoryBulkMixin):
     """In-memory implementation of Affinity repository."""
     def __init__(self):
         self._entities = {}
@@ -6679,7 +6773,7 @@ class InMemoryAffinityRepository:
             return True
         return False
 
-class InMemoryAlternate_realityRepository:
+class InMemoryAlternate_realityRepository(InMemoryBulkMixin):
     """In-memory implementation of Alternate_reality repository."""
     def __init__(self):
         self._entities = {}
@@ -6709,7 +6803,7 @@ class InMemoryAlternate_realityRepository:
             return True
         return False
 
-class InMemoryMount_equipmentRepository:
+class InMemoryMount_equipmentRepository(InMemoryBulkMixin):
     """In-memory implementation of Mount_equipment repository."""
     def __init__(self):
         self._entities = {}
@@ -6739,7 +6833,7 @@ class InMemoryMount_equipmentRepository:
             return True
         return False
 
-class InMemorySound_effectRepository:
+class InMemorySound_effectRepository(InMemoryBulkMixin):
     """In-memory implementation of Sound_effect repository."""
     def __init__(self):
         self._entities = {}
@@ -6769,7 +6863,7 @@ class InMemorySound_effectRepository:
             return True
         return False
 
-class InMemoryInternetRepository:
+class InMemoryInternetRepository(InMemoryBulkMixin):
     """In-memory implementation of Internet repository."""
     def __init__(self):
         self._entities = {}
@@ -6799,7 +6893,7 @@ class InMemoryInternetRepository:
             return True
         return False
 
-class InMemoryTime_periodRepository:
+class InMemoryTime_periodRepository(InMemoryBulkMixin):
     """In-memory implementation of Time_period repository."""
     def __init__(self):
         self._entities = {}
@@ -6829,7 +6923,7 @@ class InMemoryTime_periodRepository:
             return True
         return False
 
-class InMemoryPuzzleRepository:
+class InMemoryPuzzleRepository(InMemoryBulkMixin):
     """In-memory implementation of Puzzle repository."""
     def __init__(self):
         self._entities = {}
@@ -6859,7 +6953,7 @@ class InMemoryPuzzleRepository:
             return True
         return False
 
-class InMemoryMotion_captureRepository:
+class InMemoryMotion_captureRepository(InMemoryBulkMixin):
     """In-memory implementation of Motion_capture repository."""
     def __init__(self):
         self._entities = {}
@@ -6889,7 +6983,7 @@ class InMemoryMotion_captureRepository:
             return True
         return False
 
-class InMemoryFortificationRepository:
+class InMemoryFortificationRepository(InMemoryBulkMixin):
     """In-memory implementation of Fortification repository."""
     def __init__(self):
         self._entities = {}
@@ -6919,7 +7013,7 @@ class InMemoryFortificationRepository:
             return True
         return False
 
-class InMemoryVoice_actorRepository:
+class InMemoryVoice_actorRepository(InMemoryBulkMixin):
     """In-memory implementation of Voice_actor repository."""
     def __init__(self):
         self._entities = {}
@@ -6949,7 +7043,7 @@ class InMemoryVoice_actorRepository:
             return True
         return False
 
-class InMemoryDimensionRepository:
+class InMemoryDimensionRepository(InMemoryBulkMixin):
     """In-memory implementation of Dimension repository."""
     def __init__(self):
         self._entities = {}
@@ -6979,7 +7073,7 @@ class InMemoryDimensionRepository:
             return True
         return False
 
-class InMemoryMusic_controlRepository:
+class InMemoryMusic_controlRepository(InMemoryBulkMixin):
     """In-memory implementation of Music_control repository."""
     def __init__(self):
         self._entities = {}
@@ -7009,7 +7103,7 @@ class InMemoryMusic_controlRepository:
             return True
         return False
 
-class InMemoryDubbingRepository:
+class InMemoryDubbingRepository(InMemoryBulkMixin):
     """In-memory implementation of Dubbing repository."""
     def __init__(self):
         self._entities = {}
@@ -7039,7 +7133,7 @@ class InMemoryDubbingRepository:
             return True
         return False
 
-class InMemoryHidden_pathRepository:
+class InMemoryHidden_pathRepository(InMemoryBulkMixin):
     """In-memory implementation of Hidden_path repository."""
     def __init__(self):
         self._entities = {}
@@ -7069,7 +7163,7 @@ class InMemoryHidden_pathRepository:
             return True
         return False
 
-class InMemoryFleetRepository:
+class InMemoryFleetRepository(InMemoryBulkMixin):
     """In-memory implementation of Fleet repository."""
     def __init__(self):
         self._entities = {}
@@ -7099,7 +7193,7 @@ class InMemoryFleetRepository:
             return True
         return False
 
-class InMemorySocial_mediaRepository:
+class InMemorySocial_mediaRepository(InMemoryBulkMixin):
     """In-memory implementation of Social_media repository."""
     def __init__(self):
         self._entities = {}
@@ -7129,7 +7223,7 @@ class InMemorySocial_mediaRepository:
             return True
         return False
 
-class InMemoryBarterRepository:
+class InMemoryBarterRepository(InMemoryBulkMixin):
     """In-memory implementation of Barter repository."""
     def __init__(self):
         self._entities = {}
@@ -7159,7 +7253,7 @@ class InMemoryBarterRepository:
             return True
         return False
 
-class InMemoryCalendarRepository:
+class InMemoryCalendarRepository(InMemoryBulkMixin):
     """In-memory implementation of Calendar repository."""
     def __init__(self):
         self._entities = {}
@@ -7189,7 +7283,7 @@ class InMemoryCalendarRepository:
             return True
         return False
 
-class InMemorySolsticeRepository:
+class InMemorySolsticeRepository(InMemoryBulkMixin):
     """In-memory implementation of Solstice repository."""
     def __init__(self):
         self._entities = {}
@@ -7219,7 +7313,7 @@ class InMemorySolsticeRepository:
             return True
         return False
 
-class InMemorySchoolRepository:
+class InMemorySchoolRepository(InMemoryBulkMixin):
     """In-memory implementation of School repository."""
     def __init__(self):
         self._entities = {}
@@ -7249,7 +7343,7 @@ class InMemorySchoolRepository:
             return True
         return False
 
-class InMemorySlumsRepository:
+class InMemorySlumsRepository(InMemoryBulkMixin):
     """In-memory implementation of Slums repository."""
     def __init__(self):
         self._entities = {}
@@ -7279,7 +7373,7 @@ class InMemorySlumsRepository:
             return True
         return False
 
-class InMemoryDisasterRepository:
+class InMemoryDisasterRepository(InMemoryBulkMixin):
     """In-memory implementation of Disaster repository."""
     def __init__(self):
         self._entities = {}
@@ -7309,7 +7403,7 @@ class InMemoryDisasterRepository:
             return True
         return False
 
-class InMemoryMotifRepository:
+class InMemoryMotifRepository(InMemoryBulkMixin):
     """In-memory implementation of Motif repository."""
     def __init__(self):
         self._entities = {}
@@ -7339,7 +7433,7 @@ class InMemoryMotifRepository:
             return True
         return False
 
-class InMemorySpawn_pointRepository:
+class InMemorySpawn_pointRepository(InMemoryBulkMixin):
     """In-memory implementation of Spawn_point repository."""
     def __init__(self):
         self._entities = {}
@@ -7369,7 +7463,7 @@ class InMemorySpawn_pointRepository:
             return True
         return False
 
-class InMemoryWorkshop_entryRepository:
+class InMemoryWorkshop_entryRepository(InMemoryBulkMixin):
     """In-memory implementation of Workshop_entry repository."""
     def __init__(self):
         self._entities = {}
@@ -7399,7 +7493,7 @@ class InMemoryWorkshop_entryRepository:
             return True
         return False
 
-class InMemoryMoral_choiceRepository:
+class InMemoryMoral_choiceRepository(InMemoryBulkMixin):
     """In-memory implementation of Moral_choice repository."""
     def __init__(self):
         self._entities = {}
@@ -7429,7 +7523,7 @@ class InMemoryMoral_choiceRepository:
             return True
         return False
 
-class InMemoryVoice_lineRepository:
+class InMemoryVoice_lineRepository(InMemoryBulkMixin):
     """In-memory implementation of Voice_line repository."""
     def __init__(self):
         self._entities = {}
@@ -7459,7 +7553,7 @@ class InMemoryVoice_lineRepository:
             return True
         return False
 
-class InMemoryFamineRepository:
+class InMemoryFamineRepository(InMemoryBulkMixin):
     """In-memory implementation of Famine repository."""
     def __init__(self):
         self._entities = {}
@@ -7489,7 +7583,7 @@ class InMemoryFamineRepository:
             return True
         return False
 
-class InMemorySession_dataRepository:
+class InMemorySession_dataRepository(InMemoryBulkMixin):
     """In-memory implementation of Session_data repository."""
     def __init__(self):
         self._entities = {}
@@ -7519,7 +7613,7 @@ class InMemorySession_dataRepository:
             return True
         return False
 
-class InMemoryPatentRepository:
+class InMemoryPatentRepository(InMemoryBulkMixin):
     """In-memory implementation of Patent repository."""
     def __init__(self):
         self._entities = {}
@@ -7549,7 +7643,7 @@ class InMemoryPatentRepository:
             return True
         return False
 
-class InMemoryArchiveRepository:
+class InMemoryArchiveRepository(InMemoryBulkMixin):
     """In-memory implementation of Archive repository."""
     def __init__(self):
         self._entities = {}
@@ -7579,7 +7673,7 @@ class InMemoryArchiveRepository:
             return True
         return False
 
-class InMemoryConversion_rateRepository:
+class InMemoryConversion_rateRepository(InMemoryBulkMixin):
     """In-memory implementation of Conversion_rate repository."""
     def __init__(self):
         self._entities = {}
@@ -7609,7 +7703,7 @@ class InMemoryConversion_rateRepository:
             return True
         return False
 
-class InMemoryScriptureRepository:
+class InMemoryScriptureRepository(InMemoryBulkMixin):
     """In-memory implementation of Scripture repository."""
     def __init__(self):
         self._entities = {}
@@ -7639,7 +7733,7 @@ class InMemoryScriptureRepository:
             return True
         return False
 
-class InMemorySpaceshipRepository:
+class InMemorySpaceshipRepository(InMemoryBulkMixin):
     """In-memory implementation of Spaceship repository."""
     def __init__(self):
         self._entities = {}
@@ -7669,7 +7763,7 @@ class InMemorySpaceshipRepository:
             return True
         return False
 
-class InMemoryBattalionRepository:
+class InMemoryBattalionRepository(InMemoryBulkMixin):
     """In-memory implementation of Battalion repository."""
     def __init__(self):
         self._entities = {}
@@ -7699,7 +7793,7 @@ class InMemoryBattalionRepository:
             return True
         return False
 
-class InMemoryPhenomenonRepository:
+class InMemoryPhenomenonRepository(InMemoryBulkMixin):
     """In-memory implementation of Phenomenon repository."""
     def __init__(self):
         self._entities = {}
@@ -7729,7 +7823,7 @@ class InMemoryPhenomenonRepository:
             return True
         return False
 
-class InMemoryCompetitionRepository:
+class InMemoryCompetitionRepository(InMemoryBulkMixin):
     """In-memory implementation of Competition repository."""
     def __init__(self):
         self._entities = {}
@@ -7759,7 +7853,7 @@ class InMemoryCompetitionRepository:
             return True
         return False
 
-class InMemoryPlagueRepository:
+class InMemoryPlagueRepository(InMemoryBulkMixin):
     """In-memory implementation of Plague repository."""
     def __init__(self):
         self._entities = {}
@@ -7789,7 +7883,7 @@ class InMemoryPlagueRepository:
             return True
         return False
 
-class InMemoryBlack_holeRepository:
+class InMemoryBlack_holeRepository(InMemoryBulkMixin):
     """In-memory implementation of Black_hole repository."""
     def __init__(self):
         self._entities = {}
@@ -7819,7 +7913,7 @@ class InMemoryBlack_holeRepository:
             return True
         return False
 
-class InMemoryWitnessRepository:
+class InMemoryWitnessRepository(InMemoryBulkMixin):
     """In-memory implementation of Witness repository."""
     def __init__(self):
         self._entities = {}
@@ -7849,7 +7943,7 @@ class InMemoryWitnessRepository:
             return True
         return False
 
-class InMemoryCursed_itemRepository:
+class InMemoryCursed_itemRepository(InMemoryBulkMixin):
     """In-memory implementation of Cursed_item repository."""
     def __init__(self):
         self._entities = {}
@@ -7879,7 +7973,7 @@ class InMemoryCursed_itemRepository:
             return True
         return False
 
-class InMemoryTimelineRepository:
+class InMemoryTimelineRepository(InMemoryBulkMixin):
     """In-memory implementation of Timeline repository."""
     def __init__(self):
         self._entities = {}
@@ -7909,7 +8003,7 @@ class InMemoryTimelineRepository:
             return True
         return False
 
-class InMemoryComponentRepository:
+class InMemoryComponentRepository(InMemoryBulkMixin):
     """In-memory implementation of Component repository."""
     def __init__(self):
         self._entities = {}
@@ -7939,7 +8033,7 @@ class InMemoryComponentRepository:
             return True
         return False
 
-class InMemoryCutsceneRepository:
+class InMemoryCutsceneRepository(InMemoryBulkMixin):
     """In-memory implementation of Cutscene repository."""
     def __init__(self):
         self._entities = {}
@@ -7969,7 +8063,7 @@ class InMemoryCutsceneRepository:
             return True
         return False
 
-class InMemoryFaction_hierarchyRepository:
+class InMemoryFaction_hierarchyRepository(InMemoryBulkMixin):
     """In-memory implementation of Faction_hierarchy repository."""
     def __init__(self):
         self._entities = {}
@@ -7999,7 +8093,7 @@ class InMemoryFaction_hierarchyRepository:
             return True
         return False
 
-class InMemoryMusic_trackRepository:
+class InMemoryMusic_trackRepository(InMemoryBulkMixin):
     """In-memory implementation of Music_track repository."""
     def __init__(self):
         self._entities = {}
@@ -8029,7 +8123,7 @@ class InMemoryMusic_trackRepository:
             return True
         return False
 
-class InMemoryTrapRepository:
+class InMemoryTrapRepository(InMemoryBulkMixin):
     """In-memory implementation of Trap repository."""
     def __init__(self):
         self._entities = {}
@@ -8059,7 +8153,7 @@ class InMemoryTrapRepository:
             return True
         return False
 
-class InMemoryCrimeRepository:
+class InMemoryCrimeRepository(InMemoryBulkMixin):
     """In-memory implementation of Crime repository."""
     def __init__(self):
         self._entities = {}
@@ -8089,7 +8183,7 @@ class InMemoryCrimeRepository:
             return True
         return False
 
-class InMemoryFood_chainRepository:
+class InMemoryFood_chainRepository(InMemoryBulkMixin):
     """In-memory implementation of Food_chain repository."""
     def __init__(self):
         self._entities = {}
@@ -8119,7 +8213,7 @@ class InMemoryFood_chainRepository:
             return True
         return False
 
-class InMemoryReproductionRepository:
+class InMemoryReproductionRepository(InMemoryBulkMixin):
     """In-memory implementation of Reproduction repository."""
     def __init__(self):
         self._entities = {}
@@ -8149,7 +8243,7 @@ class InMemoryReproductionRepository:
             return True
         return False
 
-class InMemoryRaidRepository:
+class InMemoryRaidRepository(InMemoryBulkMixin):
     """In-memory implementation of Raid repository."""
     def __init__(self):
         self._entities = {}
@@ -8179,7 +8273,7 @@ class InMemoryRaidRepository:
             return True
         return False
 
-class InMemoryScoreRepository:
+class InMemoryScoreRepository(InMemoryBulkMixin):
     """In-memory implementation of Score repository."""
     def __init__(self):
         self._entities = {}
@@ -8209,7 +8303,7 @@ class InMemoryScoreRepository:
             return True
         return False
 
-class InMemoryHonorRepository:
+class InMemoryHonorRepository(InMemoryBulkMixin):
     """In-memory implementation of Honor repository."""
     def __init__(self):
         self._entities = {}
@@ -8239,7 +8333,7 @@ class InMemoryHonorRepository:
             return True
         return False
 
-class InMemoryStorylineRepository:
+class InMemoryStorylineRepository(InMemoryBulkMixin):
     """In-memory implementation of Storyline repository."""
     def __init__(self):
         self._entities = {}
@@ -8269,7 +8363,7 @@ class InMemoryStorylineRepository:
             return True
         return False
 
-class InMemoryLevel_upRepository:
+class InMemoryLevel_upRepository(InMemoryBulkMixin):
     """In-memory implementation of Level_up repository."""
     def __init__(self):
         self._entities = {}
@@ -8299,7 +8393,7 @@ class InMemoryLevel_upRepository:
             return True
         return False
 
-class InMemoryNebulaRepository:
+class InMemoryNebulaRepository(InMemoryBulkMixin):
     """In-memory implementation of Nebula repository."""
     def __init__(self):
         self._entities = {}
@@ -8329,7 +8423,7 @@ class InMemoryNebulaRepository:
             return True
         return False
 
-class InMemoryCodex_entryRepository:
+class InMemoryCodex_entryRepository(InMemoryBulkMixin):
     """In-memory implementation of Codex_entry repository."""
     def __init__(self):
         self._entities = {}
@@ -8359,7 +8453,7 @@ class InMemoryCodex_entryRepository:
             return True
         return False
 
-class InMemorySubtitleRepository:
+class InMemorySubtitleRepository(InMemoryBulkMixin):
     """In-memory implementation of Subtitle repository."""
     def __init__(self):
         self._entities = {}
@@ -8389,7 +8483,7 @@ class InMemorySubtitleRepository:
             return True
         return False
 
-class InMemoryDistrictRepository:
+class InMemoryDistrictRepository(InMemoryBulkMixin):
     """In-memory implementation of District repository."""
     def __init__(self):
         self._entities = {}
@@ -8419,7 +8513,7 @@ class InMemoryDistrictRepository:
             return True
         return False
 
-class InMemoryQuest_prerequisiteRepository:
+class InMemoryQuest_prerequisiteRepository(InMemoryBulkMixin):
     """In-memory implementation of Quest_prerequisite repository."""
     def __init__(self):
         self._entities = {}
@@ -8449,7 +8543,7 @@ class InMemoryQuest_prerequisiteRepository:
             return True
         return False
 
-class InMemoryMythical_armorRepository:
+class InMemoryMythical_armorRepository(InMemoryBulkMixin):
     """In-memory implementation of Mythical_armor repository."""
     def __init__(self):
         self._entities = {}
@@ -8479,7 +8573,7 @@ class InMemoryMythical_armorRepository:
             return True
         return False
 
-class InMemoryRitualRepository:
+class InMemoryRitualRepository(InMemoryBulkMixin):
     """In-memory implementation of Ritual repository."""
     def __init__(self):
         self._entities = {}
@@ -8509,7 +8603,7 @@ class InMemoryRitualRepository:
             return True
         return False
 
-class InMemoryRed_herringRepository:
+class InMemoryRed_herringRepository(InMemoryBulkMixin):
     """In-memory implementation of Red_herring repository."""
     def __init__(self):
         self._entities = {}
@@ -8539,7 +8633,7 @@ class InMemoryRed_herringRepository:
             return True
         return False
 
-class InMemoryPetRepository:
+class InMemoryPetRepository(InMemoryBulkMixin):
     """In-memory implementation of Pet repository."""
     def __init__(self):
         self._entities = {}
@@ -8569,7 +8663,7 @@ class InMemoryPetRepository:
             return True
         return False
 
-class InMemoryAtmosphereRepository:
+class InMemoryAtmosphereRepository(InMemoryBulkMixin):
     """In-memory implementation of Atmosphere repository."""
     def __init__(self):
         self._entities = {}
@@ -8599,7 +8693,7 @@ class InMemoryAtmosphereRepository:
             return True
         return False
 
-class InMemorySocketRepository:
+class InMemorySocketRepository(InMemoryBulkMixin):
     """In-memory implementation of Socket repository."""
     def __init__(self):
         self._entities = {}
@@ -8629,7 +8723,7 @@ class InMemorySocketRepository:
             return True
         return False
 
-class InMemoryFlashbackRepository:
+class InMemoryFlashbackRepository(InMemoryBulkMixin):
     """In-memory implementation of Flashback repository."""
     def __init__(self):
         self._entities = {}
@@ -8659,7 +8753,7 @@ class InMemoryFlashbackRepository:
             return True
         return False
 
-class InMemoryBadgeRepository:
+class InMemoryBadgeRepository(InMemoryBulkMixin):
     """In-memory implementation of Badge repository."""
     def __init__(self):
         self._entities = {}
@@ -8689,7 +8783,7 @@ class InMemoryBadgeRepository:
             return True
         return False
 
-class InMemoryPlazaRepository:
+class InMemoryPlazaRepository(InMemoryBulkMixin):
     """In-memory implementation of Plaza repository."""
     def __init__(self):
         self._entities = {}
@@ -8719,7 +8813,7 @@ class InMemoryPlazaRepository:
             return True
         return False
 
-class InMemoryEraRepository:
+class InMemoryEraRepository(InMemoryBulkMixin):
     """In-memory implementation of Era repository."""
     def __init__(self):
         self._entities = {}
@@ -8749,7 +8843,7 @@ class InMemoryEraRepository:
             return True
         return False
 
-class InMemoryTournamentRepository:
+class InMemoryTournamentRepository(InMemoryBulkMixin):
     """In-memory implementation of Tournament repository."""
     def __init__(self):
         self._entities = {}
@@ -8779,7 +8873,7 @@ class InMemoryTournamentRepository:
             return True
         return False
 
-class InMemoryShare_codeRepository:
+class InMemoryShare_codeRepository(InMemoryBulkMixin):
     """In-memory implementation of Share_code repository."""
     def __init__(self):
         self._entities = {}
@@ -8809,7 +8903,7 @@ class InMemoryShare_codeRepository:
             return True
         return False
 
-class InMemoryLocalizationRepository:
+class InMemoryLocalizationRepository(InMemoryBulkMixin):
     """In-memory implementation of Localization repository."""
     def __init__(self):
         self._entities = {}
@@ -8839,7 +8933,7 @@ class InMemoryLocalizationRepository:
             return True
         return False
 
-class InMemoryMarket_squareRepository:
+class InMemoryMarket_squareRepository(InMemoryBulkMixin):
     """In-memory implementation of Market_square repository."""
     def __init__(self):
         self._entities = {}
@@ -8869,7 +8963,7 @@ class InMemoryMarket_squareRepository:
             return True
         return False
 
-class InMemoryResearch_centerRepository:
+class InMemoryResearch_centerRepository(InMemoryBulkMixin):
     """In-memory implementation of Research_center repository."""
     def __init__(self):
         self._entities = {}
@@ -8899,7 +8993,7 @@ class InMemoryResearch_centerRepository:
             return True
         return False
 
-class InMemoryHeatmapRepository:
+class InMemoryHeatmapRepository(InMemoryBulkMixin):
     """In-memory implementation of Heatmap repository."""
     def __init__(self):
         self._entities = {}
@@ -8929,7 +9023,7 @@ class InMemoryHeatmapRepository:
             return True
         return False
 
-class InMemoryResearchRepository:
+class InMemoryResearchRepository(InMemoryBulkMixin):
     """In-memory implementation of Research repository."""
     def __init__(self):
         self._entities = {}
@@ -8959,7 +9053,7 @@ class InMemoryResearchRepository:
             return True
         return False
 
-class InMemoryRumorRepository:
+class InMemoryRumorRepository(InMemoryBulkMixin):
     """In-memory implementation of Rumor repository."""
     def __init__(self):
         self._entities = {}
@@ -8989,7 +9083,7 @@ class InMemoryRumorRepository:
             return True
         return False
 
-class InMemoryInventionRepository:
+class InMemoryInventionRepository(InMemoryBulkMixin):
     """In-memory implementation of Invention repository."""
     def __init__(self):
         self._entities = {}
@@ -9019,7 +9113,7 @@ class InMemoryInventionRepository:
             return True
         return False
 
-class InMemoryCamera_pathRepository:
+class InMemoryCamera_pathRepository(InMemoryBulkMixin):
     """In-memory implementation of Camera_path repository."""
     def __init__(self):
         self._entities = {}
@@ -9049,7 +9143,7 @@ class InMemoryCamera_pathRepository:
             return True
         return False
 
-class InMemoryEnigmaRepository:
+class InMemoryEnigmaRepository(InMemoryBulkMixin):
     """In-memory implementation of Enigma repository."""
     def __init__(self):
         self._entities = {}
@@ -9079,7 +9173,7 @@ class InMemoryEnigmaRepository:
             return True
         return False
 
-class InMemoryChekhovs_gunRepository:
+class InMemoryChekhovs_gunRepository(InMemoryBulkMixin):
     """In-memory implementation of Chekhovs_gun repository."""
     def __init__(self):
         self._entities = {}
@@ -9109,7 +9203,7 @@ class InMemoryChekhovs_gunRepository:
             return True
         return False
 
-class InMemoryReputationRepository:
+class InMemoryReputationRepository(InMemoryBulkMixin):
     """In-memory implementation of Reputation repository."""
     def __init__(self):
         self._entities = {}
@@ -9139,7 +9233,7 @@ class InMemoryReputationRepository:
             return True
         return False
 
-class InMemoryParticleRepository:
+class InMemoryParticleRepository(InMemoryBulkMixin):
     """In-memory implementation of Particle repository."""
     def __init__(self):
         self._entities = {}
@@ -9169,7 +9263,7 @@ class InMemoryParticleRepository:
             return True
         return False
 
-class InMemoryFaction_territoryRepository:
+class InMemoryFaction_territoryRepository(InMemoryBulkMixin):
     """In-memory implementation of Faction_territory repository."""
     def __init__(self):
         self._entities = {}
@@ -9199,7 +9293,7 @@ class InMemoryFaction_territoryRepository:
             return True
         return False
 
-class InMemoryCharacter_evolutionRepository:
+class InMemoryCharacter_evolutionRepository(InMemoryBulkMixin):
     """In-memory implementation of Character_evolution repository."""
     def __init__(self):
         self._entities = {}
@@ -9229,7 +9323,7 @@ class InMemoryCharacter_evolutionRepository:
             return True
         return False
 
-class InMemoryTeleporterRepository:
+class InMemoryTeleporterRepository(InMemoryBulkMixin):
     """In-memory implementation of Teleporter repository."""
     def __init__(self):
         self._entities = {}
@@ -9259,7 +9353,7 @@ class InMemoryTeleporterRepository:
             return True
         return False
 
-class InMemoryShopRepository:
+class InMemoryShopRepository(InMemoryBulkMixin):
     """In-memory implementation of Shop repository."""
     def __init__(self):
         self._entities = {}
@@ -9289,7 +9383,7 @@ class InMemoryShopRepository:
             return True
         return False
 
-class InMemoryArenaRepository:
+class InMemoryArenaRepository(InMemoryBulkMixin):
     """In-memory implementation of Arena repository."""
     def __init__(self):
         self._entities = {}
@@ -9319,7 +9413,7 @@ class InMemoryArenaRepository:
             return True
         return False
 
-class InMemoryCurrencyRepository:
+class InMemoryCurrencyRepository(InMemoryBulkMixin):
     """In-memory implementation of Currency repository."""
     def __init__(self):
         self._entities = {}
@@ -9349,7 +9443,7 @@ class InMemoryCurrencyRepository:
             return True
         return False
 
-class InMemoryExhibitionRepository:
+class InMemoryExhibitionRepository(InMemoryBulkMixin):
     """In-memory implementation of Exhibition repository."""
     def __init__(self):
         self._entities = {}
@@ -9379,7 +9473,7 @@ class InMemoryExhibitionRepository:
             return True
         return False
 
-class InMemoryMigrationRepository:
+class InMemoryMigrationRepository(InMemoryBulkMixin):
     """In-memory implementation of Migration repository."""
     def __init__(self):
         self._entities = {}
@@ -9409,7 +9503,7 @@ class InMemoryMigrationRepository:
             return True
         return False
 
-class InMemoryForeshadowingRepository:
+class InMemoryForeshadowingRepository(InMemoryBulkMixin):
     """In-memory implementation of Foreshadowing repository."""
     def __init__(self):
         self._entities = {}
@@ -9439,7 +9533,7 @@ class InMemoryForeshadowingRepository:
             return True
         return False
 
-class InMemorySkyboxRepository:
+class InMemorySkyboxRepository(InMemoryBulkMixin):
     """In-memory implementation of Skybox repository."""
     def __init__(self):
         self._entities = {}
@@ -9469,7 +9563,7 @@ class InMemorySkyboxRepository:
             return True
         return False
 
-class InMemoryQuest_reward_tierRepository:
+class InMemoryQuest_reward_tierRepository(InMemoryBulkMixin):
     """In-memory implementation of Quest_reward_tier repository."""
     def __init__(self):
         self._entities = {}
@@ -9499,7 +9593,7 @@ class InMemoryQuest_reward_tierRepository:
             return True
         return False
 
-class InMemoryEvolutionRepository:
+class InMemoryEvolutionRepository(InMemoryBulkMixin):
     """In-memory implementation of Evolution repository."""
     def __init__(self):
         self._entities = {}
@@ -9529,7 +9623,7 @@ class InMemoryEvolutionRepository:
             return True
         return False
 
-class InMemoryHibernationRepository:
+class InMemoryHibernationRepository(InMemoryBulkMixin):
     """In-memory implementation of Hibernation repository."""
     def __init__(self):
         self._entities = {}
@@ -9559,7 +9653,7 @@ class InMemoryHibernationRepository:
             return True
         return False
 
-class InMemoryConsequenceRepository:
+class InMemoryConsequenceRepository(InMemoryBulkMixin):
     """In-memory implementation of Consequence repository."""
     def __init__(self):
         self._entities = {}
@@ -9589,7 +9683,7 @@ class InMemoryConsequenceRepository:
             return True
         return False
 
-class InMemoryDivine_itemRepository:
+class InMemoryDivine_itemRepository(InMemoryBulkMixin):
     """In-memory implementation of Divine_item repository."""
     def __init__(self):
         self._entities = {}
@@ -9619,7 +9713,7 @@ class InMemoryDivine_itemRepository:
             return True
         return False
 
-class InMemoryEaster_eggRepository:
+class InMemoryEaster_eggRepository(InMemoryBulkMixin):
     """In-memory implementation of Easter_egg repository."""
     def __init__(self):
         self._entities = {}
@@ -9649,7 +9743,7 @@ class InMemoryEaster_eggRepository:
             return True
         return False
 
-class InMemoryVehicleRepository:
+class InMemoryVehicleRepository(InMemoryBulkMixin):
     """In-memory implementation of Vehicle repository."""
     def __init__(self):
         self._entities = {}
@@ -9679,7 +9773,7 @@ class InMemoryVehicleRepository:
             return True
         return False
 
-class InMemoryWeapon_systemRepository:
+class InMemoryWeapon_systemRepository(InMemoryBulkMixin):
     """In-memory implementation of Weapon_system repository."""
     def __init__(self):
         self._entities = {}
@@ -9709,7 +9803,7 @@ class InMemoryWeapon_systemRepository:
             return True
         return False
 
-class InMemoryPort_districtRepository:
+class InMemoryPort_districtRepository(InMemoryBulkMixin):
     """In-memory implementation of Port_district repository."""
     def __init__(self):
         self._entities = {}
@@ -9739,7 +9833,7 @@ class InMemoryPort_districtRepository:
             return True
         return False
 
-class InMemoryLibraryRepository:
+class InMemoryLibraryRepository(InMemoryBulkMixin):
     """In-memory implementation of Library repository."""
     def __init__(self):
         self._entities = {}
@@ -9769,7 +9863,7 @@ class InMemoryLibraryRepository:
             return True
         return False
 
-class InMemoryLightingRepository:
+class InMemoryLightingRepository(InMemoryBulkMixin):
     """In-memory implementation of Lighting repository."""
     def __init__(self):
         self._entities = {}
@@ -9799,7 +9893,7 @@ class InMemoryLightingRepository:
             return True
         return False
 
-class InMemoryCheckpointRepository:
+class InMemoryCheckpointRepository(InMemoryBulkMixin):
     """In-memory implementation of Checkpoint repository."""
     def __init__(self):
         self._entities = {}
@@ -9829,7 +9923,7 @@ class InMemoryCheckpointRepository:
             return True
         return False
 
-class InMemoryUniversityRepository:
+class InMemoryUniversityRepository(InMemoryBulkMixin):
     """In-memory implementation of University repository."""
     def __init__(self):
         self._entities = {}
@@ -9859,7 +9953,7 @@ class InMemoryUniversityRepository:
             return True
         return False
 
-class InMemoryTrophyRepository:
+class InMemoryTrophyRepository(InMemoryBulkMixin):
     """In-memory implementation of Trophy repository."""
     def __init__(self):
         self._entities = {}
@@ -9889,7 +9983,7 @@ class InMemoryTrophyRepository:
             return True
         return False
 
-class InMemorySummonRepository:
+class InMemorySummonRepository(InMemoryBulkMixin):
     """In-memory implementation of Summon repository."""
     def __init__(self):
         self._entities = {}
@@ -9919,7 +10013,7 @@ class InMemorySummonRepository:
             return True
         return False
 
-class InMemoryKingdomRepository:
+class InMemoryKingdomRepository(InMemoryBulkMixin):
     """In-memory implementation of Kingdom repository."""
     def __init__(self):
         self._entities = {}
@@ -9949,7 +10043,7 @@ class InMemoryKingdomRepository:
             return True
         return False
 
-class InMemoryLawRepository:
+class InMemoryLawRepository(InMemoryBulkMixin):
     """In-memory implementation of Law repository."""
     def __init__(self):
         self._entities = {}
@@ -9979,7 +10073,7 @@ class InMemoryLawRepository:
             return True
         return False
 
-class InMemoryAchievementRepository:
+class InMemoryAchievementRepository(InMemoryBulkMixin):
     """In-memory implementation of Achievement repository."""
     def __init__(self):
         self._entities = {}
@@ -10009,7 +10103,7 @@ class InMemoryAchievementRepository:
             return True
         return False
 
-class InMemoryTransitionRepository:
+class InMemoryTransitionRepository(InMemoryBulkMixin):
     """In-memory implementation of Transition repository."""
     def __init__(self):
         self._entities = {}
@@ -10039,7 +10133,7 @@ class InMemoryTransitionRepository:
             return True
         return False
 
-class InMemoryTaxRepository:
+class InMemoryTaxRepository(InMemoryBulkMixin):
     """In-memory implementation of Tax repository."""
     def __init__(self):
         self._entities = {}
@@ -10069,7 +10163,7 @@ class InMemoryTaxRepository:
             return True
         return False
 
-class InMemoryLawyerRepository:
+class InMemoryLawyerRepository(InMemoryBulkMixin):
     """In-memory implementation of Lawyer repository."""
     def __init__(self):
         self._entities = {}
@@ -10099,7 +10193,7 @@ class InMemoryLawyerRepository:
             return True
         return False
 
-class InMemoryQuest_giverRepository:
+class InMemoryQuest_giverRepository(InMemoryBulkMixin):
     """In-memory implementation of Quest_giver repository."""
     def __init__(self):
         self._entities = {}
@@ -10129,7 +10223,7 @@ class InMemoryQuest_giverRepository:
             return True
         return False
 
-class InMemoryPriceRepository:
+class InMemoryPriceRepository(InMemoryBulkMixin):
     """In-memory implementation of Price repository."""
     def __init__(self):
         self._entities = {}
@@ -10159,7 +10253,7 @@ class InMemoryPriceRepository:
             return True
         return False
 
-class InMemoryEndingRepository:
+class InMemoryEndingRepository(InMemoryBulkMixin):
     """In-memory implementation of Ending repository."""
     def __init__(self):
         self._entities = {}
@@ -10189,7 +10283,7 @@ class InMemoryEndingRepository:
             return True
         return False
 
-class InMemoryPortalRepository:
+class InMemoryPortalRepository(InMemoryBulkMixin):
     """In-memory implementation of Portal repository."""
     def __init__(self):
         self._entities = {}
@@ -10219,7 +10313,7 @@ class InMemoryPortalRepository:
             return True
         return False
 
-class InMemoryTradeRepository:
+class InMemoryTradeRepository(InMemoryBulkMixin):
     """In-memory implementation of Trade repository."""
     def __init__(self):
         self._entities = {}
@@ -10249,7 +10343,7 @@ class InMemoryTradeRepository:
             return True
         return False
 
-class InMemoryOathRepository:
+class InMemoryOathRepository(InMemoryBulkMixin):
     """In-memory implementation of Oath repository."""
     def __init__(self):
         self._entities = {}
@@ -10279,7 +10373,7 @@ class InMemoryOathRepository:
             return True
         return False
 
-class InMemoryAmbientRepository:
+class InMemoryAmbientRepository(InMemoryBulkMixin):
     """In-memory implementation of Ambient repository."""
     def __init__(self):
         self._entities = {}
@@ -10309,7 +10403,7 @@ class InMemoryAmbientRepository:
             return True
         return False
 
-class InMemoryMoonRepository:
+class InMemoryMoonRepository(InMemoryBulkMixin):
     """In-memory implementation of Moon repository."""
     def __init__(self):
         self._entities = {}
@@ -10339,7 +10433,7 @@ class InMemoryMoonRepository:
             return True
         return False
 
-class InMemoryExtinctionRepository:
+class InMemoryExtinctionRepository(InMemoryBulkMixin):
     """In-memory implementation of Extinction repository."""
     def __init__(self):
         self._entities = {}
@@ -10369,7 +10463,7 @@ class InMemoryExtinctionRepository:
             return True
         return False
 
-class InMemoryDungeonRepository:
+class InMemoryDungeonRepository(InMemoryBulkMixin):
     """In-memory implementation of Dungeon repository."""
     def __init__(self):
         self._entities = {}
@@ -10399,7 +10493,7 @@ class InMemoryDungeonRepository:
             return True
         return False
 
-class InMemoryJournal_pageRepository:
+class InMemoryJournal_pageRepository(InMemoryBulkMixin):
     """In-memory implementation of Journal_page repository."""
     def __init__(self):
         self._entities = {}
@@ -10429,7 +10523,7 @@ class InMemoryJournal_pageRepository:
             return True
         return False
 
-class InMemoryGalaxyRepository:
+class InMemoryGalaxyRepository(InMemoryBulkMixin):
     """In-memory implementation of Galaxy repository."""
     def __init__(self):
         self._entities = {}
@@ -10459,7 +10553,7 @@ class InMemoryGalaxyRepository:
             return True
         return False
 
-class InMemoryPlayer_profileRepository:
+class InMemoryPlayer_profileRepository(InMemoryBulkMixin):
     """In-memory implementation of Player_profile repository."""
     def __init__(self):
         self._entities = {}
@@ -10489,7 +10583,7 @@ class InMemoryPlayer_profileRepository:
             return True
         return False
 
-class InMemoryNoble_districtRepository:
+class InMemoryNoble_districtRepository(InMemoryBulkMixin):
     """In-memory implementation of Noble_district repository."""
     def __init__(self):
         self._entities = {}
@@ -10519,7 +10613,7 @@ class InMemoryNoble_districtRepository:
             return True
         return False
 
-class InMemoryDispositionRepository:
+class InMemoryDispositionRepository(InMemoryBulkMixin):
     """In-memory implementation of Disposition repository."""
     def __init__(self):
         self._entities = {}
@@ -10549,7 +10643,7 @@ class InMemoryDispositionRepository:
             return True
         return False
 
-class InMemoryJuryRepository:
+class InMemoryJuryRepository(InMemoryBulkMixin):
     """In-memory implementation of Jury repository."""
     def __init__(self):
         self._entities = {}
@@ -10579,7 +10673,7 @@ class InMemoryJuryRepository:
             return True
         return False
 
-class InMemoryCeremonyRepository:
+class InMemoryCeremonyRepository(InMemoryBulkMixin):
     """In-memory implementation of Ceremony repository."""
     def __init__(self):
         self._entities = {}
@@ -10610,7 +10704,7 @@ class InMemoryCeremonyRepository:
         return False
 
 # Simple PerkRepository (stub)
-class InMemoryPerkRepository:
+class InMemoryPerkRepository(BulkOperationsMixin):
     def __init__(self):
         self._perks = {}
         self._next_id = 1
@@ -10631,7 +10725,7 @@ class InMemoryPerkRepository:
         return False
 
 # Simple TraitRepository (stub)
-class InMemoryTraitRepository:
+class InMemoryTraitRepository(BulkOperationsMixin):
     def __init__(self):
         self._traits = {}
         self._next_id = 1
@@ -10652,7 +10746,7 @@ class InMemoryTraitRepository:
         return False
 
 # Simple AttributeRepository (stub)
-class InMemoryAttributeRepository:
+class InMemoryAttributeRepository(BulkOperationsMixin):
     def __init__(self):
         self._attributes = {}
         self._next_id = 1
@@ -10673,7 +10767,7 @@ class InMemoryAttributeRepository:
         return False
 
 # Simple ExperienceRepository (stub)
-class InMemoryExperienceRepository:
+class InMemoryExperienceRepository(BulkOperationsMixin):
     def __init__(self):
         self._experience = {}
         self._next_id = 1
@@ -10694,7 +10788,7 @@ class InMemoryExperienceRepository:
         return False
 
 # Simple LevelUpRepository (stub)
-class InMemoryLevelUpRepository:
+class InMemoryLevelUpRepository(BulkOperationsMixin):
     def __init__(self):
         self._level_ups = {}
         self._next_id = 1
@@ -10715,7 +10809,7 @@ class InMemoryLevelUpRepository:
         return False
 
 # Simple TalentTreeRepository (stub)
-class InMemoryTalentTreeRepository:
+class InMemoryTalentTreeRepository(BulkOperationsMixin):
     def __init__(self):
         self._talent_trees = {}
         self._next_id = 1
@@ -10736,7 +10830,7 @@ class InMemoryTalentTreeRepository:
         return False
 
 # Simple MasteryRepository (stub)
-class InMemoryMasteryRepository:
+class InMemoryMasteryRepository(BulkOperationsMixin):
     def __init__(self):
         self._masteries = {}
         self._next_id = 1
@@ -10758,7 +10852,9 @@ class InMemoryMasteryRepository:
 
 
 # Skill Repository
-class InMemorySkillRepository:
+class InMemorySkillRepository(InMemoryBulkMixin):
+    _store_attr = "_skills"
+
     def __init__(self):
         self._skills = {}
         self._next_id = 1
@@ -10782,7 +10878,9 @@ class InMemorySkillRepository:
         return False
 
 # Perk Repository
-class InMemoryPerkRepository:
+class InMemoryPerkRepository(InMemoryBulkMixin):
+    _store_attr = "_perks"
+
     def __init__(self):
         self._perks = {}
         self._next_id = 1
@@ -10806,7 +10904,9 @@ class InMemoryPerkRepository:
         return False
 
 # Trait Repository
-class InMemoryTraitRepository:
+class InMemoryTraitRepository(InMemoryBulkMixin):
+    _store_attr = "_traits"
+
     def __init__(self):
         self._traits = {}
         self._next_id = 1
@@ -10830,7 +10930,9 @@ class InMemoryTraitRepository:
         return False
 
 # Attribute Repository
-class InMemoryAttributeRepository:
+class InMemoryAttributeRepository(InMemoryBulkMixin):
+    _store_attr = "_attributes"
+
     def __init__(self):
         self._attributes = {}
         self._next_id = 1
@@ -10854,7 +10956,9 @@ class InMemoryAttributeRepository:
         return False
 
 # Experience Repository
-class InMemoryExperienceRepository:
+class InMemoryExperienceRepository(InMemoryBulkMixin):
+    _store_attr = "_experience"
+
     def __init__(self):
         self._experience = {}
         self._next_id = 1
@@ -10878,7 +10982,9 @@ class InMemoryExperienceRepository:
         return False
 
 # LevelUp Repository
-class InMemoryLevelUpRepository:
+class InMemoryLevelUpRepository(InMemoryBulkMixin):
+    _store_attr = "_level_ups"
+
     def __init__(self):
         self._level_ups = {}
         self._next_id = 1
@@ -10902,7 +11008,9 @@ class InMemoryLevelUpRepository:
         return False
 
 # TalentTree Repository
-class InMemoryTalentTreeRepository:
+class InMemoryTalentTreeRepository(InMemoryBulkMixin):
+    _store_attr = "_talent_trees"
+
     def __init__(self):
         self._talent_trees = {}
         self._next_id = 1
@@ -10926,7 +11034,9 @@ class InMemoryTalentTreeRepository:
         return False
 
 # Mastery Repository
-class InMemoryMasteryRepository:
+class InMemoryMasteryRepository(InMemoryBulkMixin):
+    _store_attr = "_masteries"
+
     def __init__(self):
         self._masteries = {}
         self._next_id = 1
@@ -10951,7 +11061,9 @@ class InMemoryMasteryRepository:
 
 
 # Skill Repository
-class InMemorySkillRepository:
+class InMemorySkillRepository(InMemoryBulkMixin):
+    _store_attr = "_skills"
+
     def __init__(self):
         self._skills = {}
         self._next_id = 1
@@ -10975,7 +11087,9 @@ class InMemorySkillRepository:
         return False
 
 # Perk Repository
-class InMemoryPerkRepository:
+class InMemoryPerkRepository(InMemoryBulkMixin):
+    _store_attr = "_perks"
+
     def __init__(self):
         self._perks = {}
         self._next_id = 1
@@ -10999,7 +11113,9 @@ class InMemoryPerkRepository:
         return False
 
 # Trait Repository
-class InMemoryTraitRepository:
+class InMemoryTraitRepository(InMemoryBulkMixin):
+    _store_attr = "_traits"
+
     def __init__(self):
         self._traits = {}
         self._next_id = 1
@@ -11023,7 +11139,9 @@ class InMemoryTraitRepository:
         return False
 
 # Attribute Repository
-class InMemoryAttributeRepository:
+class InMemoryAttributeRepository(InMemoryBulkMixin):
+    _store_attr = "_attributes"
+
     def __init__(self):
         self._attributes = {}
         self._next_id = 1
@@ -11047,7 +11165,9 @@ class InMemoryAttributeRepository:
         return False
 
 # Experience Repository
-class InMemoryExperienceRepository:
+class InMemoryExperienceRepository(InMemoryBulkMixin):
+    _store_attr = "_experience"
+
     def __init__(self):
         self._experience = {}
         self._next_id = 1
@@ -11071,7 +11191,9 @@ class InMemoryExperienceRepository:
         return False
 
 # LevelUp Repository
-class InMemoryLevelUpRepository:
+class InMemoryLevelUpRepository(InMemoryBulkMixin):
+    _store_attr = "_level_ups"
+
     def __init__(self):
         self._level_ups = {}
         self._next_id = 1
@@ -11095,7 +11217,9 @@ class InMemoryLevelUpRepository:
         return False
 
 # TalentTree Repository
-class InMemoryTalentTreeRepository:
+class InMemoryTalentTreeRepository(InMemoryBulkMixin):
+    _store_attr = "_talent_trees"
+
     def __init__(self):
         self._talent_trees = {}
         self._next_id = 1
@@ -11119,7 +11243,9 @@ class InMemoryTalentTreeRepository:
         return False
 
 # Mastery Repository
-class InMemoryMasteryRepository:
+class InMemoryMasteryRepository(InMemoryBulkMixin):
+    _store_attr = "_masteries"
+
     def __init__(self):
         self._masteries = {}
         self._next_id = 1
@@ -11144,7 +11270,9 @@ class InMemoryMasteryRepository:
 
 
 # World History Repositories
-class InMemoryEraRepository:
+class InMemoryEraRepository(InMemoryBulkMixin):
+    _store_attr = "_eras"
+
     def __init__(self):
         self._eras = {}
         self._next_id = 1
@@ -11166,7 +11294,9 @@ class InMemoryEraRepository:
             return True
         return False
 
-class InMemoryEraTransitionRepository:
+class InMemoryEraTransitionRepository(InMemoryBulkMixin):
+    _store_attr = "_transitions"
+
     def __init__(self):
         self._transitions = {}
         self._next_id = 1
@@ -11190,7 +11320,9 @@ class InMemoryEraTransitionRepository:
             return True
         return False
 
-class InMemoryTimelineRepository:
+class InMemoryTimelineRepository(InMemoryBulkMixin):
+    _store_attr = "_events"
+
     def __init__(self):
         self._events = {}
         self._next_id = 1
@@ -11214,7 +11346,9 @@ class InMemoryTimelineRepository:
             return True
         return False
 
-class InMemoryCalendarRepository:
+class InMemoryCalendarRepository(InMemoryBulkMixin):
+    _store_attr = "_calendars"
+
     def __init__(self):
         self._calendars = {}
         self._next_id = 1
@@ -11237,7 +11371,9 @@ class InMemoryCalendarRepository:
         return False
 
 # Time System Repositories
-class InMemoryHolidayRepository:
+class InMemoryHolidayRepository(InMemoryBulkMixin):
+    _store_attr = "_holidays"
+
     def __init__(self):
         self._holidays = {}
         self._next_id = 1
@@ -11261,7 +11397,9 @@ class InMemoryHolidayRepository:
             return True
         return False
 
-class InMemorySeasonRepository:
+class InMemorySeasonRepository(InMemoryBulkMixin):
+    _store_attr = "_seasons"
+
     def __init__(self):
         self._seasons = {}
         self._next_id = 1
@@ -11285,7 +11423,9 @@ class InMemorySeasonRepository:
             return True
         return False
 
-class InMemoryTimePeriodRepository:
+class InMemoryTimePeriodRepository(InMemoryBulkMixin):
+    _store_attr = "_periods"
+
     def __init__(self):
         self._periods = {}
         self._next_id = 1
@@ -11308,7 +11448,9 @@ class InMemoryTimePeriodRepository:
         return False
 
 # Politics/Law Repositories
-class InMemoryTreatyRepository:
+class InMemoryTreatyRepository(InMemoryBulkMixin):
+    _store_attr = "_treaties"
+
     def __init__(self):
         self._treaties = {}
         self._next_id = 1
@@ -11332,7 +11474,9 @@ class InMemoryTreatyRepository:
             return True
         return False
 
-class InMemoryConstitutionRepository:
+class InMemoryConstitutionRepository(InMemoryBulkMixin):
+    _store_attr = "_constitutions"
+
     def __init__(self):
         self._constitutions = {}
         self._next_id = 1
@@ -11356,7 +11500,9 @@ class InMemoryConstitutionRepository:
             return True
         return False
 
-class InMemoryLawRepository:
+class InMemoryLawRepository(InMemoryBulkMixin):
+    _store_attr = "_laws"
+
     def __init__(self):
         self._laws = {}
         self._next_id = 1
@@ -11380,7 +11526,9 @@ class InMemoryLawRepository:
             return True
         return False
 
-class InMemoryLegalSystemRepository:
+class InMemoryLegalSystemRepository(InMemoryBulkMixin):
+    _store_attr = "_systems"
+
     def __init__(self):
         self._systems = {}
         self._next_id = 1
@@ -11405,7 +11553,9 @@ class InMemoryLegalSystemRepository:
         return False
 
 # Political Entities Repositories
-class InMemoryNationRepository:
+class InMemoryNationRepository(InMemoryBulkMixin):
+    _store_attr = "_nations"
+
     def __init__(self):
         self._nations = {}
         self._next_id = 1
@@ -11429,7 +11579,9 @@ class InMemoryNationRepository:
             return True
         return False
 
-class InMemoryKingdomRepository:
+class InMemoryKingdomRepository(InMemoryBulkMixin):
+    _store_attr = "_kingdoms"
+
     def __init__(self):
         self._kingdoms = {}
         self._next_id = 1
@@ -11453,7 +11605,9 @@ class InMemoryKingdomRepository:
             return True
         return False
 
-class InMemoryEmpireRepository:
+class InMemoryEmpireRepository(InMemoryBulkMixin):
+    _store_attr = "_empires"
+
     def __init__(self):
         self._empires = {}
         self._next_id = 1
@@ -11477,7 +11631,9 @@ class InMemoryEmpireRepository:
             return True
         return False
 
-class InMemoryGovernmentRepository:
+class InMemoryGovernmentRepository(InMemoryBulkMixin):
+    _store_attr = "_governments"
+
     def __init__(self):
         self._governments = {}
         self._next_id = 1
@@ -11501,7 +11657,9 @@ class InMemoryGovernmentRepository:
             return True
         return False
 
-class InMemoryAllianceRepository:
+class InMemoryAllianceRepository(InMemoryBulkMixin):
+    _store_attr = "_alliances"
+
     def __init__(self):
         self._alliances = {}
         self._next_id = 1
@@ -11529,7 +11687,9 @@ class InMemoryAllianceRepository:
 # ============================================================================
 
 # Social Relations Repositories (7)
-class InMemoryReputationRepository:
+class InMemoryReputationRepository(InMemoryBulkMixin):
+    _store_attr = "_reputations"
+
     def __init__(self):
         self._reputations = {}
         self._next_id = 1
@@ -11551,7 +11711,9 @@ class InMemoryReputationRepository:
             return True
         return False
 
-class InMemoryAffinityRepository:
+class InMemoryAffinityRepository(InMemoryBulkMixin):
+    _store_attr = "_affinities"
+
     def __init__(self):
         self._affinities = {}
         self._next_id = 1
@@ -11573,7 +11735,9 @@ class InMemoryAffinityRepository:
             return True
         return False
 
-class InMemoryDispositionRepository:
+class InMemoryDispositionRepository(InMemoryBulkMixin):
+    _store_attr = "_dispositions"
+
     def __init__(self):
         self._dispositions = {}
         self._next_id = 1
@@ -11595,7 +11759,9 @@ class InMemoryDispositionRepository:
             return True
         return False
 
-class InMemoryHonorRepository:
+class InMemoryHonorRepository(InMemoryBulkMixin):
+    _store_attr = "_honor"
+
     def __init__(self):
         self._honor = {}
         self._next_id = 1
@@ -11617,7 +11783,9 @@ class InMemoryHonorRepository:
             return True
         return False
 
-class InMemoryKarmaRepository:
+class InMemoryKarmaRepository(InMemoryBulkMixin):
+    _store_attr = "_karmas"
+
     def __init__(self):
         self._karmas = {}
         self._next_id = 1
@@ -11639,7 +11807,9 @@ class InMemoryKarmaRepository:
             return True
         return False
 
-class InMemorySocialClassRepository:
+class InMemorySocialClassRepository(InMemoryBulkMixin):
+    _store_attr = "_social_classes"
+
     def __init__(self):
         self._social_classes = {}
         self._next_id = 1
@@ -11661,7 +11831,9 @@ class InMemorySocialClassRepository:
             return True
         return False
 
-class InMemorySocialMobilityRepository:
+class InMemorySocialMobilityRepository(InMemoryBulkMixin):
+    _store_attr = "_mobilities"
+
     def __init__(self):
         self._mobilities = {}
         self._next_id = 1
@@ -11684,7 +11856,9 @@ class InMemorySocialMobilityRepository:
         return False
 
 # Religion/Mysticism Repositories (10)
-class InMemoryCultRepository:
+class InMemoryCultRepository(InMemoryBulkMixin):
+    _store_attr = "_cults"
+
     def __init__(self):
         self._cults = {}
         self._next_id = 1
@@ -11706,7 +11880,9 @@ class InMemoryCultRepository:
             return True
         return False
 
-class InMemorySectRepository:
+class InMemorySectRepository(InMemoryBulkMixin):
+    _store_attr = "_sects"
+
     def __init__(self):
         self._sects = {}
         self._next_id = 1
@@ -11728,7 +11904,9 @@ class InMemorySectRepository:
             return True
         return False
 
-class InMemoryHolySiteRepository:
+class InMemoryHolySiteRepository(InMemoryBulkMixin):
+    _store_attr = "_holy_sites"
+
     def __init__(self):
         self._holy_sites = {}
         self._next_id = 1
@@ -11750,7 +11928,9 @@ class InMemoryHolySiteRepository:
             return True
         return False
 
-class InMemoryScriptureRepository:
+class InMemoryScriptureRepository(InMemoryBulkMixin):
+    _store_attr = "_scriptures"
+
     def __init__(self):
         self._scriptures = {}
         self._next_id = 1
@@ -11772,7 +11952,9 @@ class InMemoryScriptureRepository:
             return True
         return False
 
-class InMemoryRitualRepository:
+class InMemoryRitualRepository(InMemoryBulkMixin):
+    _store_attr = "_rituals"
+
     def __init__(self):
         self._rituals = {}
         self._next_id = 1
@@ -11794,7 +11976,9 @@ class InMemoryRitualRepository:
             return True
         return False
 
-class InMemoryOathRepository:
+class InMemoryOathRepository(InMemoryBulkMixin):
+    _store_attr = "_oaths"
+
     def __init__(self):
         self._oaths = {}
         self._next_id = 1
@@ -11816,7 +12000,9 @@ class InMemoryOathRepository:
             return True
         return False
 
-class InMemorySummonRepository:
+class InMemorySummonRepository(InMemoryBulkMixin):
+    _store_attr = "_summons"
+
     def __init__(self):
         self._summons = {}
         self._next_id = 1
@@ -11838,7 +12024,9 @@ class InMemorySummonRepository:
             return True
         return False
 
-class InMemoryPactRepository:
+class InMemoryPactRepository(InMemoryBulkMixin):
+    _store_attr = "_pacts"
+
     def __init__(self):
         self._pacts = {}
         self._next_id = 1
@@ -11860,7 +12048,9 @@ class InMemoryPactRepository:
             return True
         return False
 
-class InMemoryCurseRepository:
+class InMemoryCurseRepository(InMemoryBulkMixin):
+    _store_attr = "_curses"
+
     def __init__(self):
         self._curses = {}
         self._next_id = 1
@@ -11882,7 +12072,9 @@ class InMemoryCurseRepository:
             return True
         return False
 
-class InMemoryBlessingRepository:
+class InMemoryBlessingRepository(InMemoryBulkMixin):
+    _store_attr = "_blessings"
+
     def __init__(self):
         self._blessings = {}
         self._next_id = 1
@@ -11905,7 +12097,9 @@ class InMemoryBlessingRepository:
         return False
 
 # Locations Repositories (10)
-class InMemoryHubAreaRepository:
+class InMemoryHubAreaRepository(InMemoryBulkMixin):
+    _store_attr = "_hub_areas"
+
     def __init__(self):
         self._hub_areas = {}
         self._next_id = 1
@@ -11927,7 +12121,9 @@ class InMemoryHubAreaRepository:
             return True
         return False
 
-class InMemoryInstanceRepository:
+class InMemoryInstanceRepository(InMemoryBulkMixin):
+    _store_attr = "_instances"
+
     def __init__(self):
         self._instances = {}
         self._next_id = 1
@@ -11949,7 +12145,9 @@ class InMemoryInstanceRepository:
             return True
         return False
 
-class InMemoryDungeonRepository:
+class InMemoryDungeonRepository(InMemoryBulkMixin):
+    _store_attr = "_dungeons"
+
     def __init__(self):
         self._dungeons = {}
         self._next_id = 1
@@ -11971,7 +12169,9 @@ class InMemoryDungeonRepository:
             return True
         return False
 
-class InMemoryRaidRepository:
+class InMemoryRaidRepository(InMemoryBulkMixin):
+    _store_attr = "_raids"
+
     def __init__(self):
         self._raids = {}
         self._next_id = 1
@@ -11993,7 +12193,9 @@ class InMemoryRaidRepository:
             return True
         return False
 
-class InMemoryArenaRepository:
+class InMemoryArenaRepository(InMemoryBulkMixin):
+    _store_attr = "_arenas"
+
     def __init__(self):
         self._arenas = {}
         self._next_id = 1
@@ -12015,7 +12217,9 @@ class InMemoryArenaRepository:
             return True
         return False
 
-class InMemoryOpenWorldZoneRepository:
+class InMemoryOpenWorldZoneRepository(InMemoryBulkMixin):
+    _store_attr = "_open_world_zones"
+
     def __init__(self):
         self._open_world_zones = {}
         self._next_id = 1
@@ -12037,7 +12241,9 @@ class InMemoryOpenWorldZoneRepository:
             return True
         return False
 
-class InMemoryUndergroundRepository:
+class InMemoryUndergroundRepository(InMemoryBulkMixin):
+    _store_attr = "_undergrounds"
+
     def __init__(self):
         self._undergrounds = {}
         self._next_id = 1
@@ -12059,7 +12265,9 @@ class InMemoryUndergroundRepository:
             return True
         return False
 
-class InMemorySkyboxRepository:
+class InMemorySkyboxRepository(InMemoryBulkMixin):
+    _store_attr = "_skyboxes"
+
     def __init__(self):
         self._skyboxes = {}
         self._next_id = 1
@@ -12081,7 +12289,9 @@ class InMemorySkyboxRepository:
             return True
         return False
 
-class InMemoryDimensionRepository:
+class InMemoryDimensionRepository(InMemoryBulkMixin):
+    _store_attr = "_dimensions"
+
     def __init__(self):
         self._dimensions = {}
         self._next_id = 1
@@ -12103,7 +12313,9 @@ class InMemoryDimensionRepository:
             return True
         return False
 
-class InMemoryPocketDimensionRepository:
+class InMemoryPocketDimensionRepository(InMemoryBulkMixin):
+    _store_attr = "_pocket_dimensions"
+
     def __init__(self):
         self._pocket_dimensions = {}
         self._next_id = 1
@@ -12126,7 +12338,9 @@ class InMemoryPocketDimensionRepository:
         return False
 
 # Inventory/Crafting Repositories (9)
-class InMemoryInventoryRepository:
+class InMemoryInventoryRepository(InMemoryBulkMixin):
+    _store_attr = "_inventories"
+
     def __init__(self):
         self._inventories = {}
         self._next_id = 1
@@ -12148,7 +12362,9 @@ class InMemoryInventoryRepository:
             return True
         return False
 
-class InMemoryCraftingRecipeRepository:
+class InMemoryCraftingRecipeRepository(InMemoryBulkMixin):
+    _store_attr = "_recipes"
+
     def __init__(self):
         self._recipes = {}
         self._next_id = 1
@@ -12170,7 +12386,9 @@ class InMemoryCraftingRecipeRepository:
             return True
         return False
 
-class InMemoryMaterialRepository:
+class InMemoryMaterialRepository(InMemoryBulkMixin):
+    _store_attr = "_materials"
+
     def __init__(self):
         self._materials = {}
         self._next_id = 1
@@ -12192,7 +12410,9 @@ class InMemoryMaterialRepository:
             return True
         return False
 
-class InMemoryComponentRepository:
+class InMemoryComponentRepository(InMemoryBulkMixin):
+    _store_attr = "_components"
+
     def __init__(self):
         self._components = {}
         self._next_id = 1
@@ -12214,7 +12434,9 @@ class InMemoryComponentRepository:
             return True
         return False
 
-class InMemoryBlueprintRepository:
+class InMemoryBlueprintRepository(InMemoryBulkMixin):
+    _store_attr = "_blueprints"
+
     def __init__(self):
         self._blueprints = {}
         self._next_id = 1
@@ -12236,7 +12458,9 @@ class InMemoryBlueprintRepository:
             return True
         return False
 
-class InMemoryEnchantmentRepository:
+class InMemoryEnchantmentRepository(InMemoryBulkMixin):
+    _store_attr = "_enchantments"
+
     def __init__(self):
         self._enchantments = {}
         self._next_id = 1
@@ -12258,7 +12482,9 @@ class InMemoryEnchantmentRepository:
             return True
         return False
 
-class InMemorySocketRepository:
+class InMemorySocketRepository(InMemoryBulkMixin):
+    _store_attr = "_sockets"
+
     def __init__(self):
         self._sockets = {}
         self._next_id = 1
@@ -12280,7 +12506,9 @@ class InMemorySocketRepository:
             return True
         return False
 
-class InMemoryRuneRepository:
+class InMemoryRuneRepository(InMemoryBulkMixin):
+    _store_attr = "_runes"
+
     def __init__(self):
         self._runes = {}
         self._next_id = 1
@@ -12302,7 +12530,9 @@ class InMemoryRuneRepository:
             return True
         return False
 
-class InMemoryGlyphRepository:
+class InMemoryGlyphRepository(InMemoryBulkMixin):
+    _store_attr = "_glyphs"
+
     def __init__(self):
         self._glyphs = {}
         self._next_id = 1
@@ -12329,7 +12559,9 @@ class InMemoryGlyphRepository:
 # ============================================================================
 
 # UGC/Localization/Analytics Repositories (15)
-class InMemoryModRepository:
+class InMemoryModRepository(InMemoryBulkMixin):
+    _store_attr = "_mods"
+
     def __init__(self):
         self._mods = {}
         self._next_id = 1
@@ -12350,7 +12582,9 @@ class InMemoryModRepository:
             return True
         return False
 
-class InMemoryCustomMapRepository:
+class InMemoryCustomMapRepository(InMemoryBulkMixin):
+    _store_attr = "_custom_maps"
+
     def __init__(self):
         self._custom_maps = {}
         self._next_id = 1
@@ -12371,7 +12605,9 @@ class InMemoryCustomMapRepository:
             return True
         return False
 
-class InMemoryUserScenarioRepository:
+class InMemoryUserScenarioRepository(InMemoryBulkMixin):
+    _store_attr = "_scenarios"
+
     def __init__(self):
         self._scenarios = {}
         self._next_id = 1
@@ -12392,7 +12628,9 @@ class InMemoryUserScenarioRepository:
             return True
         return False
 
-class InMemoryShareCodeRepository:
+class InMemoryShareCodeRepository(InMemoryBulkMixin):
+    _store_attr = "_codes"
+
     def __init__(self):
         self._codes = {}
         self._next_id = 1
@@ -12413,7 +12651,9 @@ class InMemoryShareCodeRepository:
             return True
         return False
 
-class InMemoryWorkshopEntryRepository:
+class InMemoryWorkshopEntryRepository(InMemoryBulkMixin):
+    _store_attr = "_entries"
+
     def __init__(self):
         self._entries = {}
         self._next_id = 1
@@ -12434,7 +12674,9 @@ class InMemoryWorkshopEntryRepository:
             return True
         return False
 
-class InMemoryLocalizationRepository:
+class InMemoryLocalizationRepository(InMemoryBulkMixin):
+    _store_attr = "_localizations"
+
     def __init__(self):
         self._localizations = {}
         self._next_id = 1
@@ -12455,7 +12697,9 @@ class InMemoryLocalizationRepository:
             return True
         return False
 
-class InMemoryTranslationRepository:
+class InMemoryTranslationRepository(InMemoryBulkMixin):
+    _store_attr = "_translations"
+
     def __init__(self):
         self._translations = {}
         self._next_id = 1
@@ -12476,7 +12720,9 @@ class InMemoryTranslationRepository:
             return True
         return False
 
-class InMemoryVoiceOverRepository:
+class InMemoryVoiceOverRepository(InMemoryBulkMixin):
+    _store_attr = "_voice_overs"
+
     def __init__(self):
         self._voice_overs = {}
         self._next_id = 1
@@ -12497,7 +12743,9 @@ class InMemoryVoiceOverRepository:
             return True
         return False
 
-class InMemorySubtitleRepository:
+class InMemorySubtitleRepository(InMemoryBulkMixin):
+    _store_attr = "_subtitles"
+
     def __init__(self):
         self._subtitles = {}
         self._next_id = 1
@@ -12518,9 +12766,11 @@ class InMemorySubtitleRepository:
             return True
         return False
 
-class InMemoryDubbingRepository:
+class InMemoryDubbingRepository(InMemoryBulkMixin):
+    _store_attr = "_dubbings"
+
     def __init__(self):
-        self._ dubbings = {}
+        self._dubbings = {}
         self._next_id = 1
     def save(self, dubbing):
         if dubbing.id is None:
@@ -12539,7 +12789,9 @@ class InMemoryDubbingRepository:
             return True
         return False
 
-class InMemoryPlayerMetricRepository:
+class InMemoryPlayerMetricRepository(InMemoryBulkMixin):
+    _store_attr = "_player_metrics"
+
     def __init__(self):
         self._player_metrics = {}
         self._next_id = 1
@@ -12560,7 +12812,9 @@ class InMemoryPlayerMetricRepository:
             return True
         return False
 
-class InMemorySessionDataRepository:
+class InMemorySessionDataRepository(InMemoryBulkMixin):
+    _store_attr = "_session_data"
+
     def __init__(self):
         self._session_data = {}
         self._next_id = 1
@@ -12581,7 +12835,9 @@ class InMemorySessionDataRepository:
             return True
         return False
 
-class InMemoryHeatmapRepository:
+class InMemoryHeatmapRepository(InMemoryBulkMixin):
+    _store_attr = "_heatmaps"
+
     def __init__(self):
         self._heatmaps = {}
         self._next_id = 1
@@ -12602,7 +12858,9 @@ class InMemoryHeatmapRepository:
             return True
         return False
 
-class InMemoryDropRateRepository:
+class InMemoryDropRateRepository(InMemoryBulkMixin):
+    _store_attr = "_drop_rates"
+
     def __init__(self):
         self._drop_rates = {}
         self._next_id = 1
@@ -12623,7 +12881,9 @@ class InMemoryDropRateRepository:
             return True
         return False
 
-class InMemoryConversionRateRepository:
+class InMemoryConversionRateRepository(InMemoryBulkMixin):
+    _store_attr = "_conversion_rates"
+
     def __init__(self):
         self._conversion_rates = {}
         self._next_id = 1
@@ -12645,7 +12905,9 @@ class InMemoryConversionRateRepository:
         return False
 
 # LegendaryItems Repositories (6)
-class InMemoryLegendaryWeaponRepository:
+class InMemoryLegendaryWeaponRepository(InMemoryBulkMixin):
+    _store_attr = "_weapons"
+
     def __init__(self):
         self._weapons = {}
         self._next_id = 1
@@ -12666,7 +12928,9 @@ class InMemoryLegendaryWeaponRepository:
             return True
         return False
 
-class InMemoryMythicalArmorRepository:
+class InMemoryMythicalArmorRepository(InMemoryBulkMixin):
+    _store_attr = "_armors"
+
     def __init__(self):
         self._armors = {}
         self._next_id = 1
@@ -12687,7 +12951,9 @@ class InMemoryMythicalArmorRepository:
             return True
         return False
 
-class InMemoryDivineItemRepository:
+class InMemoryDivineItemRepository(InMemoryBulkMixin):
+    _store_attr = "_divine_items"
+
     def __init__(self):
         self._divine_items = {}
         self._next_id = 1
@@ -12708,7 +12974,9 @@ class InMemoryDivineItemRepository:
             return True
         return False
 
-class InMemoryCursedItemRepository:
+class InMemoryCursedItemRepository(InMemoryBulkMixin):
+    _store_attr = "_cursed_items"
+
     def __init__(self):
         self._cursed_items = {}
         self._next_id = 1
@@ -12729,7 +12997,9 @@ class InMemoryCursedItemRepository:
             return True
         return False
 
-class InMemoryArtifactSetRepository:
+class InMemoryArtifactSetRepository(InMemoryBulkMixin):
+    _store_attr = "_artifact_sets"
+
     def __init__(self):
         self._artifact_sets = {}
         self._next_id = 1
@@ -12750,7 +13020,9 @@ class InMemoryArtifactSetRepository:
             return True
         return False
 
-class InMemoryRelicCollectionRepository:
+class InMemoryRelicCollectionRepository(InMemoryBulkMixin):
+    _store_attr = "_relic_collections"
+
     def __init__(self):
         self._relic_collections = {}
         self._next_id = 1
@@ -12772,7 +13044,9 @@ class InMemoryRelicCollectionRepository:
         return False
 
 # Companions/Transport Repositories (9)
-class InMemoryPetRepository:
+class InMemoryPetRepository(InMemoryBulkMixin):
+    _store_attr = "_pets"
+
     def __init__(self):
         self._pets = {}
         self._next_id = 1
@@ -12793,7 +13067,9 @@ class InMemoryPetRepository:
             return True
         return False
 
-class InMemoryMountRepository:
+class InMemoryMountRepository(InMemoryBulkMixin):
+    _store_attr = "_mounts"
+
     def __init__(self):
         self._mounts = {}
         self._next_id = 1
@@ -12814,7 +13090,9 @@ class InMemoryMountRepository:
             return True
         return False
 
-class InMemoryFamiliarRepository:
+class InMemoryFamiliarRepository(InMemoryBulkMixin):
+    _store_attr = "_familiars"
+
     def __init__(self):
         self._familiars = {}
         self._next_id = 1
@@ -12835,7 +13113,9 @@ class InMemoryFamiliarRepository:
             return True
         return False
 
-class InMemoryMountEquipmentRepository:
+class InMemoryMountEquipmentRepository(InMemoryBulkMixin):
+    _store_attr = "_mount_equipment"
+
     def __init__(self):
         self._mount_equipment = {}
         self._next_id = 1
@@ -12856,7 +13136,9 @@ class InMemoryMountEquipmentRepository:
             return True
         return False
 
-class InMemoryVehicleRepository:
+class InMemoryVehicleRepository(InMemoryBulkMixin):
+    _store_attr = "_vehicles"
+
     def __init__(self):
         self._vehicles = {}
         self._next_id = 1
@@ -12877,7 +13159,9 @@ class InMemoryVehicleRepository:
             return True
         return False
 
-class InMemorySpaceshipRepository:
+class InMemorySpaceshipRepository(InMemoryBulkMixin):
+    _store_attr = "_spaceships"
+
     def __init__(self):
         self._spaceships = {}
         self._next_id = 1
@@ -12898,7 +13182,9 @@ class InMemorySpaceshipRepository:
             return True
         return False
 
-class InMemoryAirshipRepository:
+class InMemoryAirshipRepository(InMemoryBulkMixin):
+    _store_attr = "_airships"
+
     def __init__(self):
         self._airships = {}
         self._next_id = 1
@@ -12919,7 +13205,9 @@ class InMemoryAirshipRepository:
             return True
         return False
 
-class InMemoryPortalRepository:
+class InMemoryPortalRepository(InMemoryBulkMixin):
+    _store_attr = "_portals"
+
     def __init__(self):
         self._portals = {}
         self._next_id = 1
@@ -12940,7 +13228,9 @@ class InMemoryPortalRepository:
             return True
         return False
 
-class InMemoryTeleporterRepository:
+class InMemoryTeleporterRepository(InMemoryBulkMixin):
+    _store_attr = "_teleporters"
+
     def __init__(self):
         self._teleporters = {}
         self._next_id = 1
@@ -12962,7 +13252,9 @@ class InMemoryTeleporterRepository:
         return False
 
 # Institutions Repositories (7)
-class InMemoryAcademyRepository:
+class InMemoryAcademyRepository(InMemoryBulkMixin):
+    _store_attr = "_academies"
+
     def __init__(self):
         self._academies = {}
         self._next_id = 1
@@ -12983,7 +13275,9 @@ class InMemoryAcademyRepository:
             return True
         return False
 
-class InMemoryUniversityRepository:
+class InMemoryUniversityRepository(InMemoryBulkMixin):
+    _store_attr = "_universities"
+
     def __init__(self):
         self._universities = {}
         self._next_id = 1
@@ -13004,7 +13298,9 @@ class InMemoryUniversityRepository:
             return True
         return False
 
-class InMemorySchoolRepository:
+class InMemorySchoolRepository(InMemoryBulkMixin):
+    _store_attr = "_schools"
+
     def __init__(self):
         self._schools = {}
         self._next_id = 1
@@ -13025,7 +13321,9 @@ class InMemorySchoolRepository:
             return True
         return False
 
-class InMemoryLibraryRepository:
+class InMemoryLibraryRepository(InMemoryBulkMixin):
+    _store_attr = "_libraries"
+
     def __init__(self):
         self._libraries = {}
         self._next_id = 1
@@ -13046,7 +13344,9 @@ class InMemoryLibraryRepository:
             return True
         return False
 
-class InMemoryResearchCenterRepository:
+class InMemoryResearchCenterRepository(InMemoryBulkMixin):
+    _store_attr = "_research_centers"
+
     def __init__(self):
         self._research_centers = {}
         self._next_id = 1
@@ -13067,7 +13367,9 @@ class InMemoryResearchCenterRepository:
             return True
         return False
 
-class InMemoryArchiveRepository:
+class InMemoryArchiveRepository(InMemoryBulkMixin):
+    _store_attr = "_archives"
+
     def __init__(self):
         self._archives = {}
         self._next_id = 1
@@ -13088,7 +13390,9 @@ class InMemoryArchiveRepository:
             return True
         return False
 
-class InMemoryMuseumRepository:
+class InMemoryMuseumRepository(InMemoryBulkMixin):
+    _store_attr = "_museums"
+
     def __init__(self):
         self._museums = {}
         self._next_id = 1
@@ -13110,7 +13414,9 @@ class InMemoryMuseumRepository:
         return False
 
 # Media Repositories (7)
-class InMemoryNewspaperRepository:
+class InMemoryNewspaperRepository(InMemoryBulkMixin):
+    _store_attr = "_newspapers"
+
     def __init__(self):
         self._newspapers = {}
         self._next_id = 1
@@ -13131,7 +13437,9 @@ class InMemoryNewspaperRepository:
             return True
         return False
 
-class InMemoryRadioRepository:
+class InMemoryRadioRepository(InMemoryBulkMixin):
+    _store_attr = "_radios"
+
     def __init__(self):
         self._radios = {}
         self._next_id = 1
@@ -13152,7 +13460,9 @@ class InMemoryRadioRepository:
             return True
         return False
 
-class InMemoryTelevisionRepository:
+class InMemoryTelevisionRepository(InMemoryBulkMixin):
+    _store_attr = "_televisions"
+
     def __init__(self):
         self._televisions = {}
         self._next_id = 1
@@ -13173,7 +13483,9 @@ class InMemoryTelevisionRepository:
             return True
         return False
 
-class InMemoryInternetRepository:
+class InMemoryInternetRepository(InMemoryBulkMixin):
+    _store_attr = "_internets"
+
     def __init__(self):
         self._internets = {}
         self._next_id = 1
@@ -13194,7 +13506,9 @@ class InMemoryInternetRepository:
             return True
         return False
 
-class InMemorySocialMediaRepository:
+class InMemorySocialMediaRepository(InMemoryBulkMixin):
+    _store_attr = "_social_medias"
+
     def __init__(self):
         self._social_medias = {}
         self._next_id = 1
@@ -13215,7 +13529,9 @@ class InMemorySocialMediaRepository:
             return True
         return False
 
-class InMemoryPropagandaRepository:
+class InMemoryPropagandaRepository(InMemoryBulkMixin):
+    _store_attr = "_propaganda"
+
     def __init__(self):
         self._propaganda = {}
         self._next_id = 1
@@ -13236,7 +13552,9 @@ class InMemoryPropagandaRepository:
             return True
         return False
 
-class InMemoryRumorRepository:
+class InMemoryRumorRepository(InMemoryBulkMixin):
+    _store_attr = "_rumors"
+
     def __init__(self):
         self._rumors = {}
         self._next_id = 1
@@ -13258,7 +13576,9 @@ class InMemoryRumorRepository:
         return False
 
 # Secrets Repositories (8)
-class InMemorySecretAreaRepository:
+class InMemorySecretAreaRepository(InMemoryBulkMixin):
+    _store_attr = "_secret_areas"
+
     def __init__(self):
         self._secret_areas = {}
         self._next_id = 1
@@ -13279,7 +13599,9 @@ class InMemorySecretAreaRepository:
             return True
         return False
 
-class InMemoryHiddenPathRepository:
+class InMemoryHiddenPathRepository(InMemoryBulkMixin):
+    _store_attr = "_hidden_paths"
+
     def __init__(self):
         self._hidden_paths = {}
         self._next_id = 1
@@ -13300,7 +13622,9 @@ class InMemoryHiddenPathRepository:
             return True
         return False
 
-class InMemoryEasterEggRepository:
+class InMemoryEasterEggRepository(InMemoryBulkMixin):
+    _store_attr = "_easter_eggs"
+
     def __init__(self):
         self._easter_eggs = {}
         self._next_id = 1
@@ -13321,7 +13645,9 @@ class InMemoryEasterEggRepository:
             return True
         return False
 
-class InMemoryMysteryRepository:
+class InMemoryMysteryRepository(InMemoryBulkMixin):
+    _store_attr = "_mysteries"
+
     def __init__(self):
         self._mysteries = {}
         self._next_id = 1
@@ -13342,7 +13668,9 @@ class InMemoryMysteryRepository:
             return True
         return False
 
-class InMemoryEnigmaRepository:
+class InMemoryEnigmaRepository(InMemoryBulkMixin):
+    _store_attr = "_enigmas"
+
     def __init__(self):
         self._enigmas = {}
         self._next_id = 1
@@ -13363,7 +13691,9 @@ class InMemoryEnigmaRepository:
             return True
         return False
 
-class InMemoryRiddleRepository:
+class InMemoryRiddleRepository(InMemoryBulkMixin):
+    _store_attr = "_riddles"
+
     def __init__(self):
         self._riddles = {}
         self._next_id = 1
@@ -13384,7 +13714,9 @@ class InMemoryRiddleRepository:
             return True
         return False
 
-class InMemoryPuzzleRepository:
+class InMemoryPuzzleRepository(InMemoryBulkMixin):
+    _store_attr = "_puzzles"
+
     def __init__(self):
         self._puzzles = {}
         self._next_id = 1
@@ -13405,7 +13737,9 @@ class InMemoryPuzzleRepository:
             return True
         return False
 
-class InMemoryTrapRepository:
+class InMemoryTrapRepository(InMemoryBulkMixin):
+    _store_attr = "_traps"
+
     def __init__(self):
         self._traps = {}
         self._next_id = 1
@@ -13427,7 +13761,9 @@ class InMemoryTrapRepository:
         return False
 
 # Art Repositories (7)
-class InMemoryFestivalRepository:
+class InMemoryFestivalRepository(InMemoryBulkMixin):
+    _store_attr = "_festivals"
+
     def __init__(self):
         self._festivals = {}
         self._next_id = 1
@@ -13448,7 +13784,9 @@ class InMemoryFestivalRepository:
             return True
         return False
 
-class InMemoryCelebrationRepository:
+class InMemoryCelebrationRepository(InMemoryBulkMixin):
+    _store_attr = "_celebrations"
+
     def __init__(self):
         self._celebrations = {}
         self._next_id = 1
@@ -13469,7 +13807,9 @@ class InMemoryCelebrationRepository:
             return True
         return False
 
-class InMemoryCeremonyRepository:
+class InMemoryCeremonyRepository(InMemoryBulkMixin):
+    _store_attr = "_ceremonies"
+
     def __init__(self):
         self._ceremonies = {}
         self._next_id = 1
@@ -13490,7 +13830,9 @@ class InMemoryCeremonyRepository:
             return True
         return False
 
-class InMemoryConcertRepository:
+class InMemoryConcertRepository(InMemoryBulkMixin):
+    _store_attr = "_concerts"
+
     def __init__(self):
         self._concerts = {}
         self._next_id = 1
@@ -13511,7 +13853,9 @@ class InMemoryConcertRepository:
             return True
         return False
 
-class InMemoryExhibitionRepository:
+class InMemoryExhibitionRepository(InMemoryBulkMixin):
+    _store_attr = "_exhibitions"
+
     def __init__(self):
         self._exhibitions = {}
         self._next_id = 1
@@ -13532,7 +13876,9 @@ class InMemoryExhibitionRepository:
             return True
         return False
 
-class InMemoryCompetitionRepository:
+class InMemoryCompetitionRepository(InMemoryBulkMixin):
+    _store_attr = "_competitions"
+
     def __init__(self):
         self._competitions = {}
         self._next_id = 1
@@ -13553,7 +13899,9 @@ class InMemoryCompetitionRepository:
             return True
         return False
 
-class InMemoryTournamentRepository:
+class InMemoryTournamentRepository(InMemoryBulkMixin):
+    _store_attr = "_tournaments"
+
     def __init__(self):
         self._tournaments = {}
         self._next_id = 1
@@ -13577,7 +13925,7 @@ class InMemoryTournamentRepository:
 
 # MISSING IN-MEMORY IMPLEMENTATIONS (69)
 
-class InMemoryAcademyRepository:
+class InMemoryAcademyRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -13598,7 +13946,7 @@ class InMemoryAcademyRepository:
             return True
         return False
 
-class InMemoryAchievementRepository:
+class InMemoryAchievementRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -13619,7 +13967,7 @@ class InMemoryAchievementRepository:
             return True
         return False
 
-class InMemoryActRepository:
+class InMemoryActRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -13640,7 +13988,7 @@ class InMemoryActRepository:
             return True
         return False
 
-class InMemoryAffinityRepository:
+class InMemoryAffinityRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -13661,7 +14009,7 @@ class InMemoryAffinityRepository:
             return True
         return False
 
-class InMemoryAirshipRepository:
+class InMemoryAirshipRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -13682,7 +14030,7 @@ class InMemoryAirshipRepository:
             return True
         return False
 
-class InMemoryAllianceRepository:
+class InMemoryAllianceRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -13703,7 +14051,7 @@ class InMemoryAllianceRepository:
             return True
         return False
 
-class InMemoryAlternateRealityRepository:
+class InMemoryAlternateRealityRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -13724,7 +14072,7 @@ class InMemoryAlternateRealityRepository:
             return True
         return False
 
-class InMemoryAmbientRepository:
+class InMemoryAmbientRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -13745,7 +14093,7 @@ class InMemoryAmbientRepository:
             return True
         return False
 
-class InMemoryArchiveRepository:
+class InMemoryArchiveRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -13766,7 +14114,7 @@ class InMemoryArchiveRepository:
             return True
         return False
 
-class InMemoryArenaRepository:
+class InMemoryArenaRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -13787,7 +14135,7 @@ class InMemoryArenaRepository:
             return True
         return False
 
-class InMemoryArmyRepository:
+class InMemoryArmyRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -13808,7 +14156,7 @@ class InMemoryArmyRepository:
             return True
         return False
 
-class InMemoryArtifactSetRepository:
+class InMemoryArtifactSetRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -13829,7 +14177,7 @@ class InMemoryArtifactSetRepository:
             return True
         return False
 
-class InMemoryAtmosphereRepository:
+class InMemoryAtmosphereRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -13850,7 +14198,7 @@ class InMemoryAtmosphereRepository:
             return True
         return False
 
-class InMemoryAttributeRepository:
+class InMemoryAttributeRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -13871,7 +14219,7 @@ class InMemoryAttributeRepository:
             return True
         return False
 
-class InMemoryAutosaveRepository:
+class InMemoryAutosaveRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -13892,7 +14240,7 @@ class InMemoryAutosaveRepository:
             return True
         return False
 
-class InMemoryBadgeRepository:
+class InMemoryBadgeRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -13913,7 +14261,7 @@ class InMemoryBadgeRepository:
             return True
         return False
 
-class InMemoryBalanceEntitiesRepository:
+class InMemoryBalanceEntitiesRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -13934,7 +14282,7 @@ class InMemoryBalanceEntitiesRepository:
             return True
         return False
 
-class InMemoryBannerRepository:
+class InMemoryBannerRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -13955,7 +14303,7 @@ class InMemoryBannerRepository:
             return True
         return False
 
-class InMemoryBarterRepository:
+class InMemoryBarterRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -13976,7 +14324,7 @@ class InMemoryBarterRepository:
             return True
         return False
 
-class InMemoryBattalionRepository:
+class InMemoryBattalionRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -13997,7 +14345,7 @@ class InMemoryBattalionRepository:
             return True
         return False
 
-class InMemoryBestiaryEntryRepository:
+class InMemoryBestiaryEntryRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -14018,7 +14366,7 @@ class InMemoryBestiaryEntryRepository:
             return True
         return False
 
-class InMemoryBlackHoleRepository:
+class InMemoryBlackHoleRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -14039,7 +14387,7 @@ class InMemoryBlackHoleRepository:
             return True
         return False
 
-class InMemoryBlessingRepository:
+class InMemoryBlessingRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -14060,7 +14408,7 @@ class InMemoryBlessingRepository:
             return True
         return False
 
-class InMemoryBlueprintRepository:
+class InMemoryBlueprintRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -14081,7 +14429,7 @@ class InMemoryBlueprintRepository:
             return True
         return False
 
-class InMemoryBranchPointRepository:
+class InMemoryBranchPointRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -14102,7 +14450,7 @@ class InMemoryBranchPointRepository:
             return True
         return False
 
-class InMemoryCalendarRepository:
+class InMemoryCalendarRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -14123,7 +14471,7 @@ class InMemoryCalendarRepository:
             return True
         return False
 
-class InMemoryCameraPathRepository:
+class InMemoryCameraPathRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -14144,7 +14492,7 @@ class InMemoryCameraPathRepository:
             return True
         return False
 
-class InMemoryCampaignRepository:
+class InMemoryCampaignRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -14165,7 +14513,7 @@ class InMemoryCampaignRepository:
             return True
         return False
 
-class InMemoryCataclysmRepository:
+class InMemoryCataclysmRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -14186,7 +14534,7 @@ class InMemoryCataclysmRepository:
             return True
         return False
 
-class InMemoryCelebrationRepository:
+class InMemoryCelebrationRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -14207,7 +14555,7 @@ class InMemoryCelebrationRepository:
             return True
         return False
 
-class InMemoryCeremonyRepository:
+class InMemoryCeremonyRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -14228,7 +14576,7 @@ class InMemoryCeremonyRepository:
             return True
         return False
 
-class InMemoryChapterRepository:
+class InMemoryChapterRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -14249,7 +14597,7 @@ class InMemoryChapterRepository:
             return True
         return False
 
-class InMemoryCharacterEvolutionRepository:
+class InMemoryCharacterEvolutionRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -14270,7 +14618,7 @@ class InMemoryCharacterEvolutionRepository:
             return True
         return False
 
-class InMemoryCharacterProfileEntryRepository:
+class InMemoryCharacterProfileEntryRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -14291,7 +14639,7 @@ class InMemoryCharacterProfileEntryRepository:
             return True
         return False
 
-class InMemoryCharacterVariantRepository:
+class InMemoryCharacterVariantRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -14312,7 +14660,7 @@ class InMemoryCharacterVariantRepository:
             return True
         return False
 
-class InMemoryCharacterRelationshipRepository:
+class InMemoryCharacterRelationshipRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -14333,7 +14681,7 @@ class InMemoryCharacterRelationshipRepository:
             return True
         return False
 
-class InMemoryCheckpointRepository:
+class InMemoryCheckpointRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -14354,7 +14702,7 @@ class InMemoryCheckpointRepository:
             return True
         return False
 
-class InMemoryChekhovsGunRepository:
+class InMemoryChekhovsGunRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -14375,7 +14723,7 @@ class InMemoryChekhovsGunRepository:
             return True
         return False
 
-class InMemoryChoiceRepository:
+class InMemoryChoiceRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -14396,7 +14744,7 @@ class InMemoryChoiceRepository:
             return True
         return False
 
-class InMemoryCinematicRepository:
+class InMemoryCinematicRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -14417,7 +14765,7 @@ class InMemoryCinematicRepository:
             return True
         return False
 
-class InMemoryCodexEntryRepository:
+class InMemoryCodexEntryRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -14438,7 +14786,7 @@ class InMemoryCodexEntryRepository:
             return True
         return False
 
-class InMemoryColorPaletteRepository:
+class InMemoryColorPaletteRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -14459,7 +14807,7 @@ class InMemoryColorPaletteRepository:
             return True
         return False
 
-class InMemoryCompetitionRepository:
+class InMemoryCompetitionRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -14480,7 +14828,7 @@ class InMemoryCompetitionRepository:
             return True
         return False
 
-class InMemoryComponentRepository:
+class InMemoryComponentRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -14501,7 +14849,7 @@ class InMemoryComponentRepository:
             return True
         return False
 
-class InMemoryConcertRepository:
+class InMemoryConcertRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -14522,7 +14870,7 @@ class InMemoryConcertRepository:
             return True
         return False
 
-class InMemoryConsequenceRepository:
+class InMemoryConsequenceRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -14543,7 +14891,7 @@ class InMemoryConsequenceRepository:
             return True
         return False
 
-class InMemoryConstitutionRepository:
+class InMemoryConstitutionRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -14564,7 +14912,7 @@ class InMemoryConstitutionRepository:
             return True
         return False
 
-class InMemoryConversionRateRepository:
+class InMemoryConversionRateRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -14585,7 +14933,7 @@ class InMemoryConversionRateRepository:
             return True
         return False
 
-class InMemoryCourtRepository:
+class InMemoryCourtRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -14606,7 +14954,7 @@ class InMemoryCourtRepository:
             return True
         return False
 
-class InMemoryCrimeRepository:
+class InMemoryCrimeRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -14627,7 +14975,7 @@ class InMemoryCrimeRepository:
             return True
         return False
 
-class InMemoryCultRepository:
+class InMemoryCultRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -14648,7 +14996,7 @@ class InMemoryCultRepository:
             return True
         return False
 
-class InMemoryCurrencyRepository:
+class InMemoryCurrencyRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -14669,7 +15017,7 @@ class InMemoryCurrencyRepository:
             return True
         return False
 
-class InMemoryCurseRepository:
+class InMemoryCurseRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -14690,7 +15038,7 @@ class InMemoryCurseRepository:
             return True
         return False
 
-class InMemoryCursedItemRepository:
+class InMemoryCursedItemRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -14711,7 +15059,7 @@ class InMemoryCursedItemRepository:
             return True
         return False
 
-class InMemoryCustomMapRepository:
+class InMemoryCustomMapRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -14732,7 +15080,7 @@ class InMemoryCustomMapRepository:
             return True
         return False
 
-class InMemoryCutsceneRepository:
+class InMemoryCutsceneRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -14753,7 +15101,7 @@ class InMemoryCutsceneRepository:
             return True
         return False
 
-class InMemoryDefenseRepository:
+class InMemoryDefenseRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -14774,7 +15122,7 @@ class InMemoryDefenseRepository:
             return True
         return False
 
-class InMemoryDemandRepository:
+class InMemoryDemandRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -14795,7 +15143,7 @@ class InMemoryDemandRepository:
             return True
         return False
 
-class InMemoryDifficultyCurveRepository:
+class InMemoryDifficultyCurveRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -14816,7 +15164,7 @@ class InMemoryDifficultyCurveRepository:
             return True
         return False
 
-class InMemoryDimensionRepository:
+class InMemoryDimensionRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -14837,7 +15185,7 @@ class InMemoryDimensionRepository:
             return True
         return False
 
-class InMemoryDisasterRepository:
+class InMemoryDisasterRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -14858,7 +15206,7 @@ class InMemoryDisasterRepository:
             return True
         return False
 
-class InMemoryDiscoveryRepository:
+class InMemoryDiscoveryRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -14879,7 +15227,7 @@ class InMemoryDiscoveryRepository:
             return True
         return False
 
-class InMemoryDispositionRepository:
+class InMemoryDispositionRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -14900,7 +15248,7 @@ class InMemoryDispositionRepository:
             return True
         return False
 
-class InMemoryDistrictRepository:
+class InMemoryDistrictRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -14921,7 +15269,7 @@ class InMemoryDistrictRepository:
             return True
         return False
 
-class InMemoryDivineItemRepository:
+class InMemoryDivineItemRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -14942,7 +15290,7 @@ class InMemoryDivineItemRepository:
             return True
         return False
 
-class InMemoryDropRateRepository:
+class InMemoryDropRateRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -14963,7 +15311,7 @@ class InMemoryDropRateRepository:
             return True
         return False
 
-class InMemoryDungeonRepository:
+class InMemoryDungeonRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -14984,7 +15332,7 @@ class InMemoryDungeonRepository:
             return True
         return False
 
-class InMemoryDubbingRepository:
+class InMemoryDubbingRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -15005,7 +15353,7 @@ class InMemoryDubbingRepository:
             return True
         return False
 
-class InMemoryEasterEggRepository:
+class InMemoryEasterEggRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -15026,7 +15374,7 @@ class InMemoryEasterEggRepository:
             return True
         return False
 
-class InMemoryEclipseRepository:
+class InMemoryEclipseRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -15047,7 +15395,7 @@ class InMemoryEclipseRepository:
             return True
         return False
 
-class InMemoryEraTransitionRepository:
+class InMemoryEraTransitionRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -15068,7 +15416,7 @@ class InMemoryEraTransitionRepository:
             return True
         return False
 
-class InMemoryEnigmaRepository:
+class InMemoryEnigmaRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -15089,7 +15437,7 @@ class InMemoryEnigmaRepository:
             return True
         return False
 
-class InMemoryExhibitionRepository:
+class InMemoryExhibitionRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -15110,7 +15458,7 @@ class InMemoryExhibitionRepository:
             return True
         return False
 
-class InMemoryFestivalRepository:
+class InMemoryFestivalRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -15131,7 +15479,7 @@ class InMemoryFestivalRepository:
             return True
         return False
 
-class InMemoryFlashForwardRepository:
+class InMemoryFlashForwardRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -15152,7 +15500,7 @@ class InMemoryFlashForwardRepository:
             return True
         return False
 
-class InMemoryFoodChainRepository:
+class InMemoryFoodChainRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -15173,7 +15521,7 @@ class InMemoryFoodChainRepository:
             return True
         return False
 
-class InMemoryFortificationRepository:
+class InMemoryFortificationRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -15194,7 +15542,7 @@ class InMemoryFortificationRepository:
             return True
         return False
 
-class InMemoryFactionIdeologyRepository:
+class InMemoryFactionIdeologyRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -15215,7 +15563,7 @@ class InMemoryFactionIdeologyRepository:
             return True
         return False
 
-class InMemoryFactionLeaderRepository:
+class InMemoryFactionLeaderRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -15236,7 +15584,7 @@ class InMemoryFactionLeaderRepository:
             return True
         return False
 
-class InMemoryFactionMembershipRepository:
+class InMemoryFactionMembershipRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -15257,7 +15605,7 @@ class InMemoryFactionMembershipRepository:
             return True
         return False
 
-class InMemoryFactionResourceRepository:
+class InMemoryFactionResourceRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -15278,7 +15626,7 @@ class InMemoryFactionResourceRepository:
             return True
         return False
 
-class InMemoryFactionTerritoryRepository:
+class InMemoryFactionTerritoryRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -15299,7 +15647,7 @@ class InMemoryFactionTerritoryRepository:
             return True
         return False
 
-class InMemoryHubAreaRepository:
+class InMemoryHubAreaRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -15320,7 +15668,7 @@ class InMemoryHubAreaRepository:
             return True
         return False
 
-class InMemoryHiddenPathRepository:
+class InMemoryHiddenPathRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -15341,7 +15689,7 @@ class InMemoryHiddenPathRepository:
             return True
         return False
 
-class InMemoryHolySiteRepository:
+class InMemoryHolySiteRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -15362,7 +15710,7 @@ class InMemoryHolySiteRepository:
             return True
         return False
 
-class InMemoryInstanceRepository:
+class InMemoryInstanceRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -15383,7 +15731,7 @@ class InMemoryInstanceRepository:
             return True
         return False
 
-class InMemoryJournalPageRepository:
+class InMemoryJournalPageRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -15404,7 +15752,7 @@ class InMemoryJournalPageRepository:
             return True
         return False
 
-class InMemoryKillCountRepository:
+class InMemoryKillCountRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -15425,7 +15773,7 @@ class InMemoryKillCountRepository:
             return True
         return False
 
-class InMemoryLootTableWeightRepository:
+class InMemoryLootTableWeightRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -15446,7 +15794,7 @@ class InMemoryLootTableWeightRepository:
             return True
         return False
 
-class InMemoryLoreFragmentRepository:
+class InMemoryLoreFragmentRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -15467,7 +15815,7 @@ class InMemoryLoreFragmentRepository:
             return True
         return False
 
-class InMemoryMarketSquareRepository:
+class InMemoryMarketSquareRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -15488,7 +15836,7 @@ class InMemoryMarketSquareRepository:
             return True
         return False
 
-class InMemoryModRepository:
+class InMemoryModRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -15509,7 +15857,7 @@ class InMemoryModRepository:
             return True
         return False
 
-class InMemoryMotionCaptureRepository:
+class InMemoryMotionCaptureRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -15530,7 +15878,7 @@ class InMemoryMotionCaptureRepository:
             return True
         return False
 
-class InMemoryMountEquipmentRepository:
+class InMemoryMountEquipmentRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -15551,7 +15899,7 @@ class InMemoryMountEquipmentRepository:
             return True
         return False
 
-class InMemoryMuseumRepository:
+class InMemoryMuseumRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -15572,7 +15920,7 @@ class InMemoryMuseumRepository:
             return True
         return False
 
-class InMemoryMythicalArmorRepository:
+class InMemoryMythicalArmorRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -15593,7 +15941,7 @@ class InMemoryMythicalArmorRepository:
             return True
         return False
 
-class InMemoryMysteryRepository:
+class InMemoryMysteryRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -15614,7 +15962,7 @@ class InMemoryMysteryRepository:
             return True
         return False
 
-class InMemoryMythicalArmorRepository:
+class InMemoryMythicalArmorRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -15635,7 +15983,7 @@ class InMemoryMythicalArmorRepository:
             return True
         return False
 
-class InMemoryNobleDistrictRepository:
+class InMemoryNobleDistrictRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -15656,7 +16004,7 @@ class InMemoryNobleDistrictRepository:
             return True
         return False
 
-class InMemoryOpenWorldZoneRepository:
+class InMemoryOpenWorldZoneRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -15677,7 +16025,7 @@ class InMemoryOpenWorldZoneRepository:
             return True
         return False
 
-class InMemoryPactRepository:
+class InMemoryPactRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -15698,7 +16046,7 @@ class InMemoryPactRepository:
             return True
         return False
 
-class InMemoryPlotBranchRepository:
+class InMemoryPlotBranchRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -15719,7 +16067,7 @@ class InMemoryPlotBranchRepository:
             return True
         return False
 
-class InMemoryPlotDeviceRepository:
+class InMemoryPlotDeviceRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -15740,7 +16088,7 @@ class InMemoryPlotDeviceRepository:
             return True
         return False
 
-class InMemoryPocketDimensionRepository:
+class InMemoryPocketDimensionRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -15761,7 +16109,7 @@ class InMemoryPocketDimensionRepository:
             return True
         return False
 
-class InMemoryPortalRepository:
+class InMemoryPortalRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -15782,7 +16130,7 @@ class InMemoryPortalRepository:
             return True
         return False
 
-class InMemoryPortDistrictRepository:
+class InMemoryPortDistrictRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -15803,7 +16151,7 @@ class InMemoryPortDistrictRepository:
             return True
         return False
 
-class InMemoryPlayerMetricRepository:
+class InMemoryPlayerMetricRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -15824,7 +16172,7 @@ class InMemoryPlayerMetricRepository:
             return True
         return False
 
-class InMemoryRiddleRepository:
+class InMemoryRiddleRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -15845,7 +16193,7 @@ class InMemoryRiddleRepository:
             return True
         return False
 
-class InMemoryRuneRepository:
+class InMemoryRuneRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -15866,7 +16214,7 @@ class InMemoryRuneRepository:
             return True
         return False
 
-class InMemoryResearchCenterRepository:
+class InMemoryResearchCenterRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -15887,7 +16235,7 @@ class InMemoryResearchCenterRepository:
             return True
         return False
 
-class InMemoryRumorRepository:
+class InMemoryRumorRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -15908,7 +16256,7 @@ class InMemoryRumorRepository:
             return True
         return False
 
-class InMemorySavePointRepository:
+class InMemorySavePointRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -15929,7 +16277,7 @@ class InMemorySavePointRepository:
             return True
         return False
 
-class InMemoryScriptureRepository:
+class InMemoryScriptureRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -15950,7 +16298,7 @@ class InMemoryScriptureRepository:
             return True
         return False
 
-class InMemorySecretAreaRepository:
+class InMemorySecretAreaRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -15971,7 +16319,7 @@ class InMemorySecretAreaRepository:
             return True
         return False
 
-class InMemorySeasonalEventRepository:
+class InMemorySeasonalEventRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -15992,7 +16340,7 @@ class InMemorySeasonalEventRepository:
             return True
         return False
 
-class InMemorySectRepository:
+class InMemorySectRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -16013,7 +16361,7 @@ class InMemorySectRepository:
             return True
         return False
 
-class InMemorySiegeEngineRepository:
+class InMemorySiegeEngineRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -16034,7 +16382,7 @@ class InMemorySiegeEngineRepository:
             return True
         return False
 
-class InMemorySocialClassRepository:
+class InMemorySocialClassRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -16055,7 +16403,7 @@ class InMemorySocialClassRepository:
             return True
         return False
 
-class InMemorySocialMediaRepository:
+class InMemorySocialMediaRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -16076,7 +16424,7 @@ class InMemorySocialMediaRepository:
             return True
         return False
 
-class InMemorySocialMobilityRepository:
+class InMemorySocialMobilityRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -16097,7 +16445,7 @@ class InMemorySocialMobilityRepository:
             return True
         return False
 
-class InMemorySocketRepository:
+class InMemorySocketRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -16118,7 +16466,7 @@ class InMemorySocketRepository:
             return True
         return False
 
-class InMemorySkyboxRepository:
+class InMemorySkyboxRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -16139,7 +16487,7 @@ class InMemorySkyboxRepository:
             return True
         return False
 
-class InMemorySoundEffectRepository:
+class InMemorySoundEffectRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -16160,7 +16508,7 @@ class InMemorySoundEffectRepository:
             return True
         return False
 
-class InMemorySpawnPointRepository:
+class InMemorySpawnPointRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -16181,7 +16529,7 @@ class InMemorySpawnPointRepository:
             return True
         return False
 
-class InMemoryStarSystemRepository:
+class InMemoryStarSystemRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -16202,7 +16550,7 @@ class InMemoryStarSystemRepository:
             return True
         return False
 
-class InMemorySubtitleRepository:
+class InMemorySubtitleRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -16223,7 +16571,7 @@ class InMemorySubtitleRepository:
             return True
         return False
 
-class InMemorySummonRepository:
+class InMemorySummonRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -16244,7 +16592,7 @@ class InMemorySummonRepository:
             return True
         return False
 
-class InMemorySwampRepository:
+class InMemorySwampRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -16265,7 +16613,7 @@ class InMemorySwampRepository:
             return True
         return False
 
-class InMemoryTeleporterRepository:
+class InMemoryTeleporterRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -16286,7 +16634,7 @@ class InMemoryTeleporterRepository:
             return True
         return False
 
-class InMemoryTimePeriodRepository:
+class InMemoryTimePeriodRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -16307,7 +16655,7 @@ class InMemoryTimePeriodRepository:
             return True
         return False
 
-class InMemoryTimelineRepository:
+class InMemoryTimelineRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -16328,7 +16676,7 @@ class InMemoryTimelineRepository:
             return True
         return False
 
-class InMemoryTournamentRepository:
+class InMemoryTournamentRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -16349,7 +16697,7 @@ class InMemoryTournamentRepository:
             return True
         return False
 
-class InMemoryTalentTreeRepository:
+class InMemoryTalentTreeRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -16370,7 +16718,7 @@ class InMemoryTalentTreeRepository:
             return True
         return False
 
-class InMemoryTranslationRepository:
+class InMemoryTranslationRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -16391,7 +16739,7 @@ class InMemoryTranslationRepository:
             return True
         return False
 
-class InMemoryTreasuryRepository:
+class InMemoryTreasuryRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -16412,7 +16760,7 @@ class InMemoryTreasuryRepository:
             return True
         return False
 
-class InMemoryTreatyRepository:
+class InMemoryTreatyRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -16433,7 +16781,7 @@ class InMemoryTreatyRepository:
             return True
         return False
 
-class InMemoryTrophyRepository:
+class InMemoryTrophyRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -16454,7 +16802,7 @@ class InMemoryTrophyRepository:
             return True
         return False
 
-class InMemoryUndergroundRepository:
+class InMemoryUndergroundRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -16475,7 +16823,7 @@ class InMemoryUndergroundRepository:
             return True
         return False
 
-class InMemoryUserScenarioRepository:
+class InMemoryUserScenarioRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -16496,7 +16844,7 @@ class InMemoryUserScenarioRepository:
             return True
         return False
 
-class InMemoryVisualEffectRepository:
+class InMemoryVisualEffectRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -16517,7 +16865,7 @@ class InMemoryVisualEffectRepository:
             return True
         return False
 
-class InMemoryVoiceActorRepository:
+class InMemoryVoiceActorRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -16538,7 +16886,7 @@ class InMemoryVoiceActorRepository:
             return True
         return False
 
-class InMemoryVoiceLineRepository:
+class InMemoryVoiceLineRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -16559,7 +16907,7 @@ class InMemoryVoiceLineRepository:
             return True
         return False
 
-class InMemoryVoiceOverRepository:
+class InMemoryVoiceOverRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -16580,7 +16928,7 @@ class InMemoryVoiceOverRepository:
             return True
         return False
 
-class InMemoryWeatherPatternRepository:
+class InMemoryWeatherPatternRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -16601,7 +16949,7 @@ class InMemoryWeatherPatternRepository:
             return True
         return False
 
-class InMemoryWeaponSystemRepository:
+class InMemoryWeaponSystemRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -16622,7 +16970,7 @@ class InMemoryWeaponSystemRepository:
             return True
         return False
 
-class InMemoryWorldEventRepository:
+class InMemoryWorldEventRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -16643,7 +16991,7 @@ class InMemoryWorldEventRepository:
             return True
         return False
 
-class InMemoryWorkshopEntryRepository:
+class InMemoryWorkshopEntryRepository(InMemoryBulkMixin):
     def __init__(self):
         self._entities = {}
         self._next_id = 1
@@ -16667,7 +17015,9 @@ class InMemoryWorkshopEntryRepository:
 
 # FINAL 3 MISSING IN-MEMORY IMPLEMENTATIONS
 
-class InMemoryDeusExMachinaRepository:
+class InMemoryDeusExMachinaRepository(InMemoryBulkMixin):
+    _store_attr = "_deus_ex_machinas"
+
     def __init__(self):
         self._deus_ex_machinas = {}
         self._next_id = 1
@@ -16688,7 +17038,9 @@ class InMemoryDeusExMachinaRepository:
             return True
         return False
 
-class InMemoryFastTravelPointRepository:
+class InMemoryFastTravelPointRepository(InMemoryBulkMixin):
+    _store_attr = "_fast_travel_points"
+
     def __init__(self):
         self._fast_travel_points = {}
         self._next_id = 1
@@ -16709,7 +17061,9 @@ class InMemoryFastTravelPointRepository:
             return True
         return False
 
-class InMemoryRedHerringRepository:
+class InMemoryRedHerringRepository(InMemoryBulkMixin):
+    _store_attr = "_red_herrings"
+
     def __init__(self):
         self._red_herrings = {}
         self._next_id = 1
@@ -0,0 +1,267 @@
+"""
+In-Memory Full-Text Search
+
+Inverted index used by the in-memory repositories' search methods, so a
+query no longer lower-cases every stored record.
+
+Matching mirrors the SQLite FTS5 backend (see ``sqlite_fts``): text is split
+into case-folded words, every query word must match, each query word matches
+as a prefix, results are ranked with BM25, and snippets wrap matched words in
+``[`` and ``]``.
+"""
+import math
+import unicodedata
+from bisect import bisect_left, insort
+from collections import Counter
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+from src.domain.repositories.search import SearchHit
+from src.domain.value_objects.common import TenantId
+from src.infrastructure.sqlite_fts import (
+    SNIPPET_CLOSE,
+    SNIPPET_ELLIPSIS,
+    SNIPPET_OPEN,
+    SNIPPET_TOKENS,
+    WORD_PATTERN,
+)
+
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def _fold(word: str) -> str:
+    """Case-fold and strip diacritics, like FTS5's ``remove_diacritics``."""
+    decomposed = unicodedata.normalize("NFKD", word.casefold())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def text_of(value: Any) -> str:
+    """Text of a field that may be a plain string, a value object or None."""
+    if value is None:
+        return ""
+    return str(getattr(value, "value", value))
+
+
+class TextIndex:
+    """
+    Inverted word index over named text fields of keyed documents.
+
+    ``add`` replaces any previous text for the key, so re-saving an entity
+    re-indexes it.
+    """
+
+    def __init__(self, *fields: str):
+        self.fields = fields
+        self._texts: Dict[Hashable, Dict[str, str]] = {}
+        self._lengths: Dict[Hashable, int] = {}
+        # word -> key -> field -> occurrences
+        self._postings: Dict[str, Dict[Hashable, Counter]] = {}
+        self._vocabulary: List[str] = []
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._texts
+
+    def add(self, key: Hashable, **texts: Any) -> None:
+        self.remove(key)
+
+        stored = {field: text_of(texts.get(field)) for field in self.fields}
+        length = 0
+        for field, text in stored.items():
+            for word in WORD_PATTERN.findall(text):
+                word = _fold(word)
+                postings = self._postings.get(word)
+                if postings is None:
+                    postings = self._postings[word] = {}
+                    insort(self._vocabulary, word)
+                postings.setdefault(key, Counter())[field] += 1
+                length += 1
+
+        self._texts[key] = stored
+        self._lengths[key] = length
+        self._total_length += length
+
+    def remove(self, key: Hashable) -> None:
+        stored = self._texts.pop(key, None)
+        if stored is None:
+            return
+
+        self._total_length -= self._lengths.pop(key)
+        for text in stored.values():
+            for word in set(_fold(word) for word in WORD_PATTERN.findall(text)):
+                postings = self._postings.get(word)
+                if postings is None:
+                    continue
+                postings.pop(key, None)
+                if not postings:
+                    del self._postings[word]
+                    del self._vocabulary[bisect_left(self._vocabulary, word)]
+
+    def _expand(self, term: str) -> List[str]:
+        """Indexed words starting with ``term``."""
+        start = bisect_left(self._vocabulary, term)
+        words = []
+        for word in self._vocabulary[start:]:
+            if not word.startswith(term):
+                break
+            words.append(word)
+        return words
+
+    def search(
+        self,
+        search_term: str,
+        limit: int = 20,
+        fields: Optional[Sequence[str]] = None,
+        where: Optional[Callable[[Hashable], bool]] = None,
+    ) -> List[Tuple[Hashable, float]]:
+        """
+        Return ``(key, score)`` pairs matching every word of ``search_term``,
+        best first.
+
+        Args:
+            fields: Restrict matching to these fields (default: all)
+            where: Only keys for which this returns True are considered
+        """
+        terms = [_fold(word) for word in WORD_PATTERN.findall(search_term)]
+        if not terms or not self._texts:
+            return []
+
+        fields = tuple(fields or self.fields)
+        document_count = len(self._texts)
+        average_length = (self._total_length / document_count) or 1.0
+
+        scores: Optional[Dict[Hashable, float]] = None
+        for term in terms:
+            term_scores: Dict[Hashable, float] = {}
+            for word in self._expand(term):
+                postings = self._postings[word]
+                frequencies = {
+                    key: sum(counts[field] for field in fields)
+                    for key, counts in postings.items()
+                }
+                frequencies = {key: tf for key, tf in frequencies.items() if tf}
+                if not frequencies:
+                    continue
+                idf = math.log(1 + (document_count - len(frequencies) + 0.5) / (len(frequencies) + 0.5))
+                for key, tf in frequencies.items():
+                    norm = BM25_K1 * (1 - BM25_B + BM25_B * self._lengths[key] / average_length)
+                    term_scores[key] = term_scores.get(key, 0.0) + idf * tf * (BM25_K1 + 1) / (tf + norm)
+
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {key: score + term_scores[key] for key, score in scores.items() if key in term_scores}
+            if not scores:
+                return []
+
+        candidates: Iterable[Tuple[Hashable, float]] = scores.items()
+        if where is not None:
+            candidates = ((key, score) for key, score in candidates if where(key))
+        return sorted(candidates, key=lambda item: -item[1])[:limit]
+
+    def snippet(
+        self,
+        key: Hashable,
+        search_term: str,
+        fields: Optional[Sequence[str]] = None,
+    ) -> str:
+        """Excerpt of the first field matching ``search_term`` with matches highlighted."""
+        terms = [_fold(word) for word in WORD_PATTERN.findall(search_term)]
+        stored = self._texts.get(key, {})
+
+        for field in fields or self.fields:
+            text = stored.get(field, "")
+            words = list(WORD_PATTERN.finditer(text))
+            hits = [
+                i for i, match in enumerate(words)
+                if any(_fold(match.group()).startswith(term) for term in terms)
+            ]
+            if not hits:
+                continue
+
+            start = max(0, min(hits[0] - SNIPPET_TOKENS // 4, len(words) - SNIPPET_TOKENS))
+            end = min(len(words), start + SNIPPET_TOKENS)
+            hit_set = set(hits)
+
+            parts = []
+            position = words[start].start()
+            for i in range(start, end):
+                match = words[i]
+                parts.append(text[position:match.start()])
+                word = match.group()
+                parts.append(f"{SNIPPET_OPEN}{word}{SNIPPET_CLOSE}" if i in hit_set else word)
+                position = match.end()
+
+            snippet = "".join(parts)
+            if start > 0:
+                snippet = SNIPPET_ELLIPSIS + snippet
+            if end < len(words):
+                snippet += SNIPPET_ELLIPSIS
+            return snippet
+
+        return ""
+
+
+class InMemoryFullTextSearchMixin:
+    """
+    Ranked full-text search for in-memory repositories.
+
+    The repository declares ``_search_fields`` (field name -> entity
+    attribute), creates its index with :meth:`_create_text_index` and calls
+    ``_index_text`` / ``_unindex_text`` from ``save`` and ``delete``. Entities
+    are looked up in the dict named by ``_store_attr``.
+    """
+
+    _store_attr = "_entities"
+    _search_fields: Dict[str, str] = {}
+
+    def _create_text_index(self) -> TextIndex:
+        return TextIndex(*self._search_fields)
+
+    def _index_text(self, key: Hashable, entity: Any) -> None:
+        self._text_index.add(key, **{
+            field: getattr(entity, attribute, None)
+            for field, attribute in self._search_fields.items()
+        })
+
+    def _unindex_text(self, key: Hashable) -> None:
+        self._text_index.remove(key)
+
+    def search_ranked(
+        self,
+        tenant_id: TenantId,
+        search_term: str,
+        limit: int = 20,
+        columns: Optional[Sequence[str]] = None,
+    ) -> List[SearchHit]:
+        """
+        Search the indexed text fields (or only ``columns``).
+
+        Returns:
+            Hits ordered by relevance, each with a highlighted snippet
+        """
+        store = getattr(self, self._store_attr)
+        matches = self._text_index.search(
+            search_term, limit, columns, where=lambda key: key[0] == tenant_id
+        )
+        return [
+            SearchHit(store[key], score, self._text_index.snippet(key, search_term, columns))
+            for key, score in matches
+        ]
+
+    def _search_entities(
+        self,
+        tenant_id: TenantId,
+        search_term: str,
+        limit: int,
+        columns: Optional[Sequence[str]] = None,
+    ) -> List[Any]:
+        store = getattr(self, self._store_attr)
+        matches = self._text_index.search(
+            search_term, limit, columns, where=lambda key: key[0] == tenant_id
+        )
+        return [store[key] for key, _ in matches]
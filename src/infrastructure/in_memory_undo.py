@@ -0,0 +1,104 @@
+"""
+In-Memory Undo Log
+
+In-memory repositories have no transactions, and ``find_by_id`` returns the
+stored entity itself, so a tool that fails half way (say after renaming an
+item but before saving it) leaves its changes behind. :class:`UndoLog`
+records a deep copy of each entity a block touches, the first time it is
+touched, and :meth:`UndoLog.rollback` puts them back: entities that existed
+are saved again as they were and entities the block created are deleted.
+
+Repositories are journaled through :class:`JournaledRepository`, which
+records before delegating ``find_by_id``, ``find_many``, ``save``,
+``save_many``, ``delete`` and ``delete_many``; every other attribute is the
+repository's own. Entities reached only through list or search results are
+not recorded.
+"""
+import copy
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from src.domain.value_objects.common import TenantId, EntityId
+
+
+class UndoLog:
+    """Entity states to restore, keyed by repository, tenant and id."""
+
+    def __init__(self):
+        self._before: Dict[Tuple[int, Any, Any], Tuple[Any, Any, Any, Optional[Any]]] = {}
+
+    def record(self, repository: Any, tenant_id: TenantId, entity_id: EntityId, entity: Optional[Any]) -> None:
+        """Remember ``entity`` (None: no such entity) unless the id is already recorded."""
+        key = (id(repository), tenant_id, entity_id)
+        if key not in self._before:
+            self._before[key] = (repository, tenant_id, entity_id, copy.deepcopy(entity))
+
+    def merge_into(self, outer: "UndoLog") -> None:
+        """Hand the recorded states to an enclosing log, which keeps its older ones."""
+        for key, before in self._before.items():
+            outer._before.setdefault(key, before)
+
+    def rollback(self) -> None:
+        """Restore every recorded entity, most recently recorded first."""
+        for repository, tenant_id, entity_id, entity in reversed(list(self._before.values())):
+            if entity is None:
+                repository.delete(tenant_id, entity_id)
+            else:
+                repository.save(entity)
+        self._before.clear()
+
+
+class JournaledRepository:
+    """A repository that records into an :class:`UndoLog` what it returns or changes."""
+
+    def __init__(self, repository: Any, log: UndoLog):
+        self._repository = repository
+        self._log = log
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._repository, name)
+
+    def _record_existing(self, tenant_id: TenantId, entity_id: EntityId) -> None:
+        self._log.record(self._repository, tenant_id, entity_id, self._repository.find_by_id(tenant_id, entity_id))
+
+    def _record_created(self, entity: Any) -> None:
+        # Only reached for ids not recorded before the save, i.e. new entities
+        self._log.record(self._repository, entity.tenant_id, entity.id, None)
+
+    def find_by_id(self, tenant_id: TenantId, entity_id: EntityId) -> Optional[Any]:
+        entity = self._repository.find_by_id(tenant_id, entity_id)
+        if entity is not None:
+            self._log.record(self._repository, tenant_id, entity_id, entity)
+        return entity
+
+    def find_many(self, tenant_id: TenantId, entity_ids: Sequence[EntityId]) -> List[Any]:
+        entities = self._repository.find_many(tenant_id, entity_ids)
+        for entity in entities:
+            self._log.record(self._repository, tenant_id, entity.id, entity)
+        return entities
+
+    def save(self, entity: Any) -> Any:
+        if entity.id is not None:
+            self._record_existing(entity.tenant_id, entity.id)
+        saved = self._repository.save(entity)
+        self._record_created(saved)
+        return saved
+
+    def save_many(self, entities: Iterable[Any]) -> List[Any]:
+        entities = list(entities)
+        for entity in entities:
+            if entity.id is not None:
+                self._record_existing(entity.tenant_id, entity.id)
+        saved = self._repository.save_many(entities)
+        for entity in saved:
+            self._record_created(entity)
+        return saved
+
+    def delete(self, tenant_id: TenantId, entity_id: EntityId) -> bool:
+        self._record_existing(tenant_id, entity_id)
+        return self._repository.delete(tenant_id, entity_id)
+
+    def delete_many(self, tenant_id: TenantId, entity_ids: Sequence[EntityId]) -> int:
+        entity_ids = list(entity_ids)
+        for entity_id in entity_ids:
+            self._record_existing(tenant_id, entity_id)
+        return self._repository.delete_many(tenant_id, entity_ids)
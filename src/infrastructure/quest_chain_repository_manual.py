@@ -9,18 +9,20 @@ Includes:
 - Dependency graph traversal
 """
 
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 from collections import defaultdict
-import networkx as nx
 
 from src.domain.entities.quest_chain import QuestChain
+from src.domain.entities.quest_node import QuestNode
 from src.domain.repositories.quest_chain_repository import IQuestChainRepository
+from src.domain.repositories.quest_node_repository import IQuestNodeRepository
 from src.domain.value_objects.common import TenantId, EntityId, QuestStatus
 from src.domain.exceptions import (
     InvalidEntityOperation,
     BusinessRuleViolation,
     CircularDependency,
 )
+from src.infrastructure.dependency_graph import IncrementalDAG
 
 class InMemoryQuestChainRepository(IQuestChainRepository):
     """
@@ -33,8 +35,13 @@ class InMemoryQuestChainRepository(IQuestChainRepository):
     - Dependency graph traversal
     """
 
-    def __init__(self):
+    def __init__(self, quest_nodes: Optional[IQuestNodeRepository] = None):
+        # Where the chain's quests live; without it every quest is assumed
+        # to exist and to have no prerequisites
+        self._quest_nodes = quest_nodes
         self._quest_chains: Dict[Tuple[TenantId, EntityId], QuestChain] = {}
+        # Prerequisite graph of each saved chain, kept for ordering queries
+        self._chain_graphs: Dict[Tuple[TenantId, EntityId], IncrementalDAG] = {}
         self._next_id = 1
 
     def save(self, quest_chain: QuestChain) -> QuestChain:
@@ -48,12 +55,12 @@ class InMemoryQuestChainRepository(IQuestChainRepository):
         # Validate quest chain structure
         self._validate_quest_chain(quest_chain)
 
-        # Check for cycles if has prerequisites
-        if quest_chain.quest_prerequisites:
-            self._check_for_cycles(quest_chain)
+        # Check for cycles while building the chain's prerequisite graph
+        graph = self._check_for_cycles(quest_chain)
 
         key = (quest_chain.tenant_id, quest_chain.id)
         self._quest_chains[key] = quest_chain
+        self._chain_graphs[key] = graph
         return quest_chain
 
     def find_by_id(self, tenant_id: TenantId, quest_chain_id: EntityId) -> Optional[QuestChain]:
@@ -70,62 +77,52 @@ class InMemoryQuestChainRepository(IQuestChainRepository):
         key = (tenant_id, quest_chain_id)
         if key in self._quest_chains:
             del self._quest_chains[key]
+            self._chain_graphs.pop(key, None)
             return True
         return False
 
     def _validate_quest_chain(self, quest_chain: QuestChain):
         """Validate quest chain structure."""
-        # Check if quest prerequisites exist
-        for prereq_id in (quest_chain.quest_prerequisites or []):
-            if not self._quest_exists(prereq_id):
-                raise InvalidEntityOperation(
-                    f"Quest prerequisite {prereq_id} does not exist"
-                )
-
         # Check if quests in chain exist
-        for quest_id in (quest_chain.quests or []):
-            if not self._quest_exists(quest_id):
+        for quest_id in quest_chain.quest_node_ids:
+            if not self._quest_exists(quest_chain.tenant_id, quest_id):
                 raise InvalidEntityOperation(
                     f"Quest {quest_id} in chain does not exist"
                 )
 
-    def _check_for_cycles(self, quest_chain: QuestChain):
-        """Detect cycles in quest chain using graph theory."""
-        # Build dependency graph
-        graph = nx.DiGraph()
+    def _check_for_cycles(self, quest_chain: QuestChain) -> IncrementalDAG:
+        """
+        Build the chain's prerequisite graph, rejecting edges that close a cycle.
+
+        Each edge is checked as it is added, searching only the part of the
+        graph it could affect.
+        """
+        graph = IncrementalDAG()
 
         # Add all quests in chain as nodes
-        for quest_id in (quest_chain.quests or []):
+        for quest_id in quest_chain.quest_node_ids:
             graph.add_node(quest_id)
 
         # Add edges from prerequisites
-        for quest_id in (quest_chain.quests or []):
-            quest = self._get_quest_by_id(quest_id)
-            if quest and quest.quest_prerequisites:
-                for prereq_id in quest.quest_prerequisites:
+        for quest_id in quest_chain.quest_node_ids:
+            quest = self._get_quest_by_id(quest_chain.tenant_id, quest_id)
+            if quest and quest.prerequisite_ids:
+                for prereq_id in quest.prerequisite_ids:
                     graph.add_edge(prereq_id, quest_id)
 
-        # Check for cycles
-        try:
-            cycles = list(nx.simple_cycles(graph))
-            if cycles:
-                raise CircularDependency(
-                    f"Circular dependency detected in quest chain: {cycles}"
-                )
-        except nx.NetworkXError:
-            pass  # No cycles
+        return graph
 
-    def _quest_exists(self, quest_id: EntityId) -> bool:
+    def _quest_exists(self, tenant_id: TenantId, quest_id: EntityId) -> bool:
         """Check if quest exists in system."""
-        # This would normally query QuestNode repository
-        # For simplicity, we'll assume it exists
-        return True
+        if self._quest_nodes is None:
+            return True
+        return self._quest_nodes.find_by_id(tenant_id, quest_id) is not None
 
-    def _get_quest_by_id(self, quest_id: EntityId) -> Optional[object]:
+    def _get_quest_by_id(self, tenant_id: TenantId, quest_id: EntityId) -> Optional[QuestNode]:
         """Get quest by ID (helper method)."""
-        # This would normally query QuestNode repository
-        # For simplicity, return None
-        return None
+        if self._quest_nodes is None:
+            return None
+        return self._quest_nodes.find_by_id(tenant_id, quest_id)
 
     def get_chain_order(self, tenant_id: TenantId, quest_chain_id: EntityId) -> List[EntityId]:
         """
@@ -136,27 +133,16 @@ class InMemoryQuestChainRepository(IQuestChainRepository):
         if not quest_chain:
             return []
 
-        # Build graph for topological sort
-        graph = nx.DiGraph()
-        
-        # Add all quests in chain
-        for quest_id in (quest_chain.quests or []):
-            graph.add_node(quest_id)
-        
-        # Add edges from prerequisites
-        for quest_id in (quest_chain.quests or []):
-            quest = self._get_quest_by_id(quest_id)
-            if quest and quest.quest_prerequisites:
-                for prereq_id in quest.quest_prerequisites:
-                    graph.add_edge(prereq_id, quest_id)
+        key = (tenant_id, quest_chain_id)
+        graph = self._chain_graphs.get(key)
+        if graph is None:
+            try:
+                graph = self._chain_graphs[key] = self._check_for_cycles(quest_chain)
+            except CircularDependency:
+                # If there's a cycle, return empty list
+                return []
 
-        # Topological sort
-        try:
-            order = list(nx.topological_sort(graph))
-            return order
-        except nx.NetworkXError as e:
-            # If there's a cycle, return empty list
-            return []
+        return graph.topological_order()
 
     def is_chain_completable(self, tenant_id: TenantId, quest_chain_id: EntityId) -> bool:
         """
@@ -167,8 +153,8 @@ class InMemoryQuestChainRepository(IQuestChainRepository):
         if not quest_chain:
             return False
 
-        for quest_id in (quest_chain.quests or []):
-            quest = self._get_quest_by_id(quest_id)
+        for quest_id in quest_chain.quest_node_ids:
+            quest = self._get_quest_by_id(tenant_id, quest_id)
             if quest and quest.status != QuestStatus.COMPLETED:
                 return False
         return True
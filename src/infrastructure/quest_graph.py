@@ -0,0 +1,291 @@
+"""
+Compiled Quest Graphs
+
+Graph queries over quest nodes (paths, ordering, reachability, availability)
+used to rebuild an ad-hoc graph or run a list-based BFS on every call.
+:class:`QuestGraphIndex` keeps the connections of one world incrementally as
+nodes are saved and deleted, and compiles them on demand into a
+:class:`CompiledQuestGraph`:
+
+- nodes are relabelled to integers ``0..n-1`` and edges are stored in CSR
+  form (an offsets array into a flat targets array), both directions;
+- the topological order, per-source reachability bitsets (Python ints) and
+  per-source BFS parent arrays are computed lazily and cached on the
+  compiled graph; the per-source results are O(n) each, so only the
+  ``SOURCE_CACHE_SIZE`` most recently used sources are kept;
+- "which nodes are available" is answered with predecessor bitmasks, for a
+  single player state or a batch of them.
+
+A compiled graph is immutable. Saving a node with different connections or
+deleting one bumps the index version, and the next query compiles a fresh
+graph for that world only.
+"""
+from array import array
+from collections import OrderedDict, deque
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+from src.domain.exceptions import CircularDependency
+
+# Sources whose reachability bitset / BFS parents a compiled graph keeps
+SOURCE_CACHE_SIZE = 128
+
+
+class _LRUCache:
+    """Mapping that keeps only the ``maxsize`` most recently used entries."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Any:
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+class CompiledQuestGraph:
+    """Immutable CSR snapshot of one world's quest connections."""
+
+    def __init__(
+        self,
+        version: int,
+        edges: Dict[Hashable, Tuple[Hashable, ...]],
+        cache_size: int = SOURCE_CACHE_SIZE,
+    ):
+        self.version = version
+
+        nodes: List[Hashable] = list(edges)
+        index: Dict[Hashable, int] = {node: i for i, node in enumerate(nodes)}
+        for targets in edges.values():
+            for target in targets:
+                if target not in index:
+                    index[target] = len(nodes)
+                    nodes.append(target)
+        self.nodes = nodes
+        self.index = index
+
+        n = len(nodes)
+        out_degree = [0] * n
+        in_degree = [0] * n
+        for source, targets in edges.items():
+            out_degree[index[source]] = len(targets)
+            for target in targets:
+                in_degree[index[target]] += 1
+
+        self.offsets = self._offsets(out_degree)
+        self.targets = array("l", [0]) * self.offsets[n]
+        self.reverse_offsets = self._offsets(in_degree)
+        self.sources = array("l", [0]) * self.reverse_offsets[n]
+
+        fill = list(self.reverse_offsets[:n])
+        for source, targets in edges.items():
+            i = index[source]
+            start = self.offsets[i]
+            for k, target in enumerate(targets):
+                j = index[target]
+                self.targets[start + k] = j
+                self.sources[fill[j]] = i
+                fill[j] += 1
+
+        self._order: Optional[List[int]] = None
+        self._reach = _LRUCache(cache_size)
+        self._parents = _LRUCache(cache_size)
+        self._prerequisite_masks: Optional[List[int]] = None
+
+    @staticmethod
+    def _offsets(degrees: Sequence[int]) -> array:
+        offsets = array("l", [0]) * (len(degrees) + 1)
+        total = 0
+        for i, degree in enumerate(degrees):
+            offsets[i] = total
+            total += degree
+        offsets[len(degrees)] = total
+        return offsets
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def successors(self, i: int) -> array:
+        return self.targets[self.offsets[i]:self.offsets[i + 1]]
+
+    def predecessors(self, i: int) -> array:
+        return self.sources[self.reverse_offsets[i]:self.reverse_offsets[i + 1]]
+
+    def topological_order(self) -> List[Hashable]:
+        """
+        Nodes with every node after all nodes that connect to it.
+
+        Raises:
+            CircularDependency: If the quest graph has a cycle
+        """
+        if self._order is None:
+            n = len(self.nodes)
+            remaining = [self.reverse_offsets[i + 1] - self.reverse_offsets[i] for i in range(n)]
+            queue = deque(i for i in range(n) if not remaining[i])
+            order = []
+            while queue:
+                i = queue.popleft()
+                order.append(i)
+                for j in self.successors(i):
+                    remaining[j] -= 1
+                    if not remaining[j]:
+                        queue.append(j)
+            if len(order) != n:
+                raise CircularDependency("Quest graph contains a cycle")
+            self._order = order
+        return [self.nodes[i] for i in self._order]
+
+    def _reachable_mask(self, i: int) -> int:
+        """Bitset of the nodes reachable from node ``i`` (including itself)."""
+        mask = self._reach.get(i)
+        if mask is None:
+            mask = 1 << i
+            queue = deque([i])
+            while queue:
+                for j in self.successors(queue.popleft()):
+                    if not mask >> j & 1:
+                        mask |= 1 << j
+                        queue.append(j)
+            self._reach.put(i, mask)
+        return mask
+
+    def can_reach(self, source: Hashable, target: Hashable) -> bool:
+        if source not in self.index or target not in self.index:
+            return False
+        return bool(self._reachable_mask(self.index[source]) >> self.index[target] & 1)
+
+    def reachable_from(self, source: Hashable) -> List[Hashable]:
+        """Every node reachable from ``source``, in id-relabelled order."""
+        if source not in self.index:
+            return []
+        mask = self._reachable_mask(self.index[source])
+        return [node for i, node in enumerate(self.nodes) if mask >> i & 1]
+
+    def _bfs_parents(self, i: int) -> array:
+        """Parent pointers of a BFS tree rooted at ``i`` (-1 = unreached)."""
+        parents = self._parents.get(i)
+        if parents is None:
+            parents = array("l", [-1]) * len(self.nodes)
+            parents[i] = i
+            queue = deque([i])
+            while queue:
+                current = queue.popleft()
+                for j in self.successors(current):
+                    if parents[j] == -1:
+                        parents[j] = current
+                        queue.append(j)
+            self._parents.put(i, parents)
+        return parents
+
+    def shortest_path(self, source: Hashable, target: Hashable) -> List[Hashable]:
+        """Fewest-connections path from ``source`` to ``target``; [] if unreachable."""
+        if source not in self.index or target not in self.index:
+            return []
+        parents = self._bfs_parents(self.index[source])
+        i = self.index[target]
+        if parents[i] == -1:
+            return []
+        path = [i]
+        while path[-1] != parents[path[-1]]:
+            path.append(parents[path[-1]])
+        return [self.nodes[j] for j in reversed(path)]
+
+    def _masks(self) -> List[int]:
+        if self._prerequisite_masks is None:
+            masks = []
+            for i in range(len(self.nodes)):
+                mask = 0
+                for j in self.predecessors(i):
+                    mask |= 1 << j
+                masks.append(mask)
+            self._prerequisite_masks = masks
+        return self._prerequisite_masks
+
+    def _done_mask(self, completed: Iterable[Hashable]) -> int:
+        mask = 0
+        for node in completed:
+            i = self.index.get(node)
+            if i is not None:
+                mask |= 1 << i
+        return mask
+
+    def available(self, completed: Iterable[Hashable]) -> List[Hashable]:
+        """Nodes not yet completed whose incoming connections are all completed."""
+        return self.available_batch([completed])[0]
+
+    def available_batch(self, states: Iterable[Iterable[Hashable]]) -> List[List[Hashable]]:
+        """:meth:`available` for many player states, sharing the compiled masks."""
+        masks = self._masks()
+        results = []
+        for completed in states:
+            done = self._done_mask(completed)
+            results.append([
+                node for i, node in enumerate(self.nodes)
+                if not done >> i & 1 and not masks[i] & ~done
+            ])
+        return results
+
+
+class QuestGraphIndex:
+    """
+    Connections of one world's quest nodes, maintained on save and delete.
+
+    ``compiled()`` returns a cached :class:`CompiledQuestGraph`, rebuilt only
+    after the connections changed.
+    """
+
+    def __init__(self):
+        self._edges: Dict[Hashable, Tuple[Hashable, ...]] = {}
+        self._incoming: Dict[Hashable, Dict[Hashable, None]] = {}
+        self.version = 0
+        self._compiled: Optional[CompiledQuestGraph] = None
+
+    def __contains__(self, node: Hashable) -> bool:
+        return node in self._edges
+
+    def set_node(self, node: Hashable, connections: Iterable[Hashable]) -> None:
+        """Add or update a node's outgoing connections."""
+        targets = tuple(dict.fromkeys(connections))
+        if self._edges.get(node) == targets:
+            return
+        self._unlink(node)
+        self._edges[node] = targets
+        for target in targets:
+            self._incoming.setdefault(target, {})[node] = None
+        self._changed()
+
+    def remove_node(self, node: Hashable) -> None:
+        if node in self._edges:
+            self._unlink(node)
+            del self._edges[node]
+            self._changed()
+
+    def incoming(self, node: Hashable) -> List[Hashable]:
+        """Nodes with a connection to ``node``."""
+        return list(self._incoming.get(node, ()))
+
+    def compiled(self) -> CompiledQuestGraph:
+        if self._compiled is None or self._compiled.version != self.version:
+            self._compiled = CompiledQuestGraph(self.version, self._edges)
+        return self._compiled
+
+    def _unlink(self, node: Hashable) -> None:
+        for target in self._edges.get(node, ()):
+            sources = self._incoming[target]
+            del sources[node]
+            if not sources:
+                del self._incoming[target]
+
+    def _changed(self) -> None:
+        self.version += 1
+        self._compiled = None
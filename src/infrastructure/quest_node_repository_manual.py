@@ -19,6 +19,7 @@ from src.domain.exceptions import (
     InvalidEntityOperation,
     BusinessRuleViolation,
 )
+from src.infrastructure.quest_graph import CompiledQuestGraph, QuestGraphIndex
 
 class InMemoryQuestNodeRepository(IQuestNodeRepository):
     """
@@ -33,6 +34,8 @@ class InMemoryQuestNodeRepository(IQuestNodeRepository):
     def __init__(self):
         self._quest_nodes: Dict[Tuple[TenantId, EntityId], QuestNode] = {}
         self._by_world: Dict[Tuple[TenantId, EntityId], List[EntityId]] = defaultdict(list)
+        # Connection graph per world, compiled on demand for path/order queries
+        self._graphs: Dict[Tuple[TenantId, EntityId], QuestGraphIndex] = defaultdict(QuestGraphIndex)
         self._next_id = 1
 
     def save(self, quest_node: QuestNode) -> QuestNode:
@@ -50,12 +53,18 @@ class InMemoryQuestNodeRepository(IQuestNodeRepository):
         self._validate_connections(quest_node)
 
         key = (quest_node.tenant_id, quest_node.id)
+        previous = self._quest_nodes.get(key)
         self._quest_nodes[key] = quest_node
 
         world_key = (quest_node.tenant_id, quest_node.world_id)
         if quest_node.id not in self._by_world[world_key]:
             self._by_world[world_key].append(quest_node.id)
 
+        # Keep the world's connection graph in step
+        if previous is not None and previous.world_id != quest_node.world_id:
+            self._graphs[(previous.tenant_id, previous.world_id)].remove_node(quest_node.id)
+        self._graphs[world_key].set_node(quest_node.id, quest_node.connections or [])
+
         return quest_node
 
     def find_by_id(self, tenant_id: TenantId, quest_node_id: EntityId) -> Optional[QuestNode]:
@@ -83,6 +92,7 @@ class InMemoryQuestNodeRepository(IQuestNodeRepository):
         key = (tenant_id, quest_node_id)
         if key in self._quest_nodes:
             del self._quest_nodes[key]
+            self._graphs[(tenant_id, node.world_id)].remove_node(quest_node_id)
             return True
         return False
 
@@ -174,13 +184,12 @@ class InMemoryQuestNodeRepository(IQuestNodeRepository):
 
     def _check_referenced(self, tenant_id: TenantId, quest_node_id: EntityId, node: QuestNode):
         """Check if node is referenced by other nodes."""
-        referenced = False
-        for other_node in self._quest_nodes.values():
-            if other_node.tenant_id != tenant_id:
-                continue
-            if hasattr(other_node, 'connections') and quest_node_id in other_node.connections:
-                referenced = True
-                break
+        # Connections may cross worlds, so ask every world graph of the tenant
+        referenced = any(
+            graph.incoming(quest_node_id)
+            for (graph_tenant, _), graph in self._graphs.items()
+            if graph_tenant == tenant_id
+        )
         
         if referenced:
             raise BusinessRuleViolation(
@@ -218,33 +227,41 @@ class InMemoryQuestNodeRepository(IQuestNodeRepository):
     def get_node_path(self, tenant_id: TenantId, start_node_id: EntityId, end_node_id: EntityId) -> List[EntityId]:
         """
         Find shortest path from start to end node.
-        Uses breadth-first search on node graph.
+        Uses breadth-first search on the compiled node graph (parent pointers are
+        cached per start node until the world's connections change).
         """
         if start_node_id == end_node_id:
             return [start_node_id]
 
-        # Build graph
-        graph = {start_node_id: None}
-        queue = [(start_node_id, [start_node_id])]
-        visited = {start_node_id}
-        parent = {start_node_id: None}
+        start = self.find_by_id(tenant_id, start_node_id)
+        if not start:
+            return []  # No path found
+
+        return self.get_world_graph(tenant_id, start.world_id).shortest_path(start_node_id, end_node_id)
 
-        while queue:
-            current, path = queue.pop(0)
+    def get_world_graph(self, tenant_id: TenantId, world_id: EntityId) -> CompiledQuestGraph:
+        """Compiled connection graph of a world (cached until a save/delete changes it)."""
+        return self._graphs[(tenant_id, world_id)].compiled()
 
-            if current == end_node_id:
-                return path
+    def get_node_order(self, tenant_id: TenantId, world_id: EntityId) -> List[EntityId]:
+        """World nodes in topological order (every node after the nodes leading to it)."""
+        return self.get_world_graph(tenant_id, world_id).topological_order()
 
-            if current in self._quest_nodes:
-                node = self._quest_nodes[(tenant_id, current)]
-                if hasattr(node, 'connections'):
-                    for connection_id in node.connections:
-                        if connection_id not in visited:
-                            visited.add(connection_id)
-                            queue.append((connection_id, path + [connection_id]))
-                            parent[connection_id] = current
+    def can_reach_node(self, tenant_id: TenantId, world_id: EntityId, from_node_id: EntityId, to_node_id: EntityId) -> bool:
+        """Whether ``to_node_id`` can be reached from ``from_node_id``."""
+        return self.get_world_graph(tenant_id, world_id).can_reach(from_node_id, to_node_id)
 
-        return []  # No path found
+    def get_nodes_available_for(
+        self,
+        tenant_id: TenantId,
+        world_id: EntityId,
+        completed_node_ids_by_player: List[List[EntityId]],
+    ) -> List[List[EntityId]]:
+        """
+        For each player's completed nodes, the nodes they can take next: not
+        completed, and every node leading to them completed.
+        """
+        return self.get_world_graph(tenant_id, world_id).available_batch(completed_node_ids_by_player)
 
     def calculate_node_unlock_probability(self, tenant_id: TenantId, node_id: EntityId) -> float:
         """
@@ -0,0 +1,120 @@
+"""
+Lazy Repository Registry
+
+Entry points used to import every repository module and construct every
+repository up front, so cold start paid for hundreds of repositories a
+session might never touch. :class:`RepositoryRegistry` holds a factory per
+name instead: the first lookup of ``registry.character_repo`` imports the
+class, builds its dependencies (e.g. the shared ``sqlite_db``) and the
+repository, and caches it. Lookups are thread-safe, so tool handlers running
+on a thread pool share one instance per name.
+
+Inside :meth:`RepositoryRegistry.undo_on_error`, lookups on that thread
+return journaled repositories whose changes are undone if the block fails
+(for in-memory repositories, which have no transactions).
+"""
+import threading
+from contextlib import contextmanager
+from importlib import import_module
+from typing import Any, Callable, Dict, Iterator, List
+
+from src.infrastructure.in_memory_undo import JournaledRepository, UndoLog
+
+
+def resolve(path: str) -> Any:
+    """Import ``"package.module:attribute"`` and return the attribute."""
+    module, _, attribute = path.partition(":")
+    return getattr(import_module(module), attribute)
+
+
+class RepositoryRegistry:
+    """Named repositories (and shared resources) constructed on first use."""
+
+    def __init__(self):
+        self._factories: Dict[str, Callable[[], Any]] = {}
+        self._instances: Dict[str, Any] = {}
+        self._lock = threading.RLock()
+        self._journals = threading.local()
+
+    def register(self, name: str, factory: Callable[[], Any]) -> None:
+        """Register ``factory`` to build ``name``; replaces any unbuilt registration."""
+        with self._lock:
+            if name in self._instances:
+                raise ValueError(f"{name} is already constructed")
+            self._factories[name] = factory
+
+    def register_class(self, name: str, class_path: str, *dependencies: str) -> None:
+        """
+        Register ``name`` as an instance of ``class_path``
+        (``"package.module:Class"``), constructed with the named dependencies
+        as positional arguments.
+        """
+        def factory():
+            cls = resolve(class_path)
+            return cls(*(self._instance(dependency) for dependency in dependencies))
+
+        self.register(name, factory)
+
+    def get(self, name: str) -> Any:
+        instance = self._instance(name)
+        logs = getattr(self._journals, "stack", None)
+        return JournaledRepository(instance, logs[-1]) if logs else instance
+
+    def _instance(self, name: str) -> Any:
+        instance = self._instances.get(name)
+        if instance is not None:
+            return instance
+
+        with self._lock:
+            if name not in self._instances:
+                try:
+                    factory = self._factories[name]
+                except KeyError:
+                    raise KeyError(f"No repository registered as {name!r}") from None
+                self._instances[name] = factory()
+            return self._instances[name]
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self.get(name)
+        except KeyError as e:
+            raise AttributeError(str(e)) from None
+
+    @contextmanager
+    def undo_on_error(self) -> Iterator[UndoLog]:
+        """
+        Journal the repositories looked up on this thread and undo their
+        changes if the block raises.
+
+        Nested blocks work like savepoints: a failing inner block undoes
+        only its own changes, a successful one hands them to the outer log.
+        """
+        logs = getattr(self._journals, "stack", None)
+        if logs is None:
+            logs = self._journals.stack = []
+        log = UndoLog()
+        logs.append(log)
+        try:
+            yield log
+        except BaseException:
+            logs.pop()
+            log.rollback()
+            raise
+        logs.pop()
+        if logs:
+            log.merge_into(logs[-1])
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._factories
+
+    def names(self) -> List[str]:
+        return list(self._factories)
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._instances
+
+    def loaded(self) -> List[str]:
+        """Names constructed so far."""
+        return list(self._instances)
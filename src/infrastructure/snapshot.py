@@ -0,0 +1,694 @@
+"""
+Binary Lore Snapshots
+
+A compact single-file snapshot of a tenant's lore (or of a ``LoreData``
+project) that can be opened without parsing it. Exporting a tenant used to
+re-read every per-entity JSON file and write one indented JSON document;
+reading one entity back meant parsing all of them.
+
+Layout (all integers little-endian, blocks 8-byte aligned)::
+
+    header      magic, version, TOC offset, TOC length   (HEADER)
+    sections    per entity type:
+                  columns   one block per numeric/string field
+                  rest      JSON of the remaining fields, one blob per row
+                  index     ids sorted ascending, and their rows
+    strings     interned string table: offsets, then UTF-8 data
+    TOC         JSON: metadata, string table and section layouts
+
+- Fields whose values are all ints, floats or bools (or None) become typed
+  columns with a byte of null flags when any value is None.
+- Fields whose values are all strings become columns of indexes into one
+  string table shared by every section, so repeated names, enum values and
+  timestamps are stored once.
+- Everything else (lists, nested objects, mixed types) is kept per row as
+  compact JSON in the ``rest`` block.
+
+:class:`Snapshot` memory-maps the file and reads only the TOC on open.
+:meth:`Snapshot.get` binary-searches a section's id index and decodes the
+one row it finds, so fetching an entity costs the same in a snapshot of a
+hundred entities or of several gigabytes.
+
+:func:`export_repositories` and :func:`import_repositories` move whole
+tenants between repositories (in-memory or SQLite) and snapshots, encoding
+entities with :class:`EntityCodec`.
+"""
+import bisect
+import importlib
+import mmap
+import os
+import pickle
+import struct
+import sys
+import tempfile
+from array import array
+from itertools import chain, islice
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+from src.domain.value_objects.common import TenantId
+from src.infrastructure.entity_codec import EntityCodec, dumps, loads
+
+
+MAGIC = b"LORESNP1"
+FORMAT_VERSION = 1
+
+# magic, format version, reserved, TOC offset, TOC length
+HEADER = struct.Struct("<8sHHIQQ")
+
+ALIGNMENT = 8
+IMPORT_BATCH_SIZE = 500
+NO_STRING = 0xFFFFFFFF
+INT64_MIN, INT64_MAX = -(1 << 63), (1 << 63) - 1
+
+# Column kind -> (array typecode, struct format character)
+COLUMN_TYPES = {
+    "int": ("q", "q"),
+    "float": ("d", "d"),
+    "bool": ("B", "B"),
+    "str": ("I", "I"),
+}
+# Fields that are None in every row take no space at all
+NULL_COLUMN = "null"
+
+_LITTLE_ENDIAN = sys.byteorder == "little"
+_MISSING = object()
+
+# Entities are encoded with date ranges as objects so they decode losslessly
+SNAPSHOT_CODEC = EntityCodec(date_ranges_as_dicts=True)
+
+
+class SnapshotError(Exception):
+    """Raised when a file is not a readable snapshot."""
+    pass
+
+
+def _value_kind(value: Any) -> Optional[str]:
+    """The column type that holds ``value`` exactly, or None."""
+    if value is None:
+        return NULL_COLUMN
+    value_type = type(value)
+    if value_type is bool:
+        return "bool"
+    if value_type is int:
+        return "int" if INT64_MIN <= value <= INT64_MAX else None
+    if value_type is float:
+        return "float"
+    if value_type is str:
+        return "str"
+    return None
+
+
+def _merge_kind(kind: Optional[str], value: Any) -> Optional[str]:
+    """The column type that holds ``kind`` values and ``value``, or None."""
+    found = _value_kind(value)
+    if kind is None or found is None:
+        return None
+    if found == NULL_COLUMN:
+        return kind
+    if kind == NULL_COLUMN:
+        return found
+    return kind if kind == found else None
+
+
+def _to_bytes(values: array) -> bytes:
+    if not _LITTLE_ENDIAN:
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def is_snapshot(path: Union[str, Path]) -> bool:
+    """Whether ``path`` starts with the snapshot magic."""
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+class SnapshotWriter:
+    """
+    Writes a snapshot section by section.
+
+    Each section's records are spilled to a temporary file and packed into
+    columns (see :meth:`add_section`); strings are interned across the whole
+    file and written on :meth:`close`. The
+    file is written under a temporary name and renamed into place on close.
+    """
+
+    def __init__(self, path: Union[str, Path], metadata: Optional[Dict[str, Any]] = None):
+        self.path = Path(path)
+        self._temp_path = self.path.with_name(self.path.name + ".tmp")
+        self._file = open(self._temp_path, "wb")
+        self._file.write(HEADER.pack(MAGIC, FORMAT_VERSION, 0, 0, 0, 0))
+        self._strings: Dict[str, int] = {}
+        self._sections: Dict[str, Dict[str, Any]] = {}
+        self._metadata = dict(metadata or {})
+        self._closed = False
+
+    def __enter__(self) -> "SnapshotWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def _write_block(self, data: bytes) -> int:
+        """Append ``data`` at the next aligned offset and return that offset."""
+        offset = self._file.tell()
+        padding = -offset % ALIGNMENT
+        if padding:
+            self._file.write(b"\0" * padding)
+            offset += padding
+        self._file.write(data)
+        return offset
+
+    def _intern(self, value: str) -> int:
+        index = self._strings.get(value)
+        if index is None:
+            index = self._strings[value] = len(self._strings)
+        return index
+
+    def _spill(self, records: Iterable[Dict[str, Any]], spill: IO[bytes]) -> Tuple[int, Dict[str, Optional[str]]]:
+        """
+        Pickle ``records`` to ``spill`` and find each field's column type.
+
+        Returns:
+            Record count, and field -> column type (None for fields that
+            go in the ``rest`` block) in order of first appearance
+        """
+        count = 0
+        kinds: Dict[str, Optional[str]] = {}
+        present: Dict[str, int] = {}
+        for record in records:
+            pickle.dump(record, spill, pickle.HIGHEST_PROTOCOL)
+            for field, value in record.items():
+                present[field] = present.get(field, 0) + 1
+                kinds[field] = _merge_kind(kinds.get(field, NULL_COLUMN), value)
+            count += 1
+        # Fields missing from some rows stay per row
+        for field, seen in present.items():
+            if seen < count:
+                kinds[field] = None
+        return count, kinds
+
+    def _write_column(self, kind: str, values: Optional[array], nulls: Optional[bytearray]) -> Dict[str, Any]:
+        if kind == NULL_COLUMN:
+            return {"type": kind, "offset": None, "nulls": None}
+        layout = {"type": kind, "offset": self._write_block(_to_bytes(values)), "nulls": None}
+        # String columns mark None in-band
+        if nulls is not None and 1 in nulls:
+            layout["nulls"] = self._write_block(bytes(nulls))
+        return layout
+
+    def add_section(
+        self,
+        name: str,
+        records: Iterable[Dict[str, Any]],
+        entity: Optional[str] = None,
+    ) -> int:
+        """
+        Write one section.
+
+        ``records`` is consumed once and spilled to a temporary file, then
+        read back row by row: ``rest`` blobs go straight to the snapshot and
+        column values are packed into typed arrays. Memory grows with the
+        packed columns (at most 8 bytes per value and a row index for the id
+        index), not with the records themselves.
+
+        Args:
+            name: Section name (e.g. ``"characters"``)
+            records: Encoded entities (flat dicts with an ``id``)
+            entity: ``module:qualname`` of the entity class, for decoding
+
+        Returns:
+            Number of records written
+        """
+        if name in self._sections:
+            raise ValueError(f"Section '{name}' already written")
+
+        with tempfile.TemporaryFile(dir=self.path.parent) as spill:
+            count, kinds = self._spill(records, spill)
+            spill.seek(0)
+
+            values = {
+                field: array(COLUMN_TYPES[kind][0])
+                for field, kind in kinds.items() if kind not in (None, NULL_COLUMN)
+            }
+            nulls = {field: bytearray() for field in values if kinds[field] != "str"}
+            rest_fields = [field for field, kind in kinds.items() if kind is None]
+            rest = None
+            if rest_fields:
+                offsets = array("Q", [0])
+                rest = {"offsets": None, "data": self._write_block(b"")}
+
+            for _ in range(count):
+                record = pickle.load(spill)
+                for field, column in values.items():
+                    value = record[field]
+                    if field in nulls:
+                        column.append(0 if value is None else value)
+                        nulls[field].append(value is None)
+                    else:
+                        column.append(NO_STRING if value is None else self._intern(value))
+                if rest is not None:
+                    blob = dumps({f: record[f] for f in rest_fields if f in record}).encode("utf-8")
+                    self._file.write(blob)
+                    offsets.append(offsets[-1] + len(blob))
+
+        if rest is not None:
+            rest["offsets"] = self._write_block(_to_bytes(offsets))
+
+        columns: Dict[str, Dict[str, Any]] = {
+            field: self._write_column(kind, values.get(field), nulls.get(field))
+            for field, kind in kinds.items() if kind is not None
+        }
+
+        index = None
+        id_column = columns.get("id")
+        if id_column is not None and id_column["type"] == "int" and id_column["nulls"] is None:
+            id_values = values["id"]
+            order = array("I", sorted(range(count), key=id_values.__getitem__))
+            ids = array("q", (id_values[row] for row in order))
+            if all(ids[i] != ids[i + 1] for i in range(count - 1)):
+                index = {
+                    "ids": self._write_block(_to_bytes(ids)),
+                    "rows": self._write_block(_to_bytes(order)),
+                }
+
+        self._sections[name] = {
+            "count": count,
+            "entity": entity,
+            "fields": list(kinds),
+            "columns": columns,
+            "rest": rest,
+            "index": index,
+        }
+        return count
+
+    def close(self) -> None:
+        """Write the string table and TOC, then move the file into place."""
+        if self._closed:
+            return
+        strings = [value.encode("utf-8") for value in self._strings]
+        offsets = array("Q", [0])
+        for value in strings:
+            offsets.append(offsets[-1] + len(value))
+        toc = {
+            "metadata": self._metadata,
+            "strings": {
+                "count": len(strings),
+                "offsets": self._write_block(_to_bytes(offsets)),
+                "data": self._write_block(b"".join(strings)),
+            },
+            "sections": self._sections,
+        }
+        toc_bytes = dumps(toc).encode("utf-8")
+        toc_offset = self._write_block(toc_bytes)
+        self._file.seek(0)
+        self._file.write(HEADER.pack(MAGIC, FORMAT_VERSION, 0, 0, toc_offset, len(toc_bytes)))
+        self._file.close()
+        os.replace(self._temp_path, self.path)
+        self._closed = True
+
+    def abort(self) -> None:
+        """Discard the partially written snapshot."""
+        if self._closed:
+            return
+        self._file.close()
+        os.unlink(self._temp_path)
+        self._closed = True
+
+
+def write_snapshot(
+    path: Union[str, Path],
+    sections: Iterable[Tuple[str, Iterable[Dict[str, Any]]]],
+    metadata: Optional[Dict[str, Any]] = None,
+) -> Dict[str, int]:
+    """
+    Write ``(name, records)`` pairs to a snapshot.
+
+    ``LoreData.iter_sections()`` can be passed as is.
+
+    Returns:
+        Record count per section
+    """
+    counts = {}
+    with SnapshotWriter(path, metadata) as writer:
+        for name, records in sections:
+            counts[name] = writer.add_section(name, records)
+    return counts
+
+
+class _Column:
+    """Reads one column of a mapped section."""
+
+    __slots__ = ("kind", "_buffer", "_item", "_offset", "_nulls", "_strings")
+
+    def __init__(self, buffer: mmap.mmap, layout: Dict[str, Any], strings: "_StringTable"):
+        self.kind = layout["type"]
+        self._buffer = buffer
+        self._item = struct.Struct("<" + COLUMN_TYPES[self.kind][1]) if self.kind != NULL_COLUMN else None
+        self._offset = layout["offset"]
+        self._nulls = layout["nulls"]
+        self._strings = strings
+
+    def value(self, row: int) -> Any:
+        if self.kind == NULL_COLUMN:
+            return None
+        if self._nulls is not None and self._buffer[self._nulls + row]:
+            return None
+        value = self._item.unpack_from(self._buffer, self._offset + row * self._item.size)[0]
+        if self.kind == "str":
+            return None if value == NO_STRING else self._strings[value]
+        if self.kind == "bool":
+            return bool(value)
+        return value
+
+    def values(self, count: int) -> List[Any]:
+        if self.kind == NULL_COLUMN:
+            return [None] * count
+        raw = struct.unpack_from(f"<{count}{self._item.format[1:]}", self._buffer, self._offset)
+        if self.kind == "str":
+            # Each distinct string is decoded once
+            lookup = {index: self._strings[index] for index in set(raw) if index != NO_STRING}
+            lookup[NO_STRING] = None
+            return [lookup[index] for index in raw]
+        values = [bool(value) for value in raw] if self.kind == "bool" else list(raw)
+        if self._nulls is not None:
+            nulls = self._buffer[self._nulls:self._nulls + count]
+            values = [None if null else value for value, null in zip(values, nulls)]
+        return values
+
+
+class _StringTable:
+    """Interned strings, decoded on first use."""
+
+    __slots__ = ("_buffer", "_offsets", "_data", "_count", "_cache")
+
+    def __init__(self, buffer: mmap.mmap, layout: Dict[str, Any]):
+        self._buffer = buffer
+        self._count = layout["count"]
+        self._offsets = layout["offsets"]
+        self._data = layout["data"]
+        self._cache: Dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> str:
+        value = self._cache.get(index)
+        if value is None:
+            start, end = struct.unpack_from("<QQ", self._buffer, self._offsets + index * 8)
+            value = self._cache[index] = self._buffer[self._data + start:self._data + end].decode("utf-8")
+        return value
+
+
+class _Section:
+    """Layout of one section and readers for its blocks."""
+
+    def __init__(self, buffer: mmap.mmap, layout: Dict[str, Any], strings: _StringTable):
+        self._buffer = buffer
+        self.count: int = layout["count"]
+        self.entity: Optional[str] = layout.get("entity")
+        self.fields: List[str] = layout["fields"]
+        self.columns = {name: _Column(buffer, column, strings) for name, column in layout["columns"].items()}
+        self._rest = layout["rest"]
+        self._index = layout["index"]
+
+    def find_row(self, entity_id: int) -> Optional[int]:
+        """Binary-search the id index; falls back to scanning the id column."""
+        if self._index is not None:
+            ids = _IdView(self._buffer, self._index["ids"], self.count)
+            position = bisect.bisect_left(ids, entity_id)
+            if position < self.count and ids[position] == entity_id:
+                return struct.unpack_from("<I", self._buffer, self._index["rows"] + position * 4)[0]
+            return None
+        column = self.columns.get("id")
+        if column is None:
+            return None
+        for row, value in enumerate(column.values(self.count)):
+            if value == entity_id:
+                return row
+        return None
+
+    def rest(self, row: int) -> Dict[str, Any]:
+        if self._rest is None:
+            return {}
+        start, end = struct.unpack_from("<QQ", self._buffer, self._rest["offsets"] + row * 8)
+        data = self._rest["data"]
+        return loads(self._buffer[data + start:data + end])
+
+    def record(self, row: int) -> Dict[str, Any]:
+        rest = self.rest(row)
+        columns = self.columns
+        record = {}
+        for field in self.fields:
+            if field in columns:
+                record[field] = columns[field].value(row)
+            elif field in rest:
+                record[field] = rest.pop(field)
+        return record
+
+
+class _IdView:
+    """Sorted id block as a sequence, for :func:`bisect.bisect_left`."""
+
+    __slots__ = ("_buffer", "_offset", "_count")
+
+    def __init__(self, buffer: mmap.mmap, offset: int, count: int):
+        self._buffer = buffer
+        self._offset = offset
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, position: int) -> int:
+        return struct.unpack_from("<q", self._buffer, self._offset + position * 8)[0]
+
+
+class Snapshot:
+    """
+    A memory-mapped snapshot.
+
+    Opening reads only the header and TOC; records are decoded on demand.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        try:
+            self._buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise SnapshotError(f"{self.path} is empty") from None
+
+        try:
+            if len(self._buffer) < HEADER.size:
+                raise SnapshotError(f"{self.path} is not a lore snapshot")
+            magic, version, _, _, toc_offset, toc_length = HEADER.unpack_from(self._buffer, 0)
+            if magic != MAGIC:
+                raise SnapshotError(f"{self.path} is not a lore snapshot")
+            if version > FORMAT_VERSION:
+                raise SnapshotError(f"Unsupported snapshot version {version} in {self.path}")
+            toc = loads(self._buffer[toc_offset:toc_offset + toc_length])
+        except Exception:
+            self.close()
+            raise
+
+        self.metadata: Dict[str, Any] = toc["metadata"]
+        self._strings = _StringTable(self._buffer, toc["strings"])
+        self._sections = {
+            name: _Section(self._buffer, layout, self._strings)
+            for name, layout in toc["sections"].items()
+        }
+
+    def __enter__(self) -> "Snapshot":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if not self._buffer.closed:
+            self._buffer.close()
+        self._file.close()
+
+    @property
+    def sections(self) -> List[str]:
+        """Section names in file order."""
+        return list(self._sections)
+
+    def _section(self, name: str) -> _Section:
+        try:
+            return self._sections[name]
+        except KeyError:
+            raise KeyError(f"No section '{name}' in snapshot") from None
+
+    def count(self, section: str) -> int:
+        return self._section(section).count
+
+    def entity_class(self, section: str) -> Optional[type]:
+        """The entity class recorded for ``section``, imported on demand."""
+        entity = self._section(section).entity
+        if entity is None:
+            return None
+        module, _, qualname = entity.partition(":")
+        obj = importlib.import_module(module)
+        for part in qualname.split("."):
+            obj = getattr(obj, part)
+        return obj
+
+    def get(self, section: str, entity_id: int) -> Optional[Dict[str, Any]]:
+        """Fetch one record by id without reading the rest of the section."""
+        entity_id = getattr(entity_id, "value", entity_id)
+        section_ = self._section(section)
+        row = section_.find_row(entity_id)
+        return None if row is None else section_.record(row)
+
+    def record(self, section: str, row: int) -> Dict[str, Any]:
+        section_ = self._section(section)
+        if not 0 <= row < section_.count:
+            raise IndexError(f"Row {row} out of range for section '{section}'")
+        return section_.record(row)
+
+    def iter_records(self, section: str) -> Iterator[Dict[str, Any]]:
+        """Yield a section's records in the order they were written."""
+        section_ = self._section(section)
+        count = section_.count
+        columns = {name: column.values(count) for name, column in section_.columns.items()}
+        fields = [(field, columns.get(field)) for field in section_.fields]
+        for row in range(count):
+            rest = section_.rest(row)
+            record = {}
+            for field, values in fields:
+                if values is not None:
+                    record[field] = values[row]
+                elif field in rest:
+                    record[field] = rest.pop(field)
+            yield record
+
+    def column(self, section: str, field: str) -> List[Any]:
+        """All values of a column field, read as one block."""
+        section_ = self._section(section)
+        try:
+            column = section_.columns[field]
+        except KeyError:
+            raise KeyError(f"'{field}' is not a column of section '{section}'") from None
+        return column.values(section_.count)
+
+
+def _class_path(cls: type) -> str:
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def export_repositories(
+    path: Union[str, Path],
+    repositories: Mapping[str, Any],
+    tenant_id: TenantId,
+    metadata: Optional[Dict[str, Any]] = None,
+    codec: EntityCodec = SNAPSHOT_CODEC,
+) -> Dict[str, int]:
+    """
+    Snapshot every entity of a tenant.
+
+    Args:
+        path: Snapshot file to write
+        repositories: Section name -> repository; each section is streamed
+            with ``stream_by_tenant`` and never held in memory whole
+        tenant_id: Tenant to export
+        metadata: Extra metadata stored in the TOC
+
+    Returns:
+        Entity count per section
+    """
+    metadata = {"tenant_id": tenant_id.value, **(metadata or {})}
+    counts = {}
+    with SnapshotWriter(path, metadata) as writer:
+        for name, repository in repositories.items():
+            entities = iter(repository.stream_by_tenant(tenant_id))
+            first = next(entities, None)
+            entity = _class_path(type(first)) if first is not None else None
+            records = map(codec.encode, chain([first], entities)) if first is not None else ()
+            counts[name] = writer.add_section(name, records, entity)
+    return counts
+
+
+def _remap_references(record: Dict[str, Any], id_maps: Dict[str, Dict[int, int]]) -> None:
+    """Rewrite ``<entity>_id`` / ``<entity>_ids`` fields of renumbered entities."""
+    for field, value in record.items():
+        if field.endswith("_ids") and isinstance(value, list):
+            id_map = id_maps.get(field[:-4])
+            if id_map:
+                record[field] = [id_map.get(item, item) for item in value]
+        elif field.endswith("_id") and field != "tenant_id":
+            id_map = id_maps.get(field[:-3])
+            if id_map and value in id_map:
+                record[field] = id_map[value]
+
+
+def _entity_key(cls: type) -> str:
+    """``CharacterRelationship`` -> ``character_relationship``."""
+    name = cls.__name__
+    return "".join("_" + c.lower() if c.isupper() and i else c.lower() for i, c in enumerate(name))
+
+
+def import_repositories(
+    snapshot: Snapshot,
+    repositories: Mapping[str, Any],
+    tenant_id: Optional[TenantId] = None,
+    renumber: bool = False,
+    batch_size: int = IMPORT_BATCH_SIZE,
+    codec: EntityCodec = SNAPSHOT_CODEC,
+) -> Dict[str, Dict[int, int]]:
+    """
+    Save a snapshot's entities into repositories with ``save_many``.
+
+    Sections are imported in snapshot order; sections without a repository
+    (or without a recorded entity class) are skipped.
+
+    Args:
+        snapshot: Open snapshot
+        repositories: Section name -> repository
+        tenant_id: Import into this tenant instead of the exported one
+        renumber: Clear ids so the repositories allocate new ones (needed
+            for SQLite, which only inserts entities without an id). Fields
+            named after an already imported entity (``world_id``,
+            ``character_ids``, ...) are rewritten to the new ids.
+
+    Returns:
+        Old id -> new id per imported section
+    """
+    id_maps: Dict[str, Dict[int, int]] = {}
+    imported: Dict[str, Dict[int, int]] = {}
+    for name in snapshot.sections:
+        repository = repositories.get(name)
+        cls = snapshot.entity_class(name) if repository is not None else None
+        if cls is None:
+            continue
+
+        id_map: Dict[int, int] = {}
+        records = snapshot.iter_records(name)
+        while True:
+            batch = list(islice(records, batch_size))
+            if not batch:
+                break
+            old_ids = [record.get("id") for record in batch]
+            for record in batch:
+                if tenant_id is not None:
+                    record["tenant_id"] = tenant_id.value
+                if renumber:
+                    record["id"] = None
+                    _remap_references(record, id_maps)
+            saved = repository.save_many([codec.decode(cls, record) for record in batch])
+            for old_id, entity in zip(old_ids, saved):
+                id_map[old_id] = getattr(entity.id, "value", entity.id)
+
+        imported[name] = id_map
+        if renumber:
+            id_maps[_entity_key(cls)] = id_map
+    return imported
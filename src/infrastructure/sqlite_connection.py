@@ -0,0 +1,458 @@
+"""
+SQLite Connection Management
+
+Connection handling shared by every SQLite repository. Repositories never
+open connections themselves; they call ``db.get_connection()`` and receive a
+connection that is committed on success and rolled back on error.
+
+Two modes are supported:
+
+- Pooled (default): each thread keeps a long-lived connection that is tuned
+  once (WAL journal, synchronous level, page cache, mmap) and reused for every
+  call, so connect cost and page-cache warmup are paid once per thread.
+- Per-call: a fresh, untuned connection is opened and closed for every call.
+  This is the historical behaviour and is kept for comparison and for tools
+  that must not hold file handles open.
+
+``transaction()`` widens the scope: every repository call a thread makes
+inside it shares one connection and one commit (see ``SQLiteUnitOfWork``).
+
+Pool and pragma settings are read from the ``database`` and ``performance``
+sections of ``config/config.yaml``.
+"""
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional
+
+
+DEFAULT_CONFIG_PATH = Path(__file__).resolve().parents[2] / "config" / "config.yaml"
+
+_VALID_JOURNAL_MODES = {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"}
+_VALID_SYNCHRONOUS = {"OFF", "NORMAL", "FULL", "EXTRA"}
+
+
+class ConnectionPoolExhausted(RuntimeError):
+    """Raised when no connection becomes available within the pool timeout."""
+
+
+@dataclass(frozen=True)
+class SQLiteSettings:
+    """
+    Tuning knobs for SQLite connections.
+
+    Attributes:
+        pooled: Keep per-thread connections open instead of connect-per-call
+        pool_size: Maximum number of long-lived (thread-pinned) connections
+        max_overflow: Extra short-lived connections allowed when the pool is full
+        pool_timeout_seconds: How long to wait for a free connection
+        journal_mode: SQLite journal mode (WAL allows concurrent readers)
+        synchronous: SQLite synchronous level (NORMAL is safe with WAL)
+        cache_size_kb: Page cache size per connection in KiB
+        mmap_size_mb: Memory-mapped I/O window in MiB (0 disables)
+        statement_cache_size: Prepared statements cached per connection
+        busy_timeout_ms: How long a writer waits on a locked database
+    """
+
+    pooled: bool = True
+    pool_size: int = 10
+    max_overflow: int = 20
+    pool_timeout_seconds: float = 30.0
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    cache_size_kb: int = 65536
+    mmap_size_mb: int = 256
+    statement_cache_size: int = 256
+    busy_timeout_ms: int = 5000
+
+    def __post_init__(self):
+        if self.pool_size < 1:
+            raise ValueError("pool_size must be at least 1")
+        if self.max_overflow < 0:
+            raise ValueError("max_overflow cannot be negative")
+        if self.journal_mode.upper() not in _VALID_JOURNAL_MODES:
+            raise ValueError(f"Unsupported journal_mode: {self.journal_mode}")
+        if self.synchronous.upper() not in _VALID_SYNCHRONOUS:
+            raise ValueError(f"Unsupported synchronous level: {self.synchronous}")
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> "SQLiteSettings":
+        """
+        Build settings from a parsed ``config.yaml`` mapping.
+
+        Reads ``database.pool_size``, ``database.max_overflow`` and the
+        ``database.sqlite`` block, plus the ``sqlite_*`` keys of the
+        ``performance`` section. Missing keys fall back to the defaults.
+        """
+        database = config.get("database") or {}
+        sqlite_section = database.get("sqlite") or {}
+        performance = config.get("performance") or {}
+        defaults = cls()
+
+        return cls(
+            pooled=bool(sqlite_section.get("pooled", defaults.pooled)),
+            pool_size=int(database.get("pool_size", defaults.pool_size)),
+            max_overflow=int(database.get("max_overflow", defaults.max_overflow)),
+            pool_timeout_seconds=float(
+                sqlite_section.get("pool_timeout_seconds", defaults.pool_timeout_seconds)
+            ),
+            journal_mode=str(sqlite_section.get("journal_mode", defaults.journal_mode)),
+            synchronous=str(sqlite_section.get("synchronous", defaults.synchronous)),
+            busy_timeout_ms=int(sqlite_section.get("busy_timeout_ms", defaults.busy_timeout_ms)),
+            cache_size_kb=int(performance.get("sqlite_cache_size_kb", defaults.cache_size_kb)),
+            mmap_size_mb=int(performance.get("sqlite_mmap_size_mb", defaults.mmap_size_mb)),
+            statement_cache_size=int(
+                performance.get("statement_cache_size", defaults.statement_cache_size)
+            ),
+        )
+
+    @classmethod
+    def load(cls, config_path: Optional[Path] = None) -> "SQLiteSettings":
+        """
+        Load settings from ``config/config.yaml``.
+
+        Returns the defaults when the file is missing or PyYAML is not
+        installed, so repositories keep working in minimal environments.
+        """
+        path = Path(config_path) if config_path else DEFAULT_CONFIG_PATH
+        if not path.exists():
+            return cls()
+
+        try:
+            import yaml
+        except ImportError:
+            return cls()
+
+        with open(path, "r", encoding="utf-8") as f:
+            config = yaml.safe_load(f) or {}
+
+        return cls.from_config(config)
+
+    def per_call(self) -> "SQLiteSettings":
+        """Copy of these settings with pooling disabled."""
+        return replace(self, pooled=False)
+
+
+class Transaction:
+    """
+    An explicit transaction on one connection, with savepoints for nesting.
+
+    Created by :meth:`SQLiteConnectionManager.transaction`; callbacks
+    registered with :meth:`on_commit` run once the outermost commit succeeds.
+    """
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        self._savepoint_depth = 0
+        self._on_commit: List[Callable[[], None]] = []
+
+    def begin(self) -> None:
+        # IMMEDIATE takes the write lock up front so two units of work never
+        # deadlock trying to upgrade from a read lock.
+        self.conn.execute("BEGIN IMMEDIATE")
+
+    def commit(self) -> None:
+        """Commit everything so far and continue in a fresh transaction."""
+        if self._savepoint_depth:
+            raise sqlite3.ProgrammingError("Cannot commit inside a nested transaction")
+        self.conn.commit()
+        callbacks, self._on_commit = self._on_commit, []
+        for callback in callbacks:
+            callback()
+
+    def rollback(self) -> None:
+        """Discard everything since the last commit."""
+        if self._savepoint_depth:
+            raise sqlite3.ProgrammingError("Cannot roll back the outer transaction from a nested one")
+        self.conn.rollback()
+        self._on_commit = []
+
+    def restart(self) -> None:
+        """Open a new transaction after an explicit commit or rollback."""
+        if not self.conn.in_transaction:
+            self.begin()
+
+    def finish(self) -> None:
+        """Make sure no transaction is left open on the connection."""
+        if self.conn.in_transaction:
+            self.conn.rollback()
+
+    def on_commit(self, callback: Callable[[], None]) -> None:
+        """Run ``callback`` after the outermost transaction commits."""
+        self._on_commit.append(callback)
+
+    @contextmanager
+    def savepoint(self) -> Iterator[None]:
+        """Nested block; rolling it back also drops the on_commit callbacks it registered."""
+        name = f"lore_sp_{self._savepoint_depth}"
+        self.conn.execute(f"SAVEPOINT {name}")
+        self._savepoint_depth += 1
+        callbacks_before = len(self._on_commit)
+        try:
+            yield
+        except BaseException:
+            self._savepoint_depth -= 1
+            self.conn.execute(f"ROLLBACK TO SAVEPOINT {name}")
+            self.conn.execute(f"RELEASE SAVEPOINT {name}")
+            del self._on_commit[callbacks_before:]
+            raise
+        else:
+            self._savepoint_depth -= 1
+            self.conn.execute(f"RELEASE SAVEPOINT {name}")
+
+
+class _PinnedConnection:
+    """
+    Thread-local holder for a pooled connection.
+
+    When the owning thread exits, CPython drops its thread-local storage and
+    this holder hands the connection back to the pool for reuse.
+    """
+
+    def __init__(self, manager: "SQLiteConnectionManager", conn: sqlite3.Connection):
+        self._manager = manager
+        self.conn = conn
+
+    def __del__(self):
+        manager, conn = self._manager, self.conn
+        self.conn = None
+        if conn is not None:
+            manager._release_pinned(conn)
+
+
+class SQLiteConnectionManager:
+    """
+    Hands out SQLite connections according to :class:`SQLiteSettings`.
+
+    In pooled mode each thread is pinned to one connection for its lifetime.
+    At most ``pool_size`` connections are pinned; further threads receive
+    short-lived overflow connections (up to ``max_overflow``) and otherwise
+    wait for a pinned connection to be released.
+    """
+
+    def __init__(self, db_path: str = "lore_system.db", settings: Optional[SQLiteSettings] = None):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.settings = settings if settings is not None else SQLiteSettings.load()
+
+        self._local = threading.local()
+        self._lock = threading.Condition()
+        self._idle: List[sqlite3.Connection] = []
+        self._all: List[sqlite3.Connection] = []
+        self._pinned_count = 0
+        self._overflow_count = 0
+        self._closed = False
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def get_connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Get a database connection; commits on success, rolls back on error.
+
+        Inside :meth:`transaction` the thread's transaction connection is
+        returned instead and commit/rollback is left to the transaction.
+        """
+        active = getattr(self._local, "transaction", None)
+        if active is not None:
+            yield active.conn
+            return
+
+        with self._checkout() as conn:
+            try:
+                yield conn
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+    @contextmanager
+    def transaction(self) -> Iterator["Transaction"]:
+        """
+        Run a block in one transaction shared by every repository on this thread.
+
+        All ``get_connection()`` calls made by this thread inside the block use
+        the same connection and nothing is committed until the block exits. An
+        exception rolls the whole block back. Nested calls open a savepoint, so
+        an inner failure only undoes the inner block. Uncommitted writes left
+        on the thread's connection outside ``get_connection()`` raise
+        ``sqlite3.ProgrammingError`` instead of being committed.
+        """
+        active = getattr(self._local, "transaction", None)
+        if active is not None:
+            with active.savepoint():
+                yield active
+            return
+
+        with self._checkout() as conn:
+            if conn.in_transaction:
+                # Someone wrote on this connection outside get_connection();
+                # committing it here would persist work nobody asked to commit
+                raise sqlite3.ProgrammingError(
+                    "Connection has an uncommitted transaction; cannot start a new one"
+                )
+            tx = Transaction(conn)
+            tx.begin()
+            self._local.transaction = tx
+            try:
+                yield tx
+                tx.commit()
+            except BaseException:
+                tx.rollback()
+                raise
+            finally:
+                self._local.transaction = None
+                tx.finish()
+
+    def in_transaction(self) -> bool:
+        """True when the calling thread is inside :meth:`transaction`."""
+        return getattr(self._local, "transaction", None) is not None
+
+    def close(self) -> None:
+        """Close every pooled connection. The manager cannot be reused afterwards."""
+        with self._lock:
+            self._closed = True
+            connections, self._all, self._idle = self._all, [], []
+            self._lock.notify_all()
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.ProgrammingError:
+                # Connection already closed by its owning thread
+                pass
+        self._local = threading.local()
+
+    def pool_status(self) -> Dict[str, Any]:
+        """Snapshot of pool usage for diagnostics."""
+        with self._lock:
+            return {
+                "pooled": self.settings.pooled,
+                "pool_size": self.settings.pool_size,
+                "open_connections": len(self._all),
+                "pinned": self._pinned_count,
+                "idle": len(self._idle),
+                "overflow_in_use": self._overflow_count,
+            }
+
+    # ------------------------------------------------------------------
+    # Connection lifecycle
+    # ------------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a new connection; pooled connections are also tuned with pragmas."""
+        settings = self.settings
+        if not settings.pooled:
+            conn = sqlite3.connect(self.db_path)
+            conn.row_factory = sqlite3.Row  # Allow column access by name
+            return conn
+
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=settings.busy_timeout_ms / 1000.0,
+            cached_statements=settings.statement_cache_size,
+            check_same_thread=False,
+        )
+        conn.row_factory = sqlite3.Row  # Allow column access by name
+
+        conn.execute(f"PRAGMA journal_mode = {settings.journal_mode.upper()}")
+        conn.execute(f"PRAGMA synchronous = {settings.synchronous.upper()}")
+        # Negative cache_size is interpreted by SQLite as KiB rather than pages
+        conn.execute(f"PRAGMA cache_size = {-abs(settings.cache_size_kb)}")
+        conn.execute(f"PRAGMA mmap_size = {settings.mmap_size_mb * 1024 * 1024}")
+        conn.execute(f"PRAGMA busy_timeout = {settings.busy_timeout_ms}")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        return conn
+
+    @contextmanager
+    def _checkout(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection for the calling thread without touching transactions."""
+        if not self.settings.pooled:
+            conn = self._connect()
+            try:
+                yield conn
+            finally:
+                conn.close()
+            return
+
+        conn, is_overflow = self._acquire()
+        try:
+            yield conn
+        finally:
+            if is_overflow:
+                self._release_overflow(conn)
+
+    def _acquire(self):
+        """Return ``(connection, is_overflow)`` for the calling thread."""
+        holder = getattr(self._local, "pinned", None)
+        if holder is not None and holder.conn is not None:
+            return holder.conn, False
+
+        settings = self.settings
+        deadline = time.monotonic() + settings.pool_timeout_seconds
+        # Only reserve a slot under the lock; opening a connection can be
+        # slow (or block on a locked file) and must not stall other threads
+        with self._lock:
+            while True:
+                if self._closed:
+                    raise sqlite3.ProgrammingError("Connection manager has been closed")
+
+                if self._pinned_count < settings.pool_size:
+                    self._pinned_count += 1
+                    conn = self._idle.pop() if self._idle else None
+                    is_overflow = False
+                    break
+
+                if self._overflow_count < settings.max_overflow:
+                    self._overflow_count += 1
+                    conn = None
+                    is_overflow = True
+                    break
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise ConnectionPoolExhausted(
+                        f"No SQLite connection available within {settings.pool_timeout_seconds}s "
+                        f"(pool_size={settings.pool_size}, max_overflow={settings.max_overflow})"
+                    )
+                self._lock.wait(remaining)
+
+        if conn is None:
+            try:
+                conn = self._connect()
+            except Exception:
+                with self._lock:
+                    if is_overflow:
+                        self._overflow_count -= 1
+                    else:
+                        self._pinned_count -= 1
+                    self._lock.notify()
+                raise
+            if is_overflow:
+                return conn, True
+            with self._lock:
+                self._all.append(conn)
+
+        self._local.pinned = _PinnedConnection(self, conn)
+        return conn, False
+
+    def _release_pinned(self, conn: sqlite3.Connection) -> None:
+        """Return a thread's pinned connection to the idle list."""
+        with self._lock:
+            self._pinned_count = max(0, self._pinned_count - 1)
+            if self._closed or conn not in self._all:
+                return
+            if conn.in_transaction:
+                conn.rollback()
+            self._idle.append(conn)
+            self._lock.notify()
+
+    def _release_overflow(self, conn: sqlite3.Connection) -> None:
+        conn.close()
+        with self._lock:
+            self._overflow_count -= 1
+            self._lock.notify()
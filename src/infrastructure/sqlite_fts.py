@@ -0,0 +1,209 @@
+"""
+SQLite Full-Text Search
+
+FTS5 indexes over the narrative text columns, replacing ``LIKE '%term%'``
+scans in the repository search methods.
+
+Each indexed table ``t`` gets an external-content FTS5 table ``t_fts``
+(the text is stored once, in ``t``) kept in sync by insert/update/delete
+triggers. Searches are ranked with bm25, every search word is matched as a
+prefix, and a highlighted snippet of the best matching column is returned.
+"""
+import re
+import sqlite3
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from src.domain.repositories.search import SearchHit
+from src.domain.value_objects.common import TenantId
+
+
+# Narrative text columns indexed per table. Characters, items, locations
+# and environments are left out: their SQLite repositories do not implement
+# their interfaces yet, so nothing could search those indexes.
+FTS_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "worlds": ("name", "description"),
+    "stories": ("name", "description"),
+    "events": ("name", "description"),
+    "pages": ("title", "content"),
+    "notes": ("title", "content"),
+    "inspirations": ("content",),
+}
+
+SNIPPET_OPEN = "["
+SNIPPET_CLOSE = "]"
+SNIPPET_ELLIPSIS = "…"
+SNIPPET_TOKENS = 12
+
+WORD_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def fts_table(table: str) -> str:
+    return f"{table}_fts"
+
+
+def search_terms(search_term: str) -> List[str]:
+    """Split user input into the case-folded words that are matched."""
+    return WORD_PATTERN.findall(search_term.casefold())
+
+
+def match_expression(
+    search_term: str,
+    columns: Optional[Sequence[str]] = None,
+    prefix: bool = True,
+) -> Optional[str]:
+    """
+    Build an FTS5 MATCH expression from free-form user input.
+
+    Every word must match (implicit AND). Words are quoted so that user
+    input can never be parsed as FTS5 syntax. Returns None if the input
+    contains no words.
+    """
+    words = search_terms(search_term)
+    if not words:
+        return None
+
+    suffix = "*" if prefix else ""
+    expression = " AND ".join(f'"{word}"{suffix}' for word in words)
+    if columns:
+        expression = f"{{{' '.join(columns)}}} : ({expression})"
+    return expression
+
+
+def _existing_columns(conn: sqlite3.Connection, table: str) -> set:
+    return {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+
+
+def create_fts_tables(
+    conn: sqlite3.Connection,
+    tables: Optional[Dict[str, Tuple[str, ...]]] = None,
+) -> List[str]:
+    """
+    Create the FTS5 tables and sync triggers for ``tables``.
+
+    Tables missing from the schema are skipped. A newly created index is
+    rebuilt from the rows already present. Returns the indexed tables.
+    """
+    if tables is None:
+        tables = FTS_COLUMNS
+
+    indexed = []
+    for table, columns in tables.items():
+        if not set(columns) <= _existing_columns(conn, table):
+            continue
+
+        fts = fts_table(table)
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (fts,)
+        ).fetchone()
+
+        column_list = ", ".join(columns)
+        new_values = ", ".join(f"new.{column}" for column in columns)
+        old_values = ", ".join(f"old.{column}" for column in columns)
+
+        conn.execute(f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5(
+                {column_list},
+                content='{table}',
+                content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2',
+                prefix='2 3'
+            )
+        """)
+        conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {fts}_insert AFTER INSERT ON {table} BEGIN
+                INSERT INTO {fts}(rowid, {column_list}) VALUES (new.id, {new_values});
+            END
+        """)
+        conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {fts}_delete AFTER DELETE ON {table} BEGIN
+                INSERT INTO {fts}({fts}, rowid, {column_list}) VALUES ('delete', old.id, {old_values});
+            END
+        """)
+        conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {fts}_update AFTER UPDATE OF {column_list} ON {table} BEGIN
+                INSERT INTO {fts}({fts}, rowid, {column_list}) VALUES ('delete', old.id, {old_values});
+                INSERT INTO {fts}(rowid, {column_list}) VALUES (new.id, {new_values});
+            END
+        """)
+
+        if not exists:
+            conn.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+        indexed.append(table)
+
+    return indexed
+
+
+def fts_search(
+    conn: sqlite3.Connection,
+    table: str,
+    tenant_id: TenantId,
+    search_term: str,
+    limit: int = 20,
+    columns: Optional[Sequence[str]] = None,
+) -> List[sqlite3.Row]:
+    """
+    Return the rows of ``table`` matching ``search_term``, best match first.
+
+    Rows carry two extra columns: ``fts_rank`` (bm25, lower is better) and
+    ``fts_snippet``.
+    """
+    expression = match_expression(search_term, columns)
+    if expression is None:
+        return []
+
+    fts = fts_table(table)
+    return conn.execute(f"""
+        SELECT {table}.*,
+               bm25({fts}) AS fts_rank,
+               snippet({fts}, -1, ?, ?, ?, ?) AS fts_snippet
+        FROM {fts}
+        JOIN {table} ON {table}.id = {fts}.rowid
+        WHERE {fts} MATCH ? AND {table}.tenant_id = ?
+        ORDER BY fts_rank
+        LIMIT ?
+    """, (
+        SNIPPET_OPEN, SNIPPET_CLOSE, SNIPPET_ELLIPSIS, SNIPPET_TOKENS,
+        expression, tenant_id.value, limit,
+    )).fetchall()
+
+
+class SQLiteFullTextSearchMixin:
+    """
+    Ranked full-text search for SQLite repositories.
+
+    Uses the repository's ``_table`` and ``_row_mapper`` (see
+    :class:`SQLiteBulkMixin`); the table must be listed in ``FTS_COLUMNS``.
+    """
+
+    _table: Optional[str] = None
+    _row_mapper: str = "_row_to_entity"
+
+    def search_ranked(
+        self,
+        tenant_id: TenantId,
+        search_term: str,
+        limit: int = 20,
+        columns: Optional[Sequence[str]] = None,
+    ) -> List[SearchHit]:
+        """
+        Search the narrative text columns (or only ``columns``).
+
+        Returns:
+            Hits ordered by relevance, each with a highlighted snippet
+        """
+        row_to_entity = getattr(self, self._row_mapper)
+        with self.db.get_connection() as conn:
+            rows = fts_search(conn, self._table, tenant_id, search_term, limit, columns)
+            return [
+                SearchHit(row_to_entity(row), -row["fts_rank"], row["fts_snippet"])
+                for row in rows
+            ]
+
+    def _search_entities(
+        self,
+        tenant_id: TenantId,
+        search_term: str,
+        limit: int,
+        columns: Optional[Sequence[str]] = None,
+    ) -> List[Any]:
+        return [hit.entity for hit in self.search_ranked(tenant_id, search_term, limit, columns)]
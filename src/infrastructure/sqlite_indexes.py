@@ -0,0 +1,289 @@
+"""
+SQLite Secondary Indexes
+
+Derives composite indexes from the SQL the SQLite repositories issue and
+checks that every query is served by an index.
+
+The queries come from the repository classes themselves: the SQL literals
+in their methods, plus :data:`TABLE_QUERIES` -- the statements the shared
+mixins and the generated repositories build from each class's ``_table``.
+
+Index columns are the query's equality columns with ``tenant_id`` first
+(every query is tenant scoped), followed by its ``ORDER BY`` columns.
+``ORDER BY id`` needs no column of its own: SQLite stores the rowid at the
+end of every index entry, so an index on ``(tenant_id, world_id)`` already
+returns ``WHERE world_id = ? AND tenant_id = ? ORDER BY id`` in order
+without a temporary sort.
+"""
+import inspect
+import re
+import sqlite3
+from dataclasses import dataclass, field
+from types import CodeType
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+
+# Statements issued for every repository ``_table``: find_by_id/delete and
+# find_many of SQLiteBulkMixin, tenant keyset pages of
+# SQLiteKeysetPaginationMixin.
+TABLE_QUERIES = (
+    "SELECT * FROM {table} WHERE id = ? AND tenant_id = ?",
+    "DELETE FROM {table} WHERE id = ? AND tenant_id = ?",
+    "SELECT * FROM {table} WHERE tenant_id = ? AND id IN (?)",
+    "SELECT * FROM {table} WHERE tenant_id = ? AND id > ? ORDER BY id LIMIT ?",
+)
+
+# Issued only for tables with a ``world_id`` column (list_by_world and
+# world keyset pages); the mixins fall back to tenant scans otherwise.
+WORLD_TABLE_QUERIES = (
+    "SELECT * FROM {table} WHERE world_id = ? AND tenant_id = ? ORDER BY id LIMIT ? OFFSET ?",
+    "SELECT * FROM {table} WHERE world_id = ? AND tenant_id = ? AND id > ? ORDER BY id LIMIT ?",
+)
+
+_STATEMENT = re.compile(r"(SELECT|UPDATE|DELETE)\b", re.IGNORECASE)
+_TABLE = re.compile(r"\b(?:FROM|UPDATE|INTO)\s+(\w+)", re.IGNORECASE)
+_WHERE = re.compile(
+    r"\bWHERE\b(.*?)(?=\bORDER\s+BY\b|\bGROUP\s+BY\b|\bLIMIT\b|$)",
+    re.IGNORECASE | re.DOTALL,
+)
+_ORDER_BY = re.compile(r"\bORDER\s+BY\b(.*?)(?=\bLIMIT\b|$)", re.IGNORECASE | re.DOTALL)
+_EQUALITY = re.compile(r"^\s*(\w+)\s*=\s*(?:\?|-?\d+|'[^']*')\s*$")
+_AND = re.compile(r"\bAND\b", re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class QueryShape:
+    """Columns a single query filters and sorts on."""
+
+    table: str
+    equality_columns: Tuple[str, ...]
+    order_by: Tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class IndexSpec:
+    """A composite index on one table."""
+
+    table: str
+    columns: Tuple[str, ...]
+
+    @property
+    def name(self) -> str:
+        return f"idx_{self.table}_{'_'.join(self.columns)}"
+
+    def create_sql(self) -> str:
+        return f"CREATE INDEX IF NOT EXISTS {self.name} ON {self.table} ({', '.join(self.columns)})"
+
+
+@dataclass
+class QueryPlan:
+    """``EXPLAIN QUERY PLAN`` result for one repository query."""
+
+    sql: str
+    details: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @property
+    def scans(self) -> bool:
+        """True when SQLite reads a whole table (or whole index) to answer the query."""
+        return any(detail.startswith("SCAN ") for detail in self.details)
+
+    @property
+    def sorts(self) -> bool:
+        """True when results are sorted in a temporary b-tree."""
+        return any("TEMP B-TREE" in detail for detail in self.details)
+
+
+def _code_strings(code: CodeType) -> Iterator[str]:
+    for const in code.co_consts:
+        if isinstance(const, str):
+            yield const
+        elif isinstance(const, CodeType):
+            yield from _code_strings(const)
+
+
+def sql_literals(cls: type) -> List[str]:
+    """
+    The SELECT/UPDATE/DELETE statements with a WHERE clause written as
+    string literals in the methods ``cls`` defines.
+
+    Pieces of f-strings are not whole statements and do not match; the
+    statements built from ``_table`` are covered by :data:`TABLE_QUERIES`.
+    """
+    queries = []
+    for attribute in vars(cls).values():
+        function = inspect.unwrap(getattr(attribute, "__func__", attribute))
+        code = getattr(function, "__code__", None)
+        if code is None:
+            continue
+        for literal in _code_strings(code):
+            sql = " ".join(literal.split())
+            if _STATEMENT.match(sql) and _WHERE.search(sql) and sql not in queries:
+                queries.append(sql)
+    return queries
+
+
+def class_queries(cls: type, schema: Optional[Dict[str, set]] = None) -> List[str]:
+    """
+    Every query a repository class issues: its SQL literals plus the
+    :data:`TABLE_QUERIES` for its ``_table``.
+
+    With a ``schema`` (table -> columns), world-scoped statements are only
+    included for tables that have a ``world_id`` column.
+    """
+    queries = sql_literals(cls)
+    table = getattr(cls, "_table", None)
+    if isinstance(table, str):
+        templates = list(TABLE_QUERIES)
+        if schema is None or "world_id" in schema.get(table, {"world_id"}):
+            templates += WORLD_TABLE_QUERIES
+        queries += [template.format(table=table) for template in templates]
+    return queries
+
+
+def repository_classes() -> List[type]:
+    """The repository classes defined in ``sqlite_repositories``."""
+    from src.infrastructure import sqlite_repositories
+
+    return [
+        cls for name, cls in vars(sqlite_repositories).items()
+        if isinstance(cls, type)
+        and cls.__module__ == sqlite_repositories.__name__
+        and name.endswith("Repository")
+    ]
+
+
+def repository_queries(schema: Optional[Dict[str, set]] = None) -> List[str]:
+    """Return every distinct query issued by the SQLite repositories."""
+    return list(dict.fromkeys(
+        sql for cls in repository_classes() for sql in class_queries(cls, schema)
+    ))
+
+
+def parse_query(sql: str) -> Optional[QueryShape]:
+    """
+    Extract the table, equality columns and ORDER BY columns of ``sql``.
+
+    Returns None for statements without a table or without equality filters.
+    Non-equality terms (``LIKE``, ``OR`` groups) cannot use a b-tree prefix
+    and are ignored.
+    """
+    table_match = _TABLE.search(sql)
+    where_match = _WHERE.search(sql)
+    if not table_match or not where_match:
+        return None
+
+    equality = []
+    for term in _AND.split(where_match.group(1)):
+        column = _EQUALITY.match(term)
+        if column and column.group(1) not in equality:
+            equality.append(column.group(1))
+    if not equality:
+        return None
+
+    order_by = ()
+    order_match = _ORDER_BY.search(sql)
+    if order_match:
+        order_by = tuple(
+            part.split()[0]
+            for part in order_match.group(1).split(",")
+            if part.strip()
+        )
+
+    return QueryShape(table_match.group(1), tuple(equality), order_by)
+
+
+def index_for(shape: QueryShape) -> Optional[IndexSpec]:
+    """Return the index that serves ``shape``, or None if none is needed."""
+    if "id" in shape.equality_columns:
+        return None  # primary key lookup
+
+    columns = sorted(shape.equality_columns, key=lambda column: column != "tenant_id")
+    columns += [column for column in shape.order_by if column != "id" and column not in columns]
+    return IndexSpec(shape.table, tuple(columns))
+
+
+def derive_indexes(queries: Iterable[str]) -> List[IndexSpec]:
+    """
+    Derive the minimal set of indexes serving ``queries``.
+
+    An index whose columns are a prefix of another index on the same table
+    is dropped, since the longer index serves both queries -- unless it
+    serves an ``ORDER BY`` query: extra columns would sit between the
+    equality columns and the rowid and force a temporary sort.
+    """
+    specs: Dict[IndexSpec, bool] = {}
+    for sql in queries:
+        shape = parse_query(sql)
+        spec = index_for(shape) if shape else None
+        if spec is not None:
+            specs[spec] = specs.get(spec, False) or bool(shape.order_by)
+
+    def covered(spec: IndexSpec) -> bool:
+        if specs[spec]:
+            return False
+        return any(
+            other.table == spec.table
+            and len(other.columns) > len(spec.columns)
+            and other.columns[:len(spec.columns)] == spec.columns
+            for other in specs
+        )
+
+    return [spec for spec in specs if not covered(spec)]
+
+
+def _table_columns(conn: sqlite3.Connection) -> Dict[str, set]:
+    tables = [row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")]
+    return {
+        table: {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+        for table in tables
+    }
+
+
+def create_indexes(
+    conn: sqlite3.Connection,
+    specs: Optional[Sequence[IndexSpec]] = None,
+) -> List[IndexSpec]:
+    """
+    Create the derived indexes on ``conn``.
+
+    Indexes whose table or columns do not exist in the current schema are
+    skipped. Returns the indexes that exist after the call.
+    """
+    schema = _table_columns(conn)
+    if specs is None:
+        specs = derive_indexes(repository_queries(schema))
+
+    created = []
+    for spec in specs:
+        if spec.table in schema and set(spec.columns) <= schema[spec.table]:
+            conn.execute(spec.create_sql())
+            created.append(spec)
+    return created
+
+
+def explain_queries(
+    conn: sqlite3.Connection,
+    queries: Optional[Iterable[str]] = None,
+) -> List[QueryPlan]:
+    """
+    Run ``EXPLAIN QUERY PLAN`` for ``queries`` (default: every repository
+    query) against the schema on ``conn``.
+
+    Parameters are bound to NULL; the plan does not depend on their values.
+    A query that cannot be planned (missing table or column) gets an
+    ``error`` instead of details.
+    """
+    if queries is None:
+        queries = repository_queries(_table_columns(conn))
+
+    plans = []
+    for sql in queries:
+        plan = QueryPlan(sql)
+        try:
+            rows = conn.execute(f"EXPLAIN QUERY PLAN {sql}", (None,) * sql.count("?")).fetchall()
+            plan.details = [row[3] for row in rows]
+        except sqlite3.Error as e:
+            plan.error = str(e)
+        plans.append(plan)
+    return plans
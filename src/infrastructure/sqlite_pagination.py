@@ -0,0 +1,114 @@
+"""
+SQLite Keyset Pagination and Streaming
+
+``page_by_world`` / ``page_by_tenant`` for the SQLite repositories, executed
+as ``WHERE ... AND id > ? ORDER BY id LIMIT ?``. The derived
+``(tenant_id, world_id)`` / ``(tenant_id, ...)`` indexes (see
+``sqlite_indexes``) store the rowid as their last column, so SQLite seeks
+straight to the first id of the page instead of stepping over ``OFFSET``
+rows.
+
+``stream_by_world`` / ``stream_by_tenant`` run a single query and read it
+with ``fetchmany``, so only one batch of rows is materialised at a time.
+"""
+from typing import Any, Iterator, List, Optional, Sequence
+
+from src.domain.repositories.pagination import STREAM_BATCH_SIZE, CursorPaginationMixin
+from src.domain.value_objects.common import TenantId, EntityId
+
+
+class SQLiteKeysetPaginationMixin(CursorPaginationMixin):
+    """
+    Keyset pagination and streaming for SQLite repositories.
+
+    Uses the repository's ``_table`` and ``_row_mapper`` (see
+    :class:`SQLiteBulkMixin`). Without a ``_table``, or for tables that have
+    no ``world_id`` column, the scanning defaults from
+    :class:`CursorPaginationMixin` are used.
+    """
+
+    _table: Optional[str] = None
+    _row_mapper: str = "_row_to_entity"
+
+    def _table_columns(self) -> set:
+        columns = self.__dict__.get("_keyset_columns")
+        if columns is None:
+            with self.db.get_connection() as conn:
+                columns = {row[1] for row in conn.execute(f"PRAGMA table_info({self._table})")}
+            self._keyset_columns = columns
+        return columns
+
+    def _seek(
+        self,
+        where: str,
+        params: Sequence[Any],
+        after_id: Optional[EntityId],
+        limit: int,
+    ) -> List[Any]:
+        after = after_id.value if after_id is not None else 0
+        row_to_entity = getattr(self, self._row_mapper)
+        with self.db.get_connection() as conn:
+            rows = conn.execute(
+                f"SELECT * FROM {self._table} WHERE {where} AND id > ? ORDER BY id LIMIT ?",
+                (*params, after, limit),
+            ).fetchall()
+        entities = (row_to_entity(row) for row in rows)
+        return [entity for entity in entities if entity is not None]
+
+    def _stream(self, where: str, params: Sequence[Any], batch_size: int) -> Iterator[Any]:
+        row_to_entity = getattr(self, self._row_mapper)
+        with self.db.get_connection() as conn:
+            cursor = conn.execute(f"SELECT * FROM {self._table} WHERE {where} ORDER BY id", tuple(params))
+            try:
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        return
+                    for row in rows:
+                        entity = row_to_entity(row)
+                        if entity is not None:
+                            yield entity
+            finally:
+                cursor.close()
+
+    def stream_by_world(
+        self,
+        tenant_id: TenantId,
+        world_id: EntityId,
+        batch_size: int = STREAM_BATCH_SIZE,
+    ) -> Iterator[Any]:
+        if self._table is None or "world_id" not in self._table_columns():
+            return super().stream_by_world(tenant_id, world_id, batch_size)
+        return self._stream("world_id = ? AND tenant_id = ?", (world_id.value, tenant_id.value), batch_size)
+
+    def stream_by_tenant(
+        self,
+        tenant_id: TenantId,
+        batch_size: int = STREAM_BATCH_SIZE,
+    ) -> Iterator[Any]:
+        if self._table is None:
+            return super().stream_by_tenant(tenant_id, batch_size)
+        return self._stream("tenant_id = ?", (tenant_id.value,), batch_size)
+
+    def _page_after_world(
+        self,
+        tenant_id: TenantId,
+        world_id: EntityId,
+        after_id: Optional[EntityId],
+        limit: int,
+    ) -> List[Any]:
+        if self._table is None or "world_id" not in self._table_columns():
+            return super()._page_after_world(tenant_id, world_id, after_id, limit)
+        return self._seek(
+            "world_id = ? AND tenant_id = ?", (world_id.value, tenant_id.value), after_id, limit
+        )
+
+    def _page_after_tenant(
+        self,
+        tenant_id: TenantId,
+        after_id: Optional[EntityId],
+        limit: int,
+    ) -> List[Any]:
+        if self._table is None:
+            return super()._page_after_tenant(tenant_id, after_id, limit)
+        return self._seek("tenant_id = ?", (tenant_id.value,), after_id, limit)
@@ -0,0 +1,89 @@
+"""
+SQLite Unit of Work
+
+Groups calls to any number of SQLite repositories into one transaction.
+Repositories do not need to know about it: while a unit of work is active on
+a thread, ``SQLiteDatabase.get_connection()`` hands every repository the same
+connection and defers the commit to the unit of work.
+"""
+from typing import Callable, Optional
+
+from src.domain.exceptions import InvalidState
+from src.domain.repositories.unit_of_work import IUnitOfWork
+from src.infrastructure.sqlite_connection import SQLiteConnectionManager, Transaction
+
+
+class _UnitOfWorkAborted(Exception):
+    """Internal signal used to unwind the transaction scope on abort."""
+
+
+class SQLiteUnitOfWork(IUnitOfWork):
+    """
+    Unit of work backed by a single SQLite transaction.
+
+    A unit of work is bound to the thread that enters it. Entering a unit of
+    work while another is active on the same thread opens a savepoint, so the
+    inner block can fail without discarding the outer one.
+
+    Example:
+        db = SQLiteDatabase("lore_system.db")
+        world_repo = SQLiteWorldRepository(db)
+        character_repo = SQLiteCharacterRepository(db)
+
+        with SQLiteUnitOfWork(db):
+            world_repo.save(world)
+            for character in characters:
+                character.world_id = world.id
+                character_repo.save(character)
+    """
+
+    def __init__(self, db: SQLiteConnectionManager):
+        self.db = db
+        self._scope = None
+        self._transaction: Optional[Transaction] = None
+
+    @property
+    def is_active(self) -> bool:
+        return self._scope is not None
+
+    def begin(self) -> None:
+        if self._scope is not None:
+            raise InvalidState("Unit of work is already active")
+        scope = self.db.transaction()
+        self._transaction = scope.__enter__()
+        self._scope = scope
+
+    def commit(self) -> None:
+        transaction = self._require_active()
+        transaction.commit()
+        transaction.restart()
+
+    def rollback(self) -> None:
+        transaction = self._require_active()
+        transaction.rollback()
+        transaction.restart()
+
+    def complete(self) -> None:
+        scope = self._close()
+        scope.__exit__(None, None, None)
+
+    def abort(self) -> None:
+        scope = self._close()
+        try:
+            scope.__exit__(_UnitOfWorkAborted, _UnitOfWorkAborted(), None)
+        except _UnitOfWorkAborted:
+            pass
+
+    def on_commit(self, callback: Callable[[], None]) -> None:
+        self._require_active().on_commit(callback)
+
+    def _require_active(self) -> Transaction:
+        if self._transaction is None:
+            raise InvalidState("Unit of work is not active")
+        return self._transaction
+
+    def _close(self):
+        if self._scope is None:
+            raise InvalidState("Unit of work is not active")
+        scope, self._scope, self._transaction = self._scope, None, None
+        return scope
@@ -63,6 +63,7 @@ from src.domain.value_objects.common import (
     EventOutcome,
 )
 from src.domain.value_objects.ability import Ability, AbilityName, PowerLevel
+from src.infrastructure.in_memory_search import TextIndex
 
 
 # In-memory storage (in production, use actual repositories)
@@ -81,6 +82,8 @@ class InMemoryStorage:
         self.tags: Dict[str, Tag] = {}
         self.requirements: Dict[str, Requirement] = {}
         self._id_counter = 1
+        # Full-text index: (collection, id) -> name and descriptive text
+        self.search_index = TextIndex("name", "text")
     
     def _generate_id(self) -> str:
         """Generate a unique ID."""
@@ -90,38 +93,61 @@ class InMemoryStorage:
     def save_world(self, world: World) -> World:
         world.id = EntityId(self._generate_id())
         self.worlds[str(world.id)] = world
+        self.search_index.add(("worlds", str(world.id)), name=world.name, text=world.description)
         return world
     
     def save_character(self, character: Character) -> Character:
         character.id = EntityId(self._generate_id())
         self.characters[str(character.id)] = character
+        self.search_index.add(("characters", str(character.id)), name=character.name, text=character.backstory)
         return character
     
     def save_event(self, event: Event) -> Event:
         event.id = EntityId(self._generate_id())
         self.events[str(event.id)] = event
+        self.search_index.add(("events", str(event.id)), name=event.name, text=event.description)
         return event
     
     def save_item(self, item: Item) -> Item:
         item.id = EntityId(self._generate_id())
         self.items[str(item.id)] = item
+        self.search_index.add(("items", str(item.id)), name=item.name, text=item.description)
         return item
     
     def save_location(self, location: Location) -> Location:
         location.id = EntityId(self._generate_id())
         self.locations[str(location.id)] = location
+        self.search_index.add(("locations", str(location.id)), name=location.name, text=location.description)
         return location
     
     def save_quest(self, quest: Quest) -> Quest:
         quest.id = EntityId(self._generate_id())
         self.quests[str(quest.id)] = quest
+        self.search_index.add(("quests", str(quest.id)), name=quest.name, text=quest.description)
         return quest
     
     def save_note(self, note: Note) -> Note:
         note.id = EntityId(self._generate_id())
         self.notes[str(note.id)] = note
+        self.search_index.add(("notes", str(note.id)), name=note.title, text=note.content)
         return note
     
+    def remove(self, collection: str, entity_id: str) -> None:
+        """Delete an entity from a collection and the search index."""
+        del getattr(self, collection)[entity_id]
+        self.search_index.remove((collection, entity_id))
+
+    def search(self, query: str, limit: int = 50) -> Dict[str, List[tuple]]:
+        """Ranked full-text search; returns collection -> [(entity, snippet)]."""
+        results: Dict[str, List[tuple]] = {}
+        for key, _ in self.search_index.search(query, limit):
+            collection, entity_id = key
+            entity = getattr(self, collection)[entity_id]
+            results.setdefault(collection, []).append(
+                (entity, self.search_index.snippet(key, query, ["text", "name"]))
+            )
+        return results
+
     def save_tag(self, tag: Tag) -> Tag:
         tag.id = EntityId(self._generate_id())
         self.tags[str(tag.id)] = tag
@@ -830,30 +856,30 @@ def delete_world():
     
     to_delete_chars = [cid for cid, char in storage.characters.items() if str(char.world_id) == world_id]
     for cid in to_delete_chars:
-        del storage.characters[cid]
+        storage.remove("characters", cid)
         chars_deleted += 1
     
     to_delete_events = [eid for eid, event in storage.events.items() if str(event.world_id) == world_id]
     for eid in to_delete_events:
-        del storage.events[eid]
+        storage.remove("events", eid)
         events_deleted += 1
     
     to_delete_items = [iid for iid, item in storage.items.items() if str(item.world_id) == world_id]
     for iid in to_delete_items:
-        del storage.items[iid]
+        storage.remove("items", iid)
         items_deleted += 1
     
     to_delete_quests = [qid for qid, quest in storage.quests.items() if str(quest.world_id) == world_id]
     for qid in to_delete_quests:
-        del storage.quests[qid]
+        storage.remove("quests", qid)
         quests_deleted += 1
     
     to_delete_notes = [nid for nid, note in storage.notes.items() if str(note.world_id) == world_id]
     for nid in to_delete_notes:
-        del storage.notes[nid]
+        storage.remove("notes", nid)
         notes_deleted += 1
     
-    del storage.worlds[world_id]
+    storage.remove("worlds", world_id)
     
     print_success(f"World '{world.name}' deleted!")
     print_info(f"Cascade deleted: {chars_deleted} characters, {events_deleted} events, {items_deleted} items, {quests_deleted} quests, {notes_deleted} notes")
@@ -881,7 +907,7 @@ def delete_character():
         print_info("Deletion cancelled.")
         return
     
-    del storage.characters[char_id]
+    storage.remove("characters", char_id)
     print_success(f"Character '{char.name}' deleted!")
 
 
@@ -907,7 +933,7 @@ def delete_event():
         print_info("Deletion cancelled.")
         return
     
-    del storage.events[event_id]
+    storage.remove("events", event_id)
     print_success(f"Event '{event.name}' deleted!")
 
 
@@ -933,7 +959,7 @@ def delete_item():
         print_info("Deletion cancelled.")
         return
     
-    del storage.items[item_id]
+    storage.remove("items", item_id)
     print_success(f"Item '{item.name}' deleted!")
 
 
@@ -959,7 +985,7 @@ def delete_quest():
         print_info("Deletion cancelled.")
         return
     
-    del storage.quests[quest_id]
+    storage.remove("quests", quest_id)
     print_success(f"Quest '{quest.name}' deleted!")
 
 
@@ -985,7 +1011,7 @@ def delete_note():
         print_info("Deletion cancelled.")
         return
     
-    del storage.notes[note_id]
+    storage.remove("notes", note_id)
     print_success(f"Note '{note.title}' deleted!")
 
 
@@ -993,7 +1019,7 @@ def delete_note():
 
 def search_entities():
     """Search across all entity types."""
-    query = Prompt.ask("\nEnter search term").lower().strip()
+    query = Prompt.ask("\nEnter search term").strip()
     
     if not query:
         print_error("Search term cannot be empty")
@@ -1002,69 +1028,28 @@ def search_entities():
     console.print(f"\n[bold cyan]Searching for: '{query}'[/bold cyan]")
     console.print("=" * 50)
     
-    results_found = False
-    
-    # Search worlds
-    world_matches = [w for w in storage.worlds.values() 
-                     if query in str(w.name).lower() or query in str(w.description).lower()]
-    if world_matches:
-        results_found = True
-        console.print("\n[bold yellow]Worlds:[/bold yellow]")
-        for world in world_matches:
-            console.print(f"  • [cyan]{world.name}[/cyan] (ID: {world.id})")
-            console.print(f"    {str(world.description)[:60]}...")
-    
-    # Search characters
-    char_matches = [c for c in storage.characters.values()
-                    if query in str(c.name).lower() or query in str(c.backstory).lower()]
-    if char_matches:
-        results_found = True
-        console.print("\n[bold yellow]Characters:[/bold yellow]")
-        for char in char_matches:
-            console.print(f"  • [cyan]{char.name}[/cyan] (ID: {char.id})")
-            console.print(f"    {str(char.backstory)[:60]}...")
-    
-    # Search events
-    event_matches = [e for e in storage.events.values()
-                     if query in e.name.lower() or query in str(e.description).lower()]
-    if event_matches:
-        results_found = True
-        console.print("\n[bold yellow]Events:[/bold yellow]")
-        for event in event_matches:
-            console.print(f"  • [cyan]{event.name}[/cyan] (ID: {event.id})")
-            console.print(f"    {str(event.description)[:60]}...")
-    
-    # Search items
-    item_matches = [i for i in storage.items.values()
-                    if query in i.name.lower() or query in str(i.description).lower()]
-    if item_matches:
-        results_found = True
-        console.print("\n[bold yellow]Items:[/bold yellow]")
-        for item in item_matches:
-            console.print(f"  • [cyan]{item.name}[/cyan] (ID: {item.id})")
-            console.print(f"    {str(item.description)[:60]}...")
-    
-    # Search quests
-    quest_matches = [q for q in storage.quests.values()
-                     if query in q.name.lower() or query in str(q.description).lower()]
-    if quest_matches:
-        results_found = True
-        console.print("\n[bold yellow]Quests:[/bold yellow]")
-        for quest in quest_matches:
-            console.print(f"  • [cyan]{quest.name}[/cyan] (ID: {quest.id})")
-            console.print(f"    {str(quest.description)[:60]}...")
-    
-    # Search notes
-    note_matches = [n for n in storage.notes.values()
-                    if query in n.title.lower() or query in n.content.lower()]
-    if note_matches:
-        results_found = True
-        console.print("\n[bold yellow]Notes:[/bold yellow]")
-        for note in note_matches:
-            console.print(f"  • [cyan]{note.title}[/cyan] (ID: {note.id})")
-            console.print(f"    {note.content[:60]}...")
-    
-    if not results_found:
+    results = storage.search(query)
+    
+    sections = [
+        ("worlds", "Worlds", lambda w: w.name),
+        ("characters", "Characters", lambda c: c.name),
+        ("events", "Events", lambda e: e.name),
+        ("items", "Items", lambda i: i.name),
+        ("locations", "Locations", lambda l: l.name),
+        ("quests", "Quests", lambda q: q.name),
+        ("notes", "Notes", lambda n: n.title),
+    ]
+    for collection, title, name_of in sections:
+        matches = results.get(collection)
+        if not matches:
+            continue
+        console.print(f"\n[bold yellow]{title}:[/bold yellow]")
+        for entity, snippet in matches:
+            console.print(f"  • [cyan]{name_of(entity)}[/cyan] (ID: {entity.id})")
+            if snippet:
+                console.print(f"    {snippet}", markup=False)
+    
+    if not results:
         print_warning("No results found")
     else:
         console.print("\n" + "=" * 50)
@@ -0,0 +1,184 @@
+"""
+EntityCollection - an indexed list of entities for LoreData.
+
+``LoreData`` keeps one list per entity type, and the GUI looked entities up
+with ``next(c for c in lore_data.characters if c.id == ...)``: a linear scan
+per lookup. :class:`EntityCollection` is still a ``list`` (iteration,
+indexing, ``len``, ``== []`` and in-place edits behave exactly as before) but
+every mutation also maintains
+
+- an ``id -> entity`` map, for O(1) :meth:`get`;
+- secondary indexes on foreign keys (``world_id``, ``story_id``,
+  ``session_id`` by default), for O(1) :meth:`where` lookups.
+
+Indexes are keyed by the attribute values when an entity is added. If a
+foreign key is changed in place, call :meth:`reindex` for that entity.
+
+:attr:`EntityCollection.revision` increases on every mutation, so savers can
+tell which collections changed since they last wrote them. Edits made to an
+entity in place are not seen; call :meth:`touch` after them.
+"""
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_INDEXES: Tuple[str, ...] = ("world_id", "story_id", "session_id")
+
+
+class EntityCollection(List[T]):
+    """A list of entities with an id map and foreign-key indexes."""
+
+    def __init__(self, entities: Iterable[T] = (), indexes: Sequence[str] = DEFAULT_INDEXES):
+        super().__init__(entities)
+        self.indexes: Tuple[str, ...] = tuple(indexes)
+        self.revision = 0
+        self._rebuild()
+
+    def __reduce__(self):
+        return (self.__class__, (list(self), self.indexes))
+
+    # -- Lookups ----------------------------------------------------------
+
+    def get(self, entity_id: Any, default: Optional[T] = None) -> Optional[T]:
+        """The entity with ``entity_id``, or ``default``."""
+        return self._by_id.get(entity_id, default)
+
+    def where(self, field: str, value: Hashable) -> List[T]:
+        """Entities whose indexed ``field`` equals ``value``, in insertion order."""
+        return list(self._index(field).get(value, {}).values())
+
+    def count_where(self, field: str, value: Hashable) -> int:
+        return len(self._index(field).get(value, ()))
+
+    def first_where(self, field: str, value: Hashable) -> Optional[T]:
+        bucket = self._index(field).get(value)
+        return next(iter(bucket.values())) if bucket else None
+
+    def remove_id(self, entity_id: Any) -> Optional[T]:
+        """Remove and return the entity with ``entity_id`` (``None`` if absent)."""
+        entity = self._by_id.get(entity_id)
+        if entity is not None:
+            self.remove(entity)
+        return entity
+
+    def reindex(self, entity: T) -> None:
+        """Refresh the indexes of ``entity`` after its id or a foreign key changed in place."""
+        self._unindex(entity)
+        self._index_entity(entity)
+        self.touch()
+
+    def touch(self) -> None:
+        """Record a change made to an entity in place."""
+        self.revision += 1
+
+    # -- Index maintenance ------------------------------------------------
+
+    def _index(self, field: str) -> Dict[Hashable, Dict[int, T]]:
+        try:
+            return self._fields[field]
+        except KeyError:
+            raise KeyError(f"{field!r} is not indexed (indexes: {', '.join(self.indexes)})") from None
+
+    def _rebuild(self) -> None:
+        self._by_id: Dict[Any, T] = {}
+        self._fields: Dict[str, Dict[Hashable, Dict[int, T]]] = {field: {} for field in self.indexes}
+        # id(entity) -> (entity id, foreign key values) it was indexed under
+        self._keys: Dict[int, Tuple[Any, Tuple[Any, ...]]] = {}
+        for entity in self:
+            self._index_entity(entity)
+
+    def _index_entity(self, entity: T) -> None:
+        entity_id = getattr(entity, "id", None)
+        if entity_id is not None:
+            self._by_id[entity_id] = entity
+        values = tuple(getattr(entity, field, None) for field in self.indexes)
+        for field, value in zip(self.indexes, values):
+            if value is not None:
+                self._fields[field].setdefault(value, {})[id(entity)] = entity
+        self._keys[id(entity)] = (entity_id, values)
+
+    def _unindex(self, entity: T) -> None:
+        keys = self._keys.pop(id(entity), None)
+        if keys is None:
+            return
+        entity_id, values = keys
+        if entity_id is not None and self._by_id.get(entity_id) is entity:
+            del self._by_id[entity_id]
+        for field, value in zip(self.indexes, values):
+            if value is None:
+                continue
+            bucket = self._fields[field].get(value)
+            if bucket is not None:
+                bucket.pop(id(entity), None)
+                if not bucket:
+                    del self._fields[field][value]
+
+    # -- list mutators ----------------------------------------------------
+
+    def append(self, entity: T) -> None:
+        super().append(entity)
+        self._index_entity(entity)
+        self.touch()
+
+    def extend(self, entities: Iterable[T]) -> None:
+        entities = list(entities)
+        super().extend(entities)
+        for entity in entities:
+            self._index_entity(entity)
+        self.touch()
+
+    def __iadd__(self, entities: Iterable[T]) -> "EntityCollection[T]":
+        self.extend(entities)
+        return self
+
+    def insert(self, index: int, entity: T) -> None:
+        super().insert(index, entity)
+        self._index_entity(entity)
+        self.touch()
+
+    def remove(self, entity: T) -> None:
+        super().remove(entity)
+        self._unindex(entity)
+        self.touch()
+
+    def pop(self, index: int = -1) -> T:
+        entity = super().pop(index)
+        self._unindex(entity)
+        self.touch()
+        return entity
+
+    def clear(self) -> None:
+        super().clear()
+        self._rebuild()
+        self.touch()
+
+    def __setitem__(self, index, value) -> None:
+        if isinstance(index, slice):
+            super().__setitem__(index, value)
+            self._rebuild()
+            self.touch()
+            return
+        old = self[index]
+        super().__setitem__(index, value)
+        self._unindex(old)
+        self._index_entity(value)
+        self.touch()
+
+    def __delitem__(self, index) -> None:
+        if isinstance(index, slice):
+            super().__delitem__(index)
+            self._rebuild()
+            self.touch()
+            return
+        entity = self[index]
+        super().__delitem__(index)
+        self._unindex(entity)
+        self.touch()
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self.touch()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self.touch()
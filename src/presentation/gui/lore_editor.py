@@ -13,7 +13,7 @@ from typing import Optional, List, Dict, Any
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QTabWidget, QPushButton, QTableWidget, QTableWidgetItem,
+    QTabWidget, QPushButton,
     QFormLayout, QLineEdit, QTextEdit, QSpinBox, QComboBox,
     QLabel, QMessageBox, QFileDialog, QGroupBox, QListWidget, QListWidgetItem,
     QDialog, QDialogButtonBox, QInputDialog, QSplitter, QFrame,
@@ -139,10 +139,28 @@ from src.presentation.gui.tabs.model3d_tab import Model3DTab
 
 # Import LoreData from separate module
 from src.presentation.gui.lore_data import LoreData
+from src.presentation.gui.project_loader import ProjectLoader
+from src.presentation.gui.project_store import ProjectStore
 
 
 # Import AbilityDialog from separate module
 from src.presentation.gui.dialogs.ability_dialog import AbilityDialog
+from src.presentation.gui.table_models import Column, EntityTableModel, EntityTableView
+
+
+RARITY_COLORS = {
+    Rarity.COMMON: "#8B8B8B",
+    Rarity.UNCOMMON: "#4CAF50",
+    Rarity.RARE: "#2196F3",
+    Rarity.EPIC: "#9C27B0",
+    Rarity.LEGENDARY: "#FF9800",
+    Rarity.MYTHIC: "#F44336"
+}
+
+
+def _world_names(lore_data: LoreData) -> Dict[EntityId, str]:
+    """World names by ID, for table columns that show an entity's world."""
+    return {world.id: str(world.name) for world in lore_data.worlds}
 
 
 class WorldsTab(QWidget):
@@ -164,11 +182,14 @@ class WorldsTab(QWidget):
         layout.addWidget(title)
         
         # Worlds table
-        self.table = QTableWidget()
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels(["ID", "Name", "Description", "Version"])
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.table.itemSelectionChanged.connect(self._on_selection_changed)
+        self.model = EntityTableModel(lambda: self.lore_data.worlds, [
+            Column("ID", lambda world: world.id.value),
+            Column("Name", lambda world: world.name),
+            Column("Description", lambda world: str(world.description)[:50] + "..."),
+            Column("Version", lambda world: world.version),
+        ])
+        self.table = EntityTableView(self.model)
+        self.table.selectionModel().selectionChanged.connect(self._on_selection_changed)
         layout.addWidget(self.table)
         
         # Form
@@ -211,33 +232,18 @@ class WorldsTab(QWidget):
     
     def refresh(self):
         """Refresh the worlds table."""
-        self.table.setRowCount(0)
-        
-        for world in self.lore_data.worlds:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            
-            self.table.setItem(row, 0, QTableWidgetItem(str(world.id.value)))
-            self.table.setItem(row, 1, QTableWidgetItem(str(world.name)))
-            self.table.setItem(row, 2, QTableWidgetItem(str(world.description)[:50] + "..."))
-            self.table.setItem(row, 3, QTableWidgetItem(str(world.version)))
-        
+        self.model.reset()
         self.table.resizeColumnsToContents()
     
     def _on_selection_changed(self):
         """Handle world selection."""
-        selected_items = self.table.selectedItems()
-        if selected_items:
-            row = selected_items[0].row()
-            world_id = EntityId(int(self.table.item(row, 0).text()))
-            self.selected_world = self.lore_data.get_world_by_id(world_id)
-            
-            if self.selected_world:
-                self.name_input.setText(str(self.selected_world.name))
-                self.description_input.setPlainText(str(self.selected_world.description))
-                self.update_btn.setEnabled(True)
-                self.delete_btn.setEnabled(True)
-                self.world_selected.emit(world_id)
+        self.selected_world = self.table.selected_entity()
+        if self.selected_world:
+            self.name_input.setText(str(self.selected_world.name))
+            self.description_input.setPlainText(str(self.selected_world.description))
+            self.update_btn.setEnabled(True)
+            self.delete_btn.setEnabled(True)
+            self.world_selected.emit(self.selected_world.id)
         else:
             self.selected_world = None
             self.update_btn.setEnabled(False)
@@ -252,7 +258,7 @@ class WorldsTab(QWidget):
                 description=Description(self.description_input.toPlainText())
             )
             self.lore_data.add_world(world)
-            self.refresh()
+            self.model.rows_appended()
             self._clear_form()
             QMessageBox.information(self, "Success", "World created successfully!")
         except Exception as e:
@@ -266,7 +272,7 @@ class WorldsTab(QWidget):
         try:
             self.selected_world.rename(WorldName(self.name_input.text()))
             self.selected_world.update_description(Description(self.description_input.toPlainText()))
-            self.refresh()
+            self.model.entity_changed(self.selected_world)
             QMessageBox.information(self, "Success", "World updated successfully!")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to update world: {e}")
@@ -283,8 +289,7 @@ class WorldsTab(QWidget):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            self.lore_data.worlds.remove(self.selected_world)
-            self.refresh()
+            self.model.remove_entity(self.selected_world)
             self._clear_form()
             QMessageBox.information(self, "Success", "World deleted successfully!")
     
@@ -313,11 +318,16 @@ class CharactersTab(QWidget):
         layout.addWidget(title)
         
         # Characters table
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels(["ID", "Name", "World", "Abilities", "Status"])
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.table.itemSelectionChanged.connect(self._on_selection_changed)
+        self.world_names: Dict[EntityId, str] = {}
+        self.model = EntityTableModel(lambda: self.lore_data.characters, [
+            Column("ID", lambda character: character.id.value),
+            Column("Name", lambda character: character.name),
+            Column("World", lambda character: self.world_names.get(character.world_id, "Unknown")),
+            Column("Abilities", lambda character: character.ability_count()),
+            Column("Status", lambda character: character.status.value),
+        ])
+        self.table = EntityTableView(self.model)
+        self.table.selectionModel().selectionChanged.connect(self._on_selection_changed)
         layout.addWidget(self.table)
         
         # Form
@@ -385,19 +395,8 @@ class CharactersTab(QWidget):
     
     def refresh(self):
         """Refresh the characters table and world combo."""
-        self.table.setRowCount(0)
-        
-        for character in self.lore_data.characters:
-            world = self.lore_data.get_world_by_id(character.world_id)
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            
-            self.table.setItem(row, 0, QTableWidgetItem(str(character.id.value)))
-            self.table.setItem(row, 1, QTableWidgetItem(str(character.name)))
-            self.table.setItem(row, 2, QTableWidgetItem(str(world.name) if world else "Unknown"))
-            self.table.setItem(row, 3, QTableWidgetItem(str(character.ability_count())))
-            self.table.setItem(row, 4, QTableWidgetItem(character.status.value))
-        
+        self.world_names = _world_names(self.lore_data)
+        self.model.reset()
         self.table.resizeColumnsToContents()
         
         # Update world combo
@@ -407,28 +406,23 @@ class CharactersTab(QWidget):
     
     def _on_selection_changed(self):
         """Handle character selection."""
-        selected_items = self.table.selectedItems()
-        if selected_items:
-            row = selected_items[0].row()
-            character_id = EntityId(int(self.table.item(row, 0).text()))
-            self.selected_character = next((c for c in self.lore_data.characters if c.id == character_id), None)
+        self.selected_character = self.table.selected_entity()
+        if self.selected_character:
+            # Update form
+            world_idx = self.world_combo.findData(self.selected_character.world_id.value)
+            if world_idx >= 0:
+                self.world_combo.setCurrentIndex(world_idx)
             
-            if self.selected_character:
-                # Update form
-                world_idx = self.world_combo.findData(self.selected_character.world_id.value)
-                if world_idx >= 0:
-                    self.world_combo.setCurrentIndex(world_idx)
-                
-                self.name_input.setText(str(self.selected_character.name))
-                self.backstory_input.setPlainText(str(self.selected_character.backstory))
-                self.status_combo.setCurrentText(self.selected_character.status.value)
-                
-                # Update abilities list
-                self.current_abilities = list(self.selected_character.abilities)
-                self._refresh_abilities_list()
-                
-                self.update_btn.setEnabled(True)
-                self.delete_btn.setEnabled(True)
+            self.name_input.setText(str(self.selected_character.name))
+            self.backstory_input.setPlainText(str(self.selected_character.backstory))
+            self.status_combo.setCurrentText(self.selected_character.status.value)
+            
+            # Update abilities list
+            self.current_abilities = list(self.selected_character.abilities)
+            self._refresh_abilities_list()
+            
+            self.update_btn.setEnabled(True)
+            self.delete_btn.setEnabled(True)
         else:
             self.selected_character = None
             self.update_btn.setEnabled(False)
@@ -470,7 +464,7 @@ class CharactersTab(QWidget):
                 status=CharacterStatus(self.status_combo.currentText())
             )
             self.lore_data.add_character(character)
-            self.refresh()
+            self.model.rows_appended()
             self._clear_form()
             QMessageBox.information(self, "Success", "Character created successfully!")
         except Exception as e:
@@ -498,11 +492,10 @@ class CharactersTab(QWidget):
                 version=self.selected_character.version.increment()
             )
             
-            # Replace in list
-            idx = self.lore_data.characters.index(self.selected_character)
-            self.lore_data.characters[idx] = updated_character
+            # Replace in list, keeping the row
+            self.model.replace_entity(self.selected_character, updated_character)
+            self.selected_character = updated_character
             
-            self.refresh()
             QMessageBox.information(self, "Success", "Character updated successfully!")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to update character: {e}")
@@ -519,8 +512,7 @@ class CharactersTab(QWidget):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            self.lore_data.characters.remove(self.selected_character)
-            self.refresh()
+            self.model.remove_entity(self.selected_character)
             self._clear_form()
             QMessageBox.information(self, "Success", "Character deleted successfully!")
     
@@ -550,11 +542,19 @@ class EventsTab(QWidget):
         layout.addWidget(title)
         
         # Events table
-        self.table = QTableWidget()
-        self.table.setColumnCount(6)
-        self.table.setHorizontalHeaderLabels(["ID", "Name", "World", "Start Date", "End Date", "Outcome"])
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.table.itemSelectionChanged.connect(self._on_selection_changed)
+        self.world_names: Dict[EntityId, str] = {}
+        self.model = EntityTableModel(lambda: self.lore_data.events, [
+            Column("ID", lambda event: event.id.value),
+            Column("Name", lambda event: event.name),
+            Column("World", lambda event: self.world_names.get(event.world_id, "Unknown")),
+            Column("Start Date", lambda event: event.date_range.start_date.value.strftime("%Y-%m-%d")),
+            Column("End Date", lambda event: (
+                event.date_range.end_date.value.strftime("%Y-%m-%d") if event.date_range.end_date else ""
+            )),
+            Column("Outcome", lambda event: event.outcome.value),
+        ])
+        self.table = EntityTableView(self.model)
+        self.table.selectionModel().selectionChanged.connect(self._on_selection_changed)
         layout.addWidget(self.table)
         
         # Form
@@ -628,21 +628,8 @@ class EventsTab(QWidget):
     
     def refresh(self):
         """Refresh the events table and world combo."""
-        self.table.setRowCount(0)
-        
-        for event in self.lore_data.events:
-            world = self.lore_data.get_world_by_id(event.world_id)
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            
-            self.table.setItem(row, 0, QTableWidgetItem(str(event.id.value)))
-            self.table.setItem(row, 1, QTableWidgetItem(event.name))
-            self.table.setItem(row, 2, QTableWidgetItem(str(world.name) if world else "Unknown"))
-            self.table.setItem(row, 3, QTableWidgetItem(event.date_range.start_date.value.strftime("%Y-%m-%d")))
-            end_date = event.date_range.end_date.value.strftime("%Y-%m-%d") if event.date_range.end_date else ""
-            self.table.setItem(row, 4, QTableWidgetItem(end_date))
-            self.table.setItem(row, 5, QTableWidgetItem(event.outcome.value))
-        
+        self.world_names = _world_names(self.lore_data)
+        self.model.reset()
         self.table.resizeColumnsToContents()
         
         # Update world combo
@@ -652,30 +639,25 @@ class EventsTab(QWidget):
     
     def _on_selection_changed(self):
         """Handle event selection."""
-        selected_items = self.table.selectedItems()
-        if selected_items:
-            row = selected_items[0].row()
-            event_id = EntityId(int(self.table.item(row, 0).text()))
-            self.selected_event = next((e for e in self.lore_data.events if e.id == event_id), None)
+        self.selected_event = self.table.selected_entity()
+        if self.selected_event:
+            # Update form
+            world_idx = self.world_combo.findData(self.selected_event.world_id.value)
+            if world_idx >= 0:
+                self.world_combo.setCurrentIndex(world_idx)
             
-            if self.selected_event:
-                # Update form
-                world_idx = self.world_combo.findData(self.selected_event.world_id.value)
-                if world_idx >= 0:
-                    self.world_combo.setCurrentIndex(world_idx)
-                
-                self.name_input.setText(self.selected_event.name)
-                self.description_input.setPlainText(str(self.selected_event.description))
-                self.start_date_input.setText(self.selected_event.date_range.start_date.value.strftime("%Y-%m-%d"))
-                end_date = self.selected_event.date_range.end_date.value.strftime("%Y-%m-%d") if self.selected_event.date_range.end_date else ""
-                self.end_date_input.setText(end_date)
-                self.outcome_combo.setCurrentText(self.selected_event.outcome.value)
-                
-                # Update participants list
-                self._refresh_participants_list()
-                
-                self.update_btn.setEnabled(True)
-                self.delete_btn.setEnabled(True)
+            self.name_input.setText(self.selected_event.name)
+            self.description_input.setPlainText(str(self.selected_event.description))
+            self.start_date_input.setText(self.selected_event.date_range.start_date.value.strftime("%Y-%m-%d"))
+            end_date = self.selected_event.date_range.end_date.value.strftime("%Y-%m-%d") if self.selected_event.date_range.end_date else ""
+            self.end_date_input.setText(end_date)
+            self.outcome_combo.setCurrentText(self.selected_event.outcome.value)
+            
+            # Update participants list
+            self._refresh_participants_list()
+            
+            self.update_btn.setEnabled(True)
+            self.delete_btn.setEnabled(True)
         else:
             self.selected_event = None
             self.update_btn.setEnabled(False)
@@ -686,7 +668,7 @@ class EventsTab(QWidget):
         self.participants_list.clear()
         if self.selected_event:
             for participant_id in self.selected_event.participant_ids:
-                character = next((c for c in self.lore_data.characters if c.id == participant_id), None)
+                character = self.lore_data.characters.get(participant_id)
                 name = str(character.name) if character else f"Unknown (ID: {participant_id.value})"
                 self.participants_list.addItem(name)
     
@@ -694,7 +676,7 @@ class EventsTab(QWidget):
         """Add a participant to the event."""
         # Get available characters from selected world
         world_id = EntityId(self.world_combo.currentData())
-        available_characters = [c for c in self.lore_data.characters if c.world_id == world_id]
+        available_characters = self.lore_data.characters.where('world_id', world_id)
         
         if not available_characters:
             QMessageBox.information(self, "No Characters", "No characters available in selected world.")
@@ -741,7 +723,7 @@ class EventsTab(QWidget):
                 participant_ids=[]  # Start with no participants
             )
             self.lore_data.add_event(event)
-            self.refresh()
+            self.model.rows_appended()
             self._clear_form()
             QMessageBox.information(self, "Success", "Event created successfully!")
         except Exception as e:
@@ -773,11 +755,10 @@ class EventsTab(QWidget):
                 version=self.selected_event.version.increment()
             )
             
-            # Replace in list
-            idx = self.lore_data.events.index(self.selected_event)
-            self.lore_data.events[idx] = updated_event
+            # Replace in list, keeping the row
+            self.model.replace_entity(self.selected_event, updated_event)
+            self.selected_event = updated_event
             
-            self.refresh()
             QMessageBox.information(self, "Success", "Event updated successfully!")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to update event: {e}")
@@ -794,8 +775,7 @@ class EventsTab(QWidget):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            self.lore_data.events.remove(self.selected_event)
-            self.refresh()
+            self.model.remove_entity(self.selected_event)
             self._clear_form()
             QMessageBox.information(self, "Success", "Event deleted successfully!")
     
@@ -826,11 +806,16 @@ class ImprovementsTab(QWidget):
         layout.addWidget(title)
         
         # Improvements table
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels(["ID", "Entity", "Suggestion", "Status", "Created"])
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.table.itemSelectionChanged.connect(self._on_selection_changed)
+        self.entity_names: Dict[str, Dict[EntityId, str]] = {}
+        self.model = EntityTableModel(lambda: self.lore_data.improvements, [
+            Column("ID", lambda improvement: improvement.id.value),
+            Column("Entity", lambda improvement: self._get_entity_name(improvement.entity_type, improvement.entity_id)),
+            Column("Suggestion", lambda improvement: improvement.suggestion[:50] + "..."),
+            Column("Status", lambda improvement: improvement.status.value),
+            Column("Created", lambda improvement: improvement.created_at.value.strftime("%Y-%m-%d")),
+        ])
+        self.table = EntityTableView(self.model)
+        self.table.selectionModel().selectionChanged.connect(self._on_selection_changed)
         layout.addWidget(self.table)
         
         # Form
@@ -888,80 +873,61 @@ class ImprovementsTab(QWidget):
         """Update entity combo based on selected type."""
         entity_type = self.entity_type_combo.currentText()
         self.entity_combo.clear()
+        world_names = _world_names(self.lore_data)
         
         if entity_type == "world":
             for world in self.lore_data.worlds:
                 self.entity_combo.addItem(f"World: {world.name}", (entity_type, world.id.value))
         elif entity_type == "character":
             for character in self.lore_data.characters:
-                world = self.lore_data.get_world_by_id(character.world_id)
-                world_name = world.name if world else "Unknown"
+                world_name = world_names.get(character.world_id, "Unknown")
                 self.entity_combo.addItem(f"Character: {character.name} ({world_name})", (entity_type, character.id.value))
         elif entity_type == "event":
             for event in self.lore_data.events:
-                world = self.lore_data.get_world_by_id(event.world_id)
-                world_name = world.name if world else "Unknown"
+                world_name = world_names.get(event.world_id, "Unknown")
                 self.entity_combo.addItem(f"Event: {event.name} ({world_name})", (entity_type, event.id.value))
     
     def refresh(self):
         """Refresh the improvements table."""
-        self.table.setRowCount(0)
-        
-        for improvement in self.lore_data.improvements:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            
-            # Find entity name
-            entity_name = self._get_entity_name(improvement.entity_type, improvement.entity_id)
-            
-            self.table.setItem(row, 0, QTableWidgetItem(str(improvement.id.value)))
-            self.table.setItem(row, 1, QTableWidgetItem(entity_name))
-            self.table.setItem(row, 2, QTableWidgetItem(improvement.suggestion[:50] + "..."))
-            self.table.setItem(row, 3, QTableWidgetItem(improvement.status.value))
-            self.table.setItem(row, 4, QTableWidgetItem(improvement.created_at.value.strftime("%Y-%m-%d")))
-        
+        self.entity_names = {
+            "world": _world_names(self.lore_data),
+            "character": {character.id: str(character.name) for character in self.lore_data.characters},
+            "event": {event.id: event.name for event in self.lore_data.events},
+        }
+        self.model.reset()
         self.table.resizeColumnsToContents()
     
     def _get_entity_name(self, entity_type: EntityType, entity_id: EntityId) -> str:
         """Get display name for entity."""
-        if entity_type.value == "world":
-            world = self.lore_data.get_world_by_id(entity_id)
-            return f"World: {world.name}" if world else "Unknown World"
-        elif entity_type.value == "character":
-            character = next((c for c in self.lore_data.characters if c.id == entity_id), None)
-            return f"Character: {character.name}" if character else "Unknown Character"
-        elif entity_type.value == "event":
-            event = next((e for e in self.lore_data.events if e.id == entity_id), None)
-            return f"Event: {event.name}" if event else "Unknown Event"
-        return "Unknown"
+        names = self.entity_names.get(entity_type.value)
+        if names is None:
+            return "Unknown"
+        label = entity_type.value.capitalize()
+        name = names.get(entity_id)
+        return f"{label}: {name}" if name is not None else f"Unknown {label}"
     
     def _on_selection_changed(self):
         """Handle improvement selection."""
-        selected_items = self.table.selectedItems()
-        if selected_items:
-            row = selected_items[0].row()
-            improvement_id = EntityId(int(self.table.item(row, 0).text()))
-            self.selected_improvement = next((i for i in self.lore_data.improvements if i.id == improvement_id), None)
+        self.selected_improvement = self.table.selected_entity()
+        if self.selected_improvement:
+            # Update form
+            entity_type_idx = self.entity_type_combo.findText(self.selected_improvement.entity_type.value)
+            if entity_type_idx >= 0:
+                self.entity_type_combo.setCurrentIndex(entity_type_idx)
+                self._update_entity_combo()
             
-            if self.selected_improvement:
-                # Update form
-                entity_type_idx = self.entity_type_combo.findText(self.selected_improvement.entity_type.value)
-                if entity_type_idx >= 0:
-                    self.entity_type_combo.setCurrentIndex(entity_type_idx)
-                    self._update_entity_combo()
-                
-                # Find entity in combo
-                for i in range(self.entity_combo.count()):
-                    entity_data = self.entity_combo.itemData(i)
-                    if entity_data and entity_data[1] == self.selected_improvement.entity_id.value:
-                        self.entity_combo.setCurrentIndex(i)
-                        break
-                
-                self.suggestion_input.setPlainText(self.selected_improvement.suggestion)
-                self.status_combo.setCurrentText(self.selected_improvement.status.value)
-                
-                self.update_btn.setEnabled(True)
-                self.delete_btn.setEnabled(True)
+            # Find entity in combo
+            for i in range(self.entity_combo.count()):
+                entity_data = self.entity_combo.itemData(i)
+                if entity_data and entity_data[1] == self.selected_improvement.entity_id.value:
+                    self.entity_combo.setCurrentIndex(i)
+                    break
+            
+            self.suggestion_input.setPlainText(self.selected_improvement.suggestion)
+            self.status_combo.setCurrentText(self.selected_improvement.status.value)
+            
+            self.update_btn.setEnabled(True)
+            self.delete_btn.setEnabled(True)
         else:
             self.selected_improvement = None
             self.update_btn.setEnabled(False)
@@ -985,7 +951,7 @@ class ImprovementsTab(QWidget):
                 git_commit_hash=__import__('src.domain.value_objects.common', fromlist=['GitCommitHash']).GitCommitHash("temp_commit_hash")
             )
             self.lore_data.add_improvement(improvement)
-            self.refresh()
+            self.model.rows_appended()
             self._clear_form()
             QMessageBox.information(self, "Success", "Improvement proposed successfully!")
         except Exception as e:
@@ -1007,7 +973,7 @@ class ImprovementsTab(QWidget):
             elif new_status.value == "rejected":
                 self.selected_improvement.reject()
             
-            self.refresh()
+            self.model.entity_changed(self.selected_improvement)
             QMessageBox.information(self, "Success", "Improvement updated successfully!")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to update improvement: {e}")
@@ -1024,8 +990,7 @@ class ImprovementsTab(QWidget):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            self.lore_data.improvements.remove(self.selected_improvement)
-            self.refresh()
+            self.model.remove_entity(self.selected_improvement)
             self._clear_form()
             QMessageBox.information(self, "Success", "Improvement deleted successfully!")
     
@@ -1044,7 +1009,7 @@ class ItemsTab(QWidget):
         super().__init__()
         self.lore_data = lore_data
         self.selected_item: Optional[Item] = None
-        self.all_items: List[Item] = []  # Store all items for filtering
+        self.world_names: Dict[EntityId, str] = {}
         self._setup_ui()
         self.refresh()
 
@@ -1097,18 +1062,26 @@ class ItemsTab(QWidget):
         left_widget.setLayout(left_layout)
 
         # Table
-        self.table = QTableWidget()
-        self.table.setColumnCount(6)
-        self.table.setHorizontalHeaderLabels([
-            "ID", "World", "Name", "Type", "Rarity", "Description"
+        self.model = EntityTableModel(lambda: self.lore_data.items, [
+            Column("ID", lambda item: item.id.value if item.id else ""),
+            Column("World", lambda item: (
+                f"🌍 {self.world_names[item.world_id]}" if item.world_id in self.world_names else "🏠 Unknown"
+            )),
+            Column("Name", lambda item: item.name),
+            Column("Type", lambda item: item.item_type.value),
+            Column(
+                "Rarity",
+                lambda item: item.rarity.value if item.rarity else "No Rarity",
+                color=lambda item: RARITY_COLORS.get(item.rarity, "#FFFFFF") if item.rarity else None,
+            ),
+            Column("Description", lambda item: item.description),
         ])
+        self.table = EntityTableView(self.model)
         self.table.horizontalHeader().setStretchLastSection(True)
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
         self.table.setAlternatingRowColors(True)
-        self.table.setSortingEnabled(True)
-        self.table.itemSelectionChanged.connect(self._on_item_selected)
+        self.table.selectionModel().selectionChanged.connect(self._on_item_selected)
         self.table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 selection-background-color: #4a6cd4;
                 alternate-background-color: #2a2a2a;
             }
@@ -1228,7 +1201,7 @@ class ItemsTab(QWidget):
 
     def _show_context_menu(self, position):
         """Show context menu for table."""
-        if not self.table.itemAt(position):
+        if not self.table.indexAt(position).isValid():
             return
 
         menu = QMenu()
@@ -1273,7 +1246,7 @@ class ItemsTab(QWidget):
             )
 
             self.lore_data.add_item(duplicate_item)
-            self.refresh()
+            self.model.rows_appended()
 
             QMessageBox.information(
                 self, "Success",
@@ -1285,8 +1258,11 @@ class ItemsTab(QWidget):
     
     def refresh(self):
         """Refresh the table with current data."""
-        self.all_items = self.lore_data.items.copy()
+        self.world_names = _world_names(self.lore_data)
+        self.model.reset()
         self._apply_filter()
+        self.table.resizeColumnsToContents()
+        self.table.horizontalHeader().setStretchLastSection(True)
 
         # Update world combo
         self.world_combo.clear()
@@ -1304,8 +1280,11 @@ class ItemsTab(QWidget):
         type_filter = self.type_filter.currentData()
         rarity_filter = self.rarity_filter.currentData()
 
-        filtered_items = []
-        for item in self.all_items:
+        if not (search_text or type_filter or rarity_filter):
+            self.table.proxy.set_predicate(None)
+            return
+
+        def matches(item: Item) -> bool:
             # Text search
             text_match = (
                 search_text in item.name.lower() or
@@ -1325,79 +1304,21 @@ class ItemsTab(QWidget):
             else:
                 rarity_match = True
 
-            if text_match and type_match and rarity_match:
-                filtered_items.append(item)
-
-        self._populate_table(filtered_items)
-
-    def _populate_table(self, items: List[Item]):
-        """Populate table with filtered items."""
-        self.table.setRowCount(0)
-
-        for item in items:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-
-            world = self.lore_data.get_world_by_id(item.world_id)
-            world_name = f"🌍 {world.name}" if world else "🏠 Unknown"
-
-            # Color code rarity
-            rarity_text = ""
-            if item.rarity:
-                rarity_colors = {
-                    Rarity.COMMON: "#8B8B8B",
-                    Rarity.UNCOMMON: "#4CAF50",
-                    Rarity.RARE: "#2196F3",
-                    Rarity.EPIC: "#9C27B0",
-                    Rarity.LEGENDARY: "#FF9800",
-                    Rarity.MYTHIC: "#F44336"
-                }
-                color = rarity_colors.get(item.rarity, "#FFFFFF")
-                rarity_text = f'<span style="color: {color};">{item.rarity.value}</span>'
-
-            self.table.setItem(row, 0, QTableWidgetItem(str(item.id.value if item.id else "")))
-            self.table.setItem(row, 1, QTableWidgetItem(world_name))
-            self.table.setItem(row, 2, QTableWidgetItem(item.name))
-            self.table.setItem(row, 3, QTableWidgetItem(item.item_type.value))
-            self.table.setItem(row, 4, QTableWidgetItem(rarity_text if rarity_text else "No Rarity"))
-            self.table.setItem(row, 5, QTableWidgetItem(str(item.description)))
-
-            # Make rarity column rich text
-            if rarity_text:
-                self.table.item(row, 4).setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-
-        # Resize columns to content
-        self.table.resizeColumnsToContents()
-        self.table.horizontalHeader().setStretchLastSection(True)
+            return bool(text_match and type_match and rarity_match)
+
+        self.table.proxy.set_predicate(matches)
     
     def _on_item_selected(self):
         """Handle item selection."""
-        selected_rows = set()
-        for item in self.table.selectedItems():
-            selected_rows.add(item.row())
-
-        if len(selected_rows) == 1:
-            row = list(selected_rows)[0]
-            item_id_text = self.table.item(row, 0).text()
-            if item_id_text:
-                item_id = int(item_id_text)
-                self.selected_item = next(
-                    (i for i in self.all_items if i.id and i.id.value == item_id),
-                    None
-                )
-
-                if self.selected_item:
-                    self._load_item(self.selected_item)
-                    self.edit_btn.setEnabled(True)
-                    self.delete_btn.setEnabled(True)
-                    self.duplicate_btn.setEnabled(True)
-                    self.item_selected.emit(self.selected_item.id)
-                else:
-                    self._clear_form()
-            else:
-                self._clear_form()
+        self.selected_item = self.table.selected_entity()
+        if self.selected_item:
+            self._load_item(self.selected_item)
+            self.edit_btn.setEnabled(True)
+            self.delete_btn.setEnabled(True)
+            self.duplicate_btn.setEnabled(True)
+            if self.selected_item.id:
+                self.item_selected.emit(self.selected_item.id)
         else:
-            self.selected_item = None
             self.edit_btn.setEnabled(False)
             self.delete_btn.setEnabled(False)
             self.duplicate_btn.setEnabled(False)
@@ -1528,6 +1449,7 @@ class ItemsTab(QWidget):
                 self.selected_item.update_description(Description(description))
                 self.selected_item.change_type(item_type)
                 self.selected_item.set_rarity(rarity)
+                self.model.entity_changed(self.selected_item)
 
                 operation = "updated"
             else:
@@ -1541,10 +1463,10 @@ class ItemsTab(QWidget):
                     rarity=rarity
                 )
                 self.lore_data.add_item(item)
+                self.model.rows_appended()
 
                 operation = "created"
 
-            self.refresh()
             self._clear_form()
 
             # Show success message with item details
@@ -1589,13 +1511,13 @@ class ItemsTab(QWidget):
 
         if msg_box.exec() == QMessageBox.StandardButton.Yes:
             try:
-                self.lore_data.items.remove(self.selected_item)
-                self.refresh()
+                name = self.selected_item.name
+                self.model.remove_entity(self.selected_item)
                 self._clear_form()
 
                 QMessageBox.information(
                     self, "Success",
-                    f"Item '{self.selected_item.name}' deleted successfully!"
+                    f"Item '{name}' deleted successfully!"
                 )
 
             except Exception as e:
@@ -1627,14 +1549,18 @@ class QuestsTab(QWidget):
         self.setLayout(layout)
 
         # Table
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels([
-            "ID", "World", "Name", "Status", "Objectives"
+        self.world_names: Dict[EntityId, str] = {}
+        self.model = EntityTableModel(lambda: self.lore_data.quests, [
+            Column("ID", lambda quest: quest.id.value),
+            Column("World", lambda quest: self.world_names.get(quest.world_id, "Unknown")),
+            Column("Name", lambda quest: quest.name),
+            Column("Status", lambda quest: quest.status.value),
+            # Show the first 2 objectives
+            Column("Objectives", lambda quest: "; ".join(quest.objectives[:2]) + ("..." if len(quest.objectives) > 2 else "")),
         ])
+        self.table = EntityTableView(self.model)
         self.table.horizontalHeader().setStretchLastSection(True)
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.table.itemSelectionChanged.connect(self._on_quest_selected)
+        self.table.selectionModel().selectionChanged.connect(self._on_quest_selected)
 
         # Buttons
         button_layout = QHBoxLayout()
@@ -1657,31 +1583,16 @@ class QuestsTab(QWidget):
 
     def refresh(self):
         """Refresh the table with current quests."""
-        self.table.setRowCount(0)
-        for quest in self.lore_data.quests:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            
-            self.table.setItem(row, 0, QTableWidgetItem(str(quest.id.value)))
-            world = self.lore_data.get_world_by_id(quest.world_id)
-            world_name = str(world.name) if world else "Unknown"
-            self.table.setItem(row, 1, QTableWidgetItem(world_name))
-            self.table.setItem(row, 2, QTableWidgetItem(quest.name))
-            self.table.setItem(row, 3, QTableWidgetItem(quest.status.value))
-            objectives_text = "; ".join(quest.objectives[:2])  # Show first 2 objectives
-            if len(quest.objectives) > 2:
-                objectives_text += "..."
-            self.table.setItem(row, 4, QTableWidgetItem(objectives_text))
+        self.world_names = _world_names(self.lore_data)
+        self.model.reset()
 
     def _on_quest_selected(self):
         """Handle quest selection."""
-        current_row = self.table.currentRow()
-        if current_row >= 0:
-            quest_id = int(self.table.item(current_row, 0).text())
-            self.selected_quest = next((q for q in self.lore_data.quests if q.id.value == quest_id), None)
+        self.selected_quest = self.table.selected_entity()
+        if self.selected_quest:
             self.edit_btn.setEnabled(True)
             self.delete_btn.setEnabled(True)
-            self.quest_selected.emit(EntityId(quest_id))
+            self.quest_selected.emit(self.selected_quest.id)
         else:
             self.selected_quest = None
             self.edit_btn.setEnabled(False)
@@ -1697,7 +1608,7 @@ class QuestsTab(QWidget):
         world = self.lore_data.worlds[0]  # Use first world
         
         # Check if there are characters in this world
-        characters_in_world = [c for c in self.lore_data.characters if c.world_id == world.id]
+        characters_in_world = self.lore_data.characters.where('world_id', world.id)
         if not characters_in_world:
             QMessageBox.warning(
                 self, "No Characters", 
@@ -1723,7 +1634,7 @@ class QuestsTab(QWidget):
             version=__import__('src.domain.value_objects.common', fromlist=['Version']).Version(1)
         )
         self.lore_data.add_quest(quest)
-        self.refresh()
+        self.model.rows_appended()
 
     def _edit_quest(self):
         """Edit selected quest."""
@@ -1734,8 +1645,7 @@ class QuestsTab(QWidget):
     def _delete_quest(self):
         """Delete selected quest."""
         if self.selected_quest:
-            self.lore_data.quests.remove(self.selected_quest)
-            self.refresh()
+            self.model.remove_entity(self.selected_quest)
 
 
 class StorylinesTab(QWidget):
@@ -1756,14 +1666,16 @@ class StorylinesTab(QWidget):
         self.setLayout(layout)
 
         # Table
-        self.table = QTableWidget()
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels([
-            "ID", "World", "Name", "Type"
+        self.world_names: Dict[EntityId, str] = {}
+        self.model = EntityTableModel(lambda: self.lore_data.storylines, [
+            Column("ID", lambda storyline: storyline.id.value),
+            Column("World", lambda storyline: self.world_names.get(storyline.world_id, "Unknown")),
+            Column("Name", lambda storyline: storyline.name),
+            Column("Type", lambda storyline: storyline.storyline_type.value),
         ])
+        self.table = EntityTableView(self.model)
         self.table.horizontalHeader().setStretchLastSection(True)
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.table.itemSelectionChanged.connect(self._on_storyline_selected)
+        self.table.selectionModel().selectionChanged.connect(self._on_storyline_selected)
 
         # Buttons
         button_layout = QHBoxLayout()
@@ -1786,27 +1698,16 @@ class StorylinesTab(QWidget):
 
     def refresh(self):
         """Refresh the table with current storylines."""
-        self.table.setRowCount(0)
-        for storyline in self.lore_data.storylines:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            
-            self.table.setItem(row, 0, QTableWidgetItem(str(storyline.id.value)))
-            world = self.lore_data.get_world_by_id(storyline.world_id)
-            world_name = str(world.name) if world else "Unknown"
-            self.table.setItem(row, 1, QTableWidgetItem(world_name))
-            self.table.setItem(row, 2, QTableWidgetItem(storyline.name))
-            self.table.setItem(row, 3, QTableWidgetItem(storyline.storyline_type.value))
+        self.world_names = _world_names(self.lore_data)
+        self.model.reset()
 
     def _on_storyline_selected(self):
         """Handle storyline selection."""
-        current_row = self.table.currentRow()
-        if current_row >= 0:
-            storyline_id = int(self.table.item(current_row, 0).text())
-            self.selected_storyline = next((s for s in self.lore_data.storylines if s.id.value == storyline_id), None)
+        self.selected_storyline = self.table.selected_entity()
+        if self.selected_storyline:
             self.edit_btn.setEnabled(True)
             self.delete_btn.setEnabled(True)
-            self.storyline_selected.emit(EntityId(storyline_id))
+            self.storyline_selected.emit(self.selected_storyline.id)
         else:
             self.selected_storyline = None
             self.edit_btn.setEnabled(False)
@@ -1820,8 +1721,8 @@ class StorylinesTab(QWidget):
         
         world = self.lore_data.worlds[0]  # Use first world
         # Ensure at least one event or quest exists for the new storyline
-        events_in_world = [e for e in self.lore_data.events if e.world_id == world.id]
-        quests_in_world = [q for q in self.lore_data.quests if q.world_id == world.id]
+        events_in_world = self.lore_data.events.where('world_id', world.id)
+        quests_in_world = self.lore_data.quests.where('world_id', world.id)
 
         if not events_in_world and not quests_in_world:
             QMessageBox.warning(
@@ -1849,7 +1750,7 @@ class StorylinesTab(QWidget):
             version=__import__('src.domain.value_objects.common', fromlist=['Version']).Version(1)
         )
         self.lore_data.add_storyline(storyline)
-        self.refresh()
+        self.model.rows_appended()
 
     def _edit_storyline(self):
         """Edit selected storyline."""
@@ -1859,8 +1760,7 @@ class StorylinesTab(QWidget):
     def _delete_storyline(self):
         """Delete selected storyline."""
         if self.selected_storyline:
-            self.lore_data.storylines.remove(self.selected_storyline)
-            self.refresh()
+            self.model.remove_entity(self.selected_storyline)
 
 
 class MainWindow(QMainWindow):
@@ -1870,6 +1770,14 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.lore_data = LoreData()
         self.current_file: Optional[Path] = None
+        self.project_store: Optional[ProjectStore] = None
+        # Tabs whose data changed while they were hidden; refreshed when shown
+        self._stale_tabs = set()
+        self._show_load_message = True
+        self.project_loader = ProjectLoader(LoreData, self)
+        self.project_loader.progress.connect(self._on_load_progress)
+        self.project_loader.loaded.connect(self._on_project_loaded)
+        self.project_loader.failed.connect(self._on_load_failed)
         self.current_locale = 'en'  # Default to English
         self._setup_style()
         self._setup_ui()
@@ -1988,7 +1896,7 @@ class MainWindow(QMainWindow):
                 border: 1px solid #444;
             }
 
-            QTableWidget {
+            QTableView {
                 background: #2b2b2b;
                 color: #ddd;
                 border: 1px solid #555;
@@ -1996,12 +1904,12 @@ class MainWindow(QMainWindow):
                 gridline-color: #555;
             }
 
-            QTableWidget::item {
+            QTableView::item {
                 padding: 5px;
                 border-bottom: 1px solid #444;
             }
 
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background: #4a4a4a;
                 color: #fff;
             }
@@ -2413,6 +2321,7 @@ class MainWindow(QMainWindow):
             if row in self.tab_row_to_widget_index:
                 widget_index = self.tab_row_to_widget_index[row]
                 self.stacked_widget.setCurrentIndex(widget_index)
+                self._refresh_if_stale(self.stacked_widget.currentWidget())
                 self._on_tab_changed(row)
 
         self.tab_list.currentRowChanged.connect(on_tab_row_changed)
@@ -2871,13 +2780,10 @@ class MainWindow(QMainWindow):
 
     def _finish_new_file(self):
         """Complete the new file creation."""
-        self.lore_data = LoreData()
-        self.worlds_tab.lore_data = self.lore_data
-        self.characters_tab.lore_data = self.lore_data
-        self.events_tab.lore_data = self.lore_data
-        self.improvements_tab.lore_data = self.lore_data
-        self.items_tab.lore_data = self.lore_data
+        # Every tab holds this LoreData, so empty it in place
+        self.lore_data.update_from(LoreData())
         self.current_file = None
+        self.project_store = None
         self._refresh_all()
         self.progress_bar.setVisible(False)
         self.operation_label.setText("New project created")
@@ -2890,51 +2796,7 @@ class MainWindow(QMainWindow):
         )
 
         if file_path:
-            self.operation_label.setText("Loading project...")
-            self.progress_bar.setVisible(True)
-            self.progress_bar.setRange(0, 0)
-
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-
-                self.lore_data.from_dict(data)
-                self.current_file = Path(file_path)
-                self._refresh_all()
-                
-                # Ensure GUI updates before showing message
-                QApplication.processEvents()
-                
-                self.progress_bar.setVisible(False)
-                self.operation_label.setText(f"Loaded: {Path(file_path).name}")
-                self.setWindowTitle(f"🎮 MythWeave - {Path(file_path).name}")
-                
-                # Get updated stats for the message
-                total_entities = (
-                    len(self.lore_data.worlds) +
-                    len(self.lore_data.characters) +
-                    len(self.lore_data.events) +
-                    len(self.lore_data.improvements) +
-                    len(self.lore_data.items)
-                )
-                
-                QMessageBox.information(
-                    self, "Success",
-                    f"Project loaded successfully!\n\n"
-                    f"Entities: {total_entities} | "
-                    f"Worlds: {len(self.lore_data.worlds)} | "
-                    f"Characters: {len(self.lore_data.characters)} | "
-                    f"Events: {len(self.lore_data.events)} | "
-                    f"Improvements: {len(self.lore_data.improvements)} | "
-                    f"Items: {len(self.lore_data.items)}"
-                )
-            except Exception as e:
-                self.progress_bar.setVisible(False)
-                self.operation_label.setText("Load failed")
-                QMessageBox.critical(
-                    self, "Load Error",
-                    f"Failed to load project:\n\n{str(e)}"
-                )
+            self._load_file_by_path(file_path)
 
     def _save_file(self):
         """Save lore to current file."""
@@ -2963,9 +2825,7 @@ class MainWindow(QMainWindow):
         self.progress_bar.setRange(0, 0)
 
         try:
-            data = self.lore_data.to_dict()
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            self.lore_data.save_json(file_path)
 
             self.current_file = file_path
             self.progress_bar.setVisible(False)
@@ -2999,35 +2859,59 @@ class MainWindow(QMainWindow):
             self._save_to_file(self.current_file)
     
     def _save_to_file(self, file_path: Path):
-        """Save lore to specified file."""
+        """Save lore to specified file, rewriting only the entity types that changed."""
         try:
-            data = self.lore_data.to_dict()
-            with open(file_path, 'w') as f:
-                json.dump(data, f, indent=2)
+            if self.project_store is None or self.project_store.path != Path(file_path):
+                # A new location gets every section
+                self.project_store = ProjectStore(file_path)
+            written = self.project_store.save(self.lore_data)
             
-            self.statusBar().showMessage(f"Saved: {file_path}")
+            self.statusBar().showMessage(f"Saved: {file_path} ({len(written)} sections changed)")
             QMessageBox.information(self, "Success", "Lore saved successfully!")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to save file: {e}")
     
     def _load_file_by_path(self, file_path: str, show_message: bool = True):
-        """Load lore from a specific file path.
+        """Load lore from a specific file path on a worker thread.
+
+        The current data stays on screen until the project has loaded;
+        progress is shown in the status bar.
 
         Args:
-            file_path: Path to the JSON file to load
+            file_path: Path to the project file to load
             show_message: Whether to show success/error message boxes
 
         Returns:
-            bool: True if loaded successfully, False otherwise
+            bool: True if loading started, False if another load is running
         """
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+        if self.project_loader.is_running():
+            return False
 
-            self.lore_data.from_dict(data)
-            self.current_file = Path(file_path)
-            self._refresh_all()
+        self._show_load_message = show_message
+        self.operation_label.setText("Loading project...")
+        self.progress_bar.setVisible(True)
+        self.progress_bar.setRange(0, 0)
+        self.project_loader.load(Path(file_path))
+        return True
+
+    def _on_load_progress(self, done: int, total: int, section: str):
+        """Show which section the loader finished last."""
+        self.progress_bar.setRange(0, total)
+        self.progress_bar.setValue(done)
+        self.operation_label.setText(f"Loading {section}...")
+
+    def _on_project_loaded(self, lore_data: LoreData, store: ProjectStore):
+        """Swap in a project loaded by the worker thread."""
+        self.lore_data.update_from(lore_data)
+        self.project_store = store
+        self.current_file = store.path
+        self._refresh_all()
+
+        self.progress_bar.setVisible(False)
+        self.operation_label.setText(f"Loaded: {store.path.name}")
+        self.setWindowTitle(f"🎮 MythWeave - {store.path.name}")
 
+        if self._show_load_message:
             # Get comprehensive entity counts
             entity_counts = {
                 'worlds': len(self.lore_data.worlds),
@@ -3052,77 +2936,72 @@ class MainWindow(QMainWindow):
                 'sessions': len(self.lore_data.sessions),
                 'tokenboards': len(self.lore_data.tokenboards),
             }
-
             total_entities = sum(entity_counts.values())
 
-            # Update window title
-            self.setWindowTitle(f"🎮 MythWeave - {Path(file_path).name}")
-
-            # Update header status after loading
-            self._update_header_status()
+            # Build detailed entity report
+            entity_report = '\n'.join([
+                f"{name.title()}: {count}" for name, count in entity_counts.items() if count > 0
+            ])
 
-            if show_message:
-                # Build detailed entity report
-                entity_report = '\n'.join([
-                    f"{name.title()}: {count}" for name, count in entity_counts.items() if count > 0
-                ])
-
-                QMessageBox.information(
-                    self, "Success",
-                    f"Project loaded successfully!\n\n"
-                    f"Total Entities: {total_entities}\n\n"
-                    f"{entity_report}"
-                )
-
-            return True
+            QMessageBox.information(
+                self, "Success",
+                f"Project loaded successfully!\n\n"
+                f"Total Entities: {total_entities}\n\n"
+                f"{entity_report}"
+            )
 
-        except FileNotFoundError:
-            if show_message:
-                QMessageBox.warning(
-                    self, "File Not Found",
-                    f"Sample file not found:\n{file_path}\n\n"
-                    f"The application will start with an empty project."
-                )
-            return False
+    def _on_load_failed(self, message: str):
+        """Report a project the worker thread could not load."""
+        self.progress_bar.setVisible(False)
+        self.operation_label.setText("Load failed")
+        if self._show_load_message:
+            QMessageBox.critical(
+                self, "Load Error",
+                f"Failed to load project:\n\n{message}"
+            )
 
-        except Exception as e:
-            if show_message:
-                QMessageBox.critical(
-                    self, "Load Error",
-                    f"Failed to load project:\n\n{str(e)}\n\n"
-                    f"The application will start with an empty project."
-                )
-            return False
+    def _data_tabs(self) -> list:
+        """Tabs that show LoreData and need a refresh when it changes."""
+        return [
+            self.worlds_tab,
+            self.world_map_tab,
+            self.characters_tab,
+            self.events_tab,
+            self.improvements_tab,
+            self.items_tab,
+            self.texture_tab,
+            self.model3d_tab,
+            self.quests_tab,
+            self.storylines_tab,
+            self.pages_tab,
+            self.templates_tab,
+            self.stories_tab,
+            self.tags_tab,
+            self.images_tab,
+            self.choices_tab,
+            self.flowcharts_tab,
+            self.handouts_tab,
+            self.inspirations_tab,
+            self.maps_tab,
+            self.notes_tab,
+            self.requirements_tab,
+            self.sessions_tab,
+            self.tokenboards_tab,
+            self.progression_simulator_tab,
+        ]
 
     def _refresh_all(self):
-        """Refresh all tabs."""
-        self.worlds_tab.refresh()
-        self.world_map_tab.refresh()
-        self.characters_tab.refresh()
-        self.events_tab.refresh()
-        self.improvements_tab.refresh()
-        self.items_tab.refresh()
-        self.texture_tab.refresh()
-        self.model3d_tab.refresh()
-        self.quests_tab.refresh()
-        self.storylines_tab.refresh()
-        self.pages_tab.refresh()
-        self.templates_tab.refresh()
-        self.stories_tab.refresh()
-        self.tags_tab.refresh()
-        self.images_tab.refresh()
-        self.choices_tab.refresh()
-        self.flowcharts_tab.refresh()
-        self.handouts_tab.refresh()
-        self.inspirations_tab.refresh()
-        self.maps_tab.refresh()
-        self.notes_tab.refresh()
-        self.requirements_tab.refresh()
-        self.sessions_tab.refresh()
-        self.tokenboards_tab.refresh()
-        self.progression_simulator_tab.refresh()
+        """Refresh the visible tab now and every other tab when it is first shown."""
+        self._stale_tabs = set(self._data_tabs())
+        self._refresh_if_stale(self.stacked_widget.currentWidget())
         self._update_header_status()
 
+    def _refresh_if_stale(self, tab):
+        """Refresh ``tab`` if the data changed since it was last shown."""
+        if tab in self._stale_tabs:
+            self._stale_tabs.discard(tab)
+            tab.refresh()
+
     def _update_header_status(self):
         """Update header status indicators."""
         try:
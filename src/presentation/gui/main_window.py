@@ -928,9 +928,7 @@ class MainWindow(QMainWindow):
         self.progress_bar.setRange(0, 0)
 
         try:
-            data = self.lore_data.to_dict()
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            self.lore_data.save_json(file_path)
 
             self.current_file = file_path
             self.progress_bar.setVisible(False)
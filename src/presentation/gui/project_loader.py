@@ -0,0 +1,93 @@
+"""
+Background project loading.
+
+:class:`ProjectLoader` runs :func:`load_project` on a ``QThread`` into a
+fresh ``LoreData``, so parsing and rebuilding entities never blocks the
+window. Its signals are delivered on the thread that owns the loader (the
+UI thread); the window swaps the loaded data in when ``loaded`` fires.
+"""
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from PyQt6.QtCore import QObject, QThread, pyqtSignal
+
+from src.presentation.gui.project_store import load_project
+
+
+class _LoadWorker(QObject):
+    progress = pyqtSignal(int, int, str)
+    loaded = pyqtSignal(object, object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, path: Path, lore_data_factory: Callable[[], Any]):
+        super().__init__()
+        self._path = path
+        self._factory = lore_data_factory
+
+    def run(self) -> None:
+        try:
+            lore_data = self._factory()
+            store = load_project(self._path, lore_data, progress=self.progress.emit)
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.loaded.emit(lore_data, store)
+
+
+class ProjectLoader(QObject):
+    """
+    Loads projects on a worker thread.
+
+    Signals:
+        progress(done, total, section): a section finished loading
+        loaded(lore_data, store): the new ``LoreData`` and its ``ProjectStore``
+        failed(message): the project could not be read
+    """
+
+    progress = pyqtSignal(int, int, str)
+    loaded = pyqtSignal(object, object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, lore_data_factory: Callable[[], Any], parent=None):
+        super().__init__(parent)
+        self._factory = lore_data_factory
+        self._thread: Optional[QThread] = None
+        self._worker: Optional[_LoadWorker] = None
+
+    def is_running(self) -> bool:
+        return self._thread is not None
+
+    def load(self, path: Path) -> None:
+        """Start loading ``path``; one load runs at a time."""
+        if self.is_running():
+            raise RuntimeError("A project is already loading")
+
+        self._thread = QThread(self)
+        self._worker = _LoadWorker(Path(path), self._factory)
+        self._worker.moveToThread(self._thread)
+
+        self._thread.started.connect(self._worker.run)
+        self._worker.progress.connect(self.progress)
+        self._worker.loaded.connect(self._on_loaded)
+        self._worker.failed.connect(self._on_failed)
+        self._thread.start()
+
+    def wait(self, msecs: int = -1) -> bool:
+        """Block until the worker thread exits (for tests and shutdown)."""
+        return self._thread.wait(msecs) if self._thread is not None else True
+
+    def _finish(self) -> None:
+        self._thread.quit()
+        self._thread.wait()
+        self._worker.deleteLater()
+        self._thread.deleteLater()
+        self._thread = None
+        self._worker = None
+
+    def _on_loaded(self, lore_data: Any, store: Any) -> None:
+        self._finish()
+        self.loaded.emit(lore_data, store)
+
+    def _on_failed(self, message: str) -> None:
+        self._finish()
+        self.failed.emit(message)
@@ -0,0 +1,190 @@
+"""
+ProjectStore - chunked project files for LoreData.
+
+Saving a project used to write every entity list into one JSON file, and
+loading parsed and rebuilt all of them at once. A project is now a small
+manifest (the file the user picked) plus one JSON chunk per entity type in
+a sibling ``<name>.chunks`` directory::
+
+    campaign.json                       manifest: format, next_id, sections
+    campaign.chunks/characters.json     [{...}, {...}]
+    campaign.chunks/items.json          [...]
+
+:class:`ProjectStore` remembers a fingerprint of every section as last
+written or read, so :meth:`ProjectStore.save` rewrites only the chunks of
+entity types that changed. :func:`load_project` reads both manifests and
+the single-file format of older projects, reporting progress per section.
+
+The store only relies on the section API of ``LoreData``
+(``iter_sections``, ``section_records``, ``load_section`` and ``next_id``).
+"""
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.infrastructure.entity_codec import dumps, loads
+
+PROJECT_FORMAT = "mythweave-project"
+PROJECT_FORMAT_VERSION = 1
+CHUNK_SUFFIX = ".chunks"
+
+# progress(sections done, sections total, section key)
+ProgressCallback = Callable[[int, int, str], None]
+
+
+def section_keys(lore_data: Any) -> List[str]:
+    return [key for key, _ in lore_data.iter_sections()]
+
+
+def _entity_version(entity: Any) -> int:
+    version = getattr(entity, 'version', None)
+    version = getattr(version, 'value', version)
+    return version if isinstance(version, int) else 0
+
+
+def section_fingerprint(entities: List[Any]) -> Tuple[Any, ...]:
+    """
+    What a section looked like: the list itself, its revision and length,
+    and the sum of its entity versions (domain mutators bump ``version``).
+    """
+    return (
+        entities,
+        getattr(entities, 'revision', None),
+        len(entities),
+        sum(_entity_version(entity) for entity in entities),
+    )
+
+
+def _same_fingerprint(old: Optional[Tuple[Any, ...]], new: Tuple[Any, ...]) -> bool:
+    return old is not None and old[0] is new[0] and old[1:] == new[1:]
+
+
+def write_atomic(path: Path, write: Callable[[Any], None]) -> None:
+    """Write through a temporary file so a failed save never truncates ``path``."""
+    temp_path = path.with_name(path.name + ".tmp")
+    try:
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            write(f)
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def _write_records(fp, records) -> None:
+    fp.write("[")
+    for i, record in enumerate(records):
+        fp.write(("," if i else "") + "\n" + dumps(record))
+    fp.write("\n]")
+
+
+class ProjectStore:
+    """A chunked project on disk and what was last saved to it."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._fingerprints: Dict[str, Tuple[Any, ...]] = {}
+        self._counts: Dict[str, int] = {}
+        self._next_id: Optional[int] = None
+
+    @property
+    def chunk_dir(self) -> Path:
+        return self.path.with_name(self.path.stem + CHUNK_SUFFIX)
+
+    def chunk_path(self, key: str) -> Path:
+        return self.chunk_dir / f"{key}.json"
+
+    def dirty_sections(self, lore_data: Any) -> List[str]:
+        """Sections changed since they were last saved or loaded."""
+        return [
+            key for key in section_keys(lore_data)
+            if not _same_fingerprint(self._fingerprints.get(key), section_fingerprint(getattr(lore_data, key)))
+        ]
+
+    def is_dirty(self, lore_data: Any) -> bool:
+        return bool(self.dirty_sections(lore_data)) or lore_data.next_id != self._next_id
+
+    def mark_clean(self, lore_data: Any) -> None:
+        """Treat the current contents of ``lore_data`` as saved."""
+        for key in section_keys(lore_data):
+            entities = getattr(lore_data, key)
+            self._fingerprints[key] = section_fingerprint(entities)
+            self._counts[key] = len(entities)
+        self._next_id = lore_data.next_id
+
+    def save(self, lore_data: Any, full: bool = False) -> List[str]:
+        """
+        Write changed sections (every section if ``full``) and the manifest.
+
+        Returns the keys of the chunks written.
+        """
+        keys = section_keys(lore_data)
+        dirty = set(keys if full else self.dirty_sections(lore_data))
+        # Also restore chunks missing on disk (e.g. a manifest copied alone)
+        written = [key for key in keys if key in dirty or not self.chunk_path(key).exists()]
+        if not written and lore_data.next_id == self._next_id and self.path.exists():
+            return []
+
+        self.chunk_dir.mkdir(parents=True, exist_ok=True)
+        for key in written:
+            entities = getattr(lore_data, key)
+            fingerprint = section_fingerprint(entities)
+            write_atomic(self.chunk_path(key), lambda f: _write_records(f, lore_data.section_records(key)))
+            self._fingerprints[key] = fingerprint
+            self._counts[key] = len(entities)
+
+        manifest = {
+            'format': PROJECT_FORMAT,
+            'version': PROJECT_FORMAT_VERSION,
+            'next_id': lore_data.next_id,
+            'sections': {
+                key: {'file': f"{self.chunk_dir.name}/{key}.json", 'count': self._counts.get(key, 0)}
+                for key in keys
+            },
+        }
+        write_atomic(self.path, lambda f: json.dump(manifest, f, indent=2))
+        self._next_id = lore_data.next_id
+        return written
+
+
+def is_manifest(data: Any) -> bool:
+    return isinstance(data, dict) and data.get('format') == PROJECT_FORMAT
+
+
+def load_project(path: Path, lore_data: Any, progress: Optional[ProgressCallback] = None) -> ProjectStore:
+    """
+    Load the project at ``path`` into ``lore_data`` section by section.
+
+    Manifests load their chunks; any other JSON object is read as a
+    single-file project. The returned store is clean for a chunked project
+    and fully dirty for a single-file one, so its first save writes every
+    chunk.
+    """
+    store = ProjectStore(path)
+    with open(store.path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    chunked = is_manifest(data)
+    if chunked:
+        if data.get('version', 1) > PROJECT_FORMAT_VERSION:
+            raise ValueError(f"Unsupported project version {data['version']} in {store.path}")
+        sections = data.get('sections', {})
+    keys = section_keys(lore_data)
+
+    for done, key in enumerate(keys, 1):
+        if chunked:
+            records = []
+            if key in sections:
+                with open(store.path.parent / sections[key]['file'], 'rb') as f:
+                    records = loads(f.read())
+        else:
+            records = data.get(key, [])
+        lore_data.load_section(key, records)
+        if progress:
+            progress(done, len(keys), key)
+
+    lore_data.next_id = data.get('next_id', 1)
+    if chunked:
+        store.mark_clean(lore_data)
+    return store
@@ -0,0 +1,272 @@
+"""
+Virtualized Entity Tables
+
+The editor tabs used to rebuild a ``QTableWidget`` on every refresh, creating
+one ``QTableWidgetItem`` per cell for every entity. :class:`EntityTableModel`
+is a ``QAbstractTableModel`` over a ``LoreData`` list instead:
+
+- cells are computed on demand from the entity, so only rows the view
+  actually paints cost anything;
+- rows are exposed in batches through ``canFetchMore``/``fetchMore``, so a
+  reset with 100k characters is O(1) and the view pulls more as it scrolls;
+- edits are reported as single-row inserts, removals and ``dataChanged``
+  instead of full rebuilds.
+
+:class:`EntityTableView` puts an :class:`EntityFilterProxyModel` between the
+model and the view for sorting and filtering.
+"""
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, QSortFilterProxyModel, Qt
+from PyQt6.QtGui import QColor
+from PyQt6.QtWidgets import QAbstractItemView, QTableView
+
+# Rows handed to the view per fetchMore
+FETCH_BATCH_SIZE = 256
+
+SORT_ROLE = Qt.ItemDataRole.UserRole
+ENTITY_ROLE = Qt.ItemDataRole.UserRole + 1
+
+
+@dataclass(frozen=True)
+class Column:
+    """One table column: a header and how to read its value from an entity."""
+    header: str
+    value: Callable[[Any], Any]
+    # Optional text colour (e.g. "#4CAF50") per entity
+    color: Optional[Callable[[Any], Optional[str]]] = None
+
+
+def _sort_value(value: Any) -> Any:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    return "" if value is None else str(value)
+
+
+class EntityTableModel(QAbstractTableModel):
+    """
+    Table model over a live list of entities.
+
+    ``rows`` returns the list to show (e.g. ``lambda: lore_data.characters``);
+    it is called on every access so a list replaced by a project load is
+    picked up by :meth:`reset`.
+    """
+
+    def __init__(
+        self,
+        rows: Callable[[], List[Any]],
+        columns: Sequence[Column],
+        batch_size: int = FETCH_BATCH_SIZE,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self._rows = rows
+        self.columns = list(columns)
+        self.batch_size = batch_size
+        self._loaded = min(batch_size, len(rows()))
+        # List length as of the last notification
+        self._length = len(rows())
+        # id(entity) -> position in the list, built on first lookup
+        self._positions: Optional[Dict[int, int]] = None
+
+    # -- Qt model interface ---------------------------------------------
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._loaded
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.columns)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.columns[section].header
+        return super().headerData(section, orientation, role)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= self._loaded:
+            return None
+        entity = self._rows()[index.row()]
+        column = self.columns[index.column()]
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            value = column.value(entity)
+            return "" if value is None else str(value)
+        if role == SORT_ROLE:
+            return _sort_value(column.value(entity))
+        if role == ENTITY_ROLE:
+            return entity
+        if role == Qt.ItemDataRole.ForegroundRole and column.color:
+            color = column.color(entity)
+            return QColor(color) if color else None
+        return None
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        return not parent.isValid() and self._loaded < len(self._rows())
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        if parent.isValid():
+            return
+        count = min(self.batch_size, len(self._rows()) - self._loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    # -- Entity access --------------------------------------------------
+
+    def entity_at(self, row: int) -> Any:
+        return self._rows()[row]
+
+    def row_of(self, entity: Any) -> int:
+        """Position of ``entity`` in the list (loaded or not), or -1."""
+        if self._positions is None:
+            self._positions = {id(e): i for i, e in enumerate(self._rows())}
+        return self._positions.get(id(entity), -1)
+
+    def fetch_all(self) -> None:
+        """Expose every row, e.g. before filtering the whole list."""
+        remaining = len(self._rows()) - self._loaded
+        if remaining > 0:
+            self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + remaining - 1)
+            self._loaded += remaining
+            self.endInsertRows()
+
+    # -- Change notifications -------------------------------------------
+
+    def reset(self) -> None:
+        """The list was replaced or changed wholesale; start from the first batch."""
+        self.beginResetModel()
+        self._loaded = min(self.batch_size, len(self._rows()))
+        self._length = len(self._rows())
+        self._positions = None
+        self.endResetModel()
+
+    def rows_appended(self) -> None:
+        """
+        Entities were appended to the list (``LoreData.add_*``).
+
+        If every row was already shown the new ones are inserted into the
+        view; otherwise they arrive with the next ``fetchMore``.
+        """
+        rows = self._rows()
+        if self._positions is not None:
+            for position in range(self._length, len(rows)):
+                self._positions[id(rows[position])] = position
+        all_shown = self._loaded >= self._length
+        self._length = len(rows)
+        if all_shown:
+            self.fetch_all()
+
+    def entity_changed(self, entity: Any) -> None:
+        """``entity`` was modified in place."""
+        rows = self._rows()
+        if hasattr(rows, 'touch'):
+            # Let dirty tracking see in-place edits
+            rows.touch()
+        row = self.row_of(entity)
+        if 0 <= row < self._loaded:
+            self.dataChanged.emit(
+                self.index(row, 0),
+                self.index(row, len(self.columns) - 1),
+            )
+
+    def replace_entity(self, old: Any, new: Any) -> None:
+        """Replace ``old`` with ``new`` in the list, keeping its row."""
+        row = self.row_of(old)
+        if row < 0:
+            raise ValueError("Entity is not in this table")
+        self._rows()[row] = new
+        del self._positions[id(old)]
+        self._positions[id(new)] = row
+        self.entity_changed(new)
+
+    def remove_entity(self, entity: Any) -> None:
+        """Remove ``entity`` from the list and its row from the view."""
+        row = self.row_of(entity)
+        if row < 0:
+            raise ValueError("Entity is not in this table")
+        rows = self._rows()
+        if row < self._loaded:
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del rows[row]
+            self._loaded -= 1
+            self.endRemoveRows()
+        else:
+            del rows[row]
+        self._length = len(rows)
+        # Later rows shifted; rebuild positions on the next lookup
+        self._positions = None
+
+
+class EntityFilterProxyModel(QSortFilterProxyModel):
+    """
+    Sorts by each column's raw value and filters by text across all columns,
+    optionally combined with an entity predicate.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._predicate: Optional[Callable[[Any], bool]] = None
+        self.setSortRole(SORT_ROLE)
+        self.setFilterKeyColumn(-1)
+        self.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+
+    def set_filter_text(self, text: str) -> None:
+        # Filtering only sees fetched rows, so a filter covers the whole list
+        if text:
+            self.sourceModel().fetch_all()
+        self.setFilterFixedString(text)
+
+    def set_predicate(self, predicate: Optional[Callable[[Any], bool]]) -> None:
+        if predicate is not None:
+            self.sourceModel().fetch_all()
+        self._predicate = predicate
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        if self._predicate is not None and not self._predicate(self.sourceModel().entity_at(source_row)):
+            return False
+        return super().filterAcceptsRow(source_row, source_parent)
+
+    def entity_at(self, row: int) -> Any:
+        return self.sourceModel().entity_at(self.mapToSource(self.index(row, 0)).row())
+
+
+class EntityTableView(QTableView):
+    """Row-selecting, sortable view of an :class:`EntityTableModel`."""
+
+    def __init__(self, model: EntityTableModel, parent=None):
+        super().__init__(parent)
+        self.proxy = EntityFilterProxyModel(self)
+        self.proxy.setSourceModel(model)
+        self.setModel(self.proxy)
+
+        self.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        # Keep list order until a header is clicked
+        self.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+        self.setSortingEnabled(True)
+
+    @property
+    def source_model(self) -> EntityTableModel:
+        return self.proxy.sourceModel()
+
+    def selected_entity(self) -> Any:
+        """The entity of the selected row, or ``None``."""
+        rows = self.selectionModel().selectedRows()
+        return self.proxy.entity_at(rows[0].row()) if rows else None
+
+    def select_entity(self, entity: Any) -> None:
+        """Select and scroll to ``entity``'s row, fetching up to it if needed."""
+        model = self.source_model
+        row = model.row_of(entity)
+        if row < 0:
+            return
+        while row >= model.rowCount() and model.canFetchMore():
+            model.fetchMore()
+        index = self.proxy.mapFromSource(model.index(row, 0))
+        if index.isValid():
+            self.selectRow(index.row())
+            self.scrollTo(index)
@@ -135,7 +135,7 @@ class CharactersTab(QWidget):
         if selected_items:
             row = selected_items[0].row()
             character_id = EntityId(int(self.table.item(row, 0).text()))
-            self.selected_character = next((c for c in self.lore_data.characters if c.id == character_id), None)
+            self.selected_character = self.lore_data.characters.get(character_id)
             
             if self.selected_character:
                 # Update form
@@ -198,7 +198,7 @@ class ChoiceTab(QWidget):
         if len(selected_rows) == 1:
             row = list(selected_rows)[0]
             choice_id = int(self.table.item(row, 0).text())
-            self.selected_choice = next((c for c in self.lore_data.choices if c.id and c.id.value == choice_id), None)
+            self.selected_choice = self.lore_data.choices.get(EntityId(choice_id))
             if self.selected_choice:
                 self._populate_form()
                 self.update_btn.setEnabled(True)
@@ -141,7 +141,7 @@ class EventsTab(QWidget):
         if selected_items:
             row = selected_items[0].row()
             event_id = EntityId(int(self.table.item(row, 0).text()))
-            self.selected_event = next((e for e in self.lore_data.events if e.id == event_id), None)
+            self.selected_event = self.lore_data.events.get(event_id)
             
             if self.selected_event:
                 # Update form
@@ -171,7 +171,7 @@ class EventsTab(QWidget):
         self.participants_list.clear()
         if self.selected_event:
             for participant_id in self.selected_event.participant_ids:
-                character = next((c for c in self.lore_data.characters if c.id == participant_id), None)
+                character = self.lore_data.characters.get(participant_id)
                 name = str(character.name) if character else f"Unknown (ID: {participant_id.value})"
                 self.participants_list.addItem(name)
     
@@ -179,7 +179,7 @@ class EventsTab(QWidget):
         """Add a participant to the event."""
         # Get available characters from selected world
         world_id = EntityId(self.world_combo.currentData())
-        available_characters = [c for c in self.lore_data.characters if c.world_id == world_id]
+        available_characters = self.lore_data.characters.where('world_id', world_id)
         
         if not available_characters:
             QMessageBox.information(self, "No Characters", "No characters available in selected world.")
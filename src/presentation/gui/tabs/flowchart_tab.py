@@ -185,7 +185,7 @@ class FlowchartTab(QWidget):
         if len(selected_rows) == 1:
             row = list(selected_rows)[0]
             flowchart_id = int(self.table.item(row, 0).text())
-            self.selected_flowchart = next((f for f in self.lore_data.flowcharts if f.id and f.id.value == flowchart_id), None)
+            self.selected_flowchart = self.lore_data.flowcharts.get(EntityId(flowchart_id))
             if self.selected_flowchart:
                 self._populate_form()
                 self.update_btn.setEnabled(True)
@@ -199,7 +199,7 @@ class HandoutTab(QWidget):
         if len(selected_rows) == 1:
             row = list(selected_rows)[0]
             handout_id = int(self.table.item(row, 0).text())
-            self.selected_handout = next((h for h in self.lore_data.handouts if h.id and h.id.value == handout_id), None)
+            self.selected_handout = self.lore_data.handouts.get(EntityId(handout_id))
             if self.selected_handout:
                 self._populate_form()
                 self.update_btn.setEnabled(True)
@@ -173,7 +173,7 @@ class ImagesTab(QWidget):
             self.table.insertRow(row)
 
             # Get world name
-            world = next((w for w in self.lore_data.worlds if w.id == image.world_id), None)
+            world = self.lore_data.worlds.get(image.world_id)
             world_name = str(world.name) if world else f"ID: {image.world_id.value}"
 
             # Get file name from path
@@ -194,7 +194,7 @@ class ImagesTab(QWidget):
         if selected_items and hasattr(self.lore_data, 'images'):
             row = selected_items[0].row()
             image_id = EntityId(int(self.table.item(row, 0).text()))
-            self.selected_image = next((img for img in self.lore_data.images if img.id == image_id), None)
+            self.selected_image = self.lore_data.images.get(image_id)
 
             if self.selected_image:
                 # Update form fields
@@ -136,10 +136,10 @@ class ImprovementsTab(QWidget):
             world = self.lore_data.get_world_by_id(entity_id)
             return f"World: {world.name}" if world else "Unknown World"
         elif entity_type.value == "character":
-            character = next((c for c in self.lore_data.characters if c.id == entity_id), None)
+            character = self.lore_data.characters.get(entity_id)
             return f"Character: {character.name}" if character else "Unknown Character"
         elif entity_type.value == "event":
-            event = next((e for e in self.lore_data.events if e.id == entity_id), None)
+            event = self.lore_data.events.get(entity_id)
             return f"Event: {event.name}" if event else "Unknown Event"
         return "Unknown"
     
@@ -149,7 +149,7 @@ class ImprovementsTab(QWidget):
         if selected_items:
             row = selected_items[0].row()
             improvement_id = EntityId(int(self.table.item(row, 0).text()))
-            self.selected_improvement = next((i for i in self.lore_data.improvements if i.id == improvement_id), None)
+            self.selected_improvement = self.lore_data.improvements.get(improvement_id)
             
             if self.selected_improvement:
                 # Update form
@@ -179,7 +179,7 @@ class InspirationTab(QWidget):
         if len(selected_rows) == 1:
             row = list(selected_rows)[0]
             inspiration_id = int(self.table.item(row, 0).text())
-            self.selected_inspiration = next((i for i in self.lore_data.inspirations if i.id and i.id.value == inspiration_id), None)
+            self.selected_inspiration = self.lore_data.inspirations.get(EntityId(inspiration_id))
             if self.selected_inspiration:
                 self._populate_form()
                 self.update_btn.setEnabled(True)
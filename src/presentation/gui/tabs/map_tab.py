@@ -176,7 +176,7 @@ class MapTab(QWidget):
         if len(selected_rows) == 1:
             row = list(selected_rows)[0]
             map_id = int(self.table.item(row, 0).text())
-            self.selected_map = next((m for m in self.lore_data.maps if m.id and m.id.value == map_id), None)
+            self.selected_map = self.lore_data.maps.get(EntityId(map_id))
             if self.selected_map:
                 self._populate_form()
                 self.update_btn.setEnabled(True)
@@ -221,7 +221,7 @@ class Model3DTab(QWidget):
             self.table.insertRow(row)
 
             # Get world name
-            world = next((w for w in self.lore_data.worlds if w.id == model.world_id), None)
+            world = self.lore_data.worlds.get(model.world_id)
             world_name = str(world.name) if world else f"ID: {model.world_id.value}"
 
             # Get file name from path
@@ -256,7 +256,7 @@ class Model3DTab(QWidget):
         if selected_items and hasattr(self.lore_data, 'models'):
             row = selected_items[0].row()
             model_id = EntityId(int(self.table.item(row, 0).text()))
-            self.selected_model = next((mod for mod in self.lore_data.models if mod.id == model_id), None)
+            self.selected_model = self.lore_data.models.get(model_id)
 
             if self.selected_model:
                 # Update form fields
@@ -475,7 +475,7 @@ class Model3DTab(QWidget):
         if reply == QMessageBox.StandardButton.Yes:
             try:
                 # Remove from list
-                self.lore_data.models = [m for m in self.lore_data.models if m.id != self.selected_model.id]
+                self.lore_data.models.remove_id(self.selected_model.id)
                 self.refresh()
                 self._clear_form()
                 QMessageBox.information(self, "Success", "3D Model deleted successfully!")
@@ -170,7 +170,7 @@ class NoteTab(QWidget):
         if len(selected_rows) == 1:
             row = list(selected_rows)[0]
             note_id = int(self.table.item(row, 0).text())
-            self.selected_note = next((n for n in self.lore_data.notes if n.id and n.id.value == note_id), None)
+            self.selected_note = self.lore_data.notes.get(EntityId(note_id))
             if self.selected_note:
                 self._populate_form()
                 self.update_btn.setEnabled(True)
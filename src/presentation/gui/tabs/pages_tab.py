@@ -196,13 +196,13 @@ class PagesTab(QWidget):
             self.table.insertRow(row)
 
             # Get world name
-            world = next((w for w in self.lore_data.worlds if w.id == page.world_id), None)
+            world = self.lore_data.worlds.get(page.world_id)
             world_name = str(world.name) if world else f"ID: {page.world_id.value}"
 
             # Get template name
             template_name = "None"
             if page.template_id and hasattr(self.lore_data, 'templates'):
-                template = next((t for t in self.lore_data.templates if t.id == page.template_id), None)
+                template = self.lore_data.templates.get(page.template_id)
                 template_name = str(template.name) if template else f"ID: {page.template_id.value}"
 
             self.table.setItem(row, 0, QTableWidgetItem(str(page.id.value) if page.id else ""))
@@ -221,7 +221,7 @@ class PagesTab(QWidget):
         if selected_items and hasattr(self.lore_data, 'pages'):
             row = selected_items[0].row()
             page_id = EntityId(int(self.table.item(row, 0).text()))
-            self.selected_page = next((p for p in self.lore_data.pages if p.id == page_id), None)
+            self.selected_page = self.lore_data.pages.get(page_id)
 
             if self.selected_page:
                 # Update form fields
@@ -268,7 +268,7 @@ class PagesTab(QWidget):
         self.tags_list.clear()
         if self.selected_page and hasattr(self.lore_data, 'tags'):
             for tag_id in self.selected_page.tag_ids:
-                tag = next((t for t in self.lore_data.tags if t.id == tag_id), None)
+                tag = self.lore_data.tags.get(tag_id)
                 name = str(tag.name) if tag else f"Unknown (ID: {tag_id.value})"
                 self.tags_list.addItem(name)
 
@@ -277,7 +277,7 @@ class PagesTab(QWidget):
         self.images_list.clear()
         if self.selected_page and hasattr(self.lore_data, 'images'):
             for image_id in self.selected_page.image_ids:
-                image = next((img for img in self.lore_data.images if img.id == image_id), None)
+                image = self.lore_data.images.get(image_id)
                 name = str(image.path) if image else f"Unknown (ID: {image_id.value})"
                 self.images_list.addItem(name)
 
@@ -292,7 +292,7 @@ class PagesTab(QWidget):
             return
 
         # Get world tags
-        world_tags = [t for t in self.lore_data.tags if t.world_id == self.selected_page.world_id]
+        world_tags = self.lore_data.tags.where('world_id', self.selected_page.world_id)
         if not world_tags:
             QMessageBox.information(self, "No Tags", "No tags available for this world.")
             return
@@ -86,7 +86,7 @@ class QuestsTab(QWidget):
         current_row = self.table.currentRow()
         if current_row >= 0:
             quest_id = int(self.table.item(current_row, 0).text())
-            self.selected_quest = next((q for q in self.lore_data.quests if q.id.value == quest_id), None)
+            self.selected_quest = self.lore_data.quests.get(EntityId(quest_id))
             self.edit_btn.setEnabled(True)
             self.delete_btn.setEnabled(True)
             self.quest_selected.emit(EntityId(quest_id))
@@ -105,7 +105,7 @@ class QuestsTab(QWidget):
         world = self.lore_data.worlds[0]  # Use first world
 
         # Check if there are characters in this world
-        characters_in_world = [c for c in self.lore_data.characters if c.world_id == world.id]
+        characters_in_world = self.lore_data.characters.where('world_id', world.id)
         if not characters_in_world:
             QMessageBox.warning(
                 self, "No Characters",
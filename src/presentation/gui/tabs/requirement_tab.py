@@ -151,7 +151,7 @@ class RequirementTab(QWidget):
         if len(selected_rows) == 1:
             row = list(selected_rows)[0]
             requirement_id = int(self.table.item(row, 0).text())
-            self.selected_requirement = next((r for r in self.lore_data.requirements if r.id and r.id.value == requirement_id), None)
+            self.selected_requirement = self.lore_data.requirements.get(EntityId(requirement_id))
             if self.selected_requirement:
                 self._populate_form()
                 self.delete_btn.setEnabled(True)
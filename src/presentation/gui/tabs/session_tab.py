@@ -203,7 +203,7 @@ class SessionTab(QWidget):
         if len(selected_rows) == 1:
             row = list(selected_rows)[0]
             session_id = int(self.table.item(row, 0).text())
-            self.selected_session = next((s for s in self.lore_data.sessions if s.id and s.id.value == session_id), None)
+            self.selected_session = self.lore_data.sessions.get(EntityId(session_id))
             if self.selected_session:
                 self._populate_form()
                 self.update_btn.setEnabled(True)
@@ -206,7 +206,7 @@ class StoriesTab(QWidget):
             self.table.insertRow(row)
 
             # Get world name
-            world = next((w for w in self.lore_data.worlds if w.id == story.world_id), None)
+            world = self.lore_data.worlds.get(story.world_id)
             world_name = str(world.name) if world else f"ID: {story.world_id.value}"
 
             self.table.setItem(row, 0, QTableWidgetItem(str(story.id.value) if story.id else ""))
@@ -226,7 +226,7 @@ class StoriesTab(QWidget):
         if selected_items and hasattr(self.lore_data, 'stories'):
             row = selected_items[0].row()
             story_id = EntityId(int(self.table.item(row, 0).text()))
-            self.selected_story = next((s for s in self.lore_data.stories if s.id == story_id), None)
+            self.selected_story = self.lore_data.stories.get(story_id)
 
             if self.selected_story:
                 # Update form fields
@@ -263,7 +263,7 @@ class StoriesTab(QWidget):
         self.choices_list.clear()
         if self.selected_story and hasattr(self.lore_data, 'choices'):
             for choice_id in self.selected_story.choice_ids:
-                choice = next((c for c in self.lore_data.choices if c.id == choice_id), None)
+                choice = self.lore_data.choices.get(choice_id)
                 name = choice.prompt[:50] + "..." if choice and len(choice.prompt) > 50 else (choice.prompt if choice else f"Unknown (ID: {choice_id.value})")
                 self.choices_list.addItem(name)
 
@@ -280,19 +280,19 @@ class StoriesTab(QWidget):
         """Get the name of a world element by ID."""
         # Check characters
         if hasattr(self.lore_data, 'characters'):
-            char = next((c for c in self.lore_data.characters if c.id == element_id), None)
+            char = self.lore_data.characters.get(element_id)
             if char:
                 return f"Character: {char.name}"
 
         # Check items
         if hasattr(self.lore_data, 'items'):
-            item = next((i for i in self.lore_data.items if i.id == element_id), None)
+            item = self.lore_data.items.get(element_id)
             if item:
                 return f"Item: {item.name}"
 
         # Check events
         if hasattr(self.lore_data, 'events'):
-            event = next((e for e in self.lore_data.events if e.id == element_id), None)
+            event = self.lore_data.events.get(element_id)
             if event:
                 return f"Event: {event.name}"
 
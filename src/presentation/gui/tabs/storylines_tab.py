@@ -82,7 +82,7 @@ class StorylinesTab(QWidget):
         current_row = self.table.currentRow()
         if current_row >= 0:
             storyline_id = int(self.table.item(current_row, 0).text())
-            self.selected_storyline = next((s for s in self.lore_data.storylines if s.id.value == storyline_id), None)
+            self.selected_storyline = self.lore_data.storylines.get(EntityId(storyline_id))
             self.edit_btn.setEnabled(True)
             self.delete_btn.setEnabled(True)
             self.storyline_selected.emit(EntityId(storyline_id))
@@ -99,8 +99,8 @@ class StorylinesTab(QWidget):
 
         world = self.lore_data.worlds[0]  # Use first world
         # Ensure at least one event or quest exists for the new storyline
-        events_in_world = [e for e in self.lore_data.events if e.world_id == world.id]
-        quests_in_world = [q for q in self.lore_data.quests if q.world_id == world.id]
+        events_in_world = self.lore_data.events.where('world_id', world.id)
+        quests_in_world = self.lore_data.quests.where('world_id', world.id)
 
         if not events_in_world and not quests_in_world:
             QMessageBox.warning(
@@ -164,7 +164,7 @@ class TagsTab(QWidget):
             self.table.insertRow(row)
 
             # Get world name
-            world = next((w for w in self.lore_data.worlds if w.id == tag.world_id), None)
+            world = self.lore_data.worlds.get(tag.world_id)
             world_name = str(world.name) if world else f"ID: {tag.world_id.value}"
 
             # Create color item with background
@@ -193,7 +193,7 @@ class TagsTab(QWidget):
         if selected_items and hasattr(self.lore_data, 'tags'):
             row = selected_items[0].row()
             tag_id = EntityId(int(self.table.item(row, 0).text()))
-            self.selected_tag = next((t for t in self.lore_data.tags if t.id == tag_id), None)
+            self.selected_tag = self.lore_data.tags.get(tag_id)
 
             if self.selected_tag:
                 # Update form fields
@@ -180,7 +180,7 @@ class TemplatesTab(QWidget):
             self.table.insertRow(row)
 
             # Get world name
-            world = next((w for w in self.lore_data.worlds if w.id == template.world_id), None)
+            world = self.lore_data.worlds.get(template.world_id)
             world_name = str(world.name) if world else f"ID: {template.world_id.value}"
 
             self.table.setItem(row, 0, QTableWidgetItem(str(template.id.value)))
@@ -198,7 +198,7 @@ class TemplatesTab(QWidget):
         if selected_items and hasattr(self.lore_data, 'templates'):
             row = selected_items[0].row()
             template_id = EntityId(int(self.table.item(row, 0).text()))
-            self.selected_template = next((t for t in self.lore_data.templates if t.id == template_id), None)
+            self.selected_template = self.lore_data.templates.get(template_id)
 
             if self.selected_template:
                 # Update form fields
@@ -242,7 +242,7 @@ class TemplatesTab(QWidget):
         self.runes_list.clear()
         if self.selected_template and hasattr(self.lore_data, 'templates'):
             for rune_id in self.selected_template.rune_ids:
-                rune = next((t for t in self.lore_data.templates if t.id == rune_id), None)
+                rune = self.lore_data.templates.get(rune_id)
                 name = str(rune.name) if rune else f"Unknown (ID: {rune_id.value})"
                 self.runes_list.addItem(name)
 
@@ -186,7 +186,7 @@ class TextureTab(QWidget):
             self.table.insertRow(row)
 
             # Get world name
-            world = next((w for w in self.lore_data.worlds if w.id == texture.world_id), None)
+            world = self.lore_data.worlds.get(texture.world_id)
             world_name = str(world.name) if world else f"ID: {texture.world_id.value}"
 
             # Get file name from path
@@ -209,7 +209,7 @@ class TextureTab(QWidget):
         if selected_items and hasattr(self.lore_data, 'textures'):
             row = selected_items[0].row()
             texture_id = EntityId(int(self.table.item(row, 0).text()))
-            self.selected_texture = next((tex for tex in self.lore_data.textures if tex.id == texture_id), None)
+            self.selected_texture = self.lore_data.textures.get(texture_id)
 
             if self.selected_texture:
                 # Update form fields
@@ -377,7 +377,7 @@ class TextureTab(QWidget):
         if reply == QMessageBox.StandardButton.Yes:
             try:
                 # Remove from list
-                self.lore_data.textures = [t for t in self.lore_data.textures if t.id != self.selected_texture.id]
+                self.lore_data.textures.remove_id(self.selected_texture.id)
                 self.refresh()
                 self._clear_form()
                 QMessageBox.information(self, "Success", "Texture deleted successfully!")
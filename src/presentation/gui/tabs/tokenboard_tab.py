@@ -186,7 +186,7 @@ class TokenboardTab(QWidget):
         if len(selected_rows) == 1:
             row = list(selected_rows)[0]
             tokenboard_id = int(self.table.item(row, 0).text())
-            self.selected_tokenboard = next((t for t in self.lore_data.tokenboards if t.id and t.id.value == tokenboard_id), None)
+            self.selected_tokenboard = self.lore_data.tokenboards.get(EntityId(tokenboard_id))
             if self.selected_tokenboard:
                 self._populate_form()
                 self.update_btn.setEnabled(True)
@@ -282,10 +282,10 @@ class WorldMapTab(QWidget):
         info += f"Version: {self.selected_world.version}\n\n"
 
         # Counts
-        char_count = len([c for c in self.lore_data.characters if c.world_id == self.selected_world.id])
-        event_count = len([e for e in self.lore_data.events if e.world_id == self.selected_world.id])
-        item_count = len([i for i in self.lore_data.items if i.world_id == self.selected_world.id])
-        quest_count = len([q for q in self.lore_data.quests if q.world_id == self.selected_world.id])
+        char_count = self.lore_data.characters.count_where('world_id', self.selected_world.id)
+        event_count = self.lore_data.events.count_where('world_id', self.selected_world.id)
+        item_count = self.lore_data.items.count_where('world_id', self.selected_world.id)
+        quest_count = self.lore_data.quests.count_where('world_id', self.selected_world.id)
 
         info += f"Entities:\n"
         info += f"- Characters: {char_count}\n"
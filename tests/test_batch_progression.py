@@ -0,0 +1,114 @@
+"""Tests for columnar batch progression simulation."""
+import numpy as np
+import pytest
+
+from src.application.use_cases.progression_simulation import create_sample_simulation
+from src.domain.entities.lore_axioms import LoreAxioms
+from src.domain.value_objects.common import EntityId, TenantId
+from src.domain.value_objects.progression import CharacterClass, EventType, StatType, TimePoint
+from src.infrastructure.batch_progression import BatchProgressionSimulator
+
+
+@pytest.fixture
+def batch():
+    """Six characters, two of each default class, with some starting stats."""
+    lore = LoreAxioms.create_default(TenantId(1), EntityId(1))
+    classes = [CharacterClass.WARRIOR, CharacterClass.MAGE, CharacterClass.ROGUE] * 2
+    return BatchProgressionSimulator.populate(
+        TenantId(1), EntityId(1), lore, 6, classes,
+        stats={StatType.STRENGTH: 95, StatType.INTELLECT: 10, StatType.AGILITY: 88},
+    )
+
+
+def test_matches_single_step_simulator():
+    """Test that a batch run ends where the same steps through ProgressionSimulator end."""
+    simulator = create_sample_simulation()
+    batch = BatchProgressionSimulator.from_simulator(simulator)
+    char_id = EntityId(1)
+
+    for xp in [60, 60, 200]:
+        simulator.simulate_experience_gain(char_id, xp, "quest")
+        simulator.simulate_level_up(char_id)
+        simulator.simulate_stat_increase(char_id, StatType.STRENGTH, 3, "training")
+        simulator.simulate_stat_increase(char_id, StatType.AGILITY, 3, "training")
+        batch.gain_experience(xp, source="quest")
+        batch.level_up()
+        batch.increase_stat(StatType.STRENGTH, 3)
+        batch.increase_stat(StatType.AGILITY, 3)
+
+    expected = simulator.current_state.get_character_state(char_id)
+    actual = batch.character_state(char_id)
+    assert (actual.level, actual.experience, actual.stats) == (expected.level, expected.experience, expected.stats)
+    assert [e.event_type for e in batch.iter_events(char_id)] == [e.event_type for e in simulator.event_history]
+
+
+def test_level_up_follows_required_xp(batch):
+    """Test that only rows with enough XP for an axiom-defined next level advance."""
+    batch.gain_experience(np.array([99, 100, 250, 100, 0, 500]))
+
+    assert list(batch.level_up()) == [1, 2, 3, 5]
+    assert list(batch.levels) == [1, 2, 2, 2, 1, 2]
+    assert list(batch.experience) == [99, 0, 0, 0, 0, 0]
+
+    batch.gain_experience(250)
+    assert len(batch.level_up()) == 6
+    batch.gain_experience(1000)
+    # No required_xp axiom for level 4, so level 3 is the cap
+    assert list(batch.level_up()) == [0, 4]
+    assert len(batch.level_up()) == 0
+    assert list(batch.levels) == [3] * 6
+
+
+def test_stat_increase_respects_bounds_and_classes(batch):
+    """Test max_stat bounds and class-stat relations as masks."""
+    changed = batch.increase_stat(StatType.STRENGTH, 5)
+    # Only warriors use strength, and 95 + 5 stays within the bound of 100
+    assert list(changed) == [0, 3]
+
+    assert len(batch.increase_stat(StatType.STRENGTH, 1)) == 0
+    assert list(batch.increase_stat(StatType.AGILITY, np.array([0, 0, 2, 0, 0, 3]))) == [2]
+    assert list(batch.stats[:, 2]) == [88, 88, 90, 88, 88, 88]
+
+
+def test_time_and_events_are_columnar(batch):
+    """Test that each operation is one time point and events are built lazily."""
+    batch.gain_experience(100, source="raid")
+    batch.level_up(where=np.array([True, False] * 3))
+
+    assert batch.time_point == TimePoint(2)
+    assert batch.log.count_by_type() == {EventType.QUEST_COMPLETE: 6, EventType.LEVEL_UP: 3}
+
+    events = list(batch.iter_events(EntityId(3)))
+    assert [(e.event_type, e.from_time, e.to_time) for e in events] == [
+        (EventType.QUEST_COMPLETE, TimePoint(0), TimePoint(1)),
+        (EventType.LEVEL_UP, TimePoint(1), TimePoint(2)),
+    ]
+    assert "raid" in events[0].description
+
+
+def test_converts_back_to_world_state(batch):
+    """Test that the population round-trips through WorldState."""
+    batch.gain_experience(100)
+    batch.level_up(where=np.arange(6) < 2)
+
+    world = batch.to_world_state()
+    assert world.time_point == TimePoint(2)
+    state = world.get_character_state(EntityId(1))
+    assert (state.level.value, state.time_point) == (2, TimePoint(2))
+    assert world.get_character_state(EntityId(6)).time_point == TimePoint(1)
+
+    reloaded = BatchProgressionSimulator.from_world_state(TenantId(1), batch.lore_axioms, world)
+    rows = [reloaded.row_of(EntityId(int(character_id))) for character_id in batch.ids]
+    assert np.array_equal(reloaded.levels[rows], batch.levels)
+    assert np.array_equal(reloaded.stats[rows], batch.stats)
+    assert np.array_equal(reloaded.changed_at[rows], batch.changed_at)
+
+
+def test_without_log(batch):
+    """Test that keep_log=False still advances state and time."""
+    batch.keep_log = False
+    batch.run(ticks=3, xp_per_tick=250)
+
+    assert batch.time_point == TimePoint(6)
+    assert len(batch.log) == 0
+    assert list(batch.levels) == [3] * 6
@@ -0,0 +1,264 @@
+"""Tests for bulk repository operations (save_many / find_many / delete_many)."""
+from dataclasses import dataclass
+from typing import Optional
+
+import pytest
+
+from src.domain.entities.note import Note
+from src.domain.entities.texture import Texture
+from src.domain.repositories.bulk import BulkOperationsMixin
+from src.domain.value_objects.common import TenantId, EntityId, ImagePath
+from src.infrastructure.in_memory_bulk import IdIndex, InMemoryBulkMixin
+from src.infrastructure.in_memory_repositories import (
+    InMemoryMiracleRepository, InMemoryNoteRepository, InMemoryTextureRepository,
+)
+from src.infrastructure.sqlite_bulk import SQLiteBulkMixin, chunked
+from src.infrastructure.sqlite_connection import SQLiteConnectionManager, SQLiteSettings
+from src.infrastructure.sqlite_repositories import SQLiteDatabase, SQLiteMiracleRepository
+
+
+@dataclass
+class Relic:
+    tenant_id: TenantId
+    world_id: EntityId
+    name: str
+    id: Optional[EntityId] = None
+
+
+class DictRelicRepository(InMemoryBulkMixin):
+    """Mirrors the generic in-memory repositories."""
+
+    def __init__(self):
+        self._entities = {}
+        self._next_id = 1
+
+    def save(self, entity):
+        if entity.id is None:
+            object.__setattr__(entity, 'id', EntityId(self._next_id))
+            self._next_id += 1
+        self._entities[(entity.tenant_id, entity.id)] = entity
+        return entity
+
+    def find_by_id(self, tenant_id, entity_id):
+        return self._entities.get((tenant_id, entity_id))
+
+    def delete(self, tenant_id, entity_id):
+        return self._entities.pop((tenant_id, entity_id), None) is not None
+
+
+class SQLiteRelicRepository(SQLiteBulkMixin):
+    """Mirrors the generic SQLite repositories."""
+
+    _table = "relics"
+
+    def __init__(self, db):
+        self.db = db
+
+    def save(self, entity):
+        with self.db.get_connection() as conn:
+            if entity.id is None:
+                cursor = conn.execute(
+                    "INSERT INTO relics (tenant_id, world_id, name) VALUES (?, ?, ?)",
+                    (entity.tenant_id.value, entity.world_id.value, entity.name),
+                )
+                object.__setattr__(entity, 'id', EntityId(cursor.lastrowid))
+            else:
+                conn.execute(
+                    "UPDATE relics SET name = ? WHERE id = ? AND tenant_id = ?",
+                    (entity.name, entity.id.value, entity.tenant_id.value),
+                )
+        return entity
+
+    def find_by_id(self, tenant_id, entity_id):
+        with self.db.get_connection() as conn:
+            row = conn.execute(
+                "SELECT * FROM relics WHERE id = ? AND tenant_id = ?",
+                (entity_id.value, tenant_id.value),
+            ).fetchone()
+            return self._row_to_entity(row) if row else None
+
+    def delete(self, tenant_id, entity_id):
+        with self.db.get_connection() as conn:
+            cursor = conn.execute(
+                "DELETE FROM relics WHERE id = ? AND tenant_id = ?",
+                (entity_id.value, tenant_id.value),
+            )
+            return cursor.rowcount > 0
+
+    def _row_to_entity(self, row):
+        return Relic(TenantId(row['tenant_id']), EntityId(row['world_id']), row['name'], EntityId(row['id']))
+
+
+@pytest.fixture
+def sqlite_repo(tmp_path):
+    db = SQLiteConnectionManager(str(tmp_path / "bulk.db"), SQLiteSettings())
+    with db.get_connection() as conn:
+        conn.execute(
+            "CREATE TABLE relics (id INTEGER PRIMARY KEY AUTOINCREMENT, tenant_id INTEGER, world_id INTEGER, name TEXT)"
+        )
+    yield SQLiteRelicRepository(db)
+    db.close()
+
+
+@pytest.fixture(params=["in_memory", "sqlite"])
+def repo(request, sqlite_repo):
+    if request.param == "in_memory":
+        return DictRelicRepository()
+    return sqlite_repo
+
+
+def make_relics(count, tenant=1):
+    return [Relic(TenantId(tenant), EntityId(1), f"Relic {i}") for i in range(count)]
+
+
+def test_save_many_assigns_ids_in_order(repo):
+    """Test that save_many populates sequential IDs and preserves order."""
+    saved = repo.save_many(make_relics(3))
+
+    assert [r.id.value for r in saved] == [1, 2, 3]
+    assert [r.name for r in saved] == ["Relic 0", "Relic 1", "Relic 2"]
+
+
+def test_find_many_preserves_request_order_and_skips_missing(repo):
+    """Test that find_many returns entities in the requested order."""
+    repo.save_many(make_relics(5))
+
+    found = repo.find_many(TenantId(1), [EntityId(4), EntityId(99), EntityId(2)])
+
+    assert [r.id.value for r in found] == [4, 2]
+
+
+def test_find_many_respects_tenant(repo):
+    """Test that find_many never returns another tenant's entities."""
+    repo.save_many(make_relics(2, tenant=1))
+
+    assert repo.find_many(TenantId(2), [EntityId(1), EntityId(2)]) == []
+
+
+def test_delete_many_counts_deleted(repo):
+    """Test that delete_many deletes existing entities and reports the count."""
+    repo.save_many(make_relics(4))
+
+    assert repo.delete_many(TenantId(1), [EntityId(1), EntityId(3), EntityId(42)]) == 2
+    assert [r.id.value for r in repo.find_many(TenantId(1), [EntityId(i) for i in range(1, 5)])] == [2, 4]
+
+
+def test_sqlite_find_many_chunks_large_id_lists(sqlite_repo):
+    """Test that more ids than one IN (...) chunk are fetched correctly."""
+    sqlite_repo.save_many(make_relics(1200))
+
+    ids = [EntityId(i) for i in range(1, 1201)]
+    assert len(sqlite_repo.find_many(TenantId(1), ids)) == 1200
+    assert sqlite_repo.delete_many(TenantId(1), ids) == 1200
+
+
+def test_sqlite_save_many_is_atomic(sqlite_repo):
+    """Test that a failing entity rolls back the whole batch."""
+    relics = make_relics(3)
+    relics[2].name = None
+    with sqlite_repo.db.get_connection() as conn:
+        conn.execute("CREATE TRIGGER no_null BEFORE INSERT ON relics WHEN NEW.name IS NULL "
+                     "BEGIN SELECT RAISE(ABORT, 'name required'); END")
+
+    with pytest.raises(Exception):
+        sqlite_repo.save_many(relics)
+
+    with sqlite_repo.db.get_connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM relics").fetchone()[0] == 0
+
+
+def test_default_mixin_uses_single_entity_methods():
+    """Test the interface defaults on a repository without bulk overrides."""
+
+    class PlainRepository(BulkOperationsMixin):
+        def __init__(self):
+            self.store = {}
+
+        def save(self, entity):
+            self.store[entity.id] = entity
+            return entity
+
+        def find_by_id(self, tenant_id, entity_id):
+            return self.store.get(entity_id)
+
+        def delete(self, tenant_id, entity_id):
+            return self.store.pop(entity_id, None) is not None
+
+    repo = PlainRepository()
+    relics = [Relic(TenantId(1), EntityId(1), "a", EntityId(1)), Relic(TenantId(1), EntityId(1), "b", EntityId(2))]
+
+    assert repo.save_many(relics) == relics
+    assert repo.find_many(TenantId(1), [EntityId(2)]) == [relics[1]]
+    assert repo.delete_many(TenantId(1), [EntityId(1), EntityId(5)]) == 1
+
+
+def test_id_index_behaves_like_ordered_list():
+    """Test that IdIndex supports the list operations the repositories use."""
+    index = IdIndex()
+    for i in [3, 1, 2]:
+        index.append(i)
+    index.append(1)  # duplicate append is a no-op
+
+    assert 1 in index
+    assert index[0:2] == [3, 1]
+    assert index[-1] == 2
+    index.remove(1)
+    assert list(index) == [3, 2]
+    with pytest.raises(ValueError):
+        index.remove(1)
+
+
+def test_chunked_splits_sequences():
+    assert [list(c) for c in chunked([1, 2, 3, 4, 5], 2)] == [[1, 2], [3, 4], [5]]
+
+
+@pytest.fixture
+def lore_db(tmp_path):
+    db = SQLiteDatabase(str(tmp_path / "lore.db"), SQLiteSettings())
+    db.initialize_schema()
+    with db.get_connection() as conn:
+        conn.execute("INSERT INTO worlds (tenant_id, name, created_at, updated_at) VALUES (1, 'Aerth', '', '')")
+    yield db
+    db.close()
+
+
+def test_sqlite_repository_bulk_operations(lore_db):
+    """Test save_many/delete_many on a repository from sqlite_repositories against the real schema."""
+    repo = SQLiteMiracleRepository(lore_db)
+
+    saved = repo.save_many(make_relics(600))
+    assert [r.id.value for r in saved[:3]] == [1, 2, 3]
+
+    assert repo.delete_many(TenantId(1), [r.id for r in saved[:550]] + [EntityId(9999)]) == 550
+    with lore_db.get_connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM miracles").fetchone()[0] == 50
+
+
+@pytest.mark.parametrize("make_repo", [InMemoryMiracleRepository, InMemoryNoteRepository])
+def test_in_memory_repository_bulk_operations(make_repo):
+    """Test the bulk methods of repositories from in_memory_repositories."""
+    repo = make_repo()
+    if make_repo is InMemoryNoteRepository:
+        entities = [Note.create(TenantId(1), EntityId(1), f"Note {i}", "Dragon lore") for i in range(4)]
+    else:
+        entities = make_relics(4)
+
+    saved = repo.save_many(entities)
+    ids = [entity.id for entity in saved]
+
+    assert repo.find_many(TenantId(1), ids[::-1] + [EntityId(99)]) == saved[::-1]
+    assert repo.find_many(TenantId(2), ids) == []
+    assert repo.delete_many(TenantId(1), ids[:3]) == 3
+    assert repo.find_many(TenantId(1), ids) == saved[3:]
+
+
+def test_texture_repository_find_many():
+    """Test that repositories which used to expose only get_by_id work with the bulk defaults."""
+    repo = InMemoryTextureRepository()
+    textures = repo.save_many([
+        Texture.create(TenantId(1), EntityId(1), f"Stone {i}", ImagePath(f"stone_{i}.png"), "diffuse", 1024)
+        for i in range(3)
+    ])
+
+    assert repo.find_many(TenantId(1), [textures[2].id, textures[0].id]) == [textures[2], textures[0]]
+    assert repo.get_by_id(TenantId(1), textures[1].id) == textures[1]
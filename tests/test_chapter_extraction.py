@@ -0,0 +1,103 @@
+"""Tests for single-pass chapter entity extraction."""
+from types import SimpleNamespace
+
+from src.infrastructure.chapter_extraction import (
+    ChapterExtractor,
+    NameAutomaton,
+    extract_chapters,
+    known_entities,
+    known_entities_from_sqlite,
+    tokenize,
+)
+from src.infrastructure.sqlite_repositories import SQLiteDatabase
+
+CHAPTER = (
+    'Kira stood at the gates of the Silver Keep. "Ready?" asked Marcus. '
+    "Marcus said nothing more. Far away, in Dark Hollow, the Elder Council met "
+    "to investigate the theft. Kira walked on."
+)
+
+
+def test_automaton_matches_overlapping_names():
+    """Test multi-word, nested and overlapping patterns in one scan."""
+    automaton = NameAutomaton()
+    for name in ["Silver Keep", "Keep", "Silver", "Silver Keep Gate"]:
+        automaton.add(name, "location")
+
+    tokens = tokenize("The Silver Keep Gate and the Silver Keep.")
+    found = sorted(automaton.scan(tokens))
+
+    assert found == [
+        (1, "Silver"), (1, "Silver Keep"), (1, "Silver Keep Gate"), (2, "Keep"),
+        (6, "Silver"), (6, "Silver Keep"), (7, "Keep"),
+    ]
+
+
+def test_counts_known_and_discovered_entities():
+    """Test mention counts for repository names and heuristic discoveries."""
+    extractor = ChapterExtractor({"Kira": "character", "Silver Keep": "location"})
+    entities = {e.get("name") or e["keyword"]: e for e in extractor.extract(CHAPTER).entities}
+
+    assert entities["Kira"] == {"type": "character", "name": "Kira", "mentions": 2}
+    assert entities["Silver Keep"]["mentions"] == 1
+    assert entities["Marcus"] == {"type": "character", "name": "Marcus", "mentions": 2}
+    assert entities["Dark Hollow"]["type"] == "location"
+    assert entities["investigate"]["type"] == "quest_keyword"
+    # Punctuation separates "Ready?" from "asked"
+    assert "Ready" not in entities
+
+
+def test_co_occurrence_window():
+    """Test that only characters within the window are related."""
+    text = "Kira met Marcus. " + "Nothing happened. " * 20 + "Aris arrived."
+    known = {"Kira": "character", "Marcus": "character", "Aris": "character"}
+
+    near = ChapterExtractor(known, window=10).extract(text).relationships
+    assert [(r["entity_a"], r["entity_b"], r["co_occurrences"]) for r in near] == [("Kira", "Marcus", 1)]
+
+    wide = ChapterExtractor(known, window=100).extract(text).relationships
+    assert len(wide) == 3
+    assert all(r["type"] == "mentioned_together" for r in wide)
+
+
+def test_parsed_data_layout():
+    """Test that the output has what validate_parse_output.py checks."""
+    data = ChapterExtractor().extract(CHAPTER).to_parsed_data("chapter_1")
+
+    assert data["chapter_id"] == "chapter_1"
+    assert isinstance(data["entities"], list)
+    assert data["word_count"] == len(CHAPTER.split())
+
+
+def test_known_entities_and_process_pool():
+    """Test loading names from repositories and extracting on a pool."""
+    repository = SimpleNamespace(
+        stream_by_world=lambda tenant_id, world_id: iter([SimpleNamespace(name="Kira")])
+    )
+    known = known_entities({"character": repository}, 1, 1)
+    assert known == {"Kira": "character"}
+
+    texts = [CHAPTER, "Kira rested. " * 10]
+    serial = extract_chapters(texts, known)
+    pooled = extract_chapters(texts, known, workers=2)
+    assert [e.entities for e in pooled] == [e.entities for e in serial]
+
+
+def test_known_entities_from_lore_database(tmp_path):
+    """Test reading names of one world from the initialized SQLite schema."""
+    db = SQLiteDatabase(str(tmp_path / "lore.db"))
+    db.initialize_schema()
+    with db.get_connection() as conn:
+        conn.execute("INSERT INTO worlds (tenant_id, name, created_at, updated_at) VALUES (1, 'Aerth', '', '')")
+        conn.execute("INSERT INTO worlds (tenant_id, name, created_at, updated_at) VALUES (1, 'Elsewhere', '', '')")
+        conn.executemany(
+            "INSERT INTO characters (tenant_id, world_id, name, created_at, updated_at) VALUES (?, ?, ?, '', '')",
+            [(1, 1, "Kira"), (1, 1, "Marcus"), (1, 2, "Stranger")],
+        )
+        conn.execute(
+            "INSERT INTO locations (tenant_id, world_id, name, created_at) VALUES (1, 1, 'Silver Keep', '')"
+        )
+        known = known_entities_from_sqlite(conn, 1, 1)
+    db.close()
+
+    assert known == {"Kira": "character", "Marcus": "character", "Silver Keep": "location"}
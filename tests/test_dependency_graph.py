@@ -0,0 +1,177 @@
+"""Tests for the incremental dependency graph."""
+import random
+import time
+
+import pytest
+
+from src.domain.entities.quest_chain import QuestChain
+from src.domain.entities.quest_node import QuestNode
+from src.domain.exceptions import CircularDependency, InvalidEntityOperation
+from src.domain.value_objects.common import TenantId, EntityId, Description
+from src.infrastructure.dependency_graph import IncrementalDAG
+from src.infrastructure.in_memory_repositories import InMemoryQuestNodeRepository
+from src.infrastructure.quest_chain_repository_manual import InMemoryQuestChainRepository
+
+
+def assert_topological(graph):
+    position = {node: i for i, node in enumerate(graph.topological_order())}
+    for node in position:
+        for successor in graph.successors(node):
+            assert position[node] < position[successor]
+
+
+def test_rejects_edge_closing_a_cycle():
+    """Test that a closing edge raises with the cycle and leaves the graph unchanged."""
+    graph = IncrementalDAG()
+    graph.add_edge("a", "b")
+    graph.add_edge("b", "c")
+
+    with pytest.raises(CircularDependency, match="c -> a -> b -> c"):
+        graph.add_edge("c", "a")
+    with pytest.raises(CircularDependency):
+        graph.add_edge("a", "a")
+
+    assert not graph.has_edge("c", "a")
+    assert graph.would_create_cycle("c", "a")
+    assert not graph.would_create_cycle("a", "c")
+
+
+def test_order_is_repaired_for_backward_edges():
+    """Test that edges added against insertion order keep a valid order."""
+    graph = IncrementalDAG()
+    for node in "abcde":
+        graph.add_node(node)
+    graph.add_edge("e", "a")
+    graph.add_edge("d", "e")
+    graph.add_edge("c", "b")
+
+    assert_topological(graph)
+    assert graph.ancestors("a") == {"d", "e"}
+    assert graph.descendants("d") == {"e", "a"}
+
+
+def test_set_predecessors_is_all_or_nothing():
+    """Test that a rejected parent change keeps the previous parents."""
+    graph = IncrementalDAG()
+    graph.set_predecessors("child", ["parent"])
+    graph.set_predecessors("grandchild", ["child"])
+
+    with pytest.raises(CircularDependency):
+        graph.set_predecessors("parent", ["other", "grandchild"])
+    assert graph.predecessors("parent") == set()
+    assert not graph.has_edge("other", "parent")
+
+    graph.set_predecessors("grandchild", ["parent"])
+    assert graph.predecessors("grandchild") == {"parent"}
+    assert graph.successors("child") == set()
+
+
+def test_remove_node_drops_its_edges():
+    """Test that removing a node unlinks it from both sides."""
+    graph = IncrementalDAG()
+    graph.add_edge(1, 2)
+    graph.add_edge(2, 3)
+
+    graph.remove_node(2)
+
+    assert 2 not in graph
+    assert graph.successors(1) == set() and graph.predecessors(3) == set()
+    graph.add_edge(3, 1)
+    assert_topological(graph)
+
+
+def test_matches_brute_force_on_random_edges():
+    """Test cycle decisions against a full reachability check."""
+    rng = random.Random(7)
+    graph = IncrementalDAG()
+    edges = {n: set() for n in range(40)}
+    for n in range(40):
+        graph.add_node(n)
+
+    def reachable(start, goal):
+        stack, seen = [start], {start}
+        while stack:
+            node = stack.pop()
+            if node == goal:
+                return True
+            for nxt in edges[node] - seen:
+                seen.add(nxt)
+                stack.append(nxt)
+        return False
+
+    for _ in range(400):
+        u, v = rng.randrange(40), rng.randrange(40)
+        expected_cycle = u == v or reachable(v, u)
+        if expected_cycle:
+            with pytest.raises(CircularDependency):
+                graph.add_edge(u, v)
+        else:
+            graph.add_edge(u, v)
+            edges[u].add(v)
+
+    assert_topological(graph)
+
+
+def test_bulk_import_is_not_quadratic():
+    """Test that loading a 20k-node tree in reverse order stays fast."""
+    graph = IncrementalDAG()
+    start = time.perf_counter()
+    # Children before parents: every edge disagrees with insertion order
+    for node in range(20000, 0, -1):
+        graph.add_node(node)
+    for node in range(2, 20001):
+        graph.set_predecessors(node, [node // 2])
+    elapsed = time.perf_counter() - start
+
+    assert len(graph) == 20000
+    assert graph.topological_order()[0] == 1
+    assert elapsed < 10
+
+
+def test_breadth_first_levels_follow_insertion_order():
+    """Test that subtree traversal yields each node once at its shortest depth."""
+    graph = IncrementalDAG()
+    graph.set_predecessors("guard", ["order"])
+    graph.set_predecessors("scouts", ["order"])
+    graph.set_predecessors("archers", ["guard", "scouts"])
+    graph.set_predecessors("rivals", [])
+
+    assert list(graph.breadth_first("order")) == [
+        ("order", 0), ("guard", 1), ("scouts", 1), ("archers", 2),
+    ]
+    assert list(graph.breadth_first("scouts")) == [("scouts", 0), ("archers", 1)]
+    assert list(graph.breadth_first("missing")) == []
+
+
+def save_quests(nodes, prerequisites):
+    """Save one quest node per entry of ``prerequisites`` (prerequisite indexes)."""
+    quests = [
+        nodes.save(QuestNode.create(TenantId(1), EntityId(1), EntityId(1), f"Quest {i}",
+                                    Description("..."), [EntityId(1)], position=i))
+        for i in range(len(prerequisites))
+    ]
+    for quest, prereqs in zip(quests, prerequisites):
+        quest.prerequisite_ids.extend(quests[i].id for i in prereqs)
+    return [quest.id for quest in quests]
+
+
+def make_chain(quest_ids):
+    return QuestChain.create(TenantId(1), EntityId(1), "Chain", Description("..."), quest_ids)
+
+
+def test_quest_chain_repository_orders_and_rejects_cycles():
+    """Test that saving a chain orders its quests and rejects cyclic prerequisites."""
+    nodes = InMemoryQuestNodeRepository()
+    chains = InMemoryQuestChainRepository(nodes)
+
+    ids = save_quests(nodes, [[2], [], [1]])
+    chain = chains.save(make_chain(ids))
+    assert chains.get_chain_order(TenantId(1), chain.id) == [ids[1], ids[2], ids[0]]
+
+    cyclic = save_quests(nodes, [[2], [0], [1]])
+    with pytest.raises(CircularDependency):
+        chains.save(make_chain(cyclic))
+    assert chains.list_by_world(TenantId(1), EntityId(1)) == [chain]
+
+    with pytest.raises(InvalidEntityOperation):
+        chains.save(make_chain([EntityId(99)]))
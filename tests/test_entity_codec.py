@@ -0,0 +1,141 @@
+"""Tests for the compiled per-class entity encoders and decoders."""
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from src.domain.entities.character import Character
+from src.domain.entities.event import Event
+from src.domain.value_objects.ability import Ability, AbilityName, PowerLevel
+from src.domain.value_objects.common import (
+    Backstory, CharacterName, DateRange, Description, EntityId, EventOutcome, TenantId, Timestamp,
+)
+from src.infrastructure.entity_codec import EntityCodec, dumps, loads
+
+START = datetime(2024, 5, 1, tzinfo=timezone.utc)
+
+
+def reflective_encode(entity, date_ranges_as_dicts=False, stringify_values=False):
+    """The __dict__ walk the MCP server and JSON persistence used before."""
+    if entity is None:
+        return None
+    result = {}
+    for name, value in entity.__dict__.items():
+        if value is None:
+            result[name] = None
+        elif date_ranges_as_dicts and isinstance(value, DateRange):
+            result[name] = {
+                'start_date': value.start_date.value.isoformat(),
+                'end_date': value.end_date.value.isoformat() if value.end_date else None,
+            }
+        elif hasattr(value, 'value'):
+            inner = value.value
+            if isinstance(inner, datetime):
+                result[name] = inner.isoformat()
+            elif stringify_values and not isinstance(inner, (str, int, float, bool)):
+                result[name] = str(inner)
+            else:
+                result[name] = inner
+        elif isinstance(value, (str, int, float, bool)):
+            result[name] = value
+        elif isinstance(value, datetime):
+            result[name] = value.isoformat()
+        elif isinstance(value, list):
+            result[name] = [
+                reflective_encode(item, date_ranges_as_dicts, stringify_values) if hasattr(item, '__dict__')
+                else item.value if hasattr(item, 'value')
+                else str(item)
+                for item in value
+            ]
+        else:
+            result[name] = str(value)
+    return result
+
+
+class Mood(str, Enum):
+    CALM = "calm"
+    ANGRY = "angry"
+
+
+@dataclass
+class Node:
+    id: EntityId
+    mood: Mood
+    scores: List[int]
+    tags: List[str]
+    weights: Dict[str, float]
+    position: Tuple[float, float]
+    children: List['Node'] = field(default_factory=list)
+    seen_at: Optional[datetime] = None
+    note: Optional[str] = None
+
+
+def make_character():
+    character = Character.create(TenantId(1), EntityId(3), CharacterName("Aria"), Backstory("B" * 120))
+    character.abilities.append(Ability(AbilityName("Flame"), "Burns", PowerLevel(7)))
+    return character
+
+
+def make_event():
+    return Event.create(
+        TenantId(1), EntityId(3), "Siege", Description("The walls fall"),
+        Timestamp(START), [EntityId(5), EntityId(6)],
+        end_date=Timestamp(START.replace(day=9)), outcome=EventOutcome.SUCCESS,
+    )
+
+
+def make_node():
+    leaf = Node(EntityId(2), Mood.ANGRY, [3], ["x"], {}, (0.0, 1.0), seen_at=START)
+    return Node(EntityId(1), Mood.CALM, [1, 2], ["a", "b"], {"w": 0.5}, (1.5, 2.5), [leaf], note="root")
+
+
+@pytest.mark.parametrize("options", [{}, {'date_ranges_as_dicts': True, 'stringify_values': True}])
+@pytest.mark.parametrize("make", [make_character, make_event, make_node])
+def test_matches_reflective_encoding(make, options):
+    """Test that compiled encoders reproduce the reflective output exactly."""
+    entity = make()
+    codec = EntityCodec(**options)
+
+    assert codec.encode(entity) == reflective_encode(entity, **options)
+    # Again with the cached encoder
+    assert codec.encode(entity) == reflective_encode(entity, **options)
+
+
+def test_values_that_do_not_match_annotations_fall_back():
+    node = make_node()
+    node.note = EntityId(9)
+    node.scores = "not a list"
+    node.tags = [Mood.CALM, "b"]
+    codec = EntityCodec()
+
+    assert codec.encode(node) == reflective_encode(node)
+
+    node.extra = 1
+    assert codec.encode(node)['extra'] == 1
+
+
+def test_encoders_are_compiled_once_per_class():
+    codec = EntityCodec()
+    assert codec.encoder(Character) is codec.encoder(Character)
+    assert codec.encode(None) is None
+
+
+def test_decode_round_trip():
+    codec = EntityCodec(date_ranges_as_dicts=True)
+    character, event = make_character(), make_event()
+
+    assert codec.decode(Character, codec.encode(character)) == character
+    decoded = codec.decode(Event, codec.encode(event))
+    assert decoded.date_range == event.date_range
+    assert decoded.participant_ids == event.participant_ids
+    assert codec.decode(Node, codec.encode(make_node())).children[0].scores == [3]
+
+
+def test_dumps_and_loads():
+    data = {'name': "Ærin", 'ids': [1, 2]}
+
+    assert loads(dumps(data)) == data
+    assert "Ærin" in dumps(data, indent=True)
+    assert dumps(data, indent=True).startswith('{\n  "name"')
@@ -0,0 +1,153 @@
+"""Tests for the indexed entity collection behind LoreData."""
+import copy
+import json
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from src.domain.entities.map import Map
+from src.domain.entities.note import Note
+from src.domain.entities.requirement import Requirement
+from src.domain.entities.session import Session
+from src.domain.entities.tokenboard import Tokenboard
+from src.domain.value_objects.common import EntityId, SessionName, TenantId, Timestamp
+from src.presentation.gui.entity_collection import EntityCollection
+from src.presentation.gui.lore_data import SECTIONS, LoreData
+
+SAMPLE_LORE = Path(__file__).resolve().parent.parent / "examples" / "sample_lore.json"
+
+
+@dataclass
+class Record:
+    id: Optional[EntityId]
+    world_id: EntityId
+    name: str = ""
+
+
+def make(n, worlds=3):
+    return [Record(EntityId(i), EntityId(i % worlds + 1), f"R{i}") for i in range(1, n + 1)]
+
+
+def test_behaves_like_a_list():
+    """Test that existing list callers see no difference."""
+    records = make(5)
+    collection = EntityCollection(records)
+
+    assert collection == records
+    assert EntityCollection() == []
+    assert [r.name for r in collection] == [r.name for r in records]
+    assert collection[1:3] == records[1:3]
+    assert isinstance(collection, list)
+
+
+def test_id_and_foreign_key_lookups():
+    collection = EntityCollection(make(9))
+
+    assert collection.get(EntityId(4)).name == "R4"
+    assert collection.get(EntityId(99)) is None
+    assert [r.name for r in collection.where('world_id', EntityId(1))] == ["R3", "R6", "R9"]
+    assert collection.count_where('world_id', EntityId(2)) == 3
+    assert collection.first_where('world_id', EntityId(3)).name == "R2"
+    assert collection.where('session_id', EntityId(1)) == []
+
+    with pytest.raises(KeyError):
+        collection.where('faction_id', EntityId(1))
+
+
+def test_mutations_keep_indexes_current():
+    """Test append, replace, delete, pop, slices and remove_id."""
+    collection = EntityCollection(make(6))
+
+    collection.append(Record(EntityId(7), EntityId(1), "R7"))
+    assert collection.get(EntityId(7)).name == "R7"
+
+    replacement = Record(EntityId(2), EntityId(1), "R2b")
+    collection[1] = replacement
+    assert collection.get(EntityId(2)) is replacement
+    assert replacement in collection.where('world_id', EntityId(1))
+    assert collection.count_where('world_id', EntityId(3)) == 1
+
+    del collection[0]
+    assert collection.get(EntityId(1)) is None
+    collection.pop()
+    assert collection.get(EntityId(7)) is None
+
+    removed = collection.remove_id(EntityId(4))
+    assert removed.name == "R4" and removed not in collection
+    assert collection.remove_id(EntityId(4)) is None
+
+    collection[:] = make(2)
+    assert collection.get(EntityId(5)) is None
+    assert collection.get(EntityId(2)).name == "R2"
+
+    collection.clear()
+    assert collection.where('world_id', EntityId(1)) == []
+
+
+def test_reindex_after_in_place_change():
+    collection = EntityCollection(make(3))
+    record = collection.get(EntityId(1))
+
+    record.world_id = EntityId(3)
+    collection.reindex(record)
+    assert record in collection.where('world_id', EntityId(3))
+    assert record not in collection.where('world_id', EntityId(2))
+
+
+def test_copies_keep_indexes():
+    collection = EntityCollection(make(4), indexes=('world_id',))
+    clone = copy.deepcopy(collection)
+
+    assert clone.indexes == ('world_id',)
+    assert clone.get(EntityId(3)).name == "R3"
+
+
+def test_lore_data_lists_are_collections():
+    """Test that LoreData keeps every entity list indexed, however it was filled."""
+    lore = LoreData()
+    lore.from_dict(json.loads(SAMPLE_LORE.read_text()))
+
+    assert all(isinstance(getattr(lore, key), EntityCollection) for key, _ in SECTIONS)
+    world = lore.worlds[0]
+    assert lore.get_world_by_id(world.id) is world
+    assert lore.get_characters_by_world(world.id) == [c for c in lore.characters if c.world_id == world.id]
+
+    # A list assigned later (tabs reset lists) is wrapped too
+    lore.items = list(lore.items[:2])
+    assert isinstance(lore.items, EntityCollection)
+    assert lore.items.get(lore.items[1].id) is lore.items[1]
+
+    copy_of = LoreData()
+    copy_of.update_from(lore)
+    assert copy_of.to_dict() == lore.to_dict()
+
+
+def test_lore_data_add_methods_append():
+    """Test the add_* methods that used to call list.remove() on the new entity."""
+    tenant, world = TenantId(1), EntityId(1)
+    lore = LoreData()
+    added = [
+        lore.add_map(Map.create(tenant, world, "Overworld", description="The known world")),
+        lore.add_note(Note.create(tenant, world, "Todo", "Name the villain")),
+        lore.add_requirement(Requirement.create(tenant, "Every quest has a reward")),
+        lore.add_session(Session.create(
+            tenant_id=tenant,
+            world_id=world,
+            name=SessionName("Session 1"),
+            description="",
+            player_ids=[EntityId(100)],
+            gm_id=EntityId(99),
+            scheduled_start=Timestamp(datetime.now(timezone.utc) + timedelta(days=1)),
+            estimated_duration_hours=3.0,
+        )),
+        lore.add_tokenboard(Tokenboard.create(tenant, world, "Initiative")),
+    ]
+
+    for key, entity in zip(('maps', 'notes', 'requirements', 'sessions', 'tokenboards'), added):
+        assert entity.id is not None
+        assert getattr(lore, key) == [entity]
+        assert getattr(lore, key).get(entity.id) is entity
+    assert lore.sessions.where('world_id', world) == [added[3]]
@@ -0,0 +1,173 @@
+"""Tests for the FTS5 and in-memory full-text search backends."""
+import sqlite3
+
+import pytest
+
+from src.domain.entities.note import Note
+from src.domain.value_objects.common import TenantId, EntityId
+from src.infrastructure.in_memory_repositories import InMemoryNoteRepository
+from src.infrastructure.in_memory_search import TextIndex
+from src.infrastructure.sqlite_fts import create_fts_tables, fts_search, match_expression
+from src.infrastructure.sqlite_repositories import SQLiteDatabase, SQLiteNoteRepository
+
+
+TENANT = TenantId(1)
+
+NOTES = [
+    (1, "Dragons of the North", "The red dragon burns the village of Émberfall at dawn."),
+    (1, "Elven Archives", "Ancient elves guard the dragon eggs beneath the library."),
+    (1, "Harbor Gossip", "Sailors whisper about smuggled spices."),
+    (2, "Dragons", "Another tenant's dragon lore."),
+]
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    conn.execute(
+        "CREATE TABLE notes (id INTEGER PRIMARY KEY AUTOINCREMENT, tenant_id INTEGER, title TEXT, content TEXT)"
+    )
+    # Rows written before the index exists must be picked up by the rebuild
+    conn.execute("INSERT INTO notes (tenant_id, title, content) VALUES (?, ?, ?)", NOTES[0])
+    create_fts_tables(conn, {"notes": ("title", "content")})
+    conn.executemany("INSERT INTO notes (tenant_id, title, content) VALUES (?, ?, ?)", NOTES[1:])
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def index():
+    index = TextIndex("title", "content")
+    for i, (tenant, title, content) in enumerate(NOTES, start=1):
+        index.add((TenantId(tenant), i), title=title, content=content)
+    return index
+
+
+def ids(rows):
+    return [row["id"] for row in rows]
+
+
+def keys(matches):
+    return [key[1] for key, _ in matches]
+
+
+def in_tenant(key):
+    return key[0] == TENANT
+
+
+def test_match_expression_quotes_user_input():
+    """Test that FTS5 syntax in user input is treated as plain words."""
+    assert match_expression('drag "OR" -x*') == '"drag"* AND "or"* AND "x"*'
+    assert match_expression("fire", columns=["title"]) == '{title} : ("fire"*)'
+    assert match_expression("  ...  ") is None
+
+
+def test_sqlite_prefix_search_is_ranked_and_tenant_scoped(conn):
+    """Test prefix matching, bm25 ordering and tenant filtering."""
+    rows = fts_search(conn, "notes", TENANT, "drag")
+
+    assert ids(rows) == [1, 2]
+    assert rows[0]["fts_rank"] <= rows[1]["fts_rank"]
+
+
+def test_sqlite_search_requires_every_word(conn):
+    """Test that all query words must match."""
+    assert ids(fts_search(conn, "notes", TENANT, "dragon eggs")) == [2]
+
+
+def test_sqlite_search_restricted_to_columns(conn):
+    """Test that a column filter ignores matches in other columns."""
+    assert ids(fts_search(conn, "notes", TENANT, "dragon", columns=["title"])) == [1]
+
+
+def test_sqlite_snippet_highlights_matches(conn):
+    """Test that snippets wrap matched words."""
+    [row] = fts_search(conn, "notes", TENANT, "spice")
+
+    assert "[spices]" in row["fts_snippet"]
+
+
+def test_sqlite_triggers_follow_updates_and_deletes(conn):
+    """Test that the index stays in sync with the content table."""
+    conn.execute("UPDATE notes SET content = 'Nothing scaly here.' WHERE id = 2")
+    conn.execute("DELETE FROM notes WHERE id = 1")
+
+    assert ids(fts_search(conn, "notes", TENANT, "dragon")) == []
+    assert ids(fts_search(conn, "notes", TENANT, "scaly")) == [2]
+
+
+def test_sqlite_search_ignores_diacritics(conn):
+    """Test that accented words match unaccented queries."""
+    assert ids(fts_search(conn, "notes", TENANT, "emberfall")) == [1]
+
+
+def test_text_index_matches_sqlite_behaviour(index):
+    """Test prefix, AND semantics, column filters and diacritics in memory."""
+    assert keys(index.search("drag", where=in_tenant)) == [1, 2]
+    assert keys(index.search("dragon eggs", where=in_tenant)) == [2]
+    assert keys(index.search("dragon", fields=["title"], where=in_tenant)) == [1]
+    assert keys(index.search("EMBERFALL")) == [1]
+    assert index.search("") == []
+
+
+def test_text_index_ranks_denser_matches_first():
+    """Test that BM25 prefers documents where the term is more prominent."""
+    index = TextIndex("content")
+    index.add("long", content="dragon " + "filler " * 40)
+    index.add("short", content="dragon dragon lair")
+
+    assert [key for key, _ in index.search("dragon")] == ["short", "long"]
+
+
+def test_text_index_reindex_and_remove(index):
+    """Test that re-adding replaces old text and remove forgets it."""
+    index.add((TENANT, 3), title="Harbor Gossip", content="Pirates and dragons")
+    assert keys(index.search("spices")) == []
+    assert 3 in keys(index.search("dragons", where=in_tenant))
+
+    index.remove((TENANT, 3))
+    index.remove((TENANT, 3))  # removing twice is a no-op
+    assert 3 not in keys(index.search("dragons"))
+    assert (TENANT, 3) not in index
+
+
+def test_text_index_snippet(index):
+    """Test that snippets highlight matches and mark truncation."""
+    snippet = index.snippet((TENANT, 2), "egg", ["content"])
+
+    assert "[eggs]" in snippet
+    assert index.snippet((TENANT, 3), "dragon") == ""
+
+    long_index = TextIndex("content")
+    long_index.add(1, content=" ".join(f"word{i}" for i in range(40)) + " treasure " + "tail " * 20)
+    snippet = long_index.snippet(1, "treasure")
+    assert snippet.startswith("…") and snippet.endswith("…")
+    assert "[treasure]" in snippet
+
+
+@pytest.fixture(params=["in_memory", "sqlite"])
+def note_repo(request, tmp_path):
+    if request.param == "in_memory":
+        yield InMemoryNoteRepository()
+        return
+    db = SQLiteDatabase(str(tmp_path / "lore.db"))
+    db.initialize_schema()
+    with db.get_connection() as conn:
+        conn.execute("INSERT INTO worlds (tenant_id, name, created_at, updated_at) VALUES (1, 'Aerth', '', '')")
+    yield SQLiteNoteRepository(db)
+    db.close()
+
+
+def test_note_repository_search_by_content(note_repo):
+    """Test search_by_content on both note repositories."""
+    for tenant, title, content in NOTES:
+        note_repo.save(Note.create(TenantId(tenant), EntityId(1), title, content))
+
+    found = note_repo.search_by_content(TENANT, "drag")
+    [hit] = note_repo.search_ranked(TENANT, "eggs")
+
+    assert [note.title for note in found] == ["Dragons of the North", "Elven Archives"]
+    assert hit.entity.title == "Elven Archives"
+    assert "[eggs]" in hit.snippet
+    assert note_repo.search_by_content(TENANT, "") == []
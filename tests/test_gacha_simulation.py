@@ -0,0 +1,92 @@
+"""Tests for the Monte Carlo gacha simulation."""
+import numpy as np
+import pytest
+
+from src.domain.entities.banner import Banner
+from src.domain.value_objects.common import Description, TenantId
+from src.infrastructure.gacha_simulation import GachaRates, GachaSimulator
+
+
+@pytest.fixture
+def banner():
+    return Banner.create_standard_banner(TenantId(1), "Standard Wish", Description("Permanent banner"))
+
+
+@pytest.fixture
+def rates(banner):
+    return GachaRates.from_banner(banner)
+
+
+def test_gap_distribution(rates):
+    """Test the base rate, the soft-pity ramp and certainty at hard pity."""
+    p = rates.ssr_probabilities()
+    assert p[1] == pytest.approx(0.006)
+    assert p[75] == pytest.approx(0.006)
+    assert p[76] == pytest.approx(0.066)
+    assert p[90] == 1.0
+
+    cdf = rates.gap_cdf()
+    assert cdf[0] == 0.0 and cdf[-1] == 1.0
+    assert np.all(np.diff(cdf) >= 0)
+
+
+def test_cost_matches_banner(banner, rates):
+    """Test that gem costs use the same ten-pull rule as the banner."""
+    assert rates.cost_of(banner.hard_pity_threshold) == banner.calculate_total_cost_for_pity("hard")
+    assert rates.cost_of(banner.featured_guarantee_pity) == banner.calculate_total_cost_for_pity("featured")
+
+
+def test_pity_bounds_and_mean(rates):
+    """Test hard pity, the featured guarantee and the mean SSR gap."""
+    result = GachaSimulator(rates, seed=1).until_featured(200_000)
+
+    assert (result.pulls >= 1).all()
+    assert result.pulls.max() <= rates.featured_guarantee_pity
+    assert (result.featured == 1).all()
+    assert (result.ssr <= 2).all()
+    # Half the players win the first 50/50
+    assert (result.ssr == 1).mean() == pytest.approx(0.5, abs=0.01)
+
+    gaps = result.pulls[result.ssr == 1]
+    assert gaps.max() <= rates.hard_pity_threshold
+    assert gaps.mean() == pytest.approx(rates.expected_pulls_per_ssr(), rel=0.01)
+
+
+def test_budget_featured_share(rates):
+    """Test that with the 50/50 guarantee two SSRs in three are featured."""
+    result = GachaSimulator(rates, seed=2).with_budget(50_000, pulls=600)
+
+    assert (result.pulls == 600).all()
+    # Slightly under 2/3 over a finite budget: every player starts on a 50/50
+    assert result.featured.sum() / result.ssr.sum() == pytest.approx(2 / 3, abs=0.02)
+    low, median, high = result.featured_rate_percentiles((10, 50, 90)).values()
+    assert 0.5 <= low <= median <= high <= 1.0
+    assert result.expected_gems_to_featured() == pytest.approx(
+        result.gems.sum() / result.featured.sum()
+    )
+    counts, edges = result.cost_distribution(bins=5)
+    assert counts.sum() == len(result)
+
+
+def test_starting_pity_and_guarantee(rates):
+    """Test that carried-over pity and a lost 50/50 shorten the run."""
+    result = GachaSimulator(rates, seed=3).until_featured(
+        10_000, start_pity=89, start_guaranteed=True
+    )
+    assert (result.pulls == 1).all()
+    assert not result.guaranteed.any()
+
+    with pytest.raises(ValueError):
+        GachaSimulator(rates).until_featured(10, start_pity=90)
+
+
+def test_seeded_results_independent_of_workers(rates):
+    """Test that a seed reproduces the same players in-process and on a pool."""
+    serial = GachaSimulator(rates, seed=42, chunk_size=1_000).until_featured(3_000, copies=2)
+    again = GachaSimulator(rates, seed=42, chunk_size=1_000).until_featured(3_000, copies=2)
+    pooled = GachaSimulator(rates, seed=42, chunk_size=1_000, workers=2).until_featured(3_000, copies=2)
+
+    assert np.array_equal(serial.pulls, again.pulls)
+    assert np.array_equal(serial.pulls, pooled.pulls)
+    assert np.array_equal(serial.featured, pooled.featured)
+    assert (serial.featured == 2).all()
@@ -0,0 +1,93 @@
+"""Tests that entities and repositories load lazily, keeping cold start cheap."""
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.infrastructure.repository_registry import RepositoryRegistry
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Generous enough for a slow CI machine
+IMPORT_BUDGET_SECONDS = 1.5
+# src, domain, the entities package and a handful of value objects
+MODULE_BUDGET = 20
+
+
+def _cold_import(statements: str) -> dict:
+    code = f"""
+import json, sys, time
+start = time.perf_counter()
+{statements}
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "elapsed": elapsed,
+    "modules": sorted(m for m in sys.modules if m == "src" or m.startswith("src.")),
+}}))
+"""
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_cold_import_budget():
+    """Test that importing the packages loads no entity or repository modules."""
+    report = _cold_import("import src, src.domain.entities, src.infrastructure")
+
+    assert report["elapsed"] < IMPORT_BUDGET_SECONDS
+    assert len(report["modules"]) <= MODULE_BUDGET
+    assert "src.infrastructure.sqlite_repositories" not in report["modules"]
+    assert "src.infrastructure.in_memory_repositories" not in report["modules"]
+    assert not [m for m in report["modules"] if m.startswith("src.domain.entities.")]
+
+
+def test_entity_loaded_on_first_access():
+    """Test that accessing one entity imports only its own module."""
+    report = _cold_import("from src.domain.entities import Character")
+
+    entity_modules = [m for m in report["modules"] if m.startswith("src.domain.entities.")]
+    assert entity_modules == ["src.domain.entities.character"]
+
+
+def test_repository_port_loaded_alone():
+    """Test that importing one port module does not load every repository interface."""
+    report = _cold_import("from src.domain.repositories.unit_of_work import IUnitOfWork")
+
+    port_modules = [m for m in report["modules"] if m.startswith("src.domain.repositories.")]
+    assert port_modules == ["src.domain.repositories.unit_of_work"]
+
+
+def test_unknown_entity_raises_attribute_error():
+    import src.domain.entities as entities
+
+    with pytest.raises(AttributeError):
+        entities.NoSuchEntity
+
+
+def test_registry_constructs_on_first_use():
+    """Test that factories run once, on first lookup, dependencies first."""
+    calls = []
+    registry = RepositoryRegistry()
+    registry.register("db", lambda: calls.append("db") or {"name": "db"})
+    registry.register_class("items", "collections:OrderedDict", "db")
+
+    assert calls == []
+    assert "items" in registry and not registry.is_loaded("items")
+
+    items = registry.items
+    assert list(items) == ["name"]
+    assert registry.get("items") is items
+    assert calls == ["db"]
+    assert sorted(registry.loaded()) == ["db", "items"]
+
+    with pytest.raises(AttributeError):
+        registry.missing_repo
+    with pytest.raises(ValueError):
+        registry.register("db", dict)
@@ -0,0 +1,89 @@
+"""Tests for undoing in-memory repository changes."""
+from dataclasses import dataclass
+from typing import Optional
+
+import pytest
+
+from src.domain.value_objects.common import TenantId, EntityId
+from src.infrastructure.in_memory_bulk import InMemoryBulkMixin
+from src.infrastructure.repository_registry import RepositoryRegistry
+
+TENANT = TenantId(1)
+
+
+@dataclass
+class Relic:
+    tenant_id: TenantId
+    name: str
+    id: Optional[EntityId] = None
+
+
+class RelicRepository(InMemoryBulkMixin):
+    """Returns the stored relics themselves, like the in-memory repositories."""
+
+    def __init__(self):
+        self._entities = {}
+        self._next_id = 1
+
+    def save(self, entity):
+        if entity.id is None:
+            object.__setattr__(entity, 'id', EntityId(self._next_id))
+            self._next_id += 1
+        self._entities[(entity.tenant_id, entity.id)] = entity
+        return entity
+
+    def find_by_id(self, tenant_id, entity_id):
+        return self._entities.get((tenant_id, entity_id))
+
+    def delete(self, tenant_id, entity_id):
+        return self._entities.pop((tenant_id, entity_id), None) is not None
+
+    def names(self):
+        return sorted(relic.name for relic in self._entities.values())
+
+
+@pytest.fixture
+def registry():
+    registry = RepositoryRegistry()
+    registry.register("relic_repo", RelicRepository)
+    registry.relic_repo.save_many([Relic(TENANT, "Sunblade"), Relic(TENANT, "Moonstone")])
+    return registry
+
+
+def test_failed_block_restores_touched_and_deletes_created(registry):
+    with pytest.raises(RuntimeError):
+        with registry.undo_on_error():
+            relics = registry.relic_repo
+            relics.find_by_id(TENANT, EntityId(1)).name = "Dawnblade"
+            relics.save(Relic(TENANT, "Starshard"))
+            relics.delete(TENANT, EntityId(2))
+            raise RuntimeError("interrupted")
+
+    assert registry.relic_repo.names() == ["Moonstone", "Sunblade"]
+
+
+def test_successful_block_keeps_changes(registry):
+    with registry.undo_on_error():
+        registry.relic_repo.find_by_id(TENANT, EntityId(1)).name = "Dawnblade"
+        registry.relic_repo.save_many([Relic(TENANT, "Starshard")])
+
+    assert registry.relic_repo.names() == ["Dawnblade", "Moonstone", "Starshard"]
+    # Outside a block the repository itself is handed out
+    assert type(registry.relic_repo) is RelicRepository
+
+
+def test_nested_blocks_work_like_savepoints(registry):
+    with pytest.raises(RuntimeError):
+        with registry.undo_on_error():
+            registry.relic_repo.find_by_id(TENANT, EntityId(1)).name = "Dawnblade"
+            with pytest.raises(ValueError):
+                with registry.undo_on_error():
+                    registry.relic_repo.delete_many(TENANT, [EntityId(2)])
+                    raise ValueError("inner")
+            assert registry.relic_repo.names() == ["Dawnblade", "Moonstone"]
+
+            with registry.undo_on_error():
+                registry.relic_repo.find_many(TENANT, [EntityId(2)])[0].name = "Moonshard"
+            raise RuntimeError("outer")
+
+    assert registry.relic_repo.names() == ["Moonstone", "Sunblade"]
@@ -0,0 +1,175 @@
+"""Tests for the MCP server, run through its list_tools/call_tool entry points."""
+import asyncio
+import importlib
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("mcp.server")
+
+SERVER_MODULE = "lore_mcp_server.mcp_server.server"
+BASE_CONFIG = Path(__file__).resolve().parent.parent / "lore_mcp_server" / "config.json"
+TENANT = "1"
+
+
+@pytest.fixture
+def load_server(tmp_path, monkeypatch):
+    """Import a fresh server module configured for ``connection_type``."""
+    loaded = []
+
+    def load(connection_type="in_memory"):
+        config = json.loads(BASE_CONFIG.read_text())
+        config["repository"] = {"connection_type": connection_type, "database_path": str(tmp_path / "lore.db")}
+        config["persistence"] = {**config["persistence"], "data_dir": str(tmp_path / "lore_data")}
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps(config))
+        monkeypatch.setenv("LORE_MCP_CONFIG", str(config_path))
+
+        sys.modules.pop(SERVER_MODULE, None)
+        server = importlib.import_module(SERVER_MODULE)
+        loaded.append(server)
+        return server
+
+    yield load
+    for server in loaded:
+        server.tool_executor.shutdown()
+        server.persistence.close()
+    sys.modules.pop(SERVER_MODULE, None)
+
+
+@pytest.fixture
+def server(load_server):
+    return load_server()
+
+
+def call(server, tool, /, **arguments):
+    [content] = asyncio.run(server.call_tool(tool, arguments))
+    return json.loads(content.text)
+
+
+def tool_names(server):
+    return {tool.name for tool in asyncio.run(server.list_tools())}
+
+
+def create_world(server, name="Aeloria"):
+    return call(server, "create_world", tenant_id=TENANT, name=name, description="Floating isles")["world"]
+
+
+def test_search_tools_rank_in_memory(server):
+    """Test ranked search through the MCP tools with in-memory repositories."""
+    world = create_world(server)
+    for name in ("Sunforged Blade", "Moonlit Dagger", "Sunstone Amulet"):
+        call(server, "create_item", tenant_id=TENANT, world_id=world["id"], name=name,
+             description="Relic", item_type="weapon")
+
+    result = call(server, "search_items", tenant_id=TENANT, search_term="sun")
+
+    assert result["success"] and result["count"] == 2
+    assert {hit["name"] for hit in result["items"]} == {"Sunforged Blade", "Sunstone Amulet"}
+    assert all(hit["snippet"].startswith("[Sun") for hit in result["items"])
+
+
+def test_sqlite_mode_does_not_offer_unimplemented_search(load_server):
+    """Test that search tools backed by abstract SQLite repositories are not offered."""
+    server = load_server("sqlite")
+
+    names = tool_names(server)
+    assert not names & server.IN_MEMORY_ONLY_TOOLS
+    assert names == set(server.tool_registry.names())
+    assert call(server, "search_items", tenant_id=TENANT, search_term="sun")["type"] == "UnknownTool"
+
+
+def test_registry_matches_listed_tools(server):
+    """Test that every listed tool has a handler and every handler is listed."""
+    assert set(server.tool_registry.names()) == tool_names(server)
+
+
+def test_world_tools_round_trip(server):
+    """Test creating, fetching and listing a world through call_tool."""
+    world = create_world(server)
+
+    fetched = call(server, "get_world", tenant_id=TENANT, world_id=world["id"])
+    listed = call(server, "list_worlds", tenant_id=int(TENANT))
+
+    assert fetched["success"] and fetched["world"]["name"] == "Aeloria"
+    assert [w["id"] for w in listed["worlds"]] == [world["id"]]
+
+
+def test_invalid_arguments_are_rejected_before_the_handler(server):
+    """Test that schema validation reports the offending argument."""
+    result = call(server, "create_world", tenant_id=TENANT, name=7, description="Floating isles")
+
+    assert result["type"] == "ToolArgumentError"
+    assert "'name' must be of type string" in result["error"]
+    assert call(server, "list_worlds", tenant_id=TENANT)["worlds"] == []
+
+
+def test_snapshot_export_read_and_import(server):
+    """Test exporting a tenant to a snapshot, reading one entity and importing it elsewhere."""
+    world = create_world(server)
+    call(server, "create_item", tenant_id=TENANT, world_id=world["id"], name="Sunforged Blade",
+         description="Relic", item_type="weapon")
+
+    exported = call(server, "export_tenant", tenant_id=TENANT, filename="aeloria", format="snapshot")
+    assert exported["success"] and exported["filepath"].endswith("aeloria.snapshot")
+
+    entity = call(server, "get_snapshot_entity", filename="aeloria.snapshot", entity_type="world",
+                  entity_id=world["id"])
+    assert entity["success"] and entity["world"]["name"] == "Aeloria"
+
+    imported = call(server, "import_snapshot", filename="aeloria.snapshot", tenant_id="2", renumber=True)
+    assert imported["success"] and imported["counts"]["world"] == 1 and imported["counts"]["item"] == 1
+
+    [copy] = call(server, "list_worlds", tenant_id="2")["worlds"]
+    assert copy["name"] == "Aeloria" and copy["id"] != world["id"]
+    items = call(server, "list_items", tenant_id="2", world_id=copy["id"])
+    assert [item["name"] for item in items["items"]] == ["Sunforged Blade"]
+
+
+def test_batches_keep_succeeded_items_and_undo_failed_ones(server):
+    """Test mixed batches: failed items leave nothing behind, even when they fail half way."""
+    world = create_world(server)
+    created = call(server, "batch_create", tenant_id=TENANT, items=[
+        {"entity_type": "item", "arguments": {"world_id": world["id"], "name": "Sunforged Blade",
+                                              "description": "Relic", "item_type": "weapon"}},
+        {"entity_type": "item", "arguments": {"world_id": world["id"], "name": "Moonlit Dagger",
+                                              "description": " ", "item_type": "weapon"}},
+        {"entity_type": "item", "arguments": {"world_id": world["id"], "name": "Sunstone Amulet",
+                                              "description": "Relic", "item_type": "artifact"}},
+    ])
+    assert (created["succeeded"], created["failed"]) == (2, 1)
+    assert [result["success"] for result in created["results"]] == [True, False, True]
+    blade, amulet = created["results"][0]["item"], created["results"][2]["item"]
+
+    updated = call(server, "batch_update", tenant_id=TENANT, items=[
+        {"entity_type": "item", "arguments": {"item_id": blade["id"], "name": "Dawnforged Blade"}},
+        # Renames the stored item, then fails on the blank description
+        {"entity_type": "item", "arguments": {"item_id": amulet["id"], "name": "Starstone Amulet",
+                                              "description": " "}},
+        {"entity_type": "item", "arguments": {"item_id": "999", "name": "Ghost"}},
+    ])
+    assert (updated["succeeded"], updated["failed"]) == (1, 2)
+    assert updated["results"][2]["error"] == "Item not found"
+
+    fetched = call(server, "batch_get", tenant_id=TENANT, items=[
+        {"entity_type": "item", "arguments": {"item_id": blade["id"]}},
+        {"entity_type": "item", "arguments": {"item_id": amulet["id"]}},
+    ])
+    assert [result["item"]["name"] for result in fetched["results"]] == ["Dawnforged Blade", "Sunstone Amulet"]
+    assert fetched["results"][1]["item"]["version"] == amulet["version"]
+    listed = call(server, "list_items", tenant_id=TENANT, world_id=world["id"])
+    assert sorted(item["name"] for item in listed["items"]) == ["Dawnforged Blade", "Sunstone Amulet"]
+
+
+def test_invalid_batches_apply_nothing(server):
+    """Test that a batch with an invalid item is rejected before any item runs."""
+    result = call(server, "batch_create", tenant_id=TENANT, items=[
+        {"entity_type": "world", "arguments": {"name": "Aeloria", "description": "Floating isles"}},
+        {"entity_type": "world", "arguments": {"name": 7, "description": "Sunken isles"}},
+    ])
+
+    assert not result["success"]
+    assert result["errors"] == [{"index": 1, "entity_type": "world", "error": "'name' must be of type string"}]
+    assert call(server, "list_worlds", tenant_id=TENANT)["worlds"] == []
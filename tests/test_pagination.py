@@ -0,0 +1,323 @@
+"""Tests for keyset (cursor) pagination and streaming."""
+import sqlite3
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Optional
+
+import pytest
+
+from src.domain.entities.note import Note
+from src.domain.exceptions import InvalidCursor
+from src.domain.repositories.bulk import BulkOperationsMixin
+from src.domain.repositories.pagination import decode_cursor, encode_cursor, make_page
+from src.domain.value_objects.common import TenantId, EntityId
+from src.infrastructure.in_memory_bulk import IdIndex, InMemoryBulkMixin, InMemoryKeysetPaginationMixin
+from src.infrastructure.in_memory_repositories import InMemoryNoteRepository
+from src.infrastructure.sqlite_bulk import SQLiteBulkMixin
+from src.infrastructure.sqlite_connection import SQLiteConnectionManager, SQLiteSettings
+from src.infrastructure.sqlite_indexes import IndexSpec, create_indexes, explain_queries
+from src.infrastructure.sqlite_repositories import SQLiteDatabase, SQLiteNoteRepository
+
+
+TENANT = TenantId(1)
+WORLD = EntityId(1)
+
+KEYSET_QUERY = "SELECT * FROM relics WHERE world_id = ? AND tenant_id = ? AND id > ? ORDER BY id LIMIT ?"
+
+
+@dataclass
+class Relic:
+    tenant_id: TenantId
+    world_id: EntityId
+    name: str
+    id: Optional[EntityId] = None
+
+
+class DictRelicRepository(InMemoryBulkMixin):
+    """Mirrors the generic in-memory repositories (no secondary indexes)."""
+
+    def __init__(self):
+        self._entities = {}
+        self._next_id = 1
+
+    def save(self, entity):
+        return self.save_many([entity])[0]
+
+    def delete(self, tenant_id, entity_id):
+        return self._entities.pop((tenant_id, entity_id), None) is not None
+
+
+class IndexedRelicRepository(InMemoryKeysetPaginationMixin, BulkOperationsMixin):
+    """Mirrors the hand-written in-memory repositories with IdIndex indexes."""
+
+    def __init__(self):
+        self._entities = {}
+        self._by_world = defaultdict(IdIndex)
+        self._by_tenant = defaultdict(IdIndex)
+        self._next_id = 1
+
+    def save(self, entity):
+        if entity.id is None:
+            object.__setattr__(entity, 'id', EntityId(self._next_id))
+            self._next_id += 1
+        self._entities[(entity.tenant_id, entity.id)] = entity
+        self._by_world[(entity.tenant_id, entity.world_id)].append(entity.id)
+        self._by_tenant[entity.tenant_id].append(entity.id)
+        return entity
+
+    def delete(self, tenant_id, entity_id):
+        entity = self._entities.pop((tenant_id, entity_id), None)
+        if entity is None:
+            return False
+        self._by_world[(tenant_id, entity.world_id)].remove(entity_id)
+        self._by_tenant[tenant_id].remove(entity_id)
+        return True
+
+
+class SQLiteRelicRepository(SQLiteBulkMixin):
+    """Mirrors the SQLite repositories."""
+
+    _table = "relics"
+
+    def __init__(self, db):
+        self.db = db
+
+    def save(self, entity):
+        with self.db.get_connection() as conn:
+            cursor = conn.execute(
+                "INSERT INTO relics (tenant_id, world_id, name) VALUES (?, ?, ?)",
+                (entity.tenant_id.value, entity.world_id.value, entity.name),
+            )
+            object.__setattr__(entity, 'id', EntityId(cursor.lastrowid))
+        return entity
+
+    def delete(self, tenant_id, entity_id):
+        with self.db.get_connection() as conn:
+            cursor = conn.execute(
+                "DELETE FROM relics WHERE id = ? AND tenant_id = ?", (entity_id.value, tenant_id.value)
+            )
+            return cursor.rowcount > 0
+
+    def _row_to_entity(self, row):
+        return Relic(TenantId(row['tenant_id']), EntityId(row['world_id']), row['name'], EntityId(row['id']))
+
+
+class OffsetOnlyRepository(BulkOperationsMixin):
+    """A repository that only implements offset listing."""
+
+    def __init__(self, relics):
+        self.relics = relics
+
+    def list_by_world(self, tenant_id, world_id, limit=50, offset=0):
+        matching = [r for r in self.relics if r.tenant_id == tenant_id and r.world_id == world_id]
+        return matching[offset:offset + limit]
+
+
+@pytest.fixture
+def sqlite_repo(tmp_path):
+    db = SQLiteConnectionManager(str(tmp_path / "pages.db"), SQLiteSettings())
+    with db.get_connection() as conn:
+        conn.execute(
+            "CREATE TABLE relics (id INTEGER PRIMARY KEY AUTOINCREMENT, tenant_id INTEGER, world_id INTEGER, name TEXT)"
+        )
+    yield SQLiteRelicRepository(db)
+    db.close()
+
+
+@pytest.fixture(params=["dict", "indexed", "sqlite"])
+def repo(request, sqlite_repo):
+    if request.param == "dict":
+        return DictRelicRepository()
+    if request.param == "indexed":
+        return IndexedRelicRepository()
+    return sqlite_repo
+
+
+def seed(repo):
+    """Seven relics in world 1, interleaved with other worlds and tenants."""
+    for i in range(7):
+        repo.save(Relic(TENANT, WORLD, f"Relic {i}"))
+        if i % 3 == 0:
+            repo.save(Relic(TENANT, EntityId(2), f"Elsewhere {i}"))
+            repo.save(Relic(TenantId(2), WORLD, f"Foreign {i}"))
+
+
+def walk(page_by, *args, limit=3):
+    pages, cursor = [], None
+    while True:
+        page = page_by(*args, limit, cursor)
+        pages.append([relic.name for relic in page.items])
+        if page.next_cursor is None:
+            return pages
+        cursor = page.next_cursor
+
+
+def test_cursor_round_trip_and_rejects_garbage():
+    """Test that cursors decode to the id they encode and garbage is rejected."""
+    assert decode_cursor(encode_cursor(EntityId(42))) == EntityId(42)
+    assert decode_cursor(None) is None
+    assert decode_cursor("") is None
+
+    for bad in ["not a cursor", encode_cursor(EntityId(1))[:-3], "e30"]:
+        with pytest.raises(InvalidCursor):
+            decode_cursor(bad)
+
+
+def test_page_by_world_walks_every_entity_once(repo):
+    """Test that following next_cursor visits each world entity once, in id order."""
+    seed(repo)
+
+    assert walk(repo.page_by_world, TENANT, WORLD) == [
+        ["Relic 0", "Relic 1", "Relic 2"],
+        ["Relic 3", "Relic 4", "Relic 5"],
+        ["Relic 6"],
+    ]
+
+
+def test_page_by_tenant_is_tenant_scoped(repo):
+    """Test that tenant pages include every world but no other tenant."""
+    seed(repo)
+
+    names = [name for page in walk(repo.page_by_tenant, TENANT, limit=4) for name in page]
+
+    assert len(names) == 10
+    assert not any(name.startswith("Foreign") for name in names)
+
+
+def test_cursor_survives_concurrent_changes(repo):
+    """Test that deleting the cursor entity or adding rows does not skip or repeat entities."""
+    seed(repo)
+    first = repo.page_by_world(TENANT, WORLD, 3)
+
+    repo.delete(TENANT, first.items[-1].id)
+    repo.save(Relic(TENANT, WORLD, "Late arrival"))
+
+    second = repo.page_by_world(TENANT, WORLD, 10, first.next_cursor)
+    assert [relic.name for relic in second.items] == ["Relic 3", "Relic 4", "Relic 5", "Relic 6", "Late arrival"]
+    assert second.next_cursor is None
+
+
+def test_exact_multiple_has_no_empty_trailing_page(repo):
+    """Test that a full last page does not hand out a cursor to an empty page."""
+    for i in range(6):
+        repo.save(Relic(TENANT, WORLD, f"Relic {i}"))
+
+    assert len(walk(repo.page_by_world, TENANT, WORLD)) == 2
+
+
+@pytest.mark.parametrize("limit", [0, -1, -2])
+def test_non_positive_limit_is_rejected(repo, limit):
+    """Test that a page size below 1 is rejected before any query runs."""
+    seed(repo)
+
+    with pytest.raises(ValueError):
+        repo.page_by_world(TENANT, WORLD, limit)
+    with pytest.raises(ValueError):
+        repo.page_by_tenant(TENANT, limit)
+    with pytest.raises(ValueError):
+        make_page([], limit)
+
+
+def test_default_pagination_scans_offset_listing():
+    """Test the interface default for repositories without a seek."""
+    relics = [Relic(TENANT, WORLD, f"Relic {i}", EntityId(i + 1)) for i in range(5)]
+    repo = OffsetOnlyRepository(relics)
+
+    assert walk(repo.page_by_world, TENANT, WORLD, limit=2) == [
+        ["Relic 0", "Relic 1"], ["Relic 2", "Relic 3"], ["Relic 4"],
+    ]
+
+
+def test_stream_by_world_yields_every_entity_once(repo):
+    """Test that streams cover the world in small batches without duplicates."""
+    seed(repo)
+
+    names = [relic.name for relic in repo.stream_by_world(TENANT, WORLD, batch_size=2)]
+
+    assert names == [f"Relic {i}" for i in range(7)]
+    assert len(list(repo.stream_by_tenant(TENANT, batch_size=3))) == 10
+
+
+def test_stream_tolerates_writes_while_iterating(repo):
+    """Test that saving during a stream neither fails nor repeats entities."""
+    seed(repo)
+
+    seen = []
+    for relic in repo.stream_by_world(TENANT, WORLD, batch_size=2):
+        seen.append(relic.id)
+        if len(seen) == 1:
+            repo.save(Relic(TENANT, EntityId(3), "Other world"))
+
+    assert len(seen) == len(set(seen)) == 7
+
+
+def test_streams_can_be_nested(repo):
+    """Test that an exporter can stream one listing while streaming another."""
+    seed(repo)
+
+    pairs = [
+        (outer.id, inner.id)
+        for outer in repo.stream_by_world(TENANT, EntityId(2), batch_size=1)
+        for inner in repo.stream_by_world(TENANT, WORLD, batch_size=2)
+    ]
+
+    assert len(pairs) == 3 * 7
+
+
+def test_keyset_query_seeks_the_world_index():
+    """Test that the page query is an index search without a sort."""
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE relics (id INTEGER PRIMARY KEY, tenant_id INTEGER, world_id INTEGER, name TEXT)")
+    create_indexes(conn, [IndexSpec("relics", ("tenant_id", "world_id"))])
+
+    [plan] = explain_queries(conn, [KEYSET_QUERY])
+
+    assert not plan.scans and not plan.sorts
+    conn.close()
+
+
+def test_id_index_after_uses_id_order():
+    """Test that IdIndex.after seeks by id even when ids arrive out of order."""
+    index = IdIndex()
+    for i in [5, 1, 9, 3]:
+        index.append(EntityId(i))
+    index.remove(EntityId(9))
+
+    assert index.after(None, 2) == [EntityId(1), EntityId(3)]
+    assert index.after(EntityId(3), 5) == [EntityId(5)]
+    assert index.after(EntityId(4), 5) == [EntityId(5)]
+    assert list(index) == [EntityId(5), EntityId(1), EntityId(3)]
+
+
+@pytest.fixture(params=["in_memory", "sqlite"])
+def note_repo(request, tmp_path):
+    if request.param == "in_memory":
+        yield InMemoryNoteRepository()
+        return
+    db = SQLiteDatabase(str(tmp_path / "lore.db"))
+    db.initialize_schema()
+    with db.get_connection() as conn:
+        for world in (1, 2):
+            conn.execute("INSERT INTO worlds (tenant_id, name, created_at, updated_at) VALUES (1, ?, '', '')",
+                         (f"World {world}",))
+    yield SQLiteNoteRepository(db)
+    db.close()
+
+
+def test_note_repositories_page_and_stream(note_repo):
+    """Test keyset paging on the note repositories against their real storage."""
+    for i in range(7):
+        note_repo.save(Note.create(TENANT, WORLD, f"Note {i}", "text"))
+        if i % 3 == 0:
+            note_repo.save(Note.create(TENANT, EntityId(2), f"Elsewhere {i}", "text"))
+
+    pages, cursor = [], None
+    while True:
+        page = note_repo.page_by_world(TENANT, WORLD, 3, cursor)
+        pages.append([note.title for note in page.items])
+        if page.next_cursor is None:
+            break
+        cursor = page.next_cursor
+
+    assert pages == [["Note 0", "Note 1", "Note 2"], ["Note 3", "Note 4", "Note 5"], ["Note 6"]]
+    assert len(list(note_repo.stream_by_tenant(TENANT, batch_size=2))) == 10
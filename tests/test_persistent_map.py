@@ -0,0 +1,105 @@
+"""Tests for the persistent (structurally shared) map and its use in WorldState."""
+import random
+
+import pytest
+
+from src.application.use_cases.progression_simulation import create_dark_fantasy_simulation
+from src.domain.entities.progression_state import CharacterState, WorldState
+from src.domain.exceptions import InvariantViolation
+from src.domain.persistent_map import PersistentMap
+from src.domain.value_objects.common import EntityId, Timestamp
+from src.domain.value_objects.progression import TimePoint
+
+
+class Colliding:
+    """A key type whose instances all share one hash."""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __hash__(self):
+        return 42
+
+    def __eq__(self, other):
+        return isinstance(other, Colliding) and other.name == self.name
+
+
+def test_matches_dict_under_random_operations():
+    """Test set/delete/get against a dict, keeping every old version intact."""
+    rng = random.Random(3)
+    current, expected = PersistentMap(), {}
+    versions = []
+
+    for _ in range(3000):
+        key = rng.randrange(500)
+        if key in expected and rng.random() < 0.3:
+            current = current.delete(key)
+            del expected[key]
+        else:
+            current = current.set(key, rng.random())
+            expected[key] = current[key]
+        if rng.random() < 0.01:
+            versions.append((current, dict(expected)))
+
+    assert dict(current.items()) == expected and len(current) == len(expected)
+    for version, snapshot in versions:
+        assert dict(version.items()) == snapshot
+
+
+def test_hash_collisions():
+    """Test keys with identical hashes are stored and removed independently."""
+    a, b, c = Colliding("a"), Colliding("b"), Colliding("c")
+    m = PersistentMap([(a, 1), (b, 2), (c, 3)])
+
+    assert (m[a], m[b], m[c]) == (1, 2, 3)
+    m = m.delete(b)
+    assert b not in m and m[a] == 1 and m[c] == 3 and len(m) == 2
+    with pytest.raises(KeyError):
+        m.delete(b)
+
+
+def test_setting_same_value_returns_same_map():
+    """Test that a no-op update does not allocate a new version."""
+    value = object()
+    m = PersistentMap({"k": value})
+
+    assert m.set("k", value) is m
+    assert m == {"k": value}
+
+
+def test_world_state_step_changes_one_character():
+    """Test that deriving a world state shares the other characters and checks time order."""
+    now = Timestamp.now()
+    states = {
+        EntityId(i): CharacterState(character_id=EntityId(i), time_point=TimePoint(0), created_at=now)
+        for i in range(1, 100)
+    }
+    world = WorldState(world_id=EntityId(1), time_point=TimePoint(0), character_states=states, created_at=now)
+
+    changed = CharacterState(character_id=EntityId(5), time_point=TimePoint(1), created_at=now)
+    later = world.with_character_state(changed, TimePoint(1), now)
+
+    assert later.get_character_state(EntityId(5)) is changed
+    assert later.get_character_state(EntityId(6)) is world.get_character_state(EntityId(6))
+    assert world.get_character_state(EntityId(5)).time_point == TimePoint(0)
+    later.validate()
+
+    future = CharacterState(character_id=EntityId(7), time_point=TimePoint(9), created_at=now)
+    with pytest.raises(InvariantViolation):
+        later.with_character_state(future, TimePoint(2), now)
+
+
+def test_simulator_keeps_history_for_many_characters():
+    """Test that multi-character simulations step and expose every past state."""
+    sim = create_dark_fantasy_simulation()
+    first, second = list(sim.current_state.character_states)[:2]
+
+    sim.simulate_experience_gain(first, 50, "quest")
+    sim.simulate_experience_gain(second, 70, "battle")
+
+    assert sim.current_state.time_point == TimePoint(2)
+    start = sim.state_at(TimePoint(0))
+    middle = sim.state_at(TimePoint(1))
+    assert middle.get_character_state(second) is start.get_character_state(second)
+    assert sim.state_at(TimePoint(2)) is sim.current_state
+    assert sim.state_at(TimePoint(3)) is None
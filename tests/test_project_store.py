@@ -0,0 +1,218 @@
+"""Tests for chunked project saves with dirty tracking, and background loading."""
+import json
+import os
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Dict
+
+import pytest
+
+from src.presentation.gui.entity_collection import EntityCollection
+from src.presentation.gui.project_store import (
+    PROJECT_FORMAT, ProjectStore, load_project, section_keys, write_atomic,
+)
+
+
+@dataclass
+class Version:
+    value: int = 1
+
+
+@dataclass
+class Record:
+    id: int
+    name: str
+    version: Version = field(default_factory=Version)
+
+    def rename(self, name: str) -> None:
+        self.name = name
+        self.version = Version(self.version.value + 1)
+
+
+class Lore:
+    """The section API of LoreData over two entity lists."""
+
+    KEYS = ('worlds', 'characters')
+
+    def __init__(self):
+        self.worlds = EntityCollection()
+        self.characters = EntityCollection()
+        self.next_id = 1
+
+    def iter_sections(self):
+        for key in self.KEYS:
+            yield key, self.section_records(key)
+
+    def section_records(self, key):
+        return ({'id': r.id, 'name': r.name, 'version': r.version.value} for r in getattr(self, key))
+
+    def load_section(self, key, records):
+        setattr(self, key, EntityCollection(
+            Record(r['id'], r['name'], Version(r['version'])) for r in records
+        ))
+
+
+@pytest.fixture
+def lore():
+    lore = Lore()
+    lore.worlds.extend(Record(i, f"World {i}") for i in range(3))
+    lore.characters.extend(Record(i, f"Hero {i}") for i in range(100))
+    lore.next_id = 200
+    return lore
+
+
+def _mtimes(store: ProjectStore) -> Dict[str, int]:
+    return {p.name: p.stat().st_mtime_ns for p in store.chunk_dir.iterdir()}
+
+
+def test_saves_manifest_and_chunks(tmp_path, lore):
+    store = ProjectStore(tmp_path / "campaign.json")
+
+    assert store.save(lore) == ['worlds', 'characters']
+
+    manifest = json.loads(store.path.read_text(encoding='utf-8'))
+    assert manifest['format'] == PROJECT_FORMAT
+    assert manifest['next_id'] == 200
+    assert manifest['sections']['characters'] == {'file': "campaign.chunks/characters.json", 'count': 100}
+    characters = json.loads(store.chunk_path('characters').read_text(encoding='utf-8'))
+    assert characters[99] == {'id': 99, 'name': "Hero 99", 'version': 1}
+
+
+def test_only_changed_sections_are_rewritten(tmp_path, lore):
+    store = ProjectStore(tmp_path / "campaign.json")
+    store.save(lore)
+    assert store.save(lore) == []
+    assert not store.is_dirty(lore)
+
+    # A domain mutator bumps the version
+    lore.characters[5].rename("Renamed")
+    assert store.dirty_sections(lore) == ['characters']
+    before = _mtimes(store)
+    assert store.save(lore) == ['characters']
+    assert _mtimes(store)['worlds.json'] == before['worlds.json']
+
+    # List mutations, explicit touches and replaced lists
+    lore.worlds.append(Record(3, "World 3"))
+    assert store.save(lore) == ['worlds']
+    lore.worlds[0].name = "Edited in place"
+    lore.worlds.touch()
+    assert store.save(lore) == ['worlds']
+    lore.characters = EntityCollection(list(lore.characters))
+    assert store.save(lore) == ['characters']
+    assert store.save(lore, full=True) == ['worlds', 'characters']
+
+
+def test_missing_chunk_is_restored(tmp_path, lore):
+    store = ProjectStore(tmp_path / "campaign.json")
+    store.save(lore)
+    os.remove(store.chunk_path('worlds'))
+
+    assert store.save(lore) == ['worlds']
+
+
+def test_failed_write_keeps_previous_file(tmp_path):
+    """Test that an error while streaming leaves the old file and no temp file."""
+    target = tmp_path / "campaign.json"
+    write_atomic(target, lambda f: f.write('{"next_id": 1}'))
+
+    def fail_midway(f):
+        f.write('{"worlds": [')
+        raise TypeError("not serializable")
+
+    with pytest.raises(TypeError):
+        write_atomic(target, fail_midway)
+
+    assert json.loads(target.read_text(encoding='utf-8')) == {"next_id": 1}
+    assert os.listdir(tmp_path) == ["campaign.json"]
+
+
+def test_round_trip_reports_progress(tmp_path, lore):
+    ProjectStore(tmp_path / "campaign.json").save(lore)
+    progress = []
+
+    loaded = Lore()
+    store = load_project(tmp_path / "campaign.json", loaded, progress=lambda *p: progress.append(p))
+
+    assert [r.name for r in loaded.characters] == [r.name for r in lore.characters]
+    assert loaded.next_id == 200
+    assert progress == [(1, 2, 'worlds'), (2, 2, 'characters')]
+    # Freshly loaded chunks are already on disk
+    assert store.save(loaded) == []
+
+
+def test_single_file_projects_still_load(tmp_path, lore):
+    path = tmp_path / "legacy.json"
+    data = {key: list(records) for key, records in lore.iter_sections()}
+    data['next_id'] = 7
+    path.write_text(json.dumps(data), encoding='utf-8')
+
+    loaded = Lore()
+    store = load_project(path, loaded)
+
+    assert len(loaded.characters) == 100 and loaded.next_id == 7
+    # The first save converts it to the chunked format
+    assert store.save(loaded) == ['worlds', 'characters']
+    assert json.loads(path.read_text(encoding='utf-8'))['format'] == PROJECT_FORMAT
+
+
+def test_real_lore_data_round_trip(tmp_path):
+    """Test chunked saves, partial resaves and loading with the real LoreData."""
+    from src.domain.entities.note import Note
+    from src.domain.value_objects.common import TenantId
+    from src.presentation.gui.lore_data import LoreData
+
+    sample = Path(__file__).resolve().parent.parent / "examples" / "sample_lore.json"
+    lore = LoreData()
+    lore.from_dict(json.loads(sample.read_text(encoding='utf-8')))
+    store = ProjectStore(tmp_path / "campaign.json")
+
+    assert store.save(lore) == section_keys(lore)
+    assert store.save(lore) == []
+
+    item = lore.items[0]
+    lore.update_item(replace(item, name="Renamed blade"))
+    lore.add_note(Note.create(TenantId(1), lore.worlds[0].id, "Todo", "Name the villain"))
+    assert store.save(lore) == ['items', 'notes']
+
+    loaded = LoreData()
+    assert load_project(store.path, loaded).save(loaded) == []
+    assert loaded.to_dict() == lore.to_dict()
+    assert loaded.items.get(item.id).name == "Renamed blade"
+
+    # The single-file writer streams the same document
+    lore.save_json(tmp_path / "single.json")
+    assert json.loads((tmp_path / "single.json").read_text(encoding='utf-8')) == lore.to_dict()
+
+
+def test_loader_runs_on_worker_thread(tmp_path, lore):
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    QtCore = pytest.importorskip("PyQt6.QtCore")
+    from src.presentation.gui.project_loader import ProjectLoader
+
+    app = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+    ProjectStore(tmp_path / "campaign.json").save(lore)
+    results, progress = [], []
+    loop = QtCore.QEventLoop()
+
+    loader = ProjectLoader(Lore)
+    loader.progress.connect(lambda done, total, key: progress.append(key))
+    loader.loaded.connect(lambda data, store: (results.append((data, store)), loop.quit()))
+    loader.failed.connect(lambda message: (results.append(message), loop.quit()))
+    loader.load(tmp_path / "campaign.json")
+    assert loader.is_running()
+    with pytest.raises(RuntimeError):
+        loader.load(tmp_path / "campaign.json")
+
+    QtCore.QTimer.singleShot(5000, loop.quit)
+    loop.exec()
+
+    data, store = results[0]
+    assert len(data.characters) == 100
+    assert store.path == tmp_path / "campaign.json"
+    assert progress == ['worlds', 'characters']
+    assert not loader.is_running()
+
+    loader.load(tmp_path / "missing.json")
+    results.clear()
+    loop.exec()
+    assert "missing.json" in results[0]
@@ -0,0 +1,113 @@
+"""Tests for compiled quest graphs."""
+import pytest
+
+from src.domain.exceptions import CircularDependency
+from src.infrastructure.quest_graph import CompiledQuestGraph, QuestGraphIndex
+
+
+@pytest.fixture
+def index():
+    """prologue -> (forest | mines) -> siege -> epilogue, plus a side quest."""
+    index = QuestGraphIndex()
+    index.set_node("prologue", ["forest", "mines"])
+    index.set_node("forest", ["siege"])
+    index.set_node("mines", ["siege", "cave"])
+    index.set_node("siege", ["epilogue"])
+    index.set_node("epilogue", [])
+    index.set_node("side", [])
+    return index
+
+
+def test_csr_matches_connections(index):
+    """Test that relabelled CSR adjacency mirrors the saved connections."""
+    graph = index.compiled()
+
+    for node in ["prologue", "mines", "siege"]:
+        i = graph.index[node]
+        assert [graph.nodes[j] for j in graph.successors(i)] == list(index._edges[node])
+    assert sorted(graph.nodes[j] for j in graph.predecessors(graph.index["siege"])) == ["forest", "mines"]
+
+
+def test_topological_order(index):
+    """Test that every node comes after the nodes leading to it."""
+    order = index.compiled().topological_order()
+    position = {node: i for i, node in enumerate(order)}
+
+    assert set(order) == {"prologue", "forest", "mines", "siege", "epilogue", "side", "cave"}
+    assert position["prologue"] < position["forest"] < position["siege"] < position["epilogue"]
+    assert position["mines"] < position["cave"]
+
+
+def test_cycle_is_reported():
+    """Test that ordering a cyclic graph raises."""
+    index = QuestGraphIndex()
+    index.set_node("a", ["b"])
+    index.set_node("b", ["a"])
+
+    with pytest.raises(CircularDependency):
+        index.compiled().topological_order()
+    assert index.compiled().shortest_path("a", "b") == ["a", "b"]
+
+
+def test_shortest_path_and_reachability(index):
+    """Test BFS paths and reachability bitsets."""
+    graph = index.compiled()
+
+    assert graph.shortest_path("prologue", "epilogue") in (
+        ["prologue", "forest", "siege", "epilogue"],
+        ["prologue", "mines", "siege", "epilogue"],
+    )
+    assert graph.shortest_path("siege", "prologue") == []
+    assert graph.shortest_path("prologue", "unknown") == []
+    assert graph.can_reach("mines", "epilogue")
+    assert not graph.can_reach("forest", "cave")
+    assert set(graph.reachable_from("mines")) == {"mines", "siege", "cave", "epilogue"}
+
+
+def test_available_batch(index):
+    """Test availability for several player states at once."""
+    graph = index.compiled()
+
+    fresh, midway, all_routes = graph.available_batch([
+        [],
+        ["prologue", "forest"],
+        ["prologue", "forest", "mines"],
+    ])
+
+    assert fresh == ["prologue", "side"]
+    assert midway == ["mines", "side"]
+    assert all_routes == ["siege", "side", "cave"]
+
+
+def test_recompiles_only_after_changes(index):
+    """Test that unchanged saves keep the compiled graph and real changes replace it."""
+    graph = index.compiled()
+
+    index.set_node("forest", ["siege"])
+    assert index.compiled() is graph
+
+    index.set_node("forest", ["epilogue"])
+    updated = index.compiled()
+    assert updated is not graph
+    assert updated.shortest_path("prologue", "epilogue") == ["prologue", "forest", "epilogue"]
+    assert index.incoming("siege") == ["mines"]
+
+    index.remove_node("mines")
+    assert not index.compiled().can_reach("prologue", "cave")
+    assert index.incoming("cave") == []
+
+
+def test_per_source_caches_are_bounded():
+    """Test that only the most recently used sources keep their O(n) results."""
+    edges = {i: (i + 1,) for i in range(50)}
+    graph = CompiledQuestGraph(0, edges, cache_size=4)
+
+    for source in range(10):
+        assert graph.can_reach(source, 50)
+        assert len(graph.shortest_path(source, 50)) == 51 - source
+    assert len(graph._reach) == len(graph._parents) == 4
+
+    graph.can_reach(6, 50)  # most recent again, so 7 is evicted next
+    graph.can_reach(0, 50)
+    assert graph._reach.get(6) is not None and graph._reach.get(7) is None
+    assert graph.reachable_from(49) == [49, 50]
@@ -0,0 +1,152 @@
+"""Tests for the append-only segment store and SegmentPersistence."""
+import json
+from dataclasses import dataclass
+
+import pytest
+
+from lore_mcp_server.mcp_server.persistence import JSONPersistence, SegmentPersistence
+from lore_mcp_server.mcp_server.segment_store import SegmentCorruption, SegmentStore
+
+
+@dataclass
+class Entity:
+    id: int
+    name: str
+
+
+def segment_files(directory):
+    return sorted(p.name for p in directory.glob("segment-*.log"))
+
+
+def test_put_get_delete(tmp_path):
+    """Test basic reads and writes, including overwrites and deletes."""
+    with SegmentStore(tmp_path) as store:
+        store.put("worlds/1.json", b'{"name":"Eldoria"}')
+        store.put("worlds/1.json", b'{"name":"Eldoria II"}')
+        store.put("worlds/2.json", b"{}")
+
+        assert store.get("worlds/1.json") == b'{"name":"Eldoria II"}'
+        assert store.delete("worlds/2.json") is True
+        assert store.delete("worlds/2.json") is False
+        assert store.get("worlds/2.json") is None
+        assert store.keys("worlds/") == ["worlds/1.json"]
+
+
+def test_reopen_rebuilds_index(tmp_path):
+    """Test that the index is rebuilt from the segments, honouring tombstones."""
+    with SegmentStore(tmp_path, max_segment_bytes=64) as store:
+        for i in range(10):
+            store.put(f"k{i}", f"value {i}".encode())
+        store.delete("k3")
+        store.put("k4", b"updated")
+
+    with SegmentStore(tmp_path) as store:
+        assert len(store) == 9
+        assert store.get("k3") is None
+        assert store.get("k4") == b"updated"
+        assert store.get("k9") == b"value 9"
+        assert store.stats()["segments"] > 1
+
+
+def test_torn_tail_is_truncated(tmp_path):
+    """Test that a partially written last record is dropped on open."""
+    with SegmentStore(tmp_path) as store:
+        store.put("a", b"complete")
+        store.put("b", b"will be torn")
+    [name] = segment_files(tmp_path)
+    path = tmp_path / name
+    path.write_bytes(path.read_bytes()[:-4])
+
+    with SegmentStore(tmp_path) as store:
+        assert store.keys() == ["a"]
+        store.put("c", b"after recovery")
+
+    with SegmentStore(tmp_path) as store:
+        assert store.keys() == ["a", "c"]
+
+
+def test_corrupt_sealed_segment_is_an_error(tmp_path):
+    """Test that damage outside the newest segment is not silently dropped."""
+    with SegmentStore(tmp_path, max_segment_bytes=32) as store:
+        store.put("a", b"x" * 20)
+        store.put("b", b"y" * 20)
+    first = tmp_path / segment_files(tmp_path)[0]
+    data = bytearray(first.read_bytes())
+    data[-1] ^= 0xFF
+    first.write_bytes(bytes(data))
+
+    with pytest.raises(SegmentCorruption):
+        SegmentStore(tmp_path)
+
+
+def test_compaction_drops_garbage(tmp_path):
+    """Test that compaction keeps live records only and survives a reopen."""
+    with SegmentStore(tmp_path, max_segment_bytes=256, compact_min_bytes=10 ** 9) as store:
+        for round_ in range(5):
+            for i in range(10):
+                store.put(f"k{i}", f"round {round_}".encode())
+        store.delete("k0")
+        before = store.stats()
+
+        store.compact()
+
+        after = store.stats()
+        assert after["total_bytes"] == after["live_bytes"] == before["live_bytes"]
+        assert store.get("k5") == b"round 4"
+
+    with SegmentStore(tmp_path) as store:
+        assert len(store) == 9
+        assert store.get("k9") == b"round 4"
+
+
+def test_compaction_triggers_automatically(tmp_path):
+    """Test that heavy overwriting keeps the store bounded."""
+    with SegmentStore(tmp_path, compact_min_bytes=1024, compact_ratio=0.5) as store:
+        for i in range(500):
+            store.put("hot", b"x" * 100)
+        stats = store.stats()
+
+    assert stats["keys"] == 1
+    assert stats["total_bytes"] < 2048
+
+
+def test_segment_persistence_matches_file_layout(tmp_path):
+    """Test that SegmentPersistence lists and loads like JSONPersistence."""
+    persistence = SegmentPersistence(str(tmp_path / "data"))
+    try:
+        persistence.save_world(Entity(1, "Eldoria"), "7")
+        persistence.save_world(Entity(2, "Norhaven"), "8")
+        persistence.save_character(Entity(3, "Aria"), "7")
+        persistence.save_item(Entity(4, "Sword"), "7")
+        assert persistence.delete_item("7", "4") is True
+
+        data = persistence.load_all("7")
+        assert [w["name"] for w in data["worlds"]] == ["Eldoria"]
+        assert [c["name"] for c in data["characters"]] == ["Aria"]
+
+        files = persistence.list_saved_files("7")
+        assert [p.split("/")[-1] for p in files["worlds"]] == ["7_world_1.json"]
+        assert persistence.get_storage_stats()["total_files"] == 3
+        assert not any(persistence.worlds_dir.iterdir())
+    finally:
+        persistence.close()
+
+
+def test_import_directory(tmp_path):
+    """Test converting a one-file-per-entity directory."""
+    source = JSONPersistence(str(tmp_path / "files"))
+    source.save_world(Entity(1, "Eldoria"), "7")
+    source.save_page(Entity(2, "Prologue"), "7")
+
+    target = SegmentPersistence(str(tmp_path / "segments"))
+    try:
+        assert target.import_directory(source.data_dir) == 2
+        assert target.load_all("7") == source.load_all("7")
+    finally:
+        target.close()
+
+    reopened = SegmentPersistence(str(tmp_path / "segments"))
+    try:
+        assert json.dumps(reopened.load_all("7")["pages"]) == json.dumps(source.load_all("7")["pages"])
+    finally:
+        reopened.close()
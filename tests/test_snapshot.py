@@ -0,0 +1,162 @@
+"""Tests for binary lore snapshots."""
+from typing import Dict, List
+
+import pytest
+
+from src.domain.entities.character import Character
+from src.domain.entities.world import World
+from src.domain.value_objects.common import Backstory, CharacterName, Description, EntityId, TenantId, WorldName
+from src.infrastructure.snapshot import (
+    MAGIC, Snapshot, SnapshotError, SnapshotWriter,
+    export_repositories, import_repositories, is_snapshot, write_snapshot,
+)
+
+RECORDS = [
+    {'id': 30, 'name': "Aria", 'level': 3, 'score': 1.5, 'alive': True, 'rarity': "epic",
+     'tags': ["a", "b"], 'note': None, 'mixed': 1},
+    {'id': 10, 'name': "Borin", 'level': None, 'score': 2.0, 'alive': False, 'rarity': "epic",
+     'tags': [], 'note': None, 'mixed': "one"},
+    {'id': 20, 'name': "Ærin", 'level': 1 << 62, 'score': None, 'alive': None, 'rarity': None,
+     'tags': ["c"], 'note': None, 'mixed': None, 'extra': {'k': 1}},
+]
+
+
+@pytest.fixture
+def snapshot(tmp_path):
+    write_snapshot(tmp_path / "lore.snapshot", [('characters', RECORDS), ('worlds', [{'id': 1, 'name': "Aria"}])],
+                   metadata={'tenant_id': 7})
+    with Snapshot(tmp_path / "lore.snapshot") as snapshot:
+        yield snapshot
+
+
+def test_records_round_trip(snapshot):
+    assert snapshot.sections == ['characters', 'worlds']
+    assert snapshot.metadata == {'tenant_id': 7}
+    assert snapshot.count('characters') == 3
+    assert list(snapshot.iter_records('characters')) == RECORDS
+    assert [snapshot.record('characters', row) for row in range(3)] == RECORDS
+    with pytest.raises(IndexError):
+        snapshot.record('characters', 3)
+
+
+def test_get_by_id(snapshot):
+    assert snapshot.get('characters', 20) == RECORDS[2]
+    assert snapshot.get('characters', EntityId(10)) == RECORDS[1]
+    assert snapshot.get('characters', 15) is None
+    assert snapshot.get('worlds', 1) == {'id': 1, 'name': "Aria"}
+    with pytest.raises(KeyError):
+        snapshot.get('pages', 1)
+
+
+def test_numeric_and_string_fields_are_columns(snapshot):
+    assert snapshot.column('characters', 'level') == [3, None, 1 << 62]
+    assert snapshot.column('characters', 'alive') == [True, False, None]
+    assert snapshot.column('characters', 'rarity') == ["epic", "epic", None]
+    assert snapshot.column('characters', 'note') == [None, None, None]
+    # Lists, mixed types and fields missing from some rows stay per row
+    for field in ('tags', 'mixed', 'extra'):
+        with pytest.raises(KeyError):
+            snapshot.column('characters', field)
+    # "Aria" and "epic" are stored once across both sections
+    assert len(snapshot._strings) == 4
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "lore.json"
+    path.write_text('{"worlds": []}', encoding='utf-8')
+
+    assert not is_snapshot(path)
+    with pytest.raises(SnapshotError):
+        Snapshot(path)
+
+    write_snapshot(tmp_path / "empty.snapshot", [])
+    assert is_snapshot(tmp_path / "empty.snapshot")
+    assert (tmp_path / "empty.snapshot").read_bytes().startswith(MAGIC)
+
+
+def test_failed_write_leaves_no_file(tmp_path):
+    with pytest.raises(RuntimeError):
+        with SnapshotWriter(tmp_path / "lore.snapshot") as writer:
+            writer.add_section('characters', RECORDS)
+            raise RuntimeError("interrupted")
+
+    assert list(tmp_path.iterdir()) == []
+
+
+class Repository:
+    """Just enough of a repository for snapshot export and import."""
+
+    def __init__(self, entities=(), assign_ids=False):
+        self.entities: List = list(entities)
+        self.assign_ids = assign_ids
+        self._next_id = 100
+
+    def stream_by_tenant(self, tenant_id):
+        return (entity for entity in self.entities if entity.tenant_id == tenant_id)
+
+    def save_many(self, entities):
+        for entity in entities:
+            if entity.id is None and self.assign_ids:
+                object.__setattr__(entity, 'id', EntityId(self._next_id))
+                self._next_id += 1
+            self.entities.append(entity)
+        return entities
+
+
+def _with_id(entity, entity_id):
+    object.__setattr__(entity, 'id', EntityId(entity_id))
+    return entity
+
+
+def make_repositories() -> Dict[str, Repository]:
+    world = _with_id(World.create(TenantId(1), WorldName("Aetheria"), Description("A realm")), 5)
+    heroes = [
+        _with_id(Character.create(TenantId(1), EntityId(5), CharacterName(f"Hero {i}"), Backstory("B" * 120)), i)
+        for i in range(1, 4)
+    ]
+    return {'world': Repository([world]), 'character': Repository(heroes)}
+
+
+def test_repositories_round_trip(tmp_path):
+    source = make_repositories()
+
+    counts = export_repositories(tmp_path / "t.snapshot", source, TenantId(1))
+    assert counts == {'world': 1, 'character': 3}
+
+    target = {'world': Repository(), 'character': Repository()}
+    with Snapshot(tmp_path / "t.snapshot") as snapshot:
+        assert snapshot.metadata['tenant_id'] == 1
+        assert snapshot.entity_class('character') is Character
+        assert snapshot.get('character', 2)['name'] == "Hero 2"
+        id_maps = import_repositories(snapshot, target)
+
+    assert id_maps['character'] == {1: 1, 2: 2, 3: 3}
+    assert target['world'].entities == source['world'].entities
+    assert target['character'].entities == source['character'].entities
+
+
+def test_import_can_renumber_into_another_tenant(tmp_path):
+    export_repositories(tmp_path / "t.snapshot", make_repositories(), TenantId(1))
+
+    target = {'world': Repository(assign_ids=True), 'character': Repository(assign_ids=True)}
+    with Snapshot(tmp_path / "t.snapshot") as snapshot:
+        id_maps = import_repositories(snapshot, target, tenant_id=TenantId(2), renumber=True, batch_size=2)
+
+    assert id_maps == {'world': {5: 100}, 'character': {1: 100, 2: 101, 3: 102}}
+    heroes = target['character'].entities
+    assert [hero.id for hero in heroes] == [EntityId(100), EntityId(101), EntityId(102)]
+    assert {hero.world_id for hero in heroes} == {EntityId(100)}
+    assert {hero.tenant_id for hero in heroes} == {TenantId(2)}
+
+
+def test_sections_are_read_from_one_pass_iterators(tmp_path):
+    records = (dict(record) for record in RECORDS)
+    with SnapshotWriter(tmp_path / "lore.snapshot") as writer:
+        assert writer.add_section('characters', records) == 3
+        assert writer.add_section('worlds', iter(())) == 0
+
+    assert [path.name for path in tmp_path.iterdir()] == ["lore.snapshot"]
+    with Snapshot(tmp_path / "lore.snapshot") as snapshot:
+        assert list(snapshot.iter_records('characters')) == RECORDS
+        assert snapshot.get('characters', 30) == RECORDS[0]
+        assert snapshot.count('worlds') == 0
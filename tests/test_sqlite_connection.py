@@ -0,0 +1,193 @@
+"""Tests for pooled SQLite connection management."""
+import threading
+
+import pytest
+
+from src.infrastructure.sqlite_connection import (
+    ConnectionPoolExhausted,
+    SQLiteConnectionManager,
+    SQLiteSettings,
+)
+
+
+@pytest.fixture
+def db(tmp_path):
+    manager = SQLiteConnectionManager(str(tmp_path / "pool.db"), SQLiteSettings(pool_size=2, max_overflow=0))
+    with manager.get_connection() as conn:
+        conn.execute("CREATE TABLE worlds (id INTEGER PRIMARY KEY, name TEXT NOT NULL)")
+    yield manager
+    manager.close()
+
+
+def test_settings_from_config_sections():
+    """Test that pool and pragma settings come from database/performance sections."""
+    settings = SQLiteSettings.from_config({
+        "database": {"pool_size": 4, "max_overflow": 1, "sqlite": {"synchronous": "FULL"}},
+        "performance": {"sqlite_cache_size_kb": 1024, "statement_cache_size": 32},
+    })
+
+    assert settings.pool_size == 4
+    assert settings.max_overflow == 1
+    assert settings.synchronous == "FULL"
+    assert settings.cache_size_kb == 1024
+    assert settings.statement_cache_size == 32
+    assert settings.journal_mode == "WAL"
+
+
+def test_settings_reject_invalid_values():
+    """Test that invalid pragma values are rejected up front."""
+    with pytest.raises(ValueError):
+        SQLiteSettings(journal_mode="BOGUS")
+    with pytest.raises(ValueError):
+        SQLiteSettings(pool_size=0)
+
+
+def test_pooled_connection_is_reused_within_thread(db):
+    """Test that one thread keeps the same tuned connection across calls."""
+    with db.get_connection() as first:
+        pass
+    with db.get_connection() as second:
+        journal_mode = second.execute("PRAGMA journal_mode").fetchone()[0]
+
+    assert first is second
+    assert journal_mode == "wal"
+    assert db.pool_status()["open_connections"] == 1
+
+
+def test_per_call_mode_opens_fresh_connections(tmp_path):
+    """Test that per-call mode keeps the historical connect-per-call behaviour."""
+    manager = SQLiteConnectionManager(str(tmp_path / "legacy.db"), SQLiteSettings(pooled=False))
+
+    with manager.get_connection() as first:
+        first.execute("CREATE TABLE t (id INTEGER)")
+    with manager.get_connection() as second:
+        assert second.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+
+    assert first is not second
+
+
+def test_error_rolls_back(db):
+    """Test that an exception inside the block rolls back the write."""
+    with pytest.raises(RuntimeError):
+        with db.get_connection() as conn:
+            conn.execute("INSERT INTO worlds (name) VALUES ('Aerth')")
+            raise RuntimeError("boom")
+
+    with db.get_connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM worlds").fetchone()[0] == 0
+
+
+def test_threads_get_separate_connections(db):
+    """Test that concurrent threads are pinned to their own connections."""
+    seen = []
+
+    def worker():
+        with db.get_connection() as conn:
+            seen.append(id(conn))
+            conn.execute("INSERT INTO worlds (name) VALUES ('x')")
+
+    threads = [threading.Thread(target=worker) for _ in range(2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    with db.get_connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM worlds").fetchone()[0] == 2
+    assert len(seen) == 2
+
+
+def test_exhausted_pool_times_out(tmp_path):
+    """Test that callers fail fast once pool and overflow are both used up."""
+    manager = SQLiteConnectionManager(
+        str(tmp_path / "small.db"),
+        SQLiteSettings(pool_size=1, max_overflow=0, pool_timeout_seconds=0.05),
+    )
+    holding = threading.Event()
+    release = threading.Event()
+
+    def holder():
+        with manager.get_connection():
+            holding.set()
+            release.wait()
+
+    t = threading.Thread(target=holder)
+    t.start()
+    holding.wait()
+    try:
+        with pytest.raises(ConnectionPoolExhausted):
+            with manager.get_connection():
+                pass
+    finally:
+        release.set()
+        t.join()
+        manager.close()
+
+
+def test_slow_overflow_open_does_not_block_the_pool(tmp_path, monkeypatch):
+    """Test that opening an overflow connection happens outside the pool lock."""
+    manager = SQLiteConnectionManager(
+        str(tmp_path / "slow.db"),
+        SQLiteSettings(pool_size=1, max_overflow=1, pool_timeout_seconds=5),
+    )
+    connect = manager._connect
+    opening = threading.Event()
+    unblock = threading.Event()
+
+    def slow_connect():
+        if threading.current_thread().name == "overflow":
+            opening.set()
+            unblock.wait()
+        return connect()
+
+    monkeypatch.setattr(manager, "_connect", slow_connect)
+
+    def overflow_user():
+        with manager.get_connection():
+            pass
+
+    with manager.get_connection():
+        t = threading.Thread(target=overflow_user, name="overflow")
+        t.start()
+        try:
+            assert opening.wait(5)
+            # pool_status takes the pool lock; it must not wait for the slow open
+            statuses = []
+            probe = threading.Thread(target=lambda: statuses.append(manager.pool_status()), daemon=True)
+            probe.start()
+            probe.join(1)
+            assert statuses and statuses[0]["overflow_in_use"] == 1
+        finally:
+            unblock.set()
+            t.join()
+    assert manager.pool_status()["overflow_in_use"] == 0
+    manager.close()
+
+
+def test_failed_overflow_open_frees_its_slot(tmp_path, monkeypatch):
+    """Test that a connection error does not leak the reserved overflow slot."""
+    manager = SQLiteConnectionManager(
+        str(tmp_path / "fail.db"),
+        SQLiteSettings(pool_size=1, max_overflow=1, pool_timeout_seconds=0.05),
+    )
+    failures = []
+
+    def overflow_user():
+        try:
+            with manager.get_connection():
+                pass
+        except OSError as e:
+            failures.append(e)
+
+    def broken_connect():
+        raise OSError("disk gone")
+
+    with manager.get_connection():
+        monkeypatch.setattr(manager, "_connect", broken_connect)
+        t = threading.Thread(target=overflow_user)
+        t.start()
+        t.join()
+
+    assert len(failures) == 1
+    assert manager.pool_status()["overflow_in_use"] == 0
+    manager.close()
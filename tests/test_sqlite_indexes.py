@@ -0,0 +1,148 @@
+"""Tests for derived SQLite secondary indexes."""
+import sqlite3
+
+import pytest
+
+from src.infrastructure.sqlite_indexes import (
+    IndexSpec,
+    QueryShape,
+    class_queries,
+    create_indexes,
+    derive_indexes,
+    explain_queries,
+    parse_query,
+    repository_queries,
+)
+
+
+LIST_BY_WORLD = "SELECT * FROM characters WHERE world_id = ? AND tenant_id = ? ORDER BY id LIMIT ? OFFSET ?"
+FIND_BY_NAME = "SELECT * FROM characters WHERE world_id = ? AND tenant_id = ? AND name = ? LIMIT 1"
+LIST_BY_STORY = "SELECT * FROM choices WHERE story_id = ? AND tenant_id = ? ORDER BY id LIMIT ? OFFSET ?"
+FIND_BY_ID = "SELECT * FROM characters WHERE id = ? AND tenant_id = ?"
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE characters (id INTEGER PRIMARY KEY, tenant_id INTEGER, world_id INTEGER, name TEXT)")
+    conn.execute("CREATE TABLE choices (id INTEGER PRIMARY KEY, tenant_id INTEGER, story_id INTEGER)")
+    yield conn
+    conn.close()
+
+
+def test_parse_query_extracts_filters_and_ordering():
+    """Test that equality columns and ORDER BY columns are recognised."""
+    assert parse_query(LIST_BY_WORLD) == QueryShape("characters", ("world_id", "tenant_id"), ("id",))
+    assert parse_query("SELECT * FROM notes WHERE tenant_id = ? AND content LIKE ? LIMIT ?") == QueryShape(
+        "notes", ("tenant_id",)
+    )
+    assert parse_query("INSERT INTO notes (name) VALUES (?)") is None
+
+
+def test_derive_indexes_puts_tenant_first_and_keeps_ordered_prefixes():
+    """Test that indexes lead with tenant_id and ordered prefixes are kept."""
+    indexes = derive_indexes([LIST_BY_WORLD, FIND_BY_NAME, LIST_BY_STORY, FIND_BY_ID])
+
+    assert indexes == [
+        IndexSpec("characters", ("tenant_id", "world_id")),
+        IndexSpec("characters", ("tenant_id", "world_id", "name")),
+        IndexSpec("choices", ("tenant_id", "story_id")),
+    ]
+
+
+def test_derive_indexes_merges_unordered_prefixes():
+    """Test that a prefix index only used for equality lookups is dropped."""
+    indexes = derive_indexes([
+        "SELECT * FROM tags WHERE world_id = ? AND tenant_id = ? AND tag_type = ? LIMIT 1",
+        "SELECT * FROM tags WHERE world_id = ? AND tenant_id = ? AND name = ? AND tag_type = ? LIMIT 1",
+        "SELECT COUNT(*) FROM tags WHERE tenant_id = ?",
+    ])
+
+    assert indexes == [
+        IndexSpec("tags", ("tenant_id", "world_id", "tag_type")),
+        IndexSpec("tags", ("tenant_id", "world_id", "name", "tag_type")),
+    ]
+
+
+class RelicRepository:
+    _table = "relics"
+
+    def find_by_name(self, conn, name):
+        return conn.execute("""
+            SELECT * FROM relics
+            WHERE name = ? AND tenant_id = ?
+        """, (name, 1))
+
+    @staticmethod
+    def count(conn):
+        return conn.execute(f"SELECT COUNT(*) FROM {RelicRepository._table} WHERE tenant_id = ?", (1,))
+
+
+def test_class_queries_come_from_literals_and_table():
+    """Test that a class yields its SQL literals plus the statements built from _table."""
+    queries = class_queries(RelicRepository)
+
+    assert queries[0] == "SELECT * FROM relics WHERE name = ? AND tenant_id = ?"
+    assert "SELECT * FROM relics WHERE world_id = ? AND tenant_id = ? ORDER BY id LIMIT ? OFFSET ?" in queries
+    assert not any("{" in sql or "COUNT" in sql for sql in queries)
+
+    without_world = class_queries(RelicRepository, {"relics": {"id", "tenant_id", "name"}})
+    assert not any("world_id" in sql for sql in without_world)
+
+
+def test_created_indexes_remove_scans(conn):
+    """Test that the derived indexes turn scans into index searches."""
+    queries = [LIST_BY_WORLD, FIND_BY_NAME, LIST_BY_STORY]
+    assert all(plan.scans for plan in explain_queries(conn, queries))
+
+    create_indexes(conn, derive_indexes(queries))
+
+    plans = explain_queries(conn, queries)
+    assert not any(plan.scans or plan.sorts for plan in plans)
+
+
+def test_create_indexes_skips_missing_tables_and_columns(conn):
+    """Test that indexes for tables or columns outside the schema are skipped."""
+    created = create_indexes(conn, [
+        IndexSpec("characters", ("tenant_id", "world_id")),
+        IndexSpec("characters", ("tenant_id", "session_id")),
+        IndexSpec("missing", ("tenant_id",)),
+    ])
+
+    assert created == [IndexSpec("characters", ("tenant_id", "world_id"))]
+
+
+def test_explain_reports_errors_for_unknown_tables(conn):
+    """Test that a query against a missing table is reported, not raised."""
+    [plan] = explain_queries(conn, ["SELECT * FROM missing WHERE tenant_id = ?"])
+
+    assert plan.error is not None
+    assert not plan.scans
+
+
+def test_repository_queries_cover_list_by_world():
+    """Test that the repository source yields the common world-scoped index."""
+    indexes = derive_indexes(repository_queries())
+
+    assert IndexSpec("characters", ("tenant_id", "world_id")) in indexes
+    assert all(index.columns[0] == "tenant_id" for index in indexes)
+
+
+def test_initialized_schema_has_no_scanning_queries(tmp_path):
+    """Test that initialize_schema creates the derived indexes for the real repositories."""
+    from src.infrastructure.sqlite_connection import SQLiteSettings
+    from src.infrastructure.sqlite_repositories import SQLiteDatabase
+
+    db = SQLiteDatabase(str(tmp_path / "lore.db"), SQLiteSettings())
+    db.initialize_schema()
+    with db.get_connection() as conn:
+        plans = explain_queries(conn)
+        indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    db.close()
+
+    analysed = [plan for plan in plans if plan.error is None]
+    assert analysed
+    assert [plan.sql for plan in analysed if plan.scans] == []
+    # Generated repositories only reach their table through f"... {self._table} ..."
+    assert {"idx_talenttrees_tenant_id_world_id", "idx_factionleaders_tenant_id_world_id"} <= indexes
+    assert all(plan.error.startswith("no such ") for plan in plans if plan.error)
@@ -0,0 +1,142 @@
+"""Tests for the SQLite unit of work."""
+import sqlite3
+
+import pytest
+
+from src.domain.exceptions import InvalidState
+from src.infrastructure.sqlite_connection import SQLiteConnectionManager, SQLiteSettings
+from src.infrastructure.sqlite_unit_of_work import SQLiteUnitOfWork
+
+
+@pytest.fixture(params=[True, False], ids=["pooled", "per-call"])
+def db(request, tmp_path):
+    manager = SQLiteConnectionManager(str(tmp_path / "uow.db"), SQLiteSettings(pooled=request.param))
+    with manager.get_connection() as conn:
+        conn.execute("CREATE TABLE worlds (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE)")
+        conn.execute("CREATE TABLE characters (id INTEGER PRIMARY KEY, world_id INTEGER, name TEXT)")
+    yield manager
+    manager.close()
+
+
+def insert_world(db, name):
+    """Repository-style write: one get_connection() block per call."""
+    with db.get_connection() as conn:
+        return conn.execute("INSERT INTO worlds (name) VALUES (?)", (name,)).lastrowid
+
+
+def insert_character(db, world_id, name):
+    with db.get_connection() as conn:
+        conn.execute("INSERT INTO characters (world_id, name) VALUES (?, ?)", (world_id, name))
+
+
+def count(db, table):
+    with db.get_connection() as conn:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def test_commits_all_repositories_together(db):
+    """Test that writes from several repositories commit as one batch."""
+    with SQLiteUnitOfWork(db):
+        world_id = insert_world(db, "Aerth")
+        for i in range(50):
+            insert_character(db, world_id, f"Hero {i}")
+
+    assert count(db, "worlds") == 1
+    assert count(db, "characters") == 50
+
+
+def test_rolls_back_atomically(db):
+    """Test that a failure discards every write in the unit of work."""
+    with pytest.raises(RuntimeError):
+        with SQLiteUnitOfWork(db):
+            world_id = insert_world(db, "Aerth")
+            insert_character(db, world_id, "Hero")
+            raise RuntimeError("import failed")
+
+    assert count(db, "worlds") == 0
+    assert count(db, "characters") == 0
+
+
+def test_nested_unit_of_work_uses_savepoint(db):
+    """Test that an inner failure only undoes the inner block."""
+    with SQLiteUnitOfWork(db):
+        insert_world(db, "Outer")
+        with pytest.raises(Exception):
+            with SQLiteUnitOfWork(db):
+                insert_world(db, "Inner")
+                insert_world(db, "Outer")  # violates UNIQUE(name)
+
+    with db.get_connection() as conn:
+        names = [row["name"] for row in conn.execute("SELECT name FROM worlds")]
+    assert names == ["Outer"]
+
+
+def test_explicit_commit_keeps_unit_open(db):
+    """Test that commit() persists progress and later work can still roll back."""
+    with pytest.raises(RuntimeError):
+        with SQLiteUnitOfWork(db) as uow:
+            insert_world(db, "Committed")
+            uow.commit()
+            insert_world(db, "Discarded")
+            raise RuntimeError("stop")
+
+    with db.get_connection() as conn:
+        names = [row["name"] for row in conn.execute("SELECT name FROM worlds")]
+    assert names == ["Committed"]
+
+
+def test_on_commit_callbacks_run_only_after_commit(db):
+    """Test that on_commit callbacks fire after commit and not after rollback."""
+    calls = []
+
+    with SQLiteUnitOfWork(db) as uow:
+        uow.on_commit(lambda: calls.append("committed"))
+        insert_world(db, "Aerth")
+        assert calls == []
+    assert calls == ["committed"]
+
+    with pytest.raises(RuntimeError):
+        with SQLiteUnitOfWork(db) as uow:
+            uow.on_commit(lambda: calls.append("should not run"))
+            raise RuntimeError("abort")
+    assert calls == ["committed"]
+
+
+def test_inactive_unit_of_work_rejects_commit(db):
+    """Test that commit outside the block is an invalid state."""
+    uow = SQLiteUnitOfWork(db)
+    with pytest.raises(InvalidState):
+        uow.commit()
+
+
+def test_rolled_back_savepoint_drops_its_callbacks(db):
+    """Test that on_commit callbacks registered in a failed nested block never run."""
+    calls = []
+
+    with SQLiteUnitOfWork(db) as uow:
+        uow.on_commit(lambda: calls.append("outer"))
+        with pytest.raises(RuntimeError):
+            with SQLiteUnitOfWork(db) as inner:
+                inner.on_commit(lambda: calls.append("undone"))
+                raise RuntimeError("item failed")
+        with SQLiteUnitOfWork(db) as inner:
+            inner.on_commit(lambda: calls.append("kept"))
+
+    assert calls == ["outer", "kept"]
+
+
+def test_transaction_does_not_commit_stray_writes(tmp_path):
+    """Test that uncommitted work on the pinned connection is not committed by a new transaction."""
+    manager = SQLiteConnectionManager(str(tmp_path / "uow.db"), SQLiteSettings(pooled=True))
+    with manager.get_connection() as conn:
+        conn.execute("CREATE TABLE worlds (id INTEGER PRIMARY KEY, name TEXT)")
+    # Writing after the block leaves an implicit transaction open on the pinned connection
+    conn.execute("INSERT INTO worlds (name) VALUES ('Stray')")
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        with manager.transaction():
+            pass
+
+    conn.rollback()
+    assert count(manager, "worlds") == 0
+    manager.close()
@@ -0,0 +1,119 @@
+"""Tests for the virtualized entity table models."""
+import os
+from dataclasses import dataclass
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtWidgets = pytest.importorskip("PyQt6.QtWidgets")
+
+from PyQt6.QtCore import Qt
+
+from src.presentation.gui.table_models import (
+    SORT_ROLE, Column, EntityTableModel, EntityTableView,
+)
+
+
+@dataclass
+class Row:
+    id: int
+    name: str
+
+
+COLUMNS = [
+    Column("ID", lambda row: row.id),
+    Column("Name", lambda row: row.name, color=lambda row: "#FF0000" if row.id == 0 else None),
+]
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+@pytest.fixture
+def rows():
+    return [Row(i, f"Name {i:04d}") for i in range(1000)]
+
+
+@pytest.fixture
+def model(rows):
+    return EntityTableModel(lambda: rows, COLUMNS, batch_size=100)
+
+
+def test_rows_fetched_in_batches(model):
+    """Test that only the first batch is exposed until the view fetches more."""
+    assert model.rowCount() == 100
+    assert model.canFetchMore()
+    model.fetchMore()
+    assert model.rowCount() == 200
+
+    model.fetch_all()
+    assert model.rowCount() == 1000
+    assert not model.canFetchMore()
+
+    index = model.index(7, 0)
+    assert model.data(index) == "7"
+    assert model.data(index, SORT_ROLE) == 7
+    assert model.data(model.index(0, 1), Qt.ItemDataRole.ForegroundRole).name() == "#ff0000"
+    assert model.headerData(1, Qt.Orientation.Horizontal) == "Name"
+
+    model.reset()
+    assert model.rowCount() == 100
+
+
+def test_fine_grained_notifications(rows, model):
+    """Test appends, in-place edits, replacements and removals."""
+    inserted, changed, removed = [], [], []
+    model.rowsInserted.connect(lambda parent, first, last: inserted.append((first, last)))
+    model.dataChanged.connect(lambda top_left, bottom_right: changed.append(top_left.row()))
+    model.rowsRemoved.connect(lambda parent, first, last: removed.append((first, last)))
+
+    # Not every row is shown yet: the new one waits for fetchMore
+    rows.append(Row(1000, "Late"))
+    model.rows_appended()
+    assert inserted == [] and model.rowCount() == 100
+
+    model.fetch_all()
+    rows.append(Row(1001, "Shown"))
+    model.rows_appended()
+    assert inserted[-1] == (1001, 1001)
+
+    rows[5].name = "Renamed"
+    model.entity_changed(rows[5])
+    new = Row(6, "Replacement")
+    model.replace_entity(rows[6], new)
+    assert changed == [5, 6]
+    assert rows[6] is new and model.row_of(new) == 6
+
+    model.remove_entity(rows[3])
+    assert removed == [(3, 3)]
+    assert model.rowCount() == 1001
+    assert model.row_of(rows[3]) == 3
+
+
+def test_proxy_sorts_and_filters_whole_list(app, model):
+    """Test numeric sorting and that filters see rows not fetched yet."""
+    view = EntityTableView(model)
+    proxy = view.proxy
+
+    view.sortByColumn(0, Qt.SortOrder.DescendingOrder)
+    assert proxy.entity_at(0).id == 99
+
+    proxy.set_filter_text("name 0950")
+    assert proxy.rowCount() == 1
+    assert proxy.entity_at(0).id == 950
+
+    proxy.set_filter_text("")
+    proxy.set_predicate(lambda row: row.id % 250 == 0)
+    assert sorted(proxy.entity_at(i).id for i in range(proxy.rowCount())) == [0, 250, 500, 750]
+
+
+def test_view_selection(app, rows, model):
+    """Test selecting an entity beyond the fetched rows."""
+    view = EntityTableView(model)
+    assert view.selected_entity() is None
+
+    view.select_entity(rows[420])
+    assert model.rowCount() > 420
+    assert view.selected_entity() is rows[420]
@@ -0,0 +1,132 @@
+"""Tests for MCP tool dispatch: the handler registry, schema validation and latency stats."""
+from types import SimpleNamespace
+
+import pytest
+
+from lore_mcp_server.mcp_server.dispatch import (
+    LatencyHistogram, ToolArgumentError, ToolRegistry, UnknownTool, compile_schema,
+)
+
+CREATE_ITEM = {
+    "type": "object",
+    "properties": {
+        "tenant_id": {"type": "string"},
+        "name": {"type": "string"},
+        "item_type": {"type": "string", "enum": ["weapon", "armor"]},
+        "level": {"type": "integer", "minimum": 1, "maximum": 100},
+        "weight": {"type": "number"},
+        "tradeable": {"type": "boolean"},
+        "tags": {"type": "array", "items": {"type": "string"}},
+        "owner_ids": {"type": "array", "items": {"type": "string"}},
+    },
+    "required": ["tenant_id", "name"],
+}
+
+
+@pytest.fixture
+def validate():
+    return compile_schema(CREATE_ITEM)
+
+
+def test_valid_arguments_pass(validate):
+    validate({"tenant_id": "t", "name": "Sword", "item_type": "weapon", "level": 5, "weight": 1.5,
+              "tradeable": True, "tags": ["sharp"]}, "")
+    # Integer ids for string id fields, enum case, null optionals and unknown keys are accepted
+    validate({"tenant_id": 7, "name": "Sword", "item_type": "WEAPON", "level": None, "owner_ids": [1, "2"],
+              "extra": object()}, "")
+
+
+@pytest.mark.parametrize("arguments, message", [
+    ({"name": "Sword"}, "Missing required argument 'tenant_id'"),
+    ({"tenant_id": "t", "name": None}, "Missing required argument 'name'"),
+    ({"tenant_id": "t", "name": ["Sword"]}, "'name' must be of type string"),
+    ({"tenant_id": "t", "name": 7}, "'name' must be of type string"),
+    ({"tenant_id": True, "name": "Sword"}, "'tenant_id' must be of type string"),
+    ({"tenant_id": "t", "name": "Sword", "item_type": "ring"}, "'item_type' must be one of weapon, armor"),
+    ({"tenant_id": "t", "name": "Sword", "level": 0}, "'level' must be at least 1 and at most 100"),
+    ({"tenant_id": "t", "name": "Sword", "level": 2.5}, "'level' must be of type integer"),
+    ({"tenant_id": "t", "name": "Sword", "tradeable": 1}, "'tradeable' must be of type boolean"),
+    ({"tenant_id": "t", "name": "Sword", "weight": True}, "'weight' must be of type number"),
+    ({"tenant_id": "t", "name": "Sword", "tags": ["a", 1.5]}, "'tags[1]' must be of type string"),
+    ({"tenant_id": "t", "name": "Sword", "tags": ["a", 1]}, "'tags[1]' must be of type string"),
+    ({"tenant_id": "t", "name": "Sword", "owner_ids": [1, 1.5]}, "'owner_ids[1]' must be of type string"),
+    ([], "arguments must be of type object"),
+])
+def test_invalid_arguments_name_the_argument(validate, arguments, message):
+    with pytest.raises(ToolArgumentError, match=message.replace("[", r"\[").replace("]", r"\]")):
+        validate(arguments, "")
+
+
+def test_registry_dispatches_and_validates():
+    registry = ToolRegistry()
+    calls = []
+
+    @registry.handler("create_item")
+    def create_item(arguments):
+        calls.append(arguments)
+        return {"created": arguments["name"]}
+
+    registry.add_schemas([SimpleNamespace(name="create_item", inputSchema=CREATE_ITEM)])
+
+    assert "create_item" in registry and registry.names() == ["create_item"]
+    assert registry.dispatch("create_item", {"tenant_id": "t", "name": "Sword"}) == {"created": "Sword"}
+    with pytest.raises(ToolArgumentError):
+        registry.dispatch("create_item", None)
+    with pytest.raises(UnknownTool, match="Unknown tool: delete_item"):
+        registry.dispatch("delete_item", {})
+    with pytest.raises(ValueError):
+        registry.handler("create_item")(create_item)
+    assert len(calls) == 1
+
+
+def test_registry_validates_without_running():
+    registry = ToolRegistry()
+    calls = []
+    registry.handler("create_item")(calls.append)
+    registry.add_schemas([SimpleNamespace(name="create_item", inputSchema=CREATE_ITEM)])
+
+    registry.validate("create_item", {"tenant_id": "t", "name": "Sword"})
+    with pytest.raises(ToolArgumentError, match="Missing required argument 'name'"):
+        registry.validate("create_item", {"tenant_id": "t"})
+    with pytest.raises(UnknownTool):
+        registry.validate("delete_item", {})
+    assert calls == []
+
+    # Already validated arguments skip the schema check
+    registry.dispatch("create_item", {"tenant_id": "t"}, validate=False)
+    assert calls == [{"tenant_id": "t"}]
+
+
+def test_registry_records_latency_per_tool():
+    registry = ToolRegistry()
+    registry.handler("get_world")(lambda arguments: None)
+
+    @registry.handler("save_to_json")
+    def fail(arguments):
+        raise RuntimeError("disk full")
+
+    for _ in range(3):
+        registry.dispatch("get_world", {})
+    with pytest.raises(RuntimeError):
+        registry.dispatch("save_to_json", {})
+
+    stats = registry.stats()
+    assert stats["get_world"]["calls"] == 3 and stats["get_world"]["errors"] == 0
+    assert stats["save_to_json"]["errors"] == 1
+    assert sum(stats["get_world"]["buckets"].values()) == 3
+    assert list(registry.stats(["save_to_json", "list_pages"])) == ["save_to_json"]
+
+
+def test_histogram_percentiles():
+    histogram = LatencyHistogram(bounds_ms=(1, 10, 100))
+    assert histogram.percentile(0.5) is None
+
+    for elapsed_ms in [0.5] * 90 + [50] * 9 + [400]:
+        histogram.record(elapsed_ms)
+
+    assert histogram.percentile(0.5) == 1
+    assert histogram.percentile(0.95) == 100
+    assert histogram.percentile(1.0) == 400
+    summary = histogram.summary()
+    assert summary["calls"] == 100 and summary["max_ms"] == 400
+    assert summary["buckets"] == {"<=1ms": 90, "<=100ms": 9, ">100ms": 1}
@@ -0,0 +1,214 @@
+"""Tests for the MCP tool executor."""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from lore_mcp_server.mcp_server.executor import ReadWriteLock, ToolExecutor, ToolLimits, ToolTimeout, is_read_only
+
+
+@pytest.fixture
+def executor():
+    executor = ToolExecutor(max_workers=4, default_concurrency=4, default_timeout=5)
+    yield executor
+    executor.shutdown()
+
+
+def test_classifies_read_only_tools():
+    """Test that only get/list/search/find tools, batch_get and export_tenant are treated as reads."""
+    assert is_read_only("get_world") and is_read_only("list_pages") and is_read_only("search_items")
+    assert not is_read_only("create_world") and not is_read_only("save_to_json")
+    assert is_read_only("batch_get") and not is_read_only("batch_update")
+    assert is_read_only("export_tenant") and not is_read_only("import_snapshot")
+
+
+def test_handlers_run_off_the_event_loop(executor):
+    """Test that a blocking handler does not stall other coroutines."""
+    ticks = []
+
+    async def ticker():
+        for _ in range(5):
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.01)
+
+    async def scenario():
+        return await asyncio.gather(executor.run("export_tenant", time.sleep, 0.2), ticker())
+
+    start = time.monotonic()
+    asyncio.run(scenario())
+
+    assert len(ticks) == 5 and ticks[-1] - start < 0.15
+
+
+def test_reads_run_concurrently(executor):
+    """Test that read-only tools overlap."""
+    barrier = threading.Barrier(3, timeout=2)
+
+    async def scenario():
+        return await asyncio.gather(*(executor.run("list_worlds", barrier.wait) for _ in range(3)))
+
+    assert sorted(asyncio.run(scenario())) == [0, 1, 2]
+
+
+def test_writes_are_exclusive(executor):
+    """Test that a write never overlaps reads or other writes."""
+    active, overlaps = [], []
+    guard = threading.Lock()
+
+    def handler(kind):
+        with guard:
+            if active and (kind == "write" or "write" in active):
+                overlaps.append(list(active))
+            active.append(kind)
+        time.sleep(0.02)
+        with guard:
+            active.remove(kind)
+
+    async def scenario():
+        calls = [executor.run("get_world", handler, "read") for _ in range(3)]
+        calls += [executor.run("create_world", handler, "write") for _ in range(2)]
+        calls += [executor.run("list_pages", handler, "read") for _ in range(3)]
+        await asyncio.gather(*calls)
+
+    asyncio.run(scenario())
+    assert overlaps == []
+
+
+def test_per_tool_concurrency_limit():
+    """Test that a tool limited to one call never runs twice at once."""
+    executor = ToolExecutor(max_workers=4, tool_limits={"get_storage_stats": ToolLimits(1, 5)})
+    running, peak = [0], [0]
+    guard = threading.Lock()
+
+    def handler():
+        with guard:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.02)
+        with guard:
+            running[0] -= 1
+
+    async def scenario():
+        await asyncio.gather(*(executor.run("get_storage_stats", handler) for _ in range(4)))
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        executor.shutdown()
+    assert peak[0] == 1
+
+
+def test_writes_share_one_slot():
+    """Test that queued writes of different tools never hold more than one worker thread."""
+    dispatched, peak = [0], [0]
+    guard = threading.Lock()
+
+    class CountingExecutor(ToolExecutor):
+        def _call(self, name, func, args):
+            with guard:
+                dispatched[0] += 1
+                peak[0] = max(peak[0], dispatched[0])
+            try:
+                return super()._call(name, func, args)
+            finally:
+                with guard:
+                    dispatched[0] -= 1
+
+    executor = CountingExecutor(max_workers=4, default_concurrency=4, default_timeout=5)
+    export_running, release = threading.Event(), threading.Event()
+
+    def export():
+        export_running.set()
+        release.wait(2)
+
+    async def scenario():
+        reader = asyncio.ensure_future(executor.run("export_tenant", export))
+        await asyncio.get_running_loop().run_in_executor(None, export_running.wait, 2)
+        writes = [
+            asyncio.ensure_future(executor.run(name, time.sleep, 0.01))
+            for name in ("create_world", "update_world", "import_snapshot", "create_world")
+        ]
+        await asyncio.sleep(0.05)
+        # The export plus the one write waiting for the lock behind it
+        assert peak[0] == 2
+        release.set()
+        await asyncio.gather(reader, *writes)
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        executor.shutdown()
+    assert peak[0] == 2
+
+
+def test_timeout_reports_error_and_keeps_slot_until_done():
+    """Test that a timed-out call raises and its slot frees only when the thread ends."""
+    executor = ToolExecutor(max_workers=2, tool_limits={"export_tenant": ToolLimits(1, 0.05)})
+    release = threading.Event()
+    order = []
+
+    async def scenario():
+        with pytest.raises(ToolTimeout):
+            await executor.run("export_tenant", release.wait)
+        second = asyncio.ensure_future(executor.run("export_tenant", order.append, "second"))
+        await asyncio.sleep(0.05)
+        order.append("released")
+        release.set()
+        await second
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        executor.shutdown()
+    assert order == ["released", "second"]
+
+
+def test_handler_errors_propagate(executor):
+    """Test that handler exceptions reach the caller unchanged."""
+    def fail():
+        raise KeyError("tenant_id")
+
+    with pytest.raises(KeyError):
+        asyncio.run(executor.run("get_world", fail))
+
+
+def test_from_config():
+    """Test building limits from the execution section of config.json."""
+    executor = ToolExecutor.from_config({
+        "max_workers": 2,
+        "default_timeout_seconds": None,
+        "tools": {"save_to_json": {"concurrency": 1}},
+    })
+    try:
+        assert executor.limits_for("save_to_json") == ToolLimits(1, None)
+        assert executor.limits_for("get_world") == ToolLimits(4, None)
+    finally:
+        executor.shutdown()
+
+
+def test_waiting_writer_blocks_new_readers():
+    """Test writer preference in the readers/writer lock."""
+    lock = ReadWriteLock()
+    events = []
+
+    def write():
+        with lock.write():
+            events.append("write")
+
+    def read():
+        with lock.read():
+            events.append("read")
+
+    with lock.read():
+        writer = threading.Thread(target=write)
+        writer.start()
+        time.sleep(0.05)
+        reader = threading.Thread(target=read)
+        reader.start()
+        time.sleep(0.05)
+        assert events == []
+    writer.join(1)
+    reader.join(1)
+
+    assert events == ["write", "read"]
@@ -0,0 +1,217 @@
+"""Tests for atomic and write-behind JSON persistence."""
+import json
+import os
+import sqlite3
+import time
+from dataclasses import dataclass
+
+import pytest
+
+from lore_mcp_server.mcp_server.persistence import (
+    JSONPersistence,
+    WriteBehindPersistence,
+    atomic_write_json,
+)
+from src.infrastructure.sqlite_connection import SQLiteConnectionManager, SQLiteSettings
+
+
+@dataclass
+class Entity:
+    id: int
+    name: str
+
+
+@pytest.fixture
+def store(tmp_path):
+    # A long interval keeps the background thread out of the way
+    store = WriteBehindPersistence(str(tmp_path / "data"), flush_interval=60)
+    yield store
+    store.close()
+
+
+def read(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_atomic_write_leaves_no_temp_files(tmp_path):
+    """Test that atomic writes replace the target and clean up temp files."""
+    target = tmp_path / "entity.json"
+    atomic_write_json(target, {"name": "old"})
+    atomic_write_json(target, {"name": "new"}, durability="fsync")
+
+    assert read(target) == {"name": "new"}
+    assert [p.name for p in tmp_path.iterdir()] == ["entity.json"]
+
+
+def test_atomic_write_keeps_old_file_on_failure(tmp_path):
+    """Test that a failed serialization does not truncate the existing file."""
+    target = tmp_path / "entity.json"
+    atomic_write_json(target, {"name": "old"})
+
+    with pytest.raises(TypeError):
+        atomic_write_json(target, {"name": object()})
+
+    assert read(target) == {"name": "old"}
+    assert [p.name for p in tmp_path.iterdir()] == ["entity.json"]
+
+
+def test_rejects_unknown_durability(tmp_path):
+    """Test that a misspelled durability mode fails fast."""
+    with pytest.raises(ValueError):
+        JSONPersistence(str(tmp_path), durability="sometimes")
+
+
+def test_saves_are_queued_and_coalesced(store):
+    """Test that nothing is written before a flush and repeats collapse to one write."""
+    for name in ["Aria", "Aria II", "Aria III"]:
+        path = store.save_character(Entity(1, name), "7")
+    store.save_world(Entity(2, "Eldoria"), "7")
+
+    assert store.pending_count == 2
+    assert not any(store.characters_dir.iterdir())
+
+    assert store.flush() == 2
+    assert read(path)["name"] == "Aria III"
+    assert store.pending_count == 0
+
+
+def test_delete_after_queued_save(store):
+    """Test that a delete supersedes a queued save and reports existence correctly."""
+    store.save_item(Entity(3, "Sword"), "7")
+    assert store.delete_item("7", "3") is True
+    assert store.delete_item("7", "3") is False
+
+    store.flush()
+    assert not any(store.items_dir.iterdir())
+
+
+def test_reads_see_queued_writes(store):
+    """Test that listing and loading flush pending changes first."""
+    store.save_world(Entity(4, "Norhaven"), "7")
+
+    assert [w["name"] for w in store.load_all("7")["worlds"]] == ["Norhaven"]
+    assert len(store.list_saved_files("7")["worlds"]) == 1
+
+
+def test_close_flushes_and_rejects_new_writes(tmp_path):
+    """Test that shutdown writes the remaining queue."""
+    store = WriteBehindPersistence(str(tmp_path), flush_interval=60)
+    path = store.save_page(Entity(5, "Prologue"), "7")
+
+    store.close()
+
+    assert read(path)["name"] == "Prologue"
+    with pytest.raises(RuntimeError):
+        store.save_page(Entity(6, "Epilogue"), "7")
+
+
+def test_background_thread_flushes_when_queue_is_full(tmp_path):
+    """Test that reaching max_pending wakes the flusher early."""
+    store = WriteBehindPersistence(str(tmp_path), flush_interval=60, max_pending=2)
+    try:
+        store.save_event(Entity(1, "Siege"), "7")
+        path = store.save_event(Entity(2, "Truce"), "7")
+
+        deadline = time.monotonic() + 5
+        while not os.path.exists(path) and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert read(path)["name"] == "Truce"
+    finally:
+        store.close()
+
+
+def test_failed_flush_keeps_changes_queued(store, monkeypatch):
+    """Test that a write error leaves the change queued for the next flush."""
+    path = store.save_story(Entity(8, "Saga"), "7")
+
+    def fail(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("lore_mcp_server.mcp_server.persistence.atomic_write_json", fail)
+    with pytest.raises(OSError):
+        store.flush()
+    assert store.pending_count == 1
+
+    monkeypatch.undo()
+    store.flush()
+    assert read(path)["name"] == "Saga"
+
+
+def test_batch_writes_on_exit(tmp_path, monkeypatch):
+    """Test that a batch holds back its writes and flushes once at the end."""
+    store = JSONPersistence(str(tmp_path))
+    flushes = []
+    monkeypatch.setattr(store, "flush", lambda: flushes.append(1))
+
+    with store.batch():
+        store.save_world(Entity(1, "Eldoria"), "7")
+        path = store.save_character(Entity(2, "Aria"), "7")
+        store.save_character(Entity(2, "Aria II"), "7")
+        assert not any(store.characters_dir.iterdir())
+
+    assert read(path)["name"] == "Aria II"
+    assert len(flushes) == 1
+
+
+def test_failed_batch_writes_nothing(tmp_path):
+    """Test that an exception discards the batch, and a failing nested batch only its own writes."""
+    store = JSONPersistence(str(tmp_path))
+
+    with pytest.raises(RuntimeError):
+        with store.batch():
+            store.save_world(Entity(1, "Eldoria"), "7")
+            raise RuntimeError("invalid")
+    assert not any(store.worlds_dir.iterdir())
+
+    with store.batch():
+        store.save_world(Entity(1, "Eldoria"), "7")
+        with pytest.raises(RuntimeError):
+            with store.batch():
+                store.save_world(Entity(2, "Norhaven"), "7")
+                raise RuntimeError("invalid")
+        with store.batch():
+            store.save_item(Entity(3, "Sword"), "7")
+    assert [w["name"] for w in store.load_all("7")["worlds"]] == ["Eldoria"]
+    assert len(list(store.items_dir.iterdir())) == 1
+
+
+def test_batch_around_transaction_flushes_after_commit(tmp_path, monkeypatch):
+    """Test the batch tools' nesting: files follow a commit and are dropped with a failed one."""
+    store = JSONPersistence(str(tmp_path / "data"))
+    db = SQLiteConnectionManager(str(tmp_path / "lore.db"), SQLiteSettings())
+    with db.get_connection() as conn:
+        conn.execute("PRAGMA foreign_keys = ON")
+        conn.execute("CREATE TABLE worlds (id INTEGER PRIMARY KEY, name TEXT)")
+        conn.execute("CREATE TABLE notes (world_id INTEGER REFERENCES worlds(id) DEFERRABLE INITIALLY DEFERRED)")
+
+    def committed_worlds():
+        with db.get_connection() as conn:
+            return conn.execute("SELECT COUNT(*) FROM worlds").fetchone()[0]
+
+    flushes = []
+    monkeypatch.setattr(store, "flush", lambda: flushes.append(committed_worlds()))
+
+    with store.batch(), db.transaction() as tx:
+        tx.conn.execute("INSERT INTO worlds VALUES (1, 'Eldoria')")
+        store.save_world(Entity(1, "Eldoria"), "7")
+    assert flushes == [1]
+
+    # The deferred foreign key only fails at COMMIT
+    with pytest.raises(sqlite3.IntegrityError):
+        with store.batch(), db.transaction() as tx:
+            tx.conn.execute("INSERT INTO notes VALUES (99)")
+            store.save_world(Entity(2, "Norhaven"), "7")
+    assert [w["name"] for w in store.load_all("7")["worlds"]] == ["Eldoria"]
+    assert flushes == [1]
+    db.close()
+
+
+def test_delete_inside_batch_drops_staged_write(store):
+    """Test that deleting an entity saved earlier in the batch leaves no file behind."""
+    with store.batch():
+        store.save_item(Entity(3, "Sword"), "7")
+        store.delete_item("7", "3")
+
+    assert not any(store.items_dir.iterdir())